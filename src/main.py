@@ -1,3 +1,4 @@
 import struct_frame
 
-raise SystemExit(struct_frame.main())
+if __name__ == '__main__':
+    raise SystemExit(struct_frame.main())
@@ -1,15 +1,33 @@
 from .base import version, NamingStyleC, NamingStyleCpp, camel_to_snake_case, pascal_case, build_enum_leading_comments, build_enum_values, get_discriminator_enum_name, build_discriminator_enum_values, normalize_bytes_type
 
-from .c_gen import FileCGen, TestCGen
-from .ts_gen import FileTsGen, TestTsGen
-from .js_gen import FileJsGen, TestJsGen
-from .py_gen import FilePyGen, TestPyGen
-from .gql_gen import FileGqlGen
-from .cpp_gen import FileCppGen, TestCppGen
-from .csharp_gen import FileCSharpGen, TestCSharpGen
-from .rust_gen import FileRustGen, TestRustGen
-
-from .generate import main
-
-__all__ = ["main", "FileCGen", "TestCGen", "FileTsGen", "TestTsGen", "FileJsGen", "TestJsGen", "FilePyGen", "TestPyGen", "FileGqlGen", "FileCppGen", "TestCppGen", "FileCSharpGen", "TestCSharpGen", "FileRustGen", "TestRustGen", "version",
+# Language back-ends and the generator entry point are imported on first
+# access, so a generator run only loads the back-ends its build flags select.
+_LAZY_ATTRS = {
+    "FileCGen": ".c_gen", "TestCGen": ".c_gen",
+    "FileTsGen": ".ts_gen", "TestTsGen": ".ts_gen",
+    "FileJsGen": ".js_gen", "TestJsGen": ".js_gen",
+    "FilePyGen": ".py_gen", "TestPyGen": ".py_gen",
+    "FileGqlGen": ".gql_gen",
+    "FileCppGen": ".cpp_gen", "TestCppGen": ".cpp_gen",
+    "FileCSharpGen": ".csharp_gen", "TestCSharpGen": ".csharp_gen",
+    "FileRustGen": ".rust_gen", "TestRustGen": ".rust_gen",
+    "main": ".generate", "GeneratorSession": ".generate",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = ["main", "GeneratorSession", "FileCGen", "TestCGen", "FileTsGen", "TestTsGen", "FileJsGen", "TestJsGen", "FilePyGen", "TestPyGen", "FileGqlGen", "FileCppGen", "TestCppGen", "FileCSharpGen", "TestCSharpGen", "FileRustGen", "TestRustGen", "version",
            "NamingStyleC", "NamingStyleCpp", "camel_to_snake_case", "pascal_case", "build_enum_leading_comments", "build_enum_values", "get_discriminator_enum_name", "build_discriminator_enum_values", "normalize_bytes_type"]
@@ -68,6 +68,7 @@ from .frame_profiles import (
     BufferWriter,
     AccumulatingReader,
     AccumulatingReaderState,
+    MultiProfileReader,
 )
 
 # Re-export all
@@ -124,4 +125,5 @@ __all__ = [
     "BufferWriter",
     "AccumulatingReader",
     "AccumulatingReaderState",
+    "MultiProfileReader",
 ]
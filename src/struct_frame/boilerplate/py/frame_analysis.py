@@ -0,0 +1,320 @@
+"""
+Frame Analysis - parallel offline decoding of large raw captures
+
+Memory-maps a raw byte capture (the link stream exactly as received), cuts
+it into shards at safe split points and parses/decodes the shards in a
+ProcessPoolExecutor. Each worker maps the file itself, so only the shard
+bounds go to the workers and only the decoded columns come back.
+
+A split point is a start byte where a frame passes its CRC check and the
+next ``confirm - 1`` frames follow back to back and pass theirs too, so a
+shard boundary is a real frame boundary, not a start byte inside a payload.
+Profiles without a CRC give no way to confirm a split and are parsed as a
+single shard.
+
+Results are per-msg_id columns: ``offset`` (file offset of the frame),
+the header fields the profile carries, and, unless ``decode=False``, one
+column per message field (from the generated ``to_dict()``).
+
+Usage:
+    result = analyze_capture('link.bin', PROFILE_STANDARD_CONFIG,
+                             messages='my_project.generated.my_package', workers=16)
+    columns = result.to_pydict(Status.MSG_ID)   # e.g. pyarrow.Table.from_pydict(columns)
+"""
+
+import importlib
+import mmap
+import os
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from .frame_base import FrameMsgStatus
+    from .frame_profiles import BufferReader, ProfileConfig, _byte_finder, parse_frame_buffer
+except ImportError:
+    from frame_base import FrameMsgStatus
+    from frame_profiles import BufferReader, ProfileConfig, _byte_finder, parse_frame_buffer
+
+
+MIN_SHARD_BYTES = 1 << 20
+
+Columns = Dict[str, Union[array, list]]
+
+
+@dataclass
+class ShardStats:
+    """Byte range and parse counters of one shard"""
+    start: int
+    end: int
+    frames: int = 0
+    crc_failures: int = 0
+    sync_bytes: int = 0
+    decode_errors: int = 0
+    unknown_ids: int = 0
+
+
+@dataclass
+class CaptureAnalysis:
+    """Merged result of analyze_capture()
+
+    ``columns`` maps msg_id to its columns, in file order. Header columns
+    are ``array('q')``; field columns are lists until to_arrays() is used.
+    """
+    size: int
+    shards: List[ShardStats] = field(default_factory=list)
+    columns: Dict[int, Columns] = field(default_factory=dict)
+
+    @property
+    def frames(self) -> int:
+        return sum(s.frames for s in self.shards)
+
+    @property
+    def crc_failures(self) -> int:
+        return sum(s.crc_failures for s in self.shards)
+
+    @property
+    def decode_errors(self) -> int:
+        return sum(s.decode_errors for s in self.shards)
+
+    def msg_ids(self) -> List[int]:
+        return sorted(self.columns)
+
+    def count(self, msg_id: int) -> int:
+        cols = self.columns.get(msg_id)
+        return len(cols['offset']) if cols else 0
+
+    def to_pydict(self, msg_id: int) -> Dict[str, list]:
+        """Columns of *msg_id* as plain lists (ready for pyarrow/pandas)"""
+        return {name: list(values) for name, values in self.columns.get(msg_id, {}).items()}
+
+    def to_arrays(self, msg_id: int) -> Columns:
+        """Columns of *msg_id*; all-int columns as array('q'), all-float as array('d')"""
+        out: Columns = {}
+        for name, values in self.columns.get(msg_id, {}).items():
+            out[name] = _typed(values)
+        return out
+
+
+def _typed(values):
+    if isinstance(values, array):
+        return values
+    if values and all(type(v) is int for v in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            return values
+    if values and all(type(v) is float for v in values):
+        return array('d', values)
+    return values
+
+
+# =============================================================================
+# Split points
+# =============================================================================
+
+def _valid_at(view, pos: int, config: ProfileConfig, get_message_info) -> int:
+    """Frame size of a CRC-valid frame at *pos*, or 0."""
+    result = parse_frame_buffer(config, view[pos:], get_message_info)
+    return result.frame_size if result.valid else 0
+
+
+def find_sync(view, pos: int, limit: int, config: ProfileConfig,
+              get_message_info=None, confirm: int = 2) -> Optional[int]:
+    """
+    First offset in ``[pos, limit)`` where *confirm* CRC-valid frames start
+    back to back (or fewer, if the buffer ends right after them).
+
+    Returns None when there is no such offset.
+    """
+    if not isinstance(view, memoryview):
+        view = memoryview(view)
+    size = len(view)
+    find = _byte_finder(view, config.computed_start_byte1())
+    while pos < limit:
+        pos = find(pos, limit)
+        if pos == -1:
+            return None
+        at, ok = pos, True
+        for _ in range(confirm):
+            if at == size:
+                break
+            frame_size = _valid_at(view, at, config, get_message_info)
+            if not frame_size:
+                ok = False
+                break
+            at += frame_size
+        if ok:
+            return pos
+        pos += 1
+    return None
+
+
+def find_split_points(view, config: ProfileConfig, shards: int,
+                      get_message_info=None, confirm: int = 2) -> List[int]:
+    """
+    Shard boundaries ``[0, ..., len(view)]`` for about *shards* equal shards.
+
+    Tentative boundaries with no confirmed frame start before the next one
+    are dropped, merging their shards.
+    """
+    if not isinstance(view, memoryview):
+        view = memoryview(view)
+    size = len(view)
+    bounds = [0]
+    if not config.has_crc or config.num_start_bytes == 0:
+        return [0, size]
+    step = size // shards if shards > 0 else size
+    for i in range(1, shards):
+        tentative = max(i * step, bounds[-1] + 1)
+        split = find_sync(view, tentative, min((i + 1) * step, size), config, get_message_info, confirm)
+        if split is not None and split > bounds[-1]:
+            bounds.append(split)
+    bounds.append(size)
+    return bounds
+
+
+# =============================================================================
+# Shard worker
+# =============================================================================
+
+def _load_messages(messages: Optional[str]) -> Tuple[Optional[Callable], Optional[Callable]]:
+    if messages is None:
+        return None, None
+    module = importlib.import_module(messages)
+    return module.get_message_info, getattr(module, 'get_message_class', None)
+
+
+def _header_columns(config: ProfileConfig) -> Tuple[str, ...]:
+    names = ['offset', 'size']
+    if config.has_sequence:
+        names.append('sequence')
+    if config.has_system_id:
+        names.append('system_id')
+    if config.has_component_id:
+        names.append('component_id')
+    return tuple(names)
+
+
+def analyze_shard(path: str, start: int, end: int, config: ProfileConfig,
+                  messages: Optional[str] = None, decode: bool = True) -> Tuple[ShardStats, Dict[int, Columns]]:
+    """Parse (and decode) frames in ``[start, end)`` of *path*. Runs in a worker process."""
+    get_message_info, get_message_class = _load_messages(messages)
+    if not decode:
+        get_message_class = None
+    stats = ShardStats(start, end)
+    columns: Dict[int, Columns] = {}
+    header_names = _header_columns(config)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)[start:end]
+        try:
+            reader = BufferReader(config, view, get_message_info)
+            decoders: Dict[int, Optional[Callable]] = {}
+            while (result := reader.try_next()) is not None:
+                if not result.valid:
+                    if result.status is FrameMsgStatus.SYNC_RECOVERY:
+                        stats.sync_bytes += result.frame_size
+                    else:
+                        stats.crc_failures += 1
+                    continue
+                stats.frames += 1
+                msg_id = result.msg_id
+                if msg_id not in decoders:
+                    cls = get_message_class(msg_id) if get_message_class is not None else None
+                    decoders[msg_id] = cls.deserialize if cls is not None else None
+                    if cls is None and get_message_class is not None:
+                        stats.unknown_ids += 1
+                deserialize = decoders[msg_id]
+                fields = None
+                if deserialize is not None:
+                    try:
+                        fields = deserialize(result.msg_data).to_dict(False, False)
+                    except Exception:
+                        stats.decode_errors += 1
+                        continue
+                cols = columns.get(msg_id)
+                if cols is None:
+                    cols = columns[msg_id] = {name: array('q') for name in header_names}
+                    if fields is not None:
+                        for name in fields:
+                            cols[name] = []
+                cols['offset'].append(start + reader.offset - result.frame_size)
+                cols['size'].append(result.frame_size)
+                if 'sequence' in cols:
+                    cols['sequence'].append(result.sequence)
+                if 'system_id' in cols:
+                    cols['system_id'].append(result.system_id)
+                if 'component_id' in cols:
+                    cols['component_id'].append(result.component_id)
+                if fields is not None:
+                    for name, value in fields.items():
+                        cols[name].append(value)
+            del reader
+        finally:
+            view.release()
+    return stats, columns
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+def analyze_capture(path: str, config: ProfileConfig, messages: Union[None, str, Any] = None,
+                    workers: Optional[int] = None, shards: Optional[int] = None,
+                    decode: bool = True, confirm: int = 2,
+                    executor: Optional[Executor] = None) -> CaptureAnalysis:
+    """
+    Parse and decode a raw capture file in parallel.
+
+    Args:
+        path: Raw byte capture
+        config: Frame profile of the stream
+        messages: Generated messages module (or its import name) providing
+            get_message_info and get_message_class; it must be importable in
+            the worker processes. Profiles whose CRC covers per-message magic
+            numbers cannot validate frames without it.
+        workers: Worker processes (default: os.cpu_count()); 1 runs inline
+        shards: Number of shards (default: 4 per worker, at least MIN_SHARD_BYTES each)
+        decode: Decode payloads into field columns; False gives header columns only
+        confirm: Back-to-back valid frames required to accept a split point
+        executor: Use this executor instead of creating a ProcessPoolExecutor
+    """
+    if messages is not None and not isinstance(messages, str):
+        messages = messages.__name__
+    get_message_info, _ = _load_messages(messages)
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    if shards is None:
+        shards = max(1, min(workers * 4, size // MIN_SHARD_BYTES))
+
+    if size == 0:
+        bounds = [0, 0]
+    else:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                bounds = find_split_points(view, config, shards, get_message_info, confirm)
+            finally:
+                view.release()
+
+    jobs = [(path, bounds[i], bounds[i + 1], config, messages, decode) for i in range(len(bounds) - 1)]
+    if executor is None and (workers == 1 or len(jobs) == 1):
+        parts = [analyze_shard(*job) for job in jobs]
+    elif executor is not None:
+        parts = list(executor.map(analyze_shard, *zip(*jobs)))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            parts = list(pool.map(analyze_shard, *zip(*jobs)))
+
+    result = CaptureAnalysis(size)
+    for stats, columns in parts:
+        result.shards.append(stats)
+        for msg_id, cols in columns.items():
+            merged = result.columns.get(msg_id)
+            if merged is None:
+                result.columns[msg_id] = cols
+                continue
+            for name, values in cols.items():
+                merged[name].extend(values)
+    return result
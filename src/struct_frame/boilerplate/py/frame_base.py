@@ -113,12 +113,16 @@ class FrameMsgStatus(Enum):
     SYNC_RECOVERY     - The parser discarded one or more bytes to re-find a
                         valid frame start.  Triggered by bad bytes, unknown
                         message IDs, or internal buffer overflows.
+    FILTERED          - A complete frame was skipped because the reader's
+                        header filter rejected it.  Its CRC was not checked
+                        and its payload was not copied.  Not an error.
     """
     NONE = 0
     WAITING_FOR_START = 1
     COLLECTING = 2
     CRC_FAILURE = 3
     SYNC_RECOVERY = 4
+    FILTERED = 5
 
 
 @dataclass
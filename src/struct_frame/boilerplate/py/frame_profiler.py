@@ -0,0 +1,466 @@
+"""
+Frame Profiler - opt-in hot-path instrumentation for encoding and parsing
+
+Breaks the time spent inside the frame parser and encoder down by phase
+without running cProfile:
+
+- header: start bytes, header fields, length and total-size checks
+- message_info: get_message_info() lookups (magic numbers, minimal sizes)
+- checksum: Fletcher checksum over header + payload
+- payload_copy: copying the payload out of the receive buffer
+- resync: scanning for the next start byte after garbage or a bad frame
+- serialize / encode_header / encode_checksum: the encode side
+
+Nothing in frame_profiles.py is touched when profiling is off. instrument()
+swaps an AccumulatingReader's class for InstrumentedAccumulatingReader, and
+uninstrument() swaps it back, so an uninstrumented reader runs exactly the
+code it always did. With ``sample_rate < 1`` only every Nth parse (or encode)
+takes the timed path; the others go straight to the normal parser.
+
+Usage:
+    profiler = instrument(reader, FrameProfiler(sample_rate=0.01))
+    ...
+    print(profiler.report())
+
+Command line, for a raw byte capture:
+    python frame_profiler.py capture.bin --profile standard \\
+        --messages my_project.generated.my_package --path generated/py
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .frame_base import FrameMsgInfo
+    from .frame_profiles import (
+        AccumulatingReader, HeaderFilter, MessageInfo, ProfileConfig, encode_message,
+        PROFILE_STANDARD_CONFIG, PROFILE_SENSOR_CONFIG, PROFILE_IPC_CONFIG,
+        PROFILE_BULK_CONFIG, PROFILE_NETWORK_CONFIG,
+        _encode_crc, _encode_header, _encode_msg_id, _encode_payload,
+        _parse_crc, _parse_header, _parse_magic, _parse_minimal_frame, _parse_minimal_header,
+    )
+except ImportError:
+    from frame_base import FrameMsgInfo
+    from frame_profiles import (
+        AccumulatingReader, HeaderFilter, MessageInfo, ProfileConfig, encode_message,
+        PROFILE_STANDARD_CONFIG, PROFILE_SENSOR_CONFIG, PROFILE_IPC_CONFIG,
+        PROFILE_BULK_CONFIG, PROFILE_NETWORK_CONFIG,
+        _encode_crc, _encode_header, _encode_msg_id, _encode_payload,
+        _parse_crc, _parse_header, _parse_magic, _parse_minimal_frame, _parse_minimal_header,
+    )
+
+
+PARSE_PHASES = ('header', 'message_info', 'checksum', 'payload_copy', 'resync')
+ENCODE_PHASES = ('serialize', 'encode_header', 'encode_checksum')
+
+
+class PhaseStats:
+    """Sample count, total and maximum time (ns) for one phase"""
+
+    __slots__ = ('count', 'total_ns', 'max_ns')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+
+class FrameProfiler:
+    """
+    Collects per-phase timings from instrumented readers and profiled_encode().
+
+    Args:
+        sample_rate: Fraction of parses/encodes to time, in (0, 1]. Sampling
+            is deterministic: every ``round(1 / sample_rate)``-th call is timed,
+            starting with the first.
+        clock: Nanosecond clock (default: time.perf_counter_ns)
+    """
+
+    def __init__(self, sample_rate: float = 1.0, clock: Callable[[], int] = time.perf_counter_ns):
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+        self.sample_rate = sample_rate
+        self.clock = clock
+        self._every = max(1, round(1.0 / sample_rate))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and timings."""
+        self.parses = 0
+        self.parses_sampled = 0
+        self.encodes = 0
+        self.encodes_sampled = 0
+        self.message_info_calls = 0
+        self.resync_bytes = 0
+        self.phases: Dict[str, PhaseStats] = {name: PhaseStats() for name in PARSE_PHASES + ENCODE_PHASES}
+        self._parse_countdown = 1
+        self._encode_countdown = 1
+
+    def sample_parse(self) -> bool:
+        """Count a parse call; True when this one should be timed."""
+        self.parses += 1
+        self._parse_countdown -= 1
+        if self._parse_countdown:
+            return False
+        self._parse_countdown = self._every
+        self.parses_sampled += 1
+        return True
+
+    def sample_encode(self) -> bool:
+        """Count an encode call; True when this one should be timed."""
+        self.encodes += 1
+        self._encode_countdown -= 1
+        if self._encode_countdown:
+            return False
+        self._encode_countdown = self._every
+        self.encodes_sampled += 1
+        return True
+
+    def add(self, phase: str, ns: int) -> None:
+        self.phases[phase].add(ns)
+
+    def wrap_message_info(self, get_message_info: Optional[Callable[[int], Optional[MessageInfo]]]):
+        """Return a get_message_info that counts its calls (None stays None)."""
+        if get_message_info is None:
+            return None
+
+        def counted(msg_id: int) -> Optional[MessageInfo]:
+            self.message_info_calls += 1
+            return get_message_info(msg_id)
+        counted.__wrapped__ = get_message_info
+        return counted
+
+    def estimated_ns(self, phase: str) -> float:
+        """Phase total scaled up from the sampled calls to all calls."""
+        stats = self.phases[phase]
+        if phase in ENCODE_PHASES:
+            scale = self.encodes / self.encodes_sampled if self.encodes_sampled else 0.0
+        elif phase == 'resync':
+            # Resync scans are timed on every call, independent of sampling.
+            scale = 1.0
+        else:
+            scale = self.parses / self.parses_sampled if self.parses_sampled else 0.0
+        return stats.total_ns * scale
+
+    def summary(self) -> Dict[str, Any]:
+        """Plain-data view of all counters and phase timings (ns)."""
+        return {
+            'sample_rate': self.sample_rate,
+            'parses': self.parses,
+            'parses_sampled': self.parses_sampled,
+            'encodes': self.encodes,
+            'encodes_sampled': self.encodes_sampled,
+            'message_info_calls': self.message_info_calls,
+            'resync_bytes': self.resync_bytes,
+            'phases': {
+                name: {
+                    'samples': s.count,
+                    'total_ns': s.total_ns,
+                    'mean_ns': s.mean_ns,
+                    'max_ns': s.max_ns,
+                    'estimated_ns': self.estimated_ns(name),
+                }
+                for name, s in self.phases.items()
+            },
+        }
+
+    def report(self, wall_ns: Optional[int] = None) -> str:
+        """
+        Text table of the phase breakdown.
+
+        Args:
+            wall_ns: Total time spent in the reader, if known. The part not
+                covered by any phase is shown as "other (bookkeeping)".
+        """
+        lines = [
+            f"parse calls: {self.parses} (timed {self.parses_sampled}), "
+            f"encodes: {self.encodes} (timed {self.encodes_sampled}), "
+            f"sample rate {self.sample_rate:g}",
+            f"get_message_info calls: {self.message_info_calls}, resync bytes skipped: {self.resync_bytes}",
+            "",
+            f"  {'phase':<20}{'samples':>9}{'est. total ms':>15}{'mean ns':>10}{'max ns':>10}{'share':>8}",
+        ]
+        rows = [(name, self.phases[name], self.estimated_ns(name))
+                for name in PARSE_PHASES + ENCODE_PHASES if self.phases[name].count]
+        covered = sum(est for _, _, est in rows)
+        denominator = max(wall_ns or 0, covered) or 1
+        for name, stats, est in rows:
+            lines.append(f"  {name:<20}{stats.count:>9}{est / 1e6:>15.3f}{stats.mean_ns:>10.0f}"
+                         f"{stats.max_ns:>10}{100.0 * est / denominator:>7.1f}%")
+        if wall_ns:
+            other = max(wall_ns - covered, 0)
+            lines.append(f"  {'other (bookkeeping)':<20}{'':>9}{other / 1e6:>15.3f}{'':>10}{'':>10}"
+                         f"{100.0 * other / denominator:>7.1f}%")
+        return "\n".join(lines)
+
+
+# =============================================================================
+# Timed parse/encode
+# =============================================================================
+#
+# These call the same phase helpers as _frame_format_parse_with_crc,
+# _frame_format_parse_minimal and _frame_format_encode_* in frame_profiles.py,
+# with clock reads between them, so the timed path cannot drift from the
+# real one.
+
+def _profiled_parse_with_crc(profiler: FrameProfiler, config: ProfileConfig, buffer,
+                             get_message_info: Optional[Callable[[int], Optional[MessageInfo]]],
+                             header_filter: Optional[HeaderFilter]) -> FrameMsgInfo:
+    clock = profiler.clock
+    t0 = clock()
+    result = FrameMsgInfo()
+    crc_start = _parse_header(config, buffer, result, header_filter)
+    t1 = clock()
+    profiler.add('header', t1 - t0)
+    if crc_start < 0:
+        return result
+
+    if config.has_crc:
+        magic1, magic2, base_size = _parse_magic(get_message_info, result.msg_id, result.msg_len)
+        t2 = t1
+        if get_message_info:
+            t2 = clock()
+            profiler.add('message_info', t2 - t1)
+        crc_ok = _parse_crc(config, buffer, crc_start, result, magic1, magic2, base_size)
+        t1 = clock()
+        profiler.add('checksum', t1 - t2)
+        if not crc_ok:
+            return result
+
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
+    profiler.add('payload_copy', clock() - t1)
+    result.valid = True
+    return result
+
+
+def _profiled_parse_minimal(profiler: FrameProfiler, config: ProfileConfig, buffer,
+                            get_message_info: Callable[[int], Optional[MessageInfo]],
+                            header_filter: Optional[HeaderFilter]) -> FrameMsgInfo:
+    clock = profiler.clock
+    t0 = clock()
+    result = FrameMsgInfo()
+    msg_id = _parse_minimal_header(config, buffer)
+    t1 = clock()
+    header_ns = t1 - t0
+    if msg_id < 0:
+        profiler.add('header', header_ns)
+        return result
+
+    msg_info = get_message_info(msg_id)
+    t2 = clock()
+    profiler.add('message_info', t2 - t1)
+    complete = _parse_minimal_frame(config, buffer, msg_id, msg_info, result, header_filter)
+    t1 = clock()
+    profiler.add('header', header_ns + t1 - t2)
+    if not complete:
+        return result
+
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
+    profiler.add('payload_copy', clock() - t1)
+    result.valid = True
+    return result
+
+
+def profiled_encode(profiler: FrameProfiler, config: ProfileConfig, msg,
+                    seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> bytes:
+    """
+    encode_message() with phase timing; returns the same bytes.
+
+    Calls that the profiler does not sample go straight to encode_message().
+    """
+    if not profiler.sample_encode():
+        return encode_message(config, msg, seq, sys_id, comp_id)
+
+    clock = profiler.clock
+    t0 = clock()
+    msg_id = _encode_msg_id(msg)
+    payload = _encode_payload(config, msg)
+    t1 = clock()
+    profiler.add('serialize', t1 - t0)
+
+    output, crc_start = _encode_header(config, msg_id, payload, seq, sys_id, comp_id)
+    t0 = clock()
+    profiler.add('encode_header', t0 - t1)
+
+    if config.has_crc:
+        _encode_crc(config, msg, output, crc_start, len(payload))
+        profiler.add('encode_checksum', clock() - t0)
+    return bytes(output)
+
+
+# =============================================================================
+# Instrumented reader
+# =============================================================================
+
+class InstrumentedAccumulatingReader(AccumulatingReader):
+    """
+    AccumulatingReader that reports phase timings to a FrameProfiler.
+
+    Not constructed directly: instrument() swaps a live reader's class to this
+    one (keeping its buffered data and diagnostics) and uninstrument() swaps
+    it back.
+    """
+
+    _profiler: FrameProfiler
+    _plain_get_message_info: Optional[Callable[[int], Optional[MessageInfo]]]
+
+    def _parse_buffer(self, buffer) -> FrameMsgInfo:
+        profiler = self._profiler
+        if not profiler.sample_parse():
+            return AccumulatingReader._parse_buffer(self, buffer)
+        if self._config.has_crc or self._config.has_length:
+            return _profiled_parse_with_crc(profiler, self._config, buffer, self._get_message_info,
+                                            self._header_filter)
+        if self._get_message_info is None:
+            return FrameMsgInfo()
+        return _profiled_parse_minimal(profiler, self._config, buffer, self._get_message_info,
+                                       self._header_filter)
+
+    def _find_start_byte(self, start: int) -> int:
+        profiler = self._profiler
+        t0 = profiler.clock()
+        idx = AccumulatingReader._find_start_byte(self, start)
+        profiler.add('resync', profiler.clock() - t0)
+        # The scan starts one past the rejected head byte, which is skipped too.
+        profiler.resync_bytes += (idx if idx != -1 else self._current_size) - start + 1
+        return idx
+
+
+def instrument(reader: AccumulatingReader, profiler: Optional[FrameProfiler] = None) -> FrameProfiler:
+    """
+    Start profiling *reader* in place and return the profiler.
+
+    Re-instrumenting an instrumented reader just switches it to *profiler*.
+    Only plain AccumulatingReader instances can be instrumented, since the
+    class swap would drop a subclass's overrides.
+    """
+    if profiler is None:
+        profiler = FrameProfiler()
+    if isinstance(reader, InstrumentedAccumulatingReader):
+        reader._get_message_info = profiler.wrap_message_info(reader._plain_get_message_info)
+    elif type(reader) is AccumulatingReader:
+        reader._plain_get_message_info = reader._get_message_info
+        reader._get_message_info = profiler.wrap_message_info(reader._get_message_info)
+        reader.__class__ = InstrumentedAccumulatingReader
+    else:
+        raise TypeError(f"cannot instrument {type(reader).__name__}; expected AccumulatingReader")
+    reader._profiler = profiler
+    return profiler
+
+
+def uninstrument(reader: AccumulatingReader) -> None:
+    """Stop profiling *reader*; a no-op if it is not instrumented."""
+    if not isinstance(reader, InstrumentedAccumulatingReader):
+        return
+    reader._get_message_info = reader._plain_get_message_info
+    reader.__class__ = AccumulatingReader
+    del reader._profiler
+    del reader._plain_get_message_info
+
+
+# =============================================================================
+# Command line
+# =============================================================================
+
+PROFILES_BY_NAME = {
+    'standard': PROFILE_STANDARD_CONFIG,
+    'sensor': PROFILE_SENSOR_CONFIG,
+    'ipc': PROFILE_IPC_CONFIG,
+    'bulk': PROFILE_BULK_CONFIG,
+    'network': PROFILE_NETWORK_CONFIG,
+}
+
+
+def profile_capture(data: bytes, config: ProfileConfig,
+                    get_message_info: Optional[Callable[[int], Optional[MessageInfo]]] = None,
+                    profiler: Optional[FrameProfiler] = None, chunk_size: int = 4096,
+                    stream: bool = False, buffer_size: int = 4096):
+    """
+    Run *data* through an instrumented AccumulatingReader.
+
+    Returns ``(profiler, reader, valid_frames, wall_ns)``. In stream mode the
+    bytes are fed with push_byte(); otherwise in *chunk_size* add_data() calls.
+    """
+    reader = AccumulatingReader(config, get_message_info=get_message_info, buffer_size=buffer_size)
+    profiler = instrument(reader, profiler)
+    valid = 0
+    t0 = time.perf_counter_ns()
+    if stream:
+        push = reader.push_byte
+        for byte in data:
+            if push(byte).valid:
+                valid += 1
+    else:
+        view = memoryview(data)
+        for offset in range(0, len(data), chunk_size):
+            reader.add_data(view[offset:offset + chunk_size])
+            while (result := reader.try_next()) is not None:
+                if result.valid:
+                    valid += 1
+    wall_ns = time.perf_counter_ns() - t0
+    return profiler, reader, valid, wall_ns
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print a per-phase parse-time breakdown for a raw frame capture file.")
+    parser.add_argument('capture', help="File containing the raw received byte stream")
+    parser.add_argument('--profile', choices=sorted(PROFILES_BY_NAME), default='standard',
+                        help="Frame profile of the capture (default: standard)")
+    parser.add_argument('--messages', metavar='MODULE',
+                        help="Generated module providing get_message_info (needed for minimal "
+                             "profiles and for CRC magic numbers)")
+    parser.add_argument('--path', action='append', default=[], metavar='DIR',
+                        help="Directory to add to sys.path before importing --messages (repeatable)")
+    parser.add_argument('--chunk', type=int, default=4096, help="add_data() chunk size (default: 4096)")
+    parser.add_argument('--stream', action='store_true', help="Feed bytes with push_byte() instead")
+    parser.add_argument('--sample-rate', type=float, default=1.0,
+                        help="Fraction of parses to time (default: 1.0)")
+    parser.add_argument('--buffer-size', type=int, default=4096,
+                        help="Reader buffer size (default: 4096)")
+    args = parser.parse_args(argv)
+
+    get_message_info = None
+    if args.messages:
+        for path in reversed(args.path):
+            sys.path.insert(0, path)
+        get_message_info = importlib.import_module(args.messages).get_message_info
+    config = PROFILES_BY_NAME[args.profile]
+    if not (config.has_crc or config.has_length) and get_message_info is None:
+        parser.error(f"--messages is required for the {args.profile} profile")
+    if config.has_crc and get_message_info is None:
+        print("warning: no --messages given; frames of messages with magic numbers will fail CRC",
+              file=sys.stderr)
+
+    with open(args.capture, 'rb') as f:
+        data = f.read()
+
+    profiler, reader, valid, wall_ns = profile_capture(
+        data, config, get_message_info, FrameProfiler(args.sample_rate),
+        chunk_size=args.chunk, stream=args.stream, buffer_size=args.buffer_size)
+    diag = reader.diagnostics
+    print(f"{args.capture}: {len(data)} bytes, {config.name}, "
+          f"{'push_byte' if args.stream else f'add_data chunks of {args.chunk}'}")
+    print(f"frames: {valid} valid, {diag.cnt_crc_failures} CRC failures, "
+          f"{diag.cnt_sync_recoveries} resyncs, {diag.cnt_failed_bytes} bytes discarded")
+    rate = len(data) / (wall_ns / 1e9) / 1e6 if wall_ns else 0.0
+    print(f"reader time: {wall_ns / 1e6:.3f} ms ({rate:.2f} MB/s)")
+    print(profiler.report(wall_ns))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,13 +14,15 @@ Each profile provides:
 - BufferReader: iterate through multiple frames in a buffer
 - BufferWriter: encode multiple frames with automatic offset tracking
 - AccumulatingReader: unified parser supporting both buffer chunks and byte-by-byte streaming
+- MultiProfileReader: single-pass reader for streams that interleave several profiles
 
 This module composes HeaderConfig + PayloadConfig for maximum code reuse,
 matching the C++ frame_profiles.hpp pattern.
 """
 
+import re
 from dataclasses import dataclass
-from typing import Optional, Callable, List, NamedTuple
+from typing import Optional, Callable, Dict, List, NamedTuple, Tuple
 from enum import Enum
 
 try:
@@ -72,6 +74,11 @@ class MessageInfo(NamedTuple):
     base_size: int = 0
 
 
+# Header predicate used to skip frames before CRC/payload work:
+# (msg_id, package_id, sequence, system_id, component_id) -> keep?
+HeaderFilter = Callable[[int, int, int, int, int], bool]
+
+
 # =============================================================================
 # Profile Configuration - Composed from Header + Payload configs
 # =============================================================================
@@ -286,39 +293,75 @@ def _frame_format_encode_with_crc(
     Returns:
         Encoded frame as bytes
     """
-    # Get message ID
-    msg_id = getattr(msg, 'MSG_ID', None) or getattr(msg, 'msg_id', None)
-    if msg_id is None:
-        raise ValueError("Message object must have MSG_ID or msg_id attribute")
-    
-    # Get payload
-    # For minimal profiles (no length field), variable messages must use pack_max_size()
-    # Non-variable messages and variable messages on profiles with length fields use pack()
-    is_variable = getattr(msg, 'IS_VARIABLE', False)
-    if is_variable and not config.payload.has_length:
-        # Variable message on minimal profile (ProfileSensor/ProfileIPC) - need MAX_SIZE
-        if hasattr(msg, 'serialize_max_size') and callable(msg.serialize_max_size):
-            payload = msg.serialize_max_size()
-        else:
-            # Fallback to serialize() if serialize_max_size doesn't exist (shouldn't happen)
-            payload = msg.serialize()
-    elif hasattr(msg, 'serialize') and callable(msg.serialize):
-        # Standard path: serialize() returns variable encoding for variable messages,
-        # MAX_SIZE for non-variable messages
-        payload = msg.serialize()
-    else:
-        raise ValueError("Message object must have serialize() method")
-    
-    # Get magic numbers
-    msg_class = type(msg)
-    magic1 = getattr(msg_class, 'MAGIC1', 0)
-    magic2 = getattr(msg_class, 'MAGIC2', 0)
+    msg_id = _encode_msg_id(msg)
+    payload = _encode_payload(config, msg)
+    output, crc_start = _encode_header(config, msg_id, payload, seq, sys_id, comp_id)
+    if config.has_crc:
+        _encode_crc(config, msg, output, crc_start, len(payload))
+    return bytes(output)
+
+
+def _frame_format_encode_minimal(
+    config: ProfileConfig,
+    msg
+) -> bytes:
+    """
+    Generic encode function for minimal frames (no length, no CRC).
     
-    payload_size = len(payload)
+    NOTE: Minimal profiles do NOT support variable-length encoding!
+    Variable messages are always encoded at MAX_SIZE for minimal profiles
+    because the parser has no length field and cannot determine message boundaries.
     
-    if config.max_payload is not None and payload_size > config.max_payload:
-        raise ValueError(f"Payload size {payload_size} exceeds maximum {config.max_payload}")
+    Args:
+        config: Profile configuration
+        msg: Message object with MSG_ID/msg_id and data()/pack() methods
     
+    Returns:
+        Encoded frame as bytes
+    """
+    msg_id = _encode_msg_id(msg)
+    payload = _encode_payload(config, msg)
+    output, _ = _encode_header(config, msg_id, payload)
+    return bytes(output)
+
+
+# Encode and parse phases. The _frame_format_* functions above and below are
+# built from these, and frame_profiler.py times the same helpers, so a change
+# here applies to both the plain and the profiled path.
+
+def _encode_msg_id(msg) -> int:
+    """Message ID of *msg* (MSG_ID or msg_id attribute)."""
+    msg_id = getattr(msg, 'MSG_ID', None) or getattr(msg, 'msg_id', None)
+    if msg_id is None:
+        raise ValueError("Message object must have MSG_ID or msg_id attribute")
+    return msg_id
+
+
+def _encode_payload(config: ProfileConfig, msg) -> bytes:
+    """
+    Serialize *msg* for *config*.
+
+    Profiles without a payload length field (minimal, ProfileSensor/ProfileIPC)
+    cannot mark where a variable message ends, so variable messages are
+    serialized at MAX_SIZE there. Everything else uses serialize(), which is
+    the variable encoding for variable messages and MAX_SIZE otherwise.
+    """
+    if (not config.payload.has_length and getattr(msg, 'IS_VARIABLE', False)
+            and callable(getattr(msg, 'serialize_max_size', None))):
+        return msg.serialize_max_size()
+    if callable(getattr(msg, 'serialize', None)):
+        return msg.serialize()
+    raise ValueError("Message object must have serialize() method")
+
+
+def _encode_header(config: ProfileConfig, msg_id: int, payload: bytes,
+                   seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> Tuple[bytearray, int]:
+    """
+    Start bytes, header fields and payload of a frame.
+
+    Returns the frame so far and the offset where the CRC starts (after the
+    start bytes).
+    """
     output = bytearray()
 
     # Write start bytes (use computed values for dynamic payload type encoding)
@@ -326,8 +369,17 @@ def _frame_format_encode_with_crc(
         output.append(config.computed_start_byte1())
     if config.num_start_bytes >= 2:
         output.append(config.computed_start_byte2())
+    crc_start = len(output)
 
-    crc_start = len(output)  # CRC calculation starts after start bytes
+    if not (config.has_crc or config.has_length):
+        # Minimal frame: message ID and payload only
+        output.append(msg_id & 0xFF)
+        output.extend(payload)
+        return output, crc_start
+
+    payload_size = len(payload)
+    if config.max_payload is not None and payload_size > config.max_payload:
+        raise ValueError(f"Payload size {payload_size} exceeds maximum {config.max_payload}")
     
     # Write optional fields before length
     if config.has_sequence:
@@ -348,107 +400,49 @@ def _frame_format_encode_with_crc(
     # Write package ID and message ID
     if config.has_package_id:
         # Extract package ID from upper 8 bits and message ID from lower 8 bits
-        pkg_id = (msg_id >> 8) & 0xFF
-        local_msg_id = msg_id & 0xFF
-        output.append(pkg_id)
-        output.append(local_msg_id)
+        output.append((msg_id >> 8) & 0xFF)
+        output.append(msg_id & 0xFF)
     else:
         # Write message ID only
         output.append(msg_id & 0xFF)
     
     # Write payload
     output.extend(payload)
-    
-    # Calculate and write CRC (extension-aware)
-    if config.has_crc:
-        base_size = getattr(type(msg), 'BASE_SIZE', payload_size)
-        crc_end = len(output)
-        crc_len = crc_end - crc_start
-        if config.has_length and base_size < payload_size:
-            base_end = crc_start + (crc_len - payload_size) + base_size
-            crc = fletcher_checksum_ext(output, crc_start, base_end, crc_end, init1=magic1, init2=magic2)
-        else:
-            crc = fletcher_checksum(output, crc_start, init1=magic1, init2=magic2)
-        output.append(crc.byte1)
-        output.append(crc.byte2)
-    
-    return bytes(output)
+    return output, crc_start
 
 
-def _frame_format_encode_minimal(
-    config: ProfileConfig,
-    msg
-) -> bytes:
-    """
-    Generic encode function for minimal frames (no length, no CRC).
-    
-    NOTE: Minimal profiles do NOT support variable-length encoding!
-    Variable messages are always encoded at MAX_SIZE for minimal profiles
-    because the parser has no length field and cannot determine message boundaries.
-    
-    Args:
-        config: Profile configuration
-        msg: Message object with MSG_ID/msg_id and data()/pack() methods
-    
-    Returns:
-        Encoded frame as bytes
-    """
-    # Get message ID
-    msg_id = getattr(msg, 'MSG_ID', None) or getattr(msg, 'msg_id', None)
-    if msg_id is None:
-        raise ValueError("Message object must have MSG_ID or msg_id attribute")
-    
-    # Get payload - ALWAYS use MAX_SIZE for minimal profiles
-    # For variable messages, use pack_max_size() if available
-    # For non-variable messages, pack() already returns MAX_SIZE
-    is_variable = getattr(msg, 'IS_VARIABLE', False)
-    if is_variable and hasattr(msg, 'serialize_max_size') and callable(msg.serialize_max_size):
-        payload = msg.serialize_max_size()
-    elif hasattr(msg, 'serialize') and callable(msg.serialize):
-        payload = msg.serialize()
+def _encode_crc(config: ProfileConfig, msg, output: bytearray, crc_start: int, payload_size: int) -> None:
+    """Append the (extension-aware) Fletcher checksum of *output* from *crc_start*."""
+    msg_class = type(msg)
+    magic1 = getattr(msg_class, 'MAGIC1', 0)
+    magic2 = getattr(msg_class, 'MAGIC2', 0)
+    base_size = getattr(msg_class, 'BASE_SIZE', payload_size)
+    crc_end = len(output)
+    crc_len = crc_end - crc_start
+    if config.has_length and base_size < payload_size:
+        base_end = crc_start + (crc_len - payload_size) + base_size
+        crc = fletcher_checksum_ext(output, crc_start, base_end, crc_end, init1=magic1, init2=magic2)
     else:
-        raise ValueError("Message object must have serialize() or serialize_max_size() method")
+        crc = fletcher_checksum(output, crc_start, init1=magic1, init2=magic2)
+    output.append(crc.byte1)
+    output.append(crc.byte2)
 
-    output = bytearray()
-
-    # Write start bytes (use computed values for dynamic payload type encoding)
-    if config.num_start_bytes >= 1:
-        output.append(config.computed_start_byte1())
-    if config.num_start_bytes >= 2:
-        output.append(config.computed_start_byte2())
 
-    # Write message ID
-    output.append(msg_id & 0xFF)
-    
-    # Write payload
-    output.extend(payload)
-    
-    return bytes(output)
-
-
-def _frame_format_parse_with_crc(
-    config: ProfileConfig,
-    buffer: bytes,
-    get_message_info: Callable[[int], Optional[MessageInfo]] = None
-) -> FrameMsgInfo:
+def _parse_header(config: ProfileConfig, buffer, result: FrameMsgInfo,
+                  header_filter: Optional[HeaderFilter] = None) -> int:
     """
-    Generic parse function for frames with CRC.
-    
-    Args:
-        config: Profile configuration
-        buffer: Buffer containing the complete frame
-        get_message_info: Optional function to get message info (size, magic1, magic2) for a message ID
-    
-    Returns:
-        FrameMsgInfo with valid=True if frame is valid
+    Header phase of _frame_format_parse_with_crc.
+
+    Fills the header fields of *result* and returns the offset where the CRC
+    starts. Returns -1 when the frame ends here: *result.status* is then
+    WAITING_FOR_START, COLLECTING or FILTERED.
     """
-    result = FrameMsgInfo()
     length = len(buffer)
 
     if length < config.overhead:
         # Not enough bytes yet to even hold the header+footer
         result.status = FrameMsgStatus.COLLECTING
-        return result
+        return -1
 
     idx = 0
 
@@ -457,12 +451,12 @@ def _frame_format_parse_with_crc(
     if config.num_start_bytes >= 1:
         if buffer[idx] != config.computed_start_byte1():
             result.status = FrameMsgStatus.WAITING_FOR_START
-            return result
+            return -1
         idx += 1
     if config.num_start_bytes >= 2:
         if buffer[idx] != config.computed_start_byte2():
             result.status = FrameMsgStatus.WAITING_FOR_START
-            return result
+            return -1
         idx += 1
 
     crc_start = idx
@@ -494,75 +488,146 @@ def _frame_format_parse_with_crc(
     # Read package ID and message ID
     pkg_id = 0
     if config.has_package_id:
-        # Read package ID and message ID as separate bytes
+        # Combine package ID and message ID into 16-bit msg_id (pkg_id << 8 | msg_id)
         pkg_id = buffer[idx]
-        idx += 1
-        local_msg_id = buffer[idx]
-        idx += 1
-        # Combine into 16-bit msg_id (pkg_id << 8 | msg_id)
-        msg_id = (pkg_id << 8) | local_msg_id
+        msg_id = (pkg_id << 8) | buffer[idx + 1]
     else:
         # Read message ID only
         msg_id = buffer[idx]
-        idx += 1
     
     # Verify total size
     total_size = config.overhead + msg_len
     if length < total_size:
         # Header parsed but payload/footer not fully received yet
         result.status = FrameMsgStatus.COLLECTING
-        return result
-    
-    # Verify CRC (extension-aware)
-    if config.has_crc:
-        crc_len = total_size - crc_start - config.footer_size
-        
-        # Get magic numbers and base_size for this message type
-        magic1, magic2 = 0, 0
-        base_size = msg_len
-        if get_message_info:
-            msg_info = get_message_info(msg_id)
-            if msg_info:
-                magic1, magic2 = msg_info.magic1, msg_info.magic2
-                base_size = getattr(msg_info, 'base_size', msg_len)
-        
-        if config.has_length and base_size < msg_len:
-            base_end = crc_start + (crc_len - msg_len) + base_size
-            calc_crc = fletcher_checksum_ext(buffer, crc_start, base_end, crc_start + crc_len,
-                                             init1=magic1, init2=magic2)
-        else:
-            calc_crc = fletcher_checksum(buffer, crc_start, crc_start + crc_len, init1=magic1, init2=magic2)
-        recv_crc = FrameChecksum(buffer[total_size - 2], buffer[total_size - 1])
-        if calc_crc.byte1 != recv_crc.byte1 or calc_crc.byte2 != recv_crc.byte2:
-            # Structurally complete frame whose CRC did not match. Report the frame
-            # size and a CRC_FAILURE status so buffer/stream readers can skip exactly
-            # this frame and resync, instead of stalling on it forever.
-            result.msg_id = msg_id
-            result.msg_len = msg_len
-            result.frame_size = total_size
-            result.status = FrameMsgStatus.CRC_FAILURE
-            return result
-    
-    # Extract message data
-    msg_data = bytes(buffer[config.header_size:config.header_size + msg_len])
-    
-    result.valid = True
+        return -1
+
     result.msg_id = msg_id
     result.msg_len = msg_len
     result.frame_size = total_size
-    result.msg_data = msg_data
     result.package_id = pkg_id
     result.sequence = seq
     result.system_id = sys_id
     result.component_id = comp_id
+
+    # The whole frame is buffered, so skipping it by total_size keeps sync exactly
+    # as a CRC failure would.
+    if header_filter is not None and not header_filter(msg_id, pkg_id, seq, sys_id, comp_id):
+        result.status = FrameMsgStatus.FILTERED
+        return -1
+    return crc_start
+
+
+def _parse_magic(get_message_info: Optional[Callable[[int], Optional[MessageInfo]]],
+                 msg_id: int, msg_len: int) -> Tuple[int, int, int]:
+    """Magic numbers and base size of *msg_id* for the CRC check (0, 0, msg_len if unknown)."""
+    if get_message_info:
+        msg_info = get_message_info(msg_id)
+        if msg_info:
+            return msg_info.magic1, msg_info.magic2, getattr(msg_info, 'base_size', msg_len)
+    return 0, 0, msg_len
+
+
+def _parse_crc(config: ProfileConfig, buffer, crc_start: int, result: FrameMsgInfo,
+               magic1: int, magic2: int, base_size: int) -> bool:
+    """
+    Verify the (extension-aware) CRC of the frame described by *result*.
+
+    On a mismatch, sets CRC_FAILURE and returns False. The frame size stays
+    in *result*, so buffer and stream readers can skip exactly this frame
+    and resync instead of stalling on it forever.
+    """
+    msg_len = result.msg_len
+    total_size = result.frame_size
+    crc_len = total_size - crc_start - config.footer_size
+    if config.has_length and base_size < msg_len:
+        base_end = crc_start + (crc_len - msg_len) + base_size
+        calc_crc = fletcher_checksum_ext(buffer, crc_start, base_end, crc_start + crc_len,
+                                         init1=magic1, init2=magic2)
+    else:
+        calc_crc = fletcher_checksum(buffer, crc_start, crc_start + crc_len, init1=magic1, init2=magic2)
+    if calc_crc.byte1 != buffer[total_size - 2] or calc_crc.byte2 != buffer[total_size - 1]:
+        result.status = FrameMsgStatus.CRC_FAILURE
+        return False
+    return True
+
+
+def _parse_minimal_header(config: ProfileConfig, buffer) -> int:
+    """Header phase of _frame_format_parse_minimal: the message ID, or -1 if there is no frame start."""
+    if len(buffer) < config.header_size:
+        return -1
+    idx = 0
+    if config.num_start_bytes >= 1:
+        if buffer[idx] != config.computed_start_byte1():
+            return -1
+        idx += 1
+    if config.num_start_bytes >= 2:
+        if buffer[idx] != config.computed_start_byte2():
+            return -1
+        idx += 1
+    return buffer[idx]
+
+
+def _parse_minimal_frame(config: ProfileConfig, buffer, msg_id: int, msg_info: Optional[MessageInfo],
+                         result: FrameMsgInfo, header_filter: Optional[HeaderFilter] = None) -> bool:
+    """
+    Size and filter checks of _frame_format_parse_minimal.
+
+    Fills *result* and returns True when the payload is complete and should
+    be copied. Unknown IDs and incomplete frames leave *result* empty.
+    """
+    if msg_info is None:
+        return False
+    msg_len = msg_info.size
+    total_size = config.header_size + msg_len
+    if len(buffer) < total_size:
+        return False
+    result.msg_id = msg_id
+    result.msg_len = msg_len
+    result.frame_size = total_size
+    if header_filter is not None and not header_filter(msg_id, 0, 0, 0, 0):
+        result.status = FrameMsgStatus.FILTERED
+        return False
+    return True
+
+
+def _frame_format_parse_with_crc(
+    config: ProfileConfig,
+    buffer: bytes,
+    get_message_info: Callable[[int], Optional[MessageInfo]] = None,
+    header_filter: Optional[HeaderFilter] = None
+) -> FrameMsgInfo:
+    """
+    Generic parse function for frames with CRC.
     
+    Args:
+        config: Profile configuration
+        buffer: Buffer containing the complete frame
+        get_message_info: Optional function to get message info (size, magic1, magic2) for a message ID
+        header_filter: Optional predicate on the header fields; a complete frame it
+            rejects is returned as FILTERED before any CRC or payload work
+    
+    Returns:
+        FrameMsgInfo with valid=True if frame is valid
+    """
+    result = FrameMsgInfo()
+    crc_start = _parse_header(config, buffer, result, header_filter)
+    if crc_start < 0:
+        return result
+    if config.has_crc:
+        magic1, magic2, base_size = _parse_magic(get_message_info, result.msg_id, result.msg_len)
+        if not _parse_crc(config, buffer, crc_start, result, magic1, magic2, base_size):
+            return result
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
+    result.valid = True
     return result
 
 
 def _frame_format_parse_minimal(
     config: ProfileConfig,
     buffer: bytes,
-    get_message_info: Callable[[int], Optional[MessageInfo]]
+    get_message_info: Callable[[int], Optional[MessageInfo]],
+    header_filter: Optional[HeaderFilter] = None
 ) -> FrameMsgInfo:
     """
     Generic parse function for minimal frames (requires get_message_info callback for size).
@@ -571,49 +636,19 @@ def _frame_format_parse_minimal(
         config: Profile configuration
         buffer: Buffer containing the complete frame
         get_message_info: Callback to get message info (size field used) for a msg_id
+        header_filter: Optional header predicate (only msg_id is meaningful here)
     
     Returns:
         FrameMsgInfo with valid=True if frame is valid
     """
     result = FrameMsgInfo()
-    
-    if len(buffer) < config.header_size:
+    msg_id = _parse_minimal_header(config, buffer)
+    if msg_id < 0:
         return result
-    
-    idx = 0
-    
-    # Verify start bytes
-    if config.num_start_bytes >= 1:
-        if buffer[idx] != config.computed_start_byte1():
-            return result
-        idx += 1
-    if config.num_start_bytes >= 2:
-        if buffer[idx] != config.computed_start_byte2():
-            return result
-        idx += 1
-    
-    # Read message ID
-    msg_id = buffer[idx]
-    
-    # Get message info from callback
-    msg_info = get_message_info(msg_id)
-    if msg_info is None:
+    if not _parse_minimal_frame(config, buffer, msg_id, get_message_info(msg_id), result, header_filter):
         return result
-    msg_len = msg_info.size
-    
-    total_size = config.header_size + msg_len
-    if len(buffer) < total_size:
-        return result
-    
-    # Extract message data
-    msg_data = bytes(buffer[config.header_size:config.header_size + msg_len])
-    
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
     result.valid = True
-    result.msg_id = msg_id
-    result.msg_len = msg_len
-    result.frame_size = total_size
-    result.msg_data = msg_data
-    
     return result
 
 
@@ -699,6 +734,28 @@ def create_custom_config(
 # BufferReader - Iterate through multiple frames in a buffer
 # =============================================================================
 
+def _byte_finder(view: memoryview, byte: int) -> Callable[[int, int], int]:
+    """
+    ``find(start, end)`` for *byte* in *view*, returning an offset or -1.
+
+    Uses the underlying object's own find() (bytes, bytearray, mmap) when the
+    view covers all of it. Otherwise it runs a regex search, which reads the
+    view in place: memoryview has no find(), and copying the view to search
+    it would cost the whole rest of the buffer on every call.
+    """
+    needle = bytes([byte])
+    obj = view.obj
+    if hasattr(obj, 'find') and len(obj) == view.nbytes:
+        obj_find = obj.find
+        return lambda start, end: obj_find(needle, start, end)
+    search = re.compile(re.escape(needle)).search
+
+    def find(start: int, end: int) -> int:
+        match = search(view, start, end)
+        return match.start() if match else -1
+    return find
+
+
 class BufferReader:
     """
     BufferReader - Iterate through a buffer parsing multiple frames.
@@ -730,9 +787,15 @@ class BufferReader:
         """
         self._config = config
         self._buffer = buffer
-        self._size = len(buffer)
+        # Frames are parsed through a view so each next() does not copy the
+        # rest of the buffer (bytes/mmap slicing copies).
+        self._view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        if self._view.format != 'B':
+            self._view = self._view.cast('B')
+        self._size = len(self._view)
         self._offset = 0
         self._get_message_info = get_message_info
+        self._find_start = None
     
     def next(self) -> FrameMsgInfo:
         """
@@ -744,7 +807,7 @@ class BufferReader:
         if self._offset >= self._size:
             return FrameMsgInfo()
         
-        remaining = self._buffer[self._offset:]
+        remaining = self._view[self._offset:]
         
         if self._config.has_crc or self._config.has_length:
             result = _frame_format_parse_with_crc(self._config, remaining, self._get_message_info)
@@ -761,8 +824,9 @@ class BufferReader:
             # Head byte is not a frame start — scan forward to the next start byte,
             # reporting SyncRecovery so try_next() keeps advancing.
             old_offset = self._offset
-            start1 = bytes([self._config.computed_start_byte1()])
-            nxt = self._buffer.find(start1, self._offset + 1, self._size)
+            if self._find_start is None:
+                self._find_start = _byte_finder(self._view, self._config.computed_start_byte1())
+            nxt = self._find_start(self._offset + 1, self._size)
             self._offset = nxt if nxt != -1 else self._size
             result.status = FrameMsgStatus.SYNC_RECOVERY
             result.frame_size = self._offset - old_offset
@@ -930,7 +994,8 @@ class AccumulatingReader:
     
     def __init__(self, config: ProfileConfig, 
                  get_message_info: Callable[[int], Optional[MessageInfo]] = None,
-                 buffer_size: int = 1024):
+                 buffer_size: int = 1024,
+                 header_filter: Optional[HeaderFilter] = None):
         """
         Initialize accumulating reader.
         
@@ -938,13 +1003,18 @@ class AccumulatingReader:
             config: Profile configuration
             get_message_info: Callback to get message info (size, magic1, magic2) for a message ID
             buffer_size: Size of internal buffer for partial messages (default: 1024)
+            header_filter: Optional predicate on header fields (see set_header_filter)
         """
         self._config = config
         self._get_message_info = get_message_info
+        self._header_filter = header_filter
+        self.cnt_filtered = 0
         self._buffer_size = buffer_size
         
-        # Internal buffer for partial messages
+        # Internal buffer for partial messages. Never resized, so a persistent
+        # view can be handed to the parser without copying it out first.
         self._internal_buffer = bytearray(buffer_size)
+        self._internal_view = memoryview(self._internal_buffer)
         self._internal_data_len = 0
         # Bytes appended to the internal buffer from the CURRENT add_data() call.
         # Used to compute how many of the current buffer's bytes a completed frame
@@ -957,6 +1027,7 @@ class AccumulatingReader:
         self._current_buffer: Optional[bytes] = None
         self._current_size = 0
         self._current_offset = 0
+        self._find_start: Optional[Callable[[int, int], int]] = None
         
         # Diagnostic counters (stream mode)
         self._diag = ParserDiagnostics()
@@ -974,13 +1045,25 @@ class AccumulatingReader:
         to the internal buffer to complete it.
         
         Note: Do not mix add_data() with push_byte() on the same reader instance.
+
+        ``buffer`` may be ``bytes``, ``bytearray`` or a ``memoryview`` (for
+        example a transport's receive buffer). Complete frames are parsed in
+        place and only their payload is copied out; a trailing partial frame is
+        copied once into the internal buffer. A borrowed view must therefore be
+        drained with next()/try_next() before its owner reuses the memory.
         
         Args:
             buffer: New data to process
         """
+        if type(buffer) is bytes:
+            # Immutable, so a view is safe to keep and makes per-frame slicing free.
+            buffer = memoryview(buffer)
+        elif isinstance(buffer, memoryview) and buffer.format != 'B':
+            buffer = buffer.cast('B')
         self._current_buffer = buffer
         self._current_size = len(buffer)
         self._current_offset = 0
+        self._find_start = None
         self._state = AccumulatingReaderState.BUFFER_MODE
         
         # If we have partial data in internal buffer, try to complete it
@@ -1004,8 +1087,7 @@ class AccumulatingReader:
         
         # First, try to complete a partial message from the internal buffer
         if self._internal_data_len > 0 and self._current_offset == 0:
-            internal_bytes = bytes(self._internal_buffer[:self._internal_data_len])
-            result = self._parse_buffer(internal_bytes)
+            result = self._parse_buffer(self._internal_view[:self._internal_data_len])
             # Bytes already in the internal buffer before this add_data() appended to it
             partial_len = self._internal_data_len - self._bytes_appended_to_internal
 
@@ -1018,6 +1100,15 @@ class AccumulatingReader:
                 self._expected_frame_size = 0
                 return result
 
+            if result.status is FrameMsgStatus.FILTERED:
+                self.cnt_filtered += 1
+                bytes_from_current = result.frame_size - partial_len if result.frame_size > partial_len else 0
+                self._current_offset = bytes_from_current
+                self._internal_data_len = 0
+                self._bytes_appended_to_internal = 0
+                self._expected_frame_size = 0
+                return result
+
             if result.frame_size > 0:
                 # Complete but invalid frame (CRC failure) — count it, skip it, resync
                 if self._config.has_crc:
@@ -1045,6 +1136,11 @@ class AccumulatingReader:
             self._current_offset += result.frame_size
             return result
 
+        if result.status is FrameMsgStatus.FILTERED:
+            self.cnt_filtered += 1
+            self._current_offset += result.frame_size
+            return result
+
         if result.frame_size > 0:
             # Complete frame with bad CRC — count it, skip it, let caller call next() again
             if self._config.has_crc:
@@ -1058,8 +1154,7 @@ class AccumulatingReader:
             # Head byte is not a frame start — scan forward to the next start byte,
             # reporting SyncRecovery with frame_size=bytes_skipped so try_next() keeps draining.
             old_offset = self._current_offset
-            start1 = bytes([self._config.computed_start_byte1()])
-            nxt = self._current_buffer.find(start1, self._current_offset + 1, self._current_size)
+            nxt = self._find_start_byte(self._current_offset + 1)
             self._current_offset = nxt if nxt != -1 else self._current_size
             skipped = self._current_offset - old_offset
             self._diag.cnt_failed_bytes += skipped
@@ -1076,6 +1171,16 @@ class AccumulatingReader:
             self._current_offset = self._current_size
 
         return self._with_diag(FrameMsgInfo())
+
+    def _find_start_byte(self, start: int) -> int:
+        """Index of the next start byte in the current buffer, or -1."""
+        buf = self._current_buffer
+        start1 = self._config.computed_start_byte1()
+        if not isinstance(buf, memoryview):
+            return buf.find(bytes([start1]), start, self._current_size)
+        if self._find_start is None:
+            self._find_start = _byte_finder(buf, start1)
+        return self._find_start(start, self._current_size)
     
     # =========================================================================
     # Stream Mode API
@@ -1336,14 +1441,20 @@ class AccumulatingReader:
     
     def _validate_and_return(self) -> FrameMsgInfo:
         """Validate and return completed message"""
-        internal_bytes = bytes(self._internal_buffer[:self._internal_data_len])
-        result = self._parse_buffer(internal_bytes)
+        result = self._parse_buffer(self._internal_view[:self._internal_data_len])
         
         # Reset state for next message
         self._state = AccumulatingReaderState.LOOKING_FOR_START1
         self._internal_data_len = 0
         self._expected_frame_size = 0
         
+        if result.status is FrameMsgStatus.FILTERED:
+            # Still advances the sequence so the next kept frame is not a false gap.
+            self.cnt_filtered += 1
+            if self._config.has_sequence:
+                self._last_seq = result.sequence
+            return result
+
         if result.valid:
             # Check for sequence gap (profiles that carry a sequence number)
             if self._config.has_sequence:
@@ -1365,11 +1476,26 @@ class AccumulatingReader:
     def _parse_buffer(self, buffer: bytes) -> FrameMsgInfo:
         """Parse a buffer using the appropriate parser"""
         if self._config.has_crc or self._config.has_length:
-            return _frame_format_parse_with_crc(self._config, buffer, self._get_message_info)
+            return _frame_format_parse_with_crc(self._config, buffer, self._get_message_info,
+                                                self._header_filter)
         else:
             if self._get_message_info is None:
                 return FrameMsgInfo()
-            return _frame_format_parse_minimal(self._config, buffer, self._get_message_info)
+            return _frame_format_parse_minimal(self._config, buffer, self._get_message_info,
+                                               self._header_filter)
+
+    def set_header_filter(self, header_filter: Optional[HeaderFilter]) -> None:
+        """Install (or clear with None) a header predicate.
+
+        Called as ``header_filter(msg_id, package_id, sequence, system_id,
+        component_id)`` once a frame is fully buffered. Frames it rejects come
+        back from next()/try_next()/push_byte() with status FILTERED and
+        frame_size set, without CRC validation, payload copy or diagnostic
+        counting (they are tallied in ``cnt_filtered`` instead). Filtered
+        frames are skipped by their header length exactly as a CRC failure
+        would be, so stream sync is unaffected.
+        """
+        self._header_filter = header_filter
     
     # =========================================================================
     # Common API
@@ -1384,6 +1510,11 @@ class AccumulatingReader:
     def has_partial(self) -> bool:
         """Check if there's a partial message waiting for more data."""
         return self._internal_data_len > 0
+
+    @property
+    def offset(self) -> int:
+        """Bytes of the current add_data() buffer consumed so far (buffer mode)."""
+        return self._current_offset
     
     def partial_size(self) -> int:
         """Get the size of the partial message data (0 if none)."""
@@ -1424,8 +1555,9 @@ class AccumulatingReader:
         )
 
     def reset_diagnostics(self) -> None:
-        """Reset all diagnostic counters to zero."""
+        """Reset all diagnostic counters (and cnt_filtered) to zero."""
         self._diag = ParserDiagnostics()
+        self.cnt_filtered = 0
     
     def reset(self):
         """Reset the reader, clearing any partial message data."""
@@ -1439,6 +1571,260 @@ class AccumulatingReader:
         self._last_seq = None
 
 
+# =============================================================================
+# MultiProfileReader - one pass over a stream carrying several profiles
+# =============================================================================
+
+_NO_PROFILE = 0xFF
+
+
+class MultiProfileReader:
+    """
+    Reader for a link that interleaves frames of several profiles.
+
+    ProfileStandard (0x90 0x71), ProfileBulk (0x90 0x74) and ProfileNetwork
+    (0x90 0x78), or Tiny-header profiles (0x70 + payload type), can share one
+    stream. A 64 KiB table indexed by the first two bytes of a candidate
+    frame maps every start pattern to its profile, built once from each
+    profile's computed start bytes. Each frame is then parsed in place by its
+    profile's parser, without trying the others.
+
+    Buffer mode only (add_data() + next()/try_next()), with the same
+    partial-frame and resync behaviour as AccumulatingReader. ``last_profile``
+    names the profile of the frame most recently returned. Diagnostics are
+    kept per profile; bytes that match no profile's start pattern are counted
+    in ``stream_diagnostics``.
+
+    Usage:
+        reader = MultiProfileReader([PROFILE_STANDARD_CONFIG, PROFILE_BULK_CONFIG],
+                                    get_message_info=get_message_info)
+        reader.add_data(chunk)
+        while (result := reader.try_next()) is not None:
+            if result.valid:
+                handle(reader.last_profile, result)
+    """
+
+    def __init__(self, profiles: List[ProfileConfig],
+                 get_message_info: Callable[[int], Optional[MessageInfo]] = None,
+                 buffer_size: int = 4096):
+        """
+        Args:
+            profiles: Profiles that may appear on the stream. Each needs at
+                least one start byte, and no two may share a start pattern.
+            get_message_info: Message info callback shared by all profiles
+                (required if any profile has no length field)
+            buffer_size: Largest partial frame carried between add_data() calls
+        """
+        if not profiles:
+            raise ValueError('MultiProfileReader needs at least one profile')
+        self._profiles = tuple(profiles)
+        self._get_message_info = get_message_info
+        self._buffer_size = buffer_size
+        self._table = bytearray([_NO_PROFILE]) * 65536
+        first_bytes = set()
+        for index, profile in enumerate(self._profiles):
+            if profile.num_start_bytes == 0:
+                raise ValueError(f'{profile.name} has no start bytes and cannot be detected in a mixed stream')
+            if not (profile.has_crc or profile.has_length) and get_message_info is None:
+                raise ValueError(f'{profile.name} has no length field; get_message_info is required')
+            b1 = profile.computed_start_byte1()
+            seconds = [profile.computed_start_byte2()] if profile.num_start_bytes >= 2 else range(256)
+            for b2 in seconds:
+                key = (b1 << 8) | b2
+                if self._table[key] != _NO_PROFILE:
+                    other = self._profiles[self._table[key]].name
+                    raise ValueError(f'{profile.name} and {other} share start pattern 0x{b1:02X} 0x{b2:02X}')
+                self._table[key] = index
+            first_bytes.add(b1)
+        self._start_scan = re.compile(b'[' + b''.join(re.escape(bytes((b,))) for b in sorted(first_bytes)) + b']')
+
+        self._diag = [ParserDiagnostics() for _ in self._profiles]
+        self._frames = [0] * len(self._profiles)
+        self._last_seq: List[Optional[int]] = [None] * len(self._profiles)
+        self._stream_diag = ParserDiagnostics()
+        self.last_profile: Optional[ProfileConfig] = None
+
+        self._pending = bytearray()
+        self._data = memoryview(b'')
+        self._offset = 0
+        # While completing a carried-over partial, _data is pending + a prefix of
+        # the new buffer; _tail is the new buffer and _switch_at the pending length.
+        self._tail: Optional[memoryview] = None
+        self._switch_at = 0
+
+    @property
+    def profiles(self) -> tuple:
+        """The configured profiles, in constructor order."""
+        return self._profiles
+
+    def add_data(self, buffer: bytes):
+        """Add a chunk to process; drain it with next()/try_next() before adding more.
+
+        As with AccumulatingReader, complete frames are parsed in place, so a
+        borrowed memoryview must be drained before its owner reuses it.
+        """
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self._offset = 0
+        if self._pending:
+            take = min(len(view), max(0, self._buffer_size - len(self._pending)))
+            self._switch_at = len(self._pending)
+            self._data = memoryview(bytes(self._pending) + bytes(view[:take]))
+            self._tail = view
+            self._pending.clear()
+        else:
+            self._data = view
+            self._tail = None
+
+    def next(self) -> FrameMsgInfo:
+        """Parse the next frame. Returns an invalid FrameMsgInfo when no progress is possible."""
+        while True:
+            if self._tail is not None and self._offset >= self._switch_at:
+                # Past the carried-over bytes: continue directly in the new buffer.
+                self._offset -= self._switch_at
+                self._data, self._tail = self._tail, None
+            data, offset = self._data, self._offset
+            remaining = len(data) - offset
+            if remaining <= 0:
+                return FrameMsgInfo()
+
+            index = self._table[(data[offset] << 8) | data[offset + 1]] if remaining >= 2 else _NO_PROFILE
+            if index == _NO_PROFILE:
+                if remaining < 2 and self._start_scan.match(data, offset):
+                    return self._stash()
+                return self._skip(self._stream_diag, 1, scan=True)
+
+            profile = self._profiles[index]
+            diag = self._diag[index]
+            if profile.has_crc or profile.has_length:
+                result = _frame_format_parse_with_crc(profile, data[offset:], self._get_message_info)
+            else:
+                result = _frame_format_parse_minimal(profile, data[offset:], self._get_message_info)
+
+            if result.valid:
+                self._offset += result.frame_size
+                self._frames[index] += 1
+                if profile.has_sequence:
+                    last = self._last_seq[index]
+                    if last is not None and result.sequence != ((last + 1) & 0xFF):
+                        diag.cnt_seq_gaps += 1
+                    self._last_seq[index] = result.sequence
+                self.last_profile = profile
+                return result
+
+            if result.frame_size > 0:
+                # Complete frame, bad CRC: skip exactly this frame.
+                diag.cnt_crc_failures += 1
+                diag.cnt_failed_bytes += result.frame_size
+                diag.cnt_sync_recoveries += 1
+                self._offset += result.frame_size
+                result.status = FrameMsgStatus.CRC_FAILURE
+                result.diagnostics = self._snapshot(diag)
+                self.last_profile = profile
+                return result
+
+            if self._is_partial(profile, result, data, offset, remaining):
+                if remaining < self._buffer_size and (self._tail is None or len(data) - self._switch_at == len(self._tail)):
+                    return self._stash()
+                # Claims to be larger than we can hold: treat the start bytes as noise.
+            return self._skip(diag, 1, scan=True, profile=profile)
+
+    def try_next(self) -> Optional[FrameMsgInfo]:
+        """Like AccumulatingReader.try_next(): a result while progress is made, else None."""
+        result = self.next()
+        return result if (result.valid or result.frame_size > 0) else None
+
+    def _is_partial(self, profile: ProfileConfig, result: FrameMsgInfo, data, offset: int,
+                    remaining: int) -> bool:
+        if profile.has_crc or profile.has_length:
+            # COLLECTING covers both a short header and a short body.
+            return result.status == FrameMsgStatus.COLLECTING
+        # The minimal parser reports nothing; short, or a known msg_id, means wait.
+        if remaining < profile.header_size:
+            return True
+        return self._get_message_info(data[offset + profile.header_size - 1]) is not None
+
+    def _stash(self) -> FrameMsgInfo:
+        """Keep the trailing partial frame for the next add_data()."""
+        self._pending[:] = self._data[self._offset:]
+        self._data = memoryview(b'')
+        self._tail = None
+        self._offset = 0
+        return FrameMsgInfo()
+
+    def _skip(self, diag: ParserDiagnostics, minimum: int, scan: bool,
+              profile: Optional[ProfileConfig] = None) -> FrameMsgInfo:
+        """Drop bytes up to the next candidate start byte and report SYNC_RECOVERY."""
+        start = self._offset
+        target = start + minimum
+        if scan:
+            match = self._start_scan.search(self._data, target)
+            target = match.start() if match else len(self._data)
+        self._offset = target
+        skipped = target - start
+        diag.cnt_failed_bytes += skipped
+        diag.cnt_sync_recoveries += 1
+        self.last_profile = profile
+        r = FrameMsgInfo(status=FrameMsgStatus.SYNC_RECOVERY)
+        r.frame_size = skipped
+        r.diagnostics = self._snapshot(diag)
+        return r
+
+    @staticmethod
+    def _snapshot(diag: ParserDiagnostics) -> ParserDiagnostics:
+        return ParserDiagnostics(
+            cnt_crc_failures=diag.cnt_crc_failures,
+            cnt_sync_recoveries=diag.cnt_sync_recoveries,
+            cnt_failed_bytes=diag.cnt_failed_bytes,
+            cnt_len_errors=diag.cnt_len_errors,
+            cnt_seq_gaps=diag.cnt_seq_gaps,
+        )
+
+    def has_partial(self) -> bool:
+        """Check if a partial frame is waiting for more data."""
+        return len(self._pending) > 0
+
+    def partial_size(self) -> int:
+        """Size of the partial frame carried over (0 if none)."""
+        return len(self._pending)
+
+    def profile_for(self, byte1: int, byte2: int) -> Optional[ProfileConfig]:
+        """Profile whose start pattern matches the two bytes, or None."""
+        index = self._table[((byte1 & 0xFF) << 8) | (byte2 & 0xFF)]
+        return None if index == _NO_PROFILE else self._profiles[index]
+
+    @property
+    def diagnostics(self) -> Dict[str, ParserDiagnostics]:
+        """Snapshot of the diagnostic counters per profile name."""
+        return {p.name: self._snapshot(d) for p, d in zip(self._profiles, self._diag)}
+
+    @property
+    def frame_counts(self) -> Dict[str, int]:
+        """Valid frames parsed per profile name."""
+        return {p.name: n for p, n in zip(self._profiles, self._frames)}
+
+    @property
+    def stream_diagnostics(self) -> ParserDiagnostics:
+        """Counters for bytes that matched no profile's start pattern."""
+        return self._snapshot(self._stream_diag)
+
+    def reset_diagnostics(self) -> None:
+        """Reset per-profile and stream counters (and frame counts) to zero."""
+        self._diag = [ParserDiagnostics() for _ in self._profiles]
+        self._frames = [0] * len(self._profiles)
+        self._stream_diag = ParserDiagnostics()
+
+    def reset(self):
+        """Reset the reader, clearing any partial frame."""
+        self._pending.clear()
+        self._data = memoryview(b'')
+        self._tail = None
+        self._offset = 0
+        self._last_seq = [None] * len(self._profiles)
+        self.last_profile = None
+
+
 # =============================================================================
 # Backwards Compatibility - FrameFormatConfig alias
 # =============================================================================
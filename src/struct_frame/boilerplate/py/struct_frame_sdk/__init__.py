@@ -5,9 +5,24 @@ Export all SDK components for both sync and async usage
 # Sync transports
 from .transport import ITransport, TransportConfig, BaseTransport, SendResult
 from .udp_transport import UdpTransport, UdpTransportConfig
+from .batched_udp_transport import BatchedUdpTransport, BatchedUdpTransportConfig, UdpBatchStats
 from .tcp_transport import TcpTransport, TcpTransportConfig
 from .websocket_transport import WebSocketTransport, WebSocketTransportConfig
 from .serial_transport import SerialTransport, SerialTransportConfig
+from .unix_transport import UnixTransport, UnixTransportConfig
+from .shared_memory_transport import SharedMemoryTransport, SharedMemoryTransportConfig
+from .reactor import TransportReactor, TransportReactorPool
+from .capture import (
+    CaptureWriter,
+    CaptureReader,
+    CaptureIndex,
+    CapturePosition,
+    CaptureReplay,
+    RecordingTransport,
+    AsyncRecordingTransport,
+    ReplayTransport,
+)
+from .pcapng import PcapngWriter, PcapngReader, PcapPacket, export_capture
 
 # Async transports
 from .async_transport import IAsyncTransport, AsyncTransportConfig, BaseAsyncTransport
@@ -15,6 +30,17 @@ from .async_udp_transport import AsyncUdpTransport, AsyncUdpTransportConfig
 from .async_tcp_transport import AsyncTcpTransport, AsyncTcpTransportConfig
 from .async_websocket_transport import AsyncWebSocketTransport, AsyncWebSocketTransportConfig
 from .async_serial_transport import AsyncSerialTransport, AsyncSerialTransportConfig
+from .async_unix_transport import AsyncUnixTransport, AsyncUnixTransportConfig
+from .async_shared_memory_transport import AsyncSharedMemoryTransport, AsyncSharedMemoryTransportConfig
+from .async_server_transport import (
+    PeerInfo,
+    AsyncServerTransportConfig,
+    BaseAsyncServerTransport,
+    AsyncTcpServerTransport,
+    AsyncTcpServerTransportConfig,
+    AsyncUdpServerTransport,
+    AsyncUdpServerTransportConfig,
+)
 
 # SDK clients
 from .struct_frame_sdk import (
@@ -24,10 +50,17 @@ from .struct_frame_sdk import (
     MessageHandler,
     GetMessageInfo,
 )
+from .subscription import SubscriptionMode, LazyMessage, SubscriptionFilter, FieldFilter
+from .metrics import MetricsCollector, MetricsServer, MessageMetrics, LatencyHistogram
 from .async_struct_frame_sdk import (
     AsyncStructFrameSdk,
     AsyncStructFrameSdkConfig,
 )
+from .async_struct_frame_server import (
+    AsyncStructFrameServer,
+    AsyncStructFrameServerConfig,
+    PeerMessageHandler,
+)
 
 __all__ = [
     # Sync
@@ -37,12 +70,21 @@ __all__ = [
     'SendResult',
     'UdpTransport',
     'UdpTransportConfig',
+    'BatchedUdpTransport',
+    'BatchedUdpTransportConfig',
+    'UdpBatchStats',
     'TcpTransport',
     'TcpTransportConfig',
     'WebSocketTransport',
     'WebSocketTransportConfig',
     'SerialTransport',
     'SerialTransportConfig',
+    'UnixTransport',
+    'UnixTransportConfig',
+    'SharedMemoryTransport',
+    'SharedMemoryTransportConfig',
+    'TransportReactor',
+    'TransportReactorPool',
     'StructFrameSdk',
     'StructFrameSdkConfig',
     # Async
@@ -57,10 +99,47 @@ __all__ = [
     'AsyncWebSocketTransportConfig',
     'AsyncSerialTransport',
     'AsyncSerialTransportConfig',
+    'AsyncUnixTransport',
+    'AsyncUnixTransportConfig',
+    'AsyncSharedMemoryTransport',
+    'AsyncSharedMemoryTransportConfig',
     'AsyncStructFrameSdk',
     'AsyncStructFrameSdkConfig',
+    # Async server
+    'PeerInfo',
+    'AsyncServerTransportConfig',
+    'BaseAsyncServerTransport',
+    'AsyncTcpServerTransport',
+    'AsyncTcpServerTransportConfig',
+    'AsyncUdpServerTransport',
+    'AsyncUdpServerTransportConfig',
+    'AsyncStructFrameServer',
+    'AsyncStructFrameServerConfig',
+    'PeerMessageHandler',
     # Common
     'MessageCodec',
     'MessageHandler',
     'GetMessageInfo',
+    'SubscriptionMode',
+    'LazyMessage',
+    'SubscriptionFilter',
+    'FieldFilter',
+    'MetricsCollector',
+    'MetricsServer',
+    'MessageMetrics',
+    'LatencyHistogram',
+    # Capture / replay
+    'CaptureWriter',
+    'CaptureReader',
+    'CaptureIndex',
+    'CapturePosition',
+    'CaptureReplay',
+    'RecordingTransport',
+    'AsyncRecordingTransport',
+    'ReplayTransport',
+    # pcapng
+    'PcapngWriter',
+    'PcapngReader',
+    'PcapPacket',
+    'export_capture',
 ]
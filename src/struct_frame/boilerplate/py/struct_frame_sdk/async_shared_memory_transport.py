@@ -0,0 +1,150 @@
+"""Async shared-memory transport implementation using multiprocessing.shared_memory
+
+Asyncio counterpart of ``SharedMemoryTransport``; see that module for the
+segment layout. The consumer side registers the ring's wakeup pipe with
+``loop.add_reader`` and drains the ring on the event loop, with a periodic
+poll (``poll_interval``) as the fallback for missed wakeups and for platforms
+without named pipes.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .async_transport import BaseAsyncTransport, AsyncTransportConfig
+from .shared_memory_transport import SharedMemoryChannel
+
+
+@dataclass
+class AsyncSharedMemoryTransportConfig(AsyncTransportConfig):
+    """Async shared-memory transport configuration (see SharedMemoryTransportConfig)"""
+    name: str = 'struct_frame_ipc'
+    create: bool = False
+    capacity: int = 1 << 20
+    poll_interval: float = 0.01
+    send_timeout: float = 5.0
+
+
+class AsyncSharedMemoryTransport(BaseAsyncTransport):
+    """Async shared-memory ring transport between two local processes"""
+
+    def __init__(self, config: AsyncSharedMemoryTransportConfig):
+        super().__init__(config)
+        self.shm_config = config
+        self.channel: Optional[SharedMemoryChannel] = None
+        self.data_view_callback: Optional[Callable[[memoryview], None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poll_task: Optional[asyncio.Task] = None
+
+    def set_data_view_callback(self, callback: Optional[Callable[[memoryview], None]]) -> None:
+        """Set a zero-copy receive callback; the view is valid only during the call"""
+        self.data_view_callback = callback
+
+    async def connect(self) -> None:
+        """Create or attach to the shared segment and start draining it"""
+        try:
+            self.channel = SharedMemoryChannel(self.shm_config.name, self.shm_config.create,
+                                               self.shm_config.capacity)
+            self._loop = asyncio.get_running_loop()
+            if self.channel.rx_wake_fd is not None:
+                self._loop.add_reader(self.channel.rx_wake_fd, self._on_wake)
+            self.connected = True
+            self._poll_task = asyncio.create_task(self._poll_loop())
+            self._drain()
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def disconnect(self) -> None:
+        """Tell the peer we are gone and release the segment"""
+        channel = self.channel
+        if channel is None:
+            return
+        self.channel = None
+        self.connected = False
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+        if channel.rx_wake_fd is not None and self._loop is not None:
+            self._loop.remove_reader(channel.rx_wake_fd)
+        channel.mark_closed()
+        channel.close()
+
+    async def send(self, data: bytes) -> int:
+        """Copy data into the ring, yielding to the loop while it is full"""
+        channel = self.channel
+        if not channel or not self.connected:
+            raise RuntimeError('Shared memory transport not connected')
+
+        view = memoryview(data).cast('B')
+        total = len(view)
+        sent = 0
+        deadline = None
+        while sent < total:
+            n = channel.write_some(view[sent:])
+            sent += n
+            if n:
+                continue
+            if channel.peer_closed():
+                break
+            loop = asyncio.get_running_loop()
+            if deadline is None:
+                deadline = loop.time() + self.shm_config.send_timeout
+            elif loop.time() > deadline:
+                error = TimeoutError('shared memory ring full')
+                self._handle_error(error)
+                raise error
+            await asyncio.sleep(0)
+        return sent
+
+    def _on_wake(self) -> None:
+        if self.channel is not None:
+            self.channel.drain_wakeups()
+            self._drain()
+
+    async def _poll_loop(self) -> None:
+        while self.channel is not None:
+            await asyncio.sleep(self.shm_config.poll_interval)
+            self._drain()
+
+    def _drain(self) -> None:
+        """Deliver everything in the ring, then arm the peer's wakeup"""
+        channel = self.channel
+        if channel is None:
+            return
+        try:
+            channel.set_waiting(False)
+            while self.channel is channel:
+                first, second, total = channel.readable_views()
+                if not total:
+                    channel.set_waiting(True)
+                    # Re-check after publishing the flag so a write that raced
+                    # with it is not left waiting for the poll.
+                    if channel.rx.readable():
+                        channel.set_waiting(False)
+                        continue
+                    break
+                self._deliver(first)
+                if second is not None:
+                    self._deliver(second)
+                    second.release()
+                first.release()
+                channel.consume(total)
+            if self.channel is channel and channel.peer_closed() and not channel.rx.readable():
+                self.channel = None
+                if channel.rx_wake_fd is not None and self._loop is not None:
+                    self._loop.remove_reader(channel.rx_wake_fd)
+                channel.close()
+                self._handle_close()
+        except Exception as e:
+            self._handle_error(e)
+
+    def _deliver(self, view: memoryview) -> None:
+        if self.data_view_callback:
+            self.data_view_callback(view)
+        elif self.data_callback:
+            self.data_callback(bytes(view))
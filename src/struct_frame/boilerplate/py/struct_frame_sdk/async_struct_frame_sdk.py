@@ -8,11 +8,20 @@ bounded internal buffer and resyncs past corrupt or partial frames on its own.
 """
 
 import asyncio
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 
 from .async_transport import IAsyncTransport
 from .transport import SendResult
+from .subscription import (
+    SubscriptionMode, SubscriptionFilter, Subscription, HeaderGate, LazyMessage, DispatchEntry,
+    subscription_mode, compile_dispatch_entry, select_handlers,
+)
+from .metrics import MetricsCollector
+
+# Enum member lookups are slow on the per-handler path; bind them once.
+_DECODED = SubscriptionMode.DECODED
+_RAW = SubscriptionMode.RAW
 
 try:
     from frame_profiles import ProfileConfig, MessageInfo, AccumulatingReader, encode_message
@@ -44,12 +53,14 @@ class AsyncStructFrameSdkConfig:
             for minimal profiles; recommended for CRC profiles.
         buffer_size: Size of the reader's internal accumulation buffer.
         debug: Enable debug logging.
+        metrics: Optional MetricsCollector; None (default) disables metrics.
     """
     transport: IAsyncTransport
     profile: ProfileConfig
     get_message_info: Optional[GetMessageInfo] = None
     buffer_size: int = 4096
     debug: bool = False
+    metrics: Optional[MetricsCollector] = None
 
 
 class AsyncStructFrameSdk:
@@ -60,16 +71,29 @@ class AsyncStructFrameSdk:
         self.profile = config.profile
         self.get_message_info = config.get_message_info
         self.debug = config.debug
+        self.metrics: Optional[MetricsCollector] = config.metrics
         self.message_handlers: Dict[int, List[MessageHandler]] = {}
         self.message_codecs: Dict[int, MessageCodec] = {}
+        # Parallel to message_handlers: mode and filter of each subscription.
+        self.subscriptions: Dict[int, List[Subscription]] = {}
+        # Read-only snapshot of handlers + codec per msg_id used by _dispatch
+        # (see StructFrameSdk); rebuilt on subscribe/unsubscribe/register_codec.
+        self._dispatch_table: Dict[int, DispatchEntry] = {}
         self.reader = AccumulatingReader(
             config.profile,
             get_message_info=config.get_message_info,
             buffer_size=config.buffer_size,
         )
-
-        # Transport callbacks are synchronous; parsing is synchronous and cheap.
-        self.transport.set_data_callback(self._handle_incoming_data)
+        # Header filters pushed down into the reader (installed only while
+        # some message ID is fully covered by filtered subscriptions).
+        self._header_gate = HeaderGate()
+
+        # Transport callbacks are synchronous; parsing is synchronous and cheap,
+        # so a zero-copy view (when offered) is fully drained before returning.
+        if hasattr(self.transport, 'set_data_view_callback'):
+            self.transport.set_data_view_callback(self._handle_incoming_data)
+        else:
+            self.transport.set_data_callback(self._handle_incoming_data)
         self.transport.set_error_callback(self._handle_error)
         self.transport.set_close_callback(self._handle_close)
 
@@ -96,24 +120,73 @@ class AsyncStructFrameSdk:
     def register_codec(self, codec: MessageCodec) -> None:
         """Register a message codec for automatic deserialization"""
         self.message_codecs[codec.msg_id] = codec
+        self._rebuild_dispatch(codec.msg_id)
 
-    def subscribe(self, msg_id: int, handler: MessageHandler) -> Callable[[], None]:
+    def subscribe(self, msg_id: int, handler: MessageHandler,
+                  mode: Union[SubscriptionMode, str] = SubscriptionMode.DECODED,
+                  filter: Optional[SubscriptionFilter] = None) -> Callable[[], None]:
         """Subscribe to messages with a specific message ID.
 
+        *mode* selects what the handler receives: the decoded message
+        (``DECODED``, default), the original payload bytes (``RAW``) or a
+        ``LazyMessage`` that decodes on demand (``LAZY``). A frame is decoded
+        at most once however many handlers it has.
+
+        *filter* restricts the handler to frames matching header fields
+        and/or fixed-offset payload fields (see ``SubscriptionFilter``).
+
         Returns an unsubscribe function.
         """
-        if msg_id not in self.message_handlers:
-            self.message_handlers[msg_id] = []
-        self.message_handlers[msg_id].append(handler)
-        self._log(f'Subscribed to message ID {msg_id}')
+        sub = Subscription(handler, subscription_mode(mode), filter)
+        self.message_handlers.setdefault(msg_id, []).append(handler)
+        self.subscriptions.setdefault(msg_id, []).append(sub)
+        self._rebuild_dispatch(msg_id)
+        if self.debug:
+            self._log(f'Subscribed to message ID {msg_id}')
 
         def unsubscribe():
-            handlers = self.message_handlers.get(msg_id)
-            if handlers and handler in handlers:
-                handlers.remove(handler)
+            subs = self.subscriptions.get(msg_id, [])
+            for i, s in enumerate(subs):
+                if s is sub:
+                    del subs[i]
+                    del self.message_handlers[msg_id][i]
+                    self._rebuild_dispatch(msg_id)
+                    break
 
         return unsubscribe
 
+    def _rebuild_dispatch(self, msg_id: int) -> None:
+        """Publish a fresh dispatch entry for msg_id (copy-on-write)"""
+        subs = self.subscriptions.get(msg_id)
+        self._header_gate.update(msg_id, subs or ())
+        self.reader.set_header_filter(self._header_gate if self._header_gate else None)
+        if not subs:
+            self._dispatch_table.pop(msg_id, None)
+            return
+        codec = self.message_codecs.get(msg_id)
+        deserialize = codec.deserialize if codec else None
+        metrics = self.metrics
+        if metrics is None:
+            self._dispatch_table[msg_id] = compile_dispatch_entry(deserialize, subs)
+            return
+        if deserialize is not None:
+            deserialize = metrics.timed_decode(msg_id, deserialize)
+        self._dispatch_table[msg_id] = compile_dispatch_entry(
+            deserialize, subs, lambda handler: metrics.timed_handler(msg_id, handler))
+
+    def enable_metrics(self, metrics: Optional[MetricsCollector] = None) -> MetricsCollector:
+        """Start collecting metrics (into *metrics*, or a new collector) and return the collector."""
+        self.metrics = metrics if metrics is not None else MetricsCollector()
+        for msg_id in list(self._dispatch_table):
+            self._rebuild_dispatch(msg_id)
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """Stop collecting metrics and drop the timing wrappers."""
+        self.metrics = None
+        for msg_id in list(self._dispatch_table):
+            self._rebuild_dispatch(msg_id)
+
     async def send_raw(self, msg_id: int, data: bytes,
                        seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> SendResult:
         """Frame a pre-serialized payload with the configured profile and send it."""
@@ -132,7 +205,10 @@ class AsyncStructFrameSdk:
         framed = encode_message(self.profile, raw_cls(), seq=seq, sys_id=sys_id, comp_id=comp_id)
         attempted = len(framed)
         written = await self.transport.send(framed)
-        self._log(f'Sent message ID {msg_id}, {len(payload)} payload bytes')
+        if self.metrics is not None:
+            self.metrics.on_tx(msg_id, len(payload), written)
+        if self.debug:
+            self._log(f'Sent message ID {msg_id}, {len(payload)} payload bytes')
         return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
 
     async def send(self, message: Any,
@@ -141,8 +217,12 @@ class AsyncStructFrameSdk:
         framed = encode_message(self.profile, message, seq=seq, sys_id=sys_id, comp_id=comp_id)
         attempted = len(framed)
         written = await self.transport.send(framed)
-        msg_id = getattr(message, 'MSG_ID', None) or getattr(message, 'msg_id', None)
-        self._log(f'Sent message ID {msg_id}, {attempted} frame bytes')
+        if self.metrics is not None or self.debug:
+            msg_id = getattr(message, 'MSG_ID', None) or getattr(message, 'msg_id', None)
+            if self.metrics is not None:
+                self.metrics.on_tx(msg_id, attempted - self.profile.overhead, written)
+            if self.debug:
+                self._log(f'Sent message ID {msg_id}, {attempted} frame bytes')
         return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
 
     async def request(
@@ -211,39 +291,81 @@ class AsyncStructFrameSdk:
 
     def _handle_incoming_data(self, data: bytes) -> None:
         """Feed incoming bytes to the reader and dispatch every complete frame."""
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.on_rx_bytes(len(data))
         self.reader.add_data(data)
         while True:
             result = self.reader.try_next()
             if result is None:
                 break
+            if metrics is not None:
+                metrics.on_frame(result)
             if not result.valid:
                 continue
             self._dispatch(result)
 
     def _dispatch(self, result) -> None:
-        """Deserialize (if a codec is registered) and notify handlers."""
-        self._log(f'Received message ID {result.msg_id}, {result.msg_len} bytes')
-        handlers = self.message_handlers.get(result.msg_id)
-        if not handlers:
+        """Decode at most once (only if a subscriber needs it) and notify handlers."""
+        msg_id = result.msg_id
+        if self.debug:
+            self._log(f'Received message ID {msg_id}, {result.msg_len} bytes')
+        entry = self._dispatch_table.get(msg_id)
+        if entry is None:
             return
 
-        message: Any = result.msg_data
-        codec = self.message_codecs.get(result.msg_id)
-        if codec:
+        deserialize, plain, eager, lazy, handlers, filtered = entry
+        if plain is not None:
+            # Common case: every subscriber wants the decoded message, unfiltered.
+            message: Any = result.msg_data
+            if deserialize is not None:
+                try:
+                    message = deserialize(message)
+                except Exception as e:
+                    if self.debug:
+                        self._log(f'Failed to deserialize message ID {msg_id}: {e}')
+            for handler in plain:
+                try:
+                    handler(message, msg_id)
+                except Exception as e:
+                    if self.debug:
+                        self._log(f'Handler error for message ID {msg_id}: {e}')
+            return
+
+        if filtered:
+            eager, lazy, handlers = select_handlers(deserialize, handlers, result)
+        raw = result.msg_data
+        message = raw
+        view: Optional[LazyMessage] = None
+        if eager:
+            error: Optional[Exception] = None
             try:
-                message = codec.deserialize(result.msg_data)
+                message = deserialize(raw)
             except Exception as e:
-                self._log(f'Failed to deserialize message ID {result.msg_id}: {e}')
-
-        for handler in list(handlers):
+                error = e
+                if self.debug:
+                    self._log(f'Failed to deserialize message ID {msg_id}: {e}')
+            if lazy:
+                view = LazyMessage(msg_id, raw, deserialize, message, error)
+        elif lazy:
+            view = LazyMessage(msg_id, raw, deserialize)
+
+        for handler, mode, _ in handlers:
             try:
-                handler(message, result.msg_id)
+                if mode is _DECODED:
+                    handler(message, msg_id)
+                elif mode is _RAW:
+                    handler(raw, msg_id)
+                else:
+                    handler(view, msg_id)
             except Exception as e:
-                self._log(f'Handler error for message ID {result.msg_id}: {e}')
+                if self.debug:
+                    self._log(f'Handler error for message ID {msg_id}: {e}')
 
     def _handle_error(self, error: Exception) -> None:
         """Handle transport error"""
-        self._log(f'Transport error: {error}')
+        if self.debug:
+            self._log(f'Transport error: {error}')
 
     def _handle_close(self) -> None:
         """Handle transport close - discard any partial frame state."""
@@ -0,0 +1,316 @@
+"""Async Struct Frame Server
+Multi-peer counterpart of ``AsyncStructFrameSdk``.
+
+The server owns one ``AccumulatingReader`` per peer, so a partial or corrupt
+frame from one connection never affects another, and each peer has its own
+``ParserDiagnostics``. Handlers are shared across peers and receive the
+``PeerInfo`` of the sender as a third argument. Subscription modes, filters
+and the precompiled dispatch table work as in ``AsyncStructFrameSdk``.
+"""
+
+from typing import Callable, Dict, List, Optional, Any, Union
+from dataclasses import dataclass
+
+from .async_server_transport import BaseAsyncServerTransport, PeerInfo
+from .async_struct_frame_sdk import MessageCodec, GetMessageInfo
+from .transport import SendResult
+from .subscription import (
+    SubscriptionMode, SubscriptionFilter, Subscription, HeaderGate, LazyMessage, DispatchEntry,
+    subscription_mode, compile_dispatch_entry, select_handlers,
+)
+
+# Enum member lookups are slow on the per-handler path; bind them once.
+_DECODED = SubscriptionMode.DECODED
+_RAW = SubscriptionMode.RAW
+
+try:
+    from frame_profiles import ProfileConfig, AccumulatingReader, ParserDiagnostics, encode_message
+except ImportError:  # pragma: no cover - import shim for packaged layout
+    from ..frame_profiles import ProfileConfig, AccumulatingReader, ParserDiagnostics, encode_message
+
+
+# Peer message handler: (message_or_raw_payload, msg_id, peer) -> None
+PeerMessageHandler = Callable[[Any, int, PeerInfo], None]
+
+
+@dataclass
+class AsyncStructFrameServerConfig:
+    """Async Struct Frame Server Configuration.
+
+    Attributes:
+        transport: Server transport (AsyncTcpServerTransport / AsyncUdpServerTransport).
+        profile: Frame profile configuration (e.g. PROFILE_STANDARD_CONFIG).
+        get_message_info: Callback for looking up message metadata by ID.
+        buffer_size: Size of each peer's reader accumulation buffer.
+        debug: Enable debug logging.
+    """
+    transport: BaseAsyncServerTransport
+    profile: ProfileConfig
+    get_message_info: Optional[GetMessageInfo] = None
+    buffer_size: int = 4096
+    debug: bool = False
+
+
+class AsyncStructFrameServer:
+    """Frame parsing and dispatch for many peers on one event loop."""
+
+    def __init__(self, config: AsyncStructFrameServerConfig):
+        self.transport = config.transport
+        self.profile = config.profile
+        self.get_message_info = config.get_message_info
+        self.buffer_size = config.buffer_size
+        self.debug = config.debug
+        self.message_handlers: Dict[int, List[PeerMessageHandler]] = {}
+        self.message_codecs: Dict[int, MessageCodec] = {}
+        # Parallel to message_handlers: mode and filter of each subscription.
+        self.subscriptions: Dict[int, List[Subscription]] = {}
+        # Read-only snapshot of handlers + codec per msg_id used by _dispatch
+        # (see StructFrameSdk); rebuilt on subscribe/unsubscribe/register_codec.
+        self._dispatch_table: Dict[int, DispatchEntry] = {}
+        # Header filters pushed down into every peer's reader (installed only
+        # while some message ID is fully covered by filtered subscriptions).
+        self._header_gate = HeaderGate()
+        self.peer_connect_handlers: List[Callable[[PeerInfo], None]] = []
+        self.peer_close_handlers: List[Callable[[PeerInfo], None]] = []
+        self.readers: Dict[PeerInfo, AccumulatingReader] = {}
+
+        self.transport.set_peer_connect_callback(self._handle_peer_connect)
+        self.transport.set_peer_data_callback(self._handle_incoming_data)
+        self.transport.set_peer_close_callback(self._handle_peer_close)
+        self.transport.set_error_callback(self._handle_error)
+
+    async def start(self) -> None:
+        """Start accepting peers"""
+        await self.transport.start()
+        self._log('Listening')
+
+    async def stop(self) -> None:
+        """Stop the server and drop all peers"""
+        await self.transport.stop()
+        self.readers.clear()
+        self._log('Stopped')
+
+    async def __aenter__(self) -> 'AsyncStructFrameServer':
+        """Async context manager entry: start and return self."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: always stop."""
+        await self.stop()
+        return False
+
+    def register_codec(self, codec: MessageCodec) -> None:
+        """Register a message codec for automatic deserialization"""
+        self.message_codecs[codec.msg_id] = codec
+        self._rebuild_dispatch(codec.msg_id)
+
+    def subscribe(self, msg_id: int, handler: PeerMessageHandler,
+                  mode: Union[SubscriptionMode, str] = SubscriptionMode.DECODED,
+                  filter: Optional[SubscriptionFilter] = None) -> Callable[[], None]:
+        """Subscribe to messages with a specific message ID from any peer.
+
+        *mode* and *filter* work as in ``AsyncStructFrameSdk.subscribe``;
+        header filters apply to every peer's reader.
+
+        Returns an unsubscribe function.
+        """
+        sub = Subscription(handler, subscription_mode(mode), filter)
+        self.message_handlers.setdefault(msg_id, []).append(handler)
+        self.subscriptions.setdefault(msg_id, []).append(sub)
+        self._rebuild_dispatch(msg_id)
+        if self.debug:
+            self._log(f'Subscribed to message ID {msg_id}')
+
+        def unsubscribe():
+            subs = self.subscriptions.get(msg_id, [])
+            for i, s in enumerate(subs):
+                if s is sub:
+                    del subs[i]
+                    del self.message_handlers[msg_id][i]
+                    self._rebuild_dispatch(msg_id)
+                    break
+
+        return unsubscribe
+
+    def _rebuild_dispatch(self, msg_id: int) -> None:
+        """Publish a fresh dispatch entry for msg_id (copy-on-write)"""
+        subs = self.subscriptions.get(msg_id)
+        self._header_gate.update(msg_id, subs or ())
+        header_filter = self._header_gate if self._header_gate else None
+        for reader in self.readers.values():
+            reader.set_header_filter(header_filter)
+        if not subs:
+            self._dispatch_table.pop(msg_id, None)
+            return
+        codec = self.message_codecs.get(msg_id)
+        self._dispatch_table[msg_id] = compile_dispatch_entry(codec.deserialize if codec else None, subs)
+
+    def on_peer_connect(self, handler: Callable[[PeerInfo], None]) -> None:
+        """Register a handler called when a peer appears"""
+        self.peer_connect_handlers.append(handler)
+
+    def on_peer_close(self, handler: Callable[[PeerInfo], None]) -> None:
+        """Register a handler called when a peer goes away"""
+        self.peer_close_handlers.append(handler)
+
+    def peers(self) -> List[PeerInfo]:
+        """Return the currently connected peers"""
+        return list(self.readers)
+
+    def diagnostics(self, peer: PeerInfo) -> Optional[ParserDiagnostics]:
+        """Return a snapshot of one peer's parser diagnostics (None if unknown)"""
+        reader = self.readers.get(peer)
+        return reader.diagnostics if reader is not None else None
+
+    async def send_raw(self, peer: PeerInfo, msg_id: int, data: bytes,
+                       seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> SendResult:
+        """Frame a pre-serialized payload and send it to one peer."""
+        framed = self._frame_raw(msg_id, data, seq, sys_id, comp_id)
+        attempted = len(framed)
+        written = await self.transport.send_to(peer, framed)
+        if self.debug:
+            self._log(f'Sent message ID {msg_id} to peer {peer.peer_id}')
+        return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
+
+    async def send(self, peer: PeerInfo, message: Any,
+                   seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> SendResult:
+        """Send a generated message object to one peer."""
+        framed = encode_message(self.profile, message, seq=seq, sys_id=sys_id, comp_id=comp_id)
+        attempted = len(framed)
+        written = await self.transport.send_to(peer, framed)
+        if self.debug:
+            self._log(f'Sent {attempted} frame bytes to peer {peer.peer_id}')
+        return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
+
+    async def broadcast(self, message: Any,
+                        seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> int:
+        """Encode a message once and send it to every peer; returns peers reached."""
+        framed = encode_message(self.profile, message, seq=seq, sys_id=sys_id, comp_id=comp_id)
+        return await self.transport.broadcast(framed)
+
+    def _frame_raw(self, msg_id: int, data: bytes, seq: int, sys_id: int, comp_id: int) -> bytes:
+        info = self.get_message_info(msg_id) if self.get_message_info else None
+        magic1 = info.magic1 if info is not None else 0
+        magic2 = info.magic2 if info is not None else 0
+        payload = data if type(data) is bytes else bytes(data)
+        raw_cls = type('_RawMessage', (), {
+            'MSG_ID': msg_id,
+            'MAGIC1': magic1,
+            'MAGIC2': magic2,
+            'serialize': lambda self_: payload,
+        })
+        return encode_message(self.profile, raw_cls(), seq=seq, sys_id=sys_id, comp_id=comp_id)
+
+    def _reader_for(self, peer: PeerInfo) -> AccumulatingReader:
+        reader = self.readers.get(peer)
+        if reader is None:
+            reader = AccumulatingReader(
+                self.profile,
+                get_message_info=self.get_message_info,
+                buffer_size=self.buffer_size,
+                header_filter=self._header_gate if self._header_gate else None,
+            )
+            self.readers[peer] = reader
+        return reader
+
+    def _handle_peer_connect(self, peer: PeerInfo) -> None:
+        """Allocate the per-peer reader and notify connect handlers"""
+        self._reader_for(peer)
+        if self.debug:
+            self._log(f'Peer {peer.peer_id} connected from {peer.address}')
+        for handler in list(self.peer_connect_handlers):
+            try:
+                handler(peer)
+            except Exception as e:
+                if self.debug:
+                    self._log(f'Peer connect handler error: {e}')
+
+    def _handle_incoming_data(self, peer: PeerInfo, data: bytes) -> None:
+        """Feed a peer's bytes to its own reader and dispatch every complete frame."""
+        reader = self._reader_for(peer)
+        reader.add_data(data)
+        while True:
+            result = reader.try_next()
+            if result is None:
+                break
+            if not result.valid:
+                continue
+            self._dispatch(peer, result)
+
+    def _dispatch(self, peer: PeerInfo, result) -> None:
+        """Decode at most once (only if a subscriber needs it) and notify handlers."""
+        msg_id = result.msg_id
+        entry = self._dispatch_table.get(msg_id)
+        if entry is None:
+            return
+
+        deserialize, plain, eager, lazy, handlers, filtered = entry
+        if plain is not None:
+            # Common case: every subscriber wants the decoded message, unfiltered.
+            message: Any = result.msg_data
+            if deserialize is not None:
+                try:
+                    message = deserialize(message)
+                except Exception as e:
+                    if self.debug:
+                        self._log(f'Failed to deserialize message ID {msg_id}: {e}')
+            for handler in plain:
+                try:
+                    handler(message, msg_id, peer)
+                except Exception as e:
+                    if self.debug:
+                        self._log(f'Handler error for message ID {msg_id}: {e}')
+            return
+
+        if filtered:
+            eager, lazy, handlers = select_handlers(deserialize, handlers, result)
+        raw = result.msg_data
+        message = raw
+        view: Optional[LazyMessage] = None
+        if eager:
+            error: Optional[Exception] = None
+            try:
+                message = deserialize(raw)
+            except Exception as e:
+                error = e
+                if self.debug:
+                    self._log(f'Failed to deserialize message ID {msg_id}: {e}')
+            if lazy:
+                view = LazyMessage(msg_id, raw, deserialize, message, error)
+        elif lazy:
+            view = LazyMessage(msg_id, raw, deserialize)
+
+        for handler, mode, _ in handlers:
+            try:
+                if mode is _DECODED:
+                    handler(message, msg_id, peer)
+                elif mode is _RAW:
+                    handler(raw, msg_id, peer)
+                else:
+                    handler(view, msg_id, peer)
+            except Exception as e:
+                if self.debug:
+                    self._log(f'Handler error for message ID {msg_id}: {e}')
+
+    def _handle_peer_close(self, peer: PeerInfo) -> None:
+        """Drop the peer's reader (and any partial frame) and notify close handlers"""
+        self.readers.pop(peer, None)
+        if self.debug:
+            self._log(f'Peer {peer.peer_id} closed')
+        for handler in list(self.peer_close_handlers):
+            try:
+                handler(peer)
+            except Exception as e:
+                if self.debug:
+                    self._log(f'Peer close handler error: {e}')
+
+    def _handle_error(self, error: Exception) -> None:
+        """Handle transport error"""
+        if self.debug:
+            self._log(f'Transport error: {error}')
+
+    def _log(self, message: str) -> None:
+        """Log debug message"""
+        if self.debug:
+            print(f'[AsyncStructFrameServer] {message}')
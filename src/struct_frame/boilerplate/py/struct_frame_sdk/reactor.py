@@ -0,0 +1,324 @@
+"""Shared I/O reactor for sync transports
+Multiplexes many transports onto one thread using the ``selectors`` module.
+
+By default every sync transport starts its own daemon receive thread. A
+process handling hundreds of links then runs hundreds of threads that mostly
+sleep in ``recv()`` and contend for the GIL when data arrives. Passing a
+``TransportReactor`` (or a ``TransportReactorPool``) in the transport config
+makes the transport register its file descriptor with the reactor instead:
+
+    reactor = TransportReactor()
+    links = [TcpTransport(TcpTransportConfig(host=h, port=p, reactor=reactor))
+             for h, p in endpoints]
+
+Data, error and close callbacks are unchanged; they simply run on the reactor
+thread. Callbacks must therefore not block, since a slow handler delays every
+other link served by the same reactor.
+"""
+
+import heapq
+import itertools
+import selectors
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+ReadableCallback = Callable[[], None]
+
+
+class TransportReactor:
+    """Single-threaded selector loop serving any number of transports.
+
+    ``register``/``unregister`` may be called from any thread. Changes made
+    from outside the reactor thread are queued and applied by the loop, and
+    ``unregister`` waits until the loop has applied it so no callback for that
+    file object runs after it returns.
+    """
+
+    def __init__(self, name: str = 'struct-frame-reactor', select_timeout: float = 1.0):
+        self.name = name
+        self.select_timeout = select_timeout
+        self.error_callback: Optional[Callable[[Exception], None]] = None
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._commands: List[Tuple[Callable[[], None], Optional[threading.Event]]] = []
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count()
+        self._registered: Dict[int, Any] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the reactor thread (called automatically on first register)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the reactor thread. Registered transports stop receiving."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._wake()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def close(self) -> None:
+        """Stop the reactor and release the selector"""
+        self.stop()
+        self._selector.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def in_reactor_thread(self) -> bool:
+        """True when called from a callback running on this reactor"""
+        return self._thread is threading.current_thread()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        """Number of registered file objects"""
+        return len(self._registered)
+
+    def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
+        """Set callback for exceptions escaping a readable/timer callback"""
+        self.error_callback = callback
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def register(self, fileobj: Any, callback: ReadableCallback) -> None:
+        """Call *callback* on the reactor thread whenever *fileobj* is readable.
+
+        *fileobj* is anything accepted by ``selectors`` (a socket, or an object
+        with ``fileno()`` such as a POSIX ``serial.Serial``).
+        """
+        self.start()
+
+        def apply():
+            if id(fileobj) in self._registered:
+                self._selector.modify(fileobj, selectors.EVENT_READ, callback)
+            else:
+                self._selector.register(fileobj, selectors.EVENT_READ, callback)
+                self._registered[id(fileobj)] = fileobj
+
+        self._submit(apply, wait=False)
+
+    def unregister(self, fileobj: Any) -> None:
+        """Stop watching *fileobj*. Unknown or already-closed objects are ignored."""
+
+        def apply():
+            if self._registered.pop(id(fileobj), None) is None:
+                return
+            try:
+                self._selector.unregister(fileobj)
+            except (KeyError, ValueError, OSError):
+                pass
+
+        self._submit(apply, wait=True)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run *callback* on the reactor thread after *delay* seconds.
+
+        Transports use this to schedule reconnect attempts without sleeping on
+        the shared thread.
+        """
+        self.start()
+        deadline = time.monotonic() + delay
+        self._submit(lambda: heapq.heappush(self._timers, (deadline, next(self._timer_ids), callback)),
+                     wait=False)
+
+    def _submit(self, command: Callable[[], None], wait: bool) -> None:
+        if self.in_reactor_thread() or not self._running:
+            command()
+            return
+        done = threading.Event() if wait else None
+        with self._lock:
+            self._commands.append((command, done))
+        self._wake()
+        if done is not None:
+            done.wait(timeout=2.0)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b'\x00')
+        except (BlockingIOError, OSError):
+            # Wake-up pipe already full (the loop will wake anyway) or closed.
+            pass
+
+    # =========================================================================
+    # Loop
+    # =========================================================================
+
+    def _run(self) -> None:
+        while self._running:
+            self._apply_commands()
+            timeout = self.select_timeout
+            if self._timers:
+                timeout = max(0.0, min(timeout, self._timers[0][0] - time.monotonic()))
+            try:
+                events = self._selector.select(timeout)
+            except OSError as e:
+                # A registered descriptor was closed behind our back; drop it.
+                self._report(e)
+                self._prune_closed()
+                continue
+            for key, _ in events:
+                callback = key.data
+                if callback is None:
+                    self._drain_wakeups()
+                    continue
+                if id(key.fileobj) not in self._registered:
+                    continue
+                try:
+                    callback()
+                except Exception as e:
+                    self._report(e)
+            self._run_timers()
+        # Release any thread blocked in unregister() after stop().
+        self._apply_commands()
+
+    def _apply_commands(self) -> None:
+        with self._lock:
+            commands, self._commands = self._commands, []
+        for command, done in commands:
+            try:
+                command()
+            except Exception as e:
+                self._report(e)
+            finally:
+                if done is not None:
+                    done.set()
+
+    def _run_timers(self) -> None:
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback = heapq.heappop(self._timers)
+            try:
+                callback()
+            except Exception as e:
+                self._report(e)
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _prune_closed(self) -> None:
+        for key, fileobj in list(self._registered.items()):
+            try:
+                fd = fileobj.fileno()
+            except (OSError, ValueError):
+                fd = -1
+            if fd < 0:
+                self._registered.pop(key, None)
+                try:
+                    self._selector.unregister(fileobj)
+                except (KeyError, ValueError, OSError):
+                    pass
+
+    def _report(self, error: Exception) -> None:
+        if self.error_callback:
+            self.error_callback(error)
+
+
+class TransportReactorPool:
+    """A small fixed set of reactors; each registration goes to the least loaded.
+
+    Exposes the same ``register``/``unregister``/``call_later`` interface as
+    ``TransportReactor`` so it can be passed anywhere a reactor is accepted.
+    """
+
+    def __init__(self, size: int = 2, name: str = 'struct-frame-reactor'):
+        if size < 1:
+            raise ValueError('reactor pool size must be at least 1')
+        self.reactors = [TransportReactor(name=f'{name}-{i}') for i in range(size)]
+        self._owner: Dict[int, TransportReactor] = {}
+        self._load: Dict[int, int] = {id(reactor): 0 for reactor in self.reactors}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        for reactor in self.reactors:
+            reactor.start()
+
+    def stop(self) -> None:
+        for reactor in self.reactors:
+            reactor.stop()
+
+    def close(self) -> None:
+        for reactor in self.reactors:
+            reactor.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return sum(len(reactor) for reactor in self.reactors)
+
+    def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
+        for reactor in self.reactors:
+            reactor.set_error_callback(callback)
+
+    def in_reactor_thread(self) -> bool:
+        return any(reactor.in_reactor_thread() for reactor in self.reactors)
+
+    def register(self, fileobj: Any, callback: ReadableCallback) -> None:
+        with self._lock:
+            reactor = self._owner.get(id(fileobj))
+            if reactor is None:
+                reactor = self._least_loaded()
+                self._owner[id(fileobj)] = reactor
+                self._load[id(reactor)] += 1
+        reactor.register(fileobj, callback)
+
+    def unregister(self, fileobj: Any) -> None:
+        with self._lock:
+            reactor = self._owner.pop(id(fileobj), None)
+            if reactor is not None:
+                self._load[id(reactor)] -= 1
+        if reactor is not None:
+            reactor.unregister(fileobj)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        for reactor in self.reactors:
+            if reactor.in_reactor_thread():
+                reactor.call_later(delay, callback)
+                return
+        with self._lock:
+            reactor = self._least_loaded()
+        reactor.call_later(delay, callback)
+
+    def _least_loaded(self) -> TransportReactor:
+        return min(self.reactors, key=lambda reactor: self._load[id(reactor)])
@@ -56,9 +56,19 @@ class SerialTransport(BaseTransport):
                 self.serial_port.open()
             
             self.connected = True
-            
-            # Start receive thread
             self.running = True
+
+            reactor = self.config.reactor
+            if reactor is not None:
+                # Shared selector loop instead of a dedicated thread. Needs a
+                # selectable port (POSIX serial.Serial exposes fileno()).
+                if not hasattr(self.serial_port, 'fileno'):
+                    raise RuntimeError('Serial port is not selectable; reactor mode requires a POSIX port')
+                port = self.serial_port
+                reactor.register(port, lambda: self._on_readable(port))
+                return
+
+            # Start receive thread
             self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
             self.receive_thread.start()
             
@@ -69,6 +79,8 @@ class SerialTransport(BaseTransport):
     def disconnect(self) -> None:
         """Disconnect serial port"""
         self.running = False
+        if self.config.reactor is not None and self.serial_port is not None:
+            self.config.reactor.unregister(self.serial_port)
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             self.serial_port = None
@@ -110,3 +122,21 @@ class SerialTransport(BaseTransport):
                 if self.running:  # Only handle error if still running
                     self._handle_error(e)
                 break
+
+    def _on_readable(self, port) -> None:
+        """Reactor callback: drain whatever the driver has buffered.
+
+        Selector readiness guarantees at least one byte, so the read never
+        waits for the configured timeout.
+        """
+        if port is not self.serial_port or not self.running:
+            self.config.reactor.unregister(port)
+            return
+        try:
+            data = port.read(port.in_waiting or 1)
+            if data:
+                self._handle_data(data)
+        except Exception as e:
+            self.config.reactor.unregister(port)
+            if self.running:
+                self._handle_error(e)
@@ -0,0 +1,314 @@
+"""Subscription modes and filters shared by the sync and async SDK clients
+
+A subscriber declares what it wants to receive for each frame:
+
+  - ``SubscriptionMode.DECODED`` (default): the codec's decoded object, or the
+    raw payload bytes when no codec is registered for the message ID.
+  - ``SubscriptionMode.RAW``: the original payload bytes exactly as received.
+    The codec never runs on their behalf and nothing is re-serialized.
+  - ``SubscriptionMode.LAZY``: a ``LazyMessage`` exposing ``raw`` immediately
+    and decoding on first ``decode()``.
+
+The SDK decodes a frame at most once: eagerly when at least one DECODED
+subscriber is present, otherwise on the first ``LazyMessage.decode()``. Every
+subscriber of the same frame shares that one result.
+
+A ``SubscriptionFilter`` narrows a subscription by header fields and by
+fixed-offset payload fields (``FieldFilter``). Header criteria are pushed
+down into the ``AccumulatingReader`` through a ``HeaderGate`` where that is
+safe (see ``HeaderGate``); everything else is checked before decoding.
+"""
+
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+
+class SubscriptionMode(Enum):
+    """What a subscribed handler receives as its first argument"""
+    DECODED = 'decoded'
+    RAW = 'raw'
+    LAZY = 'lazy'
+
+
+_UNSET = object()
+
+
+class LazyMessage:
+    """Per-frame view handed to LAZY subscribers.
+
+    ``raw`` is the payload as received. ``decode()`` runs the codec the first
+    time it is called and caches the result (or the exception) for every
+    other subscriber of the same frame. Without a codec it returns ``raw``.
+    """
+
+    __slots__ = ('msg_id', 'raw', '_deserialize', '_message', '_error')
+
+    def __init__(self, msg_id: int, raw: bytes,
+                 deserialize: Optional[Callable[[bytes], Any]],
+                 message: Any = _UNSET, error: Optional[Exception] = None):
+        self.msg_id = msg_id
+        self.raw = raw
+        self._deserialize = deserialize
+        # The SDK passes an eager decode's outcome so it is never repeated.
+        self._message = message if error is None else _UNSET
+        self._error = error
+
+    @property
+    def decoded(self) -> bool:
+        """True once the payload has been decoded (successfully or not)"""
+        return self._message is not _UNSET or self._error is not None
+
+    def decode(self) -> Any:
+        """Return the decoded message, decoding on first use"""
+        if self._message is not _UNSET:
+            return self._message
+        if self._error is not None:
+            raise self._error
+        if self._deserialize is None:
+            self._message = self.raw
+            return self.raw
+        try:
+            self._message = self._deserialize(self.raw)
+        except Exception as e:
+            self._error = e
+            raise
+        return self._message
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.raw)
+
+    def __repr__(self) -> str:
+        return f'LazyMessage(msg_id={self.msg_id}, len={len(self.raw)}, decoded={self.decoded})'
+
+
+class FieldFilter:
+    """Match a fixed-offset field of the payload.
+
+    ``fmt`` is a single-value ``struct`` format; without a byte-order prefix it
+    is read little-endian, like the generated messages. ``equals`` may be one
+    value or a collection of accepted values; ``min``/``max`` are inclusive.
+    Payloads too short to hold the field never match.
+
+    Example: ``FieldFilter(4, 'H', min=100)`` keeps frames whose uint16 at
+    payload offset 4 is at least 100.
+    """
+
+    __slots__ = ('offset', 'fmt', 'equals', 'min', 'max', '_unpack', '_end')
+
+    def __init__(self, offset: int, fmt: str = 'B', equals: Any = None,
+                 min: Optional[float] = None, max: Optional[float] = None):
+        if fmt[:1] not in '<>!=@':
+            fmt = '<' + fmt
+        packer = struct.Struct(fmt)
+        if len(packer.unpack(bytes(packer.size))) != 1:
+            raise ValueError(f'FieldFilter format must describe one value, got {fmt!r}')
+        if offset < 0:
+            raise ValueError('FieldFilter offset must be >= 0')
+        self.offset = offset
+        self.fmt = fmt
+        self.equals = equals
+        self.min = min
+        self.max = max
+        self._unpack = packer.unpack_from
+        self._end = offset + packer.size
+
+    def predicate(self) -> Callable[[bytes], bool]:
+        """Compile to ``payload -> bool``"""
+        unpack, offset, end = self._unpack, self.offset, self._end
+        equals, lo, hi = self.equals, self.min, self.max
+        if equals is not None and not isinstance(equals, (int, float, bool, bytes, str)):
+            test_eq = frozenset(equals).__contains__
+        elif equals is not None:
+            test_eq = lambda value: value == equals  # noqa: E731
+        else:
+            test_eq = None
+
+        def accept(payload) -> bool:
+            if len(payload) < end:
+                return False
+            value = unpack(payload, offset)[0]
+            if test_eq is not None and not test_eq(value):
+                return False
+            if lo is not None and value < lo:
+                return False
+            if hi is not None and value > hi:
+                return False
+            return True
+        return accept
+
+    def __repr__(self) -> str:
+        return (f'FieldFilter(offset={self.offset}, fmt={self.fmt!r}, equals={self.equals!r}, '
+                f'min={self.min!r}, max={self.max!r})')
+
+
+def _id_test(value: Union[None, int, Iterable[int]]) -> Optional[Callable[[int], bool]]:
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value.__eq__
+    return frozenset(value).__contains__
+
+
+@dataclass(frozen=True)
+class SubscriptionFilter:
+    """Declarative per-subscription filter.
+
+    Header criteria (``package_id``, ``sys_id``, ``comp_id``: one ID or a
+    collection of IDs; ``seq_range``: inclusive ``(lo, hi)``, wrapping when
+    ``lo > hi``) are checked from the frame header. When every subscriber of
+    a message ID carries header criteria the SDK pushes them into the reader,
+    so rejected frames are skipped before CRC validation and payload copy.
+    ``fields`` are ``FieldFilter`` checks on the payload, applied before any
+    decode. Criteria left as None match everything; a field the profile does
+    not carry reads as 0.
+    """
+    package_id: Union[None, int, Iterable[int]] = None
+    sys_id: Union[None, int, Iterable[int]] = None
+    comp_id: Union[None, int, Iterable[int]] = None
+    seq_range: Optional[Tuple[int, int]] = None
+    fields: Sequence[FieldFilter] = ()
+
+    def header_predicate(self) -> Optional[Callable[[int, int, int, int], bool]]:
+        """Compile the header criteria to ``(package_id, seq, sys_id, comp_id) -> bool``.
+
+        Returns None when no header criteria are set.
+        """
+        pkg_t, sys_t, comp_t = _id_test(self.package_id), _id_test(self.sys_id), _id_test(self.comp_id)
+        seq_t = None
+        if self.seq_range is not None:
+            lo, hi = self.seq_range
+            if lo <= hi:
+                seq_t = lambda seq: lo <= seq <= hi  # noqa: E731
+            else:
+                seq_t = lambda seq: seq >= lo or seq <= hi  # noqa: E731
+        if pkg_t is None and sys_t is None and comp_t is None and seq_t is None:
+            return None
+
+        def accept(package_id: int, seq: int, sys_id: int, comp_id: int) -> bool:
+            return ((pkg_t is None or pkg_t(package_id) is True)
+                    and (seq_t is None or seq_t(seq))
+                    and (sys_t is None or sys_t(sys_id) is True)
+                    and (comp_t is None or comp_t(comp_id) is True))
+        return accept
+
+    def predicate(self) -> Callable[[Any], bool]:
+        """Compile all criteria to ``FrameMsgInfo -> bool``"""
+        header = self.header_predicate()
+        fields = tuple(f.predicate() for f in self.fields)
+
+        def accept(result) -> bool:
+            if header is not None and not header(result.package_id, result.sequence,
+                                                 result.system_id, result.component_id):
+                return False
+            data = result.msg_data
+            for field_ok in fields:
+                if not field_ok(data):
+                    return False
+            return True
+        return accept
+
+
+class Subscription:
+    """One subscribe() call: handler, mode and compiled filter"""
+
+    __slots__ = ('handler', 'mode', 'filter', 'accept', 'header_accept')
+
+    def __init__(self, handler: Callable[[Any, int], None], mode: SubscriptionMode,
+                 filter: Optional[SubscriptionFilter] = None):
+        self.handler = handler
+        self.mode = mode
+        self.filter = filter
+        self.accept = filter.predicate() if filter is not None else None
+        self.header_accept = filter.header_predicate() if filter is not None else None
+
+
+class HeaderGate:
+    """Reader-level header filter built from the subscriptions.
+
+    A message ID is gated only when every one of its subscribers has header
+    criteria; a frame is then kept if any of them accepts it. Message IDs
+    with an unfiltered subscriber, or with no subscribers, always pass, so
+    unsubscribed traffic is parsed (and diagnosed) exactly as before.
+    """
+
+    def __init__(self):
+        self._gates: Dict[int, Tuple[Callable[[int, int, int, int], bool], ...]] = {}
+
+    def update(self, msg_id: int, subscriptions: Sequence[Subscription]) -> None:
+        preds = tuple(s.header_accept for s in subscriptions)
+        if preds and None not in preds:
+            self._gates[msg_id] = preds
+        else:
+            self._gates.pop(msg_id, None)
+
+    def __bool__(self) -> bool:
+        return bool(self._gates)
+
+    def __call__(self, msg_id: int, package_id: int, seq: int, sys_id: int, comp_id: int) -> bool:
+        preds = self._gates.get(msg_id)
+        if preds is None:
+            return True
+        for accept in preds:
+            if accept(package_id, seq, sys_id, comp_id):
+                return True
+        return False
+
+
+# Precompiled dispatch entry:
+#   (deserialize or None,
+#    plain handler tuple when every subscriber is DECODED and unfiltered, else None,
+#    decode eagerly?, any lazy subscriber?,
+#    ((handler, mode, accept or None), ...), any filtered subscriber?)
+DispatchHandler = Tuple[Callable[[Any, int], None], SubscriptionMode, Optional[Callable[[Any], bool]]]
+DispatchEntry = Tuple[Optional[Callable[[bytes], Any]], Optional[Tuple[Callable[[Any, int], None], ...]],
+                      bool, bool, Tuple[DispatchHandler, ...], bool]
+
+
+def subscription_mode(mode: Union[SubscriptionMode, str]) -> SubscriptionMode:
+    """Accept a ``SubscriptionMode`` or its string value ('decoded', 'raw', 'lazy')"""
+    if isinstance(mode, SubscriptionMode):
+        return mode
+    try:
+        return SubscriptionMode(mode)
+    except ValueError:
+        raise ValueError(
+            f"mode must be one of {[m.value for m in SubscriptionMode]}, got {mode!r}") from None
+
+
+def _needs(deserialize, handlers) -> Tuple[bool, bool]:
+    modes = {h[1] for h in handlers}
+    return (deserialize is not None and SubscriptionMode.DECODED in modes,
+            SubscriptionMode.LAZY in modes)
+
+
+def compile_dispatch_entry(deserialize: Optional[Callable[[bytes], Any]],
+                           subscriptions: Sequence[Subscription],
+                           wrap: Optional[Callable[[Callable], Callable]] = None) -> DispatchEntry:
+    """Build the read-only dispatch entry for one message ID.
+
+    *wrap*, if given, is applied to every handler (used for metrics timing).
+    """
+    if wrap is None:
+        handlers = tuple((s.handler, s.mode, s.accept) for s in subscriptions)
+    else:
+        handlers = tuple((wrap(s.handler), s.mode, s.accept) for s in subscriptions)
+    eager, lazy = _needs(deserialize, handlers)
+    filtered = any(h[2] is not None for h in handlers)
+    plain = None
+    if not filtered and all(h[1] is SubscriptionMode.DECODED for h in handlers):
+        plain = tuple(h[0] for h in handlers)
+    return (deserialize, plain, eager, lazy, handlers, filtered)
+
+
+def select_handlers(deserialize: Optional[Callable[[bytes], Any]],
+                    handlers: Tuple[DispatchHandler, ...], result) -> Tuple[bool, bool, Tuple[DispatchHandler, ...]]:
+    """Narrow a filtered entry to the handlers that accept *result*.
+
+    Returns ``(decode eagerly?, any lazy?, handlers)`` for the survivors so a
+    frame nobody kept is never decoded.
+    """
+    kept = tuple(h for h in handlers if h[2] is None or h[2](result))
+    eager, lazy = _needs(deserialize, kept)
+    return eager, lazy, kept
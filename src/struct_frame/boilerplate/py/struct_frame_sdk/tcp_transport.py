@@ -55,30 +55,29 @@ class TcpTransport(BaseSocketTransport):
             self._handle_error(e)
             raise
 
-    def _receive_loop(self) -> None:
-        """Receive loop running in separate thread using pre-allocated buffer.
-        
+    def _receive_once(self) -> bool:
+        """Receive one chunk into the pre-allocated buffer.
+
         Uses recv_into to receive directly into the pre-allocated buffer,
-        reducing socket-layer allocations. The bytes copy to pass to handler
-        is necessary to maintain API compatibility with bytes-expecting callbacks.
+        reducing socket-layer allocations. A view of the filled region is
+        handed on, so view callbacks see no copy and bytes callbacks see one.
         """
-        while self.running and self.socket:
-            try:
-                # Use recv_into with pre-allocated buffer to avoid socket-layer allocation
-                nbytes = self.socket.recv_into(self._recv_view)
-                if nbytes == 0:
-                    # Connection closed
-                    self._handle_close()
-                    break
-                # Copy received bytes for handler (maintains bytes-based callback API)
-                self._handle_data(bytes(self._recv_buffer[:nbytes]))
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.running:  # Only handle error if still running
-                    self._handle_error(e)
-                    # A receive error means the connection is no longer usable;
-                    # notify close handlers so the SDK/app stops treating it as
-                    # connected (and can trigger reconnect logic).
-                    self._handle_close()
-                break
+        try:
+            # Use recv_into with pre-allocated buffer to avoid socket-layer allocation
+            nbytes = self.socket.recv_into(self._recv_view)
+            if nbytes == 0:
+                # Connection closed
+                self._handle_close()
+                return False
+            self._handle_data_view(self._recv_view[:nbytes])
+            return True
+        except socket.timeout:
+            return True
+        except Exception as e:
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+                # A receive error means the connection is no longer usable;
+                # notify close handlers so the SDK/app stops treating it as
+                # connected (and can trigger reconnect logic).
+                self._handle_close()
+            return False
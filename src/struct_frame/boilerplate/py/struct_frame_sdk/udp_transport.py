@@ -5,6 +5,10 @@ from dataclasses import dataclass
 from .transport import BaseSocketTransport, SocketTransportConfig
 
 
+# Windows error raised when a datagram is larger than the receive buffer
+WSAEMSGSIZE = 10040
+
+
 @dataclass
 class UdpTransportConfig(SocketTransportConfig):
     """UDP transport configuration"""
@@ -48,34 +52,34 @@ class UdpTransport(BaseSocketTransport):
             self._handle_error(e)
             raise
 
-    def _receive_loop(self) -> None:
-        """Receive loop running in separate thread using pre-allocated buffer.
+    def _receive_once(self) -> bool:
+        """Receive one datagram into the pre-allocated buffer.
         
         Uses recvfrom_into to receive directly into the pre-allocated buffer,
-        reducing socket-layer allocations. The bytes copy to pass to handler
-        is necessary to maintain API compatibility with bytes-expecting callbacks.
+        reducing socket-layer allocations. A view of the filled region is
+        handed on, so view callbacks see no copy and bytes callbacks see one.
         """
         # WSAEMSGSIZE (Windows): a datagram larger than the receive buffer was
         # truncated. recvfrom_into raises rather than silently delivering a partial
         # datagram. We report and drop that datagram and keep listening instead of
         # tearing down the receive loop; size buffer_size for the profile's largest
         # expected frame to avoid this.
-        WSAEMSGSIZE = 10040
-        while self.running and self.socket:
-            try:
-                # Use recvfrom_into with pre-allocated buffer to reduce socket-layer allocation
-                nbytes, addr = self.socket.recvfrom_into(self._recv_view)
-                # Copy received bytes for handler (maintains bytes-based callback API)
-                self._handle_data(bytes(self._recv_buffer[:nbytes]))
-            except OSError as e:
-                if getattr(e, 'winerror', None) == WSAEMSGSIZE or getattr(e, 'errno', None) == WSAEMSGSIZE:
-                    if self.running:
-                        self._handle_error(e)
-                    continue
-                if self.running:  # Only handle error if still running
-                    self._handle_error(e)
-                break
-            except Exception as e:
-                if self.running:  # Only handle error if still running
+        try:
+            # Use recvfrom_into with pre-allocated buffer to reduce socket-layer allocation
+            nbytes, addr = self.socket.recvfrom_into(self._recv_view)
+            self._handle_data_view(self._recv_view[:nbytes])
+            return True
+        except socket.timeout:
+            return True
+        except OSError as e:
+            if getattr(e, 'winerror', None) == WSAEMSGSIZE or getattr(e, 'errno', None) == WSAEMSGSIZE:
+                if self.running:
                     self._handle_error(e)
-                break
+                return True
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+            return False
+        except Exception as e:
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+            return False
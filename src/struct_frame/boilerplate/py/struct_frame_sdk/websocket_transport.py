@@ -25,6 +25,10 @@ class WebSocketTransport(BaseTransport):
         super().__init__(config)
         if websocket is None:
             raise ImportError('websocket-client package is required. Install with: pip install websocket-client')
+        if config.reactor is not None:
+            # websocket-client owns framing, pings and TLS buffering inside
+            # run_forever(); socket readiness alone cannot drive it safely.
+            raise ValueError('WebSocketTransport does not support reactor mode')
         self.ws_config = config
         self.ws: Optional[websocket.WebSocketApp] = None
         self.ws_thread: Optional[threading.Thread] = None
@@ -2,34 +2,20 @@
 # kate: replace-tabs on; indent-width 4;
 
 
+import fnmatch
 import os
 import shutil
+import stat
+import threading
 import hashlib
 import json
 import time
-from struct_frame import FileCGen
-from struct_frame import FileTsGen, TestTsGen
-from struct_frame import FileJsGen, TestJsGen
-from struct_frame import FilePyGen
-from struct_frame import FileGqlGen
-from struct_frame import FileCppGen
-from struct_frame import FileCSharpGen
-from struct_frame import FileRustGen, TestRustGen
-from struct_frame import TestCppGen
-from struct_frame import TestPyGen
-from struct_frame import TestCGen
-from struct_frame import TestCSharpGen
 from struct_frame import pascal_case
 from struct_frame import camel_to_snake_case
-from proto_schema_parser.parser import Parser
-from proto_schema_parser import ast
-from proto_schema_parser.ast import FieldCardinality
+from struct_frame.parse_cache import ParseCache, CACHE_DIRNAME
 
 import argparse
 
-current_error_field = ""
-current_error_message = ""
-
 default_types = {
     "uint8": {"size": 1},
     "int8": {"size": 1},
@@ -171,25 +157,9 @@ def get_version():
     return "unknown"
 
 
-def compute_generation_hash(args, packages_dict):
-    """
-    Compute a hash based on CLI parameters, struct-frame version, and parsed message definitions.
-
-    Args:
-        args: Parsed argparse arguments
-        packages_dict: Dictionary of parsed packages with their messages and enums
-
-    Returns:
-        str: SHA256 hash hex string
-    """
-    hasher = hashlib.sha256()
-
-    # 1. Add struct-frame version
-    version = get_version()
-    hasher.update(f"version:{version}\n".encode('utf-8'))
-
-    # 2. Add relevant CLI parameters (sorted for consistency)
-    cli_params = {
+def generation_cli_params(args):
+    """CLI parameters that affect generated output, for the generation hashes."""
+    return {
         'build_c': args.build_c,
         'build_ts': args.build_ts,
         'build_js': args.build_js,
@@ -212,86 +182,112 @@ def compute_generation_hash(args, packages_dict):
         'csharp_namespace': args.csharp_namespace[0],
         'no_packed': args.no_packed,
     }
-    hasher.update(
-        f"cli:{json.dumps(cli_params, sort_keys=True)}\n".encode('utf-8'))
 
-    # 3. Add parsed message definitions (sorted by package name for consistency)
-    for pkg_name in sorted(packages_dict.keys()):
-        pkg = packages_dict[pkg_name]
-        hasher.update(f"package:{pkg_name}\n".encode('utf-8'))
 
-        if pkg.package_id is not None:
-            hasher.update(f"  pkgid:{pkg.package_id}\n".encode('utf-8'))
+def hash_package_definitions(hasher, pkg_name, pkg):
+    """Feed one package's definitions into *hasher* (see compute_generation_hash)."""
+    hasher.update(f"package:{pkg_name}\n".encode('utf-8'))
 
-        # Add enums (sorted by name)
-        for enum_name in sorted(pkg.enums.keys()):
-            enum = pkg.enums[enum_name]
-            hasher.update(f"  enum:{enum_name}\n".encode('utf-8'))
+    if pkg.package_id is not None:
+        hasher.update(f"  pkgid:{pkg.package_id}\n".encode('utf-8'))
+
+    # Add enums (sorted by name)
+    for enum_name in sorted(pkg.enums.keys()):
+        enum = pkg.enums[enum_name]
+        hasher.update(f"  enum:{enum_name}\n".encode('utf-8'))
+        for entry_name in sorted(enum.data.keys()):
+            value, _ = enum.data[entry_name]
+            if enum.extensions_start is not None and value >= enum.extensions_start:
+                continue
+            hasher.update(f"    {entry_name}={value}\n".encode('utf-8'))
+
+    # Add messages (sorted by name)
+    for msg_name in sorted(pkg.messages.keys()):
+        msg = pkg.messages[msg_name]
+        hasher.update(f"  message:{msg_name}\n".encode('utf-8'))
+        if msg.id is not None:
+            hasher.update(f"    msgid:{msg.id}\n".encode('utf-8'))
+        if msg.variable:
+            hasher.update(f"    variable:true\n".encode('utf-8'))
+        if msg.is_envelope:
+            hasher.update(f"    is_envelope:true\n".encode('utf-8'))
+        if msg.extensions_start is not None:
+            hasher.update(f"    extensions_start:{msg.extensions_start}\n".encode('utf-8'))
+        if msg.magic_bytes_override is not None:
+            hasher.update(f"    magic_bytes:{msg.magic_bytes_override[0]},{msg.magic_bytes_override[1]}\n".encode('utf-8'))
+
+        # Add message-scoped enums (sorted by name)
+        for enum_name in sorted(msg.enums.keys()):
+            enum = msg.enums[enum_name]
+            hasher.update(f"    enum:{enum_name}\n".encode('utf-8'))
             for entry_name in sorted(enum.data.keys()):
                 value, _ = enum.data[entry_name]
                 if enum.extensions_start is not None and value >= enum.extensions_start:
                     continue
-                hasher.update(f"    {entry_name}={value}\n".encode('utf-8'))
-
-        # Add messages (sorted by name)
-        for msg_name in sorted(pkg.messages.keys()):
-            msg = pkg.messages[msg_name]
-            hasher.update(f"  message:{msg_name}\n".encode('utf-8'))
-            if msg.id is not None:
-                hasher.update(f"    msgid:{msg.id}\n".encode('utf-8'))
-            if msg.variable:
-                hasher.update(f"    variable:true\n".encode('utf-8'))
-            if msg.is_envelope:
-                hasher.update(f"    is_envelope:true\n".encode('utf-8'))
-            if msg.extensions_start is not None:
-                hasher.update(f"    extensions_start:{msg.extensions_start}\n".encode('utf-8'))
-            if msg.magic_bytes_override is not None:
-                hasher.update(f"    magic_bytes:{msg.magic_bytes_override[0]},{msg.magic_bytes_override[1]}\n".encode('utf-8'))
-
-            # Add message-scoped enums (sorted by name)
-            for enum_name in sorted(msg.enums.keys()):
-                enum = msg.enums[enum_name]
-                hasher.update(f"    enum:{enum_name}\n".encode('utf-8'))
-                for entry_name in sorted(enum.data.keys()):
-                    value, _ = enum.data[entry_name]
-                    if enum.extensions_start is not None and value >= enum.extensions_start:
-                        continue
-                    hasher.update(f"      {entry_name}={value}\n".encode('utf-8'))
-
-            # Add fields (sorted by name)
-            for field_name in sorted(msg.fields.keys()):
-                field = msg.fields[field_name]
-                field_info = f"    field:{field_name}:{field.field_type}"
-                if field.is_array:
-                    field_info += ":array"
-                if field.size_option is not None:
-                    field_info += f":size={field.size_option}"
-                if field.max_size is not None:
-                    field_info += f":max_size={field.max_size}"
-                if field.element_size is not None:
-                    field_info += f":element_size={field.element_size}"
-                if field.flatten:
-                    field_info += ":flatten"
-                hasher.update(f"{field_info}\n".encode('utf-8'))
-
-            # Add oneofs (sorted by name)
-            for oneof_name in sorted(msg.oneofs.keys()):
-                oneof = msg.oneofs[oneof_name]
-                hasher.update(f"    oneof:{oneof_name}\n".encode('utf-8'))
-                if oneof.variable:
-                    hasher.update(f"      variable:true\n".encode('utf-8'))
-                if oneof.discriminator_mode and oneof.discriminator_mode != "auto":
-                    hasher.update(f"      discriminator:{oneof.discriminator_mode}\n".encode('utf-8'))
-                if oneof.max_size_override is not None:
-                    hasher.update(f"      max_size:{oneof.max_size_override}\n".encode('utf-8'))
-                if oneof.min_size_override is not None:
-                    hasher.update(f"      min_size:{oneof.min_size_override}\n".encode('utf-8'))
-                if oneof.extensions_start is not None:
-                    hasher.update(f"      extensions_start:{oneof.extensions_start}\n".encode('utf-8'))
-                for oneof_field_name in sorted(oneof.fields.keys()):
-                    oneof_field = oneof.fields[oneof_field_name]
-                    hasher.update(
-                        f"      field:{oneof_field_name}:{oneof_field.field_type}\n".encode('utf-8'))
+                hasher.update(f"      {entry_name}={value}\n".encode('utf-8'))
+
+        # Add fields (sorted by name)
+        for field_name in sorted(msg.fields.keys()):
+            field = msg.fields[field_name]
+            field_info = f"    field:{field_name}:{field.field_type}"
+            if field.is_array:
+                field_info += ":array"
+            if field.size_option is not None:
+                field_info += f":size={field.size_option}"
+            if field.max_size is not None:
+                field_info += f":max_size={field.max_size}"
+            if field.element_size is not None:
+                field_info += f":element_size={field.element_size}"
+            if field.flatten:
+                field_info += ":flatten"
+            hasher.update(f"{field_info}\n".encode('utf-8'))
+
+        # Add oneofs (sorted by name)
+        for oneof_name in sorted(msg.oneofs.keys()):
+            oneof = msg.oneofs[oneof_name]
+            hasher.update(f"    oneof:{oneof_name}\n".encode('utf-8'))
+            if oneof.variable:
+                hasher.update(f"      variable:true\n".encode('utf-8'))
+            if oneof.discriminator_mode and oneof.discriminator_mode != "auto":
+                hasher.update(f"      discriminator:{oneof.discriminator_mode}\n".encode('utf-8'))
+            if oneof.max_size_override is not None:
+                hasher.update(f"      max_size:{oneof.max_size_override}\n".encode('utf-8'))
+            if oneof.min_size_override is not None:
+                hasher.update(f"      min_size:{oneof.min_size_override}\n".encode('utf-8'))
+            if oneof.extensions_start is not None:
+                hasher.update(f"      extensions_start:{oneof.extensions_start}\n".encode('utf-8'))
+            for oneof_field_name in sorted(oneof.fields.keys()):
+                oneof_field = oneof.fields[oneof_field_name]
+                hasher.update(
+                    f"      field:{oneof_field_name}:{oneof_field.field_type}\n".encode('utf-8'))
+
+
+def compute_generation_hash(args, packages_dict):
+    """
+    Compute a hash based on CLI parameters, struct-frame version, and parsed message definitions.
+
+    Args:
+        args: Parsed argparse arguments
+        packages_dict: Dictionary of parsed packages with their messages and enums
+
+    Returns:
+        str: SHA256 hash hex string
+    """
+    hasher = hashlib.sha256()
+
+    # 1. Add struct-frame version
+    version = get_version()
+    hasher.update(f"version:{version}\n".encode('utf-8'))
+
+    # 2. Add relevant CLI parameters (sorted for consistency)
+    cli_params = generation_cli_params(args)
+    hasher.update(
+        f"cli:{json.dumps(cli_params, sort_keys=True)}\n".encode('utf-8'))
+
+    # 3. Add parsed message definitions (sorted by package name for consistency)
+    for pkg_name in sorted(packages_dict.keys()):
+        pkg = packages_dict[pkg_name]
+        hash_package_definitions(hasher, pkg_name, pkg)
 
     return hasher.hexdigest()
 
@@ -369,6 +365,327 @@ def write_generation_hash(hash_file_path, hash_value):
         f.write(hash_value)
 
 
+# Pre-parse cache: source digests of the import closure, stored next to the
+# generation hash so an unchanged tree is detected without parsing.
+SOURCES_FILENAME = ".structframe.sources"
+
+
+def hash_source_text(text):
+    """SHA256 of a source file's text, as read by parseFile()."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compute_source_key(args, root_file, digests, absent_paths):
+    """
+    Compute the pre-parse cache key from source digests, CLI parameters and version.
+
+    Args:
+        args: Parsed argparse arguments
+        root_file: Absolute path of the root proto file
+        digests: {absolute source path: content digest} for the import closure
+        absent_paths: Import candidates that did not exist when imports were
+            resolved (creating one would change which file an import resolves to)
+
+    Returns:
+        str: SHA256 hash hex string
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"version:{get_version()}\n".encode('utf-8'))
+    hasher.update(
+        f"cli:{json.dumps(generation_cli_params(args), sort_keys=True)}\n".encode('utf-8'))
+    hasher.update(f"root:{root_file}\n".encode('utf-8'))
+    for path in sorted(digests):
+        hasher.update(f"source:{path}:{digests[path]}\n".encode('utf-8'))
+    for path in sorted(absent_paths):
+        hasher.update(f"absent:{path}\n".encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def get_sources_file_path(hash_file_path):
+    """Path of the source manifest stored next to the hash file."""
+    return os.path.join(os.path.dirname(hash_file_path), SOURCES_FILENAME)
+
+
+def write_source_manifest(sources_file_path, source_key, generation_hash, digests, absent_paths):
+    """
+    Write the source manifest (cache key, generation hash and import closure).
+
+    Args:
+        sources_file_path: Path to the manifest file
+        source_key: Key from compute_source_key()
+        generation_hash: Generation hash the key maps to
+        digests: {absolute source path: content digest}
+        absent_paths: Import candidates that did not exist
+    """
+    dirname = os.path.dirname(sources_file_path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    manifest = {
+        'key': source_key,
+        'generation_hash': generation_hash,
+        'files': dict(sorted(digests.items())),
+        'absent': sorted(absent_paths),
+    }
+    with open(sources_file_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+
+
+def sources_unchanged(args, root_file, sources_file_path, hash_file_path):
+    """
+    Check the source manifest against the current tree without parsing.
+
+    True when every recorded source still has its recorded content, no
+    recorded absent import candidate has appeared, the CLI parameters and
+    version match, and the manifest belongs to the stored generation hash.
+    """
+    try:
+        with open(sources_file_path, 'r') as f:
+            manifest = json.load(f)
+        files = manifest['files']
+        absent_paths = manifest['absent']
+        if manifest['generation_hash'] != read_previous_hash(hash_file_path):
+            return False
+        if root_file not in files:
+            return False
+        if any(os.path.exists(path) for path in absent_paths):
+            return False
+        digests = {}
+        for path in files:
+            with open(path, 'r') as f:
+                digests[path] = hash_source_text(f.read())
+            if digests[path] != files[path]:
+                return False
+    except (OSError, ValueError, KeyError, TypeError, UnicodeDecodeError):
+        return False
+    return manifest['key'] == compute_source_key(args, root_file, digests, absent_paths)
+
+
+# Per-package state of the previous generation, for incremental regeneration.
+PACKAGES_FILENAME = ".structframe.packages"
+
+
+def compute_package_hashes(packages_dict, pkg_imports, digests, files_to_packages):
+    """
+    Compute a hash per package covering everything its generated files depend on.
+
+    Each hash covers the package's definitions, the text of its source files
+    and, transitively, the hashes of the packages it imports, so a change in
+    one package changes the hash of every package that depends on it.
+
+    Args:
+        packages_dict: {package name: Package}
+        pkg_imports: {package name: [imported package names]}
+        digests: {absolute source path: content digest}
+        files_to_packages: {absolute source path: package name}
+
+    Returns:
+        dict: {package name: SHA256 hash hex string}
+    """
+    own = {}
+    for pkg_name in sorted(packages_dict):
+        hasher = hashlib.sha256()
+        hash_package_definitions(hasher, pkg_name, packages_dict[pkg_name])
+        for path in sorted(p for p, owner in files_to_packages.items() if owner == pkg_name):
+            if path in digests:
+                hasher.update(f"source:{digests[path]}\n".encode('utf-8'))
+        own[pkg_name] = hasher.hexdigest()
+
+    # Packages on an import cycle depend on the whole cycle; hash everything.
+    all_own = hashlib.sha256(''.join(own[name] for name in sorted(own)).encode('utf-8')).hexdigest()
+    result = {}
+    for pkg_name in topological_sort_packages(packages_dict, pkg_imports):
+        hasher = hashlib.sha256(f"own:{own[pkg_name]}\n".encode('utf-8'))
+        for dep in sorted(set(pkg_imports.get(pkg_name, []))):
+            if dep not in packages_dict or dep == pkg_name:
+                continue
+            if dep in result:
+                hasher.update(f"import:{dep}:{result[dep]}\n".encode('utf-8'))
+            else:
+                hasher.update(f"cycle:{all_own}\n".encode('utf-8'))
+        result[pkg_name] = hasher.hexdigest()
+    return result
+
+
+def compute_package_settings_key(args):
+    """Hash of everything besides the definitions that affects every package's output."""
+    settings = dict(generation_cli_params(args), generate_tests=args.generate_tests)
+    return hashlib.sha256(
+        f"version:{get_version()}\ncli:{json.dumps(settings, sort_keys=True)}\n".encode('utf-8')).hexdigest()
+
+
+def get_packages_file_path(hash_file_path):
+    """Path of the per-package manifest stored next to the hash file."""
+    return os.path.join(os.path.dirname(hash_file_path), PACKAGES_FILENAME)
+
+
+def packages_to_regenerate(args, package_hashes, packages_file_path):
+    """
+    Names of packages whose hash differs from the previous generation.
+
+    Every package is returned when there is no usable manifest or when the
+    CLI parameters or version changed.
+    """
+    try:
+        with open(packages_file_path, 'r') as f:
+            manifest = json.load(f)
+        if manifest['settings'] != compute_package_settings_key(args):
+            return set(package_hashes)
+        previous = manifest['packages']
+        return {name for name, value in package_hashes.items() if previous.get(name) != value}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return set(package_hashes)
+
+
+def write_package_manifest(args, packages_file_path, package_hashes):
+    """Record per-package hashes after a successful generation."""
+    dirname = os.path.dirname(packages_file_path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    manifest = {
+        'settings': compute_package_settings_key(args),
+        'packages': dict(sorted(package_hashes.items())),
+    }
+    with open(packages_file_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+
+
+def file_has_content(filename, data):
+    """True if *filename* exists and holds exactly the bytes *data*."""
+    try:
+        if os.stat(filename).st_size != len(data):
+            return False
+        with open(filename, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def replace_file(filename, write):
+    """
+    Atomically replace *filename* with the content that *write* writes.
+
+    *write* is called with a temporary file in the same directory, which is
+    then renamed over *filename*, so readers never see a partly written
+    file. An existing file keeps its permission bits.
+    """
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    tmp_path = os.path.join(dirname, '.%s.%d.%d.tmp' % (
+        os.path.basename(filename), os.getpid(), threading.get_ident()))
+    try:
+        write(tmp_path)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass
+        # Retry on transient PermissionError (e.g. Windows file lock from
+        # the .NET build server or an IDE holding the .csproj open briefly).
+        for _attempt in range(5):
+            try:
+                os.replace(tmp_path, filename)
+                tmp_path = None
+                return
+            except PermissionError:
+                if _attempt == 4:
+                    raise
+                time.sleep(0.5)
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def write_if_changed(filename, filedata):
+    """
+    Write *filedata* to *filename* unless the file already has exactly that content.
+
+    Leaving identical files untouched keeps their mtimes, so downstream
+    builds (make, cargo, msbuild) do not rebuild them. Changed files are
+    replaced atomically.
+
+    Returns:
+        bool: True if the file was written
+    """
+    # Text mode would have written platform line endings.
+    data = filedata.encode('utf-8')
+    if os.linesep != '\n':
+        data = data.replace(b'\n', os.linesep.encode('ascii'))
+    if file_has_content(filename, data):
+        return False
+
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    replace_file(filename, write)
+    return True
+
+
+def copy_if_changed(src, dst):
+    """
+    Copy *src* to *dst* (with its mode and mtime) unless they already match.
+
+    A destination with the source's size and mtime was copied by an earlier
+    run and is not read; otherwise equal sizes are compared byte by byte.
+
+    Returns:
+        bool: True if the file was copied
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        dst_stat = None
+    if dst_stat is not None and dst_stat.st_size == src_stat.st_size:
+        if dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return False
+        with open(src, 'rb') as f:
+            if file_has_content(dst, f.read()):
+                return False
+
+    def write(tmp_path):
+        shutil.copyfile(src, tmp_path)
+        shutil.copystat(src, tmp_path)
+    replace_file(dst, write)
+    return True
+
+
+def copy_tree_if_changed(src_dir, dst_dir, exclude=()):
+    """
+    Copy the files under *src_dir* into *dst_dir* with copy_if_changed().
+
+    Names matching a glob pattern in *exclude* are skipped at every level.
+    Symbolic links are followed; dangling ones are skipped. Files in
+    *dst_dir* that have no source are left alone.
+
+    Returns:
+        tuple: (files copied, files already up to date)
+    """
+    copied = unchanged = 0
+    if not os.path.isdir(src_dir):
+        return copied, unchanged
+    os.makedirs(dst_dir, exist_ok=True)
+    for item in sorted(os.listdir(src_dir)):
+        if any(fnmatch.fnmatch(item, pattern) for pattern in exclude):
+            continue
+        src_path = os.path.join(src_dir, item)
+        dst_path = os.path.join(dst_dir, item)
+        if os.path.isdir(src_path):
+            sub_copied, sub_unchanged = copy_tree_if_changed(src_path, dst_path, exclude)
+            copied += sub_copied
+            unchanged += sub_unchanged
+        elif os.path.isfile(src_path):
+            if copy_if_changed(src_path, dst_path):
+                copied += 1
+            else:
+                unchanged += 1
+    return copied, unchanged
+
+
 class Enum:
     def __init__(self, package, comments):
         self.name = None
@@ -384,6 +701,7 @@ class Enum:
         self.extensions_start = None
 
     def parse(self, enum):
+        from proto_schema_parser import ast
         self.name = enum.name
         comments = []
         for e in enum.elements:
@@ -407,7 +725,7 @@ class Enum:
 
         return True
 
-    def validate(self, current_package, packages, debug=False):
+    def validate(self, current_package, packages, debug=False, symbols=None):
         return True
 
     def __str__(self):
@@ -451,6 +769,7 @@ class Field:
         self.is_extension = False
 
     def parse(self, field):
+        from proto_schema_parser.ast import FieldCardinality
         self.name = field.name
         self.field_type = field.type
         self.number = getattr(field, 'number', None)
@@ -518,10 +837,7 @@ class Field:
             pass
         return True
 
-    def validate(self, current_package, packages, debug=False, current_message=None):
-
-        global current_error_field
-        current_error_field = self.name
+    def validate(self, current_package, packages, debug=False, current_message=None, symbols=None):
         if not self.validated:
             # Check for nested enum in the current message first (unqualified name only)
             if (current_message and '.' not in self.field_type
@@ -533,36 +849,13 @@ class Field:
                 base_size = nested_enum.size
             else:
                 # Handle fully-qualified type names like "pkg_name.TypeName"
-                bare_type = self.field_type
-                qualified_pkg = None
-                if '.' in self.field_type:
-                    parts = self.field_type.split('.', 1)
-                    qualified_pkg = parts[0]
-                    bare_type = parts[1]
-
-                if qualified_pkg:
-                    # Qualified name: search only in the named package
-                    ret = None
-                    source_package = None
-                    if qualified_pkg in packages:
-                        ret = packages[qualified_pkg].find_field_type(bare_type)
-                        if ret:
-                            source_package = packages[qualified_pkg]
-                else:
-                    # First try to find the type in the current package
-                    ret = current_package.find_field_type(self.field_type)
-                    source_package = current_package
-
-                    # If not found in current package, search in all packages
-                    if not ret:
-                        for pkg_name, pkg in packages.items():
-                            ret = pkg.find_field_type(self.field_type)
-                            if ret:
-                                source_package = pkg
-                                break
+                bare_type = self.field_type.split('.', 1)[-1]
+                if symbols is None:
+                    symbols = SymbolTable(packages)
+                ret, source_package = symbols.resolve(self.field_type, current_package)
 
                 if ret:
-                    if ret.validate(current_package, packages, debug):
+                    if ret.validate(source_package, packages, debug, symbols):
                         self.is_enum = ret.is_enum
                         self.validated = True
                         base_size = ret.size
@@ -729,6 +1022,7 @@ class OneOf:
 
     def parse(self, oneof_element):
         """Parse a oneof element from the AST."""
+        from proto_schema_parser import ast
         self.name = oneof_element.name
         comments = []
 
@@ -814,10 +1108,12 @@ class OneOf:
                     self._pending_extensions = False
         return True
 
-    def validate(self, current_package, packages, debug=False, current_message=None):
+    def validate(self, current_package, packages, debug=False, current_message=None, symbols=None):
         """Validate all fields in the oneof and determine size."""
         if self.validated:
             return True
+        if symbols is None:
+            symbols = SymbolTable(packages)
 
         # Field-number validation: each oneof has its own number space; fields
         # must be 1..M sequentially in declaration order.
@@ -858,7 +1154,8 @@ class OneOf:
         all_have_msg_id = True
 
         for key, field in self.fields.items():
-            if not field.validate(current_package, packages, debug, current_message=current_message):
+            if not field.validate(current_package, packages, debug, current_message=current_message,
+                                  symbols=symbols):
                 print(f"Failed to validate field {key} in oneof {self.name}")
                 return False
             max_size = max(max_size, field.size)
@@ -867,13 +1164,7 @@ class OneOf:
 
             # Check if this field's type has a message ID
             if not field.is_default_type and not field.is_enum:
-                field_type = current_package.find_field_type(field.field_type)
-                # If not found in current package, search in all packages
-                if not field_type:
-                    for pkg_name, pkg in packages.items():
-                        field_type = pkg.find_field_type(field.field_type)
-                        if field_type:
-                            break
+                field_type, _pkg = symbols.resolve(field.field_type, current_package)
 
                 if field_type and hasattr(field_type, 'id') and field_type.id is not None:
                     # This message type has an ID
@@ -956,7 +1247,7 @@ class OneOf:
         self.variant_info = []
         for field_name, field in self.fields.items():
             if self.discriminator_type is not None:
-                disc_val = self.get_field_discriminator_value(field_name, current_package, packages)
+                disc_val = self.get_field_discriminator_value(field_name, current_package, packages, symbols)
             else:
                 disc_val = 0
             self.variant_info.append((disc_val, field_name, field.size))
@@ -964,7 +1255,7 @@ class OneOf:
         self.validated = True
         return True
 
-    def get_field_discriminator_value(self, field_name, current_package, packages):
+    def get_field_discriminator_value(self, field_name, current_package, packages, symbols=None):
         """Get the discriminator value for a field based on discriminator_type.
 
         Returns:
@@ -972,12 +1263,9 @@ class OneOf:
         """
         if self.discriminator_type == "msgid":
             field = self.fields[field_name]
-            field_type = current_package.find_field_type(field.field_type)
-            if not field_type:
-                for pkg_name, pkg in packages.items():
-                    field_type = pkg.find_field_type(field.field_type)
-                    if field_type:
-                        break
+            if symbols is None:
+                symbols = SymbolTable(packages)
+            field_type, _pkg = symbols.resolve(field.field_type, current_package)
             return field_type.id if field_type else 0
         elif self.discriminator_type == "field_order":
             # 1-based index
@@ -1019,6 +1307,7 @@ class Message:
         self.base_size = 0
 
     def parse(self, msg):
+        from proto_schema_parser import ast
         self.name = msg.name
         comments = []
         for e in msg.elements:
@@ -1118,12 +1407,11 @@ class Message:
                     return False
         return True
 
-    def validate(self, current_package, packages, debug=False):
+    def validate(self, current_package, packages, debug=False, symbols=None):
         if self.validated:
             return True
-
-        global current_error_message
-        current_error_message = self.name
+        if symbols is None:
+            symbols = SymbolTable(packages)
 
         # Field-number validation: non-oneof fields must be numbered 1..N
         # in declaration order. Numbers carry no wire-format meaning (wire
@@ -1160,7 +1448,7 @@ class Message:
 
         # Validate regular fields
         for key, value in self.fields.items():
-            if not value.validate(current_package, packages, debug, current_message=self):
+            if not value.validate(current_package, packages, debug, current_message=self, symbols=symbols):
                 print(
                     f"Failed To validate Field: {key}, in Message {self.name}\n")
                 return False
@@ -1175,7 +1463,7 @@ class Message:
                 sole_oneof.discriminator_mode = self.discriminator_mode
 
         for key, oneof in self.oneofs.items():
-            if not oneof.validate(current_package, packages, debug, current_message=self):
+            if not oneof.validate(current_package, packages, debug, current_message=self, symbols=symbols):
                 print(
                     f"Failed To validate OneOf: {key}, in Message {self.name}\n")
                 return False
@@ -1262,13 +1550,7 @@ class Message:
             if oneof.discriminator_type == "msgid":
                 for field_name, field in oneof.fields.items():
                     # Find the message type and verify it has a message ID
-                    field_type = current_package.find_field_type(
-                        field.field_type)
-                    if not field_type:
-                        for pkg_name, pkg in packages.items():
-                            field_type = pkg.find_field_type(field.field_type)
-                            if field_type:
-                                break
+                    field_type, _pkg = symbols.resolve(field.field_type, current_package)
 
                     if not field_type or not hasattr(field_type, 'id') or field_type.id is None:
                         print(
@@ -1333,6 +1615,102 @@ class Message:
         return output
 
 
+def dependency_order(roots, dependencies):
+    """
+    Depth-first post-order of *roots* and everything they depend on.
+
+    Uses an explicit stack, so long dependency chains do not hit the
+    recursion limit.
+
+    Args:
+        roots: Nodes to visit, in order
+        dependencies: Function returning the nodes a node depends on
+
+    Returns:
+        tuple: (order, cycle). order lists each node after its dependencies.
+            cycle is None, or the first cycle found as [a, b, ..., a], in
+            which case order is incomplete.
+    """
+    order = []
+    done = set()
+    for root in roots:
+        if root in done:
+            continue
+        path = [root]
+        on_path = {root: 0}
+        pending = [iter(dependencies(root))]
+        while pending:
+            for dep in pending[-1]:
+                if dep in on_path:
+                    return order, path[on_path[dep]:] + [dep]
+                if dep not in done:
+                    on_path[dep] = len(path)
+                    path.append(dep)
+                    pending.append(iter(dependencies(dep)))
+                    break
+            else:
+                pending.pop()
+                node = path.pop()
+                del on_path[node]
+                done.add(node)
+                order.append(node)
+    return order, None
+
+
+class SymbolTable:
+    """
+    Type lookups across all packages, indexed once per validation.
+
+    An unqualified name is looked up in the current package first and then
+    in the first package (in package order) that defines it; ``pkg.Name``
+    is looked up in ``pkg`` only.
+    """
+
+    def __init__(self, packages):
+        self.packages = packages
+        self.first_definition = {}
+        for pkg in packages.values():
+            for name in pkg.enums:
+                self.first_definition.setdefault(name, pkg)
+            for name in pkg.messages:
+                self.first_definition.setdefault(name, pkg)
+
+    def resolve(self, type_name, current_package):
+        """
+        Returns:
+            tuple: (Enum or Message, defining Package), or (None, None)
+        """
+        if '.' in type_name:
+            pkg_name, bare_type = type_name.split('.', 1)
+            pkg = self.packages.get(pkg_name)
+            definition = pkg.find_field_type(bare_type) if pkg is not None else None
+            return (definition, pkg) if definition is not None else (None, None)
+        definition = current_package.find_field_type(type_name)
+        if definition is not None:
+            return definition, current_package
+        pkg = self.first_definition.get(type_name)
+        if pkg is None:
+            return None, None
+        return pkg.find_field_type(type_name), pkg
+
+    def message_dependencies(self, message):
+        """Unvalidated messages that the fields of *message* embed."""
+        if message.validated:
+            return []
+        package = self.packages[message.package]
+        fields = list(message.fields.values())
+        for oneof in message.oneofs.values():
+            fields.extend(oneof.fields.values())
+        deps = []
+        for field in fields:
+            if field.validated or ('.' not in field.field_type and field.field_type in message.enums):
+                continue
+            definition, _pkg = self.resolve(field.field_type, package)
+            if isinstance(definition, Message) and not definition.validated:
+                deps.append(definition)
+        return deps
+
+
 class Package:
     def __init__(self, name):
         self.name = name
@@ -1358,20 +1736,20 @@ class Package:
         self.messages[message.name].source_file = source_file
         return self.messages[message.name].parse(message)
 
-    def validate_package(self, all_packages, debug=False):
-        names = []
+    def validate_package(self, all_packages, debug=False, symbols=None):
+        names = set()
         for key, value in self.enums.items():
             if value.name in names:
                 print(
                     f"Name collision with Enum and Message: {value.name} in Packaage {self.name}")
                 return False
-            names.append(value.name)
+            names.add(value.name)
         for key, value in self.messages.items():
             if value.name in names:
                 print(
                     f"Name collision with Enum and Message: {value.name} in Packaage {self.name}")
                 return False
-            names.append(value.name)
+            names.add(value.name)
 
         # Validate package ID if specified
         if self.package_id is not None:
@@ -1412,22 +1790,27 @@ class Package:
                             f"  Without package ID, message IDs must be in range [0, 65535]")
                         return False
 
-        for key, value in self.messages.items():
-            if not value.validate(self, all_packages, debug):
+        # Validate embedded messages before the messages that embed them
+        # (from any package), so sizes are known when they are needed.
+        if symbols is None:
+            symbols = SymbolTable(all_packages)
+        order, cycle = dependency_order(self.messages.values(), symbols.message_dependencies)
+        if cycle is not None:
+            print("Error: circular message dependency: " +
+                  " -> ".join(f"{msg.package}.{msg.name}" for msg in cycle))
+            return False
+        for value in order:
+            if not value.validate(all_packages[value.package], all_packages, debug, symbols):
                 print(
-                    f"Failed To validate Message: {key}, in Package {self.name}\n")
+                    f"Failed To validate Message: {value.name}, in Package {value.package}\n")
                 return False
 
         return True
 
     def find_field_type(self, name):
-        for key, value in self.enums.items():
-            if value.name == name:
-                return value
-
-        for key, value in self.messages.items():
-            if value.name == name:
-                return value
+        if name in self.enums:
+            return self.enums[name]
+        return self.messages.get(name)
 
     def sortedMessages(self):
         # Need to sort messages to ensure no out of order dependencies.
@@ -1445,384 +1828,525 @@ class Package:
         return output
 
 
-packages = {}
-processed_file = []
-required_file = []
-# Track which package imports which other packages: {importing_pkg: [imported_pkg1, imported_pkg2, ...]}
-package_imports = {}
-# Imports that could not be resolved when first seen because the target
-# package had not been parsed yet: [(importing_pkg, imported_abs_path), ...]
-pending_package_imports = []
-# Track the owning package for each parsed file so repeated imports can still
-# contribute package-level edges even when parseFile short-circuits.
-file_to_package = {}
+class GeneratorSession:
+    """
+    Parser and model state for one schema and its import closure.
 
-parser = argparse.ArgumentParser(
-    prog='struct_frame',
-    description='Message serialization and header generation program')
+    A session can be reused for several generations, and any number of
+    sessions can live in one process, so build systems can embed the
+    generator instead of starting it as a subprocess:
 
-parser.add_argument('filename', nargs='?', default=None,
-                    help='Proto file to process')
-parser.add_argument('--debug', action='store_true')
-parser.add_argument('--validate', action='store_true',
-                    help='Validate the proto file without generating any output files')
-parser.add_argument('--build_c', action='store_true')
-parser.add_argument('--build_ts', action='store_true')
-parser.add_argument('--build_js', action='store_true')
-parser.add_argument('--build_py', action='store_true')
-parser.add_argument('--build_cpp', action='store_true')
-parser.add_argument('--build_csharp', action='store_true')
-parser.add_argument('--c_path', nargs=1, type=str, default=['generated/c/'])
-parser.add_argument('--ts_path', nargs=1, type=str, default=['generated/ts/'])
-parser.add_argument('--js_path', nargs=1, type=str, default=['generated/js/'])
-parser.add_argument('--py_path', nargs=1, type=str, default=['generated/py/'])
-parser.add_argument('--cpp_path', nargs=1, type=str,
-                    default=['generated/cpp/'])
-parser.add_argument('--csharp_path', nargs=1, type=str,
-                    default=['generated/csharp/'])
-parser.add_argument('--build_gql', action='store_true')
-parser.add_argument('--gql_path', nargs=1, type=str,
-                    default=['generated/gql/'])
-parser.add_argument('--build_rust', action='store_true')
-parser.add_argument('--rust_path', nargs=1, type=str,
-                    default=['generated/rust/'])
-parser.add_argument('--catalog_path', nargs=1, type=str, default=['generated/'],
-                    help='Directory for the LSP type catalog file (sf_compile.json)')
-parser.add_argument('--sdk', action='store_true',
-                    help='Include full SDK with all transports (UDP, TCP, WebSocket, Serial)')
-parser.add_argument('--sdk_embedded', action='store_true',
-                    help='Include embedded SDK (serial transport only, no ASIO dependencies)')
-parser.add_argument('--equality', action='store_true',
-                    help='Generate equality comparison operators/methods for messages')
-parser.add_argument('--csharp_namespace', nargs=1, type=str, default=['StructFrame'],
-                    help='Root namespace for generated C# code (default: StructFrame)')
-parser.add_argument('--force', action='store_true',
-                    help='Force regeneration even if hash matches previous generation')
-parser.add_argument('--hash_path', nargs=1, type=str, default=[None],
-                    help='Path to store the generation hash file (default: first output path)')
-parser.add_argument('--generate_tests', action='store_true',
-                    help='Generate test code with dummy values for all messages (round-trip encode/decode verification)')
-parser.add_argument('--no_packed', action='store_true',
-                    help=('Generate code without packed structs. All messages are treated as variable, '
-                          'so serialization/deserialization is performed field-by-field instead of relying on '
-                          'packed memory layout. Useful on platforms that do not support struct packing or '
-                          'have different endianness/alignment requirements.'))
+        session = GeneratorSession()
+        if session.load('messages.sf'):
+            files = session.generate(['c', 'py'], paths={'c': 'gen/c/', 'py': 'gen/py/'})
+            write_files(files)
 
+    generate() returns the generated files only; the CLI also copies the
+    language boilerplate (frame parsers, SDK) into the output directories.
+    """
 
-def parseFile(filename, base_path=None, importing_package=None):
-    """Parse a proto file and handle imports recursively.
+    def __init__(self, parse_cache=None):
+        self.packages = {}
+        # Absolute paths of every file parsed so far (also stops import cycles)
+        self.processed_files = set()
+        # Which package imports which other packages, in import order:
+        # {importing_pkg: [imported_pkg1, imported_pkg2, ...]}
+        self.package_imports = {}
+        # (importing_pkg, imported_pkg) for every entry of package_imports
+        self.import_edges = set()
+        # Imports that could not be resolved when first seen because the target
+        # package had not been parsed yet: [(importing_pkg, imported_abs_path), ...]
+        self.pending_package_imports = []
+        # Owning package of each parsed file, so repeated imports can still
+        # contribute package-level edges even when parse_file short-circuits.
+        self.file_to_package = {}
+        # Content digest of every parsed file, and import candidates that were
+        # tried but did not exist; together they make up the pre-parse cache key.
+        self.source_digests = {}
+        self.absent_import_paths = set()
+        # Parsed-AST cache used by parse_file(), or None to always run the parser.
+        self.parse_cache = parse_cache
+
+    def reset(self):
+        """Forget every parsed file and package so the next parse starts afresh."""
+        self.packages.clear()
+        self.processed_files.clear()
+        self.package_imports.clear()
+        self.import_edges.clear()
+        self.pending_package_imports.clear()
+        self.file_to_package.clear()
+        self.source_digests.clear()
+        self.absent_import_paths.clear()
+
+    def load(self, filename, no_packed=False, debug=False):
+        """
+        Parse *filename* with its imports and validate the result.
 
-    Args:
-        filename: Path to the proto file to parse
-        base_path: Base directory for resolving relative imports (defaults to filename's directory)
-        importing_package: Name of the package that is importing this file (for tracking imports)
+        Any previously loaded model is discarded first. With *no_packed*,
+        every message is treated as variable (see ``--no_packed``).
 
-    Returns:
-        bool: True if parsing succeeded, False otherwise
-    """
-    # Convert to absolute path for circular import detection
-    abs_filename = os.path.abspath(filename)
+        Returns:
+            bool: True if the schema parsed and validated
+        """
+        self.reset()
+        if not self.parse_file(filename):
+            return False
+        if no_packed:
+            self.mark_all_variable()
+        return self.validate(debug)
 
-    if not processed_file and not packages and not package_imports:
-        file_to_package.clear()
-        pending_package_imports.clear()
+    def add_package_import(self, importer, imported):
+        """Record that package *importer* imports package *imported*."""
+        if (importer, imported) in self.import_edges:
+            return
+        self.import_edges.add((importer, imported))
+        self.package_imports.setdefault(importer, []).append(imported)
 
-    # Avoid circular imports
-    if abs_filename in processed_file:
-        return True
+    def parse_file(self, filename, base_path=None, importing_package=None):
+        """Parse a proto file and handle imports recursively.
 
-    processed_file.append(abs_filename)
+        Args:
+            filename: Path to the proto file to parse
+            base_path: Base directory for resolving relative imports (defaults to filename's directory)
+            importing_package: Name of the package that is importing this file (for tracking imports)
 
-    # Set base path for resolving imports
-    if base_path is None:
-        base_path = os.path.dirname(abs_filename)
+        Returns:
+            bool: True if parsing succeeded, False otherwise
+        """
+        # Imported here so that runs which never parse (up-to-date builds,
+        # --help) do not pay for loading the grammar.
+        from proto_schema_parser import ast
 
-    try:
-        with open(abs_filename, "r") as f:
-            result = Parser().parse(f.read())
-    except FileNotFoundError:
-        print(f"Error: Could not find file {filename}")
-        return False
-    except (OSError, ValueError, TypeError, SyntaxError, RuntimeError) as e:
-        print(f"Error parsing file {filename}: {e}")
-        return False
+        # Convert to absolute path for circular import detection
+        abs_filename = os.path.abspath(filename)
 
-    foundPackage = False
-    package_name = ""
-    comments = []
-    pending_imports = []
+        if not self.processed_files and not self.packages and not self.package_imports:
+            self.reset()
 
-    def record_package_import(importer, import_path):
-        imported_abs_path = os.path.abspath(import_path)
-        imported_package_name = file_to_package.get(imported_abs_path)
-        if not imported_package_name or importer == imported_package_name:
-            return False
-        if importer not in package_imports:
-            package_imports[importer] = []
-        if imported_package_name not in package_imports[importer]:
-            package_imports[importer].append(imported_package_name)
-        return True
+        # Avoid circular imports
+        if abs_filename in self.processed_files:
+            return True
 
-    for e in result.file_elements:
-        if (type(e) == ast.Package):
-            if foundPackage:
-                print(
-                    f"Multiple Package declaration found in file {filename} - {package_name}")
-                return False
-            foundPackage = True
-            package_name = e.name
-            if package_name not in packages:
-                packages[package_name] = Package(package_name)
-            file_to_package[abs_filename] = package_name
-            # Track import relationship if this file was imported
-            if importing_package and importing_package != package_name:
-                record_package_import(importing_package, abs_filename)
-                for pending_import in pending_imports:
-                    record_package_import(package_name, pending_import)
-                pending_imports.clear()
-
-        elif (type(e) == ast.Import):
-            # Handle import statements
-            import_file = e.name
-
-            # Try to resolve import path relative to base_path first
-            import_path_base = os.path.join(base_path, import_file)
-            import_path_current = os.path.join(
-                os.path.dirname(abs_filename), import_file)
-
-            if os.path.exists(import_path_base):
-                import_path = import_path_base
-            elif os.path.exists(import_path_current):
-                import_path = import_path_current
-            else:
-                print(
-                    f"Error: Could not find imported file '{import_file}' from {filename}")
-                print(f"  Tried: {import_path_base}")
-                print(f"  Tried: {import_path_current}")
-                return False
+        self.processed_files.add(abs_filename)
 
-            imported_abs_path = os.path.abspath(import_path)
-            if foundPackage and package_name:
-                if not record_package_import(package_name, imported_abs_path):
-                    pending_package_imports.append((package_name, imported_abs_path))
+        # Set base path for resolving imports
+        if base_path is None:
+            base_path = os.path.dirname(abs_filename)
+
+        try:
+            with open(abs_filename, "r") as f:
+                text = f.read()
+            digest = hash_source_text(text)
+            self.source_digests[abs_filename] = digest
+            if self.parse_cache is not None:
+                result = self.parse_cache.parse(text, digest)
             else:
-                pending_imports.append(imported_abs_path)
+                from proto_schema_parser.parser import Parser
+                result = Parser().parse(text)
+        except FileNotFoundError:
+            print(f"Error: Could not find file {filename}")
+            return False
+        except (OSError, ValueError, TypeError, SyntaxError, RuntimeError) as e:
+            print(f"Error parsing file {filename}: {e}")
+            return False
 
-            # Recursively parse the imported file, passing current package as importer
-            if not parseFile(import_path, base_path, package_name):
-                print(f"Error: Failed to parse imported file {import_file}")
-                return False
+        packages = self.packages
+        foundPackage = False
+        package_name = ""
+        comments = []
+        pending_imports = []
 
-        elif (type(e) == ast.Option):
-            # Handle file-level options (like pkgid)
-            if not foundPackage:
-                print(
-                    f"Option {e.name} found before package declaration in {filename}")
+        def record_package_import(importer, import_path):
+            imported_abs_path = os.path.abspath(import_path)
+            imported_package_name = self.file_to_package.get(imported_abs_path)
+            if not imported_package_name or importer == imported_package_name:
                 return False
-            if e.name == "pkgid":
-                if not validate_package_id(package_name, e.value, filename):
+            self.add_package_import(importer, imported_package_name)
+            return True
+
+        for e in result.file_elements:
+            if (type(e) == ast.Package):
+                if foundPackage:
+                    print(
+                        f"Multiple Package declaration found in file {filename} - {package_name}")
+                    return False
+                foundPackage = True
+                package_name = e.name
+                if package_name not in packages:
+                    packages[package_name] = Package(package_name)
+                self.file_to_package[abs_filename] = package_name
+                # Track import relationship if this file was imported
+                if importing_package and importing_package != package_name:
+                    record_package_import(importing_package, abs_filename)
+                    for pending_import in pending_imports:
+                        record_package_import(package_name, pending_import)
+                    pending_imports.clear()
+
+            elif (type(e) == ast.Import):
+                # Handle import statements
+                import_file = e.name
+
+                # Try to resolve import path relative to base_path first
+                import_path_base = os.path.join(base_path, import_file)
+                import_path_current = os.path.join(
+                    os.path.dirname(abs_filename), import_file)
+
+                if os.path.exists(import_path_base):
+                    import_path = import_path_base
+                elif os.path.exists(import_path_current):
+                    import_path = import_path_current
+                    self.absent_import_paths.add(os.path.abspath(import_path_base))
+                else:
+                    print(
+                        f"Error: Could not find imported file '{import_file}' from {filename}")
+                    print(f"  Tried: {import_path_base}")
+                    print(f"  Tried: {import_path_current}")
                     return False
 
-        elif (type(e) == ast.Enum):
-            if not foundPackage:
-                print(f"Enum found before package declaration in {filename}")
-                return False
-            if not packages[package_name].addEnum(e, comments, source_file=abs_filename):
-                print(
-                    f"Enum Error in Package: {package_name}  FileName: {filename} EnumName: {e.name}")
-                return False
-            comments = []
+                imported_abs_path = os.path.abspath(import_path)
+                if foundPackage and package_name:
+                    if not record_package_import(package_name, imported_abs_path):
+                        self.pending_package_imports.append((package_name, imported_abs_path))
+                else:
+                    pending_imports.append(imported_abs_path)
 
-        elif (type(e) == ast.Message):
-            if not foundPackage:
-                print(
-                    f"Message found before package declaration in {filename}")
-                return False
-            if not packages[package_name].addMessage(e, comments, source_file=abs_filename):
-                print(
-                    f"Message Error in Package: {package_name}  FileName: {filename} MessageName: {e.name}")
-                return False
-            comments = []
+                # Recursively parse the imported file, passing current package as importer
+                if not self.parse_file(import_path, base_path, package_name):
+                    print(f"Error: Failed to parse imported file {import_file}")
+                    return False
 
-        elif (type(e) == ast.Comment):
-            comments.append(e.text)
+            elif (type(e) == ast.Option):
+                # Handle file-level options (like pkgid)
+                if not foundPackage:
+                    print(
+                        f"Option {e.name} found before package declaration in {filename}")
+                    return False
+                if e.name == "pkgid":
+                    if not self.validate_package_id(package_name, e.value, filename):
+                        return False
 
-    if foundPackage and pending_imports:
-        for pending_import in pending_imports:
-            if not record_package_import(package_name, pending_import):
-                pending_package_imports.append((package_name, pending_import))
+            elif (type(e) == ast.Enum):
+                if not foundPackage:
+                    print(f"Enum found before package declaration in {filename}")
+                    return False
+                if not packages[package_name].addEnum(e, comments, source_file=abs_filename):
+                    print(
+                        f"Enum Error in Package: {package_name}  FileName: {filename} EnumName: {e.name}")
+                    return False
+                comments = []
 
-    return True
+            elif (type(e) == ast.Message):
+                if not foundPackage:
+                    print(
+                        f"Message found before package declaration in {filename}")
+                    return False
+                if not packages[package_name].addMessage(e, comments, source_file=abs_filename):
+                    print(
+                        f"Message Error in Package: {package_name}  FileName: {filename} MessageName: {e.name}")
+                    return False
+                comments = []
 
+            elif (type(e) == ast.Comment):
+                comments.append(e.text)
 
-def validate_package_id(package_name, new_id, filename):
-    """Validate package ID assignment.
+        if foundPackage and pending_imports:
+            for pending_import in pending_imports:
+                if not record_package_import(package_name, pending_import):
+                    self.pending_package_imports.append((package_name, pending_import))
 
-    Args:
-        package_name: Name of the package
-        new_id: Package ID being assigned
-        filename: File where the assignment occurs
+        return True
 
-    Returns:
-        bool: True if valid, False if conflict detected
-    """
-    current_id = packages[package_name].package_id
+    def validate_package_id(self, package_name, new_id, filename):
+        """Validate package ID assignment.
 
-    if current_id is not None:
-        # Check if this is a conflicting value
-        if current_id != new_id:
-            print(
-                f"Error: Package '{package_name}' has conflicting package IDs:")
-            print(f"  Already defined as: {current_id}")
-            print(f"  Trying to redefine as: {new_id} in {filename}")
-            return False
-        # Same value - this is OK (multiple files in same package)
-    else:
-        # First assignment
-        packages[package_name].package_id = new_id
-        packages[package_name].package_id_explicit = True
+        Args:
+            package_name: Name of the package
+            new_id: Package ID being assigned
+            filename: File where the assignment occurs
 
-    return True
+        Returns:
+            bool: True if valid, False if conflict detected
+        """
+        package = self.packages[package_name]
+        current_id = package.package_id
+
+        if current_id is not None:
+            # Check if this is a conflicting value
+            if current_id != new_id:
+                print(
+                    f"Error: Package '{package_name}' has conflicting package IDs:")
+                print(f"  Already defined as: {current_id}")
+                print(f"  Trying to redefine as: {new_id} in {filename}")
+                return False
+            # Same value - this is OK (multiple files in same package)
+        else:
+            # First assignment
+            package.package_id = new_id
+            package.package_id_explicit = True
 
+        return True
 
-def apply_package_id_inheritance():
-    """Apply package ID inheritance rules.
+    def apply_package_id_inheritance(self):
+        """Apply package ID inheritance rules.
 
-    After all files are parsed, if an imported package has no package ID,
-    it inherits the package ID from the importing package.
+        After all files are parsed, if an imported package has no package ID,
+        it inherits the package ID from the importing package.
 
-    Returns:
-        bool: True if successful, False if conflicts detected
-    """
-    # Iterate through import relationships
-    for importing_pkg, imported_pkgs in package_imports.items():
-        importing_pkg_id = packages[importing_pkg].package_id
-
-        for imported_pkg in imported_pkgs:
-            imported_pkg_id = packages[imported_pkg].package_id
-
-            # If imported package has no ID, inherit from importing package
-            if imported_pkg_id is None:
-                if importing_pkg_id is not None:
-                    # Inheritance: imported package gets the importing package's ID
-                    packages[imported_pkg].package_id = importing_pkg_id
-                    packages[imported_pkg].package_id_explicit = False
-                # else: Neither package has an ID - this will be caught by validatePackages if needed
-            # If both packages have IDs, they are validated separately
-            # Note: Same package name with different IDs is caught by validate_package_id()
-            # during parsing, not here
+        Returns:
+            bool: True if successful, False if conflicts detected
+        """
+        packages = self.packages
+        # Iterate through import relationships
+        for importing_pkg, imported_pkgs in self.package_imports.items():
+            importing_pkg_id = packages[importing_pkg].package_id
+
+            for imported_pkg in imported_pkgs:
+                imported_pkg_id = packages[imported_pkg].package_id
+
+                # If imported package has no ID, inherit from importing package
+                if imported_pkg_id is None:
+                    if importing_pkg_id is not None:
+                        # Inheritance: imported package gets the importing package's ID
+                        packages[imported_pkg].package_id = importing_pkg_id
+                        packages[imported_pkg].package_id_explicit = False
+                    # else: Neither package has an ID - this will be caught by validatePackages if needed
+                # If both packages have IDs, they are validated separately
+                # Note: Same package name with different IDs is caught by validate_package_id()
+                # during parsing, not here
 
-    return True
+        return True
 
+    def mark_all_variable(self):
+        """Treat every message as variable (``--no_packed``); call before validate()."""
+        for pkg in self.packages.values():
+            for msg in pkg.messages.values():
+                msg.variable = True
 
-def validate_packages(debug=False):
-    """Validate all packages and enforce multi-package rules."""
+    def validate(self, debug=False):
+        """Validate all packages and enforce multi-package rules."""
+        packages = self.packages
+        package_imports = self.package_imports
 
-    # Apply package ID inheritance first
-    if not apply_package_id_inheritance():
-        return False
+        # Apply package ID inheritance first
+        if not self.apply_package_id_inheritance():
+            return False
 
-    # Resolve deferred import edges now that all package/file mappings exist.
-    for importing_pkg, imported_abs_path in pending_package_imports:
-        imported_pkg = file_to_package.get(os.path.abspath(imported_abs_path))
-        if imported_pkg and importing_pkg != imported_pkg:
-            if importing_pkg not in package_imports:
-                package_imports[importing_pkg] = []
-            if imported_pkg not in package_imports[importing_pkg]:
-                package_imports[importing_pkg].append(imported_pkg)
-
-    # Reject package import cycles (A -> B -> A).
-    visiting = set()
-    visited = set()
-
-    def dfs(pkg_name, stack):
-        if pkg_name in visiting:
-            cycle_start = stack.index(pkg_name)
-            cycle = stack[cycle_start:] + [pkg_name]
+        # Resolve deferred import edges now that all package/file mappings exist.
+        for importing_pkg, imported_abs_path in self.pending_package_imports:
+            imported_pkg = self.file_to_package.get(os.path.abspath(imported_abs_path))
+            if imported_pkg and importing_pkg != imported_pkg:
+                self.add_package_import(importing_pkg, imported_pkg)
+
+        # Reject package import cycles (A -> B -> A).
+        _order, cycle = dependency_order(
+            sorted(packages),
+            lambda pkg_name: [dep for dep in package_imports.get(pkg_name, []) if dep in packages])
+        if cycle is not None:
             print("Error: circular package import detected: " + " -> ".join(cycle))
             return False
-        if pkg_name in visited:
-            return True
 
-        visiting.add(pkg_name)
-        stack.append(pkg_name)
-        for dep in package_imports.get(pkg_name, []):
-            if dep in packages and not dfs(dep, stack):
+        # Reject duplicate explicit package IDs across compiled packages.
+        seen_pkg_ids = {}
+        for pkg_name in sorted(packages):
+            pkg = packages[pkg_name]
+            if pkg.package_id is None or not pkg.package_id_explicit:
+                continue
+            if pkg.package_id in seen_pkg_ids:
+                other = seen_pkg_ids[pkg.package_id]
+                print(
+                    f"Error: duplicate package ID {pkg.package_id} used by packages '{other}' and '{pkg_name}'")
+                return False
+            seen_pkg_ids[pkg.package_id] = pkg_name
+
+        # Check if multiple packages exist
+        if len(packages) > 1:
+            # When multiple packages are being compiled, they must have package IDs
+            packages_without_ids = [
+                name for name, pkg in packages.items() if pkg.package_id is None]
+            if packages_without_ids:
+                print(f"Error: Multiple packages are being compiled, but the following packages do not have package IDs assigned:")
+                for pkg_name in packages_without_ids:
+                    print(f"  - {pkg_name}")
+                print(f"\nWhen compiling multiple packages, each package must specify 'option pkgid = N;' where N is 0-255.")
+                print(f"This ensures unique message IDs across all packages using the format: (package_id << 8) | msg_id")
+                return False
+
+        # Validate each package
+        symbols = SymbolTable(packages)
+        for key, value in packages.items():
+            if not value.validate_package(packages, debug, symbols):
+                print(f"Failed To Validate Package: {key}")
                 return False
-        stack.pop()
-        visiting.remove(pkg_name)
-        visited.add(pkg_name)
+
         return True
 
-    for pkg_name in sorted(packages):
-        if not dfs(pkg_name, []):
-            return False
+    def needs_extended_payload_types(self):
+        """
+        Determine if only Extended* payload types should be used.
 
-    # Reject duplicate explicit package IDs across compiled packages.
-    seen_pkg_ids = {}
-    for pkg_name in sorted(packages):
-        pkg = packages[pkg_name]
-        if pkg.package_id is None or not pkg.package_id_explicit:
-            continue
-        if pkg.package_id in seen_pkg_ids:
-            other = seen_pkg_ids[pkg.package_id]
-            print(
-                f"Error: duplicate package ID {pkg.package_id} used by packages '{other}' and '{pkg_name}'")
-            return False
-        seen_pkg_ids[pkg.package_id] = pkg_name
-
-    # Check if multiple packages exist
-    if len(packages) > 1:
-        # When multiple packages are being compiled, they must have package IDs
-        packages_without_ids = [
-            name for name, pkg in packages.items() if pkg.package_id is None]
-        if packages_without_ids:
-            print(f"Error: Multiple packages are being compiled, but the following packages do not have package IDs assigned:")
-            for pkg_name in packages_without_ids:
-                print(f"  - {pkg_name}")
-            print(f"\nWhen compiling multiple packages, each package must specify 'option pkgid = N;' where N is 0-255.")
-            print(f"This ensures unique message IDs across all packages using the format: (package_id << 8) | msg_id")
-            return False
+        Returns True if:
+        - Any package has a package ID, OR
+        - Any message ID is >= 256
 
-    # Validate each package
-    for key, value in packages.items():
-        if not value.validate_package(packages, debug):
-            print(f"Failed To Validate Package: {key}")
-            return False
+        When this returns True, only Extended* payload types should be generated:
+        - ExtendedMsgIds, Extended, ExtendedMinimal, ExtendedMultiSystemStream, ExtendedLength
 
-    return True
+        Standard payload types (Minimal, Default, SysComp, Seq, MultiSystemStream)
+        and their profiles (ProfileStandard, ProfileSensor, ProfileIPC) should not be generated.
+        """
+        for pkg_name, pkg in self.packages.items():
+            # Check if package has package ID
+            if pkg.package_id is not None:
+                return True
 
+            # Check if any message ID >= 256
+            for msg_name, msg in pkg.messages.items():
+                if msg.id is not None and msg.id >= 256:
+                    return True
 
-def needs_extended_payload_types():
-    """
-    Determine if only Extended* payload types should be used.
+        return False
 
-    Returns True if:
-    - Any package has a package ID, OR
-    - Any message ID is >= 256
+    def print_packages(self):
+        for key, value in self.packages.items():
+            print(value)
 
-    When this returns True, only Extended* payload types should be generated:
-    - ExtendedMsgIds, Extended, ExtendedMinimal, ExtendedMultiSystemStream, ExtendedLength
+    def generate(self, languages, paths=None, equality=False, generate_tests=False,
+                 csharp_namespace='StructFrame', only=None, jobs=1):
+        """
+        Generate code for the loaded model.
 
-    Standard payload types (Minimal, Default, SysComp, Seq, MultiSystemStream)
-    and their profiles (ProfileStandard, ProfileSensor, ProfileIPC) should not be generated.
-    """
-    for pkg_name, pkg in packages.items():
-        # Check if package has package ID
-        if pkg.package_id is not None:
-            return True
+        Args:
+            languages: Names from LANGUAGES, e.g. ``['c', 'py']``
+            paths: {language: output directory}; missing entries use the
+                CLI defaults (``generated/<language>/``)
+            equality, generate_tests, csharp_namespace: As the CLI flags
+            only: Package names to generate, or None for all of them
+            jobs: Worker processes, as ``--jobs``
 
-        # Check if any message ID >= 256
-        for msg_name, msg in pkg.messages.items():
-            if msg.id is not None and msg.id >= 256:
-                return True
+        Returns:
+            dict: Output file path -> file content (nothing is written)
+        """
+        paths = paths or {}
+        unknown = sorted(set(languages) - set(LANGUAGES))
+        if unknown:
+            raise ValueError(f"Unknown language(s): {', '.join(unknown)}")
+        options = {'equality': equality, 'generate_tests': generate_tests,
+                   'csharp_namespace': csharp_namespace}
+        generators = []
+        for lang in LANGUAGES:
+            if lang in languages:
+                path = paths.get(lang, parser.get_default(lang + '_path')[0])
+                generators.append(language_generator(lang, path, options))
+        if only is None:
+            only = set(self.packages)
+        return run_generators(generators, only, jobs, self)
+
+
+# The session behind the module-level functions below (parseFile(),
+# validate_packages(), ...), for callers that predate GeneratorSession.
+# The module-level names alias its containers.
+default_session = GeneratorSession()
+packages = default_session.packages
+processed_file = default_session.processed_files
+package_imports = default_session.package_imports
+pending_package_imports = default_session.pending_package_imports
+file_to_package = default_session.file_to_package
+source_digests = default_session.source_digests
+absent_import_paths = default_session.absent_import_paths
 
-    return False
+parser = argparse.ArgumentParser(
+    prog='struct_frame',
+    description='Message serialization and header generation program')
+
+parser.add_argument('filename', nargs='?', default=None,
+                    help='Proto file to process')
+parser.add_argument('--debug', action='store_true')
+parser.add_argument('--validate', action='store_true',
+                    help='Validate the proto file without generating any output files')
+parser.add_argument('--build_c', action='store_true')
+parser.add_argument('--build_ts', action='store_true')
+parser.add_argument('--build_js', action='store_true')
+parser.add_argument('--build_py', action='store_true')
+parser.add_argument('--build_cpp', action='store_true')
+parser.add_argument('--build_csharp', action='store_true')
+parser.add_argument('--c_path', nargs=1, type=str, default=['generated/c/'])
+parser.add_argument('--ts_path', nargs=1, type=str, default=['generated/ts/'])
+parser.add_argument('--js_path', nargs=1, type=str, default=['generated/js/'])
+parser.add_argument('--py_path', nargs=1, type=str, default=['generated/py/'])
+parser.add_argument('--cpp_path', nargs=1, type=str,
+                    default=['generated/cpp/'])
+parser.add_argument('--csharp_path', nargs=1, type=str,
+                    default=['generated/csharp/'])
+parser.add_argument('--build_gql', action='store_true')
+parser.add_argument('--gql_path', nargs=1, type=str,
+                    default=['generated/gql/'])
+parser.add_argument('--build_rust', action='store_true')
+parser.add_argument('--rust_path', nargs=1, type=str,
+                    default=['generated/rust/'])
+parser.add_argument('--catalog_path', nargs=1, type=str, default=['generated/'],
+                    help='Directory for the LSP type catalog file (sf_compile.json)')
+parser.add_argument('--sdk', action='store_true',
+                    help='Include full SDK with all transports (UDP, TCP, WebSocket, Serial)')
+parser.add_argument('--sdk_embedded', action='store_true',
+                    help='Include embedded SDK (serial transport only, no ASIO dependencies)')
+parser.add_argument('--equality', action='store_true',
+                    help='Generate equality comparison operators/methods for messages')
+parser.add_argument('--csharp_namespace', nargs=1, type=str, default=['StructFrame'],
+                    help='Root namespace for generated C# code (default: StructFrame)')
+parser.add_argument('--force', action='store_true',
+                    help='Force regeneration even if hash matches previous generation')
+parser.add_argument('--hash_path', nargs=1, type=str, default=[None],
+                    help='Path to store the generation hash file (default: first output path)')
+parser.add_argument('--cache_dir', nargs=1, type=str, default=[None],
+                    help='Directory of the parsed-file cache (default: ' + CACHE_DIRNAME + ' next to the hash file); '
+                         'entries are data-only JSON, but they decide what is generated, so use a directory '
+                         'only trusted users can write')
+parser.add_argument('--no_cache', action='store_true',
+                    help='Parse every file without using or updating the parsed-file cache')
+parser.add_argument('--jobs', nargs=1, type=int, default=[1],
+                    help='Number of worker processes for code generation (0: one per CPU, default: 1)')
+parser.add_argument('--watch', action='store_true',
+                    help='Keep running and regenerate whenever a file in the import closure changes')
+parser.add_argument('--watch_interval', nargs=1, type=float, default=[0.25],
+                    help='Seconds between checks for changed files in --watch mode (default: 0.25)')
+parser.add_argument('--watch_port', nargs=1, type=int, default=[None],
+                    help='Also accept regeneration requests on this localhost TCP port in --watch mode (0: any free port)')
+parser.add_argument('--generate_tests', action='store_true',
+                    help='Generate test code with dummy values for all messages (round-trip encode/decode verification)')
+parser.add_argument('--no_packed', action='store_true',
+                    help=('Generate code without packed structs. All messages are treated as variable, '
+                          'so serialization/deserialization is performed field-by-field instead of relying on '
+                          'packed memory layout. Useful on platforms that do not support struct packing or '
+                          'have different endianness/alignment requirements.'))
+
+
+def parseFile(filename, base_path=None, importing_package=None):
+    """GeneratorSession.parse_file() on the default session."""
+    return default_session.parse_file(filename, base_path, importing_package)
+
+
+def validate_package_id(package_name, new_id, filename):
+    """GeneratorSession.validate_package_id() on the default session."""
+    return default_session.validate_package_id(package_name, new_id, filename)
+
+
+def apply_package_id_inheritance():
+    """GeneratorSession.apply_package_id_inheritance() on the default session."""
+    return default_session.apply_package_id_inheritance()
+
+
+def validate_packages(debug=False):
+    """GeneratorSession.validate() on the default session."""
+    return default_session.validate(debug)
+
+
+def needs_extended_payload_types():
+    """GeneratorSession.needs_extended_payload_types() on the default session."""
+    return default_session.needs_extended_payload_types()
 
 
 def printPackages():
-    for key, value in packages.items():
-        print(value)
+    default_session.print_packages()
 
 
 def topological_sort_packages(pkgs, pkg_imports):
@@ -1875,7 +2399,14 @@ def topological_sort_packages(pkgs, pkg_imports):
     return result
 
 
-def generate_lsp_file_strings(catalog_path, build_flags=None, paths=None):
+def _session_model(session):
+    """(packages, package_imports) of *session*, or of the default session."""
+    if session is None:
+        session = default_session
+    return session.packages, session.package_imports
+
+
+def generate_lsp_file_strings(catalog_path, build_flags=None, paths=None, session=None):
     """Generate a single JSON catalog file for language-server navigation.
 
     Produces one language-agnostic ``sf_compile.json`` that lists
@@ -1887,10 +2418,12 @@ def generate_lsp_file_strings(catalog_path, build_flags=None, paths=None):
         catalog_path: Directory where ``sf_compile.json`` will be written.
         build_flags:  dict {lang: bool}  e.g. {'c': True, 'cpp': False, ...}
         paths:        dict {lang: str}   absolute output directory for each language
+        session:      GeneratorSession to describe (default: the module's session)
 
     Returns:
         dict {filename: content}
     """
+    packages, package_imports = _session_model(session)
     if build_flags is None:
         build_flags = {}
     if paths is None:
@@ -2136,9 +2669,13 @@ def generate_lsp_file_strings(catalog_path, build_flags=None, paths=None):
     return {catalog_file: json.dumps(catalog, indent=2) + "\n"}
 
 
-def generateCFileStrings(path, equality=False, generate_tests=False):
+def generateCFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.c_gen import FileCGen, TestCGen
+    packages, package_imports = _session_model(session)
     out = {}
     for key, value in packages.items():
+        if only is not None and value.name not in only:
+            continue
         name = os.path.join(path, value.name + ".structframe.h")
         imported = package_imports.get(value.name, [])
         data = ''.join(FileCGen.generate(
@@ -2154,12 +2691,17 @@ def generateCFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generateTsFileStrings(path, equality=False, generate_tests=False):
+def generateTsFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.ts_gen import FileTsGen, TestTsGen
+    packages, package_imports = _session_model(session)
     import json as _json
     out = {}
     pkg_names = []
     for key, value in packages.items():
         kebab_name = value.name.replace('_', '-')
+        if only is not None and value.name not in only:
+            pkg_names.append(kebab_name)
+            continue
         name = os.path.join(path, kebab_name + ".structframe.ts")
         data = ''.join(FileTsGen.generate(
             value, use_class_based=True, packages=packages, equality=equality))
@@ -2201,12 +2743,17 @@ def generateTsFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generateJsFileStrings(path, equality=False, generate_tests=False):
+def generateJsFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.js_gen import FileJsGen, TestJsGen
+    packages, package_imports = _session_model(session)
     import json as _json
     out = {}
     pkg_names = []
     for key, value in packages.items():
         kebab_name = value.name.replace('_', '-')
+        if only is not None and value.name not in only:
+            pkg_names.append(kebab_name)
+            continue
         name = os.path.join(path, kebab_name + ".structframe.js")
         data = ''.join(FileJsGen.generate(
             value, use_class_based=True, packages=packages, equality=equality))
@@ -2238,7 +2785,9 @@ def generateJsFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generatePyFileStrings(path, equality=False, generate_tests=False):
+def generatePyFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.py_gen import FilePyGen, TestPyGen
+    packages, package_imports = _session_model(session)
     out = {}
 
     # Create package structure: struct_frame/generated/
@@ -2254,6 +2803,8 @@ def generatePyFileStrings(path, equality=False, generate_tests=False):
 
     # Generate message files in the generated package
     for key, value in packages.items():
+        if only is not None and value.name not in only:
+            continue
         name = os.path.join(generated_path, value.name + ".py")
         imported_pkg_names = package_imports.get(value.name, [])
         imported_pkg_objects = {n: packages[n]
@@ -2286,9 +2837,13 @@ def generatePyFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generateCppFileStrings(path, equality=False, generate_tests=False):
+def generateCppFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.cpp_gen import FileCppGen, TestCppGen
+    packages, package_imports = _session_model(session)
     out = {}
     for key, value in packages.items():
+        if only is not None and value.name not in only:
+            continue
         name = os.path.join(path, value.name + ".structframe.hpp")
         imported = package_imports.get(value.name, [])
         data = ''.join(FileCppGen.generate(
@@ -2309,11 +2864,57 @@ def generateCppFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generateRustFileStrings(path, equality=False, generate_tests=False):
+def generateGqlFileStrings(path, only=None, session=None):
+    from struct_frame.gql_gen import FileGqlGen, _PACKAGE_DIRECTIVE_DEF
+    packages, package_imports = _session_model(session)
+    out = {}
+    for key, value in packages.items():
+        if only is not None and value.name not in only:
+            continue
+        name = os.path.join(path, value.name + '.graphql')
+        data = ''.join(FileGqlGen.generate(value))
+        out[name] = data
+
+    # Generate a stitched schema.graphql that combines all packages into
+    # one document with extend-based merging.  Each per-package file is
+    # included via a comment header so tooling can trace provenance.
+    stitched_parts = [
+        f'# Stitched schema — generated by struct-frame {get_version()}\n',
+        f'# Contains all packages: {", ".join(sorted(packages.keys()))}\n\n',
+        _PACKAGE_DIRECTIVE_DEF + '\n\n',
+    ]
+    query_fields = []
+    for key, value in packages.items():
+        stitched_parts.append(f'# --- Package: {value.name} ---\n')
+        # Re-emit enum and message types (without the per-file directive def)
+        from struct_frame.gql_gen import EnumGqlGen, MessageGqlGen, pascal_case as _pc
+        for _, enum in value.enums.items():
+            stitched_parts.append(
+                EnumGqlGen.generate(enum).rstrip() + '\n\n')
+        for _, msg in value.sortedMessages().items():
+            stitched_parts.append(MessageGqlGen.generate(
+                value, msg).rstrip() + '\n\n')
+        for _, msg in value.sortedMessages().items():
+            type_name = f'{_pc(value.name)}{msg.name}'
+            query_fields.append(f'  {msg.name}: {type_name}')
+    if query_fields:
+        stitched_parts.append('type Query {\n')
+        stitched_parts.append('\n'.join(query_fields) + '\n')
+        stitched_parts.append('}\n')
+    out[os.path.join(path, 'schema.graphql')] = ''.join(stitched_parts)
+    return out
+
+
+def generateRustFileStrings(path, equality=False, generate_tests=False, only=None, session=None):
+    from struct_frame.rust_gen import FileRustGen, TestRustGen
+    packages, package_imports = _session_model(session)
     out = {}
     # Collect all packages being generated now
     new_package_names = []
     for key, value in packages.items():
+        if only is not None and value.name not in only:
+            new_package_names.append(value.name)
+            continue
         name = os.path.join(path, value.name + ".structframe.rs")
         data = ''.join(FileRustGen.generate(value, equality=equality))
         out[name] = data
@@ -2357,9 +2958,13 @@ def generateRustFileStrings(path, equality=False, generate_tests=False):
     return out
 
 
-def generateCSharpFileStrings(path, equality=False, namespace='StructFrame.Generated', generate_tests=False):
+def generateCSharpFileStrings(path, equality=False, namespace='StructFrame.Generated', generate_tests=False, only=None, session=None):
+    from struct_frame.csharp_gen import FileCSharpGen, TestCSharpGen
+    packages, package_imports = _session_model(session)
     out = {}
     for key, value in packages.items():
+        if only is not None and value.name not in only:
+            continue
         # Generate per-file output into a package subfolder
         pkg_folder = os.path.join(path, pascal_case(value.name))
         per_file = FileCSharpGen.generate_per_file(value, equality=equality)
@@ -2481,9 +3086,142 @@ def _generateCSharpProjectFile(namespace):
     return project_content
 
 
-def main():
+# Generator and option names of every output language, keyed by the name used
+# in the --build_<language> and --<language>_path flags.
+LANGUAGES = {
+    'c': (generateCFileStrings, ('equality', 'generate_tests')),
+    'ts': (generateTsFileStrings, ('equality', 'generate_tests')),
+    'js': (generateJsFileStrings, ('equality', 'generate_tests')),
+    'py': (generatePyFileStrings, ('equality', 'generate_tests')),
+    'cpp': (generateCppFileStrings, ('equality', 'generate_tests')),
+    'csharp': (generateCSharpFileStrings, ('equality', 'generate_tests', 'namespace')),
+    'gql': (generateGqlFileStrings, ()),
+    'rust': (generateRustFileStrings, ('equality', 'generate_tests')),
+}
+
+
+def language_generator(lang, path, options):
+    """
+    (generator, path, kwargs) for *lang*, taking its keyword arguments from
+    *options* ({'equality': ..., 'generate_tests': ..., 'csharp_namespace': ...}).
+
+    The generator is one of the generate*FileStrings functions and is called
+    as ``generator(path, only=..., session=..., **kwargs)``.
+    """
+    generator, option_names = LANGUAGES[lang]
+    kwargs = {name: options['csharp_namespace' if name == 'namespace' else name]
+              for name in option_names}
+    return (generator, path, kwargs)
+
+
+def language_generators(args):
+    """language_generator() tuples for every language enabled on the command line."""
+    options = {'equality': args.equality, 'generate_tests': args.generate_tests,
+               'csharp_namespace': args.csharp_namespace[0]}
+    return [language_generator(lang, getattr(args, lang + '_path')[0], options)
+            for lang in LANGUAGES if getattr(args, 'build_' + lang)]
+
+
+# The session holding the model in a generation worker process
+_worker_session = None
+
+
+def _init_generation_worker(model):
+    """Install the validated model in a generation worker process."""
+    global _worker_session
+    _worker_session = GeneratorSession()
+    packages, package_imports = model
+    _worker_session.packages.update(packages)
+    _worker_session.package_imports.update(package_imports)
+
+
+def _run_generation_task(task):
+    generator, path, kwargs, only = task
+    return generator(path, only=only, session=_worker_session, **kwargs)
+
+
+def run_generators(generators, only, jobs=1, session=None):
+    """
+    Run *generators* for the packages in *only* and merge their outputs.
+
+    With jobs > 1 every (language, package) pair is generated in a pool of
+    worker processes that receive the validated model of *session* (default:
+    the module's session) once, at start-up.
+    Files shared by all packages of a language (index.ts, lib.rs,
+    StructFrame.csproj, ...) are produced by every task of that language
+    with identical content. The merged result does not depend on *jobs*.
+
+    Returns:
+        dict: Output file path -> file content
+    """
+    if session is None:
+        session = default_session
+    tasks = []
+    for generator, path, kwargs in generators:
+        subsets = [{name} for name in sorted(only)] or [set()]
+        tasks.extend((generator, path, kwargs, subset) for subset in subsets)
+
+    files = {}
+    if jobs <= 1 or len(tasks) <= 1:
+        for generator, path, kwargs in generators:
+            files.update(generator(path, only=only, session=session, **kwargs))
+        return files
+
+    from concurrent.futures import ProcessPoolExecutor
+    workers = min(jobs, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_generation_worker,
+                             initargs=((session.packages, session.package_imports),)) as pool:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        for out in pool.map(_run_generation_task, tasks, chunksize=chunksize):
+            files.update(out)
+    return files
+
+
+def write_files(files, jobs=1):
+    """
+    Write every file in *files* whose content changed, with up to *jobs* threads.
+
+    Returns:
+        int: Number of files written
+    """
+    if jobs <= 1 or len(files) <= 1:
+        return sum(write_if_changed(name, data) for name, data in files.items())
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return sum(pool.map(write_if_changed, files.keys(), files.values()))
 
-    args = parser.parse_args()
+
+def make_parse_cache(args, hash_file_path, memory=False):
+    """
+    The parsed-file cache selected by --cache_dir / --no_cache, or None.
+
+    With *memory*, the result always exists and also keeps entries in memory.
+    """
+    directory = None
+    if not args.no_cache:
+        if args.cache_dir[0] is not None:
+            directory = args.cache_dir[0]
+        elif not args.validate:
+            # Validate mode writes nothing to the output directories.
+            directory = os.path.join(os.path.dirname(hash_file_path), CACHE_DIRNAME)
+    if directory is None and not memory:
+        return None
+    return ParseCache(directory, memory=memory)
+
+
+def reset_model():
+    """Forget every parsed file and package so the next parseFile() starts afresh."""
+    default_session.reset()
+
+
+def main(argv=None):
+    """
+    Command line entry point; *argv* defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: Exit code
+    """
+    args = parser.parse_args(argv)
 
     # Normal mode requires a filename
     if not args.filename:
@@ -2491,7 +3229,57 @@ def main():
         parser.print_help()
         return 1
 
-    parseFile(args.filename)
+    if args.jobs[0] < 0:
+        print("Error: --jobs must be 0 (one per CPU) or a positive number")
+        return 1
+
+    if args.watch:
+        from struct_frame.watch import watch
+        return watch(args)
+
+    return run_generation(args)
+
+
+def run_generation(args, session=None):
+    """
+    Parse, validate and generate once for the parsed command line *args*.
+
+    Args:
+        args: Parsed command line
+        session: GeneratorSession to load the model into, parsing through
+            its parse_cache. A caller that passes one tracks source changes
+            itself, so the pre-parse manifest check is skipped and the
+            import closure is always parsed (from the cache).
+
+    Returns:
+        int: Exit code
+    """
+    building = (args.build_c or args.build_ts or args.build_js or args.build_py or args.build_cpp
+                or args.build_csharp or args.build_gql or args.build_rust)
+    root_file = os.path.abspath(args.filename)
+    hash_file_path = get_hash_file_path(args)
+    sources_file_path = get_sources_file_path(hash_file_path)
+
+    # Pre-parse fast path: skip parsing entirely when no source in the
+    # import closure changed since the previous generation.
+    if building and session is None and not args.validate and not args.force and \
+            sources_unchanged(args, root_file, sources_file_path, hash_file_path):
+        print("Generation skipped: no changes detected (source files unchanged since previous generation)")
+        print(f"  Hash file: {hash_file_path}")
+        print("  Use --force to regenerate anyway")
+        return 0
+
+    if session is None:
+        session = GeneratorSession(make_parse_cache(args, hash_file_path))
+    parse_cache = session.parse_cache
+    packages = session.packages
+
+    session.reset()
+    if not session.parse_file(args.filename):
+        print("Parsing failed")
+        return 1
+    if args.debug and parse_cache is not None:
+        print(f"Parse cache: {parse_cache.hits} hit(s), {parse_cache.misses} miss(es) in {parse_cache.directory}")
 
     # If --no_packed is set, mark every message as variable BEFORE validation so
     # that min_size and other variable-related metadata is computed correctly.
@@ -2499,9 +3287,7 @@ def main():
     # on packed memory layout. Useful on platforms that don't support struct
     # packing or have different endianness/alignment requirements.
     if args.no_packed:
-        for pkg in packages.values():
-            for msg in pkg.messages.values():
-                msg.variable = True
+        session.mark_all_variable()
         if args.debug:
             print("--no_packed: all messages marked as variable")
 
@@ -2512,13 +3298,7 @@ def main():
         print("Select at least one build argument")
         return 1
 
-    valid = False
-    try:
-        valid = validate_packages(args.debug)
-    except RecursionError as err:
-        print(
-            f'Recursion Error. Messages most likely have a cyclical dependancy. Check Message: {current_error_message} and Field: {current_error_field}')
-        return 1
+    valid = session.validate(args.debug)
 
     if not valid:
         print("Validation failed")
@@ -2528,19 +3308,23 @@ def main():
         # In validate mode, only perform validation - no file generation
         print("Validation successful")
         if args.debug:
-            printPackages()
+            session.print_packages()
         return 0
 
     # Compute generation hash and check if regeneration is needed
     current_hash = compute_generation_hash(args, packages)
-    hash_file_path = get_hash_file_path(args)
     previous_hash = read_previous_hash(hash_file_path)
+    source_key = compute_source_key(args, root_file, session.source_digests, session.absent_import_paths)
 
     if not args.force and previous_hash == current_hash:
+        # Sources changed without changing the definitions (e.g. comments):
+        # record the new closure so the next run takes the fast path.
+        write_source_manifest(sources_file_path, source_key, current_hash,
+                              session.source_digests, session.absent_import_paths)
         print("Generation skipped: no changes detected (hash matches previous generation)")
         print(f"  Hash file: {hash_file_path}")
         print("  Use --force to regenerate anyway")
-        return
+        return 0
 
     if args.debug:
         if previous_hash is None:
@@ -2549,73 +3333,22 @@ def main():
             print(
                 f"Hash changed: {previous_hash[:16]}... -> {current_hash[:16]}...")
 
-    # Normal mode: generate files
-    files = {}
-    if (args.build_c):
-        files.update(generateCFileStrings(
-            args.c_path[0], equality=args.equality, generate_tests=args.generate_tests))
-
-    if (args.build_ts):
-        files.update(generateTsFileStrings(
-            args.ts_path[0], equality=args.equality, generate_tests=args.generate_tests))
-
-    if (args.build_js):
-        files.update(generateJsFileStrings(
-            args.js_path[0], equality=args.equality, generate_tests=args.generate_tests))
-
-    if (args.build_py):
-        files.update(generatePyFileStrings(
-            args.py_path[0], equality=args.equality, generate_tests=args.generate_tests))
-
-    if (args.build_cpp):
-        files.update(generateCppFileStrings(
-            args.cpp_path[0], equality=args.equality, generate_tests=args.generate_tests))
-
-    if (args.build_csharp):
-        files.update(generateCSharpFileStrings(args.csharp_path[0],
-                                               equality=args.equality,
-                                               namespace=args.csharp_namespace[0],
-                                               generate_tests=args.generate_tests))
+    # Regenerate only packages whose definitions, sources or imports changed.
+    package_hashes = compute_package_hashes(packages, session.package_imports,
+                                            session.source_digests, session.file_to_package)
+    packages_file_path = get_packages_file_path(hash_file_path)
+    if args.force:
+        regenerate = set(packages)
+    else:
+        regenerate = packages_to_regenerate(args, package_hashes, packages_file_path)
+    if args.debug:
+        print(f"Regenerating {len(regenerate)} of {len(packages)} package(s): "
+              f"{', '.join(sorted(regenerate)) or '(none)'}")
 
-    if (args.build_gql):
-        from struct_frame.gql_gen import _PACKAGE_DIRECTIVE_DEF
-        for key, value in packages.items():
-            name = os.path.join(args.gql_path[0], value.name + '.graphql')
-            data = ''.join(FileGqlGen.generate(value))
-            files[name] = data
-
-        # Generate a stitched schema.graphql that combines all packages into
-        # one document with extend-based merging.  Each per-package file is
-        # included via a comment header so tooling can trace provenance.
-        stitched_parts = [
-            f'# Stitched schema — generated by struct-frame {get_version()}\n',
-            f'# Contains all packages: {", ".join(sorted(packages.keys()))}\n\n',
-            _PACKAGE_DIRECTIVE_DEF + '\n\n',
-        ]
-        query_fields = []
-        for key, value in packages.items():
-            stitched_parts.append(f'# --- Package: {value.name} ---\n')
-            # Re-emit enum and message types (without the per-file directive def)
-            from struct_frame.gql_gen import EnumGqlGen, MessageGqlGen, pascal_case as _pc
-            for _, enum in value.enums.items():
-                stitched_parts.append(
-                    EnumGqlGen.generate(enum).rstrip() + '\n\n')
-            for _, msg in value.sortedMessages().items():
-                stitched_parts.append(MessageGqlGen.generate(
-                    value, msg).rstrip() + '\n\n')
-            for _, msg in value.sortedMessages().items():
-                type_name = f'{_pc(value.name)}{msg.name}'
-                query_fields.append(f'  {msg.name}: {type_name}')
-        if query_fields:
-            stitched_parts.append('type Query {\n')
-            stitched_parts.append('\n'.join(query_fields) + '\n')
-            stitched_parts.append('}\n')
-        files[os.path.join(args.gql_path[0], 'schema.graphql')
-              ] = ''.join(stitched_parts)
+    jobs = args.jobs[0] if args.jobs[0] > 0 else (os.cpu_count() or 1)
 
-    if (args.build_rust):
-        files.update(generateRustFileStrings(
-            args.rust_path[0], equality=args.equality, generate_tests=args.generate_tests))
+    # Normal mode: generate files
+    files = run_generators(language_generators(args), regenerate, jobs, session)
 
     # Generate LSP type catalog (single language-agnostic JSON file)
     lsp_build_flags = {
@@ -2639,56 +3372,29 @@ def main():
         'rust':   args.rust_path[0],
     }
     files.update(generate_lsp_file_strings(
-        args.catalog_path[0], lsp_build_flags, lsp_paths))
-
-    for filename, filedata in files.items():
-        dirname = os.path.dirname(filename)
-        if dirname and not os.path.exists(dirname):
-            os.makedirs(dirname)
+        args.catalog_path[0], lsp_build_flags, lsp_paths, session))
 
-        # Retry on transient PermissionError (e.g. Windows file lock from
-        # the .NET build server or an IDE holding the .csproj open briefly).
-        for _attempt in range(5):
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(filedata)
-                break
-            except PermissionError:
-                if _attempt == 4:
-                    raise
-                time.sleep(0.5)
+    written = write_files(files, jobs)
+    if args.debug:
+        print(f"Wrote {written} file(s); {len(files) - written} unchanged file(s) left untouched")
 
     dir_path = os.path.dirname(os.path.realpath(__file__))
 
+    boilerplate_counts = [0, 0]
+
     def copy_all_files(src_dir, dst_dir, exclude_dirs=None):
         """Copy all files and directories from src_dir to dst_dir
 
+        Files that already match their source are not rewritten.
+
         Args:
             src_dir: Source directory
             dst_dir: Destination directory  
             exclude_dirs: List of directory names to exclude at any level (e.g., ['struct_frame_sdk', 'Transports'])
         """
-        if exclude_dirs is None:
-            exclude_dirs = []
-
-        if not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
-        if os.path.exists(src_dir):
-            ignore_fn = shutil.ignore_patterns(
-                *exclude_dirs) if exclude_dirs else None
-            for item in os.listdir(src_dir):
-                # Skip excluded directories
-                if item in exclude_dirs:
-                    continue
-
-                src_path = os.path.join(src_dir, item)
-                dst_path = os.path.join(dst_dir, item)
-                if os.path.isdir(src_path):
-                    # Recursively copy directories
-                    shutil.copytree(src_path, dst_path,
-                                    dirs_exist_ok=True, ignore=ignore_fn)
-                elif os.path.isfile(src_path):
-                    shutil.copy2(src_path, dst_path)
+        copied, unchanged = copy_tree_if_changed(src_dir, dst_dir, exclude_dirs or ())
+        boilerplate_counts[0] += copied
+        boilerplate_counts[1] += unchanged
 
     def copy_sdk_files(src_dir, dst_dir, embedded=False, include_asio=False):
         """Copy SDK files (struct_frame_sdk directory)
@@ -2710,9 +3416,6 @@ def main():
         if not os.path.exists(sdk_src):
             return
 
-        if not os.path.exists(sdk_dst):
-            os.makedirs(sdk_dst)
-
         # Determine which files to exclude
         exclude_items = []
 
@@ -2723,21 +3426,8 @@ def main():
                 exclude_items = ['asio.hpp', 'asio', 'asio-repo',
                                  'network_transports.hpp', 'sdk.hpp']
 
-        # Copy SDK files with exclusions
-        for item in os.listdir(sdk_src):
-            if item in exclude_items:
-                continue
-            src_path = os.path.join(sdk_src, item)
-            dst_path = os.path.join(sdk_dst, item)
-
-            # Skip broken symlinks
-            if os.path.islink(src_path) and not os.path.exists(os.path.realpath(src_path)):
-                continue
-
-            if os.path.isfile(src_path):
-                shutil.copy2(src_path, dst_path)
-            elif os.path.isdir(src_path):
-                shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
+        # Copy SDK files with exclusions (broken symlinks are skipped)
+        copy_all_files(sdk_src, sdk_dst, exclude_items)
 
     # Copy all boilerplate files (excluding SDK by default)
     # SDK is handled separately below based on --sdk or --sdk_embedded flags
@@ -2818,14 +3508,20 @@ def main():
                 args.cpp_path[0], embedded_only, include_asio=include_asio)
 
     # No boilerplate for GraphQL currently
+    if args.debug:
+        print(f"Copied {boilerplate_counts[0]} boilerplate file(s); "
+              f"{boilerplate_counts[1]} already up to date")
 
     # Write generation hash after successful generation
     write_generation_hash(hash_file_path, current_hash)
+    write_package_manifest(args, packages_file_path, package_hashes)
+    write_source_manifest(sources_file_path, source_key, current_hash,
+                          session.source_digests, session.absent_import_paths)
     if args.debug:
         print(f"Generation hash written to {hash_file_path}")
 
     if args.debug:
-        printPackages()
+        session.print_packages()
     print("Struct Frame successfully completed")
     return 0
 
@@ -0,0 +1,198 @@
+"""
+On-disk cache of parsed schema files.
+
+Nearly all of parseFile()'s time goes to the proto_schema_parser grammar.
+Its result depends only on the file text and the parser version, so the
+parsed AST is stored under a key built from both and reused by later runs:
+only files whose text changed go through the grammar again. Building the
+Package/Message/Field model from an AST and validating it are cheap and
+always run, so cross-file validation sees the current state of every import.
+
+Entries are written to a temporary file and renamed into place, so
+concurrent generator runs sharing a cache directory never see a partial
+entry. A missing, unreadable or corrupt entry is a cache miss. The
+directory can be deleted at any time.
+
+Entries are JSON, never pickle: a cache directory may be shared between
+users or build jobs, and loading an entry must not be able to run code.
+Each AST node is tagged with the name of its proto_schema_parser.ast class,
+and only dataclasses and enums defined in that module are rebuilt from it.
+An entry that names anything else, or fields the class does not have, is
+a cache miss. Entries still decide what gets generated, so the directory
+should only be writable by users trusted to write the generated code.
+
+A long-running process (``--watch``) can also keep entries in memory.
+They are held encoded, so every hit returns a fresh AST that the model
+builder is free to modify.
+"""
+
+import dataclasses
+import enum
+import hashlib
+import json
+import os
+import tempfile
+
+# Bump when the entry layout changes.
+CACHE_FORMAT = 2
+CACHE_DIRNAME = ".structframe.cache"
+
+_SCHEMA = "struct-frame-ast"
+_SCALARS = (str, int, float, bool, type(None))
+_AST_TYPES = None
+
+
+def _ast_types():
+    """The proto_schema_parser.ast classes an entry may name, by class name."""
+    global _AST_TYPES
+    if _AST_TYPES is None:
+        from proto_schema_parser import ast
+        _AST_TYPES = {
+            name: obj for name, obj in vars(ast).items()
+            if isinstance(obj, type) and obj.__module__ == ast.__name__
+            and (dataclasses.is_dataclass(obj) or issubclass(obj, enum.Enum))
+        }
+    return _AST_TYPES
+
+
+def _encode(node):
+    """*node* as JSON-compatible data; TypeError for anything outside the AST."""
+    if isinstance(node, enum.Enum):
+        return {"@": type(node).__name__, "name": node.name}
+    if isinstance(node, _SCALARS):
+        return node
+    if isinstance(node, list):
+        return [_encode(item) for item in node]
+    if dataclasses.is_dataclass(node) and _ast_types().get(type(node).__name__) is type(node):
+        data = {"@": type(node).__name__}
+        for f in dataclasses.fields(node):
+            data[f.name] = _encode(getattr(node, f.name))
+        return data
+    raise TypeError(f"cannot cache {type(node).__name__}")
+
+
+def _decode(data):
+    """Rebuild the AST encoded by _encode(); ValueError for anything else."""
+    if isinstance(data, _SCALARS):
+        return data
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        raise ValueError("unexpected value in cache entry")
+    cls = _ast_types().get(data.get("@"))
+    if cls is None:
+        raise ValueError(f"unknown node type {data.get('@')!r} in cache entry")
+    if issubclass(cls, enum.Enum):
+        if set(data) != {"@", "name"} or data["name"] not in cls.__members__:
+            raise ValueError(f"bad {cls.__name__} in cache entry")
+        return cls[data["name"]]
+    names = {f.name for f in dataclasses.fields(cls) if f.init}
+    if set(data) != names | {"@"}:
+        raise ValueError(f"bad {cls.__name__} fields in cache entry")
+    return cls(**{name: _decode(data[name]) for name in names})
+
+
+def _dumps(result):
+    return json.dumps({"schema": _SCHEMA, "format": CACHE_FORMAT, "ast": _encode(result)},
+                      separators=(',', ':'))
+
+
+def _loads(text):
+    data = json.loads(text)
+    if not isinstance(data, dict) or data.get("schema") != _SCHEMA or data.get("format") != CACHE_FORMAT:
+        raise ValueError("not a parse cache entry")
+    return _decode(data["ast"])
+
+
+def parser_version():
+    """Version of proto-schema-parser, part of every cache key."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version as get_pkg_version
+        return get_pkg_version('proto-schema-parser')
+    except (ImportError, ModuleNotFoundError, PackageNotFoundError):
+        return "unknown"
+
+
+class ParseCache:
+    """
+    Parsed-AST cache in *directory*, keyed by content digest and parser version.
+
+    Args:
+        directory: Cache directory (created on the first store), or None for
+            no on-disk cache
+        memory: Also keep entries in memory for the lifetime of the object
+    """
+
+    def __init__(self, directory, memory=False):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._salt = f"{CACHE_FORMAT}:{parser_version()}:".encode('utf-8')
+        self._memory = {} if memory else None
+
+    def entry_path(self, digest):
+        """Path of the entry for a file whose text has SHA256 *digest*."""
+        key = hashlib.sha256(self._salt + digest.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def load(self, digest):
+        """The cached AST for *digest*, or None."""
+        if self._memory is not None and digest in self._memory:
+            return _loads(self._memory[digest])
+        if self.directory is None:
+            return None
+        try:
+            with open(self.entry_path(digest), 'r', encoding='utf-8') as f:
+                data = f.read()
+            result = _loads(data)
+        except (OSError, ValueError, TypeError, KeyError, RecursionError):
+            return None
+        if self._memory is not None:
+            self._memory[digest] = data
+        return result
+
+    def store(self, digest, result):
+        """Store *result* for *digest*; failures leave the cache unchanged."""
+        try:
+            data = _dumps(result)
+        except (TypeError, ValueError, RecursionError):
+            return
+        if self._memory is not None:
+            self._memory[digest] = data
+        if self.directory is None:
+            return
+        path = self.entry_path(digest)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def retain(self, digests):
+        """Drop in-memory entries whose digest is not in *digests*."""
+        if self._memory is not None:
+            for digest in set(self._memory) - set(digests):
+                del self._memory[digest]
+
+    def parse(self, text, digest):
+        """Parse *text* (whose SHA256 is *digest*), using the cache when possible."""
+        result = self.load(digest)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        from proto_schema_parser.parser import Parser
+        result = Parser().parse(text)
+        self.store(digest, result)
+        return result
@@ -0,0 +1,206 @@
+"""
+Watch mode: regenerate from a warm process whenever a schema file changes.
+
+``--watch`` runs one normal generation, then polls every file of the import
+closure (plus the import candidates that did not exist) for a change in
+modification time, size or existence. Each change triggers another pass in
+the same process: the language generators are already imported, unchanged
+files come from an in-memory parse cache, and per-package hashing means
+only the affected packages are regenerated and only changed files written.
+
+With ``--watch_port`` the process also listens on a localhost TCP port, so
+build tools can ask the warm process for a regeneration instead of starting
+a new generator. The protocol is one command line per connection, answered
+by one JSON line:
+
+    regenerate   run a pass now (checks for changes, cheap when none)
+    ping         report that the watcher is alive
+    stop         shut the watcher down
+
+A regenerate reply looks like
+``{"status": "ok", "exit_code": 0, "elapsed_ms": 12.5, "output": "..."}``.
+"""
+
+import contextlib
+import io
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from struct_frame import generate
+
+
+def stat_key(path):
+    """(mtime_ns, size) of *path*, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class SourceWatcher:
+    """Polls a set of paths for changes against recorded stat keys."""
+
+    def __init__(self):
+        self.stats = {}
+
+    def watch(self, stats):
+        """Replace the watched set with *stats* ({path: stat_key})."""
+        self.stats = dict(stats)
+
+    def changed(self):
+        """Watched paths whose state differs from the recorded one."""
+        return sorted(p for p, st in self.stats.items() if stat_key(p) != st)
+
+
+class RequestServer:
+    """
+    Accepts line commands on a localhost TCP port.
+
+    Each command is queued as ``(command, reply_queue)`` for the watch loop,
+    which runs every pass on the main thread and puts the JSON-able reply on
+    ``reply_queue``. ``reply_queue.join()`` returns once the reply was sent.
+    """
+
+    def __init__(self, port, requests):
+        self.requests = requests
+        self.sock = socket.create_server(('127.0.0.1', port))
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _addr = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn, conn.makefile('rwb') as f:
+            try:
+                command = f.readline().decode('utf-8', 'replace').strip() or 'regenerate'
+                reply = queue.Queue(maxsize=1)
+                self.requests.put((command, reply))
+                response = reply.get()
+                try:
+                    f.write(json.dumps(response).encode('utf-8') + b'\n')
+                    f.flush()
+                finally:
+                    reply.task_done()
+            except OSError:
+                pass
+
+    def close(self):
+        self.sock.close()
+
+
+def request(port, command='regenerate', timeout=60.0):
+    """Send *command* to a watcher listening on *port* and return its reply."""
+    with socket.create_connection(('127.0.0.1', port), timeout=timeout) as sock:
+        sock.sendall(command.encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            return json.loads(f.readline())
+
+
+def run_pass(args, session, watcher):
+    """
+    Run one generation pass in *session* and re-arm *watcher* on the
+    resulting closure.
+
+    Files are stat'ed before the pass, so an edit made while it runs is
+    picked up by the next poll.
+
+    Returns:
+        dict: The reply sent to socket clients
+    """
+    root = os.path.abspath(args.filename)
+    before = {p: stat_key(p) for p in set(watcher.stats) | {root}}
+    cache = session.parse_cache
+    cache.hits = cache.misses = 0
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            exit_code = generate.run_generation(args, session)
+        except Exception:  # keep watching after a generator bug
+            traceback.print_exc(file=sys.stdout)
+            exit_code = 1
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    sys.stdout.write(output.getvalue())
+
+    closure = set(session.source_digests) | set(session.absent_import_paths) | {root}
+    if exit_code != 0:
+        # A failed parse stops early; keep watching everything seen before.
+        closure |= set(before)
+    else:
+        cache.retain(session.source_digests.values())
+    watcher.watch({p: before[p] if p in before else stat_key(p) for p in closure})
+    print(f"Pass finished in {elapsed_ms:.1f} ms (exit code {exit_code})", flush=True)
+    return {
+        'status': 'ok' if exit_code == 0 else 'error',
+        'exit_code': exit_code,
+        'elapsed_ms': round(elapsed_ms, 3),
+        'output': output.getvalue(),
+    }
+
+
+def watch(args):
+    """Entry point for ``--watch``; returns the exit code."""
+    if args.watch_interval[0] <= 0:
+        print("Error: --watch_interval must be positive")
+        return 1
+    session = generate.GeneratorSession(
+        generate.make_parse_cache(args, generate.get_hash_file_path(args), memory=True))
+    watcher = SourceWatcher()
+    requests = queue.Queue()
+    server = None
+    if args.watch_port[0] is not None:
+        try:
+            server = RequestServer(args.watch_port[0], requests)
+        except OSError as err:
+            print(f"Error: cannot listen on port {args.watch_port[0]}: {err}")
+            return 1
+
+    try:
+        run_pass(args, session, watcher)
+        # --force applies to the first pass; later passes are incremental.
+        args.force = False
+        if server is not None:
+            print(f"Listening for regeneration requests on 127.0.0.1:{server.port}")
+        print(f"Watching {len(watcher.stats)} file(s) for changes (Ctrl+C to stop)", flush=True)
+
+        while True:
+            try:
+                command, reply = requests.get(timeout=args.watch_interval[0])
+            except queue.Empty:
+                command, reply = None, None
+            if command is None:
+                changed = watcher.changed()
+                if not changed:
+                    continue
+                print(f"Changed: {', '.join(changed)}", flush=True)
+                run_pass(args, session, watcher)
+            elif command == 'regenerate':
+                reply.put(run_pass(args, session, watcher))
+            elif command == 'ping':
+                reply.put({'status': 'ok', 'watching': len(watcher.stats)})
+            elif command == 'stop':
+                reply.put({'status': 'ok'})
+                reply.join()
+                break
+            else:
+                reply.put({'status': 'error', 'output': f"Unknown command: {command}"})
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.close()
+    print("Watch stopped", flush=True)
+    return 0
@@ -3,11 +3,12 @@ import argparse, json, sys
 from pathlib import Path
 ROOT=Path(__file__).resolve().parent
 LANGS=['python','c','cpp','ts','js','csharp','rust']
+SUITES=['python_import','python_generator']
 def scenarios(data): return {s['name']:s for s in data.get('scenarios',[])}
 def pct(old,new): return (new-old)/old*100 if old else 0.0
 def main():
-    ap=argparse.ArgumentParser(); ap.add_argument('--lang', action='append', choices=LANGS); ap.add_argument('--allow-missing-baseline', action='store_true'); args=ap.parse_args()
-    cfg=json.loads((ROOT/'thresholds.json').read_text()); failures=[]; langs=args.lang or LANGS
+    ap=argparse.ArgumentParser(); ap.add_argument('--lang', action='append', choices=LANGS); ap.add_argument('--suite', action='append', choices=SUITES); ap.add_argument('--allow-missing-baseline', action='store_true'); args=ap.parse_args()
+    cfg=json.loads((ROOT/'thresholds.json').read_text()); failures=[]; langs=(args.lang or []) + (args.suite or []) or LANGS + SUITES
     for lang in langs:
         base=ROOT/'baselines'/f'{lang}.json'; cur=ROOT/'results'/f'{lang}.json'
         if not cur.exists():
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Code generator benchmark on a synthetic multi-package schema.
+
+The schema has --packages packages of --messages messages each. Package k
+imports package k-1 and embeds its leaf messages. Within a package,
+messages form nesting chains --depth deep. Every message has an enum
+field, a bounded (variable) array and a bounded string. The top of each
+chain has a msgid and a oneof. Phases are timed in-process through
+GeneratorSession:
+
+  parse             parse the import closure with the grammar (no cache)
+  build_model       build the model from cached ASTs (warm --watch pass)
+  validate          resolve types, compute sizes and magic bytes
+  hash              generation hash plus per-package hashes
+  generate_<lang>   produce every file of one language (nothing is written)
+
+msg_per_sec is schema messages processed per second; mb_per_sec is schema
+source (parse, build_model) or generated output (generate_*) per second.
+latency_ns is the time per pass over the whole schema. Results use the
+tests/benchmarks/schema.json shape with operation "generate".
+"""
+import argparse, json, os, platform, socket, sys, tempfile, time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from struct_frame import generate  # noqa: E402
+from struct_frame.generate import GeneratorSession, LANGUAGES  # noqa: E402
+from struct_frame.parse_cache import ParseCache  # noqa: E402
+
+
+def write_schema(directory, packages, messages, depth):
+    """Write p0.sf .. p<packages-1>.sf into *directory*; returns the root file."""
+    for k in range(packages):
+        lines = [f'import "p{k - 1}.sf";\n' if k else '', f'package p{k};\noption pkgid = {k + 1};\n\n',
+                 f'enum Kind{k} {{\n  IDLE = 0;\n  BUSY = 1;\n  FAULT = 2;\n}}\n\n']
+        msgid = 0
+        for i in range(messages):
+            level = i % depth
+            fields = ['uint32 id', f'Kind{k} kind', ('repeated uint16 samples', 'max_size=16'),
+                      ('string label', 'max_size=24')]
+            if level:
+                fields.append(f'M{i - 1} inner')
+            if k and level == 1:
+                fields.append(f'p{k - 1}.M{i - 1} upstream')
+            fields = [f if isinstance(f, tuple) else (f, None) for f in fields]
+            body = ''.join(f'  {decl} = {n}{f" [{opt}]" if opt else ""};\n'
+                           for n, (decl, opt) in enumerate(fields, start=1))
+            if level == depth - 1 or i == messages - 1:
+                msgid += 1
+                body = f'  option msgid = {msgid};\n' + body
+                body += f'  oneof detail {{\n    M{i - level} leaf = 1;\n    uint32 code = 2;\n  }}\n' if level else ''
+            lines.append(f'message M{i} {{\n{body}}}\n\n')
+        (Path(directory) / f'p{k}.sf').write_text(''.join(lines), encoding='utf-8')
+    return str(Path(directory) / f'p{packages - 1}.sf')
+
+
+def pct(values, q):
+    values = sorted(values); return values[min(len(values)-1, int((len(values)-1) * q))]
+
+
+def scenario(name, lat, msg_count, bytes_per_run):
+    duration = sum(lat) / 1e9
+    runs = len(lat)
+    return {"name": name, "profile": "bulk", "operation": "generate", "msg_count": msg_count * runs,
+            "bytes_total": bytes_per_run * runs, "duration_s": duration, "msg_per_sec": msg_count * runs / duration,
+            "mb_per_sec": bytes_per_run * runs / duration / 1e6,
+            "latency_ns": {"p50": pct(lat, .50), "p95": pct(lat, .95), "p99": pct(lat, .99), "max": max(lat)}}
+
+
+def timed(fn):
+    t0 = time.perf_counter_ns(); result = fn(); return time.perf_counter_ns() - t0, result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=int(os.getenv("BENCH_GENERATOR_RUNS", "5")),
+                    help="timed passes per phase (after one warm-up pass)")
+    ap.add_argument("--packages", type=int, default=int(os.getenv("BENCH_GENERATOR_PACKAGES", "6")))
+    ap.add_argument("--messages", type=int, default=int(os.getenv("BENCH_GENERATOR_MESSAGES", "48")),
+                    help="messages per package (at most 255 chain tops get a msgid)")
+    ap.add_argument("--depth", type=int, default=8, help="nesting depth of the message chains")
+    ap.add_argument("--output", default="tests/benchmarks/results/python_generator.json")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_schema(tmp, args.packages, args.messages, args.depth)
+        source_bytes = sum(p.stat().st_size for p in Path(tmp).glob('*.sf'))
+        total = args.packages * args.messages
+        cli = generate.parser.parse_args([root, '--force'] + [f'--build_{lang}' for lang in LANGUAGES])
+        cache = ParseCache(None, memory=True)
+
+        def loaded():
+            session = GeneratorSession(cache)
+            if not (session.parse_file(root) and session.validate()):
+                raise SystemExit("synthetic schema failed to load")
+            return session
+
+        def parse_sample():
+            return timed(lambda: GeneratorSession().parse_file(root))[0]
+
+        def build_sample():
+            return timed(lambda: GeneratorSession(cache).parse_file(root))[0]
+
+        def validate_sample():
+            session = GeneratorSession(cache)
+            session.parse_file(root)
+            return timed(session.validate)[0]
+
+        session = loaded()
+
+        def hash_sample():
+            return timed(lambda: (generate.compute_generation_hash(cli, session.packages),
+                                  generate.compute_package_hashes(session.packages, session.package_imports,
+                                                                  session.source_digests, session.file_to_package)))[0]
+
+        phases = [("parse", parse_sample, source_bytes), ("build_model", build_sample, source_bytes),
+                  ("validate", validate_sample, 0), ("hash", hash_sample, 0)]
+        scenarios = []
+        for name, sample, nbytes in phases:
+            sample()  # warm-up: loads the grammar, fills the AST cache
+            scenarios.append(scenario(name, [sample() for _ in range(args.runs)], total, nbytes))
+        for lang in LANGUAGES:
+            paths = {lang: os.path.join(tmp, 'out', lang) + os.sep}
+            run = lambda: timed(lambda: session.generate([lang], paths=paths))
+            _lat, files = run()
+            out_bytes = sum(len(data.encode('utf-8')) for data in files.values())
+            scenarios.append(scenario(f"generate_{lang}", [run()[0] for _ in range(args.runs)], total, out_bytes))
+
+    print(f"{args.packages} packages x {args.messages} messages, depth {args.depth}")
+    for s in scenarios:
+        print(f"{s['name']:<18} p50 {s['latency_ns']['p50'] / 1e6:>9.1f} ms  {s['msg_per_sec']:>10.0f} msg/s")
+    out = {"schema_version": "1", "language": "python", "runner_version": "tier-d-generator-1",
+           "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+           "host": {"os": platform.system(), "arch": platform.machine(), "cpu": platform.processor() or socket.gethostname()},
+           "scenarios": scenarios}
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True); Path(args.output).write_text(json.dumps(out, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
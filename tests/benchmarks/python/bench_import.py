@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Generator start-up benchmark.
+
+Every sample runs in a fresh interpreter, so the numbers include module
+loading but not the work a warm process would have done already:
+
+  import_struct_frame   import struct_frame (package, no back-ends)
+  import_generate       import struct_frame.generate
+  noop_build            full CLI run on an up-to-date output directory,
+                        which returns before any parsing
+  validate              full CLI run with --validate --no_cache (loads the
+                        grammar and parses test_messages.sf)
+
+Bytecode writing is enabled and every scenario is warmed up once, so the
+samples measure an installed package rather than source compilation.
+msg_per_sec is samples per second; latency_ns is the per-sample wall time
+(for the import_* scenarios, the time spent inside the import statement).
+Results use the tests/benchmarks/schema.json shape with operation
+"startup".
+"""
+import argparse, json, os, platform, socket, subprocess, sys, tempfile, time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+SRC = ROOT / 'src'
+PROTO = ROOT / 'tests' / 'proto' / 'test_messages.sf'
+
+IMPORT_SNIPPET = ("import time; t = time.perf_counter_ns(); import {module}; "
+                  "print(time.perf_counter_ns() - t)")
+
+
+def environment():
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPATH'] = str(SRC) + os.pathsep + env.get('PYTHONPATH', '')
+    return env
+
+
+def import_sample(module, env):
+    out = subprocess.run([sys.executable, '-c', IMPORT_SNIPPET.format(module=module)],
+                         env=env, capture_output=True, text=True, check=True).stdout
+    return int(out.strip())
+
+
+def cli_sample(args, env):
+    t0 = time.perf_counter_ns()
+    subprocess.run([sys.executable, str(SRC / 'main.py'), *args], env=env,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter_ns() - t0
+
+
+def pct(values, q):
+    values = sorted(values); return values[min(len(values)-1, int((len(values)-1) * q))]
+
+
+def run(name, sample, runs):
+    sample()  # warm-up: writes bytecode, primes the output directory
+    lat = [sample() for _ in range(runs)]
+    duration = sum(lat) / 1e9
+    return {"name": name, "profile": "standard", "operation": "startup", "msg_count": runs,
+            "bytes_total": 0, "duration_s": duration, "msg_per_sec": runs / duration, "mb_per_sec": 0.0,
+            "latency_ns": {"p50": pct(lat, .50), "p95": pct(lat, .95), "p99": pct(lat, .99), "max": max(lat)}}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=int(os.getenv("BENCH_STARTUP_RUNS", "20")),
+                    help="fresh interpreters per scenario")
+    ap.add_argument("--output", default="tests/benchmarks/results/python_import.json")
+    args = ap.parse_args()
+    env = environment()
+    with tempfile.TemporaryDirectory() as out_dir:
+        build = [str(PROTO), '--build_py', '--py_path', out_dir + os.sep]
+        scenarios = [
+            run("import_struct_frame", lambda: import_sample('struct_frame', env), args.runs),
+            run("import_generate", lambda: import_sample('struct_frame.generate', env), args.runs),
+            run("noop_build", lambda: cli_sample(build, env), args.runs),
+            run("validate", lambda: cli_sample([str(PROTO), '--validate', '--no_cache'], env), args.runs),
+        ]
+    for s in scenarios:
+        print(f"{s['name']:<22} p50 {s['latency_ns']['p50'] / 1e6:>8.1f} ms")
+    out = {"schema_version": "1", "language": "python", "runner_version": "tier-d-startup-1",
+           "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+           "host": {"os": platform.system(), "arch": platform.machine(), "cpu": platform.processor() or socket.gethostname()},
+           "scenarios": scenarios}
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True); Path(args.output).write_text(json.dumps(out, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""In-process dispatch benchmark for StructFrameSdk.
+
+Feeds a pre-encoded buffer of ProfileStandard frames straight into the SDK's
+receive path (no sockets) and reports messages/sec through reader + dispatch
+for a few subscription shapes:
+
+  dispatch_raw_1       one handler, no codec (raw payload bytes)
+  dispatch_codec_1     one handler, codec registered
+  dispatch_codec_4     four handlers sharing one decode
+  dispatch_unhandled   frames with no subscriber (parse + drop)
+  handlers_only_*      pre-parsed frames through _dispatch alone (no reader)
+
+Results use the tests/benchmarks/schema.json shape; latency_ns is the time
+to dispatch one chunk of CHUNK_FRAMES frames.
+"""
+import argparse, json, os, platform, socket, sys, time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT / 'src' / 'struct_frame' / 'boilerplate' / 'py'))
+
+from frame_profiles import PROFILE_STANDARD_CONFIG, AccumulatingReader, encode_message  # noqa: E402
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig  # noqa: E402
+from struct_frame_sdk.transport import BaseTransport  # noqa: E402
+
+MSG_ID = 3
+PAYLOAD_LEN = 32
+CHUNK_FRAMES = 256
+
+
+class _NullTransport(BaseTransport):
+    def connect(self): self.connected = True
+    def disconnect(self): self.connected = False
+    def send(self, data): return len(data)
+
+
+class _Codec:
+    msg_id = MSG_ID
+
+    def deserialize(self, data):
+        return data[0]
+
+
+def make_chunk():
+    payload = bytes(range(PAYLOAD_LEN))
+    raw = type('_Raw', (), {'MSG_ID': MSG_ID, 'MAGIC1': 0, 'MAGIC2': 0, 'serialize': lambda self_: payload})()
+    frame = encode_message(PROFILE_STANDARD_CONFIG, raw)
+    return frame * CHUNK_FRAMES
+
+
+def pct(values, q):
+    values.sort(); return values[min(len(values)-1, int((len(values)-1) * q))]
+
+
+def parsed_chunk(chunk):
+    reader = AccumulatingReader(PROFILE_STANDARD_CONFIG, buffer_size=65536)
+    reader.add_data(chunk)
+    results = []
+    while (r := reader.try_next()) is not None:
+        results.append(r)
+    return results
+
+
+def run(name, handlers, codec, frame_count, direct=False):
+    sdk = StructFrameSdk(StructFrameSdkConfig(transport=_NullTransport(), profile=PROFILE_STANDARD_CONFIG,
+                                              buffer_size=65536))
+    if codec:
+        sdk.register_codec(_Codec())
+    count = [0]
+
+    def handler(_message, _msg_id):
+        count[0] += 1
+
+    for _ in range(handlers):
+        sdk.subscribe(MSG_ID, handler)
+    chunk = make_chunk()
+    feed = sdk._handle_incoming_data
+    if direct:
+        results, dispatch = parsed_chunk(chunk), sdk._dispatch
+
+        def feed(_chunk):
+            for r in results:
+                dispatch(r)
+    chunks = max(1, frame_count // CHUNK_FRAMES)
+    lat = []
+    start = time.perf_counter_ns()
+    for _ in range(chunks):
+        t0 = time.perf_counter_ns()
+        feed(chunk)
+        lat.append(time.perf_counter_ns() - t0)
+    duration = max((time.perf_counter_ns() - start) / 1e9, 1e-9)
+    if count[0] != chunks * CHUNK_FRAMES * handlers:
+        raise RuntimeError(f'{name}: {count[0]} handler calls, expected {chunks * CHUNK_FRAMES * handlers}')
+    n = chunks * CHUNK_FRAMES
+    return {"name": name, "profile": "standard", "operation": "decode", "msg_count": n,
+            "bytes_total": chunks * len(chunk), "duration_s": duration, "msg_per_sec": n / duration,
+            "mb_per_sec": chunks * len(chunk) / duration / 1_000_000,
+            "latency_ns": {"p50": pct(lat, .50), "p95": pct(lat, .95), "p99": pct(lat, .99), "max": max(lat)}}
+
+
+SCENARIOS = [
+    ("dispatch_raw_1", 1, False),
+    ("dispatch_codec_1", 1, True),
+    ("dispatch_codec_4", 4, True),
+    ("dispatch_unhandled", 0, False),
+    ("handlers_only_raw_1", 1, False, True),
+    ("handlers_only_codec_4", 4, True, True),
+]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--iterations", type=int, default=int(os.getenv("BENCH_ITERATIONS", "200000")),
+                    help="frames dispatched per scenario")
+    ap.add_argument("--output", default="tests/benchmarks/results/python_sdk_dispatch.json")
+    args = ap.parse_args()
+    scenarios = [run(*spec[:3], args.iterations, *spec[3:]) for spec in SCENARIOS]
+    for s in scenarios:
+        print(f"{s['name']:<24} {s['msg_per_sec']:>12.0f} msg/s")
+    out = {"schema_version": "1", "language": "python", "runner_version": "tier-d-sdk-dispatch-1",
+           "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+           "host": {"os": platform.system(), "arch": platform.machine(), "cpu": platform.processor() or socket.gethostname()},
+           "scenarios": scenarios}
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True); Path(args.output).write_text(json.dumps(out, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
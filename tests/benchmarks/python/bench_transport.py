@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Loopback receive-path benchmark for the Python SDK transports.
+
+Streams ProfileStandard frames from a local peer into a StructFrameSdk and
+measures frames/sec through the real transport receive loop. Each scenario
+runs the same stream through a different receive path so the cost of the
+transport layer itself is visible:
+
+  tcp_bytes_callback  TcpTransport -> set_data_callback (bytes copy per read)
+  tcp_view_callback   TcpTransport -> set_data_view_callback (memoryview, no copy)
+  shm_view_callback   SharedMemoryTransport ring -> memoryview of the ring
+  uds_stream_view_callback     UnixTransport SOCK_STREAM
+  uds_seqpacket_view_callback  UnixTransport SOCK_SEQPACKET (64 frames per record)
+
+The *_pingpong scenarios compare loopback TCP with Unix domain sockets for
+latency: one frame is sent, echoed by the peer and received back before the
+next one goes out.
+
+Results use the same JSON shape as the Tier D wire benchmarks
+(tests/benchmarks/schema.json). For the streaming scenarios latency_ns is
+the time spent inside each receive callback (parse + dispatch of one read);
+for the ping-pong scenarios it is the round-trip time of one frame.
+"""
+import argparse, json, os, platform, socket, sys, threading, time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT / 'src' / 'struct_frame' / 'boilerplate' / 'py'))
+
+from frame_profiles import PROFILE_STANDARD_CONFIG, encode_message  # noqa: E402
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig  # noqa: E402
+from struct_frame_sdk.tcp_transport import TcpTransport, TcpTransportConfig  # noqa: E402
+from struct_frame_sdk.shared_memory_transport import SharedMemoryTransport, SharedMemoryTransportConfig  # noqa: E402
+from struct_frame_sdk.unix_transport import UnixTransport, UnixTransportConfig  # noqa: E402
+
+MSG_ID = 3
+PAYLOAD_LEN = 32
+RECV_BUFFER = 65536
+PINGPONG_ROUNDS = 5000
+
+
+def make_stream(count):
+    payload = bytes((i * 31 + PAYLOAD_LEN) & 0xff for i in range(PAYLOAD_LEN))
+    raw = type('_Raw', (), {'MSG_ID': MSG_ID, 'MAGIC1': 0, 'MAGIC2': 0, 'serialize': lambda self_: payload})()
+    frame = encode_message(PROFILE_STANDARD_CONFIG, raw)
+    return frame * count, len(frame)
+
+
+def pct(values, q):
+    values.sort(); return values[min(len(values)-1, int((len(values)-1) * q))]
+
+
+def tcp_pair():
+    """Return (listening peer socket, port). The peer accepts one connection."""
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(('127.0.0.1', 0)); srv.listen(1)
+    return srv, srv.getsockname()[1]
+
+
+def drive(transport, accept_peer, stream, frame_count, use_view):
+    """Connect *transport* through an SDK, stream frames from the peer, time delivery."""
+    sdk = StructFrameSdk(StructFrameSdkConfig(transport=transport, profile=PROFILE_STANDARD_CONFIG,
+                                              buffer_size=RECV_BUFFER))
+    received = [0]
+    done = threading.Event()
+
+    def on_frame(_payload, _msg_id):
+        received[0] += 1
+        if received[0] == frame_count:
+            done.set()
+
+    sdk.subscribe(MSG_ID, on_frame)
+    lat = []
+
+    def timed(handler):
+        def cb(data):
+            t0 = time.perf_counter_ns(); handler(data); lat.append(time.perf_counter_ns() - t0)
+        return cb
+
+    if use_view:
+        transport.set_data_view_callback(timed(sdk._handle_incoming_data))
+    else:
+        transport.set_data_view_callback(None)
+        transport.set_data_callback(timed(sdk._handle_incoming_data))
+
+    sdk.connect()
+    peer = accept_peer()
+    start = time.perf_counter_ns()
+    peer.sendall(stream)
+    done.wait(timeout=60)
+    duration = max((time.perf_counter_ns() - start) / 1e9, 1e-9)
+    sdk.disconnect(); peer.close()
+    if received[0] != frame_count:
+        raise RuntimeError(f'received {received[0]}/{frame_count} frames')
+    return duration, lat or [0]
+
+
+def run_tcp(name, use_view, frame_count):
+    stream, _ = make_stream(frame_count)
+    srv, port = tcp_pair()
+    try:
+        transport = TcpTransport(TcpTransportConfig(host='127.0.0.1', port=port, buffer_size=RECV_BUFFER))
+        duration, lat = drive(transport, lambda: srv.accept()[0], stream, frame_count, use_view)
+    finally:
+        srv.close()
+    return result(name, frame_count, len(stream), duration, lat)
+
+
+class _ShmPeer:
+    """Creator end of a shared-memory channel, used like a connected socket."""
+
+    def __init__(self, name):
+        self.transport = SharedMemoryTransport(SharedMemoryTransportConfig(name=name, create=True))
+        self.transport.connect()
+
+    def sendall(self, data):
+        self.transport.send(data)
+
+    def close(self):
+        self.transport.disconnect()
+
+
+def run_shm(name, frame_count):
+    stream, _ = make_stream(frame_count)
+    seg = f'sf_bench_{os.getpid()}'
+    peer = _ShmPeer(seg)
+    transport = SharedMemoryTransport(SharedMemoryTransportConfig(name=seg))
+    duration, lat = drive(transport, lambda: peer, stream, frame_count, True)
+    return result(name, frame_count, len(stream), duration, lat)
+
+
+class _RecordPeer:
+    """Wraps a seqpacket socket so sendall() sends one record per FRAMES_PER_RECORD frames."""
+    FRAMES_PER_RECORD = 64
+
+    def __init__(self, sock, frame_len):
+        self.sock, self.record = sock, frame_len * self.FRAMES_PER_RECORD
+
+    def sendall(self, data):
+        view = memoryview(data)
+        for off in range(0, len(view), self.record):
+            self.sock.send(view[off:off + self.record])
+
+    def close(self):
+        self.sock.close()
+
+
+def run_uds(name, socket_type, frame_count):
+    stream, frame_len = make_stream(frame_count)
+    transport, peer = UnixTransport.pair(socket_type, buffer_size=RECV_BUFFER)
+    peer_sock = peer.unix_config.sock
+    wrapped = _RecordPeer(peer_sock, frame_len) if socket_type == 'seqpacket' else peer_sock
+    duration, lat = drive(transport, lambda: wrapped, stream, frame_count, True)
+    return result(name, frame_count, len(stream), duration, lat)
+
+
+def _echo(sock):
+    try:
+        while True:
+            data = sock.recv(RECV_BUFFER)
+            if not data:
+                return
+            sock.sendall(data)
+    except OSError:
+        return
+
+
+def pingpong(name, transport, peer_sock, rounds):
+    """Round-trip one frame at a time through a connected *transport* and an echoing peer."""
+    frame, _ = make_stream(1)
+    got = threading.Event()
+    transport.set_data_callback(lambda _data: got.set())
+    threading.Thread(target=_echo, args=(peer_sock,), daemon=True).start()
+    lat = []
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        got.clear()
+        t0 = time.perf_counter_ns()
+        transport.send(frame)
+        if not got.wait(5.0):
+            raise RuntimeError('echo timed out')
+        lat.append(time.perf_counter_ns() - t0)
+    duration = (time.perf_counter_ns() - start) / 1e9
+    transport.disconnect(); peer_sock.close()
+    return {**result(name, rounds, 2 * rounds * len(frame), duration, lat), "operation": "roundtrip"}
+
+
+def run_tcp_pingpong(name, rounds):
+    srv, port = tcp_pair()
+    try:
+        transport = TcpTransport(TcpTransportConfig(host='127.0.0.1', port=port))
+        transport.connect()
+        peer = srv.accept()[0]
+    finally:
+        srv.close()
+    # Nagle would delay the small frames; disable it on both ends for a fair latency run.
+    peer.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    transport.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return pingpong(name, transport, peer, rounds)
+
+
+def run_uds_pingpong(name, socket_type, rounds):
+    transport, peer = UnixTransport.pair(socket_type, buffer_size=RECV_BUFFER)
+    transport.connect()
+    return pingpong(name, transport, peer.unix_config.sock, rounds)
+
+
+def result(name, count, total_bytes, duration, lat):
+    return {"name": name, "profile": "standard", "operation": "decode", "msg_count": count, "bytes_total": total_bytes,
+            "duration_s": duration, "msg_per_sec": count / duration, "mb_per_sec": total_bytes / duration / 1_000_000,
+            "latency_ns": {"p50": pct(lat, .50), "p95": pct(lat, .95), "p99": pct(lat, .99), "max": max(lat)}}
+
+
+SCENARIOS = [
+    ("tcp_bytes_callback", lambda n: run_tcp("tcp_bytes_callback", False, n)),
+    ("tcp_view_callback", lambda n: run_tcp("tcp_view_callback", True, n)),
+    ("shm_view_callback", lambda n: run_shm("shm_view_callback", n)),
+    ("uds_stream_view_callback", lambda n: run_uds("uds_stream_view_callback", 'stream', n)),
+    ("uds_seqpacket_view_callback", lambda n: run_uds("uds_seqpacket_view_callback", 'seqpacket', n)),
+    ("tcp_pingpong", lambda n: run_tcp_pingpong("tcp_pingpong", min(n, PINGPONG_ROUNDS))),
+    ("uds_stream_pingpong", lambda n: run_uds_pingpong("uds_stream_pingpong", 'stream', min(n, PINGPONG_ROUNDS))),
+    ("uds_seqpacket_pingpong", lambda n: run_uds_pingpong("uds_seqpacket_pingpong", 'seqpacket', min(n, PINGPONG_ROUNDS))),
+]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--iterations", type=int, default=int(os.getenv("BENCH_ITERATIONS", "50000")),
+                    help="frames streamed per scenario")
+    ap.add_argument("--output", default="tests/benchmarks/results/python_transport.json")
+    args = ap.parse_args()
+    scenarios = [run(args.iterations) for _, run in SCENARIOS]
+    for s in scenarios:
+        print(f"{s['name']:<30} {s['msg_per_sec']:>12.0f} msg/s {s['mb_per_sec']:>8.2f} MB/s  p99 {s['latency_ns']['p99']} ns")
+    out = {"schema_version": "1", "language": "python", "runner_version": "tier-d-transport-1",
+           "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+           "host": {"os": platform.system(), "arch": platform.machine(), "cpu": platform.processor() or socket.gethostname()},
+           "scenarios": scenarios}
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True); Path(args.output).write_text(json.dumps(out, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ ROOT = Path(__file__).resolve().parents[2]
 BENCH = ROOT / 'tests' / 'benchmarks'
 RESULTS = BENCH / 'results'
 LANGS = ['python','c','cpp','ts','js','csharp','rust']
+# Extra result files produced alongside a language: (suite name, language, script, runs env var, default runs).
+SUITES = [('python_import', 'python', 'tests/benchmarks/python/bench_import.py', 'BENCH_STARTUP_RUNS', '20'),
+          ('python_generator', 'python', 'tests/benchmarks/python/bench_generator.py', 'BENCH_GENERATOR_RUNS', '5')]
 
 def run(cmd, cwd=ROOT, env=None):
     print('+', ' '.join(map(str, cmd)))
@@ -57,6 +60,15 @@ def main():
             all_data.append(validate(ROOT/out, lang))
         except (OSError, json.JSONDecodeError, ValueError) as e:
             failures.append((lang, str(e)))
+        for suite, suite_lang, script, runs_env, runs in SUITES:
+            if suite_lang != lang: continue
+            out=Path('tests/benchmarks/results')/f'{suite}.json'
+            rc=run([sys.executable, script, '--runs', '5' if args.quick else os.getenv(runs_env, runs), '--output', str(out)]).returncode
+            if rc: failures.append((suite, f'exit {rc}')); continue
+            try:
+                all_data.append(validate(ROOT/out, lang))
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                failures.append((suite, str(e)))
     summary={'schema_version':'1','host':{'os':platform.system(),'arch':platform.machine()},'languages':all_data}
     (RESULTS/'summary.json').write_text(json.dumps(summary,indent=2)+'\n')
     lines=['| language | scenario | msg/sec | MB/sec | p99 ns |','|---|---:|---:|---:|---:|']
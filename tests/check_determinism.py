@@ -48,12 +48,15 @@ LANGUAGES = [
 IGNORE_NAMES = {
     "sf_compile.json",   # catalog – may contain absolute paths
     ".structframe.hash",  # cache key includes output-directory paths
+    ".structframe.sources",  # source manifest lists absolute input paths
+    ".structframe.packages",  # per-package manifest keyed on output paths
     "Cargo.lock",         # created by `cargo build`, not by the struct-frame generator
 }
 
 # Directory segments that mark entire subtrees to skip.
 IGNORE_DIR_SEGMENTS = {
     "__pycache__",  # Python bytecode
+    ".structframe.cache",  # parsed-file cache
     "obj",          # C# / MSBuild build artefacts
     "bin",          # C# compiled output
     "roundtrip_bin",  # round-trip test binaries built into tests/generated/<lang>/ at runtime
@@ -122,7 +122,33 @@ SECTIONS = [
                          "absence of `#pragma pack`, round-trip parity)"),
                     _full("Hash / `--force` caching", "✅",
                           "Verified by `tests/test_caching.py` (hash file creation, "
-                          "skip-on-match, `--force` bypass, structural change invalidation)"),
+                          "skip-on-match, `--force` bypass, structural change invalidation, "
+                          "pre-parse source manifest)"),
+                    _full("Parsed-file cache (`--cache_dir` / `--no_cache`)", "✅",
+                          "Verified by `tests/test_parse_cache.py` (hits on unchanged files, "
+                          "re-parse of edited files only, corrupt and non-AST entries, concurrent runs)"),
+                    _full("Per-package incremental regeneration", "✅",
+                          "Verified by `tests/test_incremental_generation.py` (edited package and "
+                          "its importers only, unchanged files keep their mtime, flag change and "
+                          "`--force` regenerate all)"),
+                    _full("Parallel generation (`--jobs`)", "✅",
+                          "Verified by `tests/test_parallel_generation.py` (all languages "
+                          "byte-identical to a serial run, incremental parallel run)"),
+                    _full("Watch mode (`--watch`, `--watch_interval`, `--watch_port`)", "✅",
+                          "Verified by `tests/test_watch_mode.py` (polling, socket requests, "
+                          "syntax-error recovery, growing import closure, `stop`)"),
+                    _full("Lazy language back-end loading", "✅",
+                          "Verified by `tests/test_lazy_imports.py` (imports load no back-end, "
+                          "a run loads only the selected back-ends); start-up timed by "
+                          "`tests/benchmarks/python/bench_import.py`"),
+                    _full("Output writer (skip-if-identical, atomic replace)", "✅",
+                          "Verified by `tests/test_output_writer.py` (forced run touches no "
+                          "file, edited boilerplate restored, mode kept, failed write leaves "
+                          "the old file)"),
+                    _full("`GeneratorSession` library API", "✅",
+                          "Verified by `tests/test_generator_session.py` (independent sessions in "
+                          "one process, reload after errors, output identical to the CLI); parse, "
+                          "validate and generation timed by `tests/benchmarks/python/bench_generator.py`"),
                 ],
             },
         ],
@@ -556,7 +582,7 @@ SECTIONS = [
                     "> **Closed.** `StructFrameSdk` subscribe/dispatch is now "
                     "tested with mock transports in six languages:\n"
                     "> - **C++** -- `tests/cpp/test_sdk_subscribe.cpp` (17 `run_test` registrations)\n"
-                    "> - **Python** -- `tests/py/test_sdk.py` (8 test functions, 31 `run_test` assertions)\n"
+                    "> - **Python** -- `tests/py/test_sdk.py` (9 test functions, 39 `run_test` assertions)\n"
                     "> - **TypeScript** -- `tests/ts/test_sdk.ts` (7 test functions, 25 `assert` assertions)\n"
                     "> - **C#** -- `tests/csharp/TestSdkSubscribe.cs` (32 `Assert` assertions)\n"
                     "> - **JavaScript** -- `tests/js/test_sdk.js` (7 test functions, 25 `assert` assertions)\n"
@@ -593,8 +619,8 @@ SECTIONS = [
                     "subscribe/dispatch/send_raw/send/register_codec/"
                     "__aenter__/__aexit__/close-callback are tested with a mock "
                     "async transport in "
-                    "`tests/py/test_async_sdk.py` (40 `run_test` pattern hits, "
-                    "36 live assertions).\n>\n"
+                    "`tests/py/test_async_sdk.py` (43 `run_test` pattern hits, "
+                    "39 live assertions).\n>\n"
                     "> **Closed (request/response).** `request()` / `request_raw()` "
                     "(Python sync), `async request()` (Python async), "
                     "`request<TResp>()` (TypeScript), and `RequestAsync<TReq,TResp>()` "
@@ -690,11 +716,16 @@ SECTIONS = [
                     _row("Field number zero", {"Tested": "✅"}),
                     _row("Circular import detection", {"Tested": "✅"}),
                     _row("Multi-package without `pkgid`", {"Tested": "✅"}),
+                    _row("Message embedding cycle (incl. self-reference), reported "
+                         "with the cycle path", {"Tested": "✅"}),
+                    _row("Message nesting deeper than the recursion limit: accepted",
+                         {"Tested": "✅"}),
                 ],
                 "caption": (
-                    "All 14 generator-side error rules plus 2 acceptance checks "
-                    "(max_size > 255 is legal for array and string fields) are "
-                    "covered by the 16 passing tests in "
+                    "All 15 generator-side error rules plus 3 acceptance checks "
+                    "(max_size > 255 is legal for array and string fields, and "
+                    "deep message nesting is validated without recursion) are "
+                    "covered by the 18 passing tests in "
                     "`tests/test_generator_validation.py`. Note: "
                     "`max_size` > 255 triggers a two-byte length-count prefix "
                     "in the generated code; it is explicitly validated as "
@@ -0,0 +1,126 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace common_types {
+
+/* Package ID for extended message IDs */
+constexpr uint8_t PACKAGE_ID = 1;
+
+/* Enum definitions */
+// Common types that can be imported by other proto files
+// Note: No pkgid defined here - will inherit from importing file
+enum class Status : uint8_t {
+    Idle = 0,
+    Active = 1,
+    Error = 2
+};
+
+/* Convert Status to string */
+inline const char* Status_to_string(Status value) {
+    switch (value) {
+        case Status::Idle: return "IDLE";
+        case Status::Active: return "ACTIVE";
+        case Status::Error: return "ERROR";
+        default: return "UNKNOWN";
+    }
+}
+
+/* Struct definitions */
+#pragma pack(push, 1)
+struct Timestamp : structframe::MessageBase<Timestamp, 257, 12, 19, 31, 12> {
+
+    uint64_t seconds;
+    uint32_t nanoseconds;
+
+    bool operator==(const Timestamp& other) const {
+        return (seconds == other.seconds) &&
+               (nanoseconds == other.nanoseconds);
+    }
+    bool operator!=(const Timestamp& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(uint16_t msg_id, size_t* size) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != common_types::PACKAGE_ID) {
+        return false;
+    }
+    
+    switch (local_msg_id) {
+        case 1: *size = common_types::Timestamp::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != common_types::PACKAGE_ID) {
+        return MessageInfo{};
+    }
+    
+    switch (local_msg_id) {
+        case 1: return MessageInfo{common_types::Timestamp::MAX_SIZE, common_types::Timestamp::MAGIC1, common_types::Timestamp::MAGIC2, common_types::Timestamp::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace common_types
+}  // namespace structframe
@@ -0,0 +1,856 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace envelope_test {
+
+/* Enum definitions */
+// ============================================================================
+// Response Messages
+// ============================================================================
+// Generic response status
+enum class ResponseStatus : uint8_t {
+    Success = 0,
+    Error = 1,
+    Busy = 2,
+    Invalid = 3
+};
+
+/* Convert ResponseStatus to string */
+inline const char* ResponseStatus_to_string(ResponseStatus value) {
+    switch (value) {
+        case ResponseStatus::Success: return "SUCCESS";
+        case ResponseStatus::Error: return "ERROR";
+        case ResponseStatus::Busy: return "BUSY";
+        case ResponseStatus::Invalid: return "INVALID";
+        default: return "UNKNOWN";
+    }
+}
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// Test file for envelope/container message feature
+// Demonstrates the is_envelope option for wrapping multiple message types
+// ============================================================================
+// Command Messages - These are the individual command types
+// ============================================================================
+// ADC (Analog-to-Digital Converter) Command
+struct ADCCommand : structframe::MessageBase<ADCCommand, 112, 4, 17, 26, 4> {
+
+    uint8_t channel;
+    uint16_t sample_rate;
+    bool enable;
+
+    bool operator==(const ADCCommand& other) const {
+        return (channel == other.channel) &&
+               (sample_rate == other.sample_rate) &&
+               (enable == other.enable);
+    }
+    bool operator!=(const ADCCommand& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// DAC (Digital-to-Analog Converter) Command  
+struct DACCommand : structframe::MessageBase<DACCommand, 113, 4, 17, 26, 4> {
+
+    uint8_t channel;
+    uint16_t output_value;
+    bool enable;
+
+    bool operator==(const DACCommand& other) const {
+        return (channel == other.channel) &&
+               (output_value == other.output_value) &&
+               (enable == other.enable);
+    }
+    bool operator!=(const DACCommand& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Motor Control Command
+struct MotorCommand : structframe::MessageBase<MotorCommand, 114, 4, 18, 31, 4> {
+
+    int16_t speed;
+    uint8_t direction;
+    bool brake;
+
+    bool operator==(const MotorCommand& other) const {
+        return (speed == other.speed) &&
+               (direction == other.direction) &&
+               (brake == other.brake);
+    }
+    bool operator!=(const MotorCommand& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Sensor Read Command
+struct SensorReadCommand : structframe::MessageBase<SensorReadCommand, 115, 3, 7, 9, 3> {
+
+    uint8_t sensor_id;
+    uint16_t interval_ms;
+
+    bool operator==(const SensorReadCommand& other) const {
+        return (sensor_id == other.sensor_id) &&
+               (interval_ms == other.interval_ms);
+    }
+    bool operator!=(const SensorReadCommand& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Envelope Message - Wraps all command types for unified handling
+// ============================================================================
+// CommandEnvelope is a container message that can hold any of the above commands.
+// The is_envelope option enables special SDK helper methods for wrapping/unwrapping.
+struct CommandEnvelope : structframe::MessageBase<CommandEnvelope, 200, 12, 188, 166, 12> {
+
+// Envelope-level fields (metadata about the command)
+    uint32_t sequence_number;
+    uint8_t priority;
+    bool run_immediately;
+// Union of all command types - exactly one will be populated
+// The auto-discriminator uses the message ID of the wrapped command
+    uint16_t command_discriminator;  // Auto-generated message ID discriminator
+    union {
+        ADCCommand adc;
+        DACCommand dac;
+        MotorCommand motor;
+        SensorReadCommand sensor;
+    } command;
+
+    bool operator==(const CommandEnvelope& other) const {
+        return (sequence_number == other.sequence_number) &&
+               (priority == other.priority) &&
+               (run_immediately == other.run_immediately) &&
+               (command_discriminator == other.command_discriminator) && (std::memcmp(&command, &other.command, sizeof(command)) == 0);
+    }
+    bool operator!=(const CommandEnvelope& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    // ========================================
+    // Envelope message helper methods
+    // ========================================
+
+    /**
+     * Create a CommandEnvelope envelope wrapping a payload message.
+     * Only accepts valid payload types: ADCCommand, DACCommand, MotorCommand, SensorReadCommand
+     * @tparam T The payload message type (must be one of the valid types)
+     * @param payload The message to wrap
+     * @param sequence_number Envelope field value
+     * @param priority Envelope field value
+     * @param run_immediately Envelope field value
+     * @return A fully initialized CommandEnvelope envelope
+     */
+    template<typename T, typename = std::enable_if_t<T::MSG_ID == ADCCommand::MSG_ID || T::MSG_ID == DACCommand::MSG_ID || T::MSG_ID == MotorCommand::MSG_ID || T::MSG_ID == SensorReadCommand::MSG_ID>>
+    static CommandEnvelope wrap(uint32_t sequence_number, uint8_t priority, bool run_immediately, const T& payload) {
+        CommandEnvelope envelope{};
+        envelope.sequence_number = sequence_number;
+        envelope.priority = priority;
+        envelope.run_immediately = run_immediately;
+        envelope.command_discriminator = T::MSG_ID;
+        // Copy payload into the correct union field based on MSG_ID
+        if constexpr (T::MSG_ID == ADCCommand::MSG_ID) {
+            std::memcpy(&envelope.command.adc, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == DACCommand::MSG_ID) {
+            std::memcpy(&envelope.command.dac, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == MotorCommand::MSG_ID) {
+            std::memcpy(&envelope.command.motor, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == SensorReadCommand::MSG_ID) {
+            std::memcpy(&envelope.command.sensor, &payload, sizeof(T));
+        }
+        return envelope;
+    }
+
+    /**
+     * Get the message ID of the wrapped payload.
+     * @return The message ID of the payload in the command union
+     */
+    uint16_t getPayloadMessageId() const {
+        return command_discriminator;
+    }
+};
+
+
+// ADC Response
+struct ADCResponse : structframe::MessageBase<ADCResponse, 212, 4, 23, 32, 4> {
+
+    uint8_t channel;
+    uint16_t value;
+    ResponseStatus status;
+
+    bool operator==(const ADCResponse& other) const {
+        return (channel == other.channel) &&
+               (value == other.value) &&
+               (status == other.status);
+    }
+    bool operator!=(const ADCResponse& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// DAC Response
+struct DACResponse : structframe::MessageBase<DACResponse, 213, 2, 17, 19, 2> {
+
+    uint8_t channel;
+    ResponseStatus status;
+
+    bool operator==(const DACResponse& other) const {
+        return (channel == other.channel) &&
+               (status == other.status);
+    }
+    bool operator!=(const DACResponse& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Motor Response
+struct MotorResponse : structframe::MessageBase<MotorResponse, 214, 3, 20, 25, 3> {
+
+    int16_t actual_speed;
+    ResponseStatus status;
+
+    bool operator==(const MotorResponse& other) const {
+        return (actual_speed == other.actual_speed) &&
+               (status == other.status);
+    }
+    bool operator!=(const MotorResponse& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Sensor Response  
+struct SensorResponse : structframe::MessageBase<SensorResponse, 215, 6, 28, 42, 6> {
+
+    uint8_t sensor_id;
+    float value;
+    ResponseStatus status;
+
+    bool operator==(const SensorResponse& other) const {
+        return (sensor_id == other.sensor_id) &&
+               (value == other.value) &&
+               (status == other.status);
+    }
+    bool operator!=(const SensorResponse& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Response Envelope
+// ============================================================================
+// ResponseEnvelope wraps all response types
+struct ResponseEnvelope : structframe::MessageBase<ResponseEnvelope, 250, 16, 118, 153, 16> {
+
+// Envelope-level fields
+    uint32_t sequence_number;
+    uint32_t timestamp_ms;
+// Union of all response types
+    uint16_t response_discriminator;  // Auto-generated message ID discriminator
+    union {
+        ADCResponse adc;
+        DACResponse dac;
+        MotorResponse motor;
+        SensorResponse sensor;
+    } response;
+
+    bool operator==(const ResponseEnvelope& other) const {
+        return (sequence_number == other.sequence_number) &&
+               (timestamp_ms == other.timestamp_ms) &&
+               (response_discriminator == other.response_discriminator) && (std::memcmp(&response, &other.response, sizeof(response)) == 0);
+    }
+    bool operator!=(const ResponseEnvelope& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    // ========================================
+    // Envelope message helper methods
+    // ========================================
+
+    /**
+     * Create a ResponseEnvelope envelope wrapping a payload message.
+     * Only accepts valid payload types: ADCResponse, DACResponse, MotorResponse, SensorResponse
+     * @tparam T The payload message type (must be one of the valid types)
+     * @param payload The message to wrap
+     * @param sequence_number Envelope field value
+     * @param timestamp_ms Envelope field value
+     * @return A fully initialized ResponseEnvelope envelope
+     */
+    template<typename T, typename = std::enable_if_t<T::MSG_ID == ADCResponse::MSG_ID || T::MSG_ID == DACResponse::MSG_ID || T::MSG_ID == MotorResponse::MSG_ID || T::MSG_ID == SensorResponse::MSG_ID>>
+    static ResponseEnvelope wrap(uint32_t sequence_number, uint32_t timestamp_ms, const T& payload) {
+        ResponseEnvelope envelope{};
+        envelope.sequence_number = sequence_number;
+        envelope.timestamp_ms = timestamp_ms;
+        envelope.response_discriminator = T::MSG_ID;
+        // Copy payload into the correct union field based on MSG_ID
+        if constexpr (T::MSG_ID == ADCResponse::MSG_ID) {
+            std::memcpy(&envelope.response.adc, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == DACResponse::MSG_ID) {
+            std::memcpy(&envelope.response.dac, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == MotorResponse::MSG_ID) {
+            std::memcpy(&envelope.response.motor, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == SensorResponse::MSG_ID) {
+            std::memcpy(&envelope.response.sensor, &payload, sizeof(T));
+        }
+        return envelope;
+    }
+
+    /**
+     * Get the message ID of the wrapped payload.
+     * @return The message ID of the payload in the response union
+     */
+    uint16_t getPayloadMessageId() const {
+        return response_discriminator;
+    }
+};
+
+
+// ============================================================================
+// Field-Order Discriminator Envelope Test
+// These inner types intentionally have NO msgid, so the auto-discriminator
+// falls back to field_order - this exercises the SDK interface enum naming fix.
+// ============================================================================
+// Payload type without msgid - forces field_order discriminator
+struct RawSamplePayload {
+    uint8_t channel;
+    float value;
+    uint8_t flags;
+
+    bool operator==(const RawSamplePayload& other) const {
+        return (channel == other.channel) &&
+               (value == other.value) &&
+               (flags == other.flags);
+    }
+    bool operator!=(const RawSamplePayload& other) const { return !(*this == other); }
+};
+
+
+// Config payload without msgid - forces field_order discriminator
+struct RawConfigPayload {
+    uint8_t setting_id;
+    uint16_t setting_value;
+
+    bool operator==(const RawConfigPayload& other) const {
+        return (setting_id == other.setting_id) &&
+               (setting_value == other.setting_value);
+    }
+    bool operator!=(const RawConfigPayload& other) const { return !(*this == other); }
+};
+
+
+// Envelope wrapping payloads that have no msgid.
+// Since neither RawSamplePayload nor RawConfigPayload has a msgid,
+// the auto-discriminator uses field_order, generating a discriminator enum.
+// This is the scenario that exposed the enum naming bug in SdkInterface.cs.
+struct RawDataEnvelope : structframe::MessageBase<RawDataEnvelope, 300, 12, 176, 29, 12> {
+
+    /* Discriminator enum for payload oneof */
+    enum class PayloadField : uint8_t {
+        NONE = 0,
+        SAMPLE = 1,
+        CONFIG = 2,
+    };
+
+    uint8_t priority;
+    uint32_t timestamp_us;
+    PayloadField payload_discriminator;  // Auto-generated field order discriminator
+    union {
+        RawSamplePayload sample;
+        RawConfigPayload config;
+    } payload;
+
+    bool operator==(const RawDataEnvelope& other) const {
+        return (priority == other.priority) &&
+               (timestamp_us == other.timestamp_us) &&
+               (payload_discriminator == other.payload_discriminator) && (std::memcmp(&payload, &other.payload, sizeof(payload)) == 0);
+    }
+    bool operator!=(const RawDataEnvelope& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    // ========================================
+    // Envelope message helper methods
+    // ========================================
+
+    /**
+     * Create a RawDataEnvelope envelope wrapping a RawSamplePayload payload.
+     * @param payload The RawSamplePayload message to wrap
+     * @param priority Envelope field value
+     * @param timestamp_us Envelope field value
+     * @return A fully initialized RawDataEnvelope envelope
+     */
+    static RawDataEnvelope wrap(uint8_t priority, uint32_t timestamp_us, const RawSamplePayload& payload) {
+        RawDataEnvelope envelope{};
+        envelope.priority = priority;
+        envelope.timestamp_us = timestamp_us;
+        envelope.payload_discriminator = PayloadField::SAMPLE;
+        std::memcpy(&envelope.payload.sample, &payload, sizeof(RawSamplePayload));
+        return envelope;
+    }
+
+    /**
+     * Create a RawDataEnvelope envelope wrapping a RawConfigPayload payload.
+     * @param payload The RawConfigPayload message to wrap
+     * @param priority Envelope field value
+     * @param timestamp_us Envelope field value
+     * @return A fully initialized RawDataEnvelope envelope
+     */
+    static RawDataEnvelope wrap(uint8_t priority, uint32_t timestamp_us, const RawConfigPayload& payload) {
+        RawDataEnvelope envelope{};
+        envelope.priority = priority;
+        envelope.timestamp_us = timestamp_us;
+        envelope.payload_discriminator = PayloadField::CONFIG;
+        std::memcpy(&envelope.payload.config, &payload, sizeof(RawConfigPayload));
+        return envelope;
+    }
+
+    /**
+     * Get the discriminator value of the wrapped payload.
+     * @return The PayloadField enum value for the active payload
+     */
+    PayloadField getPayloadField() const {
+        return payload_discriminator;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(size_t msg_id, size_t* size) {
+    switch (msg_id) {
+        case envelope_test::ADCCommand::MSG_ID: *size = envelope_test::ADCCommand::MAX_SIZE; return true;
+        case envelope_test::DACCommand::MSG_ID: *size = envelope_test::DACCommand::MAX_SIZE; return true;
+        case envelope_test::MotorCommand::MSG_ID: *size = envelope_test::MotorCommand::MAX_SIZE; return true;
+        case envelope_test::SensorReadCommand::MSG_ID: *size = envelope_test::SensorReadCommand::MAX_SIZE; return true;
+        case envelope_test::CommandEnvelope::MSG_ID: *size = envelope_test::CommandEnvelope::MAX_SIZE; return true;
+        case envelope_test::ADCResponse::MSG_ID: *size = envelope_test::ADCResponse::MAX_SIZE; return true;
+        case envelope_test::DACResponse::MSG_ID: *size = envelope_test::DACResponse::MAX_SIZE; return true;
+        case envelope_test::MotorResponse::MSG_ID: *size = envelope_test::MotorResponse::MAX_SIZE; return true;
+        case envelope_test::SensorResponse::MSG_ID: *size = envelope_test::SensorResponse::MAX_SIZE; return true;
+        case envelope_test::ResponseEnvelope::MSG_ID: *size = envelope_test::ResponseEnvelope::MAX_SIZE; return true;
+        case envelope_test::RawDataEnvelope::MSG_ID: *size = envelope_test::RawDataEnvelope::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    switch (msg_id) {
+        case envelope_test::ADCCommand::MSG_ID: return MessageInfo{envelope_test::ADCCommand::MAX_SIZE, envelope_test::ADCCommand::MAGIC1, envelope_test::ADCCommand::MAGIC2, envelope_test::ADCCommand::BASE_SIZE};
+        case envelope_test::DACCommand::MSG_ID: return MessageInfo{envelope_test::DACCommand::MAX_SIZE, envelope_test::DACCommand::MAGIC1, envelope_test::DACCommand::MAGIC2, envelope_test::DACCommand::BASE_SIZE};
+        case envelope_test::MotorCommand::MSG_ID: return MessageInfo{envelope_test::MotorCommand::MAX_SIZE, envelope_test::MotorCommand::MAGIC1, envelope_test::MotorCommand::MAGIC2, envelope_test::MotorCommand::BASE_SIZE};
+        case envelope_test::SensorReadCommand::MSG_ID: return MessageInfo{envelope_test::SensorReadCommand::MAX_SIZE, envelope_test::SensorReadCommand::MAGIC1, envelope_test::SensorReadCommand::MAGIC2, envelope_test::SensorReadCommand::BASE_SIZE};
+        case envelope_test::CommandEnvelope::MSG_ID: return MessageInfo{envelope_test::CommandEnvelope::MAX_SIZE, envelope_test::CommandEnvelope::MAGIC1, envelope_test::CommandEnvelope::MAGIC2, envelope_test::CommandEnvelope::BASE_SIZE};
+        case envelope_test::ADCResponse::MSG_ID: return MessageInfo{envelope_test::ADCResponse::MAX_SIZE, envelope_test::ADCResponse::MAGIC1, envelope_test::ADCResponse::MAGIC2, envelope_test::ADCResponse::BASE_SIZE};
+        case envelope_test::DACResponse::MSG_ID: return MessageInfo{envelope_test::DACResponse::MAX_SIZE, envelope_test::DACResponse::MAGIC1, envelope_test::DACResponse::MAGIC2, envelope_test::DACResponse::BASE_SIZE};
+        case envelope_test::MotorResponse::MSG_ID: return MessageInfo{envelope_test::MotorResponse::MAX_SIZE, envelope_test::MotorResponse::MAGIC1, envelope_test::MotorResponse::MAGIC2, envelope_test::MotorResponse::BASE_SIZE};
+        case envelope_test::SensorResponse::MSG_ID: return MessageInfo{envelope_test::SensorResponse::MAX_SIZE, envelope_test::SensorResponse::MAGIC1, envelope_test::SensorResponse::MAGIC2, envelope_test::SensorResponse::BASE_SIZE};
+        case envelope_test::ResponseEnvelope::MSG_ID: return MessageInfo{envelope_test::ResponseEnvelope::MAX_SIZE, envelope_test::ResponseEnvelope::MAGIC1, envelope_test::ResponseEnvelope::MAGIC2, envelope_test::ResponseEnvelope::BASE_SIZE};
+        case envelope_test::RawDataEnvelope::MSG_ID: return MessageInfo{envelope_test::RawDataEnvelope::MAX_SIZE, envelope_test::RawDataEnvelope::MAGIC1, envelope_test::RawDataEnvelope::MAGIC2, envelope_test::RawDataEnvelope::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace envelope_test
+}  // namespace structframe
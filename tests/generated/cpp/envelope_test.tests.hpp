@@ -0,0 +1,454 @@
+/* Automatically generated test code for struct-frame messages */
+/* This file provides round-trip encode/decode verification tests */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+
+#include <cstdio>
+#include <cstring>
+#include <cstdint>
+#include "envelope_test.structframe.hpp"
+#include "frame_profiles.hpp"
+#include "profiling_tests.hpp"
+
+namespace structframe {
+namespace envelope_test {
+namespace Tests {
+
+/* Create a test instance of ADCCommand */
+inline ADCCommand create_test_a_d_c_command() {
+    ADCCommand msg{};
+    msg.channel = 42;
+    msg.sample_rate = 1001;
+    msg.enable = true;
+    return msg;
+}
+
+/* Create a test instance of DACCommand */
+inline DACCommand create_test_d_a_c_command() {
+    DACCommand msg{};
+    msg.channel = 42;
+    msg.output_value = 1001;
+    msg.enable = true;
+    return msg;
+}
+
+/* Create a test instance of MotorCommand */
+inline MotorCommand create_test_motor_command() {
+    MotorCommand msg{};
+    msg.speed = 500;
+    msg.direction = 43;
+    msg.brake = true;
+    return msg;
+}
+
+/* Create a test instance of SensorReadCommand */
+inline SensorReadCommand create_test_sensor_read_command() {
+    SensorReadCommand msg{};
+    msg.sensor_id = 42;
+    msg.interval_ms = 1001;
+    return msg;
+}
+
+/* Create a test instance of ADCResponse */
+inline ADCResponse create_test_a_d_c_response() {
+    ADCResponse msg{};
+    msg.channel = 42;
+    msg.value = 1001;
+    msg.status = static_cast<ResponseStatus>(0);
+    return msg;
+}
+
+/* Create a test instance of DACResponse */
+inline DACResponse create_test_d_a_c_response() {
+    DACResponse msg{};
+    msg.channel = 42;
+    msg.status = static_cast<ResponseStatus>(0);
+    return msg;
+}
+
+/* Create a test instance of MotorResponse */
+inline MotorResponse create_test_motor_response() {
+    MotorResponse msg{};
+    msg.actual_speed = 500;
+    msg.status = static_cast<ResponseStatus>(0);
+    return msg;
+}
+
+/* Create a test instance of SensorResponse */
+inline SensorResponse create_test_sensor_response() {
+    SensorResponse msg{};
+    msg.sensor_id = 42;
+    msg.value = 4.14159f;
+    msg.status = static_cast<ResponseStatus>(0);
+    return msg;
+}
+
+/* Test result structure */
+struct TestResult {
+    bool passed;
+    const char* message_name;
+    const char* error_msg;
+    bool skipped = false;  /* profile-incompatible: not a real pass */
+};
+
+/* Test round-trip encode/decode for ADCCommand */
+template <typename Config>
+inline TestResult test_a_d_c_command() {
+    using MsgT = ADCCommand;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ADCCommand", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ADCCommand", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_a_d_c_command();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ADCCommand", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for DACCommand */
+template <typename Config>
+inline TestResult test_d_a_c_command() {
+    using MsgT = DACCommand;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "DACCommand", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "DACCommand", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_d_a_c_command();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "DACCommand", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for MotorCommand */
+template <typename Config>
+inline TestResult test_motor_command() {
+    using MsgT = MotorCommand;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "MotorCommand", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "MotorCommand", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_motor_command();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "MotorCommand", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for SensorReadCommand */
+template <typename Config>
+inline TestResult test_sensor_read_command() {
+    using MsgT = SensorReadCommand;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "SensorReadCommand", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "SensorReadCommand", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_sensor_read_command();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "SensorReadCommand", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ADCResponse */
+template <typename Config>
+inline TestResult test_a_d_c_response() {
+    using MsgT = ADCResponse;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ADCResponse", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ADCResponse", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_a_d_c_response();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ADCResponse", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for DACResponse */
+template <typename Config>
+inline TestResult test_d_a_c_response() {
+    using MsgT = DACResponse;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "DACResponse", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "DACResponse", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_d_a_c_response();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "DACResponse", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for MotorResponse */
+template <typename Config>
+inline TestResult test_motor_response() {
+    using MsgT = MotorResponse;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "MotorResponse", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "MotorResponse", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_motor_response();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "MotorResponse", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for SensorResponse */
+template <typename Config>
+inline TestResult test_sensor_response() {
+    using MsgT = SensorResponse;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "SensorResponse", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "SensorResponse", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_sensor_response();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "SensorResponse", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Number of test messages */
+static constexpr size_t TEST_MESSAGE_COUNT = 8;
+
+/* Run all message tests with a specific profile.
+ * Profile-incompatible messages are counted in *out_skipped* (NOT as
+ * passes); ``tested[i]`` is set true when message i round-trips under this
+ * profile so the caller can verify every message is exercised somewhere.
+ * Returns the number of genuine passes. */
+template <typename Config>
+inline size_t run_all_tests(bool* tested, size_t& out_skipped, bool verbose = false) {
+    size_t passed = 0;
+    out_skipped = 0;
+    TestResult results[] = {
+        test_a_d_c_command<Config>(),
+        test_d_a_c_command<Config>(),
+        test_motor_command<Config>(),
+        test_sensor_read_command<Config>(),
+        test_a_d_c_response<Config>(),
+        test_d_a_c_response<Config>(),
+        test_motor_response<Config>(),
+        test_sensor_response<Config>(),
+    };
+    
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (results[i].skipped) {
+            out_skipped++;
+            if (verbose) {
+                std::printf("[SKIP] %s: %s\n", results[i].message_name,
+                           results[i].error_msg ? results[i].error_msg : "");
+            }
+        } else if (results[i].passed) {
+            passed++;
+            tested[i] = true;
+            if (verbose) {
+                std::printf("[PASS] %s\n", results[i].message_name);
+            }
+        } else {
+            if (verbose) {
+                std::printf("[FAIL] %s: %s\n", results[i].message_name, 
+                           results[i].error_msg ? results[i].error_msg : "Unknown error");
+            }
+        }
+    }
+    
+    if (verbose) {
+        std::printf("\nTest Results: %zu/%zu passed (%zu skipped)\n", passed, TEST_MESSAGE_COUNT - out_skipped, out_skipped);
+    }
+    
+    return passed;
+}
+
+/* Run profiling tests for all messages with a specific profile */
+template <typename Config>
+inline void run_profiling_tests(bool verbose = false) {
+    uint8_t buffer[4096];
+    
+    if (verbose) {
+        std::printf("Running profiling tests (%zu iterations each)...\n", 
+                   structframe::ProfilingTests::PROFILE_ITERATIONS);
+    }
+    
+    {
+        auto msg = create_test_a_d_c_command();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ADCCommand, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ADCCommand:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_d_a_c_command();
+        auto result = structframe::ProfilingTests::run_packed_profiling<DACCommand, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("DACCommand:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_motor_command();
+        auto result = structframe::ProfilingTests::run_packed_profiling<MotorCommand, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("MotorCommand:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_sensor_read_command();
+        auto result = structframe::ProfilingTests::run_packed_profiling<SensorReadCommand, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("SensorReadCommand:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_a_d_c_response();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ADCResponse, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ADCResponse:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_d_a_c_response();
+        auto result = structframe::ProfilingTests::run_packed_profiling<DACResponse, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("DACResponse:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_motor_response();
+        auto result = structframe::ProfilingTests::run_packed_profiling<MotorResponse, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("MotorResponse:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_sensor_response();
+        auto result = structframe::ProfilingTests::run_packed_profiling<SensorResponse, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("SensorResponse:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+}
+
+/* Run round-trip tests across all 5 frame profiles */
+inline bool run_roundtrip_all_profiles(bool verbose = false) {
+    using namespace structframe;
+    struct ProfileEntry { const char* name; size_t (*runner)(bool*, size_t&, bool); };
+    ProfileEntry profiles[] = {
+        {"ProfileStandard", run_all_tests<ProfileStandardConfig>},
+        {"ProfileSensor",   run_all_tests<ProfileSensorConfig>},
+        {"ProfileIPC",      run_all_tests<ProfileIPCConfig>},
+        {"ProfileBulk",     run_all_tests<ProfileBulkConfig>},
+        {"ProfileNetwork",  run_all_tests<ProfileNetworkConfig>},
+    };
+    bool all_passed = true;
+    /* tested[i] becomes true once message i round-trips under any profile. */
+    bool tested[TEST_MESSAGE_COUNT == 0 ? 1 : TEST_MESSAGE_COUNT] = {false};
+    for (const auto& p : profiles) {
+        if (verbose) std::printf("\n--- %s ---\n", p.name);
+        size_t skipped = 0;
+        size_t passed = p.runner(tested, skipped, verbose);
+        size_t expected = TEST_MESSAGE_COUNT - skipped;
+        if (passed != expected) {
+            all_passed = false;
+            std::printf("[FAIL] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        } else if (verbose) {
+            std::printf("[OK] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        }
+    }
+    /* Messages skipped under every profile are not exercised by this
+     * generated suite (e.g. cross-package messages the per-package
+     * registry cannot resolve). Reported loudly but non-fatally -- a
+     * profile that *attempts* a message and fails is caught above. */
+    size_t never = 0;
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (!tested[i]) { never++; std::printf("[WARN] message index %zu skipped under every profile, not exercised\n", i); }
+    }
+    (void)never;
+    return all_passed;
+}
+
+}  // namespace Tests
+}  // namespace envelope_test
+}  // namespace structframe
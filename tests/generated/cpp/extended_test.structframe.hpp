@@ -0,0 +1,550 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace extended_test {
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// Extended test messages for struct-frame code generation framework
+// Tests for message IDs > 255 (require extended profiles with pkg_id)
+// Also tests for extended payloads > 255 bytes (require 2-byte length field)
+//
+// These messages are only compatible with extended profiles:
+// - profile_bulk (BasicExtended): supports extended msg_id and extended payload
+// - profile_network (BasicExtendedMultiSystemStream): supports extended msg_id and extended payload
+// ============================================================================
+// Extended Message ID Tests (msgid > 255)
+// Three representative IDs cover the full range: boundary (256), mid (1000), high (4000).
+// ============================================================================
+// Message with ID 256 - tests minimum extended ID (just above 255)
+struct ExtendedIdMessage10 : structframe::MessageBase<ExtendedIdMessage10, 256, 19, 28, 50, 19> {
+
+    uint16_t small_value;
+    char short_text[16];  // Fixed string: exactly 16 chars
+    bool flag;
+
+    bool operator==(const ExtendedIdMessage10& other) const {
+        return (small_value == other.small_value) &&
+               (std::strncmp(short_text, other.short_text, 16) == 0) &&
+               (flag == other.flag);
+    }
+    bool operator!=(const ExtendedIdMessage10& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Message with ID 1000 - tests mid-range extended ID
+struct ExtendedIdMessage2 : structframe::MessageBase<ExtendedIdMessage2, 1000, 79, 40, 89, 79> {
+
+    int32_t sensor_id;
+    double reading;
+    uint16_t status_code;
+    struct { uint8_t length; char data[64]; } description;  // Variable string: up to 64 chars
+
+    bool operator==(const ExtendedIdMessage2& other) const {
+        return (sensor_id == other.sensor_id) &&
+               (reading == other.reading) &&
+               (status_code == other.status_code) &&
+               (description.length == other.description.length && std::strncmp(description.data, other.description.data, 64) == 0);
+    }
+    bool operator!=(const ExtendedIdMessage2& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Message with ID 4000 - tests high extended ID with 64-bit fields
+struct ExtendedIdMessage9 : structframe::MessageBase<ExtendedIdMessage9, 4000, 24, 36, 71, 24> {
+
+    int64_t big_number;
+    uint64_t big_unsigned;
+    double precision_value;
+
+    bool operator==(const ExtendedIdMessage9& other) const {
+        return (big_number == other.big_number) &&
+               (big_unsigned == other.big_unsigned) &&
+               (precision_value == other.precision_value);
+    }
+    bool operator!=(const ExtendedIdMessage9& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Extended Payload Tests (payload > 255 bytes)
+// These require profiles with 2-byte length field
+// ============================================================================
+// Large message with payload > 255 bytes (fixed arrays: 64 floats = 256 bytes)
+struct LargePayloadMessage1 : structframe::MessageBase<LargePayloadMessage1, 800, 300, 45, 99, 300> {
+
+    float sensor_readings[64];  // Fixed array: always 64 elements
+// 64 * 4 = 256 bytes
+    uint32_t reading_count;
+    int64_t timestamp;
+    char device_name[32];  // Fixed string: exactly 32 chars
+
+    bool operator==(const LargePayloadMessage1& other) const {
+        return (std::memcmp(sensor_readings, other.sensor_readings, sizeof(sensor_readings)) == 0) &&
+               (reading_count == other.reading_count) &&
+               (timestamp == other.timestamp) &&
+               (std::strncmp(device_name, other.device_name, 32) == 0);
+    }
+    bool operator!=(const LargePayloadMessage1& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Large message with fixed array of 280 bytes
+struct LargePayloadMessage2 : structframe::MessageBase<LargePayloadMessage2, 801, 280, 2, 2, 280> {
+
+    uint8_t large_data[280];  // Fixed array: always 280 elements
+
+    bool operator==(const LargePayloadMessage2& other) const {
+        return (std::memcmp(large_data, other.large_data, sizeof(large_data)) == 0);
+    }
+    bool operator!=(const LargePayloadMessage2& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Variable Length Message Tests for Extended IDs (msgid: 802)
+// ============================================================================
+// Variable message with extended ID and single bounded array (msgid: 802)
+struct ExtendedVariableSingleArray : structframe::MessageBase<ExtendedVariableSingleArray, 802, 263, 23, 50, 263> {
+
+    uint64_t timestamp;
+    struct { uint8_t count; uint8_t data[250]; } telemetry_data;  // Variable array: up to 250 elements
+// Up to 250 bytes
+    uint32_t crc;
+
+    bool operator==(const ExtendedVariableSingleArray& other) const {
+        return (timestamp == other.timestamp) &&
+               (telemetry_data.count == other.telemetry_data.count && std::memcmp(telemetry_data.data, other.telemetry_data.data, sizeof(telemetry_data.data)) == 0) &&
+               (crc == other.crc);
+    }
+    bool operator!=(const ExtendedVariableSingleArray& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 13;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 8;  // timestamp
+        size += 1 + (telemetry_data.count * 1);  // telemetry_data
+        size += 4;  // crc
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &timestamp, 8); offset += 8;  // fixed run
+        buffer[offset++] = telemetry_data.count;
+        std::memcpy(buffer + offset, telemetry_data.data, telemetry_data.count * 1);
+        offset += telemetry_data.count * 1;
+        std::memcpy(buffer + offset, &crc, 4); offset += 4;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 8 > buffer_size) return 0;
+        std::memcpy(&timestamp, buffer + offset, 8);
+        offset += 8;
+        if (offset >= buffer_size) return 0;
+        telemetry_data.count = buffer[offset++];
+        if (telemetry_data.count > 250) telemetry_data.count = 250;
+        if (offset + telemetry_data.count * 1 > buffer_size) return 0;
+        std::memcpy(telemetry_data.data, buffer + offset, telemetry_data.count * 1);
+        offset += telemetry_data.count * 1;
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&crc, buffer + offset, 4);
+        offset += 4;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// Variable message with bounded fields whose max_size > 255, forcing 2-byte
+// count/length prefixes in the variable encoding. Regression cover for the
+// encoder/decoder/serialized_size prefix-width agreement: a 1-byte read on a
+// 2-byte prefix corrupts every following field.
+struct ExtendedVariableLargeArray : structframe::MessageBase<ExtendedVariableLargeArray, 803, 610, 31, 70, 610> {
+
+    uint32_t id;
+    struct { uint16_t count; uint8_t data[300]; } big_telemetry;  // Variable array: up to 300 elements
+// >255 -> 2-byte count prefix
+    struct { uint16_t length; char data[300]; } big_label;  // Variable string: up to 300 chars
+// >255 -> 2-byte length prefix
+    uint16_t trailer;
+
+    bool operator==(const ExtendedVariableLargeArray& other) const {
+        return (id == other.id) &&
+               (big_telemetry.count == other.big_telemetry.count && std::memcmp(big_telemetry.data, other.big_telemetry.data, sizeof(big_telemetry.data)) == 0) &&
+               (big_label.length == other.big_label.length && std::strncmp(big_label.data, other.big_label.data, 300) == 0) &&
+               (trailer == other.trailer);
+    }
+    bool operator!=(const ExtendedVariableLargeArray& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 10;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 4;  // id
+        size += 1 + (big_telemetry.count * 1);  // big_telemetry
+        size += 1 + big_label.length;  // big_label
+        size += 2;  // trailer
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &id, 4); offset += 4;  // fixed run
+        buffer[offset++] = big_telemetry.count;
+        std::memcpy(buffer + offset, big_telemetry.data, big_telemetry.count * 1);
+        offset += big_telemetry.count * 1;
+        buffer[offset++] = big_label.length;
+        std::memcpy(buffer + offset, big_label.data, big_label.length);
+        offset += big_label.length;
+        std::memcpy(buffer + offset, &trailer, 2); offset += 2;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&id, buffer + offset, 4);
+        offset += 4;
+        if (offset >= buffer_size) return 0;
+        big_telemetry.count = buffer[offset++];
+        if (big_telemetry.count > 300) big_telemetry.count = 300;
+        if (offset + big_telemetry.count * 1 > buffer_size) return 0;
+        std::memcpy(big_telemetry.data, buffer + offset, big_telemetry.count * 1);
+        offset += big_telemetry.count * 1;
+        if (offset >= buffer_size) return 0;
+        big_label.length = buffer[offset++];
+        if (big_label.length > 300) big_label.length = 300;
+        if (offset + big_label.length > buffer_size) return 0;
+        std::memcpy(big_label.data, buffer + offset, big_label.length);
+        offset += big_label.length;
+        if (offset + 2 > buffer_size) return 0;
+        std::memcpy(&trailer, buffer + offset, 2);
+        offset += 2;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(size_t msg_id, size_t* size) {
+    switch (msg_id) {
+        case extended_test::ExtendedIdMessage10::MSG_ID: *size = extended_test::ExtendedIdMessage10::MAX_SIZE; return true;
+        case extended_test::ExtendedIdMessage2::MSG_ID: *size = extended_test::ExtendedIdMessage2::MAX_SIZE; return true;
+        case extended_test::ExtendedIdMessage9::MSG_ID: *size = extended_test::ExtendedIdMessage9::MAX_SIZE; return true;
+        case extended_test::LargePayloadMessage1::MSG_ID: *size = extended_test::LargePayloadMessage1::MAX_SIZE; return true;
+        case extended_test::LargePayloadMessage2::MSG_ID: *size = extended_test::LargePayloadMessage2::MAX_SIZE; return true;
+        case extended_test::ExtendedVariableSingleArray::MSG_ID: *size = extended_test::ExtendedVariableSingleArray::MAX_SIZE; return true;
+        case extended_test::ExtendedVariableLargeArray::MSG_ID: *size = extended_test::ExtendedVariableLargeArray::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    switch (msg_id) {
+        case extended_test::ExtendedIdMessage10::MSG_ID: return MessageInfo{extended_test::ExtendedIdMessage10::MAX_SIZE, extended_test::ExtendedIdMessage10::MAGIC1, extended_test::ExtendedIdMessage10::MAGIC2, extended_test::ExtendedIdMessage10::BASE_SIZE};
+        case extended_test::ExtendedIdMessage2::MSG_ID: return MessageInfo{extended_test::ExtendedIdMessage2::MAX_SIZE, extended_test::ExtendedIdMessage2::MAGIC1, extended_test::ExtendedIdMessage2::MAGIC2, extended_test::ExtendedIdMessage2::BASE_SIZE};
+        case extended_test::ExtendedIdMessage9::MSG_ID: return MessageInfo{extended_test::ExtendedIdMessage9::MAX_SIZE, extended_test::ExtendedIdMessage9::MAGIC1, extended_test::ExtendedIdMessage9::MAGIC2, extended_test::ExtendedIdMessage9::BASE_SIZE};
+        case extended_test::LargePayloadMessage1::MSG_ID: return MessageInfo{extended_test::LargePayloadMessage1::MAX_SIZE, extended_test::LargePayloadMessage1::MAGIC1, extended_test::LargePayloadMessage1::MAGIC2, extended_test::LargePayloadMessage1::BASE_SIZE};
+        case extended_test::LargePayloadMessage2::MSG_ID: return MessageInfo{extended_test::LargePayloadMessage2::MAX_SIZE, extended_test::LargePayloadMessage2::MAGIC1, extended_test::LargePayloadMessage2::MAGIC2, extended_test::LargePayloadMessage2::BASE_SIZE};
+        case extended_test::ExtendedVariableSingleArray::MSG_ID: return MessageInfo{extended_test::ExtendedVariableSingleArray::MAX_SIZE, extended_test::ExtendedVariableSingleArray::MAGIC1, extended_test::ExtendedVariableSingleArray::MAGIC2, extended_test::ExtendedVariableSingleArray::BASE_SIZE};
+        case extended_test::ExtendedVariableLargeArray::MSG_ID: return MessageInfo{extended_test::ExtendedVariableLargeArray::MAX_SIZE, extended_test::ExtendedVariableLargeArray::MAGIC1, extended_test::ExtendedVariableLargeArray::MAGIC2, extended_test::ExtendedVariableLargeArray::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace extended_test
+}  // namespace structframe
@@ -0,0 +1,428 @@
+/* Automatically generated test code for struct-frame messages */
+/* This file provides round-trip encode/decode verification tests */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+
+#include <cstdio>
+#include <cstring>
+#include <cstdint>
+#include "extended_test.structframe.hpp"
+#include "frame_profiles.hpp"
+#include "profiling_tests.hpp"
+
+namespace structframe {
+namespace extended_test {
+namespace Tests {
+
+/* Create a test instance of ExtendedIdMessage10 */
+inline ExtendedIdMessage10 create_test_extended_id_message10() {
+    ExtendedIdMessage10 msg{};
+    msg.small_value = 1000;
+    std::strncpy(msg.short_text, "test_string", sizeof(msg.short_text) - 1);
+    msg.flag = true;
+    return msg;
+}
+
+/* Create a test instance of ExtendedIdMessage2 */
+inline ExtendedIdMessage2 create_test_extended_id_message2() {
+    ExtendedIdMessage2 msg{};
+    msg.sensor_id = 123456;
+    msg.reading = 3.718281828;
+    msg.status_code = 1002;
+    msg.description.length = 11;
+    std::strncpy(msg.description.data, "test_string", sizeof(msg.description.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of ExtendedIdMessage9 */
+inline ExtendedIdMessage9 create_test_extended_id_message9() {
+    ExtendedIdMessage9 msg{};
+    msg.big_number = 9876543210LL;
+    msg.big_unsigned = 9876543211ULL;
+    msg.precision_value = 4.718281828;
+    return msg;
+}
+
+/* Create a test instance of LargePayloadMessage1 */
+inline LargePayloadMessage1 create_test_large_payload_message1() {
+    LargePayloadMessage1 msg{};
+    msg.sensor_readings[0] = 3.14159f;
+    msg.sensor_readings[1] = 4.14159f;
+    msg.sensor_readings[2] = 5.14159f;
+    msg.reading_count = 123457U;
+    msg.timestamp = 9876543212LL;
+    std::strncpy(msg.device_name, "test_string", sizeof(msg.device_name) - 1);
+    return msg;
+}
+
+/* Create a test instance of LargePayloadMessage2 */
+inline LargePayloadMessage2 create_test_large_payload_message2() {
+    LargePayloadMessage2 msg{};
+    msg.large_data[0] = 42;
+    msg.large_data[1] = 43;
+    msg.large_data[2] = 44;
+    return msg;
+}
+
+/* Create a test instance of ExtendedVariableSingleArray */
+inline ExtendedVariableSingleArray create_test_extended_variable_single_array() {
+    ExtendedVariableSingleArray msg{};
+    msg.timestamp = 9876543210ULL;
+    msg.telemetry_data.count = 3;
+    msg.telemetry_data.data[0] = 42;
+    msg.telemetry_data.data[1] = 43;
+    msg.telemetry_data.data[2] = 44;
+    msg.crc = 123458U;
+    return msg;
+}
+
+/* Create a test instance of ExtendedVariableLargeArray */
+inline ExtendedVariableLargeArray create_test_extended_variable_large_array() {
+    ExtendedVariableLargeArray msg{};
+    msg.id = 123456U;
+    msg.big_telemetry.count = 3;
+    msg.big_telemetry.data[0] = 42;
+    msg.big_telemetry.data[1] = 43;
+    msg.big_telemetry.data[2] = 44;
+    msg.big_label.length = 11;
+    std::strncpy(msg.big_label.data, "test_string", sizeof(msg.big_label.data) - 1);
+    msg.trailer = 1003;
+    return msg;
+}
+
+/* Test result structure */
+struct TestResult {
+    bool passed;
+    const char* message_name;
+    const char* error_msg;
+    bool skipped = false;  /* profile-incompatible: not a real pass */
+};
+
+/* Test round-trip encode/decode for ExtendedIdMessage10 */
+template <typename Config>
+inline TestResult test_extended_id_message10() {
+    using MsgT = ExtendedIdMessage10;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ExtendedIdMessage10", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ExtendedIdMessage10", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_extended_id_message10();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ExtendedIdMessage10", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ExtendedIdMessage2 */
+template <typename Config>
+inline TestResult test_extended_id_message2() {
+    using MsgT = ExtendedIdMessage2;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ExtendedIdMessage2", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ExtendedIdMessage2", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_extended_id_message2();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ExtendedIdMessage2", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ExtendedIdMessage9 */
+template <typename Config>
+inline TestResult test_extended_id_message9() {
+    using MsgT = ExtendedIdMessage9;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ExtendedIdMessage9", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ExtendedIdMessage9", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_extended_id_message9();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ExtendedIdMessage9", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for LargePayloadMessage1 */
+template <typename Config>
+inline TestResult test_large_payload_message1() {
+    using MsgT = LargePayloadMessage1;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "LargePayloadMessage1", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "LargePayloadMessage1", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_large_payload_message1();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "LargePayloadMessage1", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for LargePayloadMessage2 */
+template <typename Config>
+inline TestResult test_large_payload_message2() {
+    using MsgT = LargePayloadMessage2;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "LargePayloadMessage2", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "LargePayloadMessage2", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_large_payload_message2();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "LargePayloadMessage2", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ExtendedVariableSingleArray */
+template <typename Config>
+inline TestResult test_extended_variable_single_array() {
+    using MsgT = ExtendedVariableSingleArray;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ExtendedVariableSingleArray", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ExtendedVariableSingleArray", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_extended_variable_single_array();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ExtendedVariableSingleArray", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ExtendedVariableLargeArray */
+template <typename Config>
+inline TestResult test_extended_variable_large_array() {
+    using MsgT = ExtendedVariableLargeArray;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ExtendedVariableLargeArray", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ExtendedVariableLargeArray", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_extended_variable_large_array();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ExtendedVariableLargeArray", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Number of test messages */
+static constexpr size_t TEST_MESSAGE_COUNT = 7;
+
+/* Run all message tests with a specific profile.
+ * Profile-incompatible messages are counted in *out_skipped* (NOT as
+ * passes); ``tested[i]`` is set true when message i round-trips under this
+ * profile so the caller can verify every message is exercised somewhere.
+ * Returns the number of genuine passes. */
+template <typename Config>
+inline size_t run_all_tests(bool* tested, size_t& out_skipped, bool verbose = false) {
+    size_t passed = 0;
+    out_skipped = 0;
+    TestResult results[] = {
+        test_extended_id_message10<Config>(),
+        test_extended_id_message2<Config>(),
+        test_extended_id_message9<Config>(),
+        test_large_payload_message1<Config>(),
+        test_large_payload_message2<Config>(),
+        test_extended_variable_single_array<Config>(),
+        test_extended_variable_large_array<Config>(),
+    };
+    
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (results[i].skipped) {
+            out_skipped++;
+            if (verbose) {
+                std::printf("[SKIP] %s: %s\n", results[i].message_name,
+                           results[i].error_msg ? results[i].error_msg : "");
+            }
+        } else if (results[i].passed) {
+            passed++;
+            tested[i] = true;
+            if (verbose) {
+                std::printf("[PASS] %s\n", results[i].message_name);
+            }
+        } else {
+            if (verbose) {
+                std::printf("[FAIL] %s: %s\n", results[i].message_name, 
+                           results[i].error_msg ? results[i].error_msg : "Unknown error");
+            }
+        }
+    }
+    
+    if (verbose) {
+        std::printf("\nTest Results: %zu/%zu passed (%zu skipped)\n", passed, TEST_MESSAGE_COUNT - out_skipped, out_skipped);
+    }
+    
+    return passed;
+}
+
+/* Run profiling tests for all messages with a specific profile */
+template <typename Config>
+inline void run_profiling_tests(bool verbose = false) {
+    uint8_t buffer[4096];
+    
+    if (verbose) {
+        std::printf("Running profiling tests (%zu iterations each)...\n", 
+                   structframe::ProfilingTests::PROFILE_ITERATIONS);
+    }
+    
+    {
+        auto msg = create_test_extended_id_message10();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ExtendedIdMessage10, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ExtendedIdMessage10:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_extended_id_message2();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ExtendedIdMessage2, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ExtendedIdMessage2:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_extended_id_message9();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ExtendedIdMessage9, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ExtendedIdMessage9:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_large_payload_message1();
+        auto result = structframe::ProfilingTests::run_packed_profiling<LargePayloadMessage1, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("LargePayloadMessage1:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_large_payload_message2();
+        auto result = structframe::ProfilingTests::run_packed_profiling<LargePayloadMessage2, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("LargePayloadMessage2:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_extended_variable_single_array();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ExtendedVariableSingleArray, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ExtendedVariableSingleArray:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_extended_variable_large_array();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ExtendedVariableLargeArray, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ExtendedVariableLargeArray:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+}
+
+/* Run round-trip tests across all 5 frame profiles */
+inline bool run_roundtrip_all_profiles(bool verbose = false) {
+    using namespace structframe;
+    struct ProfileEntry { const char* name; size_t (*runner)(bool*, size_t&, bool); };
+    ProfileEntry profiles[] = {
+        {"ProfileStandard", run_all_tests<ProfileStandardConfig>},
+        {"ProfileSensor",   run_all_tests<ProfileSensorConfig>},
+        {"ProfileIPC",      run_all_tests<ProfileIPCConfig>},
+        {"ProfileBulk",     run_all_tests<ProfileBulkConfig>},
+        {"ProfileNetwork",  run_all_tests<ProfileNetworkConfig>},
+    };
+    bool all_passed = true;
+    /* tested[i] becomes true once message i round-trips under any profile. */
+    bool tested[TEST_MESSAGE_COUNT == 0 ? 1 : TEST_MESSAGE_COUNT] = {false};
+    for (const auto& p : profiles) {
+        if (verbose) std::printf("\n--- %s ---\n", p.name);
+        size_t skipped = 0;
+        size_t passed = p.runner(tested, skipped, verbose);
+        size_t expected = TEST_MESSAGE_COUNT - skipped;
+        if (passed != expected) {
+            all_passed = false;
+            std::printf("[FAIL] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        } else if (verbose) {
+            std::printf("[OK] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        }
+    }
+    /* Messages skipped under every profile are not exercised by this
+     * generated suite (e.g. cross-package messages the per-package
+     * registry cannot resolve). Reported loudly but non-fatally -- a
+     * profile that *attempts* a message and fails is caught above. */
+    size_t never = 0;
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (!tested[i]) { never++; std::printf("[WARN] message index %zu skipped under every profile, not exercised\n", i); }
+    }
+    (void)never;
+    return all_passed;
+}
+
+}  // namespace Tests
+}  // namespace extended_test
+}  // namespace structframe
@@ -0,0 +1,15 @@
+/* Struct-frame boilerplate: frame parser main header */
+
+#pragma once
+
+/* Base utilities */
+#include "frame_base.hpp"
+
+/* Frame headers - Start byte patterns and header configurations */
+#include "frame_headers.hpp"
+
+/* Payload types - Message structure configurations */
+#include "payload_types.hpp"
+
+/* Frame profiles - Pre-defined Header + Payload combinations */
+#include "frame_profiles.hpp"
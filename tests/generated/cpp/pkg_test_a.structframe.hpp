@@ -0,0 +1,129 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace pkg_test_a {
+
+/* Package ID for extended message IDs */
+constexpr uint8_t PACKAGE_ID = 2;
+
+/* Enum definitions */
+// Package A for testing package imports and inheritance
+enum class ActionType : uint8_t {
+    Start = 0,
+    Stop = 1,
+    Pause = 2,
+    Resume = 3
+};
+
+/* Convert ActionType to string */
+inline const char* ActionType_to_string(ActionType value) {
+    switch (value) {
+        case ActionType::Start: return "START";
+        case ActionType::Stop: return "STOP";
+        case ActionType::Pause: return "PAUSE";
+        case ActionType::Resume: return "RESUME";
+        default: return "UNKNOWN";
+    }
+}
+
+/* Struct definitions */
+#pragma pack(push, 1)
+struct ActionMessage : structframe::MessageBase<ActionMessage, 513, 70, 36, 71, 70> {
+
+    ActionType action;
+    uint32_t target_id;
+    struct { uint8_t length; char data[64]; } description;  // Variable string: up to 64 chars
+
+    bool operator==(const ActionMessage& other) const {
+        return (action == other.action) &&
+               (target_id == other.target_id) &&
+               (description.length == other.description.length && std::strncmp(description.data, other.description.data, 64) == 0);
+    }
+    bool operator!=(const ActionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(uint16_t msg_id, size_t* size) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != pkg_test_a::PACKAGE_ID) {
+        return false;
+    }
+    
+    switch (local_msg_id) {
+        case 1: *size = pkg_test_a::ActionMessage::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != pkg_test_a::PACKAGE_ID) {
+        return MessageInfo{};
+    }
+    
+    switch (local_msg_id) {
+        case 1: return MessageInfo{pkg_test_a::ActionMessage::MAX_SIZE, pkg_test_a::ActionMessage::MAGIC1, pkg_test_a::ActionMessage::MAGIC2, pkg_test_a::ActionMessage::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace pkg_test_a
+}  // namespace structframe
@@ -0,0 +1,164 @@
+/* Automatically generated test code for struct-frame messages */
+/* This file provides round-trip encode/decode verification tests */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+
+#include <cstdio>
+#include <cstring>
+#include <cstdint>
+#include "pkg_test_a.structframe.hpp"
+#include "frame_profiles.hpp"
+#include "profiling_tests.hpp"
+
+namespace structframe {
+namespace pkg_test_a {
+namespace Tests {
+
+/* Create a test instance of ActionMessage */
+inline ActionMessage create_test_action_message() {
+    ActionMessage msg{};
+    msg.action = static_cast<ActionType>(0);
+    msg.target_id = 123457U;
+    msg.description.length = 11;
+    std::strncpy(msg.description.data, "test_string", sizeof(msg.description.data) - 1);
+    return msg;
+}
+
+/* Test result structure */
+struct TestResult {
+    bool passed;
+    const char* message_name;
+    const char* error_msg;
+    bool skipped = false;  /* profile-incompatible: not a real pass */
+};
+
+/* Test round-trip encode/decode for ActionMessage */
+template <typename Config>
+inline TestResult test_action_message() {
+    using MsgT = ActionMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ActionMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ActionMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_action_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ActionMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Number of test messages */
+static constexpr size_t TEST_MESSAGE_COUNT = 1;
+
+/* Run all message tests with a specific profile.
+ * Profile-incompatible messages are counted in *out_skipped* (NOT as
+ * passes); ``tested[i]`` is set true when message i round-trips under this
+ * profile so the caller can verify every message is exercised somewhere.
+ * Returns the number of genuine passes. */
+template <typename Config>
+inline size_t run_all_tests(bool* tested, size_t& out_skipped, bool verbose = false) {
+    size_t passed = 0;
+    out_skipped = 0;
+    TestResult results[] = {
+        test_action_message<Config>(),
+    };
+    
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (results[i].skipped) {
+            out_skipped++;
+            if (verbose) {
+                std::printf("[SKIP] %s: %s\n", results[i].message_name,
+                           results[i].error_msg ? results[i].error_msg : "");
+            }
+        } else if (results[i].passed) {
+            passed++;
+            tested[i] = true;
+            if (verbose) {
+                std::printf("[PASS] %s\n", results[i].message_name);
+            }
+        } else {
+            if (verbose) {
+                std::printf("[FAIL] %s: %s\n", results[i].message_name, 
+                           results[i].error_msg ? results[i].error_msg : "Unknown error");
+            }
+        }
+    }
+    
+    if (verbose) {
+        std::printf("\nTest Results: %zu/%zu passed (%zu skipped)\n", passed, TEST_MESSAGE_COUNT - out_skipped, out_skipped);
+    }
+    
+    return passed;
+}
+
+/* Run profiling tests for all messages with a specific profile */
+template <typename Config>
+inline void run_profiling_tests(bool verbose = false) {
+    uint8_t buffer[4096];
+    
+    if (verbose) {
+        std::printf("Running profiling tests (%zu iterations each)...\n", 
+                   structframe::ProfilingTests::PROFILE_ITERATIONS);
+    }
+    
+    {
+        auto msg = create_test_action_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ActionMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ActionMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+}
+
+/* Run round-trip tests across all 5 frame profiles */
+inline bool run_roundtrip_all_profiles(bool verbose = false) {
+    using namespace structframe;
+    struct ProfileEntry { const char* name; size_t (*runner)(bool*, size_t&, bool); };
+    ProfileEntry profiles[] = {
+        {"ProfileStandard", run_all_tests<ProfileStandardConfig>},
+        {"ProfileSensor",   run_all_tests<ProfileSensorConfig>},
+        {"ProfileIPC",      run_all_tests<ProfileIPCConfig>},
+        {"ProfileBulk",     run_all_tests<ProfileBulkConfig>},
+        {"ProfileNetwork",  run_all_tests<ProfileNetworkConfig>},
+    };
+    bool all_passed = true;
+    /* tested[i] becomes true once message i round-trips under any profile. */
+    bool tested[TEST_MESSAGE_COUNT == 0 ? 1 : TEST_MESSAGE_COUNT] = {false};
+    for (const auto& p : profiles) {
+        if (verbose) std::printf("\n--- %s ---\n", p.name);
+        size_t skipped = 0;
+        size_t passed = p.runner(tested, skipped, verbose);
+        size_t expected = TEST_MESSAGE_COUNT - skipped;
+        if (passed != expected) {
+            all_passed = false;
+            std::printf("[FAIL] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        } else if (verbose) {
+            std::printf("[OK] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        }
+    }
+    /* Messages skipped under every profile are not exercised by this
+     * generated suite (e.g. cross-package messages the per-package
+     * registry cannot resolve). Reported loudly but non-fatally -- a
+     * profile that *attempts* a message and fails is caught above. */
+    size_t never = 0;
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (!tested[i]) { never++; std::printf("[WARN] message index %zu skipped under every profile, not exercised\n", i); }
+    }
+    (void)never;
+    return all_passed;
+}
+
+}  // namespace Tests
+}  // namespace pkg_test_a
+}  // namespace structframe
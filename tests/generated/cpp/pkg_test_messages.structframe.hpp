@@ -0,0 +1,169 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+#include "common_types.structframe.hpp"
+#include "pkg_test_a.structframe.hpp"
+
+namespace structframe {
+namespace pkg_test_messages {
+
+/* Package ID for extended message IDs */
+constexpr uint8_t PACKAGE_ID = 1;
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// Package test messages that imports common_types and pkg_test_a
+// common_types.proto has no pkgid, so it will inherit pkgid=1 from this file
+// pkg_test_a.proto has its own pkgid=2
+// Message using types from common_types (which inherits pkgid=1)
+struct PackageTestMessage : structframe::MessageBase<PackageTestMessage, 257, 45, 211, 76, 45> {
+
+    common_types::Timestamp created_at;
+    common_types::Status current_status;
+    char name[32];  // Fixed string: exactly 32 chars
+
+    bool operator==(const PackageTestMessage& other) const {
+        return (std::memcmp(&created_at, &other.created_at, sizeof(created_at)) == 0) &&
+               (current_status == other.current_status) &&
+               (std::strncmp(name, other.name, 32) == 0);
+    }
+    bool operator!=(const PackageTestMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Message using types from pkg_test_a (which has pkgid=2)
+struct CrossPackageMessage : structframe::MessageBase<CrossPackageMessage, 258, 134, 36, 63, 134> {
+
+    uint32_t message_id;
+    pkg_test_a::ActionType action;
+    struct { uint8_t length; char data[128]; } payload;  // Variable string: up to 128 chars
+
+    bool operator==(const CrossPackageMessage& other) const {
+        return (message_id == other.message_id) &&
+               (action == other.action) &&
+               (payload.length == other.payload.length && std::strncmp(payload.data, other.payload.data, 128) == 0);
+    }
+    bool operator!=(const CrossPackageMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(uint16_t msg_id, size_t* size) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != pkg_test_messages::PACKAGE_ID) {
+        return false;
+    }
+    
+    switch (local_msg_id) {
+        case 1: *size = pkg_test_messages::PackageTestMessage::MAX_SIZE; return true;
+        case 2: *size = pkg_test_messages::CrossPackageMessage::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    // Extract package ID and message ID from 16-bit message ID
+    uint8_t pkg_id = (msg_id >> 8) & 0xFF;
+    uint8_t local_msg_id = msg_id & 0xFF;
+    
+    // Check if this is our package
+    if (pkg_id != pkg_test_messages::PACKAGE_ID) {
+        return MessageInfo{};
+    }
+    
+    switch (local_msg_id) {
+        case 1: return MessageInfo{pkg_test_messages::PackageTestMessage::MAX_SIZE, pkg_test_messages::PackageTestMessage::MAGIC1, pkg_test_messages::PackageTestMessage::MAGIC2, pkg_test_messages::PackageTestMessage::BASE_SIZE};
+        case 2: return MessageInfo{pkg_test_messages::CrossPackageMessage::MAX_SIZE, pkg_test_messages::CrossPackageMessage::MAGIC1, pkg_test_messages::CrossPackageMessage::MAGIC2, pkg_test_messages::CrossPackageMessage::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace pkg_test_messages
+}  // namespace structframe
@@ -0,0 +1,2313 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace serialization_test {
+
+/* Enum definitions */
+// Combined test messages for struct-frame code generation framework
+// This file consolidates all test message definitions for testing
+//
+// Note: NestedMessage (from original nested_messages.proto) is intentionally
+// excluded because the JavaScript code generator has a bug with nested struct
+// references. The test suite only uses SerializationTestMessage for cross-language
+// testing, so this exclusion doesn't affect test coverage.
+// ============================================================================
+// Enums
+// ============================================================================
+enum class Priority : uint8_t {
+    Low = 0,
+    Medium = 1,
+    High = 2,
+    Critical = 3
+};
+
+/* Convert Priority to string */
+inline const char* Priority_to_string(Priority value) {
+    switch (value) {
+        case Priority::Low: return "LOW";
+        case Priority::Medium: return "MEDIUM";
+        case Priority::High: return "HIGH";
+        case Priority::Critical: return "CRITICAL";
+        default: return "UNKNOWN";
+    }
+}
+
+enum class Status : uint8_t {
+    Inactive = 0,
+    Active = 1,
+    Error = 2,
+    Maintenance = 3
+};
+
+/* Convert Status to string */
+inline const char* Status_to_string(Status value) {
+    switch (value) {
+        case Status::Inactive: return "INACTIVE";
+        case Status::Active: return "ACTIVE";
+        case Status::Error: return "ERROR";
+        case Status::Maintenance: return "MAINTENANCE";
+        default: return "UNKNOWN";
+    }
+}
+
+enum class MsgSeverity : uint8_t {
+    SevMsg = 0,
+    SevError = 1,
+    SevWarn = 2,
+    SevInfo = 3,
+    SevDebug = 4
+};
+
+/* Convert MsgSeverity to string */
+inline const char* MsgSeverity_to_string(MsgSeverity value) {
+    switch (value) {
+        case MsgSeverity::SevMsg: return "SEV_MSG";
+        case MsgSeverity::SevError: return "SEV_ERROR";
+        case MsgSeverity::SevWarn: return "SEV_WARN";
+        case MsgSeverity::SevInfo: return "SEV_INFO";
+        case MsgSeverity::SevDebug: return "SEV_DEBUG";
+        default: return "UNKNOWN";
+    }
+}
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// ============================================================================
+// Basic Types Test Message (msgid: 201)
+// ============================================================================
+// Test all basic data types
+struct BasicTypesMessage : structframe::MessageBase<BasicTypesMessage, 201, 204, 181, 194, 204> {
+
+// Integer types
+    int8_t small_int;
+    int16_t medium_int;
+    int32_t regular_int;
+    int64_t large_int;
+// Unsigned integer types
+    uint8_t small_uint;
+    uint16_t medium_uint;
+    uint32_t regular_uint;
+    uint64_t large_uint;
+// Floating point types
+    float single_precision;
+    double double_precision;
+// Boolean type
+    bool flag;
+// Fixed string
+    char device_id[32];  // Fixed string: exactly 32 chars
+// Variable string
+    struct { uint8_t length; char data[128]; } description;  // Variable string: up to 128 chars
+
+    bool operator==(const BasicTypesMessage& other) const {
+        return (small_int == other.small_int) &&
+               (medium_int == other.medium_int) &&
+               (regular_int == other.regular_int) &&
+               (large_int == other.large_int) &&
+               (small_uint == other.small_uint) &&
+               (medium_uint == other.medium_uint) &&
+               (regular_uint == other.regular_uint) &&
+               (large_uint == other.large_uint) &&
+               (single_precision == other.single_precision) &&
+               (double_precision == other.double_precision) &&
+               (flag == other.flag) &&
+               (std::strncmp(device_id, other.device_id, 32) == 0) &&
+               (description.length == other.description.length && std::strncmp(description.data, other.description.data, 128) == 0);
+    }
+    bool operator!=(const BasicTypesMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Comprehensive Arrays Test (msgid: 203)
+// ============================================================================
+struct Sensor {
+    uint8_t id;
+    float value;
+    Status status;
+    char name[16];  // Fixed string: exactly 16 chars
+
+    bool operator==(const Sensor& other) const {
+        return (id == other.id) &&
+               (value == other.value) &&
+               (status == other.status) &&
+               (std::strncmp(name, other.name, 16) == 0);
+    }
+    bool operator!=(const Sensor& other) const { return !(*this == other); }
+};
+
+
+struct ComprehensiveArrayMessage : structframe::MessageBase<ComprehensiveArrayMessage, 203, 139, 137, 147, 139> {
+
+// Fixed arrays of primitives
+    int32_t fixed_ints[3];  // Fixed array: always 3 elements
+    float fixed_floats[2];  // Fixed array: always 2 elements
+    bool fixed_bools[4];  // Fixed array: always 4 elements
+// Bounded arrays of primitives  
+    struct { uint8_t count; uint16_t data[3]; } bounded_uints;  // Variable array: up to 3 elements
+    struct { uint8_t count; double data[2]; } bounded_doubles;  // Variable array: up to 2 elements
+// Fixed string arrays (smaller strings and fewer of them)
+    char fixed_strings[2][8];  // Fixed string array: 2 strings, each max 8 chars
+// Bounded string arrays (smaller)
+    struct { uint8_t count; char data[2][12]; } bounded_strings;  // Variable string array: up to 2 strings, each max 12 chars
+// Enum arrays
+    Status fixed_statuses[2];  // Fixed array: always 2 elements
+    struct { uint8_t count; Status data[2]; } bounded_statuses;  // Variable array: up to 2 elements
+// Nested message arrays (reduced)
+    Sensor fixed_sensors[1];  // Fixed array: always 1 elements
+    struct { uint8_t count; Sensor data[1]; } bounded_sensors;  // Variable array: up to 1 elements
+
+    bool operator==(const ComprehensiveArrayMessage& other) const {
+        return (std::memcmp(fixed_ints, other.fixed_ints, sizeof(fixed_ints)) == 0) &&
+               (std::memcmp(fixed_floats, other.fixed_floats, sizeof(fixed_floats)) == 0) &&
+               (std::memcmp(fixed_bools, other.fixed_bools, sizeof(fixed_bools)) == 0) &&
+               (bounded_uints.count == other.bounded_uints.count && std::memcmp(bounded_uints.data, other.bounded_uints.data, sizeof(bounded_uints.data)) == 0) &&
+               (bounded_doubles.count == other.bounded_doubles.count && std::memcmp(bounded_doubles.data, other.bounded_doubles.data, sizeof(bounded_doubles.data)) == 0) &&
+               (std::memcmp(fixed_strings, other.fixed_strings, sizeof(fixed_strings)) == 0) &&
+               (bounded_strings.count == other.bounded_strings.count && std::memcmp(bounded_strings.data, other.bounded_strings.data, sizeof(bounded_strings.data)) == 0) &&
+               (std::memcmp(fixed_statuses, other.fixed_statuses, sizeof(fixed_statuses)) == 0) &&
+               (bounded_statuses.count == other.bounded_statuses.count && std::memcmp(bounded_statuses.data, other.bounded_statuses.data, sizeof(bounded_statuses.data)) == 0) &&
+               (std::memcmp(fixed_sensors, other.fixed_sensors, sizeof(fixed_sensors)) == 0) &&
+               (bounded_sensors.count == other.bounded_sensors.count && std::memcmp(bounded_sensors.data, other.bounded_sensors.data, sizeof(bounded_sensors.data)) == 0);
+    }
+    bool operator!=(const ComprehensiveArrayMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Serialization Test Message (msgid: 204)
+// ============================================================================
+// A simple message for cross-language serialization testing
+struct SerializationTestMessage : structframe::MessageBase<SerializationTestMessage, 204, 95, 53, 152, 95> {
+
+    uint32_t magic_number;
+    struct { uint8_t length; char data[64]; } test_string;  // Variable string: up to 64 chars
+    float test_float;
+    bool test_bool;
+    struct { uint8_t count; int32_t data[5]; } test_array;  // Variable array: up to 5 elements
+
+    bool operator==(const SerializationTestMessage& other) const {
+        return (magic_number == other.magic_number) &&
+               (test_string.length == other.test_string.length && std::strncmp(test_string.data, other.test_string.data, 64) == 0) &&
+               (test_float == other.test_float) &&
+               (test_bool == other.test_bool) &&
+               (test_array.count == other.test_array.count && std::memcmp(test_array.data, other.test_array.data, sizeof(test_array.data)) == 0);
+    }
+    bool operator!=(const SerializationTestMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Union Message Test (msgid: 205)
+// ============================================================================
+// A message demonstrating union-like behavior using oneof
+// Since ComprehensiveArrayMessage and SerializationTestMessage both have
+// message IDs, the generator will automatically add a discriminator field
+struct UnionTestMessage : structframe::MessageBase<UnionTestMessage, 205, 141, 226, 255, 141> {
+
+// oneof payload (auto-discriminator will be added for message ID)
+    uint16_t payload_discriminator;  // Auto-generated message ID discriminator
+    union {
+        ComprehensiveArrayMessage array_payload;
+        SerializationTestMessage test_payload;
+    } payload;
+
+    bool operator==(const UnionTestMessage& other) const {
+        return (payload_discriminator == other.payload_discriminator) && (std::memcmp(&payload, &other.payload, sizeof(payload)) == 0);
+    }
+    bool operator!=(const UnionTestMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Field-Order Discriminator Test (msgid: 212)
+// ============================================================================
+// A message without a msgid (used in field_order discriminator oneof)
+struct SimplePayload {
+    uint8_t type_code;
+    uint16_t value;
+
+    bool operator==(const SimplePayload& other) const {
+        return (type_code == other.type_code) &&
+               (value == other.value);
+    }
+    bool operator!=(const SimplePayload& other) const { return !(*this == other); }
+};
+
+
+// A message using field_order discriminator (SimplePayload has no msgid,
+// so the auto-discriminator falls back to field_order, generating an enum)
+struct UnionTestMessageFieldOrder : structframe::MessageBase<UnionTestMessageFieldOrder, 212, 205, 243, 176, 205> {
+
+    /* Discriminator enum for data oneof */
+    enum class DataField : uint8_t {
+        NONE = 0,
+        BASIC_PAYLOAD = 1,
+        SIMPLE_PAYLOAD = 2,
+    };
+
+// oneof data (auto-discriminator will use field_order since SimplePayload has no msgid)
+    DataField data_discriminator;  // Auto-generated field order discriminator
+    union {
+        BasicTypesMessage basic_payload;
+        SimplePayload simple_payload;
+    } data;
+
+    bool operator==(const UnionTestMessageFieldOrder& other) const {
+        return (data_discriminator == other.data_discriminator) && (std::memcmp(&data, &other.data, sizeof(data)) == 0);
+    }
+    bool operator!=(const UnionTestMessageFieldOrder& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Variable Length Message Tests (msgid: 206-208)
+// These messages use option variable = true for variable-length encoding
+// ============================================================================
+// Variable message with single bounded array (msgid: 206)
+struct VariableSingleArray : structframe::MessageBase<VariableSingleArray, 206, 207, 15, 30, 207> {
+
+    uint32_t message_id;
+    struct { uint8_t count; uint8_t data[200]; } payload;  // Variable array: up to 200 elements
+// Up to 200 bytes, only sends used
+    uint16_t checksum;
+
+    bool operator==(const VariableSingleArray& other) const {
+        return (message_id == other.message_id) &&
+               (payload.count == other.payload.count && std::memcmp(payload.data, other.payload.data, sizeof(payload.data)) == 0) &&
+               (checksum == other.checksum);
+    }
+    bool operator!=(const VariableSingleArray& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 7;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 4;  // message_id
+        size += 1 + (payload.count * 1);  // payload
+        size += 2;  // checksum
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &message_id, 4); offset += 4;  // fixed run
+        buffer[offset++] = payload.count;
+        std::memcpy(buffer + offset, payload.data, payload.count * 1);
+        offset += payload.count * 1;
+        std::memcpy(buffer + offset, &checksum, 2); offset += 2;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&message_id, buffer + offset, 4);
+        offset += 4;
+        if (offset >= buffer_size) return 0;
+        payload.count = buffer[offset++];
+        if (payload.count > 200) payload.count = 200;
+        if (offset + payload.count * 1 > buffer_size) return 0;
+        std::memcpy(payload.data, buffer + offset, payload.count * 1);
+        offset += payload.count * 1;
+        if (offset + 2 > buffer_size) return 0;
+        std::memcpy(&checksum, buffer + offset, 2);
+        offset += 2;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// Variable message with multiple bounded arrays (msgid: 207)
+struct VariableMultipleArrays : structframe::MessageBase<VariableMultipleArrays, 207, 368, 37, 70, 368> {
+
+    uint8_t type;
+    struct { uint8_t count; int32_t data[50]; } readings;  // Variable array: up to 50 elements
+// Up to 200 bytes of int32 data
+    struct { uint8_t count; float data[25]; } values;  // Variable array: up to 25 elements
+// Up to 100 bytes of float data
+    struct { uint8_t length; char data[64]; } label;  // Variable string: up to 64 chars
+
+    bool operator==(const VariableMultipleArrays& other) const {
+        return (type == other.type) &&
+               (readings.count == other.readings.count && std::memcmp(readings.data, other.readings.data, sizeof(readings.data)) == 0) &&
+               (values.count == other.values.count && std::memcmp(values.data, other.values.data, sizeof(values.data)) == 0) &&
+               (label.length == other.label.length && std::strncmp(label.data, other.label.data, 64) == 0);
+    }
+    bool operator!=(const VariableMultipleArrays& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 4;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // type
+        size += 1 + (readings.count * 4);  // readings
+        size += 1 + (values.count * 4);  // values
+        size += 1 + label.length;  // label
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &type, 1); offset += 1;  // fixed run
+        buffer[offset++] = readings.count;
+        std::memcpy(buffer + offset, readings.data, readings.count * 4);
+        offset += readings.count * 4;
+        buffer[offset++] = values.count;
+        std::memcpy(buffer + offset, values.data, values.count * 4);
+        offset += values.count * 4;
+        buffer[offset++] = label.length;
+        std::memcpy(buffer + offset, label.data, label.length);
+        offset += label.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&type, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        readings.count = buffer[offset++];
+        if (readings.count > 50) readings.count = 50;
+        if (offset + readings.count * 4 > buffer_size) return 0;
+        std::memcpy(readings.data, buffer + offset, readings.count * 4);
+        offset += readings.count * 4;
+        if (offset >= buffer_size) return 0;
+        values.count = buffer[offset++];
+        if (values.count > 25) values.count = 25;
+        if (offset + values.count * 4 > buffer_size) return 0;
+        std::memcpy(values.data, buffer + offset, values.count * 4);
+        offset += values.count * 4;
+        if (offset >= buffer_size) return 0;
+        label.length = buffer[offset++];
+        if (label.length > 64) label.length = 64;
+        if (offset + label.length > buffer_size) return 0;
+        std::memcpy(label.data, buffer + offset, label.length);
+        offset += label.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// Variable message with mixed fixed and variable fields (msgid: 208)
+struct VariableMixedFields : structframe::MessageBase<VariableMixedFields, 208, 354, 55, 146, 354> {
+
+    uint32_t fixed_id;
+// Fixed field
+    float fixed_value;
+// Fixed field
+    char fixed_name[16];  // Fixed string: exactly 16 chars
+// Fixed string
+    struct { uint8_t count; uint16_t data[100]; } variable_data;  // Variable array: up to 100 elements
+// Variable array
+    struct { uint8_t length; char data[128]; } variable_desc;  // Variable string: up to 128 chars
+
+    bool operator==(const VariableMixedFields& other) const {
+        return (fixed_id == other.fixed_id) &&
+               (fixed_value == other.fixed_value) &&
+               (std::strncmp(fixed_name, other.fixed_name, 16) == 0) &&
+               (variable_data.count == other.variable_data.count && std::memcmp(variable_data.data, other.variable_data.data, sizeof(variable_data.data)) == 0) &&
+               (variable_desc.length == other.variable_desc.length && std::strncmp(variable_desc.data, other.variable_desc.data, 128) == 0);
+    }
+    bool operator!=(const VariableMixedFields& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 26;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 4;  // fixed_id
+        size += 4;  // fixed_value
+        size += 16;  // fixed_name
+        size += 1 + (variable_data.count * 2);  // variable_data
+        size += 1 + variable_desc.length;  // variable_desc
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &fixed_id, 24); offset += 24;  // fixed run
+        buffer[offset++] = variable_data.count;
+        std::memcpy(buffer + offset, variable_data.data, variable_data.count * 2);
+        offset += variable_data.count * 2;
+        buffer[offset++] = variable_desc.length;
+        std::memcpy(buffer + offset, variable_desc.data, variable_desc.length);
+        offset += variable_desc.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&fixed_id, buffer + offset, 4);
+        offset += 4;
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&fixed_value, buffer + offset, 4);
+        offset += 4;
+        if (offset + 16 > buffer_size) return 0;
+        std::memcpy(&fixed_name, buffer + offset, 16);
+        offset += 16;
+        if (offset >= buffer_size) return 0;
+        variable_data.count = buffer[offset++];
+        if (variable_data.count > 100) variable_data.count = 100;
+        if (offset + variable_data.count * 2 > buffer_size) return 0;
+        std::memcpy(variable_data.data, buffer + offset, variable_data.count * 2);
+        offset += variable_data.count * 2;
+        if (offset >= buffer_size) return 0;
+        variable_desc.length = buffer[offset++];
+        if (variable_desc.length > 128) variable_desc.length = 128;
+        if (offset + variable_desc.length > buffer_size) return 0;
+        std::memcpy(variable_desc.data, buffer + offset, variable_desc.length);
+        offset += variable_desc.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Truncation Test Messages (msgid: 209-210)
+// These messages are identical except one has variable=true to test truncation
+// ============================================================================
+// Non-variable message with large array (msgid: 209)
+struct TruncationTestNonVariable : structframe::MessageBase<TruncationTestNonVariable, 209, 207, 15, 30, 207> {
+
+    uint32_t sequence_id;
+    struct { uint8_t count; uint8_t data[200]; } data_array;  // Variable array: up to 200 elements
+// Up to 200 bytes
+    uint16_t footer;
+
+    bool operator==(const TruncationTestNonVariable& other) const {
+        return (sequence_id == other.sequence_id) &&
+               (data_array.count == other.data_array.count && std::memcmp(data_array.data, other.data_array.data, sizeof(data_array.data)) == 0) &&
+               (footer == other.footer);
+    }
+    bool operator!=(const TruncationTestNonVariable& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// Variable message with large array (msgid: 210)
+struct TruncationTestVariable : structframe::MessageBase<TruncationTestVariable, 210, 207, 15, 30, 207> {
+
+    uint32_t sequence_id;
+    struct { uint8_t count; uint8_t data[200]; } data_array;  // Variable array: up to 200 elements
+// Up to 200 bytes
+    uint16_t footer;
+
+    bool operator==(const TruncationTestVariable& other) const {
+        return (sequence_id == other.sequence_id) &&
+               (data_array.count == other.data_array.count && std::memcmp(data_array.data, other.data_array.data, sizeof(data_array.data)) == 0) &&
+               (footer == other.footer);
+    }
+    bool operator!=(const TruncationTestVariable& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 7;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 4;  // sequence_id
+        size += 1 + (data_array.count * 1);  // data_array
+        size += 2;  // footer
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &sequence_id, 4); offset += 4;  // fixed run
+        buffer[offset++] = data_array.count;
+        std::memcpy(buffer + offset, data_array.data, data_array.count * 1);
+        offset += data_array.count * 1;
+        std::memcpy(buffer + offset, &footer, 2); offset += 2;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&sequence_id, buffer + offset, 4);
+        offset += 4;
+        if (offset >= buffer_size) return 0;
+        data_array.count = buffer[offset++];
+        if (data_array.count > 200) data_array.count = 200;
+        if (offset + data_array.count * 1 > buffer_size) return 0;
+        std::memcpy(data_array.data, buffer + offset, data_array.count * 1);
+        offset += data_array.count * 1;
+        if (offset + 2 > buffer_size) return 0;
+        std::memcpy(&footer, buffer + offset, 2);
+        offset += 2;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Variable Message Test (msgid: 211)
+// ============================================================================
+// Variable message with two variable string fields
+struct Message : structframe::MessageBase<Message, 211, 274, 43, 85, 274> {
+
+    MsgSeverity severity;
+    struct { uint8_t length; char data[16]; } module;  // Variable string: up to 16 chars
+    struct { uint8_t length; char data[255]; } msg;  // Variable string: up to 255 chars
+
+    bool operator==(const Message& other) const {
+        return (severity == other.severity) &&
+               (module.length == other.module.length && std::strncmp(module.data, other.module.data, 16) == 0) &&
+               (msg.length == other.msg.length && std::strncmp(msg.data, other.msg.data, 255) == 0);
+    }
+    bool operator!=(const Message& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 3;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // severity
+        size += 1 + module.length;  // module
+        size += 1 + msg.length;  // msg
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &severity, 1); offset += 1;  // fixed run
+        buffer[offset++] = module.length;
+        std::memcpy(buffer + offset, module.data, module.length);
+        offset += module.length;
+        buffer[offset++] = msg.length;
+        std::memcpy(buffer + offset, msg.data, msg.length);
+        offset += msg.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&severity, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        module.length = buffer[offset++];
+        if (module.length > 16) module.length = 16;
+        if (offset + module.length > buffer_size) return 0;
+        std::memcpy(module.data, buffer + offset, module.length);
+        offset += module.length;
+        if (offset >= buffer_size) return 0;
+        msg.length = buffer[offset++];
+        if (msg.length > 255) msg.length = 255;
+        if (offset + msg.length > buffer_size) return 0;
+        std::memcpy(msg.data, buffer + offset, msg.length);
+        offset += msg.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Nested Variable Message Tests (msgid: 220)
+// These messages exercise the nested-struct + variable-length code path:
+//   a nested struct containing variable-length fields (string and array),
+//   embedded in a parent message that is also marked option variable = true.
+// ============================================================================
+// Nested struct with variable-length fields (no msgid — used only as a sub-message)
+struct NestedPayload {
+    uint8_t id;
+    struct { uint8_t length; char data[32]; } label;  // Variable string: up to 32 chars
+// variable string inside nested struct
+    struct { uint8_t count; uint16_t data[16]; } samples;  // Variable array: up to 16 elements
+
+    bool operator==(const NestedPayload& other) const {
+        return (id == other.id) &&
+               (label.length == other.label.length && std::strncmp(label.data, other.label.data, 32) == 0) &&
+               (samples.count == other.samples.count && std::memcmp(samples.data, other.samples.data, sizeof(samples.data)) == 0);
+    }
+    bool operator!=(const NestedPayload& other) const { return !(*this == other); }
+};
+
+
+// Parent message with option variable = true containing a nested struct that has
+// variable-length fields, plus a top-level variable string.
+struct NestedVariableMessage : structframe::MessageBase<NestedVariableMessage, 220, 136, 68, 127, 136> {
+
+    uint32_t sequence;
+    NestedPayload payload;
+// nested struct with variable fields
+    struct { uint8_t length; char data[64]; } description;  // Variable string: up to 64 chars
+
+    bool operator==(const NestedVariableMessage& other) const {
+        return (sequence == other.sequence) &&
+               (std::memcmp(&payload, &other.payload, sizeof(payload)) == 0) &&
+               (description.length == other.description.length && std::strncmp(description.data, other.description.data, 64) == 0);
+    }
+    bool operator!=(const NestedVariableMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 72;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 4;  // sequence
+        size += 67;  // payload
+        size += 1 + description.length;  // description
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &sequence, 71); offset += 71;  // fixed run
+        buffer[offset++] = description.length;
+        std::memcpy(buffer + offset, description.data, description.length);
+        offset += description.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&sequence, buffer + offset, 4);
+        offset += 4;
+        if (offset + 67 > buffer_size) return 0;
+        std::memcpy(&payload, buffer + offset, 67);
+        offset += 67;
+        if (offset >= buffer_size) return 0;
+        description.length = buffer[offset++];
+        if (description.length > 64) description.length = 64;
+        if (offset + description.length > buffer_size) return 0;
+        std::memcpy(description.data, buffer + offset, description.length);
+        offset += description.length;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Nested Enum Test Message (msgid: 213)
+// ============================================================================
+// Tests a message-scoped enum definition and a field that references it
+struct NestedEnumMessage : structframe::MessageBase<NestedEnumMessage, 213, 3, 27, 58, 3> {
+
+    // Enum scoped to this message
+    enum class OperationMode : uint8_t {
+        Idle = 0,
+        Active = 1,
+        Calibrating = 2,
+        Errorstate = 3
+    };
+
+    OperationMode mode;
+// Field using the nested enum
+    uint8_t value;
+    bool enabled;
+
+    bool operator==(const NestedEnumMessage& other) const {
+        return (mode == other.mode) &&
+               (value == other.value) &&
+               (enabled == other.enabled);
+    }
+    bool operator!=(const NestedEnumMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Collision Enum Test Message (msgid: 214)
+// ============================================================================
+// Tests that an enum named identically to one of the fields (Status status)
+// is correctly renamed to StatusEnum to avoid CS0102 in C#.
+struct CollisionEnumMessage : structframe::MessageBase<CollisionEnumMessage, 214, 10, 29, 60, 10> {
+
+    enum class Status : uint8_t {
+        Unknown = 0,
+        Running = 1,
+        Stopped = 2,
+        Failed = 3
+    };
+
+    Status status;
+// Collision: enum Status + field status -> StatusEnum
+    uint8_t id;
+    double time;
+
+    bool operator==(const CollisionEnumMessage& other) const {
+        return (status == other.status) &&
+               (id == other.id) &&
+               (time == other.time);
+    }
+    bool operator!=(const CollisionEnumMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Flatten Option Test (msgid: 215)
+// ============================================================================
+// Sub-message for flatten option test (no msgid - used as nested struct)
+struct FlattenInner {
+    uint8_t a;
+    uint16_t b;
+
+    bool operator==(const FlattenInner& other) const {
+        return (a == other.a) &&
+               (b == other.b);
+    }
+    bool operator!=(const FlattenInner& other) const { return !(*this == other); }
+};
+
+
+// Tests flatten=true option: inner fields appear inlined in to_dict() output
+struct FlattenMessage : structframe::MessageBase<FlattenMessage, 215, 7, 210, 216, 7> {
+
+    uint32_t seq;
+    FlattenInner inner;
+
+    bool operator==(const FlattenMessage& other) const {
+        return (seq == other.seq) &&
+               (std::memcmp(&inner, &other.inner, sizeof(inner)) == 0);
+    }
+    bool operator!=(const FlattenMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Discriminator None Oneof Test (msgid: 216)
+// ============================================================================
+// Tests oneof with discriminator=none: no auto-discriminator field is generated.
+// Application must track which variant is active.
+struct NoneDiscriminatorMessage : structframe::MessageBase<NoneDiscriminatorMessage, 216, 205, 134, 72, 205> {
+
+    uint8_t header;
+    union {
+        BasicTypesMessage basic;
+        SerializationTestMessage test_msg;
+    } data;
+
+    bool operator==(const NoneDiscriminatorMessage& other) const {
+        return (header == other.header) &&
+               (std::memcmp(&data, &other.data, sizeof(data)) == 0);
+    }
+    bool operator!=(const NoneDiscriminatorMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Multiple Oneof Test (msgid: 217)
+// ============================================================================
+// Tests a message with two separate oneof fields.
+struct MultiOneofMessage : structframe::MessageBase<MultiOneofMessage, 217, 481, 219, 52, 481> {
+
+    uint8_t selector;
+    uint16_t first_payload_discriminator;  // Auto-generated message ID discriminator
+    union {
+        BasicTypesMessage basic;
+        SerializationTestMessage test_msg;
+    } first_payload;
+    union {
+        VariableSingleArray var_single;
+        Message msg_payload;
+    } second_payload;
+
+    bool operator==(const MultiOneofMessage& other) const {
+        return (selector == other.selector) &&
+               (first_payload_discriminator == other.first_payload_discriminator) && (std::memcmp(&first_payload, &other.first_payload, sizeof(first_payload)) == 0) &&
+               (std::memcmp(&second_payload, &other.second_payload, sizeof(second_payload)) == 0);
+    }
+    bool operator!=(const MultiOneofMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Variable + Oneof Tests (msgid: 221-222)
+// These messages combine option variable = true with a oneof to cover the
+// code-generation bug where variable serializers skipped oneof fields entirely.
+// ============================================================================
+// Small fixed-size payload A (no msgid - used as oneof variant)
+struct VarEnvPayloadA {
+    uint8_t code;
+    uint16_t value;
+
+    bool operator==(const VarEnvPayloadA& other) const {
+        return (code == other.code) &&
+               (value == other.value);
+    }
+    bool operator!=(const VarEnvPayloadA& other) const { return !(*this == other); }
+};
+
+
+// Small fixed-size payload B (no msgid - used as oneof variant)
+struct VarEnvPayloadB {
+    uint32_t flags;
+    float ratio;
+
+    bool operator==(const VarEnvPayloadB& other) const {
+        return (flags == other.flags) &&
+               (ratio == other.ratio);
+    }
+    bool operator!=(const VarEnvPayloadB& other) const { return !(*this == other); }
+};
+
+
+// Variable envelope with field_order discriminator (msgid: 221)
+// Combines variable = true + is_envelope = true + oneof (field_order)
+// This is the key regression test: discriminator + union must appear on the wire.
+struct VariableEnvelopeMessage : structframe::MessageBase<VariableEnvelopeMessage, 221, 10, 194, 37, 10> {
+
+    /* Discriminator enum for payload oneof */
+    enum class PayloadField : uint8_t {
+        NONE = 0,
+        PAYLOAD_A = 1,
+        PAYLOAD_B = 2,
+    };
+
+// Fixed header field (always present on the wire)
+    uint8_t priority;
+// field_order oneof - discriminator must be serialized in variable format
+    PayloadField payload_discriminator;  // Auto-generated field order discriminator
+    union {
+        VarEnvPayloadA payload_a;
+        VarEnvPayloadB payload_b;
+    } payload;
+
+    bool operator==(const VariableEnvelopeMessage& other) const {
+        return (priority == other.priority) &&
+               (payload_discriminator == other.payload_discriminator) && (std::memcmp(&payload, &other.payload, sizeof(payload)) == 0);
+    }
+    bool operator!=(const VariableEnvelopeMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 10;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // priority
+        size += 1;  // payload discriminator
+        {
+            uint16_t _payload_tlen = 0;
+            if (static_cast<int>(payload_discriminator) == 1) _payload_tlen = 3;  // payload_a
+            if (static_cast<int>(payload_discriminator) == 2) _payload_tlen = 8;  // payload_b
+            size += _payload_tlen;  // payload trimmed union payload
+        }
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &priority, 1); offset += 1;  // fixed run
+        buffer[offset++] = static_cast<uint8_t>(payload_discriminator);
+        // payload: trimmed union
+        {
+            uint16_t _payload_tlen = 0;
+            if (static_cast<int>(payload_discriminator) == 1) _payload_tlen = 3;
+            if (static_cast<int>(payload_discriminator) == 2) _payload_tlen = 8;
+            std::memcpy(buffer + offset, &payload, _payload_tlen);
+            offset += _payload_tlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&priority, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        payload_discriminator = static_cast<decltype(payload_discriminator)>(buffer[offset++]);
+        // payload: trimmed union read
+        {
+            uint16_t _payload_rlen = 0;
+            if (static_cast<int>(payload_discriminator) == 1) _payload_rlen = 3;
+            if (static_cast<int>(payload_discriminator) == 2) _payload_rlen = 8;
+            if (offset + _payload_rlen > buffer_size) return 0;
+            std::memcpy(&payload, buffer + offset, _payload_rlen);
+            offset += _payload_rlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    // ========================================
+    // Envelope message helper methods
+    // ========================================
+
+    /**
+     * Create a VariableEnvelopeMessage envelope wrapping a VarEnvPayloadA payload.
+     * @param payload The VarEnvPayloadA message to wrap
+     * @param priority Envelope field value
+     * @return A fully initialized VariableEnvelopeMessage envelope
+     */
+    static VariableEnvelopeMessage wrap(uint8_t priority, const VarEnvPayloadA& payload) {
+        VariableEnvelopeMessage envelope{};
+        envelope.priority = priority;
+        envelope.payload_discriminator = PayloadField::PAYLOAD_A;
+        std::memcpy(&envelope.payload.payload_a, &payload, sizeof(VarEnvPayloadA));
+        return envelope;
+    }
+
+    /**
+     * Create a VariableEnvelopeMessage envelope wrapping a VarEnvPayloadB payload.
+     * @param payload The VarEnvPayloadB message to wrap
+     * @param priority Envelope field value
+     * @return A fully initialized VariableEnvelopeMessage envelope
+     */
+    static VariableEnvelopeMessage wrap(uint8_t priority, const VarEnvPayloadB& payload) {
+        VariableEnvelopeMessage envelope{};
+        envelope.priority = priority;
+        envelope.payload_discriminator = PayloadField::PAYLOAD_B;
+        std::memcpy(&envelope.payload.payload_b, &payload, sizeof(VarEnvPayloadB));
+        return envelope;
+    }
+
+    /**
+     * Get the discriminator value of the wrapped payload.
+     * @return The PayloadField enum value for the active payload
+     */
+    PayloadField getPayloadField() const {
+        return payload_discriminator;
+    }
+};
+
+
+// Variable envelope with msgid discriminator (msgid: 222)
+// Uses msgs that have IDs so the generator picks msgid discriminator type.
+struct VariableEnvelopeMsgIdMessage : structframe::MessageBase<VariableEnvelopeMsgIdMessage, 222, 207, 134, 72, 207> {
+
+    uint8_t priority;
+// msgid oneof - uint16 discriminator must be serialized in variable format
+    uint16_t payload_discriminator;  // Auto-generated message ID discriminator
+    union {
+        BasicTypesMessage basic;
+        SerializationTestMessage test_msg;
+    } payload;
+
+    bool operator==(const VariableEnvelopeMsgIdMessage& other) const {
+        return (priority == other.priority) &&
+               (payload_discriminator == other.payload_discriminator) && (std::memcmp(&payload, &other.payload, sizeof(payload)) == 0);
+    }
+    bool operator!=(const VariableEnvelopeMsgIdMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 207;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // priority
+        size += 2;  // payload discriminator
+        {
+            uint16_t _payload_tlen = 0;
+            if (static_cast<int>(payload_discriminator) == 201) _payload_tlen = 204;  // basic
+            if (static_cast<int>(payload_discriminator) == 204) _payload_tlen = 95;  // test_msg
+            size += _payload_tlen;  // payload trimmed union payload
+        }
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &priority, 1); offset += 1;  // fixed run
+        std::memcpy(buffer + offset, &payload_discriminator, 2);
+        offset += 2;
+        // payload: trimmed union
+        {
+            uint16_t _payload_tlen = 0;
+            if (static_cast<int>(payload_discriminator) == 201) _payload_tlen = 204;
+            if (static_cast<int>(payload_discriminator) == 204) _payload_tlen = 95;
+            std::memcpy(buffer + offset, &payload, _payload_tlen);
+            offset += _payload_tlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&priority, buffer + offset, 1);
+        offset += 1;
+        if (offset + 2 > buffer_size) return 0;
+        std::memcpy(&payload_discriminator, buffer + offset, 2);
+        offset += 2;
+        // payload: trimmed union read
+        {
+            uint16_t _payload_rlen = 0;
+            if (static_cast<int>(payload_discriminator) == 201) _payload_rlen = 204;
+            if (static_cast<int>(payload_discriminator) == 204) _payload_rlen = 95;
+            if (offset + _payload_rlen > buffer_size) return 0;
+            std::memcpy(&payload, buffer + offset, _payload_rlen);
+            offset += _payload_rlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    // ========================================
+    // Envelope message helper methods
+    // ========================================
+
+    /**
+     * Create a VariableEnvelopeMsgIdMessage envelope wrapping a payload message.
+     * Only accepts valid payload types: BasicTypesMessage, SerializationTestMessage
+     * @tparam T The payload message type (must be one of the valid types)
+     * @param payload The message to wrap
+     * @param priority Envelope field value
+     * @return A fully initialized VariableEnvelopeMsgIdMessage envelope
+     */
+    template<typename T, typename = std::enable_if_t<T::MSG_ID == BasicTypesMessage::MSG_ID || T::MSG_ID == SerializationTestMessage::MSG_ID>>
+    static VariableEnvelopeMsgIdMessage wrap(uint8_t priority, const T& payload) {
+        VariableEnvelopeMsgIdMessage envelope{};
+        envelope.priority = priority;
+        envelope.payload_discriminator = T::MSG_ID;
+        // Copy payload into the correct union field based on MSG_ID
+        if constexpr (T::MSG_ID == BasicTypesMessage::MSG_ID) {
+            std::memcpy(&envelope.payload.basic, &payload, sizeof(T));
+        }
+        if constexpr (T::MSG_ID == SerializationTestMessage::MSG_ID) {
+            std::memcpy(&envelope.payload.test_msg, &payload, sizeof(T));
+        }
+        return envelope;
+    }
+
+    /**
+     * Get the message ID of the wrapped payload.
+     * @return The message ID of the payload in the payload union
+     */
+    uint16_t getPayloadMessageId() const {
+        return payload_discriminator;
+    }
+};
+
+
+// ============================================================================
+// Variable oneof tests (msgid: 223-224)
+// Tests for option variable = true on a oneof (different from variable message with fixed oneof).
+// Wire format: [disc][uint16 length][variant_bytes]
+// ============================================================================
+// Variable oneof test message: oneof with variable = true
+// Each variant writes only its own bytes (not padded to union size).
+struct VariableOneofMessage : structframe::MessageBase<VariableOneofMessage, 223, 12, 194, 37, 12> {
+
+    /* Discriminator enum for data oneof */
+    enum class DataField : uint8_t {
+        NONE = 0,
+        SMALL_PAYLOAD = 1,
+        LARGE_PAYLOAD = 2,
+    };
+
+    uint8_t header;
+    DataField data_discriminator;  // Auto-generated field order discriminator
+    union {
+        VarEnvPayloadA small_payload;
+        VarEnvPayloadB large_payload;
+    } data;
+
+    bool operator==(const VariableOneofMessage& other) const {
+        return (header == other.header) &&
+               (data_discriminator == other.data_discriminator) && (std::memcmp(&data, &other.data, sizeof(data)) == 0);
+    }
+    bool operator!=(const VariableOneofMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 4;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // header
+        size += 1;  // data discriminator
+        size += 2;  // data variable-length prefix
+        {
+            uint16_t _data_vlen = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_vlen = 3;  // small_payload
+            if (static_cast<int>(data_discriminator) == 2) _data_vlen = 8;  // large_payload
+            size += _data_vlen;
+        }
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &header, 1); offset += 1;  // fixed run
+        buffer[offset++] = static_cast<uint8_t>(data_discriminator);
+        // data variable-length union: write uint16 length + variant bytes
+        {
+            uint16_t _data_len = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_len = 3;
+            if (static_cast<int>(data_discriminator) == 2) _data_len = 8;
+            std::memcpy(buffer + offset, &_data_len, 2);
+            offset += 2;
+            if (_data_len > 0) {
+                std::memcpy(buffer + offset, &data, _data_len);
+                offset += _data_len;
+            }
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&header, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        data_discriminator = static_cast<decltype(data_discriminator)>(buffer[offset++]);
+        // data variable-length union: read uint16 length + variant bytes
+        {
+            if (offset + 2 > buffer_size) return 0;
+            uint16_t _data_len;
+            std::memcpy(&_data_len, buffer + offset, 2);
+            offset += 2;
+            if (offset + _data_len > buffer_size) return 0;
+            if (static_cast<int>(data_discriminator) == 1) {
+                size_t _copy = _data_len < 3 ? _data_len : 3;
+                std::memcpy(&data, buffer + offset, _copy);
+            }
+            if (static_cast<int>(data_discriminator) == 2) {
+                size_t _copy = _data_len < 8 ? _data_len : 8;
+                std::memcpy(&data, buffer + offset, _copy);
+            }
+            offset += _data_len;  // Always skip full payload
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable oneof message - always use variable-length deserialization
+        return _deserialize_variable(buffer, buffer_size);
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// Max-size oneof test message: oneof with max_size override
+// oneof.size is extended to 32 bytes so future larger variants fit.
+struct MaxSizeOneofMessage : structframe::MessageBase<MaxSizeOneofMessage, 224, 34, 97, 99, 34> {
+
+    /* Discriminator enum for data oneof */
+    enum class DataField : uint8_t {
+        NONE = 0,
+        SMALL_PAYLOAD = 1,
+    };
+
+    uint8_t header;
+    DataField data_discriminator;  // Auto-generated field order discriminator
+    union {
+        VarEnvPayloadA small_payload;
+        uint8_t _padding[32];  // pad union to oneof.size
+    } data;
+
+    bool operator==(const MaxSizeOneofMessage& other) const {
+        return (header == other.header) &&
+               (data_discriminator == other.data_discriminator) && (std::memcmp(&data, &other.data, sizeof(data)) == 0);
+    }
+    bool operator!=(const MaxSizeOneofMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 34;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // header
+        size += 1;  // data discriminator
+        {
+            uint16_t _data_tlen = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_tlen = 3;  // small_payload
+            size += _data_tlen;  // data trimmed union payload
+        }
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &header, 1); offset += 1;  // fixed run
+        buffer[offset++] = static_cast<uint8_t>(data_discriminator);
+        // data: trimmed union
+        {
+            uint16_t _data_tlen = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_tlen = 3;
+            std::memcpy(buffer + offset, &data, _data_tlen);
+            offset += _data_tlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&header, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        data_discriminator = static_cast<decltype(data_discriminator)>(buffer[offset++]);
+        // data: trimmed union read
+        {
+            uint16_t _data_rlen = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_rlen = 3;
+            if (offset + _data_rlen > buffer_size) return 0;
+            std::memcpy(&data, buffer + offset, _data_rlen);
+            offset += _data_rlen;
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// Min-size oneof test message: oneof with min_size override
+// VarEnvPayloadA is 3 bytes; min_size = 8 pads it to 8 on the wire.
+// VarEnvPayloadB is 8 bytes; no padding needed (already at min_size).
+struct MinSizeOneofMessage : structframe::MessageBase<MinSizeOneofMessage, 225, 12, 194, 37, 12> {
+
+    /* Discriminator enum for data oneof */
+    enum class DataField : uint8_t {
+        NONE = 0,
+        SMALL_PAYLOAD = 1,
+        LARGE_PAYLOAD = 2,
+    };
+
+    uint8_t header;
+    DataField data_discriminator;  // Auto-generated field order discriminator
+    union {
+        VarEnvPayloadA small_payload;
+        VarEnvPayloadB large_payload;
+    } data;
+
+    bool operator==(const MinSizeOneofMessage& other) const {
+        return (header == other.header) &&
+               (data_discriminator == other.data_discriminator) && (std::memcmp(&data, &other.data, sizeof(data)) == 0);
+    }
+    bool operator!=(const MinSizeOneofMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 4;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // header
+        size += 1;  // data discriminator
+        size += 2;  // data variable-length prefix
+        {
+            uint16_t _data_vlen = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_vlen = 3;  // small_payload
+            if (static_cast<int>(data_discriminator) == 2) _data_vlen = 8;  // large_payload
+            if (_data_vlen < 8) _data_vlen = 8;
+            size += _data_vlen;
+        }
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &header, 1); offset += 1;  // fixed run
+        buffer[offset++] = static_cast<uint8_t>(data_discriminator);
+        // data variable-length union: write uint16 length + variant bytes
+        {
+            uint16_t _data_len = 0;
+            if (static_cast<int>(data_discriminator) == 1) _data_len = 3;
+            if (static_cast<int>(data_discriminator) == 2) _data_len = 8;
+            if (_data_len < 8) _data_len = 8;
+            std::memcpy(buffer + offset, &_data_len, 2);
+            offset += 2;
+            if (_data_len > 0) {
+                std::memcpy(buffer + offset, &data, _data_len);
+                offset += _data_len;
+            }
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&header, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        data_discriminator = static_cast<decltype(data_discriminator)>(buffer[offset++]);
+        // data variable-length union: read uint16 length + variant bytes
+        {
+            if (offset + 2 > buffer_size) return 0;
+            uint16_t _data_len;
+            std::memcpy(&_data_len, buffer + offset, 2);
+            offset += 2;
+            if (offset + _data_len > buffer_size) return 0;
+            if (static_cast<int>(data_discriminator) == 1) {
+                size_t _copy = _data_len < 3 ? _data_len : 3;
+                std::memcpy(&data, buffer + offset, _copy);
+            }
+            if (static_cast<int>(data_discriminator) == 2) {
+                size_t _copy = _data_len < 8 ? _data_len : 8;
+                std::memcpy(&data, buffer + offset, _copy);
+            }
+            offset += _data_len;  // Always skip full payload
+        }
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable oneof message - always use variable-length deserialization
+        return _deserialize_variable(buffer, buffer_size);
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(size_t msg_id, size_t* size) {
+    switch (msg_id) {
+        case serialization_test::BasicTypesMessage::MSG_ID: *size = serialization_test::BasicTypesMessage::MAX_SIZE; return true;
+        case serialization_test::ComprehensiveArrayMessage::MSG_ID: *size = serialization_test::ComprehensiveArrayMessage::MAX_SIZE; return true;
+        case serialization_test::SerializationTestMessage::MSG_ID: *size = serialization_test::SerializationTestMessage::MAX_SIZE; return true;
+        case serialization_test::UnionTestMessage::MSG_ID: *size = serialization_test::UnionTestMessage::MAX_SIZE; return true;
+        case serialization_test::UnionTestMessageFieldOrder::MSG_ID: *size = serialization_test::UnionTestMessageFieldOrder::MAX_SIZE; return true;
+        case serialization_test::VariableSingleArray::MSG_ID: *size = serialization_test::VariableSingleArray::MAX_SIZE; return true;
+        case serialization_test::VariableMultipleArrays::MSG_ID: *size = serialization_test::VariableMultipleArrays::MAX_SIZE; return true;
+        case serialization_test::VariableMixedFields::MSG_ID: *size = serialization_test::VariableMixedFields::MAX_SIZE; return true;
+        case serialization_test::TruncationTestNonVariable::MSG_ID: *size = serialization_test::TruncationTestNonVariable::MAX_SIZE; return true;
+        case serialization_test::TruncationTestVariable::MSG_ID: *size = serialization_test::TruncationTestVariable::MAX_SIZE; return true;
+        case serialization_test::Message::MSG_ID: *size = serialization_test::Message::MAX_SIZE; return true;
+        case serialization_test::NestedVariableMessage::MSG_ID: *size = serialization_test::NestedVariableMessage::MAX_SIZE; return true;
+        case serialization_test::NestedEnumMessage::MSG_ID: *size = serialization_test::NestedEnumMessage::MAX_SIZE; return true;
+        case serialization_test::CollisionEnumMessage::MSG_ID: *size = serialization_test::CollisionEnumMessage::MAX_SIZE; return true;
+        case serialization_test::FlattenMessage::MSG_ID: *size = serialization_test::FlattenMessage::MAX_SIZE; return true;
+        case serialization_test::NoneDiscriminatorMessage::MSG_ID: *size = serialization_test::NoneDiscriminatorMessage::MAX_SIZE; return true;
+        case serialization_test::MultiOneofMessage::MSG_ID: *size = serialization_test::MultiOneofMessage::MAX_SIZE; return true;
+        case serialization_test::VariableEnvelopeMessage::MSG_ID: *size = serialization_test::VariableEnvelopeMessage::MAX_SIZE; return true;
+        case serialization_test::VariableEnvelopeMsgIdMessage::MSG_ID: *size = serialization_test::VariableEnvelopeMsgIdMessage::MAX_SIZE; return true;
+        case serialization_test::VariableOneofMessage::MSG_ID: *size = serialization_test::VariableOneofMessage::MAX_SIZE; return true;
+        case serialization_test::MaxSizeOneofMessage::MSG_ID: *size = serialization_test::MaxSizeOneofMessage::MAX_SIZE; return true;
+        case serialization_test::MinSizeOneofMessage::MSG_ID: *size = serialization_test::MinSizeOneofMessage::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    switch (msg_id) {
+        case serialization_test::BasicTypesMessage::MSG_ID: return MessageInfo{serialization_test::BasicTypesMessage::MAX_SIZE, serialization_test::BasicTypesMessage::MAGIC1, serialization_test::BasicTypesMessage::MAGIC2, serialization_test::BasicTypesMessage::BASE_SIZE};
+        case serialization_test::ComprehensiveArrayMessage::MSG_ID: return MessageInfo{serialization_test::ComprehensiveArrayMessage::MAX_SIZE, serialization_test::ComprehensiveArrayMessage::MAGIC1, serialization_test::ComprehensiveArrayMessage::MAGIC2, serialization_test::ComprehensiveArrayMessage::BASE_SIZE};
+        case serialization_test::SerializationTestMessage::MSG_ID: return MessageInfo{serialization_test::SerializationTestMessage::MAX_SIZE, serialization_test::SerializationTestMessage::MAGIC1, serialization_test::SerializationTestMessage::MAGIC2, serialization_test::SerializationTestMessage::BASE_SIZE};
+        case serialization_test::UnionTestMessage::MSG_ID: return MessageInfo{serialization_test::UnionTestMessage::MAX_SIZE, serialization_test::UnionTestMessage::MAGIC1, serialization_test::UnionTestMessage::MAGIC2, serialization_test::UnionTestMessage::BASE_SIZE};
+        case serialization_test::UnionTestMessageFieldOrder::MSG_ID: return MessageInfo{serialization_test::UnionTestMessageFieldOrder::MAX_SIZE, serialization_test::UnionTestMessageFieldOrder::MAGIC1, serialization_test::UnionTestMessageFieldOrder::MAGIC2, serialization_test::UnionTestMessageFieldOrder::BASE_SIZE};
+        case serialization_test::VariableSingleArray::MSG_ID: return MessageInfo{serialization_test::VariableSingleArray::MAX_SIZE, serialization_test::VariableSingleArray::MAGIC1, serialization_test::VariableSingleArray::MAGIC2, serialization_test::VariableSingleArray::BASE_SIZE};
+        case serialization_test::VariableMultipleArrays::MSG_ID: return MessageInfo{serialization_test::VariableMultipleArrays::MAX_SIZE, serialization_test::VariableMultipleArrays::MAGIC1, serialization_test::VariableMultipleArrays::MAGIC2, serialization_test::VariableMultipleArrays::BASE_SIZE};
+        case serialization_test::VariableMixedFields::MSG_ID: return MessageInfo{serialization_test::VariableMixedFields::MAX_SIZE, serialization_test::VariableMixedFields::MAGIC1, serialization_test::VariableMixedFields::MAGIC2, serialization_test::VariableMixedFields::BASE_SIZE};
+        case serialization_test::TruncationTestNonVariable::MSG_ID: return MessageInfo{serialization_test::TruncationTestNonVariable::MAX_SIZE, serialization_test::TruncationTestNonVariable::MAGIC1, serialization_test::TruncationTestNonVariable::MAGIC2, serialization_test::TruncationTestNonVariable::BASE_SIZE};
+        case serialization_test::TruncationTestVariable::MSG_ID: return MessageInfo{serialization_test::TruncationTestVariable::MAX_SIZE, serialization_test::TruncationTestVariable::MAGIC1, serialization_test::TruncationTestVariable::MAGIC2, serialization_test::TruncationTestVariable::BASE_SIZE};
+        case serialization_test::Message::MSG_ID: return MessageInfo{serialization_test::Message::MAX_SIZE, serialization_test::Message::MAGIC1, serialization_test::Message::MAGIC2, serialization_test::Message::BASE_SIZE};
+        case serialization_test::NestedVariableMessage::MSG_ID: return MessageInfo{serialization_test::NestedVariableMessage::MAX_SIZE, serialization_test::NestedVariableMessage::MAGIC1, serialization_test::NestedVariableMessage::MAGIC2, serialization_test::NestedVariableMessage::BASE_SIZE};
+        case serialization_test::NestedEnumMessage::MSG_ID: return MessageInfo{serialization_test::NestedEnumMessage::MAX_SIZE, serialization_test::NestedEnumMessage::MAGIC1, serialization_test::NestedEnumMessage::MAGIC2, serialization_test::NestedEnumMessage::BASE_SIZE};
+        case serialization_test::CollisionEnumMessage::MSG_ID: return MessageInfo{serialization_test::CollisionEnumMessage::MAX_SIZE, serialization_test::CollisionEnumMessage::MAGIC1, serialization_test::CollisionEnumMessage::MAGIC2, serialization_test::CollisionEnumMessage::BASE_SIZE};
+        case serialization_test::FlattenMessage::MSG_ID: return MessageInfo{serialization_test::FlattenMessage::MAX_SIZE, serialization_test::FlattenMessage::MAGIC1, serialization_test::FlattenMessage::MAGIC2, serialization_test::FlattenMessage::BASE_SIZE};
+        case serialization_test::NoneDiscriminatorMessage::MSG_ID: return MessageInfo{serialization_test::NoneDiscriminatorMessage::MAX_SIZE, serialization_test::NoneDiscriminatorMessage::MAGIC1, serialization_test::NoneDiscriminatorMessage::MAGIC2, serialization_test::NoneDiscriminatorMessage::BASE_SIZE};
+        case serialization_test::MultiOneofMessage::MSG_ID: return MessageInfo{serialization_test::MultiOneofMessage::MAX_SIZE, serialization_test::MultiOneofMessage::MAGIC1, serialization_test::MultiOneofMessage::MAGIC2, serialization_test::MultiOneofMessage::BASE_SIZE};
+        case serialization_test::VariableEnvelopeMessage::MSG_ID: return MessageInfo{serialization_test::VariableEnvelopeMessage::MAX_SIZE, serialization_test::VariableEnvelopeMessage::MAGIC1, serialization_test::VariableEnvelopeMessage::MAGIC2, serialization_test::VariableEnvelopeMessage::BASE_SIZE};
+        case serialization_test::VariableEnvelopeMsgIdMessage::MSG_ID: return MessageInfo{serialization_test::VariableEnvelopeMsgIdMessage::MAX_SIZE, serialization_test::VariableEnvelopeMsgIdMessage::MAGIC1, serialization_test::VariableEnvelopeMsgIdMessage::MAGIC2, serialization_test::VariableEnvelopeMsgIdMessage::BASE_SIZE};
+        case serialization_test::VariableOneofMessage::MSG_ID: return MessageInfo{serialization_test::VariableOneofMessage::MAX_SIZE, serialization_test::VariableOneofMessage::MAGIC1, serialization_test::VariableOneofMessage::MAGIC2, serialization_test::VariableOneofMessage::BASE_SIZE};
+        case serialization_test::MaxSizeOneofMessage::MSG_ID: return MessageInfo{serialization_test::MaxSizeOneofMessage::MAX_SIZE, serialization_test::MaxSizeOneofMessage::MAGIC1, serialization_test::MaxSizeOneofMessage::MAGIC2, serialization_test::MaxSizeOneofMessage::BASE_SIZE};
+        case serialization_test::MinSizeOneofMessage::MSG_ID: return MessageInfo{serialization_test::MinSizeOneofMessage::MAX_SIZE, serialization_test::MinSizeOneofMessage::MAGIC1, serialization_test::MinSizeOneofMessage::MAGIC2, serialization_test::MinSizeOneofMessage::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace serialization_test
+}  // namespace structframe
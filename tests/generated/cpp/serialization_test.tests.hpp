@@ -0,0 +1,734 @@
+/* Automatically generated test code for struct-frame messages */
+/* This file provides round-trip encode/decode verification tests */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+
+#include <cstdio>
+#include <cstring>
+#include <cstdint>
+#include "serialization_test.structframe.hpp"
+#include "frame_profiles.hpp"
+#include "profiling_tests.hpp"
+
+namespace structframe {
+namespace serialization_test {
+namespace Tests {
+
+/* Create a test instance of BasicTypesMessage */
+inline BasicTypesMessage create_test_basic_types_message() {
+    BasicTypesMessage msg{};
+    msg.small_int = 42;
+    msg.medium_int = 501;
+    msg.regular_int = 123458;
+    msg.large_int = 9876543213LL;
+    msg.small_uint = 46;
+    msg.medium_uint = 1005;
+    msg.regular_uint = 123462U;
+    msg.large_uint = 9876543217ULL;
+    msg.single_precision = 11.14159f;
+    msg.double_precision = 11.718281828;
+    msg.flag = true;
+    std::strncpy(msg.device_id, "test_string", sizeof(msg.device_id) - 1);
+    msg.description.length = 11;
+    std::strncpy(msg.description.data, "test_string", sizeof(msg.description.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of ComprehensiveArrayMessage */
+inline ComprehensiveArrayMessage create_test_comprehensive_array_message() {
+    ComprehensiveArrayMessage msg{};
+    msg.fixed_ints[0] = 123456;
+    msg.fixed_ints[1] = 123457;
+    msg.fixed_ints[2] = 123458;
+    msg.fixed_floats[0] = 3.14159f;
+    msg.fixed_floats[1] = 4.14159f;
+    msg.fixed_bools[0] = true;
+    msg.fixed_bools[1] = false;
+    msg.fixed_bools[2] = true;
+    msg.bounded_uints.count = 3;
+    msg.bounded_uints.data[0] = 1000;
+    msg.bounded_uints.data[1] = 1001;
+    msg.bounded_uints.data[2] = 1002;
+    msg.bounded_doubles.count = 2;
+    msg.bounded_doubles.data[0] = 2.718281828;
+    msg.bounded_doubles.data[1] = 3.718281828;
+    std::strncpy(msg.fixed_strings[0], "test_0", sizeof(msg.fixed_strings[0]) - 1);
+    std::strncpy(msg.fixed_strings[1], "test_1", sizeof(msg.fixed_strings[1]) - 1);
+    msg.bounded_strings.count = 2;
+    std::strncpy(msg.bounded_strings.data[0], "test_0", sizeof(msg.bounded_strings.data[0]) - 1);
+    std::strncpy(msg.bounded_strings.data[1], "test_1", sizeof(msg.bounded_strings.data[1]) - 1);
+    msg.fixed_statuses[0] = static_cast<Status>(0);
+    msg.fixed_statuses[1] = static_cast<Status>(0);
+    msg.bounded_statuses.count = 2;
+    msg.bounded_statuses.data[0] = static_cast<Status>(0);
+    msg.bounded_statuses.data[1] = static_cast<Status>(0);
+    msg.fixed_sensors[0] = {};
+    msg.bounded_sensors.count = 1;
+    msg.bounded_sensors.data[0] = {};
+    return msg;
+}
+
+/* Create a test instance of SerializationTestMessage */
+inline SerializationTestMessage create_test_serialization_test_message() {
+    SerializationTestMessage msg{};
+    msg.magic_number = 123456U;
+    msg.test_string.length = 11;
+    std::strncpy(msg.test_string.data, "test_string", sizeof(msg.test_string.data) - 1);
+    msg.test_float = 5.14159f;
+    msg.test_bool = false;
+    msg.test_array.count = 3;
+    msg.test_array.data[0] = 123456;
+    msg.test_array.data[1] = 123457;
+    msg.test_array.data[2] = 123458;
+    return msg;
+}
+
+/* Create a test instance of VariableSingleArray */
+inline VariableSingleArray create_test_variable_single_array() {
+    VariableSingleArray msg{};
+    msg.message_id = 123456U;
+    msg.payload.count = 3;
+    msg.payload.data[0] = 42;
+    msg.payload.data[1] = 43;
+    msg.payload.data[2] = 44;
+    msg.checksum = 1002;
+    return msg;
+}
+
+/* Create a test instance of VariableMultipleArrays */
+inline VariableMultipleArrays create_test_variable_multiple_arrays() {
+    VariableMultipleArrays msg{};
+    msg.type = 42;
+    msg.readings.count = 3;
+    msg.readings.data[0] = 123456;
+    msg.readings.data[1] = 123457;
+    msg.readings.data[2] = 123458;
+    msg.values.count = 3;
+    msg.values.data[0] = 3.14159f;
+    msg.values.data[1] = 4.14159f;
+    msg.values.data[2] = 5.14159f;
+    msg.label.length = 11;
+    std::strncpy(msg.label.data, "test_string", sizeof(msg.label.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of VariableMixedFields */
+inline VariableMixedFields create_test_variable_mixed_fields() {
+    VariableMixedFields msg{};
+    msg.fixed_id = 123456U;
+    msg.fixed_value = 4.14159f;
+    std::strncpy(msg.fixed_name, "test_string", sizeof(msg.fixed_name) - 1);
+    msg.variable_data.count = 3;
+    msg.variable_data.data[0] = 1000;
+    msg.variable_data.data[1] = 1001;
+    msg.variable_data.data[2] = 1002;
+    msg.variable_desc.length = 11;
+    std::strncpy(msg.variable_desc.data, "test_string", sizeof(msg.variable_desc.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of TruncationTestNonVariable */
+inline TruncationTestNonVariable create_test_truncation_test_non_variable() {
+    TruncationTestNonVariable msg{};
+    msg.sequence_id = 123456U;
+    msg.data_array.count = 3;
+    msg.data_array.data[0] = 42;
+    msg.data_array.data[1] = 43;
+    msg.data_array.data[2] = 44;
+    msg.footer = 1002;
+    return msg;
+}
+
+/* Create a test instance of TruncationTestVariable */
+inline TruncationTestVariable create_test_truncation_test_variable() {
+    TruncationTestVariable msg{};
+    msg.sequence_id = 123456U;
+    msg.data_array.count = 3;
+    msg.data_array.data[0] = 42;
+    msg.data_array.data[1] = 43;
+    msg.data_array.data[2] = 44;
+    msg.footer = 1002;
+    return msg;
+}
+
+/* Create a test instance of Message */
+inline Message create_test_message() {
+    Message msg{};
+    msg.severity = static_cast<MsgSeverity>(0);
+    msg.module.length = 11;
+    std::strncpy(msg.module.data, "test_string", sizeof(msg.module.data) - 1);
+    msg.msg.length = 11;
+    std::strncpy(msg.msg.data, "test_string", sizeof(msg.msg.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of NestedVariableMessage */
+inline NestedVariableMessage create_test_nested_variable_message() {
+    NestedVariableMessage msg{};
+    msg.sequence = 123456U;
+    msg.payload = {};
+    msg.description.length = 11;
+    std::strncpy(msg.description.data, "test_string", sizeof(msg.description.data) - 1);
+    return msg;
+}
+
+/* Create a test instance of NestedEnumMessage */
+inline NestedEnumMessage create_test_nested_enum_message() {
+    NestedEnumMessage msg{};
+    msg.mode = static_cast<NestedEnumMessage::OperationMode>(0);
+    msg.value = 43;
+    msg.enabled = true;
+    return msg;
+}
+
+/* Create a test instance of CollisionEnumMessage */
+inline CollisionEnumMessage create_test_collision_enum_message() {
+    CollisionEnumMessage msg{};
+    msg.status = static_cast<CollisionEnumMessage::Status>(0);
+    msg.id = 43;
+    msg.time = 4.718281828;
+    return msg;
+}
+
+/* Create a test instance of FlattenMessage */
+inline FlattenMessage create_test_flatten_message() {
+    FlattenMessage msg{};
+    msg.seq = 123456U;
+    msg.inner = {};
+    return msg;
+}
+
+/* Test result structure */
+struct TestResult {
+    bool passed;
+    const char* message_name;
+    const char* error_msg;
+    bool skipped = false;  /* profile-incompatible: not a real pass */
+};
+
+/* Test round-trip encode/decode for BasicTypesMessage */
+template <typename Config>
+inline TestResult test_basic_types_message() {
+    using MsgT = BasicTypesMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "BasicTypesMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "BasicTypesMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_basic_types_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "BasicTypesMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for ComprehensiveArrayMessage */
+template <typename Config>
+inline TestResult test_comprehensive_array_message() {
+    using MsgT = ComprehensiveArrayMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "ComprehensiveArrayMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "ComprehensiveArrayMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_comprehensive_array_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "ComprehensiveArrayMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for SerializationTestMessage */
+template <typename Config>
+inline TestResult test_serialization_test_message() {
+    using MsgT = SerializationTestMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "SerializationTestMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "SerializationTestMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_serialization_test_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "SerializationTestMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for VariableSingleArray */
+template <typename Config>
+inline TestResult test_variable_single_array() {
+    using MsgT = VariableSingleArray;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "VariableSingleArray", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "VariableSingleArray", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_variable_single_array();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "VariableSingleArray", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for VariableMultipleArrays */
+template <typename Config>
+inline TestResult test_variable_multiple_arrays() {
+    using MsgT = VariableMultipleArrays;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "VariableMultipleArrays", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "VariableMultipleArrays", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_variable_multiple_arrays();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "VariableMultipleArrays", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for VariableMixedFields */
+template <typename Config>
+inline TestResult test_variable_mixed_fields() {
+    using MsgT = VariableMixedFields;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "VariableMixedFields", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "VariableMixedFields", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_variable_mixed_fields();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "VariableMixedFields", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for TruncationTestNonVariable */
+template <typename Config>
+inline TestResult test_truncation_test_non_variable() {
+    using MsgT = TruncationTestNonVariable;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "TruncationTestNonVariable", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "TruncationTestNonVariable", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_truncation_test_non_variable();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "TruncationTestNonVariable", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for TruncationTestVariable */
+template <typename Config>
+inline TestResult test_truncation_test_variable() {
+    using MsgT = TruncationTestVariable;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "TruncationTestVariable", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "TruncationTestVariable", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_truncation_test_variable();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "TruncationTestVariable", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for Message */
+template <typename Config>
+inline TestResult test_message() {
+    using MsgT = Message;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "Message", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "Message", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "Message", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for NestedVariableMessage */
+template <typename Config>
+inline TestResult test_nested_variable_message() {
+    using MsgT = NestedVariableMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "NestedVariableMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "NestedVariableMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_nested_variable_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "NestedVariableMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for NestedEnumMessage */
+template <typename Config>
+inline TestResult test_nested_enum_message() {
+    using MsgT = NestedEnumMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "NestedEnumMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "NestedEnumMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_nested_enum_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "NestedEnumMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for CollisionEnumMessage */
+template <typename Config>
+inline TestResult test_collision_enum_message() {
+    using MsgT = CollisionEnumMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "CollisionEnumMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "CollisionEnumMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_collision_enum_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "CollisionEnumMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Test round-trip encode/decode for FlattenMessage */
+template <typename Config>
+inline TestResult test_flatten_message() {
+    using MsgT = FlattenMessage;
+    if constexpr (!Config::has_pkg_id && (MsgT::MSG_ID > 255)) {
+        return TestResult{true, "FlattenMessage", "skipped: msg_id > 255 requires has_pkg_id profile", true};
+    } else if constexpr (Config::has_length && (MsgT::MAX_SIZE > Config::max_payload)) {
+        return TestResult{true, "FlattenMessage", "skipped: message exceeds profile max_payload", true};
+    } else {
+        uint8_t buffer[(MsgT::MAX_SIZE > 4096) ? (MsgT::MAX_SIZE + 128) : 4096];
+        auto msg = create_test_flatten_message();
+        bool passed = structframe::ProfilingTests::verify_roundtrip<MsgT, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        return TestResult{passed, "FlattenMessage", passed ? nullptr : "Round-trip verification failed"};
+    }
+}
+
+/* Number of test messages */
+static constexpr size_t TEST_MESSAGE_COUNT = 13;
+
+/* Run all message tests with a specific profile.
+ * Profile-incompatible messages are counted in *out_skipped* (NOT as
+ * passes); ``tested[i]`` is set true when message i round-trips under this
+ * profile so the caller can verify every message is exercised somewhere.
+ * Returns the number of genuine passes. */
+template <typename Config>
+inline size_t run_all_tests(bool* tested, size_t& out_skipped, bool verbose = false) {
+    size_t passed = 0;
+    out_skipped = 0;
+    TestResult results[] = {
+        test_basic_types_message<Config>(),
+        test_comprehensive_array_message<Config>(),
+        test_serialization_test_message<Config>(),
+        test_variable_single_array<Config>(),
+        test_variable_multiple_arrays<Config>(),
+        test_variable_mixed_fields<Config>(),
+        test_truncation_test_non_variable<Config>(),
+        test_truncation_test_variable<Config>(),
+        test_message<Config>(),
+        test_nested_variable_message<Config>(),
+        test_nested_enum_message<Config>(),
+        test_collision_enum_message<Config>(),
+        test_flatten_message<Config>(),
+    };
+    
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (results[i].skipped) {
+            out_skipped++;
+            if (verbose) {
+                std::printf("[SKIP] %s: %s\n", results[i].message_name,
+                           results[i].error_msg ? results[i].error_msg : "");
+            }
+        } else if (results[i].passed) {
+            passed++;
+            tested[i] = true;
+            if (verbose) {
+                std::printf("[PASS] %s\n", results[i].message_name);
+            }
+        } else {
+            if (verbose) {
+                std::printf("[FAIL] %s: %s\n", results[i].message_name, 
+                           results[i].error_msg ? results[i].error_msg : "Unknown error");
+            }
+        }
+    }
+    
+    if (verbose) {
+        std::printf("\nTest Results: %zu/%zu passed (%zu skipped)\n", passed, TEST_MESSAGE_COUNT - out_skipped, out_skipped);
+    }
+    
+    return passed;
+}
+
+/* Run profiling tests for all messages with a specific profile */
+template <typename Config>
+inline void run_profiling_tests(bool verbose = false) {
+    uint8_t buffer[4096];
+    
+    if (verbose) {
+        std::printf("Running profiling tests (%zu iterations each)...\n", 
+                   structframe::ProfilingTests::PROFILE_ITERATIONS);
+    }
+    
+    {
+        auto msg = create_test_basic_types_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<BasicTypesMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("BasicTypesMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_comprehensive_array_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<ComprehensiveArrayMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("ComprehensiveArrayMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_serialization_test_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<SerializationTestMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("SerializationTestMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_variable_single_array();
+        auto result = structframe::ProfilingTests::run_packed_profiling<VariableSingleArray, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("VariableSingleArray:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_variable_multiple_arrays();
+        auto result = structframe::ProfilingTests::run_packed_profiling<VariableMultipleArrays, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("VariableMultipleArrays:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_variable_mixed_fields();
+        auto result = structframe::ProfilingTests::run_packed_profiling<VariableMixedFields, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("VariableMixedFields:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_truncation_test_non_variable();
+        auto result = structframe::ProfilingTests::run_packed_profiling<TruncationTestNonVariable, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("TruncationTestNonVariable:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_truncation_test_variable();
+        auto result = structframe::ProfilingTests::run_packed_profiling<TruncationTestVariable, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("TruncationTestVariable:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<Message, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("Message:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_nested_variable_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<NestedVariableMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("NestedVariableMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_nested_enum_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<NestedEnumMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("NestedEnumMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_collision_enum_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<CollisionEnumMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("CollisionEnumMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+    {
+        auto msg = create_test_flatten_message();
+        auto result = structframe::ProfilingTests::run_packed_profiling<FlattenMessage, Config>(
+            msg, buffer, sizeof(buffer), get_message_info);
+        
+        if (verbose) {
+            std::printf("FlattenMessage:\n");
+            std::printf("  Roundtrip: %s\n", result.roundtrip_verified ? "OK" : "FAIL");
+            std::printf("  Encode packed:  %zu iterations, %zu bytes\n", 
+                       result.encode_packed.iterations, result.encode_packed.bytes_total);
+            std::printf("  Decode packed:  %zu iterations, %zu bytes\n", 
+                       result.decode_packed.iterations, result.decode_packed.bytes_total);
+        }
+    }
+    
+}
+
+/* Run round-trip tests across all 5 frame profiles */
+inline bool run_roundtrip_all_profiles(bool verbose = false) {
+    using namespace structframe;
+    struct ProfileEntry { const char* name; size_t (*runner)(bool*, size_t&, bool); };
+    ProfileEntry profiles[] = {
+        {"ProfileStandard", run_all_tests<ProfileStandardConfig>},
+        {"ProfileSensor",   run_all_tests<ProfileSensorConfig>},
+        {"ProfileIPC",      run_all_tests<ProfileIPCConfig>},
+        {"ProfileBulk",     run_all_tests<ProfileBulkConfig>},
+        {"ProfileNetwork",  run_all_tests<ProfileNetworkConfig>},
+    };
+    bool all_passed = true;
+    /* tested[i] becomes true once message i round-trips under any profile. */
+    bool tested[TEST_MESSAGE_COUNT == 0 ? 1 : TEST_MESSAGE_COUNT] = {false};
+    for (const auto& p : profiles) {
+        if (verbose) std::printf("\n--- %s ---\n", p.name);
+        size_t skipped = 0;
+        size_t passed = p.runner(tested, skipped, verbose);
+        size_t expected = TEST_MESSAGE_COUNT - skipped;
+        if (passed != expected) {
+            all_passed = false;
+            std::printf("[FAIL] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        } else if (verbose) {
+            std::printf("[OK] %s: %zu/%zu passed (%zu skipped)\n", p.name, passed, expected, skipped);
+        }
+    }
+    /* Messages skipped under every profile are not exercised by this
+     * generated suite (e.g. cross-package messages the per-package
+     * registry cannot resolve). Reported loudly but non-fatally -- a
+     * profile that *attempts* a message and fails is caught above. */
+    size_t never = 0;
+    for (size_t i = 0; i < TEST_MESSAGE_COUNT; i++) {
+        if (!tested[i]) { never++; std::printf("[WARN] message index %zu skipped under every profile, not exercised\n", i); }
+    }
+    (void)never;
+    return all_passed;
+}
+
+}  // namespace Tests
+}  // namespace serialization_test
+}  // namespace structframe
@@ -0,0 +1,10 @@
+// C++ Struct Frame SDK
+// Header-only SDK for structured message communication
+
+#pragma once
+
+#include "transport.hpp"
+#include "serial_transport.hpp"
+#include "network_transports.hpp"
+#include "observer.hpp"
+#include "struct_frame_sdk.hpp"
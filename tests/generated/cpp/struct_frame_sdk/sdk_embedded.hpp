@@ -0,0 +1,10 @@
+// C++ Struct Frame SDK for Embedded Systems
+// Header-only SDK without ASIO dependencies
+// Only includes serial transport and observer pattern
+
+#pragma once
+
+#include "transport.hpp"
+#include "serial_transport.hpp"
+#include "observer.hpp"
+#include "struct_frame_sdk.hpp"
@@ -0,0 +1,36 @@
+/* Automatically generated round-trip test for struct-frame messages. */
+/* Generated by struct-frame 0.0.1. */
+/*
+ * For every message in the package this binary populates the
+ * fields with deterministic dummy values, encodes the message via
+ * BufferWriter / FrameEncoder, decodes it back via the parser used
+ * by AccumulatingReader and verifies that the decoded message
+ * matches the original. Every message is exercised against all
+ * five frame profiles (Standard, Sensor, IPC, Bulk, Network).
+ * Combinations that are intentionally incompatible (e.g. msg_id
+ * > 255 on a profile without pkg_id, or a payload that exceeds
+ * the profile maximum) are reported as skipped, not as failures.
+ */
+
+#include <cstdio>
+#include <cstring>
+#include "pkg_test_messages.tests.hpp"
+
+int main(int argc, char** argv) {
+    bool verbose = false;
+    for (int i = 1; i < argc; i++) {
+        if (std::strcmp(argv[i], "-v") == 0 || std::strcmp(argv[i], "--verbose") == 0) {
+            verbose = true;
+        }
+    }
+
+    std::printf("Running round-trip tests for package 'pkg_test_messages' across 5 profiles...\n");
+    bool ok = structframe::pkg_test_messages::Tests::run_roundtrip_all_profiles(verbose);
+    if (ok) {
+        std::printf("[TEST PASSED] All round-trip tests for 'pkg_test_messages' succeeded.\n");
+        return 0;
+    } else {
+        std::printf("[TEST FAILED] Round-trip tests for 'pkg_test_messages' had failures.\n");
+        return 1;
+    }
+}
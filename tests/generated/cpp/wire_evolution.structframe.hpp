@@ -0,0 +1,445 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace wire_evolution {
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// Wire-evolution test messages for struct-frame code generation framework.
+//
+// Tests the extensions_start mechanism for both top-level message fields and
+// for variants inside a oneof block.  Extension fields/variants are excluded
+// from the magic-byte computation (so older parsers still validate the base
+// portion) but are still mixed into the CRC (so corruption is detected).
+//
+// Four scenarios are exercised:
+//  1. BaseExtensionMessage    — top-level extension fields, fixed-size base
+//  2. VariableExtensionMessage — top-level extensions, variable-length base
+//  3. OneOfExtensionMessage   — extension variants inside a single oneof
+//  4. MultiOneOfExtensionMessage — two oneofs, the second has extension variants
+//
+// Syntax notes:
+//  • option extensions_start = N;  — canonical marker (message or oneof scope)
+//    The next field/variant with number >= N is an extension field.
+//
+// ============================================================================
+// Shared sub-message types used inside oneofs
+// ============================================================================
+// Used as a base oneof variant (no msgid — discriminator uses field_order)
+struct BaseCommandA {
+    uint32_t value_a;
+    uint16_t flags_a;
+
+    bool operator==(const BaseCommandA& other) const {
+        return (value_a == other.value_a) &&
+               (flags_a == other.flags_a);
+    }
+    bool operator!=(const BaseCommandA& other) const { return !(*this == other); }
+};
+
+
+// Used as a base oneof variant
+struct BaseCommandB {
+    int16_t value_b;
+    bool active_b;
+
+    bool operator==(const BaseCommandB& other) const {
+        return (value_b == other.value_b) &&
+               (active_b == other.active_b);
+    }
+    bool operator!=(const BaseCommandB& other) const { return !(*this == other); }
+};
+
+
+// Used as an extension oneof variant — older receivers treat it as unknown
+struct ExtCommandC {
+    float value_c;
+    uint8_t mode_c;
+
+    bool operator==(const ExtCommandC& other) const {
+        return (value_c == other.value_c) &&
+               (mode_c == other.mode_c);
+    }
+    bool operator!=(const ExtCommandC& other) const { return !(*this == other); }
+};
+
+
+// Used as a second extension oneof variant
+struct ExtCommandD {
+    double value_d;
+
+    bool operator==(const ExtCommandD& other) const {
+        return (value_d == other.value_d);
+    }
+    bool operator!=(const ExtCommandD& other) const { return !(*this == other); }
+};
+
+
+// ============================================================================
+// Scenario 1 — standard message with top-level extension fields (fixed base)
+// ============================================================================
+//
+// Base wire format: header(2) + seq(1) = 3 bytes
+// Extension: crc_seed(4) is appended when the sender is extension-aware.
+// Older parsers see a 3-byte payload; magic is derived only from the 2 base
+// fields, so they compute the same magic byte as a v2 sender.
+struct BaseExtensionMessage : structframe::MessageBase<BaseExtensionMessage, 1, 7, 7, 11, 3> {
+
+// Base fields — always present on the wire
+    uint16_t header;
+    uint8_t seq;
+// this; older senders omit it and older receivers zero-fill on reception.
+// Extension fields — senders/receivers that understand extensions include
+    uint32_t crc_seed;
+
+    bool operator==(const BaseExtensionMessage& other) const {
+        return (header == other.header) &&
+               (seq == other.seq) &&
+               (crc_seed == other.crc_seed);
+    }
+    bool operator!=(const BaseExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Scenario 2 — variable-length message with top-level extension fields
+// ============================================================================
+//
+// This verifies that extensions play nicely with variable encoding: the base
+// portion is variable (contains a bounded array) while the extension portion
+// is a plain fixed field appended after the base.
+struct VariableExtensionMessage : structframe::MessageBase<VariableExtensionMessage, 2, 38, 7, 9, 34> {
+
+// Base fields
+    uint8_t node_id;
+    struct { uint8_t count; uint16_t data[16]; } readings;  // Variable array: up to 16 elements
+// Extension field — fixed-size trailer, appended after the variable base
+    uint32_t ext_timestamp;
+
+    bool operator==(const VariableExtensionMessage& other) const {
+        return (node_id == other.node_id) &&
+               (readings.count == other.readings.count && std::memcmp(readings.data, other.readings.data, sizeof(readings.data)) == 0) &&
+               (ext_timestamp == other.ext_timestamp);
+    }
+    bool operator!=(const VariableExtensionMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 6;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // node_id
+        size += 1 + (readings.count * 2);  // readings
+        size += 4;  // ext_timestamp
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &node_id, 1); offset += 1;  // fixed run
+        buffer[offset++] = readings.count;
+        std::memcpy(buffer + offset, readings.data, readings.count * 2);
+        offset += readings.count * 2;
+        std::memcpy(buffer + offset, &ext_timestamp, 4); offset += 4;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&node_id, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        readings.count = buffer[offset++];
+        if (readings.count > 16) readings.count = 16;
+        if (offset + readings.count * 2 > buffer_size) return 0;
+        std::memcpy(readings.data, buffer + offset, readings.count * 2);
+        offset += readings.count * 2;
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&ext_timestamp, buffer + offset, 4);
+        offset += 4;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Scenario 3 — message with a single oneof that contains extension variants
+// ============================================================================
+//
+// The oneof 'command' has two base variants (field_order 1 and 2) and two
+// extension variants (field_order 3 and 4).  The magic bytes are computed only
+// from base variants; the message base_size is derived from the largest base
+// variant.  An older parser cannot decode an ext variant payload but still
+// validates the CRC (extension bytes are mixed in after the magic).
+struct OneOfExtensionMessage : structframe::MessageBase<OneOfExtensionMessage, 3, 10, 254, 127, 8> {
+
+    /* Discriminator enum for command oneof */
+    enum class CommandField : uint8_t {
+        NONE = 0,
+        CMD_A = 1,
+        CMD_B = 2,
+        CMD_C = 3,
+        CMD_D = 4,
+    };
+
+// Fixed header always present
+    uint8_t device_id;
+    CommandField command_discriminator;  // Auto-generated field order discriminator
+    union {
+        // Base variants — older parsers understand these
+    BaseCommandA cmd_a;
+        BaseCommandB cmd_b;
+        // discriminator value as unknown and ignore the payload.
+// Extension variants — newer additions; older receivers treat the
+    ExtCommandC cmd_c;
+        ExtCommandD cmd_d;
+    } command;
+
+    bool operator==(const OneOfExtensionMessage& other) const {
+        return (device_id == other.device_id) &&
+               (command_discriminator == other.command_discriminator) && (std::memcmp(&command, &other.command, sizeof(command)) == 0);
+    }
+    bool operator!=(const OneOfExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Scenario 4 — message with two oneofs, only the second has extension variants
+// ============================================================================
+//
+// Verifies that per-oneof base_size is tracked independently, and that the
+// message-level base_size sums correctly.
+struct MultiOneOfExtensionMessage : structframe::MessageBase<MultiOneOfExtensionMessage, 4, 15, 125, 252, 15> {
+
+    /* Discriminator enum for base_union oneof */
+    enum class BaseUnionField : uint8_t {
+        NONE = 0,
+        FIRST_A = 1,
+        FIRST_B = 2,
+    };
+
+    /* Discriminator enum for ext_union oneof */
+    enum class ExtUnionField : uint8_t {
+        NONE = 0,
+        SECOND_A = 1,
+        SECOND_EXT = 2,
+    };
+
+    uint8_t priority;
+// First oneof — all base variants, no extensions
+    BaseUnionField base_union_discriminator;  // Auto-generated field order discriminator
+    union {
+        BaseCommandA first_a;
+        BaseCommandB first_b;
+    } base_union;
+// Second oneof — has extension variants
+    ExtUnionField ext_union_discriminator;  // Auto-generated field order discriminator
+    union {
+        // Base variant
+    BaseCommandA second_a;
+        // Extension variant — added later; older parsers skip it
+    ExtCommandC second_ext;
+    } ext_union;
+
+    bool operator==(const MultiOneOfExtensionMessage& other) const {
+        return (priority == other.priority) &&
+               (base_union_discriminator == other.base_union_discriminator) && (std::memcmp(&base_union, &other.base_union, sizeof(base_union)) == 0) &&
+               (ext_union_discriminator == other.ext_union_discriminator) && (std::memcmp(&ext_union, &other.ext_union, sizeof(ext_union)) == 0);
+    }
+    bool operator!=(const MultiOneOfExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(size_t msg_id, size_t* size) {
+    switch (msg_id) {
+        case wire_evolution::BaseExtensionMessage::MSG_ID: *size = wire_evolution::BaseExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution::VariableExtensionMessage::MSG_ID: *size = wire_evolution::VariableExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution::OneOfExtensionMessage::MSG_ID: *size = wire_evolution::OneOfExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution::MultiOneOfExtensionMessage::MSG_ID: *size = wire_evolution::MultiOneOfExtensionMessage::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    switch (msg_id) {
+        case wire_evolution::BaseExtensionMessage::MSG_ID: return MessageInfo{wire_evolution::BaseExtensionMessage::MAX_SIZE, wire_evolution::BaseExtensionMessage::MAGIC1, wire_evolution::BaseExtensionMessage::MAGIC2, wire_evolution::BaseExtensionMessage::BASE_SIZE};
+        case wire_evolution::VariableExtensionMessage::MSG_ID: return MessageInfo{wire_evolution::VariableExtensionMessage::MAX_SIZE, wire_evolution::VariableExtensionMessage::MAGIC1, wire_evolution::VariableExtensionMessage::MAGIC2, wire_evolution::VariableExtensionMessage::BASE_SIZE};
+        case wire_evolution::OneOfExtensionMessage::MSG_ID: return MessageInfo{wire_evolution::OneOfExtensionMessage::MAX_SIZE, wire_evolution::OneOfExtensionMessage::MAGIC1, wire_evolution::OneOfExtensionMessage::MAGIC2, wire_evolution::OneOfExtensionMessage::BASE_SIZE};
+        case wire_evolution::MultiOneOfExtensionMessage::MSG_ID: return MessageInfo{wire_evolution::MultiOneOfExtensionMessage::MAX_SIZE, wire_evolution::MultiOneOfExtensionMessage::MAGIC1, wire_evolution::MultiOneOfExtensionMessage::MAGIC2, wire_evolution::MultiOneOfExtensionMessage::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace wire_evolution
+}  // namespace structframe
@@ -0,0 +1,410 @@
+/* Automatically generated struct frame header for C++ */
+/* Generated by struct-frame 0.0.1. */
+
+#pragma once
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <type_traits>
+#include "frame_base.hpp"
+
+namespace structframe {
+namespace wire_evolution_v2 {
+
+/* Struct definitions */
+#pragma pack(push, 1)
+// Wire-evolution interop fixture — *version 2* (adds extension fields/variants).
+//
+// This is the "newer" half of a paired schema set used to test genuine
+// cross-version extension interop.  It is generated into its own package
+// (`wire_evolution_v2`) so that the v2 side is truly unaware that it is talking
+// to a v1 peer — it simply uses the canonical `option extensions_start`
+// mechanism to append extension fields/variants after the base portion.
+//
+// The base fields/variants, message ids, and oneof base variants are identical
+// to `wire_evolution_v1.sf`.  v2 additionally declares `extensions_start` plus
+// the extension fields (crc_seed, ext_timestamp) and extension oneof variants
+// (cmd_c/cmd_d, second_ext).  Because extension fields are excluded from the
+// magic-byte computation, a v1 and v2 build of the same message agree on magic
+// bytes — which is what lets a v1 receiver validate the base portion of a v2
+// frame using the frame length field to skip the trailing extension bytes.
+//
+// ============================================================================
+// Shared sub-message types used inside oneofs
+// ============================================================================
+struct BaseCommandA {
+    uint32_t value_a;
+    uint16_t flags_a;
+
+    bool operator==(const BaseCommandA& other) const {
+        return (value_a == other.value_a) &&
+               (flags_a == other.flags_a);
+    }
+    bool operator!=(const BaseCommandA& other) const { return !(*this == other); }
+};
+
+
+struct BaseCommandB {
+    int16_t value_b;
+    bool active_b;
+
+    bool operator==(const BaseCommandB& other) const {
+        return (value_b == other.value_b) &&
+               (active_b == other.active_b);
+    }
+    bool operator!=(const BaseCommandB& other) const { return !(*this == other); }
+};
+
+
+// Extension oneof variants — older (v1) receivers treat these as unknown.
+struct ExtCommandC {
+    float value_c;
+    uint8_t mode_c;
+
+    bool operator==(const ExtCommandC& other) const {
+        return (value_c == other.value_c) &&
+               (mode_c == other.mode_c);
+    }
+    bool operator!=(const ExtCommandC& other) const { return !(*this == other); }
+};
+
+
+struct ExtCommandD {
+    double value_d;
+
+    bool operator==(const ExtCommandD& other) const {
+        return (value_d == other.value_d);
+    }
+    bool operator!=(const ExtCommandD& other) const { return !(*this == other); }
+};
+
+
+// ============================================================================
+// Scenario 1 — standard message with top-level extension field (fixed base)
+// ============================================================================
+struct BaseExtensionMessage : structframe::MessageBase<BaseExtensionMessage, 1, 7, 7, 11, 3> {
+
+    uint16_t header;
+    uint8_t seq;
+    uint32_t crc_seed;
+
+    bool operator==(const BaseExtensionMessage& other) const {
+        return (header == other.header) &&
+               (seq == other.seq) &&
+               (crc_seed == other.crc_seed);
+    }
+    bool operator!=(const BaseExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Scenario 2 — variable-length message with top-level extension field
+// ============================================================================
+struct VariableExtensionMessage : structframe::MessageBase<VariableExtensionMessage, 2, 38, 7, 9, 34> {
+
+    uint8_t node_id;
+    struct { uint8_t count; uint16_t data[16]; } readings;  // Variable array: up to 16 elements
+    uint32_t ext_timestamp;
+
+    bool operator==(const VariableExtensionMessage& other) const {
+        return (node_id == other.node_id) &&
+               (readings.count == other.readings.count && std::memcmp(readings.data, other.readings.data, sizeof(readings.data)) == 0) &&
+               (ext_timestamp == other.ext_timestamp);
+    }
+    bool operator!=(const VariableExtensionMessage& other) const { return !(*this == other); }
+
+    // Variable-length message constants
+    static constexpr size_t MIN_SIZE = 6;
+    static constexpr bool IS_VARIABLE = true;
+
+    /**
+     * Calculate the serialized size using variable-length encoding.
+     * @return The size in bytes when serialized (between MIN_SIZE and MAX_SIZE)
+     */
+    size_t serialized_size() const {
+        size_t size = 0;
+        size += 1;  // node_id
+        size += 1 + (readings.count * 2);  // readings
+        size += 4;  // ext_timestamp
+        return size;
+    }
+
+    /**
+     * Serialize message using variable-length encoding.
+     * @param buffer Output buffer (must be at least serialized_size() bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        size_t offset = 0;
+        std::memcpy(buffer + offset, &node_id, 1); offset += 1;  // fixed run
+        buffer[offset++] = readings.count;
+        std::memcpy(buffer + offset, readings.data, readings.count * 2);
+        offset += readings.count * 2;
+        std::memcpy(buffer + offset, &ext_timestamp, 4); offset += 4;  // fixed run
+        return offset;
+    }
+
+    /**
+     * Deserialize message from variable-length encoding (internal method).
+     * @param buffer Input buffer
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t _deserialize_variable(const uint8_t* buffer, size_t buffer_size) {
+        size_t offset = 0;
+        std::memset(this, 0, sizeof(*this));
+        if (offset + 1 > buffer_size) return 0;
+        std::memcpy(&node_id, buffer + offset, 1);
+        offset += 1;
+        if (offset >= buffer_size) return 0;
+        readings.count = buffer[offset++];
+        if (readings.count > 16) readings.count = 16;
+        if (offset + readings.count * 2 > buffer_size) return 0;
+        std::memcpy(readings.data, buffer + offset, readings.count * 2);
+        offset += readings.count * 2;
+        if (offset + 4 > buffer_size) return 0;
+        std::memcpy(&ext_timestamp, buffer + offset, 4);
+        offset += 4;
+        return offset;
+    }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Variable message - check encoding format
+        if (buffer_size == MAX_SIZE) {
+            // Minimal profile format (MAX_SIZE encoding)
+            std::memcpy(this, buffer, MAX_SIZE);
+            return MAX_SIZE;
+        } else {
+            // Variable-length format
+            return _deserialize_variable(buffer, buffer_size);
+        }
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+};
+
+
+// ============================================================================
+// Scenario 3 — single oneof with base + extension variants
+// ============================================================================
+struct OneOfExtensionMessage : structframe::MessageBase<OneOfExtensionMessage, 3, 10, 254, 127, 8> {
+
+    /* Discriminator enum for command oneof */
+    enum class CommandField : uint8_t {
+        NONE = 0,
+        CMD_A = 1,
+        CMD_B = 2,
+        CMD_C = 3,
+        CMD_D = 4,
+    };
+
+    uint8_t device_id;
+    CommandField command_discriminator;  // Auto-generated field order discriminator
+    union {
+        BaseCommandA cmd_a;
+        BaseCommandB cmd_b;
+        ExtCommandC cmd_c;
+        ExtCommandD cmd_d;
+    } command;
+
+    bool operator==(const OneOfExtensionMessage& other) const {
+        return (device_id == other.device_id) &&
+               (command_discriminator == other.command_discriminator) && (std::memcmp(&command, &other.command, sizeof(command)) == 0);
+    }
+    bool operator!=(const OneOfExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+// ============================================================================
+// Scenario 4 — two oneofs, only the second has an extension variant
+// ============================================================================
+struct MultiOneOfExtensionMessage : structframe::MessageBase<MultiOneOfExtensionMessage, 4, 15, 125, 252, 15> {
+
+    /* Discriminator enum for base_union oneof */
+    enum class BaseUnionField : uint8_t {
+        NONE = 0,
+        FIRST_A = 1,
+        FIRST_B = 2,
+    };
+
+    /* Discriminator enum for ext_union oneof */
+    enum class ExtUnionField : uint8_t {
+        NONE = 0,
+        SECOND_A = 1,
+        SECOND_EXT = 2,
+    };
+
+    uint8_t priority;
+    BaseUnionField base_union_discriminator;  // Auto-generated field order discriminator
+    union {
+        BaseCommandA first_a;
+        BaseCommandB first_b;
+    } base_union;
+    ExtUnionField ext_union_discriminator;  // Auto-generated field order discriminator
+    union {
+        BaseCommandA second_a;
+        ExtCommandC second_ext;
+    } ext_union;
+
+    bool operator==(const MultiOneOfExtensionMessage& other) const {
+        return (priority == other.priority) &&
+               (base_union_discriminator == other.base_union_discriminator) && (std::memcmp(&base_union, &other.base_union, sizeof(base_union)) == 0) &&
+               (ext_union_discriminator == other.ext_union_discriminator) && (std::memcmp(&ext_union, &other.ext_union, sizeof(ext_union)) == 0);
+    }
+    bool operator!=(const MultiOneOfExtensionMessage& other) const { return !(*this == other); }
+
+    /**
+     * Deserialize message from binary data.
+     * Works for both variable and non-variable messages.
+     * Uses compile-time dispatch for zero runtime overhead.
+     * For variable messages with minimal profiles (buffer_size == MAX_SIZE),
+     * uses direct copy instead of variable-length deserialization.
+     * @param buffer Input buffer containing serialized message data
+     * @param buffer_size Size of input buffer
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const uint8_t* buffer, size_t buffer_size) {
+        // Fixed-size message - use direct copy
+        if (buffer_size < MAX_SIZE) return 0;
+        std::memcpy(this, buffer, MAX_SIZE);
+        return MAX_SIZE;
+    }
+
+    /**
+     * Deserialize message from FrameMsgInfo (convenience overload).
+     * @param frame_info Frame information from frame parser
+     * @return Number of bytes read, or 0 if buffer too small
+     */
+    size_t deserialize(const structframe::FrameMsgInfo& frame_info) {
+        return deserialize(frame_info.msg_data, frame_info.msg_len);
+    }
+
+    /**
+     * Serialize message to binary data.
+     * @param buffer Output buffer (must be at least MAX_SIZE bytes)
+     * @return Number of bytes written
+     */
+    size_t serialize(uint8_t* buffer) const {
+        std::memcpy(buffer, this, MAX_SIZE);
+        return MAX_SIZE;
+    }
+};
+
+
+#pragma pack(pop)
+
+
+inline bool get_message_length(size_t msg_id, size_t* size) {
+    switch (msg_id) {
+        case wire_evolution_v2::BaseExtensionMessage::MSG_ID: *size = wire_evolution_v2::BaseExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution_v2::VariableExtensionMessage::MSG_ID: *size = wire_evolution_v2::VariableExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution_v2::OneOfExtensionMessage::MSG_ID: *size = wire_evolution_v2::OneOfExtensionMessage::MAX_SIZE; return true;
+        case wire_evolution_v2::MultiOneOfExtensionMessage::MSG_ID: *size = wire_evolution_v2::MultiOneOfExtensionMessage::MAX_SIZE; return true;
+        default: break;
+    }
+    return false;
+}
+
+inline MessageInfo get_message_info(uint16_t msg_id) {
+    switch (msg_id) {
+        case wire_evolution_v2::BaseExtensionMessage::MSG_ID: return MessageInfo{wire_evolution_v2::BaseExtensionMessage::MAX_SIZE, wire_evolution_v2::BaseExtensionMessage::MAGIC1, wire_evolution_v2::BaseExtensionMessage::MAGIC2, wire_evolution_v2::BaseExtensionMessage::BASE_SIZE};
+        case wire_evolution_v2::VariableExtensionMessage::MSG_ID: return MessageInfo{wire_evolution_v2::VariableExtensionMessage::MAX_SIZE, wire_evolution_v2::VariableExtensionMessage::MAGIC1, wire_evolution_v2::VariableExtensionMessage::MAGIC2, wire_evolution_v2::VariableExtensionMessage::BASE_SIZE};
+        case wire_evolution_v2::OneOfExtensionMessage::MSG_ID: return MessageInfo{wire_evolution_v2::OneOfExtensionMessage::MAX_SIZE, wire_evolution_v2::OneOfExtensionMessage::MAGIC1, wire_evolution_v2::OneOfExtensionMessage::MAGIC2, wire_evolution_v2::OneOfExtensionMessage::BASE_SIZE};
+        case wire_evolution_v2::MultiOneOfExtensionMessage::MSG_ID: return MessageInfo{wire_evolution_v2::MultiOneOfExtensionMessage::MAX_SIZE, wire_evolution_v2::MultiOneOfExtensionMessage::MAGIC1, wire_evolution_v2::MultiOneOfExtensionMessage::MAGIC2, wire_evolution_v2::MultiOneOfExtensionMessage::BASE_SIZE};
+        default: break;
+    }
+    return MessageInfo{};
+}
+
+
+}  // namespace wire_evolution_v2
+}  // namespace structframe
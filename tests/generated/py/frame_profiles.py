@@ -0,0 +1,1833 @@
+"""
+Frame Profiles - Pre-defined Header + Payload combinations
+
+This module provides ready-to-use encode/parse functions for frame format profiles:
+- ProfileStandard: Basic + Default (General serial/UART)
+- ProfileSensor: Tiny + Minimal (Low-bandwidth sensors)
+- ProfileIPC: None + Minimal (Trusted inter-process communication)
+- ProfileBulk: Basic + Extended (Large data transfers with package namespacing)
+- ProfileNetwork: Basic + ExtendedMultiSystemStream (Multi-system networked communication)
+
+Each profile provides:
+- Encoder: encode messages into a buffer
+- BufferParser: parse/validate a complete frame in a buffer
+- BufferReader: iterate through multiple frames in a buffer
+- BufferWriter: encode multiple frames with automatic offset tracking
+- AccumulatingReader: unified parser supporting both buffer chunks and byte-by-byte streaming
+- MultiProfileReader: single-pass reader for streams that interleave several profiles
+
+This module composes HeaderConfig + PayloadConfig for maximum code reuse,
+matching the C++ frame_profiles.hpp pattern.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Callable, Dict, List, NamedTuple, Tuple
+from enum import Enum
+
+try:
+    from .frame_headers import (
+        HeaderType, HeaderConfig,
+        BASIC_START_BYTE, PAYLOAD_TYPE_BASE,
+        HEADER_NONE_CONFIG, HEADER_TINY_CONFIG, HEADER_BASIC_CONFIG
+    )
+    from .payload_types import (
+        PayloadType, PayloadConfig,
+        PAYLOAD_MINIMAL_CONFIG, PAYLOAD_DEFAULT_CONFIG, PAYLOAD_EXTENDED_CONFIG,
+        PAYLOAD_EXTENDED_MULTI_SYSTEM_STREAM_CONFIG
+    )
+    from .frame_base import fletcher_checksum, fletcher_checksum_ext, FrameMsgInfo, FrameMsgStatus, FrameChecksum, ParserState, ParserDiagnostics
+except ImportError:
+    from frame_headers import (
+        HeaderType, HeaderConfig,
+        BASIC_START_BYTE, PAYLOAD_TYPE_BASE,
+        HEADER_NONE_CONFIG, HEADER_TINY_CONFIG, HEADER_BASIC_CONFIG
+    )
+    from payload_types import (
+        PayloadType, PayloadConfig,
+        PAYLOAD_MINIMAL_CONFIG, PAYLOAD_DEFAULT_CONFIG, PAYLOAD_EXTENDED_CONFIG,
+        PAYLOAD_EXTENDED_MULTI_SYSTEM_STREAM_CONFIG
+    )
+    from frame_base import fletcher_checksum, fletcher_checksum_ext, FrameMsgInfo, FrameMsgStatus, FrameChecksum, ParserState, ParserDiagnostics
+
+
+# =============================================================================
+# MessageInfo - Unified message information type
+# =============================================================================
+
+class MessageInfo(NamedTuple):
+    """
+    Unified message information for parsing.
+    
+    This type combines message size and magic numbers into a single lookup result,
+    simplifying the parser API by requiring only one callback instead of two.
+    
+    Attributes:
+        size: Message payload size in bytes
+        magic1: First magic number for CRC calculation
+        magic2: Second magic number for CRC calculation
+        base_size: Non-extension portion size (== size when no extensions)
+    """
+    size: int
+    magic1: int = 0
+    magic2: int = 0
+    base_size: int = 0
+
+
+# Header predicate used to skip frames before CRC/payload work:
+# (msg_id, package_id, sequence, system_id, component_id) -> keep?
+HeaderFilter = Callable[[int, int, int, int, int], bool]
+
+
+# =============================================================================
+# Profile Configuration - Composed from Header + Payload configs
+# =============================================================================
+
+@dataclass
+class ProfileConfig:
+    """
+    Profile configuration - combines a HeaderConfig with a PayloadConfig.
+    
+    This mirrors the C++ ProfileConfig template, providing composed configurations
+    for maximum code reuse.
+    
+    Usage:
+        config = ProfileConfig(HEADER_BASIC_CONFIG, PAYLOAD_DEFAULT_CONFIG)
+    """
+    header: HeaderConfig
+    payload: PayloadConfig
+    name: str = ""
+    
+    def __post_init__(self):
+        """Generate name if not provided"""
+        if not self.name:
+            self.name = f"{self.header.name}{self.payload.name}"
+    
+    # Header properties
+    @property
+    def num_start_bytes(self) -> int:
+        return self.header.num_start_bytes
+    
+    @property
+    def header_type(self) -> HeaderType:
+        return self.header.header_type
+    
+    # Payload properties
+    @property
+    def payload_type(self) -> PayloadType:
+        return self.payload.payload_type
+    
+    @property
+    def has_length(self) -> bool:
+        return self.payload.has_length
+    
+    @property
+    def length_bytes(self) -> int:
+        return self.payload.length_bytes
+    
+    @property
+    def has_crc(self) -> bool:
+        return self.payload.has_crc
+    
+    @property
+    def has_package_id(self) -> bool:
+        return self.payload.has_package_id
+    
+    @property
+    def has_sequence(self) -> bool:
+        return self.payload.has_sequence
+    
+    @property
+    def has_system_id(self) -> bool:
+        return self.payload.has_system_id
+    
+    @property
+    def has_component_id(self) -> bool:
+        return self.payload.has_component_id
+    
+    # Combined sizes
+    @property
+    def header_size(self) -> int:
+        """Total header size (start bytes + payload header fields)"""
+        return self.header.num_start_bytes + self.payload.header_size
+    
+    @property
+    def footer_size(self) -> int:
+        """Footer size (CRC bytes)"""
+        return self.payload.footer_size
+    
+    @property
+    def overhead(self) -> int:
+        """Total overhead (header + footer)"""
+        return self.header_size + self.footer_size
+    
+    @property
+    def max_payload(self) -> Optional[int]:
+        """Maximum payload size, or None if no length field"""
+        if not self.has_length:
+            return None
+        return 65535 if self.length_bytes == 2 else 255
+    
+    def computed_start_byte1(self) -> int:
+        """
+        Compute start byte1 dynamically for headers that encode payload type.
+        For Tiny header: 0x70 + payload_type
+        """
+        if self.header.encodes_payload_type and self.header.num_start_bytes == 1:
+            return PAYLOAD_TYPE_BASE + self.payload.payload_type.value
+        return self.header.start_bytes[0] if self.header.start_bytes else 0
+    
+    def computed_start_byte2(self) -> int:
+        """
+        Compute start byte2 dynamically for headers that encode payload type.
+        For Basic header: start_byte1 is fixed (0x90), start_byte2 = 0x70 + payload_type
+        """
+        if self.header.encodes_payload_type and self.header.num_start_bytes == 2:
+            return PAYLOAD_TYPE_BASE + self.payload.payload_type.value
+        return self.header.start_bytes[1] if len(self.header.start_bytes) > 1 else 0
+    
+    # Convenience properties for backwards compatibility
+    @property
+    def start_byte1(self) -> int:
+        return self.computed_start_byte1()
+    
+    @property
+    def start_byte2(self) -> int:
+        return self.computed_start_byte2()
+
+
+# =============================================================================
+# Standard Profile Configurations
+# =============================================================================
+
+# Profile Standard: Basic + Default
+# Frame: [0x90] [0x71] [LEN] [MSG_ID] [PAYLOAD] [CRC1] [CRC2]
+PROFILE_STANDARD_CONFIG = ProfileConfig(
+    header=HEADER_BASIC_CONFIG,
+    payload=PAYLOAD_DEFAULT_CONFIG,
+    name="ProfileStandard"
+)
+
+# Profile Sensor: Tiny + Minimal
+# Frame: [0x70] [MSG_ID] [PAYLOAD]
+PROFILE_SENSOR_CONFIG = ProfileConfig(
+    header=HEADER_TINY_CONFIG,
+    payload=PAYLOAD_MINIMAL_CONFIG,
+    name="ProfileSensor"
+)
+
+# Profile IPC: None + Minimal
+# Frame: [MSG_ID] [PAYLOAD]
+PROFILE_IPC_CONFIG = ProfileConfig(
+    header=HEADER_NONE_CONFIG,
+    payload=PAYLOAD_MINIMAL_CONFIG,
+    name="ProfileIPC"
+)
+
+# Profile Bulk: Basic + Extended
+# Frame: [0x90] [0x74] [LEN_LO] [LEN_HI] [PKG_ID] [MSG_ID] [PAYLOAD] [CRC1] [CRC2]
+PROFILE_BULK_CONFIG = ProfileConfig(
+    header=HEADER_BASIC_CONFIG,
+    payload=PAYLOAD_EXTENDED_CONFIG,
+    name="ProfileBulk"
+)
+
+# Profile Network: Basic + ExtendedMultiSystemStream
+# Frame: [0x90] [0x78] [SEQ] [SYS_ID] [COMP_ID] [LEN_LO] [LEN_HI] [PKG_ID] [MSG_ID] [PAYLOAD] [CRC1] [CRC2]
+PROFILE_NETWORK_CONFIG = ProfileConfig(
+    header=HEADER_BASIC_CONFIG,
+    payload=PAYLOAD_EXTENDED_MULTI_SYSTEM_STREAM_CONFIG,
+    name="ProfileNetwork"
+)
+
+
+# =============================================================================
+# Generic Frame Encoder/Parser Functions
+# =============================================================================
+
+def encode_message(
+    config: ProfileConfig,
+    msg,
+    seq: int = 0,
+    sys_id: int = 0,
+    comp_id: int = 0
+) -> bytes:
+    """
+    Encode a message object.
+    
+    Automatically extracts msg_id, payload, and magic numbers from the message object.
+    
+    Args:
+        config: Profile configuration
+        msg: Message object with MSG_ID/msg_id, data()/pack() methods, and MAGIC1/MAGIC2 attributes
+        seq: Sequence number (for profiles with sequence)
+        sys_id: System ID (for profiles with routing)
+        comp_id: Component ID (for profiles with routing)
+    
+    Returns:
+        Encoded frame as bytes
+    """
+    if config.has_crc or config.has_length:
+        return _frame_format_encode_with_crc(config, msg, seq, sys_id, comp_id)
+    else:
+        return _frame_format_encode_minimal(config, msg)
+
+
+def _frame_format_encode_with_crc(
+    config: ProfileConfig,
+    msg,
+    seq: int = 0,
+    sys_id: int = 0,
+    comp_id: int = 0
+) -> bytes:
+    """
+    Generic encode function for frames with CRC.
+    
+    Args:
+        config: Profile configuration
+        msg: Message object with MSG_ID/msg_id, data()/pack() methods, and MAGIC1/MAGIC2 attributes
+        seq: Sequence number (for profiles with sequence)
+        sys_id: System ID (for profiles with routing)
+        comp_id: Component ID (for profiles with routing)
+    
+    Returns:
+        Encoded frame as bytes
+    """
+    msg_id = _encode_msg_id(msg)
+    payload = _encode_payload(config, msg)
+    output, crc_start = _encode_header(config, msg_id, payload, seq, sys_id, comp_id)
+    if config.has_crc:
+        _encode_crc(config, msg, output, crc_start, len(payload))
+    return bytes(output)
+
+
+def _frame_format_encode_minimal(
+    config: ProfileConfig,
+    msg
+) -> bytes:
+    """
+    Generic encode function for minimal frames (no length, no CRC).
+    
+    NOTE: Minimal profiles do NOT support variable-length encoding!
+    Variable messages are always encoded at MAX_SIZE for minimal profiles
+    because the parser has no length field and cannot determine message boundaries.
+    
+    Args:
+        config: Profile configuration
+        msg: Message object with MSG_ID/msg_id and data()/pack() methods
+    
+    Returns:
+        Encoded frame as bytes
+    """
+    msg_id = _encode_msg_id(msg)
+    payload = _encode_payload(config, msg)
+    output, _ = _encode_header(config, msg_id, payload)
+    return bytes(output)
+
+
+# Encode and parse phases. The _frame_format_* functions above and below are
+# built from these, and frame_profiler.py times the same helpers, so a change
+# here applies to both the plain and the profiled path.
+
+def _encode_msg_id(msg) -> int:
+    """Message ID of *msg* (MSG_ID or msg_id attribute)."""
+    msg_id = getattr(msg, 'MSG_ID', None) or getattr(msg, 'msg_id', None)
+    if msg_id is None:
+        raise ValueError("Message object must have MSG_ID or msg_id attribute")
+    return msg_id
+
+
+def _encode_payload(config: ProfileConfig, msg) -> bytes:
+    """
+    Serialize *msg* for *config*.
+
+    Profiles without a payload length field (minimal, ProfileSensor/ProfileIPC)
+    cannot mark where a variable message ends, so variable messages are
+    serialized at MAX_SIZE there. Everything else uses serialize(), which is
+    the variable encoding for variable messages and MAX_SIZE otherwise.
+    """
+    if (not config.payload.has_length and getattr(msg, 'IS_VARIABLE', False)
+            and callable(getattr(msg, 'serialize_max_size', None))):
+        return msg.serialize_max_size()
+    if callable(getattr(msg, 'serialize', None)):
+        return msg.serialize()
+    raise ValueError("Message object must have serialize() method")
+
+
+def _encode_header(config: ProfileConfig, msg_id: int, payload: bytes,
+                   seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> Tuple[bytearray, int]:
+    """
+    Start bytes, header fields and payload of a frame.
+
+    Returns the frame so far and the offset where the CRC starts (after the
+    start bytes).
+    """
+    output = bytearray()
+
+    # Write start bytes (use computed values for dynamic payload type encoding)
+    if config.num_start_bytes >= 1:
+        output.append(config.computed_start_byte1())
+    if config.num_start_bytes >= 2:
+        output.append(config.computed_start_byte2())
+    crc_start = len(output)
+
+    if not (config.has_crc or config.has_length):
+        # Minimal frame: message ID and payload only
+        output.append(msg_id & 0xFF)
+        output.extend(payload)
+        return output, crc_start
+
+    payload_size = len(payload)
+    if config.max_payload is not None and payload_size > config.max_payload:
+        raise ValueError(f"Payload size {payload_size} exceeds maximum {config.max_payload}")
+    
+    # Write optional fields before length
+    if config.has_sequence:
+        output.append(seq & 0xFF)
+    if config.has_system_id:
+        output.append(sys_id & 0xFF)
+    if config.has_component_id:
+        output.append(comp_id & 0xFF)
+    
+    # Write length field
+    if config.has_length:
+        if config.length_bytes == 1:
+            output.append(payload_size & 0xFF)
+        else:
+            output.append(payload_size & 0xFF)
+            output.append((payload_size >> 8) & 0xFF)
+    
+    # Write package ID and message ID
+    if config.has_package_id:
+        # Extract package ID from upper 8 bits and message ID from lower 8 bits
+        output.append((msg_id >> 8) & 0xFF)
+        output.append(msg_id & 0xFF)
+    else:
+        # Write message ID only
+        output.append(msg_id & 0xFF)
+    
+    # Write payload
+    output.extend(payload)
+    return output, crc_start
+
+
+def _encode_crc(config: ProfileConfig, msg, output: bytearray, crc_start: int, payload_size: int) -> None:
+    """Append the (extension-aware) Fletcher checksum of *output* from *crc_start*."""
+    msg_class = type(msg)
+    magic1 = getattr(msg_class, 'MAGIC1', 0)
+    magic2 = getattr(msg_class, 'MAGIC2', 0)
+    base_size = getattr(msg_class, 'BASE_SIZE', payload_size)
+    crc_end = len(output)
+    crc_len = crc_end - crc_start
+    if config.has_length and base_size < payload_size:
+        base_end = crc_start + (crc_len - payload_size) + base_size
+        crc = fletcher_checksum_ext(output, crc_start, base_end, crc_end, init1=magic1, init2=magic2)
+    else:
+        crc = fletcher_checksum(output, crc_start, init1=magic1, init2=magic2)
+    output.append(crc.byte1)
+    output.append(crc.byte2)
+
+
+def _parse_header(config: ProfileConfig, buffer, result: FrameMsgInfo,
+                  header_filter: Optional[HeaderFilter] = None) -> int:
+    """
+    Header phase of _frame_format_parse_with_crc.
+
+    Fills the header fields of *result* and returns the offset where the CRC
+    starts. Returns -1 when the frame ends here: *result.status* is then
+    WAITING_FOR_START, COLLECTING or FILTERED.
+    """
+    length = len(buffer)
+
+    if length < config.overhead:
+        # Not enough bytes yet to even hold the header+footer
+        result.status = FrameMsgStatus.COLLECTING
+        return -1
+
+    idx = 0
+
+    # Verify start bytes. A mismatch means this position is not a frame start,
+    # so report WAITING_FOR_START to let buffer readers scan forward for a start byte.
+    if config.num_start_bytes >= 1:
+        if buffer[idx] != config.computed_start_byte1():
+            result.status = FrameMsgStatus.WAITING_FOR_START
+            return -1
+        idx += 1
+    if config.num_start_bytes >= 2:
+        if buffer[idx] != config.computed_start_byte2():
+            result.status = FrameMsgStatus.WAITING_FOR_START
+            return -1
+        idx += 1
+
+    crc_start = idx
+    
+    # Read optional fields before length
+    seq = 0
+    sys_id = 0
+    comp_id = 0
+    if config.has_sequence:
+        seq = buffer[idx]
+        idx += 1
+    if config.has_system_id:
+        sys_id = buffer[idx]
+        idx += 1
+    if config.has_component_id:
+        comp_id = buffer[idx]
+        idx += 1
+    
+    # Read length field
+    msg_len = 0
+    if config.has_length:
+        if config.length_bytes == 1:
+            msg_len = buffer[idx]
+            idx += 1
+        else:
+            msg_len = buffer[idx] | (buffer[idx + 1] << 8)
+            idx += 2
+    
+    # Read package ID and message ID
+    pkg_id = 0
+    if config.has_package_id:
+        # Combine package ID and message ID into 16-bit msg_id (pkg_id << 8 | msg_id)
+        pkg_id = buffer[idx]
+        msg_id = (pkg_id << 8) | buffer[idx + 1]
+    else:
+        # Read message ID only
+        msg_id = buffer[idx]
+    
+    # Verify total size
+    total_size = config.overhead + msg_len
+    if length < total_size:
+        # Header parsed but payload/footer not fully received yet
+        result.status = FrameMsgStatus.COLLECTING
+        return -1
+
+    result.msg_id = msg_id
+    result.msg_len = msg_len
+    result.frame_size = total_size
+    result.package_id = pkg_id
+    result.sequence = seq
+    result.system_id = sys_id
+    result.component_id = comp_id
+
+    # The whole frame is buffered, so skipping it by total_size keeps sync exactly
+    # as a CRC failure would.
+    if header_filter is not None and not header_filter(msg_id, pkg_id, seq, sys_id, comp_id):
+        result.status = FrameMsgStatus.FILTERED
+        return -1
+    return crc_start
+
+
+def _parse_magic(get_message_info: Optional[Callable[[int], Optional[MessageInfo]]],
+                 msg_id: int, msg_len: int) -> Tuple[int, int, int]:
+    """Magic numbers and base size of *msg_id* for the CRC check (0, 0, msg_len if unknown)."""
+    if get_message_info:
+        msg_info = get_message_info(msg_id)
+        if msg_info:
+            return msg_info.magic1, msg_info.magic2, getattr(msg_info, 'base_size', msg_len)
+    return 0, 0, msg_len
+
+
+def _parse_crc(config: ProfileConfig, buffer, crc_start: int, result: FrameMsgInfo,
+               magic1: int, magic2: int, base_size: int) -> bool:
+    """
+    Verify the (extension-aware) CRC of the frame described by *result*.
+
+    On a mismatch, sets CRC_FAILURE and returns False. The frame size stays
+    in *result*, so buffer and stream readers can skip exactly this frame
+    and resync instead of stalling on it forever.
+    """
+    msg_len = result.msg_len
+    total_size = result.frame_size
+    crc_len = total_size - crc_start - config.footer_size
+    if config.has_length and base_size < msg_len:
+        base_end = crc_start + (crc_len - msg_len) + base_size
+        calc_crc = fletcher_checksum_ext(buffer, crc_start, base_end, crc_start + crc_len,
+                                         init1=magic1, init2=magic2)
+    else:
+        calc_crc = fletcher_checksum(buffer, crc_start, crc_start + crc_len, init1=magic1, init2=magic2)
+    if calc_crc.byte1 != buffer[total_size - 2] or calc_crc.byte2 != buffer[total_size - 1]:
+        result.status = FrameMsgStatus.CRC_FAILURE
+        return False
+    return True
+
+
+def _parse_minimal_header(config: ProfileConfig, buffer) -> int:
+    """Header phase of _frame_format_parse_minimal: the message ID, or -1 if there is no frame start."""
+    if len(buffer) < config.header_size:
+        return -1
+    idx = 0
+    if config.num_start_bytes >= 1:
+        if buffer[idx] != config.computed_start_byte1():
+            return -1
+        idx += 1
+    if config.num_start_bytes >= 2:
+        if buffer[idx] != config.computed_start_byte2():
+            return -1
+        idx += 1
+    return buffer[idx]
+
+
+def _parse_minimal_frame(config: ProfileConfig, buffer, msg_id: int, msg_info: Optional[MessageInfo],
+                         result: FrameMsgInfo, header_filter: Optional[HeaderFilter] = None) -> bool:
+    """
+    Size and filter checks of _frame_format_parse_minimal.
+
+    Fills *result* and returns True when the payload is complete and should
+    be copied. Unknown IDs and incomplete frames leave *result* empty.
+    """
+    if msg_info is None:
+        return False
+    msg_len = msg_info.size
+    total_size = config.header_size + msg_len
+    if len(buffer) < total_size:
+        return False
+    result.msg_id = msg_id
+    result.msg_len = msg_len
+    result.frame_size = total_size
+    if header_filter is not None and not header_filter(msg_id, 0, 0, 0, 0):
+        result.status = FrameMsgStatus.FILTERED
+        return False
+    return True
+
+
+def _frame_format_parse_with_crc(
+    config: ProfileConfig,
+    buffer: bytes,
+    get_message_info: Callable[[int], Optional[MessageInfo]] = None,
+    header_filter: Optional[HeaderFilter] = None
+) -> FrameMsgInfo:
+    """
+    Generic parse function for frames with CRC.
+    
+    Args:
+        config: Profile configuration
+        buffer: Buffer containing the complete frame
+        get_message_info: Optional function to get message info (size, magic1, magic2) for a message ID
+        header_filter: Optional predicate on the header fields; a complete frame it
+            rejects is returned as FILTERED before any CRC or payload work
+    
+    Returns:
+        FrameMsgInfo with valid=True if frame is valid
+    """
+    result = FrameMsgInfo()
+    crc_start = _parse_header(config, buffer, result, header_filter)
+    if crc_start < 0:
+        return result
+    if config.has_crc:
+        magic1, magic2, base_size = _parse_magic(get_message_info, result.msg_id, result.msg_len)
+        if not _parse_crc(config, buffer, crc_start, result, magic1, magic2, base_size):
+            return result
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
+    result.valid = True
+    return result
+
+
+def _frame_format_parse_minimal(
+    config: ProfileConfig,
+    buffer: bytes,
+    get_message_info: Callable[[int], Optional[MessageInfo]],
+    header_filter: Optional[HeaderFilter] = None
+) -> FrameMsgInfo:
+    """
+    Generic parse function for minimal frames (requires get_message_info callback for size).
+    
+    Args:
+        config: Profile configuration
+        buffer: Buffer containing the complete frame
+        get_message_info: Callback to get message info (size field used) for a msg_id
+        header_filter: Optional header predicate (only msg_id is meaningful here)
+    
+    Returns:
+        FrameMsgInfo with valid=True if frame is valid
+    """
+    result = FrameMsgInfo()
+    msg_id = _parse_minimal_header(config, buffer)
+    if msg_id < 0:
+        return result
+    if not _parse_minimal_frame(config, buffer, msg_id, get_message_info(msg_id), result, header_filter):
+        return result
+    result.msg_data = bytes(buffer[config.header_size:config.header_size + result.msg_len])
+    result.valid = True
+    return result
+
+
+# =============================================================================
+# Generic Encoder/Parser Functions
+# =============================================================================
+
+def encode_frame(
+    config: ProfileConfig,
+    msg,
+    seq: int = 0,
+    sys_id: int = 0,
+    comp_id: int = 0
+) -> bytes:
+    """
+    Generic encode function that works with any ProfileConfig.
+    
+    Args:
+        config: Profile configuration
+        msg: Message object with MSG_ID/msg_id, data()/pack() methods, and MAGIC1/MAGIC2 attributes
+        seq: Sequence number (for profiles with sequence)
+        sys_id: System ID (for profiles with routing)
+        comp_id: Component ID (for profiles with routing)
+    
+    Returns:
+        Encoded frame as bytes
+    """
+    if config.has_crc or config.has_length:
+        return _frame_format_encode_with_crc(
+            config, msg,
+            seq=seq, sys_id=sys_id, comp_id=comp_id
+        )
+    else:
+        return _frame_format_encode_minimal(config, msg)
+
+
+def parse_frame_buffer(
+    config: ProfileConfig,
+    buffer: bytes,
+    get_message_info: Callable[[int], Optional[MessageInfo]] = None
+) -> FrameMsgInfo:
+    """
+    Generic parse function that works with any ProfileConfig.
+    
+    Args:
+        config: Profile configuration
+        buffer: Buffer containing the complete frame
+        get_message_info: Callback to get message info (required for minimal frames, optional for CRC frames)
+    
+    Returns:
+        FrameMsgInfo with valid=True if frame is valid
+    """
+    if config.has_crc or config.has_length:
+        return _frame_format_parse_with_crc(config, buffer, get_message_info)
+    else:
+        if get_message_info is None:
+            raise ValueError("get_message_info callback required for minimal frames")
+        return _frame_format_parse_minimal(config, buffer, get_message_info)
+
+
+def create_custom_config(
+    header: HeaderConfig,
+    payload: PayloadConfig,
+    name: str = ""
+) -> ProfileConfig:
+    """
+    Create a custom profile configuration from header and payload configs.
+    
+    This allows creating any header+payload combination for specialized use cases.
+    
+    Args:
+        header: Header configuration
+        payload: Payload configuration
+        name: Optional name for the configuration
+    
+    Returns:
+        ProfileConfig instance
+    """
+    return ProfileConfig(header=header, payload=payload, name=name)
+
+
+# =============================================================================
+# BufferReader - Iterate through multiple frames in a buffer
+# =============================================================================
+
+def _byte_finder(view: memoryview, byte: int) -> Callable[[int, int], int]:
+    """
+    ``find(start, end)`` for *byte* in *view*, returning an offset or -1.
+
+    Uses the underlying object's own find() (bytes, bytearray, mmap) when the
+    view covers all of it. Otherwise it runs a regex search, which reads the
+    view in place: memoryview has no find(), and copying the view to search
+    it would cost the whole rest of the buffer on every call.
+    """
+    needle = bytes([byte])
+    obj = view.obj
+    if hasattr(obj, 'find') and len(obj) == view.nbytes:
+        obj_find = obj.find
+        return lambda start, end: obj_find(needle, start, end)
+    search = re.compile(re.escape(needle)).search
+
+    def find(start: int, end: int) -> int:
+        match = search(view, start, end)
+        return match.start() if match else -1
+    return find
+
+
+class BufferReader:
+    """
+    BufferReader - Iterate through a buffer parsing multiple frames.
+    
+    Usage:
+        reader = BufferReader(PROFILE_STANDARD_CONFIG, buffer)
+        while True:
+            result = reader.next()
+            if not result.valid:
+                break
+            # Process result.msg_id, result.msg_data, result.msg_len
+    
+    For minimal profiles that need get_message_info:
+        reader = BufferReader(PROFILE_SENSOR_CONFIG, buffer, get_message_info)
+    
+    For profiles with CRC that need magic numbers:
+        reader = BufferReader(PROFILE_STANDARD_CONFIG, buffer, get_message_info=get_message_info)
+    """
+    
+    def __init__(self, config: ProfileConfig, buffer: bytes, 
+                 get_message_info: Callable[[int], Optional[MessageInfo]] = None):
+        """
+        Initialize buffer reader.
+        
+        Args:
+            config: Profile configuration
+            buffer: Buffer containing one or more frames
+            get_message_info: Callback to get message info (size, magic1, magic2) for a message ID
+        """
+        self._config = config
+        self._buffer = buffer
+        # Frames are parsed through a view so each next() does not copy the
+        # rest of the buffer (bytes/mmap slicing copies).
+        self._view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        if self._view.format != 'B':
+            self._view = self._view.cast('B')
+        self._size = len(self._view)
+        self._offset = 0
+        self._get_message_info = get_message_info
+        self._find_start = None
+    
+    def next(self) -> FrameMsgInfo:
+        """
+        Parse the next frame in the buffer.
+        
+        Returns:
+            FrameMsgInfo with valid=True if successful, valid=False if no more frames.
+        """
+        if self._offset >= self._size:
+            return FrameMsgInfo()
+        
+        remaining = self._view[self._offset:]
+        
+        if self._config.has_crc or self._config.has_length:
+            result = _frame_format_parse_with_crc(self._config, remaining, self._get_message_info)
+        else:
+            if self._get_message_info is None:
+                self._offset = self._size
+                return FrameMsgInfo()
+            result = _frame_format_parse_minimal(self._config, remaining, self._get_message_info)
+        
+        if result.frame_size > 0:
+            # Advance past complete frames (valid, or CRC-failed but structurally known)
+            self._offset += result.frame_size
+        elif result.status == FrameMsgStatus.WAITING_FOR_START and self._config.num_start_bytes >= 1:
+            # Head byte is not a frame start — scan forward to the next start byte,
+            # reporting SyncRecovery so try_next() keeps advancing.
+            old_offset = self._offset
+            if self._find_start is None:
+                self._find_start = _byte_finder(self._view, self._config.computed_start_byte1())
+            nxt = self._find_start(self._offset + 1, self._size)
+            self._offset = nxt if nxt != -1 else self._size
+            result.status = FrameMsgStatus.SYNC_RECOVERY
+            result.frame_size = self._offset - old_offset
+        else:
+            # Incomplete/garbage with no recoverable start — consume the rest
+            self._offset = self._size
+
+        return result
+
+    def reset(self):
+        """Reset the reader to the beginning of the buffer."""
+        self._offset = 0
+    
+    @property
+    def offset(self) -> int:
+        """Get the current offset in the buffer."""
+        return self._offset
+    
+    @property
+    def remaining(self) -> int:
+        """Get the remaining bytes in the buffer."""
+        return max(0, self._size - self._offset)
+    
+    def has_more(self) -> bool:
+        """Check if there are more bytes to parse."""
+        return self._offset < self._size
+
+    def try_next(self) -> Optional['FrameMsgInfo']:
+        """Try to parse the next frame. Returns the result if forward progress was made
+        (valid frame, CRC-failed frame, or resync bytes skipped), or None when the buffer
+        is drained or only a trailing partial frame remains.
+
+        Canonical drain loop::
+
+            while (result := reader.try_next()) is not None:
+                if result.valid: handle(result)  # else CrcFailure or SyncRecovery
+        """
+        result = self.next()
+        return result if (result.valid or result.frame_size > 0) else None
+
+
+# =============================================================================
+# BufferWriter - Encode multiple frames with automatic offset tracking
+# =============================================================================
+
+class BufferWriter:
+    """
+    BufferWriter - Encode multiple frames into a buffer with automatic offset tracking.
+    
+    Usage:
+        writer = BufferWriter(PROFILE_STANDARD_CONFIG, 1024)
+        writer.write(0x01, msg1_payload)
+        writer.write(0x02, msg2_payload)
+        encoded_data = writer.data()
+        total_bytes = writer.size()
+    
+    For profiles with extra header fields:
+        writer = BufferWriter(PROFILE_NETWORK_CONFIG, 1024)
+        writer.write(0x01, payload, seq=1, sys_id=1, comp_id=1)
+    """
+    
+    def __init__(self, config: ProfileConfig, capacity: int = 1024):
+        """
+        Initialize buffer writer.
+        
+        Args:
+            config: Profile configuration
+            capacity: Maximum buffer capacity in bytes
+        """
+        self._config = config
+        self._capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._offset = 0
+    
+    def write(self, msg, seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> int:
+        """
+        Write a message object to the buffer.
+        
+        The message object must have MSG_ID (or msg_id) and data() (or pack()) methods.
+        Magic numbers for checksum are automatically extracted from the message class
+        if MAGIC1/MAGIC2 class attributes are present.
+        
+        Args:
+            msg: Message object with MSG_ID/msg_id and data()/pack() attributes
+            seq: Sequence number (for profiles with sequence)
+            sys_id: System ID (for profiles with routing)
+            comp_id: Component ID (for profiles with routing)
+        
+        Returns:
+            Number of bytes written, or 0 on failure.
+        """
+        encoded = encode_message(self._config, msg, seq=seq, sys_id=sys_id, comp_id=comp_id)
+        
+        written = len(encoded)
+        if self._offset + written > self._capacity:
+            return 0
+        
+        self._buffer[self._offset:self._offset + written] = encoded
+        self._offset += written
+        return written
+    
+    def reset(self):
+        """Reset the writer to the beginning of the buffer."""
+        self._offset = 0
+    
+    def size(self) -> int:
+        """Get the total number of bytes written."""
+        return self._offset
+    
+    @property
+    def remaining(self) -> int:
+        """Get the remaining capacity in the buffer."""
+        return max(0, self._capacity - self._offset)
+    
+    def data(self) -> bytes:
+        """Get the written data as bytes."""
+        return bytes(self._buffer[:self._offset])
+
+
+# =============================================================================
+# AccumulatingReader - Unified parser for buffer and byte-by-byte streaming
+# =============================================================================
+
+class AccumulatingReaderState(Enum):
+    """Parser state for streaming mode"""
+    IDLE = 0
+    LOOKING_FOR_START1 = 1
+    LOOKING_FOR_START2 = 2
+    COLLECTING_HEADER = 3
+    COLLECTING_PAYLOAD = 4
+    BUFFER_MODE = 5
+
+
+class AccumulatingReader:
+    """
+    AccumulatingReader - Unified parser for buffer and byte-by-byte streaming input.
+    
+    Handles partial messages across buffer boundaries and supports both:
+    - Buffer mode: add_data() for processing chunks of data
+    - Stream mode: push_byte() for byte-by-byte processing (e.g., UART)
+    
+    Buffer mode usage:
+        reader = AccumulatingReader(PROFILE_STANDARD_CONFIG)
+        reader.add_data(chunk1)
+        while True:
+            result = reader.next()
+            if not result.valid:
+                break
+            # Process complete messages
+    
+    Stream mode usage:
+        reader = AccumulatingReader(PROFILE_STANDARD_CONFIG)
+        while receiving:
+            byte = read_byte()
+            result = reader.push_byte(byte)
+            if result.valid:
+                # Process complete message
+    
+    For minimal profiles:
+        reader = AccumulatingReader(PROFILE_SENSOR_CONFIG, get_message_info=get_message_info)
+    
+    For profiles with CRC that need magic numbers:
+        reader = AccumulatingReader(PROFILE_STANDARD_CONFIG, get_message_info=get_message_info)
+    """
+    
+    def __init__(self, config: ProfileConfig, 
+                 get_message_info: Callable[[int], Optional[MessageInfo]] = None,
+                 buffer_size: int = 1024,
+                 header_filter: Optional[HeaderFilter] = None):
+        """
+        Initialize accumulating reader.
+        
+        Args:
+            config: Profile configuration
+            get_message_info: Callback to get message info (size, magic1, magic2) for a message ID
+            buffer_size: Size of internal buffer for partial messages (default: 1024)
+            header_filter: Optional predicate on header fields (see set_header_filter)
+        """
+        self._config = config
+        self._get_message_info = get_message_info
+        self._header_filter = header_filter
+        self.cnt_filtered = 0
+        self._buffer_size = buffer_size
+        
+        # Internal buffer for partial messages. Never resized, so a persistent
+        # view can be handed to the parser without copying it out first.
+        self._internal_buffer = bytearray(buffer_size)
+        self._internal_view = memoryview(self._internal_buffer)
+        self._internal_data_len = 0
+        # Bytes appended to the internal buffer from the CURRENT add_data() call.
+        # Used to compute how many of the current buffer's bytes a completed frame
+        # consumed (partial_len = internal_data_len - bytes_appended_to_internal).
+        self._bytes_appended_to_internal = 0
+        self._expected_frame_size = 0
+        self._state = AccumulatingReaderState.IDLE
+        
+        # Buffer mode state
+        self._current_buffer: Optional[bytes] = None
+        self._current_size = 0
+        self._current_offset = 0
+        self._find_start: Optional[Callable[[int, int], int]] = None
+        
+        # Diagnostic counters (stream mode)
+        self._diag = ParserDiagnostics()
+        self._last_seq: Optional[int] = None  # last seen sequence number
+    
+    # =========================================================================
+    # Buffer Mode API
+    # =========================================================================
+    
+    def add_data(self, buffer: bytes):
+        """
+        Add a new buffer of data to process.
+        
+        If there was a partial message from the previous buffer, data is appended
+        to the internal buffer to complete it.
+        
+        Note: Do not mix add_data() with push_byte() on the same reader instance.
+
+        ``buffer`` may be ``bytes``, ``bytearray`` or a ``memoryview`` (for
+        example a transport's receive buffer). Complete frames are parsed in
+        place and only their payload is copied out; a trailing partial frame is
+        copied once into the internal buffer. A borrowed view must therefore be
+        drained with next()/try_next() before its owner reuses the memory.
+        
+        Args:
+            buffer: New data to process
+        """
+        if type(buffer) is bytes:
+            # Immutable, so a view is safe to keep and makes per-frame slicing free.
+            buffer = memoryview(buffer)
+        elif isinstance(buffer, memoryview) and buffer.format != 'B':
+            buffer = buffer.cast('B')
+        self._current_buffer = buffer
+        self._current_size = len(buffer)
+        self._current_offset = 0
+        self._find_start = None
+        self._state = AccumulatingReaderState.BUFFER_MODE
+        
+        # If we have partial data in internal buffer, try to complete it
+        self._bytes_appended_to_internal = 0
+        if self._internal_data_len > 0:
+            space_available = self._buffer_size - self._internal_data_len
+            bytes_to_copy = min(len(buffer), space_available)
+            self._internal_buffer[self._internal_data_len:self._internal_data_len + bytes_to_copy] = buffer[:bytes_to_copy]
+            self._internal_data_len += bytes_to_copy
+            self._bytes_appended_to_internal = bytes_to_copy
+    
+    def next(self) -> FrameMsgInfo:
+        """
+        Parse the next frame (buffer mode).
+        
+        Returns:
+            FrameMsgInfo with valid=True if successful, valid=False if no more complete frames.
+        """
+        if self._state != AccumulatingReaderState.BUFFER_MODE:
+            return self._with_diag(FrameMsgInfo())
+        
+        # First, try to complete a partial message from the internal buffer
+        if self._internal_data_len > 0 and self._current_offset == 0:
+            result = self._parse_buffer(self._internal_view[:self._internal_data_len])
+            # Bytes already in the internal buffer before this add_data() appended to it
+            partial_len = self._internal_data_len - self._bytes_appended_to_internal
+
+            if result.valid:
+                # How many bytes from the current buffer were consumed to complete the frame
+                bytes_from_current = result.frame_size - partial_len if result.frame_size > partial_len else 0
+                self._current_offset = bytes_from_current
+                self._internal_data_len = 0
+                self._bytes_appended_to_internal = 0
+                self._expected_frame_size = 0
+                return result
+
+            if result.status is FrameMsgStatus.FILTERED:
+                self.cnt_filtered += 1
+                bytes_from_current = result.frame_size - partial_len if result.frame_size > partial_len else 0
+                self._current_offset = bytes_from_current
+                self._internal_data_len = 0
+                self._bytes_appended_to_internal = 0
+                self._expected_frame_size = 0
+                return result
+
+            if result.frame_size > 0:
+                # Complete but invalid frame (CRC failure) — count it, skip it, resync
+                if self._config.has_crc:
+                    self._diag.cnt_crc_failures += 1
+                self._diag.cnt_failed_bytes += result.frame_size
+                self._diag.cnt_sync_recoveries += 1
+                bytes_from_current = result.frame_size - partial_len if result.frame_size > partial_len else 0
+                self._current_offset = bytes_from_current
+                self._internal_data_len = 0
+                self._bytes_appended_to_internal = 0
+                self._expected_frame_size = 0
+                return self._with_diag(result)
+
+            # Still not enough data for a complete message — wait for next add_data()
+            return self._with_diag(FrameMsgInfo())
+
+        # Parse from current buffer
+        if self._current_buffer is None or self._current_offset >= self._current_size:
+            return self._with_diag(FrameMsgInfo())
+
+        remaining = self._current_buffer[self._current_offset:]
+        result = self._parse_buffer(remaining)
+
+        if result.valid:
+            self._current_offset += result.frame_size
+            return result
+
+        if result.status is FrameMsgStatus.FILTERED:
+            self.cnt_filtered += 1
+            self._current_offset += result.frame_size
+            return result
+
+        if result.frame_size > 0:
+            # Complete frame with bad CRC — count it, skip it, let caller call next() again
+            if self._config.has_crc:
+                self._diag.cnt_crc_failures += 1
+            self._diag.cnt_failed_bytes += result.frame_size
+            self._diag.cnt_sync_recoveries += 1
+            self._current_offset += result.frame_size
+            return self._with_diag(result)
+
+        if result.status == FrameMsgStatus.WAITING_FOR_START and self._config.num_start_bytes >= 1:
+            # Head byte is not a frame start — scan forward to the next start byte,
+            # reporting SyncRecovery with frame_size=bytes_skipped so try_next() keeps draining.
+            old_offset = self._current_offset
+            nxt = self._find_start_byte(self._current_offset + 1)
+            self._current_offset = nxt if nxt != -1 else self._current_size
+            skipped = self._current_offset - old_offset
+            self._diag.cnt_failed_bytes += skipped
+            self._diag.cnt_sync_recoveries += 1
+            r = FrameMsgInfo(status=FrameMsgStatus.SYNC_RECOVERY)
+            r.frame_size = skipped
+            return self._with_diag(r)
+
+        # Parse failed - might be a partial message at the end of the buffer
+        remaining_len = self._current_size - self._current_offset
+        if remaining_len > 0 and remaining_len < self._buffer_size:
+            self._internal_buffer[:remaining_len] = remaining
+            self._internal_data_len = remaining_len
+            self._current_offset = self._current_size
+
+        return self._with_diag(FrameMsgInfo())
+
+    def _find_start_byte(self, start: int) -> int:
+        """Index of the next start byte in the current buffer, or -1."""
+        buf = self._current_buffer
+        start1 = self._config.computed_start_byte1()
+        if not isinstance(buf, memoryview):
+            return buf.find(bytes([start1]), start, self._current_size)
+        if self._find_start is None:
+            self._find_start = _byte_finder(buf, start1)
+        return self._find_start(start, self._current_size)
+    
+    # =========================================================================
+    # Stream Mode API
+    # =========================================================================
+    
+    def push_byte(self, byte: int) -> FrameMsgInfo:
+        """
+        Push a single byte for parsing (stream mode).
+        
+        Returns:
+            FrameMsgInfo with valid=True when a complete valid message is received.
+        
+        Note: Do not mix push_byte() with add_data() on the same reader instance.
+        """
+        # Initialize state on first byte if idle
+        if self._state == AccumulatingReaderState.IDLE or self._state == AccumulatingReaderState.BUFFER_MODE:
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            self._internal_data_len = 0
+            self._expected_frame_size = 0
+        
+        if self._state == AccumulatingReaderState.LOOKING_FOR_START1:
+            return self._handle_looking_for_start1(byte)
+        elif self._state == AccumulatingReaderState.LOOKING_FOR_START2:
+            return self._handle_looking_for_start2(byte)
+        elif self._state == AccumulatingReaderState.COLLECTING_HEADER:
+            return self._handle_collecting_header(byte)
+        elif self._state == AccumulatingReaderState.COLLECTING_PAYLOAD:
+            return self._handle_collecting_payload(byte)
+        else:
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            return self._status_result(FrameMsgStatus.WAITING_FOR_START)
+
+    def _with_diag(self, result: FrameMsgInfo) -> FrameMsgInfo:
+        result.diagnostics = self._diag
+        return result
+
+    def _status_result(self, status: FrameMsgStatus) -> FrameMsgInfo:
+        return self._with_diag(FrameMsgInfo(status=status))
+    
+    def _handle_looking_for_start1(self, byte: int) -> FrameMsgInfo:
+        """Handle LOOKING_FOR_START1 state"""
+        if self._config.num_start_bytes == 0:
+            # No start bytes - this byte is the beginning of the frame
+            self._internal_buffer[0] = byte
+            self._internal_data_len = 1
+            
+            if not self._config.has_length and not self._config.has_crc:
+                return self._handle_minimal_msg_id(byte)
+            else:
+                self._state = AccumulatingReaderState.COLLECTING_HEADER
+        else:
+            if byte == self._config.computed_start_byte1():
+                self._internal_buffer[0] = byte
+                self._internal_data_len = 1
+                
+                if self._config.num_start_bytes == 1:
+                    self._state = AccumulatingReaderState.COLLECTING_HEADER
+                else:
+                    self._state = AccumulatingReaderState.LOOKING_FOR_START2
+            else:
+                return self._status_result(FrameMsgStatus.WAITING_FOR_START)
+        
+        return self._status_result(FrameMsgStatus.COLLECTING)
+    
+    def _handle_looking_for_start2(self, byte: int) -> FrameMsgInfo:
+        """Handle LOOKING_FOR_START2 state"""
+        if byte == self._config.computed_start_byte2():
+            self._internal_buffer[self._internal_data_len] = byte
+            self._internal_data_len += 1
+            self._state = AccumulatingReaderState.COLLECTING_HEADER
+        elif byte == self._config.computed_start_byte1():
+            # Might be start of new frame - restart
+            self._internal_buffer[0] = byte
+            self._internal_data_len = 1
+        else:
+            # Invalid byte - lost sync; discard and restart
+            self._diag.cnt_failed_bytes += self._internal_data_len + 1
+            self._diag.cnt_sync_recoveries += 1
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            self._internal_data_len = 0
+            return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+        
+        return self._status_result(FrameMsgStatus.COLLECTING)
+    
+    def _handle_collecting_header(self, byte: int) -> FrameMsgInfo:
+        """Handle COLLECTING_HEADER state"""
+        if self._internal_data_len >= self._buffer_size:
+            # Buffer overflow - reset
+            self._diag.cnt_failed_bytes += self._internal_data_len + 1
+            self._diag.cnt_sync_recoveries += 1
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            self._internal_data_len = 0
+            return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+        
+        self._internal_buffer[self._internal_data_len] = byte
+        self._internal_data_len += 1
+        
+        # Check if we have enough header bytes to determine frame size
+        if self._internal_data_len >= self._config.header_size:
+            if not self._config.has_length and not self._config.has_crc:
+                # For minimal profiles, we need the callback to determine length
+                msg_id = self._internal_buffer[self._config.header_size - 1]
+                if self._get_message_info:
+                    msg_info = self._get_message_info(msg_id)
+                    if msg_info is not None:
+                        msg_len = msg_info.size
+                        self._expected_frame_size = self._config.header_size + msg_len
+                        
+                        if self._expected_frame_size > self._buffer_size:
+                            self._diag.cnt_failed_bytes += self._internal_data_len
+                            self._diag.cnt_sync_recoveries += 1
+                            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                            self._internal_data_len = 0
+                            return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+                        
+                        if msg_len == 0:
+                            # Zero-length message - complete!
+                            result = FrameMsgInfo(
+                                valid=True,
+                                msg_id=msg_id,
+                                msg_len=0,
+                                frame_size=self._config.header_size,
+                                msg_data=b''
+                            )
+                            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                            self._internal_data_len = 0
+                            self._expected_frame_size = 0
+                            return self._with_diag(result)
+                        
+                        self._state = AccumulatingReaderState.COLLECTING_PAYLOAD
+                    else:
+                        self._diag.cnt_failed_bytes += self._internal_data_len
+                        self._diag.cnt_sync_recoveries += 1
+                        self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                        self._internal_data_len = 0
+                        return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+                else:
+                    self._diag.cnt_failed_bytes += self._internal_data_len
+                    self._diag.cnt_sync_recoveries += 1
+                    self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                    self._internal_data_len = 0
+                    return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+            else:
+                # Calculate payload length from header
+                len_offset = self._config.num_start_bytes
+                
+                # Skip seq, sys_id, comp_id if present
+                if self._config.has_sequence:
+                    len_offset += 1
+                if self._config.has_system_id:
+                    len_offset += 1
+                if self._config.has_component_id:
+                    len_offset += 1
+                
+                payload_len = 0
+                if self._config.has_length:
+                    if self._config.length_bytes == 1:
+                        payload_len = self._internal_buffer[len_offset]
+                    else:
+                        payload_len = self._internal_buffer[len_offset] | (self._internal_buffer[len_offset + 1] << 8)
+                
+                # Check for length mismatch against the expected message struct size
+                if self._config.has_length and self._get_message_info is not None:
+                    if self._config.has_package_id:
+                        pkg_id = self._internal_buffer[self._config.header_size - 2]
+                        low_msg_id = self._internal_buffer[self._config.header_size - 1]
+                        full_msg_id = (pkg_id << 8) | low_msg_id
+                    else:
+                        full_msg_id = self._internal_buffer[self._config.header_size - 1]
+                    msg_info = self._get_message_info(full_msg_id)
+                    if msg_info is not None:
+                        # A valid frame may carry anywhere from base_size (extensions
+                        # truncated) up to size (full extensions) bytes. Only count a
+                        # length error when payload_len falls outside that range —
+                        # matches the C++ parser semantics.
+                        base_size = getattr(msg_info, 'base_size', msg_info.size)
+                        if payload_len > msg_info.size or payload_len < base_size:
+                            self._diag.cnt_len_errors += 1
+
+                self._expected_frame_size = self._config.overhead + payload_len
+                
+                if self._expected_frame_size > self._buffer_size:
+                    self._diag.cnt_failed_bytes += self._internal_data_len
+                    self._diag.cnt_sync_recoveries += 1
+                    self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                    self._internal_data_len = 0
+                    return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+                
+                # Check if we already have the complete frame
+                if self._internal_data_len >= self._expected_frame_size:
+                    return self._validate_and_return()
+                
+                self._state = AccumulatingReaderState.COLLECTING_PAYLOAD
+        
+        return self._status_result(FrameMsgStatus.COLLECTING)
+    
+    def _handle_collecting_payload(self, byte: int) -> FrameMsgInfo:
+        """Handle COLLECTING_PAYLOAD state"""
+        if self._internal_data_len >= self._buffer_size:
+            # Buffer overflow - reset
+            self._diag.cnt_failed_bytes += self._internal_data_len + 1
+            self._diag.cnt_sync_recoveries += 1
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            self._internal_data_len = 0
+            return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+        
+        self._internal_buffer[self._internal_data_len] = byte
+        self._internal_data_len += 1
+        
+        if self._internal_data_len >= self._expected_frame_size:
+            return self._validate_and_return()
+        
+        return self._status_result(FrameMsgStatus.COLLECTING)
+    
+    def _handle_minimal_msg_id(self, msg_id: int) -> FrameMsgInfo:
+        """Handle minimal profile msg_id"""
+        if self._get_message_info:
+            msg_info = self._get_message_info(msg_id)
+            if msg_info is not None:
+                msg_len = msg_info.size
+                self._expected_frame_size = self._config.header_size + msg_len
+                
+                if self._expected_frame_size > self._buffer_size:
+                    self._diag.cnt_failed_bytes += self._internal_data_len
+                    self._diag.cnt_sync_recoveries += 1
+                    self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                    self._internal_data_len = 0
+                    return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+                
+                if msg_len == 0:
+                    # Zero-length message - complete!
+                    result = FrameMsgInfo(
+                        valid=True,
+                        msg_id=msg_id,
+                        msg_len=0,
+                        frame_size=self._config.header_size,
+                        msg_data=b''
+                    )
+                    self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                    self._internal_data_len = 0
+                    self._expected_frame_size = 0
+                    return self._with_diag(result)
+                
+                self._state = AccumulatingReaderState.COLLECTING_PAYLOAD
+                return self._status_result(FrameMsgStatus.COLLECTING)
+            else:
+                self._diag.cnt_failed_bytes += self._internal_data_len
+                self._diag.cnt_sync_recoveries += 1
+                self._state = AccumulatingReaderState.LOOKING_FOR_START1
+                self._internal_data_len = 0
+                return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+        else:
+            self._diag.cnt_failed_bytes += self._internal_data_len
+            self._diag.cnt_sync_recoveries += 1
+            self._state = AccumulatingReaderState.LOOKING_FOR_START1
+            self._internal_data_len = 0
+            return self._status_result(FrameMsgStatus.SYNC_RECOVERY)
+    
+    def _validate_and_return(self) -> FrameMsgInfo:
+        """Validate and return completed message"""
+        result = self._parse_buffer(self._internal_view[:self._internal_data_len])
+        
+        # Reset state for next message
+        self._state = AccumulatingReaderState.LOOKING_FOR_START1
+        self._internal_data_len = 0
+        self._expected_frame_size = 0
+        
+        if result.status is FrameMsgStatus.FILTERED:
+            # Still advances the sequence so the next kept frame is not a false gap.
+            self.cnt_filtered += 1
+            if self._config.has_sequence:
+                self._last_seq = result.sequence
+            return result
+
+        if result.valid:
+            # Check for sequence gap (profiles that carry a sequence number)
+            if self._config.has_sequence:
+                if self._last_seq is not None:
+                    expected_seq = (self._last_seq + 1) & 0xFF
+                    if result.sequence != expected_seq:
+                        self._diag.cnt_seq_gaps += 1
+                self._last_seq = result.sequence
+        else:
+            # Invalid frame — count CRC failures and sync recoveries
+            if self._config.has_crc:
+                self._diag.cnt_crc_failures += 1
+                result.status = FrameMsgStatus.CRC_FAILURE
+            self._diag.cnt_failed_bytes += result.frame_size
+            self._diag.cnt_sync_recoveries += 1
+        
+        return self._with_diag(result)
+    
+    def _parse_buffer(self, buffer: bytes) -> FrameMsgInfo:
+        """Parse a buffer using the appropriate parser"""
+        if self._config.has_crc or self._config.has_length:
+            return _frame_format_parse_with_crc(self._config, buffer, self._get_message_info,
+                                                self._header_filter)
+        else:
+            if self._get_message_info is None:
+                return FrameMsgInfo()
+            return _frame_format_parse_minimal(self._config, buffer, self._get_message_info,
+                                               self._header_filter)
+
+    def set_header_filter(self, header_filter: Optional[HeaderFilter]) -> None:
+        """Install (or clear with None) a header predicate.
+
+        Called as ``header_filter(msg_id, package_id, sequence, system_id,
+        component_id)`` once a frame is fully buffered. Frames it rejects come
+        back from next()/try_next()/push_byte() with status FILTERED and
+        frame_size set, without CRC validation, payload copy or diagnostic
+        counting (they are tallied in ``cnt_filtered`` instead). Filtered
+        frames are skipped by their header length exactly as a CRC failure
+        would be, so stream sync is unaffected.
+        """
+        self._header_filter = header_filter
+    
+    # =========================================================================
+    # Common API
+    # =========================================================================
+    
+    def has_more(self) -> bool:
+        """Check if there might be more data to parse (buffer mode only)."""
+        if self._state != AccumulatingReaderState.BUFFER_MODE:
+            return False
+        return (self._internal_data_len > 0) or (self._current_buffer is not None and self._current_offset < self._current_size)
+    
+    def has_partial(self) -> bool:
+        """Check if there's a partial message waiting for more data."""
+        return self._internal_data_len > 0
+
+    @property
+    def offset(self) -> int:
+        """Bytes of the current add_data() buffer consumed so far (buffer mode)."""
+        return self._current_offset
+    
+    def partial_size(self) -> int:
+        """Get the size of the partial message data (0 if none)."""
+        return self._internal_data_len
+
+    def try_next(self) -> Optional['FrameMsgInfo']:
+        """Try to parse the next frame. Returns the result if forward progress was made
+        (valid frame, CRC-failed frame, or resync bytes skipped), or None when the
+        current buffer is exhausted or only a trailing partial is pending.
+
+        Canonical drain loop::
+
+            while (result := reader.try_next()) is not None:
+                if result.valid: handle(result)  # else CrcFailure or SyncRecovery
+            if reader.has_partial(): pass  # incomplete frame; feed more data
+        """
+        result = self.next()
+        return result if (result.valid or result.frame_size > 0) else None
+    
+    @property
+    def state(self) -> AccumulatingReaderState:
+        """Get current parser state (for debugging)."""
+        return self._state
+    
+    @property
+    def diagnostics(self) -> ParserDiagnostics:
+        """Return a snapshot of the current diagnostic counters.
+
+        Counters accumulate over the reader's lifetime. Call
+        reset_diagnostics() to clear them.
+        """
+        return ParserDiagnostics(
+            cnt_crc_failures=self._diag.cnt_crc_failures,
+            cnt_sync_recoveries=self._diag.cnt_sync_recoveries,
+            cnt_failed_bytes=self._diag.cnt_failed_bytes,
+            cnt_len_errors=self._diag.cnt_len_errors,
+            cnt_seq_gaps=self._diag.cnt_seq_gaps,
+        )
+
+    def reset_diagnostics(self) -> None:
+        """Reset all diagnostic counters (and cnt_filtered) to zero."""
+        self._diag = ParserDiagnostics()
+        self.cnt_filtered = 0
+    
+    def reset(self):
+        """Reset the reader, clearing any partial message data."""
+        self._internal_data_len = 0
+        self._bytes_appended_to_internal = 0
+        self._expected_frame_size = 0
+        self._state = AccumulatingReaderState.IDLE
+        self._current_buffer = None
+        self._current_size = 0
+        self._current_offset = 0
+        self._last_seq = None
+
+
+# =============================================================================
+# MultiProfileReader - one pass over a stream carrying several profiles
+# =============================================================================
+
+_NO_PROFILE = 0xFF
+
+
+class MultiProfileReader:
+    """
+    Reader for a link that interleaves frames of several profiles.
+
+    ProfileStandard (0x90 0x71), ProfileBulk (0x90 0x74) and ProfileNetwork
+    (0x90 0x78), or Tiny-header profiles (0x70 + payload type), can share one
+    stream. A 64 KiB table indexed by the first two bytes of a candidate
+    frame maps every start pattern to its profile, built once from each
+    profile's computed start bytes. Each frame is then parsed in place by its
+    profile's parser, without trying the others.
+
+    Buffer mode only (add_data() + next()/try_next()), with the same
+    partial-frame and resync behaviour as AccumulatingReader. ``last_profile``
+    names the profile of the frame most recently returned. Diagnostics are
+    kept per profile; bytes that match no profile's start pattern are counted
+    in ``stream_diagnostics``.
+
+    Usage:
+        reader = MultiProfileReader([PROFILE_STANDARD_CONFIG, PROFILE_BULK_CONFIG],
+                                    get_message_info=get_message_info)
+        reader.add_data(chunk)
+        while (result := reader.try_next()) is not None:
+            if result.valid:
+                handle(reader.last_profile, result)
+    """
+
+    def __init__(self, profiles: List[ProfileConfig],
+                 get_message_info: Callable[[int], Optional[MessageInfo]] = None,
+                 buffer_size: int = 4096):
+        """
+        Args:
+            profiles: Profiles that may appear on the stream. Each needs at
+                least one start byte, and no two may share a start pattern.
+            get_message_info: Message info callback shared by all profiles
+                (required if any profile has no length field)
+            buffer_size: Largest partial frame carried between add_data() calls
+        """
+        if not profiles:
+            raise ValueError('MultiProfileReader needs at least one profile')
+        self._profiles = tuple(profiles)
+        self._get_message_info = get_message_info
+        self._buffer_size = buffer_size
+        self._table = bytearray([_NO_PROFILE]) * 65536
+        first_bytes = set()
+        for index, profile in enumerate(self._profiles):
+            if profile.num_start_bytes == 0:
+                raise ValueError(f'{profile.name} has no start bytes and cannot be detected in a mixed stream')
+            if not (profile.has_crc or profile.has_length) and get_message_info is None:
+                raise ValueError(f'{profile.name} has no length field; get_message_info is required')
+            b1 = profile.computed_start_byte1()
+            seconds = [profile.computed_start_byte2()] if profile.num_start_bytes >= 2 else range(256)
+            for b2 in seconds:
+                key = (b1 << 8) | b2
+                if self._table[key] != _NO_PROFILE:
+                    other = self._profiles[self._table[key]].name
+                    raise ValueError(f'{profile.name} and {other} share start pattern 0x{b1:02X} 0x{b2:02X}')
+                self._table[key] = index
+            first_bytes.add(b1)
+        self._start_scan = re.compile(b'[' + b''.join(re.escape(bytes((b,))) for b in sorted(first_bytes)) + b']')
+
+        self._diag = [ParserDiagnostics() for _ in self._profiles]
+        self._frames = [0] * len(self._profiles)
+        self._last_seq: List[Optional[int]] = [None] * len(self._profiles)
+        self._stream_diag = ParserDiagnostics()
+        self.last_profile: Optional[ProfileConfig] = None
+
+        self._pending = bytearray()
+        self._data = memoryview(b'')
+        self._offset = 0
+        # While completing a carried-over partial, _data is pending + a prefix of
+        # the new buffer; _tail is the new buffer and _switch_at the pending length.
+        self._tail: Optional[memoryview] = None
+        self._switch_at = 0
+
+    @property
+    def profiles(self) -> tuple:
+        """The configured profiles, in constructor order."""
+        return self._profiles
+
+    def add_data(self, buffer: bytes):
+        """Add a chunk to process; drain it with next()/try_next() before adding more.
+
+        As with AccumulatingReader, complete frames are parsed in place, so a
+        borrowed memoryview must be drained before its owner reuses it.
+        """
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self._offset = 0
+        if self._pending:
+            take = min(len(view), max(0, self._buffer_size - len(self._pending)))
+            self._switch_at = len(self._pending)
+            self._data = memoryview(bytes(self._pending) + bytes(view[:take]))
+            self._tail = view
+            self._pending.clear()
+        else:
+            self._data = view
+            self._tail = None
+
+    def next(self) -> FrameMsgInfo:
+        """Parse the next frame. Returns an invalid FrameMsgInfo when no progress is possible."""
+        while True:
+            if self._tail is not None and self._offset >= self._switch_at:
+                # Past the carried-over bytes: continue directly in the new buffer.
+                self._offset -= self._switch_at
+                self._data, self._tail = self._tail, None
+            data, offset = self._data, self._offset
+            remaining = len(data) - offset
+            if remaining <= 0:
+                return FrameMsgInfo()
+
+            index = self._table[(data[offset] << 8) | data[offset + 1]] if remaining >= 2 else _NO_PROFILE
+            if index == _NO_PROFILE:
+                if remaining < 2 and self._start_scan.match(data, offset):
+                    return self._stash()
+                return self._skip(self._stream_diag, 1, scan=True)
+
+            profile = self._profiles[index]
+            diag = self._diag[index]
+            if profile.has_crc or profile.has_length:
+                result = _frame_format_parse_with_crc(profile, data[offset:], self._get_message_info)
+            else:
+                result = _frame_format_parse_minimal(profile, data[offset:], self._get_message_info)
+
+            if result.valid:
+                self._offset += result.frame_size
+                self._frames[index] += 1
+                if profile.has_sequence:
+                    last = self._last_seq[index]
+                    if last is not None and result.sequence != ((last + 1) & 0xFF):
+                        diag.cnt_seq_gaps += 1
+                    self._last_seq[index] = result.sequence
+                self.last_profile = profile
+                return result
+
+            if result.frame_size > 0:
+                # Complete frame, bad CRC: skip exactly this frame.
+                diag.cnt_crc_failures += 1
+                diag.cnt_failed_bytes += result.frame_size
+                diag.cnt_sync_recoveries += 1
+                self._offset += result.frame_size
+                result.status = FrameMsgStatus.CRC_FAILURE
+                result.diagnostics = self._snapshot(diag)
+                self.last_profile = profile
+                return result
+
+            if self._is_partial(profile, result, data, offset, remaining):
+                if remaining < self._buffer_size and (self._tail is None or len(data) - self._switch_at == len(self._tail)):
+                    return self._stash()
+                # Claims to be larger than we can hold: treat the start bytes as noise.
+            return self._skip(diag, 1, scan=True, profile=profile)
+
+    def try_next(self) -> Optional[FrameMsgInfo]:
+        """Like AccumulatingReader.try_next(): a result while progress is made, else None."""
+        result = self.next()
+        return result if (result.valid or result.frame_size > 0) else None
+
+    def _is_partial(self, profile: ProfileConfig, result: FrameMsgInfo, data, offset: int,
+                    remaining: int) -> bool:
+        if profile.has_crc or profile.has_length:
+            # COLLECTING covers both a short header and a short body.
+            return result.status == FrameMsgStatus.COLLECTING
+        # The minimal parser reports nothing; short, or a known msg_id, means wait.
+        if remaining < profile.header_size:
+            return True
+        return self._get_message_info(data[offset + profile.header_size - 1]) is not None
+
+    def _stash(self) -> FrameMsgInfo:
+        """Keep the trailing partial frame for the next add_data()."""
+        self._pending[:] = self._data[self._offset:]
+        self._data = memoryview(b'')
+        self._tail = None
+        self._offset = 0
+        return FrameMsgInfo()
+
+    def _skip(self, diag: ParserDiagnostics, minimum: int, scan: bool,
+              profile: Optional[ProfileConfig] = None) -> FrameMsgInfo:
+        """Drop bytes up to the next candidate start byte and report SYNC_RECOVERY."""
+        start = self._offset
+        target = start + minimum
+        if scan:
+            match = self._start_scan.search(self._data, target)
+            target = match.start() if match else len(self._data)
+        self._offset = target
+        skipped = target - start
+        diag.cnt_failed_bytes += skipped
+        diag.cnt_sync_recoveries += 1
+        self.last_profile = profile
+        r = FrameMsgInfo(status=FrameMsgStatus.SYNC_RECOVERY)
+        r.frame_size = skipped
+        r.diagnostics = self._snapshot(diag)
+        return r
+
+    @staticmethod
+    def _snapshot(diag: ParserDiagnostics) -> ParserDiagnostics:
+        return ParserDiagnostics(
+            cnt_crc_failures=diag.cnt_crc_failures,
+            cnt_sync_recoveries=diag.cnt_sync_recoveries,
+            cnt_failed_bytes=diag.cnt_failed_bytes,
+            cnt_len_errors=diag.cnt_len_errors,
+            cnt_seq_gaps=diag.cnt_seq_gaps,
+        )
+
+    def has_partial(self) -> bool:
+        """Check if a partial frame is waiting for more data."""
+        return len(self._pending) > 0
+
+    def partial_size(self) -> int:
+        """Size of the partial frame carried over (0 if none)."""
+        return len(self._pending)
+
+    def profile_for(self, byte1: int, byte2: int) -> Optional[ProfileConfig]:
+        """Profile whose start pattern matches the two bytes, or None."""
+        index = self._table[((byte1 & 0xFF) << 8) | (byte2 & 0xFF)]
+        return None if index == _NO_PROFILE else self._profiles[index]
+
+    @property
+    def diagnostics(self) -> Dict[str, ParserDiagnostics]:
+        """Snapshot of the diagnostic counters per profile name."""
+        return {p.name: self._snapshot(d) for p, d in zip(self._profiles, self._diag)}
+
+    @property
+    def frame_counts(self) -> Dict[str, int]:
+        """Valid frames parsed per profile name."""
+        return {p.name: n for p, n in zip(self._profiles, self._frames)}
+
+    @property
+    def stream_diagnostics(self) -> ParserDiagnostics:
+        """Counters for bytes that matched no profile's start pattern."""
+        return self._snapshot(self._stream_diag)
+
+    def reset_diagnostics(self) -> None:
+        """Reset per-profile and stream counters (and frame counts) to zero."""
+        self._diag = [ParserDiagnostics() for _ in self._profiles]
+        self._frames = [0] * len(self._profiles)
+        self._stream_diag = ParserDiagnostics()
+
+    def reset(self):
+        """Reset the reader, clearing any partial frame."""
+        self._pending.clear()
+        self._data = memoryview(b'')
+        self._tail = None
+        self._offset = 0
+        self._last_seq = [None] * len(self._profiles)
+        self.last_profile = None
+
+
+# =============================================================================
+# Backwards Compatibility - FrameFormatConfig alias
+# =============================================================================
+
+# Alias for backwards compatibility
+FrameFormatConfig = ProfileConfig
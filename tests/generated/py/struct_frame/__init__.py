@@ -0,0 +1 @@
+"""StructFrame generated code package."""
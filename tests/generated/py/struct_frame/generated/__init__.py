@@ -0,0 +1 @@
+"""StructFrame generated message definitions."""
@@ -0,0 +1,149 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Package ID for extended message IDs
+PACKAGE_ID = 1
+
+# Enum definitions
+#// Common types that can be imported by other proto files
+#// Note: No pkgid defined here - will inherit from importing file
+class Status(Enum):
+    IDLE = 0
+    ACTIVE = 1
+    ERROR = 2
+
+# Message definitions 
+class Timestamp:
+    msg_size = 12
+    MAX_SIZE = 12  # C++ compatible alias
+    BASE_SIZE = 12  # Non-extension portion size (== MAX_SIZE when no extensions)
+    # Combined 16-bit ID: (PACKAGE_ID << 8) | local_msg_id = (1 << 8) | 1 = 257
+    msg_id = 257
+    MSG_ID = 257  # C++ compatible alias (combined: pkg_id=1, local_id=1)
+    MAGIC1 = 19  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 31  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, seconds: int = None, nanoseconds: int = None):
+        self.seconds = seconds if seconds is not None else 0
+        self.nanoseconds = nanoseconds if nanoseconds is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<QI", self.seconds, self.nanoseconds)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<QI", data, offset)
+        offset += 12
+        fields["seconds"] = _vals[0]
+        fields["nanoseconds"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "Timestamp Msg, ID 257, Size 12 \n"
+        out += f"seconds = {self.seconds}\n"
+        out += f"nanoseconds = {self.nanoseconds}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["seconds"] = self.seconds
+        out["nanoseconds"] = self.nanoseconds
+        if include_name:
+            out["name"] = "Timestamp"
+        if include_id:
+            out["msg_id"] = "257"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, Timestamp):
+            return False
+        return (self.seconds == other.seconds and
+                self.nanoseconds == other.nanoseconds)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+
+__all__ = [
+    'Status',
+    'Timestamp',
+]
+
+# Message definitions dictionary with package ID support
+# Format: (package_id << 8) | msg_id => Message class
+common_types_definitions = {
+    257: Timestamp,  # pkg_id=1, msg_id=1
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from 16-bit message ID (package_id << 8 | msg_id)"""
+    return common_types_definitions.get(msg_id)
+
+def get_message_size(msg_id: int) -> int:
+    """Get message size from 16-bit message ID"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+# Alias for minimal frame parsing compatibility
+get_msg_length = get_message_size
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a 16-bit message ID.
+    
+    Args:
+        msg_id: 16-bit message ID (pkg_id << 8 | local_msg_id)
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
@@ -0,0 +1,1471 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Enum definitions
+#// ============================================================================
+#// Response Messages
+#// ============================================================================
+#// Generic response status
+class ResponseStatus(Enum):
+    SUCCESS = 0
+    ERROR = 1
+    BUSY = 2
+    INVALID = 3
+
+# Oneof discriminator enums
+class RawDataEnvelopePayloadField(Enum):
+    """Discriminator enum for RawDataEnvelope.payload oneof"""
+    NONE = 0
+    SAMPLE = 1
+    CONFIG = 2
+
+# Message definitions 
+#// Test file for envelope/container message feature
+#// Demonstrates the is_envelope option for wrapping multiple message types
+#// ============================================================================
+#// Command Messages - These are the individual command types
+#// ============================================================================
+#// ADC (Analog-to-Digital Converter) Command
+class ADCCommand:
+    msg_size = 4
+    MAX_SIZE = 4  # C++ compatible alias
+    BASE_SIZE = 4  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 112
+    MSG_ID = 112  # C++ compatible alias
+    MAGIC1 = 17  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 26  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, channel: int = None, sample_rate: int = None, enable: bool = None):
+        self.channel = channel if channel is not None else 0
+        self.sample_rate = sample_rate if sample_rate is not None else 0
+        self.enable = enable if enable is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH?", self.channel, self.sample_rate, self.enable)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH?", data, offset)
+        offset += 4
+        fields["channel"] = _vals[0]
+        fields["sample_rate"] = _vals[1]
+        fields["enable"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ADCCommand Msg, ID 112, Size 4 \n"
+        out += f"channel = {self.channel}\n"
+        out += f"sample_rate = {self.sample_rate}\n"
+        out += f"enable = {self.enable}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["channel"] = self.channel
+        out["sample_rate"] = self.sample_rate
+        out["enable"] = self.enable
+        if include_name:
+            out["name"] = "ADCCommand"
+        if include_id:
+            out["msg_id"] = "112"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ADCCommand):
+            return False
+        return (self.channel == other.channel and
+                self.sample_rate == other.sample_rate and
+                self.enable == other.enable)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// DAC (Digital-to-Analog Converter) Command  
+class DACCommand:
+    msg_size = 4
+    MAX_SIZE = 4  # C++ compatible alias
+    BASE_SIZE = 4  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 113
+    MSG_ID = 113  # C++ compatible alias
+    MAGIC1 = 17  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 26  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, channel: int = None, output_value: int = None, enable: bool = None):
+        self.channel = channel if channel is not None else 0
+        self.output_value = output_value if output_value is not None else 0
+        self.enable = enable if enable is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH?", self.channel, self.output_value, self.enable)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH?", data, offset)
+        offset += 4
+        fields["channel"] = _vals[0]
+        fields["output_value"] = _vals[1]
+        fields["enable"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "DACCommand Msg, ID 113, Size 4 \n"
+        out += f"channel = {self.channel}\n"
+        out += f"output_value = {self.output_value}\n"
+        out += f"enable = {self.enable}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["channel"] = self.channel
+        out["output_value"] = self.output_value
+        out["enable"] = self.enable
+        if include_name:
+            out["name"] = "DACCommand"
+        if include_id:
+            out["msg_id"] = "113"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, DACCommand):
+            return False
+        return (self.channel == other.channel and
+                self.output_value == other.output_value and
+                self.enable == other.enable)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Motor Control Command
+class MotorCommand:
+    msg_size = 4
+    MAX_SIZE = 4  # C++ compatible alias
+    BASE_SIZE = 4  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 114
+    MSG_ID = 114  # C++ compatible alias
+    MAGIC1 = 18  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 31  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, speed: int = None, direction: int = None, brake: bool = None):
+        self.speed = speed if speed is not None else 0
+        self.direction = direction if direction is not None else 0
+        self.brake = brake if brake is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<hB?", self.speed, self.direction, self.brake)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<hB?", data, offset)
+        offset += 4
+        fields["speed"] = _vals[0]
+        fields["direction"] = _vals[1]
+        fields["brake"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MotorCommand Msg, ID 114, Size 4 \n"
+        out += f"speed = {self.speed}\n"
+        out += f"direction = {self.direction}\n"
+        out += f"brake = {self.brake}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["speed"] = self.speed
+        out["direction"] = self.direction
+        out["brake"] = self.brake
+        if include_name:
+            out["name"] = "MotorCommand"
+        if include_id:
+            out["msg_id"] = "114"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MotorCommand):
+            return False
+        return (self.speed == other.speed and
+                self.direction == other.direction and
+                self.brake == other.brake)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Sensor Read Command
+class SensorReadCommand:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 115
+    MSG_ID = 115  # C++ compatible alias
+    MAGIC1 = 7  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 9  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sensor_id: int = None, interval_ms: int = None):
+        self.sensor_id = sensor_id if sensor_id is not None else 0
+        self.interval_ms = interval_ms if interval_ms is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH", self.sensor_id, self.interval_ms)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        fields["sensor_id"] = _vals[0]
+        fields["interval_ms"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "SensorReadCommand Msg, ID 115, Size 3 \n"
+        out += f"sensor_id = {self.sensor_id}\n"
+        out += f"interval_ms = {self.interval_ms}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sensor_id"] = self.sensor_id
+        out["interval_ms"] = self.interval_ms
+        if include_name:
+            out["name"] = "SensorReadCommand"
+        if include_id:
+            out["msg_id"] = "115"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, SensorReadCommand):
+            return False
+        return (self.sensor_id == other.sensor_id and
+                self.interval_ms == other.interval_ms)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Envelope Message - Wraps all command types for unified handling
+#// ============================================================================
+#// CommandEnvelope is a container message that can hold any of the above commands.
+#// The is_envelope option enables special SDK helper methods for wrapping/unwrapping.
+class CommandEnvelope:
+    msg_size = 12
+    MAX_SIZE = 12  # C++ compatible alias
+    BASE_SIZE = 12  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 200
+    MSG_ID = 200  # C++ compatible alias
+    MAGIC1 = 188  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 166  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sequence_number: int = None, priority: int = None, run_immediately: bool = None, command: dict = None, command_which: str = None, command_discriminator: int = None):
+        self.sequence_number = sequence_number if sequence_number is not None else 0
+        self.priority = priority if priority is not None else 0
+        self.run_immediately = run_immediately if run_immediately is not None else False
+        self.command = command if command is not None else {}
+        self.command_which = command_which
+        self.command_discriminator = command_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<IB?", self.sequence_number, self.priority, self.run_immediately)
+        # Oneof command auto-discriminator (uint16 - message ID)
+        if self.command_which is not None:
+            data += struct.pack("<H", self.command[self.command_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof command payload
+        union_data = b""
+        if self.command_which is not None:
+            union_data = self.command[self.command_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(4, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<IB?", data, offset)
+        offset += 6
+        fields["sequence_number"] = _vals[0]
+        fields["priority"] = _vals[1]
+        fields["run_immediately"] = _vals[2]
+        # Oneof command auto-discriminator (uint16 - message ID)
+        discriminator = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        fields["command_discriminator"] = discriminator
+        # Oneof command payload
+        fields["command"] = {}
+        fields["command_which"] = None
+        # Determine which field is active based on message ID
+        if discriminator == ADCCommand.msg_id:
+            fields["command"]["adc"] = ADCCommand._deserialize_fixed(data[offset:offset+ADCCommand.MAX_SIZE])
+            fields["command_which"] = "adc"
+        if discriminator == DACCommand.msg_id:
+            fields["command"]["dac"] = DACCommand._deserialize_fixed(data[offset:offset+DACCommand.MAX_SIZE])
+            fields["command_which"] = "dac"
+        if discriminator == MotorCommand.msg_id:
+            fields["command"]["motor"] = MotorCommand._deserialize_fixed(data[offset:offset+MotorCommand.MAX_SIZE])
+            fields["command_which"] = "motor"
+        if discriminator == SensorReadCommand.msg_id:
+            fields["command"]["sensor"] = SensorReadCommand._deserialize_fixed(data[offset:offset+SensorReadCommand.MAX_SIZE])
+            fields["command_which"] = "sensor"
+        offset += 4
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "CommandEnvelope Msg, ID 200, Size 12 \n"
+        out += f"sequence_number = {self.sequence_number}\n"
+        out += f"priority = {self.priority}\n"
+        out += f"run_immediately = {self.run_immediately}\n"
+        out += f"command = {self.command}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sequence_number"] = self.sequence_number
+        out["priority"] = self.priority
+        out["run_immediately"] = self.run_immediately
+        if self.command_which:
+            out["command"] = self.command[self.command_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "CommandEnvelope"
+        if include_id:
+            out["msg_id"] = "200"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, CommandEnvelope):
+            return False
+        return (self.sequence_number == other.sequence_number and
+                self.priority == other.priority and
+                self.run_immediately == other.run_immediately and
+                self.command == other.command and
+                self.command_which == other.command_which and
+                self.command_discriminator == other.command_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+    # ========================================
+    # Envelope message helper methods
+    # ========================================
+
+    # Valid payload types for this envelope
+    _VALID_PAYLOAD_TYPES = ("ADCCommand", "DACCommand", "MotorCommand", "SensorReadCommand",)
+
+    @classmethod
+    def wrap(cls, payload: Union["ADCCommand", "DACCommand", "MotorCommand", "SensorReadCommand"], sequence_number: int, priority: int, run_immediately: bool) -> "CommandEnvelope":
+        """Create a CommandEnvelope envelope wrapping a payload message.
+        
+        Args:
+            payload: The message to wrap (must be one of: ADCCommand, DACCommand, MotorCommand, SensorReadCommand)
+            sequence_number: Envelope field value
+            priority: Envelope field value
+            run_immediately: Envelope field value
+        
+        Returns:
+            A fully initialized CommandEnvelope envelope
+        
+        Raises:
+            TypeError: If payload is not a valid payload type
+        """
+        payload_type_name = type(payload).__name__
+        if payload_type_name not in cls._VALID_PAYLOAD_TYPES:
+            raise TypeError(f"Invalid payload type {payload_type_name}. Must be one of: {cls._VALID_PAYLOAD_TYPES}")
+        
+        # Determine which oneof field to use based on MSG_ID
+        if payload.MSG_ID == ADCCommand.MSG_ID:
+            field_name = "adc"
+        if payload.MSG_ID == DACCommand.MSG_ID:
+            field_name = "dac"
+        if payload.MSG_ID == MotorCommand.MSG_ID:
+            field_name = "motor"
+        if payload.MSG_ID == SensorReadCommand.MSG_ID:
+            field_name = "sensor"
+        
+        envelope = cls(
+            sequence_number=sequence_number,
+            priority=priority,
+            run_immediately=run_immediately,
+            command={field_name: payload},
+            command_which=field_name,
+            command_discriminator=payload.MSG_ID
+        )
+        return envelope
+
+    def unwrap(self) -> Union["ADCCommand", "DACCommand", "MotorCommand", "SensorReadCommand", None]:
+        """Unwrap and get the payload message based on the discriminator.
+        
+        Returns:
+            The payload message matching the discriminator, or None if not set
+        """
+        if self.command_discriminator == ADCCommand.MSG_ID:
+            return self.command.get("adc")
+        elif self.command_discriminator == DACCommand.MSG_ID:
+            return self.command.get("dac")
+        elif self.command_discriminator == MotorCommand.MSG_ID:
+            return self.command.get("motor")
+        elif self.command_discriminator == SensorReadCommand.MSG_ID:
+            return self.command.get("sensor")
+        return None
+
+    def get_payload_message_id(self) -> int:
+        """Get the message ID of the wrapped payload.
+        
+        Returns:
+            The message ID of the payload in the command union
+        """
+        return self.command_discriminator
+
+#// ADC Response
+class ADCResponse:
+    msg_size = 4
+    MAX_SIZE = 4  # C++ compatible alias
+    BASE_SIZE = 4  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 212
+    MSG_ID = 212  # C++ compatible alias
+    MAGIC1 = 23  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 32  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, channel: int = None, value: int = None, status: int = None):
+        self.channel = channel if channel is not None else 0
+        self.value = value if value is not None else 0
+        self.status = status if status is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BHB", self.channel, self.value, self.status)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BHB", data, offset)
+        offset += 4
+        fields["channel"] = _vals[0]
+        fields["value"] = _vals[1]
+        fields["status"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ADCResponse Msg, ID 212, Size 4 \n"
+        out += f"channel = {self.channel}\n"
+        out += f"value = {self.value}\n"
+        out += f"status = {self.status}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["channel"] = self.channel
+        out["value"] = self.value
+        out["status"] = self.status
+        if include_name:
+            out["name"] = "ADCResponse"
+        if include_id:
+            out["msg_id"] = "212"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ADCResponse):
+            return False
+        return (self.channel == other.channel and
+                self.value == other.value and
+                self.status == other.status)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// DAC Response
+class DACResponse:
+    msg_size = 2
+    MAX_SIZE = 2  # C++ compatible alias
+    BASE_SIZE = 2  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 213
+    MSG_ID = 213  # C++ compatible alias
+    MAGIC1 = 17  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 19  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, channel: int = None, status: int = None):
+        self.channel = channel if channel is not None else 0
+        self.status = status if status is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BB", self.channel, self.status)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BB", data, offset)
+        offset += 2
+        fields["channel"] = _vals[0]
+        fields["status"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "DACResponse Msg, ID 213, Size 2 \n"
+        out += f"channel = {self.channel}\n"
+        out += f"status = {self.status}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["channel"] = self.channel
+        out["status"] = self.status
+        if include_name:
+            out["name"] = "DACResponse"
+        if include_id:
+            out["msg_id"] = "213"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, DACResponse):
+            return False
+        return (self.channel == other.channel and
+                self.status == other.status)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Motor Response
+class MotorResponse:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 214
+    MSG_ID = 214  # C++ compatible alias
+    MAGIC1 = 20  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 25  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, actual_speed: int = None, status: int = None):
+        self.actual_speed = actual_speed if actual_speed is not None else 0
+        self.status = status if status is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<hB", self.actual_speed, self.status)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<hB", data, offset)
+        offset += 3
+        fields["actual_speed"] = _vals[0]
+        fields["status"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MotorResponse Msg, ID 214, Size 3 \n"
+        out += f"actual_speed = {self.actual_speed}\n"
+        out += f"status = {self.status}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["actual_speed"] = self.actual_speed
+        out["status"] = self.status
+        if include_name:
+            out["name"] = "MotorResponse"
+        if include_id:
+            out["msg_id"] = "214"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MotorResponse):
+            return False
+        return (self.actual_speed == other.actual_speed and
+                self.status == other.status)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Sensor Response  
+class SensorResponse:
+    msg_size = 6
+    MAX_SIZE = 6  # C++ compatible alias
+    BASE_SIZE = 6  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 215
+    MSG_ID = 215  # C++ compatible alias
+    MAGIC1 = 28  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 42  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sensor_id: int = None, value: float = None, status: int = None):
+        self.sensor_id = sensor_id if sensor_id is not None else 0
+        self.value = _truncate_float32(value) if value is not None else 0.0
+        self.status = status if status is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BfB", self.sensor_id, self.value, self.status)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BfB", data, offset)
+        offset += 6
+        fields["sensor_id"] = _vals[0]
+        fields["value"] = _vals[1]
+        fields["status"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "SensorResponse Msg, ID 215, Size 6 \n"
+        out += f"sensor_id = {self.sensor_id}\n"
+        out += f"value = {self.value}\n"
+        out += f"status = {self.status}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sensor_id"] = self.sensor_id
+        out["value"] = self.value
+        out["status"] = self.status
+        if include_name:
+            out["name"] = "SensorResponse"
+        if include_id:
+            out["msg_id"] = "215"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, SensorResponse):
+            return False
+        return (self.sensor_id == other.sensor_id and
+                self.value == other.value and
+                self.status == other.status)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Response Envelope
+#// ============================================================================
+#// ResponseEnvelope wraps all response types
+class ResponseEnvelope:
+    msg_size = 16
+    MAX_SIZE = 16  # C++ compatible alias
+    BASE_SIZE = 16  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 250
+    MSG_ID = 250  # C++ compatible alias
+    MAGIC1 = 118  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 153  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sequence_number: int = None, timestamp_ms: int = None, response: dict = None, response_which: str = None, response_discriminator: int = None):
+        self.sequence_number = sequence_number if sequence_number is not None else 0
+        self.timestamp_ms = timestamp_ms if timestamp_ms is not None else 0
+        self.response = response if response is not None else {}
+        self.response_which = response_which
+        self.response_discriminator = response_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<II", self.sequence_number, self.timestamp_ms)
+        # Oneof response auto-discriminator (uint16 - message ID)
+        if self.response_which is not None:
+            data += struct.pack("<H", self.response[self.response_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof response payload
+        union_data = b""
+        if self.response_which is not None:
+            union_data = self.response[self.response_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(6, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<II", data, offset)
+        offset += 8
+        fields["sequence_number"] = _vals[0]
+        fields["timestamp_ms"] = _vals[1]
+        # Oneof response auto-discriminator (uint16 - message ID)
+        discriminator = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        fields["response_discriminator"] = discriminator
+        # Oneof response payload
+        fields["response"] = {}
+        fields["response_which"] = None
+        # Determine which field is active based on message ID
+        if discriminator == ADCResponse.msg_id:
+            fields["response"]["adc"] = ADCResponse._deserialize_fixed(data[offset:offset+ADCResponse.MAX_SIZE])
+            fields["response_which"] = "adc"
+        if discriminator == DACResponse.msg_id:
+            fields["response"]["dac"] = DACResponse._deserialize_fixed(data[offset:offset+DACResponse.MAX_SIZE])
+            fields["response_which"] = "dac"
+        if discriminator == MotorResponse.msg_id:
+            fields["response"]["motor"] = MotorResponse._deserialize_fixed(data[offset:offset+MotorResponse.MAX_SIZE])
+            fields["response_which"] = "motor"
+        if discriminator == SensorResponse.msg_id:
+            fields["response"]["sensor"] = SensorResponse._deserialize_fixed(data[offset:offset+SensorResponse.MAX_SIZE])
+            fields["response_which"] = "sensor"
+        offset += 6
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ResponseEnvelope Msg, ID 250, Size 16 \n"
+        out += f"sequence_number = {self.sequence_number}\n"
+        out += f"timestamp_ms = {self.timestamp_ms}\n"
+        out += f"response = {self.response}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sequence_number"] = self.sequence_number
+        out["timestamp_ms"] = self.timestamp_ms
+        if self.response_which:
+            out["response"] = self.response[self.response_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "ResponseEnvelope"
+        if include_id:
+            out["msg_id"] = "250"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ResponseEnvelope):
+            return False
+        return (self.sequence_number == other.sequence_number and
+                self.timestamp_ms == other.timestamp_ms and
+                self.response == other.response and
+                self.response_which == other.response_which and
+                self.response_discriminator == other.response_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+    # ========================================
+    # Envelope message helper methods
+    # ========================================
+
+    # Valid payload types for this envelope
+    _VALID_PAYLOAD_TYPES = ("ADCResponse", "DACResponse", "MotorResponse", "SensorResponse",)
+
+    @classmethod
+    def wrap(cls, payload: Union["ADCResponse", "DACResponse", "MotorResponse", "SensorResponse"], sequence_number: int, timestamp_ms: int) -> "ResponseEnvelope":
+        """Create a ResponseEnvelope envelope wrapping a payload message.
+        
+        Args:
+            payload: The message to wrap (must be one of: ADCResponse, DACResponse, MotorResponse, SensorResponse)
+            sequence_number: Envelope field value
+            timestamp_ms: Envelope field value
+        
+        Returns:
+            A fully initialized ResponseEnvelope envelope
+        
+        Raises:
+            TypeError: If payload is not a valid payload type
+        """
+        payload_type_name = type(payload).__name__
+        if payload_type_name not in cls._VALID_PAYLOAD_TYPES:
+            raise TypeError(f"Invalid payload type {payload_type_name}. Must be one of: {cls._VALID_PAYLOAD_TYPES}")
+        
+        # Determine which oneof field to use based on MSG_ID
+        if payload.MSG_ID == ADCResponse.MSG_ID:
+            field_name = "adc"
+        if payload.MSG_ID == DACResponse.MSG_ID:
+            field_name = "dac"
+        if payload.MSG_ID == MotorResponse.MSG_ID:
+            field_name = "motor"
+        if payload.MSG_ID == SensorResponse.MSG_ID:
+            field_name = "sensor"
+        
+        envelope = cls(
+            sequence_number=sequence_number,
+            timestamp_ms=timestamp_ms,
+            response={field_name: payload},
+            response_which=field_name,
+            response_discriminator=payload.MSG_ID
+        )
+        return envelope
+
+    def unwrap(self) -> Union["ADCResponse", "DACResponse", "MotorResponse", "SensorResponse", None]:
+        """Unwrap and get the payload message based on the discriminator.
+        
+        Returns:
+            The payload message matching the discriminator, or None if not set
+        """
+        if self.response_discriminator == ADCResponse.MSG_ID:
+            return self.response.get("adc")
+        elif self.response_discriminator == DACResponse.MSG_ID:
+            return self.response.get("dac")
+        elif self.response_discriminator == MotorResponse.MSG_ID:
+            return self.response.get("motor")
+        elif self.response_discriminator == SensorResponse.MSG_ID:
+            return self.response.get("sensor")
+        return None
+
+    def get_payload_message_id(self) -> int:
+        """Get the message ID of the wrapped payload.
+        
+        Returns:
+            The message ID of the payload in the response union
+        """
+        return self.response_discriminator
+
+#// ============================================================================
+#// Field-Order Discriminator Envelope Test
+#// These inner types intentionally have NO msgid, so the auto-discriminator
+#// falls back to field_order - this exercises the SDK interface enum naming fix.
+#// ============================================================================
+#// Payload type without msgid - forces field_order discriminator
+class RawSamplePayload:
+    msg_size = 6
+    MAX_SIZE = 6  # C++ compatible alias
+    BASE_SIZE = 6  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, channel: int = None, value: float = None, flags: int = None):
+        self.channel = channel if channel is not None else 0
+        self.value = _truncate_float32(value) if value is not None else 0.0
+        self.flags = flags if flags is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BfB", self.channel, self.value, self.flags)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BfB", data, offset)
+        offset += 6
+        fields["channel"] = _vals[0]
+        fields["value"] = _vals[1]
+        fields["flags"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "RawSamplePayload Msg, ID None, Size 6 \n"
+        out += f"channel = {self.channel}\n"
+        out += f"value = {self.value}\n"
+        out += f"flags = {self.flags}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["channel"] = self.channel
+        out["value"] = self.value
+        out["flags"] = self.flags
+        if include_name:
+            out["name"] = "RawSamplePayload"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, RawSamplePayload):
+            return False
+        return (self.channel == other.channel and
+                self.value == other.value and
+                self.flags == other.flags)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Config payload without msgid - forces field_order discriminator
+class RawConfigPayload:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, setting_id: int = None, setting_value: int = None):
+        self.setting_id = setting_id if setting_id is not None else 0
+        self.setting_value = setting_value if setting_value is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH", self.setting_id, self.setting_value)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        fields["setting_id"] = _vals[0]
+        fields["setting_value"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "RawConfigPayload Msg, ID None, Size 3 \n"
+        out += f"setting_id = {self.setting_id}\n"
+        out += f"setting_value = {self.setting_value}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["setting_id"] = self.setting_id
+        out["setting_value"] = self.setting_value
+        if include_name:
+            out["name"] = "RawConfigPayload"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, RawConfigPayload):
+            return False
+        return (self.setting_id == other.setting_id and
+                self.setting_value == other.setting_value)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Envelope wrapping payloads that have no msgid.
+#// Since neither RawSamplePayload nor RawConfigPayload has a msgid,
+#// the auto-discriminator uses field_order, generating a discriminator enum.
+#// This is the scenario that exposed the enum naming bug in SdkInterface.cs.
+class RawDataEnvelope:
+    msg_size = 12
+    MAX_SIZE = 12  # C++ compatible alias
+    BASE_SIZE = 12  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 300
+    MSG_ID = 300  # C++ compatible alias
+    MAGIC1 = 176  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 29  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, priority: int = None, timestamp_us: int = None, payload: dict = None, payload_which: str = None, payload_discriminator: int = None):
+        self.priority = priority if priority is not None else 0
+        self.timestamp_us = timestamp_us if timestamp_us is not None else 0
+        self.payload = payload if payload is not None else {}
+        self.payload_which = payload_which
+        self.payload_discriminator = payload_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BI", self.priority, self.timestamp_us)
+        # Oneof payload discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'sample': 1, 'config': 2}
+        if self.payload_which is not None:
+            data += struct.pack("<B", _field_order_map[self.payload_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof payload payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(6, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BI", data, offset)
+        offset += 5
+        fields["priority"] = _vals[0]
+        fields["timestamp_us"] = _vals[1]
+        # Oneof payload discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["payload_discriminator"] = discriminator
+        # Oneof payload payload
+        fields["payload"] = {}
+        fields["payload_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["payload"]["sample"] = RawSamplePayload._deserialize_fixed(data[offset:offset+RawSamplePayload.MAX_SIZE])
+            fields["payload_which"] = "sample"
+        if discriminator == 2:
+            fields["payload"]["config"] = RawConfigPayload._deserialize_fixed(data[offset:offset+RawConfigPayload.MAX_SIZE])
+            fields["payload_which"] = "config"
+        offset += 6
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "RawDataEnvelope Msg, ID 300, Size 12 \n"
+        out += f"priority = {self.priority}\n"
+        out += f"timestamp_us = {self.timestamp_us}\n"
+        out += f"payload = {self.payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["priority"] = self.priority
+        out["timestamp_us"] = self.timestamp_us
+        if self.payload_which:
+            out["payload"] = self.payload[self.payload_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "RawDataEnvelope"
+        if include_id:
+            out["msg_id"] = "300"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, RawDataEnvelope):
+            return False
+        return (self.priority == other.priority and
+                self.timestamp_us == other.timestamp_us and
+                self.payload == other.payload and
+                self.payload_which == other.payload_which and
+                self.payload_discriminator == other.payload_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+    # ========================================
+    # Envelope message helper methods
+    # ========================================
+
+    # Valid payload types for this envelope
+    _VALID_PAYLOAD_TYPES = ("RawSamplePayload", "RawConfigPayload",)
+
+    @classmethod
+    def wrap(cls, payload: Union["RawSamplePayload", "RawConfigPayload"], priority: int, timestamp_us: int) -> "RawDataEnvelope":
+        """Create a RawDataEnvelope envelope wrapping a payload message.
+        
+        Args:
+            payload: The message to wrap (must be one of: RawSamplePayload, RawConfigPayload)
+            priority: Envelope field value
+            timestamp_us: Envelope field value
+        
+        Returns:
+            A fully initialized RawDataEnvelope envelope
+        
+        Raises:
+            TypeError: If payload is not a valid payload type
+        """
+        payload_type_name = type(payload).__name__
+        if payload_type_name not in cls._VALID_PAYLOAD_TYPES:
+            raise TypeError(f"Invalid payload type {payload_type_name}. Must be one of: {cls._VALID_PAYLOAD_TYPES}")
+        
+        # Determine which oneof field to use and its discriminator value
+        if payload_type_name == "RawSamplePayload":
+            field_name = "sample"
+            discriminator_value = RawDataEnvelopePayloadField.SAMPLE
+        elif payload_type_name == "RawConfigPayload":
+            field_name = "config"
+            discriminator_value = RawDataEnvelopePayloadField.CONFIG
+        
+        envelope = cls(
+            priority=priority,
+            timestamp_us=timestamp_us,
+            payload={field_name: payload},
+            payload_which=field_name,
+            payload_discriminator=discriminator_value
+        )
+        return envelope
+
+    def unwrap(self) -> Union["RawSamplePayload", "RawConfigPayload", None]:
+        """Unwrap and get the payload message based on the discriminator.
+        
+        Returns:
+            The payload message matching the discriminator, or None if not set
+        """
+        if self.payload_discriminator == RawDataEnvelopePayloadField.SAMPLE:
+            return self.payload.get("sample")
+        elif self.payload_discriminator == RawDataEnvelopePayloadField.CONFIG:
+            return self.payload.get("config")
+        return None
+
+    def get_payload_field(self) -> "RawDataEnvelopePayloadField":
+        """Get the discriminator enum value for the wrapped payload.
+        
+        Returns:
+            The RawDataEnvelopePayloadField enum value for the active payload
+        """
+        return self.payload_discriminator
+
+
+__all__ = [
+    'ADCCommand',
+    'ADCResponse',
+    'CommandEnvelope',
+    'DACCommand',
+    'DACResponse',
+    'MotorCommand',
+    'MotorResponse',
+    'RawConfigPayload',
+    'RawDataEnvelope',
+    'RawDataEnvelopePayloadField',
+    'RawSamplePayload',
+    'ResponseEnvelope',
+    'ResponseStatus',
+    'SensorReadCommand',
+    'SensorResponse',
+]
+
+envelope_test_definitions = {
+    112: ADCCommand,
+    113: DACCommand,
+    114: MotorCommand,
+    115: SensorReadCommand,
+    200: CommandEnvelope,
+    212: ADCResponse,
+    213: DACResponse,
+    214: MotorResponse,
+    215: SensorResponse,
+    250: ResponseEnvelope,
+    300: RawDataEnvelope,
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from message ID"""
+    return envelope_test_definitions.get(msg_id)
+
+def get_msg_length(msg_id: int) -> int:
+    """Get message size from message ID (for minimal frame parsing)"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a message ID.
+    
+    Args:
+        msg_id: Message ID
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
@@ -0,0 +1,860 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Message definitions 
+#// Extended test messages for struct-frame code generation framework
+#// Tests for message IDs > 255 (require extended profiles with pkg_id)
+#// Also tests for extended payloads > 255 bytes (require 2-byte length field)
+#//
+#// These messages are only compatible with extended profiles:
+#// - profile_bulk (BasicExtended): supports extended msg_id and extended payload
+#// - profile_network (BasicExtendedMultiSystemStream): supports extended msg_id and extended payload
+#// ============================================================================
+#// Extended Message ID Tests (msgid > 255)
+#// Three representative IDs cover the full range: boundary (256), mid (1000), high (4000).
+#// ============================================================================
+#// Message with ID 256 - tests minimum extended ID (just above 255)
+class ExtendedIdMessage10:
+    msg_size = 19
+    MAX_SIZE = 19  # C++ compatible alias
+    BASE_SIZE = 19  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 256
+    MSG_ID = 256  # C++ compatible alias
+    MAGIC1 = 28  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 50  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, small_value: int = None, short_text: bytes = None, flag: bool = None):
+        self.small_value = small_value if small_value is not None else 0
+        self.short_text = short_text if short_text is not None else b""
+        self.flag = flag if flag is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<H", self.small_value)
+        # Fixed string: short_text
+        data += struct.pack("<16s", self.short_text[:16])
+        data += struct.pack("<?", self.flag)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["small_value"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        # Fixed string: short_text
+        fields["short_text"] = struct.unpack_from("<16s", data, offset)[0]
+        offset += 16
+        fields["flag"] = struct.unpack_from("<?", data, offset)[0]
+        offset += 1
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtendedIdMessage10 Msg, ID 256, Size 19 \n"
+        out += f"small_value = {self.small_value}\n"
+        out += f"short_text = {self.short_text}\n"
+        out += f"flag = {self.flag}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["small_value"] = self.small_value
+        out["short_text"] = self.short_text
+        out["flag"] = self.flag
+        if include_name:
+            out["name"] = "ExtendedIdMessage10"
+        if include_id:
+            out["msg_id"] = "256"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtendedIdMessage10):
+            return False
+        return (self.small_value == other.small_value and
+                self.short_text == other.short_text and
+                self.flag == other.flag)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Message with ID 1000 - tests mid-range extended ID
+class ExtendedIdMessage2:
+    msg_size = 79
+    MAX_SIZE = 79  # C++ compatible alias
+    BASE_SIZE = 79  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 1000
+    MSG_ID = 1000  # C++ compatible alias
+    MAGIC1 = 40  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 89  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sensor_id: int = None, reading: float = None, status_code: int = None, description: bytes = None):
+        self.sensor_id = sensor_id if sensor_id is not None else 0
+        self.reading = reading if reading is not None else 0.0
+        self.status_code = status_code if status_code is not None else 0
+        self.description = description if description is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<idH", self.sensor_id, self.reading, self.status_code)
+        # Variable string: description
+        str_data = self.description[:64]
+        data += struct.pack("<B64s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<idH", data, offset)
+        offset += 14
+        fields["sensor_id"] = _vals[0]
+        fields["reading"] = _vals[1]
+        fields["status_code"] = _vals[2]
+        # Variable string: description
+        _s = struct.unpack_from("<B64s", data, offset)
+        fields["description"] = _s[1][:_s[0]]
+        offset += 65
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtendedIdMessage2 Msg, ID 1000, Size 79 \n"
+        out += f"sensor_id = {self.sensor_id}\n"
+        out += f"reading = {self.reading}\n"
+        out += f"status_code = {self.status_code}\n"
+        out += f"description = {self.description}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sensor_id"] = self.sensor_id
+        out["reading"] = self.reading
+        out["status_code"] = self.status_code
+        out["description"] = self.description
+        if include_name:
+            out["name"] = "ExtendedIdMessage2"
+        if include_id:
+            out["msg_id"] = "1000"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtendedIdMessage2):
+            return False
+        return (self.sensor_id == other.sensor_id and
+                self.reading == other.reading and
+                self.status_code == other.status_code and
+                self.description == other.description)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Message with ID 4000 - tests high extended ID with 64-bit fields
+class ExtendedIdMessage9:
+    msg_size = 24
+    MAX_SIZE = 24  # C++ compatible alias
+    BASE_SIZE = 24  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 4000
+    MSG_ID = 4000  # C++ compatible alias
+    MAGIC1 = 36  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 71  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, big_number: int = None, big_unsigned: int = None, precision_value: float = None):
+        self.big_number = big_number if big_number is not None else 0
+        self.big_unsigned = big_unsigned if big_unsigned is not None else 0
+        self.precision_value = precision_value if precision_value is not None else 0.0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<qQd", self.big_number, self.big_unsigned, self.precision_value)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<qQd", data, offset)
+        offset += 24
+        fields["big_number"] = _vals[0]
+        fields["big_unsigned"] = _vals[1]
+        fields["precision_value"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtendedIdMessage9 Msg, ID 4000, Size 24 \n"
+        out += f"big_number = {self.big_number}\n"
+        out += f"big_unsigned = {self.big_unsigned}\n"
+        out += f"precision_value = {self.precision_value}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["big_number"] = self.big_number
+        out["big_unsigned"] = self.big_unsigned
+        out["precision_value"] = self.precision_value
+        if include_name:
+            out["name"] = "ExtendedIdMessage9"
+        if include_id:
+            out["msg_id"] = "4000"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtendedIdMessage9):
+            return False
+        return (self.big_number == other.big_number and
+                self.big_unsigned == other.big_unsigned and
+                self.precision_value == other.precision_value)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Extended Payload Tests (payload > 255 bytes)
+#// These require profiles with 2-byte length field
+#// ============================================================================
+#// Large message with payload > 255 bytes (fixed arrays: 64 floats = 256 bytes)
+class LargePayloadMessage1:
+    msg_size = 300
+    MAX_SIZE = 300  # C++ compatible alias
+    BASE_SIZE = 300  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 800
+    MSG_ID = 800  # C++ compatible alias
+    MAGIC1 = 45  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 99  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sensor_readings: List[float] = None, reading_count: int = None, timestamp: int = None, device_name: bytes = None):
+        self.sensor_readings = [_truncate_float32(v) for v in sensor_readings] if sensor_readings is not None else []
+        self.reading_count = reading_count if reading_count is not None else 0
+        self.timestamp = timestamp if timestamp is not None else 0
+        self.device_name = device_name if device_name is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        # Fixed array: sensor_readings
+        _vals = list(self.sensor_readings[:64])
+        _vals += [0] * (64 - len(_vals))
+        data += struct.pack("<64f", *_vals)
+        data += struct.pack("<Iq", self.reading_count, self.timestamp)
+        # Fixed string: device_name
+        data += struct.pack("<32s", self.device_name[:32])
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        # Fixed array: sensor_readings
+        fields["sensor_readings"] = list(struct.unpack_from("<64f", data, offset))
+        offset += 256
+        _vals = struct.unpack_from("<Iq", data, offset)
+        offset += 12
+        fields["reading_count"] = _vals[0]
+        fields["timestamp"] = _vals[1]
+        # Fixed string: device_name
+        fields["device_name"] = struct.unpack_from("<32s", data, offset)[0]
+        offset += 32
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "LargePayloadMessage1 Msg, ID 800, Size 300 \n"
+        out += f"sensor_readings = {self.sensor_readings}\n"
+        out += f"reading_count = {self.reading_count}\n"
+        out += f"timestamp = {self.timestamp}\n"
+        out += f"device_name = {self.device_name}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sensor_readings"] = self.sensor_readings
+        out["reading_count"] = self.reading_count
+        out["timestamp"] = self.timestamp
+        out["device_name"] = self.device_name
+        if include_name:
+            out["name"] = "LargePayloadMessage1"
+        if include_id:
+            out["msg_id"] = "800"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, LargePayloadMessage1):
+            return False
+        return (self.sensor_readings == other.sensor_readings and
+                self.reading_count == other.reading_count and
+                self.timestamp == other.timestamp and
+                self.device_name == other.device_name)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Large message with fixed array of 280 bytes
+class LargePayloadMessage2:
+    msg_size = 280
+    MAX_SIZE = 280  # C++ compatible alias
+    BASE_SIZE = 280  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 801
+    MSG_ID = 801  # C++ compatible alias
+    MAGIC1 = 2  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 2  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, large_data: List[int] = None):
+        self.large_data = large_data if large_data is not None else []
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        # Fixed array: large_data
+        _vals = list(self.large_data[:280])
+        _vals += [0] * (280 - len(_vals))
+        data += struct.pack("<280B", *_vals)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        # Fixed array: large_data
+        fields["large_data"] = list(struct.unpack_from("<280B", data, offset))
+        offset += 280
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "LargePayloadMessage2 Msg, ID 801, Size 280 \n"
+        out += f"large_data = {self.large_data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["large_data"] = self.large_data
+        if include_name:
+            out["name"] = "LargePayloadMessage2"
+        if include_id:
+            out["msg_id"] = "801"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, LargePayloadMessage2):
+            return False
+        return (self.large_data == other.large_data)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Variable Length Message Tests for Extended IDs (msgid: 802)
+#// ============================================================================
+#// Variable message with extended ID and single bounded array (msgid: 802)
+class ExtendedVariableSingleArray:
+    msg_size = 263
+    MAX_SIZE = 263  # C++ compatible alias
+    BASE_SIZE = 263  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 802
+    MSG_ID = 802  # C++ compatible alias
+    MAGIC1 = 23  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 50  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 13  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, timestamp: int = None, telemetry_data: List[int] = None, crc: int = None):
+        self.timestamp = timestamp if timestamp is not None else 0
+        self.telemetry_data = telemetry_data if telemetry_data is not None else []
+        self.crc = crc if crc is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<Q", self.timestamp)
+        # Bounded array: telemetry_data
+        data += struct.pack("<B", min(len(self.telemetry_data), 250))
+        _vals = list(self.telemetry_data[:250])
+        _vals += [0] * (250 - len(_vals))
+        data += struct.pack("<250B", *_vals)
+        data += struct.pack("<I", self.crc)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["timestamp"] = struct.unpack_from("<Q", data, offset)[0]
+        offset += 8
+        # Bounded array: telemetry_data
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<250B", data, offset)
+        offset += 250
+        fields["telemetry_data"] = list(_all[:min(count, 250)])
+        fields["crc"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtendedVariableSingleArray Msg, ID 802, Size 263 \n"
+        out += f"timestamp = {self.timestamp}\n"
+        out += f"telemetry_data = {self.telemetry_data}\n"
+        out += f"crc = {self.crc}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["timestamp"] = self.timestamp
+        out["telemetry_data"] = self.telemetry_data
+        out["crc"] = self.crc
+        if include_name:
+            out["name"] = "ExtendedVariableSingleArray"
+        if include_id:
+            out["msg_id"] = "802"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtendedVariableSingleArray):
+            return False
+        return (self.timestamp == other.timestamp and
+                self.telemetry_data == other.telemetry_data and
+                self.crc == other.crc)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 8  # timestamp
+        size += 1 + (min(len(self.telemetry_data), 250) * 1)  # telemetry_data
+        size += 4  # crc
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<Q", self.timestamp)
+        # Bounded array: telemetry_data
+        _n = min(len(self.telemetry_data), 250)
+        data += struct.pack("<B", _n)
+        _vals = list(self.telemetry_data[:_n])
+        data += struct.pack("<%dB" % _n, *_vals)
+        data += struct.pack("<I", self.crc)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # timestamp: uint64
+        fields["timestamp"] = struct.unpack_from("<Q", data, offset)[0]
+        offset += 8
+        # telemetry_data: variable uint8 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 250)
+        fields["telemetry_data"] = list(struct.unpack_from("<%dB" % _n, data, offset))
+        offset += _n * 1
+        # crc: uint32
+        fields["crc"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// Variable message with bounded fields whose max_size > 255, forcing 2-byte
+#// count/length prefixes in the variable encoding. Regression cover for the
+#// encoder/decoder/serialized_size prefix-width agreement: a 1-byte read on a
+#// 2-byte prefix corrupts every following field.
+class ExtendedVariableLargeArray:
+    msg_size = 610
+    MAX_SIZE = 610  # C++ compatible alias
+    BASE_SIZE = 610  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 803
+    MSG_ID = 803  # C++ compatible alias
+    MAGIC1 = 31  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 70  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 10  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, id: int = None, big_telemetry: List[int] = None, big_label: bytes = None, trailer: int = None):
+        self.id = id if id is not None else 0
+        self.big_telemetry = big_telemetry if big_telemetry is not None else []
+        self.big_label = big_label if big_label is not None else b""
+        self.trailer = trailer if trailer is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<I", self.id)
+        # Bounded array: big_telemetry
+        data += struct.pack("<H", min(len(self.big_telemetry), 300))
+        _vals = list(self.big_telemetry[:300])
+        _vals += [0] * (300 - len(_vals))
+        data += struct.pack("<300B", *_vals)
+        # Variable string: big_label
+        str_data = self.big_label[:300]
+        data += struct.pack("<H300s", len(str_data), str_data)
+        data += struct.pack("<H", self.trailer)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # Bounded array: big_telemetry
+        count = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        _all = struct.unpack_from("<300B", data, offset)
+        offset += 300
+        fields["big_telemetry"] = list(_all[:min(count, 300)])
+        # Variable string: big_label
+        _s = struct.unpack_from("<H300s", data, offset)
+        fields["big_label"] = _s[1][:_s[0]]
+        offset += 302
+        fields["trailer"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtendedVariableLargeArray Msg, ID 803, Size 610 \n"
+        out += f"id = {self.id}\n"
+        out += f"big_telemetry = {self.big_telemetry}\n"
+        out += f"big_label = {self.big_label}\n"
+        out += f"trailer = {self.trailer}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["id"] = self.id
+        out["big_telemetry"] = self.big_telemetry
+        out["big_label"] = self.big_label
+        out["trailer"] = self.trailer
+        if include_name:
+            out["name"] = "ExtendedVariableLargeArray"
+        if include_id:
+            out["msg_id"] = "803"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtendedVariableLargeArray):
+            return False
+        return (self.id == other.id and
+                self.big_telemetry == other.big_telemetry and
+                self.big_label == other.big_label and
+                self.trailer == other.trailer)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 4  # id
+        size += 2 + (min(len(self.big_telemetry), 300) * 1)  # big_telemetry
+        size += 2 + min(len(self.big_label), 300)  # big_label
+        size += 2  # trailer
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<I", self.id)
+        # Bounded array: big_telemetry
+        _n = min(len(self.big_telemetry), 300)
+        data += struct.pack("<H", _n)
+        _vals = list(self.big_telemetry[:_n])
+        data += struct.pack("<%dB" % _n, *_vals)
+        # Variable string: big_label
+        str_data = self.big_label[:300]
+        data += struct.pack("<H", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        data += struct.pack("<H", self.trailer)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # id: uint32
+        fields["id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # big_telemetry: variable uint8 array
+        count = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        _n = min(count, 300)
+        fields["big_telemetry"] = list(struct.unpack_from("<%dB" % _n, data, offset))
+        offset += _n * 1
+        # big_label: variable string
+        str_len = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        str_len = min(str_len, 300)
+        fields["big_label"] = data[offset:offset+str_len]
+        offset += str_len
+        # trailer: uint16
+        fields["trailer"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+
+__all__ = [
+    'ExtendedIdMessage10',
+    'ExtendedIdMessage2',
+    'ExtendedIdMessage9',
+    'ExtendedVariableLargeArray',
+    'ExtendedVariableSingleArray',
+    'LargePayloadMessage1',
+    'LargePayloadMessage2',
+]
+
+extended_test_definitions = {
+    256: ExtendedIdMessage10,
+    1000: ExtendedIdMessage2,
+    4000: ExtendedIdMessage9,
+    800: LargePayloadMessage1,
+    801: LargePayloadMessage2,
+    802: ExtendedVariableSingleArray,
+    803: ExtendedVariableLargeArray,
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from message ID"""
+    return extended_test_definitions.get(msg_id)
+
+def get_msg_length(msg_id: int) -> int:
+    """Get message size from message ID (for minimal frame parsing)"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a message ID.
+    
+    Args:
+        msg_id: Message ID
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
@@ -0,0 +1,160 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Package ID for extended message IDs
+PACKAGE_ID = 2
+
+# Enum definitions
+#// Package A for testing package imports and inheritance
+class ActionType(Enum):
+    START = 0
+    STOP = 1
+    PAUSE = 2
+    RESUME = 3
+
+# Message definitions 
+class ActionMessage:
+    msg_size = 70
+    MAX_SIZE = 70  # C++ compatible alias
+    BASE_SIZE = 70  # Non-extension portion size (== MAX_SIZE when no extensions)
+    # Combined 16-bit ID: (PACKAGE_ID << 8) | local_msg_id = (2 << 8) | 1 = 513
+    msg_id = 513
+    MSG_ID = 513  # C++ compatible alias (combined: pkg_id=2, local_id=1)
+    MAGIC1 = 36  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 71  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, action: int = None, target_id: int = None, description: bytes = None):
+        self.action = action if action is not None else 0
+        self.target_id = target_id if target_id is not None else 0
+        self.description = description if description is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BI", self.action, self.target_id)
+        # Variable string: description
+        str_data = self.description[:64]
+        data += struct.pack("<B64s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BI", data, offset)
+        offset += 5
+        fields["action"] = _vals[0]
+        fields["target_id"] = _vals[1]
+        # Variable string: description
+        _s = struct.unpack_from("<B64s", data, offset)
+        fields["description"] = _s[1][:_s[0]]
+        offset += 65
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ActionMessage Msg, ID 513, Size 70 \n"
+        out += f"action = {self.action}\n"
+        out += f"target_id = {self.target_id}\n"
+        out += f"description = {self.description}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["action"] = self.action
+        out["target_id"] = self.target_id
+        out["description"] = self.description
+        if include_name:
+            out["name"] = "ActionMessage"
+        if include_id:
+            out["msg_id"] = "513"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ActionMessage):
+            return False
+        return (self.action == other.action and
+                self.target_id == other.target_id and
+                self.description == other.description)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+
+__all__ = [
+    'ActionMessage',
+    'ActionType',
+]
+
+# Message definitions dictionary with package ID support
+# Format: (package_id << 8) | msg_id => Message class
+pkg_test_a_definitions = {
+    513: ActionMessage,  # pkg_id=2, msg_id=1
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from 16-bit message ID (package_id << 8 | msg_id)"""
+    return pkg_test_a_definitions.get(msg_id)
+
+def get_message_size(msg_id: int) -> int:
+    """Get message size from 16-bit message ID"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+# Alias for minimal frame parsing compatibility
+get_msg_length = get_message_size
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a 16-bit message ID.
+    
+    Args:
+        msg_id: 16-bit message ID (pkg_id << 8 | local_msg_id)
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
@@ -0,0 +1,250 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+from .common_types import Status, Timestamp
+from .pkg_test_a import ActionMessage, ActionType
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Package ID for extended message IDs
+PACKAGE_ID = 1
+
+# Message definitions 
+#// Package test messages that imports common_types and pkg_test_a
+#// common_types.proto has no pkgid, so it will inherit pkgid=1 from this file
+#// pkg_test_a.proto has its own pkgid=2
+#// Message using types from common_types (which inherits pkgid=1)
+class PackageTestMessage:
+    msg_size = 45
+    MAX_SIZE = 45  # C++ compatible alias
+    BASE_SIZE = 45  # Non-extension portion size (== MAX_SIZE when no extensions)
+    # Combined 16-bit ID: (PACKAGE_ID << 8) | local_msg_id = (1 << 8) | 1 = 257
+    msg_id = 257
+    MSG_ID = 257  # C++ compatible alias (combined: pkg_id=1, local_id=1)
+    MAGIC1 = 211  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 76  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, created_at: Timestamp = None, current_status: int = None, name: bytes = None):
+        self.created_at = created_at if created_at is not None else Timestamp()
+        self.current_status = current_status if current_status is not None else 0
+        self.name = name if name is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += self.created_at.serialize()
+        data += struct.pack("<B", self.current_status)
+        # Fixed string: name
+        data += struct.pack("<32s", self.name[:32])
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["created_at"] = Timestamp._deserialize_fixed(data[offset:offset+Timestamp.MAX_SIZE])
+        offset += Timestamp.MAX_SIZE
+        fields["current_status"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Fixed string: name
+        fields["name"] = struct.unpack_from("<32s", data, offset)[0]
+        offset += 32
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "PackageTestMessage Msg, ID 257, Size 45 \n"
+        out += f"created_at = {self.created_at}\n"
+        out += f"current_status = {self.current_status}\n"
+        out += f"name = {self.name}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["created_at"] = self.created_at.to_dict(False, False)
+        out["current_status"] = self.current_status
+        out["name"] = self.name
+        if include_name:
+            out["name"] = "PackageTestMessage"
+        if include_id:
+            out["msg_id"] = "257"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, PackageTestMessage):
+            return False
+        return (self.created_at == other.created_at and
+                self.current_status == other.current_status and
+                self.name == other.name)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Message using types from pkg_test_a (which has pkgid=2)
+class CrossPackageMessage:
+    msg_size = 134
+    MAX_SIZE = 134  # C++ compatible alias
+    BASE_SIZE = 134  # Non-extension portion size (== MAX_SIZE when no extensions)
+    # Combined 16-bit ID: (PACKAGE_ID << 8) | local_msg_id = (1 << 8) | 2 = 258
+    msg_id = 258
+    MSG_ID = 258  # C++ compatible alias (combined: pkg_id=1, local_id=2)
+    MAGIC1 = 36  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 63  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, message_id: int = None, action: int = None, payload: bytes = None):
+        self.message_id = message_id if message_id is not None else 0
+        self.action = action if action is not None else 0
+        self.payload = payload if payload is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<IB", self.message_id, self.action)
+        # Variable string: payload
+        str_data = self.payload[:128]
+        data += struct.pack("<B128s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<IB", data, offset)
+        offset += 5
+        fields["message_id"] = _vals[0]
+        fields["action"] = _vals[1]
+        # Variable string: payload
+        _s = struct.unpack_from("<B128s", data, offset)
+        fields["payload"] = _s[1][:_s[0]]
+        offset += 129
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "CrossPackageMessage Msg, ID 258, Size 134 \n"
+        out += f"message_id = {self.message_id}\n"
+        out += f"action = {self.action}\n"
+        out += f"payload = {self.payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["message_id"] = self.message_id
+        out["action"] = self.action
+        out["payload"] = self.payload
+        if include_name:
+            out["name"] = "CrossPackageMessage"
+        if include_id:
+            out["msg_id"] = "258"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, CrossPackageMessage):
+            return False
+        return (self.message_id == other.message_id and
+                self.action == other.action and
+                self.payload == other.payload)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+
+__all__ = [
+    'CrossPackageMessage',
+    'PackageTestMessage',
+]
+
+# Message definitions dictionary with package ID support
+# Format: (package_id << 8) | msg_id => Message class
+pkg_test_messages_definitions = {
+    257: PackageTestMessage,  # pkg_id=1, msg_id=1
+    258: CrossPackageMessage,  # pkg_id=1, msg_id=2
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from 16-bit message ID (package_id << 8 | msg_id)"""
+    return pkg_test_messages_definitions.get(msg_id)
+
+def get_message_size(msg_id: int) -> int:
+    """Get message size from 16-bit message ID"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+# Alias for minimal frame parsing compatibility
+get_msg_length = get_message_size
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a 16-bit message ID.
+    
+    Args:
+        msg_id: 16-bit message ID (pkg_id << 8 | local_msg_id)
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
@@ -0,0 +1,3883 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Enum definitions
+#// Combined test messages for struct-frame code generation framework
+#// This file consolidates all test message definitions for testing
+#//
+#// Note: NestedMessage (from original nested_messages.proto) is intentionally
+#// excluded because the JavaScript code generator has a bug with nested struct
+#// references. The test suite only uses SerializationTestMessage for cross-language
+#// testing, so this exclusion doesn't affect test coverage.
+#// ============================================================================
+#// Enums
+#// ============================================================================
+class Priority(Enum):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+class Status(Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+    ERROR = 2
+    MAINTENANCE = 3
+
+class MsgSeverity(Enum):
+    SEV_MSG = 0
+    SEV_ERROR = 1
+    SEV_WARN = 2
+    SEV_INFO = 3
+    SEV_DEBUG = 4
+
+# Oneof discriminator enums
+class UnionTestMessageFieldOrderDataField(Enum):
+    """Discriminator enum for UnionTestMessageFieldOrder.data oneof"""
+    NONE = 0
+    BASIC_PAYLOAD = 1
+    SIMPLE_PAYLOAD = 2
+
+class VariableEnvelopeMessagePayloadField(Enum):
+    """Discriminator enum for VariableEnvelopeMessage.payload oneof"""
+    NONE = 0
+    PAYLOAD_A = 1
+    PAYLOAD_B = 2
+
+class VariableOneofMessageDataField(Enum):
+    """Discriminator enum for VariableOneofMessage.data oneof"""
+    NONE = 0
+    SMALL_PAYLOAD = 1
+    LARGE_PAYLOAD = 2
+
+class MaxSizeOneofMessageDataField(Enum):
+    """Discriminator enum for MaxSizeOneofMessage.data oneof"""
+    NONE = 0
+    SMALL_PAYLOAD = 1
+
+class MinSizeOneofMessageDataField(Enum):
+    """Discriminator enum for MinSizeOneofMessage.data oneof"""
+    NONE = 0
+    SMALL_PAYLOAD = 1
+    LARGE_PAYLOAD = 2
+
+# Message definitions 
+#// ============================================================================
+#// Basic Types Test Message (msgid: 201)
+#// ============================================================================
+#// Test all basic data types
+class BasicTypesMessage:
+    msg_size = 204
+    MAX_SIZE = 204  # C++ compatible alias
+    BASE_SIZE = 204  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 201
+    MSG_ID = 201  # C++ compatible alias
+    MAGIC1 = 181  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 194  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, small_int: int = None, medium_int: int = None, regular_int: int = None, large_int: int = None, small_uint: int = None, medium_uint: int = None, regular_uint: int = None, large_uint: int = None, single_precision: float = None, double_precision: float = None, flag: bool = None, device_id: bytes = None, description: bytes = None):
+        self.small_int = small_int if small_int is not None else 0
+        self.medium_int = medium_int if medium_int is not None else 0
+        self.regular_int = regular_int if regular_int is not None else 0
+        self.large_int = large_int if large_int is not None else 0
+        self.small_uint = small_uint if small_uint is not None else 0
+        self.medium_uint = medium_uint if medium_uint is not None else 0
+        self.regular_uint = regular_uint if regular_uint is not None else 0
+        self.large_uint = large_uint if large_uint is not None else 0
+        self.single_precision = _truncate_float32(single_precision) if single_precision is not None else 0.0
+        self.double_precision = double_precision if double_precision is not None else 0.0
+        self.flag = flag if flag is not None else False
+        self.device_id = device_id if device_id is not None else b""
+        self.description = description if description is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<bhiqBHIQfd?", self.small_int, self.medium_int, self.regular_int, self.large_int, self.small_uint, self.medium_uint, self.regular_uint, self.large_uint, self.single_precision, self.double_precision, self.flag)
+        # Fixed string: device_id
+        data += struct.pack("<32s", self.device_id[:32])
+        # Variable string: description
+        str_data = self.description[:128]
+        data += struct.pack("<B128s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<bhiqBHIQfd?", data, offset)
+        offset += 43
+        fields["small_int"] = _vals[0]
+        fields["medium_int"] = _vals[1]
+        fields["regular_int"] = _vals[2]
+        fields["large_int"] = _vals[3]
+        fields["small_uint"] = _vals[4]
+        fields["medium_uint"] = _vals[5]
+        fields["regular_uint"] = _vals[6]
+        fields["large_uint"] = _vals[7]
+        fields["single_precision"] = _vals[8]
+        fields["double_precision"] = _vals[9]
+        fields["flag"] = _vals[10]
+        # Fixed string: device_id
+        fields["device_id"] = struct.unpack_from("<32s", data, offset)[0]
+        offset += 32
+        # Variable string: description
+        _s = struct.unpack_from("<B128s", data, offset)
+        fields["description"] = _s[1][:_s[0]]
+        offset += 129
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "BasicTypesMessage Msg, ID 201, Size 204 \n"
+        out += f"small_int = {self.small_int}\n"
+        out += f"medium_int = {self.medium_int}\n"
+        out += f"regular_int = {self.regular_int}\n"
+        out += f"large_int = {self.large_int}\n"
+        out += f"small_uint = {self.small_uint}\n"
+        out += f"medium_uint = {self.medium_uint}\n"
+        out += f"regular_uint = {self.regular_uint}\n"
+        out += f"large_uint = {self.large_uint}\n"
+        out += f"single_precision = {self.single_precision}\n"
+        out += f"double_precision = {self.double_precision}\n"
+        out += f"flag = {self.flag}\n"
+        out += f"device_id = {self.device_id}\n"
+        out += f"description = {self.description}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["small_int"] = self.small_int
+        out["medium_int"] = self.medium_int
+        out["regular_int"] = self.regular_int
+        out["large_int"] = self.large_int
+        out["small_uint"] = self.small_uint
+        out["medium_uint"] = self.medium_uint
+        out["regular_uint"] = self.regular_uint
+        out["large_uint"] = self.large_uint
+        out["single_precision"] = self.single_precision
+        out["double_precision"] = self.double_precision
+        out["flag"] = self.flag
+        out["device_id"] = self.device_id
+        out["description"] = self.description
+        if include_name:
+            out["name"] = "BasicTypesMessage"
+        if include_id:
+            out["msg_id"] = "201"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, BasicTypesMessage):
+            return False
+        return (self.small_int == other.small_int and
+                self.medium_int == other.medium_int and
+                self.regular_int == other.regular_int and
+                self.large_int == other.large_int and
+                self.small_uint == other.small_uint and
+                self.medium_uint == other.medium_uint and
+                self.regular_uint == other.regular_uint and
+                self.large_uint == other.large_uint and
+                self.single_precision == other.single_precision and
+                self.double_precision == other.double_precision and
+                self.flag == other.flag and
+                self.device_id == other.device_id and
+                self.description == other.description)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Comprehensive Arrays Test (msgid: 203)
+#// ============================================================================
+class Sensor:
+    msg_size = 22
+    MAX_SIZE = 22  # C++ compatible alias
+    BASE_SIZE = 22  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, id: int = None, value: float = None, status: int = None, name: bytes = None):
+        self.id = id if id is not None else 0
+        self.value = _truncate_float32(value) if value is not None else 0.0
+        self.status = status if status is not None else 0
+        self.name = name if name is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BfB", self.id, self.value, self.status)
+        # Fixed string: name
+        data += struct.pack("<16s", self.name[:16])
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BfB", data, offset)
+        offset += 6
+        fields["id"] = _vals[0]
+        fields["value"] = _vals[1]
+        fields["status"] = _vals[2]
+        # Fixed string: name
+        fields["name"] = struct.unpack_from("<16s", data, offset)[0]
+        offset += 16
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "Sensor Msg, ID None, Size 22 \n"
+        out += f"id = {self.id}\n"
+        out += f"value = {self.value}\n"
+        out += f"status = {self.status}\n"
+        out += f"name = {self.name}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["id"] = self.id
+        out["value"] = self.value
+        out["status"] = self.status
+        out["name"] = self.name
+        if include_name:
+            out["name"] = "Sensor"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, Sensor):
+            return False
+        return (self.id == other.id and
+                self.value == other.value and
+                self.status == other.status and
+                self.name == other.name)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+class ComprehensiveArrayMessage:
+    msg_size = 139
+    MAX_SIZE = 139  # C++ compatible alias
+    BASE_SIZE = 139  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 203
+    MSG_ID = 203  # C++ compatible alias
+    MAGIC1 = 137  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 147  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, fixed_ints: List[int] = None, fixed_floats: List[float] = None, fixed_bools: List[bool] = None, bounded_uints: List[int] = None, bounded_doubles: List[float] = None, fixed_strings: List[bytes] = None, bounded_strings: List[bytes] = None, fixed_statuses: List[int] = None, bounded_statuses: List[int] = None, fixed_sensors: List[Sensor] = None, bounded_sensors: List[Sensor] = None):
+        self.fixed_ints = fixed_ints if fixed_ints is not None else []
+        self.fixed_floats = [_truncate_float32(v) for v in fixed_floats] if fixed_floats is not None else []
+        self.fixed_bools = fixed_bools if fixed_bools is not None else []
+        self.bounded_uints = bounded_uints if bounded_uints is not None else []
+        self.bounded_doubles = bounded_doubles if bounded_doubles is not None else []
+        self.fixed_strings = fixed_strings if fixed_strings is not None else []
+        self.bounded_strings = bounded_strings if bounded_strings is not None else []
+        self.fixed_statuses = fixed_statuses if fixed_statuses is not None else []
+        self.bounded_statuses = bounded_statuses if bounded_statuses is not None else []
+        self.fixed_sensors = fixed_sensors if fixed_sensors is not None else []
+        self.bounded_sensors = bounded_sensors if bounded_sensors is not None else []
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        # Fixed array: fixed_ints
+        _vals = list(self.fixed_ints[:3])
+        _vals += [0] * (3 - len(_vals))
+        data += struct.pack("<3i", *_vals)
+        # Fixed array: fixed_floats
+        _vals = list(self.fixed_floats[:2])
+        _vals += [0] * (2 - len(_vals))
+        data += struct.pack("<2f", *_vals)
+        # Fixed array: fixed_bools
+        _vals = list(self.fixed_bools[:4])
+        _vals += [0] * (4 - len(_vals))
+        data += struct.pack("<4?", *_vals)
+        # Bounded array: bounded_uints
+        data += struct.pack("<B", min(len(self.bounded_uints), 3))
+        _vals = list(self.bounded_uints[:3])
+        _vals += [0] * (3 - len(_vals))
+        data += struct.pack("<3H", *_vals)
+        # Bounded array: bounded_doubles
+        data += struct.pack("<B", min(len(self.bounded_doubles), 2))
+        _vals = list(self.bounded_doubles[:2])
+        _vals += [0] * (2 - len(_vals))
+        data += struct.pack("<2d", *_vals)
+        # Fixed string array: fixed_strings
+        _elems = [self.fixed_strings[i][:8] if i < len(self.fixed_strings) else b"" for i in range(2)]
+        data += struct.pack("<8s8s", *_elems)
+        # Bounded string array: bounded_strings
+        _elems = [self.bounded_strings[i][:12] if i < len(self.bounded_strings) else b"" for i in range(2)]
+        data += struct.pack("<B12s12s", min(len(self.bounded_strings), 2), *_elems)
+        # Fixed array: fixed_statuses
+        _vals = list(self.fixed_statuses[:2])
+        _vals += [0] * (2 - len(_vals))
+        data += struct.pack("<2B", *(int(v) for v in _vals))
+        # Bounded array: bounded_statuses
+        data += struct.pack("<B", min(len(self.bounded_statuses), 2))
+        _vals = list(self.bounded_statuses[:2])
+        _vals += [0] * (2 - len(_vals))
+        data += struct.pack("<2B", *(int(v) for v in _vals))
+        # Fixed nested message array: fixed_sensors
+        for i in range(1):
+            if i < len(self.fixed_sensors):
+                data += self.fixed_sensors[i].serialize()
+            else:
+                data += Sensor().serialize()
+        # Bounded nested message array: bounded_sensors
+        data += struct.pack("<B", min(len(self.bounded_sensors), 1))
+        for i in range(1):
+            if i < len(self.bounded_sensors):
+                data += self.bounded_sensors[i].serialize()
+            else:
+                data += Sensor().serialize()
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        # Fixed array: fixed_ints
+        fields["fixed_ints"] = list(struct.unpack_from("<3i", data, offset))
+        offset += 12
+        # Fixed array: fixed_floats
+        fields["fixed_floats"] = list(struct.unpack_from("<2f", data, offset))
+        offset += 8
+        # Fixed array: fixed_bools
+        fields["fixed_bools"] = list(struct.unpack_from("<4?", data, offset))
+        offset += 4
+        # Bounded array: bounded_uints
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<3H", data, offset)
+        offset += 6
+        fields["bounded_uints"] = list(_all[:min(count, 3)])
+        # Bounded array: bounded_doubles
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<2d", data, offset)
+        offset += 16
+        fields["bounded_doubles"] = list(_all[:min(count, 2)])
+        # Fixed string array: fixed_strings
+        fields["fixed_strings"] = list(struct.unpack_from("<8s8s", data, offset))
+        offset += 16
+        # Bounded string array: bounded_strings
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<12s12s", data, offset)
+        offset += 24
+        fields["bounded_strings"] = list(_all[:min(count, 2)])
+        # Fixed array: fixed_statuses
+        fields["fixed_statuses"] = list(struct.unpack_from("<2B", data, offset))
+        offset += 2
+        # Bounded array: bounded_statuses
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<2B", data, offset)
+        offset += 2
+        fields["bounded_statuses"] = list(_all[:min(count, 2)])
+        # Fixed nested message array: fixed_sensors
+        fields["fixed_sensors"] = []
+        for i in range(1):
+            msg = Sensor._deserialize_fixed(data[offset:offset+Sensor.MAX_SIZE])
+            fields["fixed_sensors"].append(msg)
+            offset += Sensor.MAX_SIZE
+        # Bounded nested message array: bounded_sensors
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["bounded_sensors"] = []
+        for i in range(1):
+            msg = Sensor._deserialize_fixed(data[offset:offset+Sensor.MAX_SIZE])
+            if i < count:
+                fields["bounded_sensors"].append(msg)
+            offset += Sensor.MAX_SIZE
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ComprehensiveArrayMessage Msg, ID 203, Size 139 \n"
+        out += f"fixed_ints = {self.fixed_ints}\n"
+        out += f"fixed_floats = {self.fixed_floats}\n"
+        out += f"fixed_bools = {self.fixed_bools}\n"
+        out += f"bounded_uints = {self.bounded_uints}\n"
+        out += f"bounded_doubles = {self.bounded_doubles}\n"
+        out += f"fixed_strings = {self.fixed_strings}\n"
+        out += f"bounded_strings = {self.bounded_strings}\n"
+        out += f"fixed_statuses = {self.fixed_statuses}\n"
+        out += f"bounded_statuses = {self.bounded_statuses}\n"
+        out += f"fixed_sensors = {self.fixed_sensors}\n"
+        out += f"bounded_sensors = {self.bounded_sensors}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["fixed_ints"] = self.fixed_ints
+        out["fixed_floats"] = self.fixed_floats
+        out["fixed_bools"] = self.fixed_bools
+        out["bounded_uints"] = self.bounded_uints
+        out["bounded_doubles"] = self.bounded_doubles
+        out["fixed_strings"] = self.fixed_strings
+        out["bounded_strings"] = self.bounded_strings
+        out["fixed_statuses"] = self.fixed_statuses
+        out["bounded_statuses"] = self.bounded_statuses
+        out["fixed_sensors"] = [item.to_dict(False, False) for item in self.fixed_sensors]
+        out["bounded_sensors"] = [item.to_dict(False, False) for item in self.bounded_sensors]
+        if include_name:
+            out["name"] = "ComprehensiveArrayMessage"
+        if include_id:
+            out["msg_id"] = "203"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ComprehensiveArrayMessage):
+            return False
+        return (self.fixed_ints == other.fixed_ints and
+                self.fixed_floats == other.fixed_floats and
+                self.fixed_bools == other.fixed_bools and
+                self.bounded_uints == other.bounded_uints and
+                self.bounded_doubles == other.bounded_doubles and
+                self.fixed_strings == other.fixed_strings and
+                self.bounded_strings == other.bounded_strings and
+                self.fixed_statuses == other.fixed_statuses and
+                self.bounded_statuses == other.bounded_statuses and
+                self.fixed_sensors == other.fixed_sensors and
+                self.bounded_sensors == other.bounded_sensors)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Serialization Test Message (msgid: 204)
+#// ============================================================================
+#// A simple message for cross-language serialization testing
+class SerializationTestMessage:
+    msg_size = 95
+    MAX_SIZE = 95  # C++ compatible alias
+    BASE_SIZE = 95  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 204
+    MSG_ID = 204  # C++ compatible alias
+    MAGIC1 = 53  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 152  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, magic_number: int = None, test_string: bytes = None, test_float: float = None, test_bool: bool = None, test_array: List[int] = None):
+        self.magic_number = magic_number if magic_number is not None else 0
+        self.test_string = test_string if test_string is not None else b""
+        self.test_float = _truncate_float32(test_float) if test_float is not None else 0.0
+        self.test_bool = test_bool if test_bool is not None else False
+        self.test_array = test_array if test_array is not None else []
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<I", self.magic_number)
+        # Variable string: test_string
+        str_data = self.test_string[:64]
+        data += struct.pack("<B64s", len(str_data), str_data)
+        data += struct.pack("<f?", self.test_float, self.test_bool)
+        # Bounded array: test_array
+        data += struct.pack("<B", min(len(self.test_array), 5))
+        _vals = list(self.test_array[:5])
+        _vals += [0] * (5 - len(_vals))
+        data += struct.pack("<5i", *_vals)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["magic_number"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # Variable string: test_string
+        _s = struct.unpack_from("<B64s", data, offset)
+        fields["test_string"] = _s[1][:_s[0]]
+        offset += 65
+        _vals = struct.unpack_from("<f?", data, offset)
+        offset += 5
+        fields["test_float"] = _vals[0]
+        fields["test_bool"] = _vals[1]
+        # Bounded array: test_array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<5i", data, offset)
+        offset += 20
+        fields["test_array"] = list(_all[:min(count, 5)])
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "SerializationTestMessage Msg, ID 204, Size 95 \n"
+        out += f"magic_number = {self.magic_number}\n"
+        out += f"test_string = {self.test_string}\n"
+        out += f"test_float = {self.test_float}\n"
+        out += f"test_bool = {self.test_bool}\n"
+        out += f"test_array = {self.test_array}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["magic_number"] = self.magic_number
+        out["test_string"] = self.test_string
+        out["test_float"] = self.test_float
+        out["test_bool"] = self.test_bool
+        out["test_array"] = self.test_array
+        if include_name:
+            out["name"] = "SerializationTestMessage"
+        if include_id:
+            out["msg_id"] = "204"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, SerializationTestMessage):
+            return False
+        return (self.magic_number == other.magic_number and
+                self.test_string == other.test_string and
+                self.test_float == other.test_float and
+                self.test_bool == other.test_bool and
+                self.test_array == other.test_array)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Union Message Test (msgid: 205)
+#// ============================================================================
+#// A message demonstrating union-like behavior using oneof
+#// Since ComprehensiveArrayMessage and SerializationTestMessage both have
+#// message IDs, the generator will automatically add a discriminator field
+class UnionTestMessage:
+    msg_size = 141
+    MAX_SIZE = 141  # C++ compatible alias
+    BASE_SIZE = 141  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 205
+    MSG_ID = 205  # C++ compatible alias
+    MAGIC1 = 226  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 255  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, payload: dict = None, payload_which: str = None, payload_discriminator: int = None):
+        self.payload = payload if payload is not None else {}
+        self.payload_which = payload_which
+        self.payload_discriminator = payload_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        # Oneof payload auto-discriminator (uint16 - message ID)
+        if self.payload_which is not None:
+            data += struct.pack("<H", self.payload[self.payload_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof payload payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(139, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        # Oneof payload auto-discriminator (uint16 - message ID)
+        discriminator = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        fields["payload_discriminator"] = discriminator
+        # Oneof payload payload
+        fields["payload"] = {}
+        fields["payload_which"] = None
+        # Determine which field is active based on message ID
+        if discriminator == ComprehensiveArrayMessage.msg_id:
+            fields["payload"]["array_payload"] = ComprehensiveArrayMessage._deserialize_fixed(data[offset:offset+ComprehensiveArrayMessage.MAX_SIZE])
+            fields["payload_which"] = "array_payload"
+        if discriminator == SerializationTestMessage.msg_id:
+            fields["payload"]["test_payload"] = SerializationTestMessage._deserialize_fixed(data[offset:offset+SerializationTestMessage.MAX_SIZE])
+            fields["payload_which"] = "test_payload"
+        offset += 139
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "UnionTestMessage Msg, ID 205, Size 141 \n"
+        out += f"payload = {self.payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        if self.payload_which:
+            out["payload"] = self.payload[self.payload_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "UnionTestMessage"
+        if include_id:
+            out["msg_id"] = "205"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, UnionTestMessage):
+            return False
+        return (self.payload == other.payload and
+                self.payload_which == other.payload_which and
+                self.payload_discriminator == other.payload_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Field-Order Discriminator Test (msgid: 212)
+#// ============================================================================
+#// A message without a msgid (used in field_order discriminator oneof)
+class SimplePayload:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, type_code: int = None, value: int = None):
+        self.type_code = type_code if type_code is not None else 0
+        self.value = value if value is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH", self.type_code, self.value)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        fields["type_code"] = _vals[0]
+        fields["value"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "SimplePayload Msg, ID None, Size 3 \n"
+        out += f"type_code = {self.type_code}\n"
+        out += f"value = {self.value}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["type_code"] = self.type_code
+        out["value"] = self.value
+        if include_name:
+            out["name"] = "SimplePayload"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, SimplePayload):
+            return False
+        return (self.type_code == other.type_code and
+                self.value == other.value)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// A message using field_order discriminator (SimplePayload has no msgid,
+#// so the auto-discriminator falls back to field_order, generating an enum)
+class UnionTestMessageFieldOrder:
+    msg_size = 205
+    MAX_SIZE = 205  # C++ compatible alias
+    BASE_SIZE = 205  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 212
+    MSG_ID = 212  # C++ compatible alias
+    MAGIC1 = 243  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 176  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, data: dict = None, data_which: str = None, data_discriminator: int = None):
+        self.data = data if data is not None else {}
+        self.data_which = data_which
+        self.data_discriminator = data_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'basic_payload': 1, 'simple_payload': 2}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(204, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["data_discriminator"] = discriminator
+        # Oneof data payload
+        fields["data"] = {}
+        fields["data_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["data"]["basic_payload"] = BasicTypesMessage._deserialize_fixed(data[offset:offset+BasicTypesMessage.MAX_SIZE])
+            fields["data_which"] = "basic_payload"
+        if discriminator == 2:
+            fields["data"]["simple_payload"] = SimplePayload._deserialize_fixed(data[offset:offset+SimplePayload.MAX_SIZE])
+            fields["data_which"] = "simple_payload"
+        offset += 204
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "UnionTestMessageFieldOrder Msg, ID 212, Size 205 \n"
+        out += f"data = {self.data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        if self.data_which:
+            out["data"] = self.data[self.data_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "UnionTestMessageFieldOrder"
+        if include_id:
+            out["msg_id"] = "212"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, UnionTestMessageFieldOrder):
+            return False
+        return (self.data == other.data and
+                self.data_which == other.data_which and
+                self.data_discriminator == other.data_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Variable Length Message Tests (msgid: 206-208)
+#// These messages use option variable = true for variable-length encoding
+#// ============================================================================
+#// Variable message with single bounded array (msgid: 206)
+class VariableSingleArray:
+    msg_size = 207
+    MAX_SIZE = 207  # C++ compatible alias
+    BASE_SIZE = 207  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 206
+    MSG_ID = 206  # C++ compatible alias
+    MAGIC1 = 15  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 30  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 7  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, message_id: int = None, payload: List[int] = None, checksum: int = None):
+        self.message_id = message_id if message_id is not None else 0
+        self.payload = payload if payload is not None else []
+        self.checksum = checksum if checksum is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<I", self.message_id)
+        # Bounded array: payload
+        data += struct.pack("<B", min(len(self.payload), 200))
+        _vals = list(self.payload[:200])
+        _vals += [0] * (200 - len(_vals))
+        data += struct.pack("<200B", *_vals)
+        data += struct.pack("<H", self.checksum)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["message_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # Bounded array: payload
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<200B", data, offset)
+        offset += 200
+        fields["payload"] = list(_all[:min(count, 200)])
+        fields["checksum"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableSingleArray Msg, ID 206, Size 207 \n"
+        out += f"message_id = {self.message_id}\n"
+        out += f"payload = {self.payload}\n"
+        out += f"checksum = {self.checksum}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["message_id"] = self.message_id
+        out["payload"] = self.payload
+        out["checksum"] = self.checksum
+        if include_name:
+            out["name"] = "VariableSingleArray"
+        if include_id:
+            out["msg_id"] = "206"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableSingleArray):
+            return False
+        return (self.message_id == other.message_id and
+                self.payload == other.payload and
+                self.checksum == other.checksum)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 4  # message_id
+        size += 1 + (min(len(self.payload), 200) * 1)  # payload
+        size += 2  # checksum
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<I", self.message_id)
+        # Bounded array: payload
+        _n = min(len(self.payload), 200)
+        data += struct.pack("<B", _n)
+        _vals = list(self.payload[:_n])
+        data += struct.pack("<%dB" % _n, *_vals)
+        data += struct.pack("<H", self.checksum)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # message_id: uint32
+        fields["message_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # payload: variable uint8 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 200)
+        fields["payload"] = list(struct.unpack_from("<%dB" % _n, data, offset))
+        offset += _n * 1
+        # checksum: uint16
+        fields["checksum"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// Variable message with multiple bounded arrays (msgid: 207)
+class VariableMultipleArrays:
+    msg_size = 368
+    MAX_SIZE = 368  # C++ compatible alias
+    BASE_SIZE = 368  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 207
+    MSG_ID = 207  # C++ compatible alias
+    MAGIC1 = 37  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 70  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 4  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, type: int = None, readings: List[int] = None, values: List[float] = None, label: bytes = None):
+        self.type = type if type is not None else 0
+        self.readings = readings if readings is not None else []
+        self.values = [_truncate_float32(v) for v in values] if values is not None else []
+        self.label = label if label is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.type)
+        # Bounded array: readings
+        data += struct.pack("<B", min(len(self.readings), 50))
+        _vals = list(self.readings[:50])
+        _vals += [0] * (50 - len(_vals))
+        data += struct.pack("<50i", *_vals)
+        # Bounded array: values
+        data += struct.pack("<B", min(len(self.values), 25))
+        _vals = list(self.values[:25])
+        _vals += [0] * (25 - len(_vals))
+        data += struct.pack("<25f", *_vals)
+        # Variable string: label
+        str_data = self.label[:64]
+        data += struct.pack("<B64s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["type"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Bounded array: readings
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<50i", data, offset)
+        offset += 200
+        fields["readings"] = list(_all[:min(count, 50)])
+        # Bounded array: values
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<25f", data, offset)
+        offset += 100
+        fields["values"] = list(_all[:min(count, 25)])
+        # Variable string: label
+        _s = struct.unpack_from("<B64s", data, offset)
+        fields["label"] = _s[1][:_s[0]]
+        offset += 65
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableMultipleArrays Msg, ID 207, Size 368 \n"
+        out += f"type = {self.type}\n"
+        out += f"readings = {self.readings}\n"
+        out += f"values = {self.values}\n"
+        out += f"label = {self.label}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["type"] = self.type
+        out["readings"] = self.readings
+        out["values"] = self.values
+        out["label"] = self.label
+        if include_name:
+            out["name"] = "VariableMultipleArrays"
+        if include_id:
+            out["msg_id"] = "207"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableMultipleArrays):
+            return False
+        return (self.type == other.type and
+                self.readings == other.readings and
+                self.values == other.values and
+                self.label == other.label)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # type
+        size += 1 + (min(len(self.readings), 50) * 4)  # readings
+        size += 1 + (min(len(self.values), 25) * 4)  # values
+        size += 1 + min(len(self.label), 64)  # label
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.type)
+        # Bounded array: readings
+        _n = min(len(self.readings), 50)
+        data += struct.pack("<B", _n)
+        _vals = list(self.readings[:_n])
+        data += struct.pack("<%di" % _n, *_vals)
+        # Bounded array: values
+        _n = min(len(self.values), 25)
+        data += struct.pack("<B", _n)
+        _vals = list(self.values[:_n])
+        data += struct.pack("<%df" % _n, *_vals)
+        # Variable string: label
+        str_data = self.label[:64]
+        data += struct.pack("<B", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # type: uint8
+        fields["type"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # readings: variable int32 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 50)
+        fields["readings"] = list(struct.unpack_from("<%di" % _n, data, offset))
+        offset += _n * 4
+        # values: variable float array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 25)
+        fields["values"] = list(struct.unpack_from("<%df" % _n, data, offset))
+        offset += _n * 4
+        # label: variable string
+        str_len = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        str_len = min(str_len, 64)
+        fields["label"] = data[offset:offset+str_len]
+        offset += str_len
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// Variable message with mixed fixed and variable fields (msgid: 208)
+class VariableMixedFields:
+    msg_size = 354
+    MAX_SIZE = 354  # C++ compatible alias
+    BASE_SIZE = 354  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 208
+    MSG_ID = 208  # C++ compatible alias
+    MAGIC1 = 55  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 146  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 26  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, fixed_id: int = None, fixed_value: float = None, fixed_name: bytes = None, variable_data: List[int] = None, variable_desc: bytes = None):
+        self.fixed_id = fixed_id if fixed_id is not None else 0
+        self.fixed_value = _truncate_float32(fixed_value) if fixed_value is not None else 0.0
+        self.fixed_name = fixed_name if fixed_name is not None else b""
+        self.variable_data = variable_data if variable_data is not None else []
+        self.variable_desc = variable_desc if variable_desc is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<If", self.fixed_id, self.fixed_value)
+        # Fixed string: fixed_name
+        data += struct.pack("<16s", self.fixed_name[:16])
+        # Bounded array: variable_data
+        data += struct.pack("<B", min(len(self.variable_data), 100))
+        _vals = list(self.variable_data[:100])
+        _vals += [0] * (100 - len(_vals))
+        data += struct.pack("<100H", *_vals)
+        # Variable string: variable_desc
+        str_data = self.variable_desc[:128]
+        data += struct.pack("<B128s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<If", data, offset)
+        offset += 8
+        fields["fixed_id"] = _vals[0]
+        fields["fixed_value"] = _vals[1]
+        # Fixed string: fixed_name
+        fields["fixed_name"] = struct.unpack_from("<16s", data, offset)[0]
+        offset += 16
+        # Bounded array: variable_data
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<100H", data, offset)
+        offset += 200
+        fields["variable_data"] = list(_all[:min(count, 100)])
+        # Variable string: variable_desc
+        _s = struct.unpack_from("<B128s", data, offset)
+        fields["variable_desc"] = _s[1][:_s[0]]
+        offset += 129
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableMixedFields Msg, ID 208, Size 354 \n"
+        out += f"fixed_id = {self.fixed_id}\n"
+        out += f"fixed_value = {self.fixed_value}\n"
+        out += f"fixed_name = {self.fixed_name}\n"
+        out += f"variable_data = {self.variable_data}\n"
+        out += f"variable_desc = {self.variable_desc}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["fixed_id"] = self.fixed_id
+        out["fixed_value"] = self.fixed_value
+        out["fixed_name"] = self.fixed_name
+        out["variable_data"] = self.variable_data
+        out["variable_desc"] = self.variable_desc
+        if include_name:
+            out["name"] = "VariableMixedFields"
+        if include_id:
+            out["msg_id"] = "208"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableMixedFields):
+            return False
+        return (self.fixed_id == other.fixed_id and
+                self.fixed_value == other.fixed_value and
+                self.fixed_name == other.fixed_name and
+                self.variable_data == other.variable_data and
+                self.variable_desc == other.variable_desc)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 4  # fixed_id
+        size += 4  # fixed_value
+        size += 16  # fixed_name
+        size += 1 + (min(len(self.variable_data), 100) * 2)  # variable_data
+        size += 1 + min(len(self.variable_desc), 128)  # variable_desc
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<I", self.fixed_id)
+        data += struct.pack("<f", self.fixed_value)
+        # Fixed string: fixed_name
+        data += struct.pack("<16s", self.fixed_name[:16])
+        # Bounded array: variable_data
+        _n = min(len(self.variable_data), 100)
+        data += struct.pack("<B", _n)
+        _vals = list(self.variable_data[:_n])
+        data += struct.pack("<%dH" % _n, *_vals)
+        # Variable string: variable_desc
+        str_data = self.variable_desc[:128]
+        data += struct.pack("<B", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # fixed_id: uint32
+        fields["fixed_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # fixed_value: float
+        fields["fixed_value"] = struct.unpack_from("<f", data, offset)[0]
+        offset += 4
+        # fixed_name: fixed string
+        fields["fixed_name"] = struct.unpack_from("<16s", data, offset)[0]
+        offset += 16
+        # variable_data: variable uint16 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 100)
+        fields["variable_data"] = list(struct.unpack_from("<%dH" % _n, data, offset))
+        offset += _n * 2
+        # variable_desc: variable string
+        str_len = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        str_len = min(str_len, 128)
+        fields["variable_desc"] = data[offset:offset+str_len]
+        offset += str_len
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// ============================================================================
+#// Truncation Test Messages (msgid: 209-210)
+#// These messages are identical except one has variable=true to test truncation
+#// ============================================================================
+#// Non-variable message with large array (msgid: 209)
+class TruncationTestNonVariable:
+    msg_size = 207
+    MAX_SIZE = 207  # C++ compatible alias
+    BASE_SIZE = 207  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 209
+    MSG_ID = 209  # C++ compatible alias
+    MAGIC1 = 15  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 30  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, sequence_id: int = None, data_array: List[int] = None, footer: int = None):
+        self.sequence_id = sequence_id if sequence_id is not None else 0
+        self.data_array = data_array if data_array is not None else []
+        self.footer = footer if footer is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<I", self.sequence_id)
+        # Bounded array: data_array
+        data += struct.pack("<B", min(len(self.data_array), 200))
+        _vals = list(self.data_array[:200])
+        _vals += [0] * (200 - len(_vals))
+        data += struct.pack("<200B", *_vals)
+        data += struct.pack("<H", self.footer)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["sequence_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # Bounded array: data_array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<200B", data, offset)
+        offset += 200
+        fields["data_array"] = list(_all[:min(count, 200)])
+        fields["footer"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "TruncationTestNonVariable Msg, ID 209, Size 207 \n"
+        out += f"sequence_id = {self.sequence_id}\n"
+        out += f"data_array = {self.data_array}\n"
+        out += f"footer = {self.footer}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sequence_id"] = self.sequence_id
+        out["data_array"] = self.data_array
+        out["footer"] = self.footer
+        if include_name:
+            out["name"] = "TruncationTestNonVariable"
+        if include_id:
+            out["msg_id"] = "209"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, TruncationTestNonVariable):
+            return False
+        return (self.sequence_id == other.sequence_id and
+                self.data_array == other.data_array and
+                self.footer == other.footer)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// Variable message with large array (msgid: 210)
+class TruncationTestVariable:
+    msg_size = 207
+    MAX_SIZE = 207  # C++ compatible alias
+    BASE_SIZE = 207  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 210
+    MSG_ID = 210  # C++ compatible alias
+    MAGIC1 = 15  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 30  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 7  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, sequence_id: int = None, data_array: List[int] = None, footer: int = None):
+        self.sequence_id = sequence_id if sequence_id is not None else 0
+        self.data_array = data_array if data_array is not None else []
+        self.footer = footer if footer is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<I", self.sequence_id)
+        # Bounded array: data_array
+        data += struct.pack("<B", min(len(self.data_array), 200))
+        _vals = list(self.data_array[:200])
+        _vals += [0] * (200 - len(_vals))
+        data += struct.pack("<200B", *_vals)
+        data += struct.pack("<H", self.footer)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["sequence_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # Bounded array: data_array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<200B", data, offset)
+        offset += 200
+        fields["data_array"] = list(_all[:min(count, 200)])
+        fields["footer"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "TruncationTestVariable Msg, ID 210, Size 207 \n"
+        out += f"sequence_id = {self.sequence_id}\n"
+        out += f"data_array = {self.data_array}\n"
+        out += f"footer = {self.footer}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sequence_id"] = self.sequence_id
+        out["data_array"] = self.data_array
+        out["footer"] = self.footer
+        if include_name:
+            out["name"] = "TruncationTestVariable"
+        if include_id:
+            out["msg_id"] = "210"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, TruncationTestVariable):
+            return False
+        return (self.sequence_id == other.sequence_id and
+                self.data_array == other.data_array and
+                self.footer == other.footer)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 4  # sequence_id
+        size += 1 + (min(len(self.data_array), 200) * 1)  # data_array
+        size += 2  # footer
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<I", self.sequence_id)
+        # Bounded array: data_array
+        _n = min(len(self.data_array), 200)
+        data += struct.pack("<B", _n)
+        _vals = list(self.data_array[:_n])
+        data += struct.pack("<%dB" % _n, *_vals)
+        data += struct.pack("<H", self.footer)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # sequence_id: uint32
+        fields["sequence_id"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # data_array: variable uint8 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 200)
+        fields["data_array"] = list(struct.unpack_from("<%dB" % _n, data, offset))
+        offset += _n * 1
+        # footer: uint16
+        fields["footer"] = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// ============================================================================
+#// Variable Message Test (msgid: 211)
+#// ============================================================================
+#// Variable message with two variable string fields
+class Message:
+    msg_size = 274
+    MAX_SIZE = 274  # C++ compatible alias
+    BASE_SIZE = 274  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 211
+    MSG_ID = 211  # C++ compatible alias
+    MAGIC1 = 43  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 85  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 3  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, severity: int = None, module: bytes = None, msg: bytes = None):
+        self.severity = severity if severity is not None else 0
+        self.module = module if module is not None else b""
+        self.msg = msg if msg is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.severity)
+        # Variable string: module
+        str_data = self.module[:16]
+        data += struct.pack("<B16s", len(str_data), str_data)
+        # Variable string: msg
+        str_data = self.msg[:255]
+        data += struct.pack("<B255s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["severity"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Variable string: module
+        _s = struct.unpack_from("<B16s", data, offset)
+        fields["module"] = _s[1][:_s[0]]
+        offset += 17
+        # Variable string: msg
+        _s = struct.unpack_from("<B255s", data, offset)
+        fields["msg"] = _s[1][:_s[0]]
+        offset += 256
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "Message Msg, ID 211, Size 274 \n"
+        out += f"severity = {self.severity}\n"
+        out += f"module = {self.module}\n"
+        out += f"msg = {self.msg}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["severity"] = self.severity
+        out["module"] = self.module
+        out["msg"] = self.msg
+        if include_name:
+            out["name"] = "Message"
+        if include_id:
+            out["msg_id"] = "211"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, Message):
+            return False
+        return (self.severity == other.severity and
+                self.module == other.module and
+                self.msg == other.msg)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # severity
+        size += 1 + min(len(self.module), 16)  # module
+        size += 1 + min(len(self.msg), 255)  # msg
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.severity)
+        # Variable string: module
+        str_data = self.module[:16]
+        data += struct.pack("<B", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        # Variable string: msg
+        str_data = self.msg[:255]
+        data += struct.pack("<B", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # severity: enum
+        fields["severity"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # module: variable string
+        str_len = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        str_len = min(str_len, 16)
+        fields["module"] = data[offset:offset+str_len]
+        offset += str_len
+        # msg: variable string
+        str_len = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        str_len = min(str_len, 255)
+        fields["msg"] = data[offset:offset+str_len]
+        offset += str_len
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// ============================================================================
+#// Nested Variable Message Tests (msgid: 220)
+#// These messages exercise the nested-struct + variable-length code path:
+#//   a nested struct containing variable-length fields (string and array),
+#//   embedded in a parent message that is also marked option variable = true.
+#// ============================================================================
+#// Nested struct with variable-length fields (no msgid — used only as a sub-message)
+class NestedPayload:
+    msg_size = 67
+    MAX_SIZE = 67  # C++ compatible alias
+    BASE_SIZE = 67  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, id: int = None, label: bytes = None, samples: List[int] = None):
+        self.id = id if id is not None else 0
+        self.label = label if label is not None else b""
+        self.samples = samples if samples is not None else []
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<B", self.id)
+        # Variable string: label
+        str_data = self.label[:32]
+        data += struct.pack("<B32s", len(str_data), str_data)
+        # Bounded array: samples
+        data += struct.pack("<B", min(len(self.samples), 16))
+        _vals = list(self.samples[:16])
+        _vals += [0] * (16 - len(_vals))
+        data += struct.pack("<16H", *_vals)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["id"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Variable string: label
+        _s = struct.unpack_from("<B32s", data, offset)
+        fields["label"] = _s[1][:_s[0]]
+        offset += 33
+        # Bounded array: samples
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<16H", data, offset)
+        offset += 32
+        fields["samples"] = list(_all[:min(count, 16)])
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "NestedPayload Msg, ID None, Size 67 \n"
+        out += f"id = {self.id}\n"
+        out += f"label = {self.label}\n"
+        out += f"samples = {self.samples}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["id"] = self.id
+        out["label"] = self.label
+        out["samples"] = self.samples
+        if include_name:
+            out["name"] = "NestedPayload"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, NestedPayload):
+            return False
+        return (self.id == other.id and
+                self.label == other.label and
+                self.samples == other.samples)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Parent message with option variable = true containing a nested struct that has
+#// variable-length fields, plus a top-level variable string.
+class NestedVariableMessage:
+    msg_size = 136
+    MAX_SIZE = 136  # C++ compatible alias
+    BASE_SIZE = 136  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 220
+    MSG_ID = 220  # C++ compatible alias
+    MAGIC1 = 68  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 127  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 72  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, sequence: int = None, payload: NestedPayload = None, description: bytes = None):
+        self.sequence = sequence if sequence is not None else 0
+        self.payload = payload if payload is not None else NestedPayload()
+        self.description = description if description is not None else b""
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<I", self.sequence)
+        data += self.payload.serialize()
+        # Variable string: description
+        str_data = self.description[:64]
+        data += struct.pack("<B64s", len(str_data), str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["sequence"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        fields["payload"] = NestedPayload._deserialize_fixed(data[offset:offset+NestedPayload.MAX_SIZE])
+        offset += NestedPayload.MAX_SIZE
+        # Variable string: description
+        _s = struct.unpack_from("<B64s", data, offset)
+        fields["description"] = _s[1][:_s[0]]
+        offset += 65
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "NestedVariableMessage Msg, ID 220, Size 136 \n"
+        out += f"sequence = {self.sequence}\n"
+        out += f"payload = {self.payload}\n"
+        out += f"description = {self.description}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["sequence"] = self.sequence
+        out["payload"] = self.payload.to_dict(False, False)
+        out["description"] = self.description
+        if include_name:
+            out["name"] = "NestedVariableMessage"
+        if include_id:
+            out["msg_id"] = "220"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, NestedVariableMessage):
+            return False
+        return (self.sequence == other.sequence and
+                self.payload == other.payload and
+                self.description == other.description)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 4  # sequence
+        size += 67  # payload
+        size += 1 + min(len(self.description), 64)  # description
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<I", self.sequence)
+        data += self.payload.serialize()
+        # Variable string: description
+        str_data = self.description[:64]
+        data += struct.pack("<B", len(str_data))
+        data += struct.pack(f"<{len(str_data)}s", str_data)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # sequence: uint32
+        fields["sequence"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        # payload: nested message
+        fields["payload"] = NestedPayload._deserialize_fixed(data[offset:offset+NestedPayload.MAX_SIZE])
+        offset += NestedPayload.MAX_SIZE
+        # description: variable string
+        str_len = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        str_len = min(str_len, 64)
+        fields["description"] = data[offset:offset+str_len]
+        offset += str_len
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// ============================================================================
+#// Nested Enum Test Message (msgid: 213)
+#// ============================================================================
+#// Tests a message-scoped enum definition and a field that references it
+class NestedEnumMessage:
+    #// Enum scoped to this message
+    class OperationMode(Enum):
+        IDLE = 0
+        ACTIVE = 1
+        CALIBRATING = 2
+        ERRORSTATE = 3
+
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 213
+    MSG_ID = 213  # C++ compatible alias
+    MAGIC1 = 27  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 58  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, mode: int = None, value: int = None, enabled: bool = None):
+        self.mode = mode if mode is not None else 0
+        self.value = value if value is not None else 0
+        self.enabled = enabled if enabled is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BB?", self.mode, self.value, self.enabled)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BB?", data, offset)
+        offset += 3
+        fields["mode"] = _vals[0]
+        fields["value"] = _vals[1]
+        fields["enabled"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "NestedEnumMessage Msg, ID 213, Size 3 \n"
+        out += f"mode = {self.mode}\n"
+        out += f"value = {self.value}\n"
+        out += f"enabled = {self.enabled}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["mode"] = self.mode
+        out["value"] = self.value
+        out["enabled"] = self.enabled
+        if include_name:
+            out["name"] = "NestedEnumMessage"
+        if include_id:
+            out["msg_id"] = "213"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, NestedEnumMessage):
+            return False
+        return (self.mode == other.mode and
+                self.value == other.value and
+                self.enabled == other.enabled)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Collision Enum Test Message (msgid: 214)
+#// ============================================================================
+#// Tests that an enum named identically to one of the fields (Status status)
+#// is correctly renamed to StatusEnum to avoid CS0102 in C#.
+class CollisionEnumMessage:
+    class Status(Enum):
+        UNKNOWN = 0
+        RUNNING = 1
+        STOPPED = 2
+        FAILED = 3
+
+    msg_size = 10
+    MAX_SIZE = 10  # C++ compatible alias
+    BASE_SIZE = 10  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 214
+    MSG_ID = 214  # C++ compatible alias
+    MAGIC1 = 29  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 60  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, status: int = None, id: int = None, time: float = None):
+        self.status = status if status is not None else 0
+        self.id = id if id is not None else 0
+        self.time = time if time is not None else 0.0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BBd", self.status, self.id, self.time)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BBd", data, offset)
+        offset += 10
+        fields["status"] = _vals[0]
+        fields["id"] = _vals[1]
+        fields["time"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "CollisionEnumMessage Msg, ID 214, Size 10 \n"
+        out += f"status = {self.status}\n"
+        out += f"id = {self.id}\n"
+        out += f"time = {self.time}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["status"] = self.status
+        out["id"] = self.id
+        out["time"] = self.time
+        if include_name:
+            out["name"] = "CollisionEnumMessage"
+        if include_id:
+            out["msg_id"] = "214"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, CollisionEnumMessage):
+            return False
+        return (self.status == other.status and
+                self.id == other.id and
+                self.time == other.time)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Flatten Option Test (msgid: 215)
+#// ============================================================================
+#// Sub-message for flatten option test (no msgid - used as nested struct)
+class FlattenInner:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, a: int = None, b: int = None):
+        self.a = a if a is not None else 0
+        self.b = b if b is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH", self.a, self.b)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        fields["a"] = _vals[0]
+        fields["b"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "FlattenInner Msg, ID None, Size 3 \n"
+        out += f"a = {self.a}\n"
+        out += f"b = {self.b}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["a"] = self.a
+        out["b"] = self.b
+        if include_name:
+            out["name"] = "FlattenInner"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, FlattenInner):
+            return False
+        return (self.a == other.a and
+                self.b == other.b)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Tests flatten=true option: inner fields appear inlined in to_dict() output
+class FlattenMessage:
+    msg_size = 7
+    MAX_SIZE = 7  # C++ compatible alias
+    BASE_SIZE = 7  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 215
+    MSG_ID = 215  # C++ compatible alias
+    MAGIC1 = 210  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 216  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, seq: int = None, inner: FlattenInner = None):
+        self.seq = seq if seq is not None else 0
+        self.inner = inner if inner is not None else FlattenInner()
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<I", self.seq)
+        data += self.inner.serialize()
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["seq"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        fields["inner"] = FlattenInner._deserialize_fixed(data[offset:offset+FlattenInner.MAX_SIZE])
+        offset += FlattenInner.MAX_SIZE
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "FlattenMessage Msg, ID 215, Size 7 \n"
+        out += f"seq = {self.seq}\n"
+        out += f"inner = {self.inner}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["seq"] = self.seq
+        out.update(self.inner.to_dict(False, False))
+        if include_name:
+            out["name"] = "FlattenMessage"
+        if include_id:
+            out["msg_id"] = "215"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, FlattenMessage):
+            return False
+        return (self.seq == other.seq and
+                self.inner == other.inner)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Discriminator None Oneof Test (msgid: 216)
+#// ============================================================================
+#// Tests oneof with discriminator=none: no auto-discriminator field is generated.
+#// Application must track which variant is active.
+class NoneDiscriminatorMessage:
+    msg_size = 205
+    MAX_SIZE = 205  # C++ compatible alias
+    BASE_SIZE = 205  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 216
+    MSG_ID = 216  # C++ compatible alias
+    MAGIC1 = 134  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 72  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, header: int = None, data: dict = None, data_which: str = None):
+        self.header = header if header is not None else 0
+        self.data = data if data is not None else {}
+        self.data_which = data_which
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(204, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data payload
+        fields["data"] = {}
+        fields["data_which"] = None
+        offset += 204
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "NoneDiscriminatorMessage Msg, ID 216, Size 205 \n"
+        out += f"header = {self.header}\n"
+        out += f"data = {self.data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["header"] = self.header
+        if self.data_which:
+            out["data"] = self.data[self.data_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "NoneDiscriminatorMessage"
+        if include_id:
+            out["msg_id"] = "216"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, NoneDiscriminatorMessage):
+            return False
+        return (self.header == other.header and
+                self.data == other.data and
+                self.data_which == other.data_which)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Multiple Oneof Test (msgid: 217)
+#// ============================================================================
+#// Tests a message with two separate oneof fields.
+class MultiOneofMessage:
+    msg_size = 481
+    MAX_SIZE = 481  # C++ compatible alias
+    BASE_SIZE = 481  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 217
+    MSG_ID = 217  # C++ compatible alias
+    MAGIC1 = 219  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 52  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, selector: int = None, first_payload: dict = None, first_payload_which: str = None, first_payload_discriminator: int = None, second_payload: dict = None, second_payload_which: str = None):
+        self.selector = selector if selector is not None else 0
+        self.first_payload = first_payload if first_payload is not None else {}
+        self.first_payload_which = first_payload_which
+        self.first_payload_discriminator = first_payload_discriminator
+        self.second_payload = second_payload if second_payload is not None else {}
+        self.second_payload_which = second_payload_which
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<B", self.selector)
+        # Oneof first_payload auto-discriminator (uint16 - message ID)
+        if self.first_payload_which is not None:
+            data += struct.pack("<H", self.first_payload[self.first_payload_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof first_payload payload
+        union_data = b""
+        if self.first_payload_which is not None:
+            union_data = self.first_payload[self.first_payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(204, b"\x00")
+        data += union_data
+        # Oneof second_payload payload
+        union_data = b""
+        if self.second_payload_which is not None:
+            union_data = self.second_payload[self.second_payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(274, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["selector"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof first_payload auto-discriminator (uint16 - message ID)
+        discriminator = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        fields["first_payload_discriminator"] = discriminator
+        # Oneof first_payload payload
+        fields["first_payload"] = {}
+        fields["first_payload_which"] = None
+        # Determine which field is active based on message ID
+        if discriminator == BasicTypesMessage.msg_id:
+            fields["first_payload"]["basic"] = BasicTypesMessage._deserialize_fixed(data[offset:offset+BasicTypesMessage.MAX_SIZE])
+            fields["first_payload_which"] = "basic"
+        if discriminator == SerializationTestMessage.msg_id:
+            fields["first_payload"]["test_msg"] = SerializationTestMessage._deserialize_fixed(data[offset:offset+SerializationTestMessage.MAX_SIZE])
+            fields["first_payload_which"] = "test_msg"
+        offset += 204
+        # Oneof second_payload payload
+        fields["second_payload"] = {}
+        fields["second_payload_which"] = None
+        offset += 274
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MultiOneofMessage Msg, ID 217, Size 481 \n"
+        out += f"selector = {self.selector}\n"
+        out += f"first_payload = {self.first_payload}\n"
+        out += f"second_payload = {self.second_payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["selector"] = self.selector
+        if self.first_payload_which:
+            out["first_payload"] = self.first_payload[self.first_payload_which].to_dict(False, False)
+        if self.second_payload_which:
+            out["second_payload"] = self.second_payload[self.second_payload_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "MultiOneofMessage"
+        if include_id:
+            out["msg_id"] = "217"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MultiOneofMessage):
+            return False
+        return (self.selector == other.selector and
+                self.first_payload == other.first_payload and
+                self.first_payload_which == other.first_payload_which and
+                self.first_payload_discriminator == other.first_payload_discriminator and
+                self.second_payload == other.second_payload and
+                self.second_payload_which == other.second_payload_which)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Variable + Oneof Tests (msgid: 221-222)
+#// These messages combine option variable = true with a oneof to cover the
+#// code-generation bug where variable serializers skipped oneof fields entirely.
+#// ============================================================================
+#// Small fixed-size payload A (no msgid - used as oneof variant)
+class VarEnvPayloadA:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, code: int = None, value: int = None):
+        self.code = code if code is not None else 0
+        self.value = value if value is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<BH", self.code, self.value)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        fields["code"] = _vals[0]
+        fields["value"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VarEnvPayloadA Msg, ID None, Size 3 \n"
+        out += f"code = {self.code}\n"
+        out += f"value = {self.value}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["code"] = self.code
+        out["value"] = self.value
+        if include_name:
+            out["name"] = "VarEnvPayloadA"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VarEnvPayloadA):
+            return False
+        return (self.code == other.code and
+                self.value == other.value)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Small fixed-size payload B (no msgid - used as oneof variant)
+class VarEnvPayloadB:
+    msg_size = 8
+    MAX_SIZE = 8  # C++ compatible alias
+    BASE_SIZE = 8  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, flags: int = None, ratio: float = None):
+        self.flags = flags if flags is not None else 0
+        self.ratio = _truncate_float32(ratio) if ratio is not None else 0.0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<If", self.flags, self.ratio)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<If", data, offset)
+        offset += 8
+        fields["flags"] = _vals[0]
+        fields["ratio"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VarEnvPayloadB Msg, ID None, Size 8 \n"
+        out += f"flags = {self.flags}\n"
+        out += f"ratio = {self.ratio}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["flags"] = self.flags
+        out["ratio"] = self.ratio
+        if include_name:
+            out["name"] = "VarEnvPayloadB"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VarEnvPayloadB):
+            return False
+        return (self.flags == other.flags and
+                self.ratio == other.ratio)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Variable envelope with field_order discriminator (msgid: 221)
+#// Combines variable = true + is_envelope = true + oneof (field_order)
+#// This is the key regression test: discriminator + union must appear on the wire.
+class VariableEnvelopeMessage:
+    msg_size = 10
+    MAX_SIZE = 10  # C++ compatible alias
+    BASE_SIZE = 10  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 221
+    MSG_ID = 221  # C++ compatible alias
+    MAGIC1 = 194  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 37  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 10  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, priority: int = None, payload: dict = None, payload_which: str = None, payload_discriminator: int = None):
+        self.priority = priority if priority is not None else 0
+        self.payload = payload if payload is not None else {}
+        self.payload_which = payload_which
+        self.payload_discriminator = payload_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.priority)
+        # Oneof payload discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'payload_a': 1, 'payload_b': 2}
+        if self.payload_which is not None:
+            data += struct.pack("<B", _field_order_map[self.payload_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof payload payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(8, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["priority"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof payload discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["payload_discriminator"] = discriminator
+        # Oneof payload payload
+        fields["payload"] = {}
+        fields["payload_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["payload"]["payload_a"] = VarEnvPayloadA._deserialize_fixed(data[offset:offset+VarEnvPayloadA.MAX_SIZE])
+            fields["payload_which"] = "payload_a"
+        if discriminator == 2:
+            fields["payload"]["payload_b"] = VarEnvPayloadB._deserialize_fixed(data[offset:offset+VarEnvPayloadB.MAX_SIZE])
+            fields["payload_which"] = "payload_b"
+        offset += 8
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableEnvelopeMessage Msg, ID 221, Size 10 \n"
+        out += f"priority = {self.priority}\n"
+        out += f"payload = {self.payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["priority"] = self.priority
+        if self.payload_which:
+            out["payload"] = self.payload[self.payload_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "VariableEnvelopeMessage"
+        if include_id:
+            out["msg_id"] = "221"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableEnvelopeMessage):
+            return False
+        return (self.priority == other.priority and
+                self.payload == other.payload and
+                self.payload_which == other.payload_which and
+                self.payload_discriminator == other.payload_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # priority
+        size += 1  # payload discriminator
+        size += {"payload_a": 3, "payload_b": 8}.get(self.payload_which, 0)  # payload trimmed union
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.priority)
+        # Oneof payload discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'payload_a': 1, 'payload_b': 2}
+        if self.payload_which is not None:
+            data += struct.pack("<B", _field_order_map[self.payload_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof payload trimmed union payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # priority: uint8
+        fields["priority"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof payload discriminator (uint8 - field order)
+        disc_val = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof payload trimmed union read
+        _payload_rlen = 0
+        if disc_val == 1: _payload_rlen = max(3, 0)
+        if disc_val == 2: _payload_rlen = max(8, 0)
+        if disc_val == 1:
+            fields["payload_which"] = "payload_a"
+            _slice = data[offset:offset+VarEnvPayloadA.MAX_SIZE]
+            if len(_slice) < VarEnvPayloadA.MAX_SIZE: _slice = _slice.ljust(VarEnvPayloadA.MAX_SIZE, b"\x00")
+            fields["payload"] = {"payload_a": VarEnvPayloadA._deserialize_fixed(_slice)}
+        if disc_val == 2:
+            fields["payload_which"] = "payload_b"
+            _slice = data[offset:offset+VarEnvPayloadB.MAX_SIZE]
+            if len(_slice) < VarEnvPayloadB.MAX_SIZE: _slice = _slice.ljust(VarEnvPayloadB.MAX_SIZE, b"\x00")
+            fields["payload"] = {"payload_b": VarEnvPayloadB._deserialize_fixed(_slice)}
+        offset += _payload_rlen
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+    # ========================================
+    # Envelope message helper methods
+    # ========================================
+
+    # Valid payload types for this envelope
+    _VALID_PAYLOAD_TYPES = ("VarEnvPayloadA", "VarEnvPayloadB",)
+
+    @classmethod
+    def wrap(cls, payload: Union["VarEnvPayloadA", "VarEnvPayloadB"], priority: int) -> "VariableEnvelopeMessage":
+        """Create a VariableEnvelopeMessage envelope wrapping a payload message.
+        
+        Args:
+            payload: The message to wrap (must be one of: VarEnvPayloadA, VarEnvPayloadB)
+            priority: Envelope field value
+        
+        Returns:
+            A fully initialized VariableEnvelopeMessage envelope
+        
+        Raises:
+            TypeError: If payload is not a valid payload type
+        """
+        payload_type_name = type(payload).__name__
+        if payload_type_name not in cls._VALID_PAYLOAD_TYPES:
+            raise TypeError(f"Invalid payload type {payload_type_name}. Must be one of: {cls._VALID_PAYLOAD_TYPES}")
+        
+        # Determine which oneof field to use and its discriminator value
+        if payload_type_name == "VarEnvPayloadA":
+            field_name = "payload_a"
+            discriminator_value = VariableEnvelopeMessagePayloadField.PAYLOAD_A
+        elif payload_type_name == "VarEnvPayloadB":
+            field_name = "payload_b"
+            discriminator_value = VariableEnvelopeMessagePayloadField.PAYLOAD_B
+        
+        envelope = cls(
+            priority=priority,
+            payload={field_name: payload},
+            payload_which=field_name,
+            payload_discriminator=discriminator_value
+        )
+        return envelope
+
+    def unwrap(self) -> Union["VarEnvPayloadA", "VarEnvPayloadB", None]:
+        """Unwrap and get the payload message based on the discriminator.
+        
+        Returns:
+            The payload message matching the discriminator, or None if not set
+        """
+        if self.payload_discriminator == VariableEnvelopeMessagePayloadField.PAYLOAD_A:
+            return self.payload.get("payload_a")
+        elif self.payload_discriminator == VariableEnvelopeMessagePayloadField.PAYLOAD_B:
+            return self.payload.get("payload_b")
+        return None
+
+    def get_payload_field(self) -> "VariableEnvelopeMessagePayloadField":
+        """Get the discriminator enum value for the wrapped payload.
+        
+        Returns:
+            The VariableEnvelopeMessagePayloadField enum value for the active payload
+        """
+        return self.payload_discriminator
+
+#// Variable envelope with msgid discriminator (msgid: 222)
+#// Uses msgs that have IDs so the generator picks msgid discriminator type.
+class VariableEnvelopeMsgIdMessage:
+    msg_size = 207
+    MAX_SIZE = 207  # C++ compatible alias
+    BASE_SIZE = 207  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 222
+    MSG_ID = 222  # C++ compatible alias
+    MAGIC1 = 134  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 72  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 207  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, priority: int = None, payload: dict = None, payload_which: str = None, payload_discriminator: int = None):
+        self.priority = priority if priority is not None else 0
+        self.payload = payload if payload is not None else {}
+        self.payload_which = payload_which
+        self.payload_discriminator = payload_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.priority)
+        # Oneof payload auto-discriminator (uint16 - message ID)
+        if self.payload_which is not None:
+            data += struct.pack("<H", self.payload[self.payload_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof payload payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(204, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["priority"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof payload auto-discriminator (uint16 - message ID)
+        discriminator = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        fields["payload_discriminator"] = discriminator
+        # Oneof payload payload
+        fields["payload"] = {}
+        fields["payload_which"] = None
+        # Determine which field is active based on message ID
+        if discriminator == BasicTypesMessage.msg_id:
+            fields["payload"]["basic"] = BasicTypesMessage._deserialize_fixed(data[offset:offset+BasicTypesMessage.MAX_SIZE])
+            fields["payload_which"] = "basic"
+        if discriminator == SerializationTestMessage.msg_id:
+            fields["payload"]["test_msg"] = SerializationTestMessage._deserialize_fixed(data[offset:offset+SerializationTestMessage.MAX_SIZE])
+            fields["payload_which"] = "test_msg"
+        offset += 204
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableEnvelopeMsgIdMessage Msg, ID 222, Size 207 \n"
+        out += f"priority = {self.priority}\n"
+        out += f"payload = {self.payload}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["priority"] = self.priority
+        if self.payload_which:
+            out["payload"] = self.payload[self.payload_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "VariableEnvelopeMsgIdMessage"
+        if include_id:
+            out["msg_id"] = "222"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableEnvelopeMsgIdMessage):
+            return False
+        return (self.priority == other.priority and
+                self.payload == other.payload and
+                self.payload_which == other.payload_which and
+                self.payload_discriminator == other.payload_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # priority
+        size += 2  # payload discriminator
+        size += {"basic": 204, "test_msg": 95}.get(self.payload_which, 0)  # payload trimmed union
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.priority)
+        # Oneof payload auto-discriminator (uint16 - message ID)
+        if self.payload_which is not None:
+            data += struct.pack("<H", self.payload[self.payload_which].__class__.msg_id)
+        else:
+            data += struct.pack("<H", 0)
+        # Oneof payload trimmed union payload
+        union_data = b""
+        if self.payload_which is not None:
+            union_data = self.payload[self.payload_which].serialize()
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # priority: uint8
+        fields["priority"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof payload discriminator (uint16 - message ID)
+        disc_val = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        # Oneof payload trimmed union read
+        _payload_rlen = 0
+        if disc_val == 201: _payload_rlen = max(204, 0)
+        if disc_val == 204: _payload_rlen = max(95, 0)
+        if disc_val == 201:
+            fields["payload_which"] = "basic"
+            _slice = data[offset:offset+BasicTypesMessage.MAX_SIZE]
+            if len(_slice) < BasicTypesMessage.MAX_SIZE: _slice = _slice.ljust(BasicTypesMessage.MAX_SIZE, b"\x00")
+            fields["payload"] = {"basic": BasicTypesMessage._deserialize_fixed(_slice)}
+        if disc_val == 204:
+            fields["payload_which"] = "test_msg"
+            _slice = data[offset:offset+SerializationTestMessage.MAX_SIZE]
+            if len(_slice) < SerializationTestMessage.MAX_SIZE: _slice = _slice.ljust(SerializationTestMessage.MAX_SIZE, b"\x00")
+            fields["payload"] = {"test_msg": SerializationTestMessage._deserialize_fixed(_slice)}
+        offset += _payload_rlen
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+    # ========================================
+    # Envelope message helper methods
+    # ========================================
+
+    # Valid payload types for this envelope
+    _VALID_PAYLOAD_TYPES = ("BasicTypesMessage", "SerializationTestMessage",)
+
+    @classmethod
+    def wrap(cls, payload: Union["BasicTypesMessage", "SerializationTestMessage"], priority: int) -> "VariableEnvelopeMsgIdMessage":
+        """Create a VariableEnvelopeMsgIdMessage envelope wrapping a payload message.
+        
+        Args:
+            payload: The message to wrap (must be one of: BasicTypesMessage, SerializationTestMessage)
+            priority: Envelope field value
+        
+        Returns:
+            A fully initialized VariableEnvelopeMsgIdMessage envelope
+        
+        Raises:
+            TypeError: If payload is not a valid payload type
+        """
+        payload_type_name = type(payload).__name__
+        if payload_type_name not in cls._VALID_PAYLOAD_TYPES:
+            raise TypeError(f"Invalid payload type {payload_type_name}. Must be one of: {cls._VALID_PAYLOAD_TYPES}")
+        
+        # Determine which oneof field to use based on MSG_ID
+        if payload.MSG_ID == BasicTypesMessage.MSG_ID:
+            field_name = "basic"
+        if payload.MSG_ID == SerializationTestMessage.MSG_ID:
+            field_name = "test_msg"
+        
+        envelope = cls(
+            priority=priority,
+            payload={field_name: payload},
+            payload_which=field_name,
+            payload_discriminator=payload.MSG_ID
+        )
+        return envelope
+
+    def unwrap(self) -> Union["BasicTypesMessage", "SerializationTestMessage", None]:
+        """Unwrap and get the payload message based on the discriminator.
+        
+        Returns:
+            The payload message matching the discriminator, or None if not set
+        """
+        if self.payload_discriminator == BasicTypesMessage.MSG_ID:
+            return self.payload.get("basic")
+        elif self.payload_discriminator == SerializationTestMessage.MSG_ID:
+            return self.payload.get("test_msg")
+        return None
+
+    def get_payload_message_id(self) -> int:
+        """Get the message ID of the wrapped payload.
+        
+        Returns:
+            The message ID of the payload in the payload union
+        """
+        return self.payload_discriminator
+
+#// ============================================================================
+#// Variable oneof tests (msgid: 223-224)
+#// Tests for option variable = true on a oneof (different from variable message with fixed oneof).
+#// Wire format: [disc][uint16 length][variant_bytes]
+#// ============================================================================
+#// Variable oneof test message: oneof with variable = true
+#// Each variant writes only its own bytes (not padded to union size).
+class VariableOneofMessage:
+    msg_size = 12
+    MAX_SIZE = 12  # C++ compatible alias
+    BASE_SIZE = 12  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 223
+    MSG_ID = 223  # C++ compatible alias
+    MAGIC1 = 194  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 37  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 4  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, header: int = None, data: dict = None, data_which: str = None, data_discriminator: int = None):
+        self.header = header if header is not None else 0
+        self.data = data if data is not None else {}
+        self.data_which = data_which
+        self.data_discriminator = data_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1, 'large_payload': 2}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(8, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["data_discriminator"] = discriminator
+        # Oneof data payload
+        fields["data"] = {}
+        fields["data_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["data"]["small_payload"] = VarEnvPayloadA._deserialize_fixed(data[offset:offset+VarEnvPayloadA.MAX_SIZE])
+            fields["data_which"] = "small_payload"
+        if discriminator == 2:
+            fields["data"]["large_payload"] = VarEnvPayloadB._deserialize_fixed(data[offset:offset+VarEnvPayloadB.MAX_SIZE])
+            fields["data_which"] = "large_payload"
+        offset += 8
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableOneofMessage Msg, ID 223, Size 12 \n"
+        out += f"header = {self.header}\n"
+        out += f"data = {self.data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["header"] = self.header
+        if self.data_which:
+            out["data"] = self.data[self.data_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "VariableOneofMessage"
+        if include_id:
+            out["msg_id"] = "223"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableOneofMessage):
+            return False
+        return (self.header == other.header and
+                self.data == other.data and
+                self.data_which == other.data_which and
+                self.data_discriminator == other.data_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # header
+        size += 1  # data discriminator
+        size += 2  # data variable-length prefix
+        size += {"small_payload": 3, "large_payload": 8}.get(self.data_which, 0)  # data variant
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1, 'large_payload': 2}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data variable-length union payload
+        _variant_data = b""
+        if self.data_which is not None:
+            _variant_data = self.data[self.data_which].serialize()
+        data += struct.pack("<H", len(_variant_data))
+        data += _variant_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # header: uint8
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order)
+        disc_val = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data variable-length union payload
+        if offset + 2 > len(data): return None
+        _data_len = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        if offset + _data_len > len(data): return None
+        if disc_val == 1 and _data_len >= 3:
+            fields["data_which"] = "small_payload"
+            fields["data"] = {"small_payload": VarEnvPayloadA._deserialize_fixed(data[offset:offset+3])}
+        if disc_val == 2 and _data_len >= 8:
+            fields["data_which"] = "large_payload"
+            fields["data"] = {"large_payload": VarEnvPayloadB._deserialize_fixed(data[offset:offset+8])}
+        offset += _data_len  # Always skip full payload
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// Max-size oneof test message: oneof with max_size override
+#// oneof.size is extended to 32 bytes so future larger variants fit.
+class MaxSizeOneofMessage:
+    msg_size = 34
+    MAX_SIZE = 34  # C++ compatible alias
+    BASE_SIZE = 34  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 224
+    MSG_ID = 224  # C++ compatible alias
+    MAGIC1 = 97  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 99  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 34  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, header: int = None, data: dict = None, data_which: str = None, data_discriminator: int = None):
+        self.header = header if header is not None else 0
+        self.data = data if data is not None else {}
+        self.data_which = data_which
+        self.data_discriminator = data_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(32, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["data_discriminator"] = discriminator
+        # Oneof data payload
+        fields["data"] = {}
+        fields["data_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["data"]["small_payload"] = VarEnvPayloadA._deserialize_fixed(data[offset:offset+VarEnvPayloadA.MAX_SIZE])
+            fields["data_which"] = "small_payload"
+        offset += 32
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MaxSizeOneofMessage Msg, ID 224, Size 34 \n"
+        out += f"header = {self.header}\n"
+        out += f"data = {self.data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["header"] = self.header
+        if self.data_which:
+            out["data"] = self.data[self.data_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "MaxSizeOneofMessage"
+        if include_id:
+            out["msg_id"] = "224"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MaxSizeOneofMessage):
+            return False
+        return (self.header == other.header and
+                self.data == other.data and
+                self.data_which == other.data_which and
+                self.data_discriminator == other.data_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # header
+        size += 1  # data discriminator
+        size += {"small_payload": 3}.get(self.data_which, 0)  # data trimmed union
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data trimmed union payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # header: uint8
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order)
+        disc_val = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data trimmed union read
+        _data_rlen = 0
+        if disc_val == 1: _data_rlen = max(3, 0)
+        if disc_val == 1:
+            fields["data_which"] = "small_payload"
+            _slice = data[offset:offset+VarEnvPayloadA.MAX_SIZE]
+            if len(_slice) < VarEnvPayloadA.MAX_SIZE: _slice = _slice.ljust(VarEnvPayloadA.MAX_SIZE, b"\x00")
+            fields["data"] = {"small_payload": VarEnvPayloadA._deserialize_fixed(_slice)}
+        offset += _data_rlen
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// Min-size oneof test message: oneof with min_size override
+#// VarEnvPayloadA is 3 bytes; min_size = 8 pads it to 8 on the wire.
+#// VarEnvPayloadB is 8 bytes; no padding needed (already at min_size).
+class MinSizeOneofMessage:
+    msg_size = 12
+    MAX_SIZE = 12  # C++ compatible alias
+    BASE_SIZE = 12  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 225
+    MSG_ID = 225  # C++ compatible alias
+    MAGIC1 = 194  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 37  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 4  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, header: int = None, data: dict = None, data_which: str = None, data_discriminator: int = None):
+        self.header = header if header is not None else 0
+        self.data = data if data is not None else {}
+        self.data_which = data_which
+        self.data_discriminator = data_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1, 'large_payload': 2}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data payload
+        union_data = b""
+        if self.data_which is not None:
+            union_data = self.data[self.data_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(8, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["data_discriminator"] = discriminator
+        # Oneof data payload
+        fields["data"] = {}
+        fields["data_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["data"]["small_payload"] = VarEnvPayloadA._deserialize_fixed(data[offset:offset+VarEnvPayloadA.MAX_SIZE])
+            fields["data_which"] = "small_payload"
+        if discriminator == 2:
+            fields["data"]["large_payload"] = VarEnvPayloadB._deserialize_fixed(data[offset:offset+VarEnvPayloadB.MAX_SIZE])
+            fields["data_which"] = "large_payload"
+        offset += 8
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MinSizeOneofMessage Msg, ID 225, Size 12 \n"
+        out += f"header = {self.header}\n"
+        out += f"data = {self.data}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["header"] = self.header
+        if self.data_which:
+            out["data"] = self.data[self.data_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "MinSizeOneofMessage"
+        if include_id:
+            out["msg_id"] = "225"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MinSizeOneofMessage):
+            return False
+        return (self.header == other.header and
+                self.data == other.data and
+                self.data_which == other.data_which and
+                self.data_discriminator == other.data_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # header
+        size += 1  # data discriminator
+        size += 2  # data variable-length prefix
+        size += max({"small_payload": 3, "large_payload": 8}.get(self.data_which, 0), 8)  # data variant
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.header)
+        # Oneof data discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'small_payload': 1, 'large_payload': 2}
+        if self.data_which is not None:
+            data += struct.pack("<B", _field_order_map[self.data_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof data variable-length union payload
+        _variant_data = b""
+        if self.data_which is not None:
+            _variant_data = self.data[self.data_which].serialize()
+        if len(_variant_data) < 8:
+            _variant_data = _variant_data.ljust(8, b"\x00")
+        data += struct.pack("<H", len(_variant_data))
+        data += _variant_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # header: uint8
+        fields["header"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data discriminator (uint8 - field order)
+        disc_val = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof data variable-length union payload
+        if offset + 2 > len(data): return None
+        _data_len = struct.unpack_from("<H", data, offset)[0]
+        offset += 2
+        if offset + _data_len > len(data): return None
+        if disc_val == 1 and _data_len >= 3:
+            fields["data_which"] = "small_payload"
+            fields["data"] = {"small_payload": VarEnvPayloadA._deserialize_fixed(data[offset:offset+3])}
+        if disc_val == 2 and _data_len >= 8:
+            fields["data_which"] = "large_payload"
+            fields["data"] = {"large_payload": VarEnvPayloadB._deserialize_fixed(data[offset:offset+8])}
+        offset += _data_len  # Always skip full payload
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+
+__all__ = [
+    'BasicTypesMessage',
+    'CollisionEnumMessage',
+    'ComprehensiveArrayMessage',
+    'FlattenInner',
+    'FlattenMessage',
+    'MaxSizeOneofMessage',
+    'MaxSizeOneofMessageDataField',
+    'Message',
+    'MinSizeOneofMessage',
+    'MinSizeOneofMessageDataField',
+    'MsgSeverity',
+    'MultiOneofMessage',
+    'NestedEnumMessage',
+    'NestedPayload',
+    'NestedVariableMessage',
+    'NoneDiscriminatorMessage',
+    'Priority',
+    'Sensor',
+    'SerializationTestMessage',
+    'SimplePayload',
+    'Status',
+    'TruncationTestNonVariable',
+    'TruncationTestVariable',
+    'UnionTestMessage',
+    'UnionTestMessageFieldOrder',
+    'UnionTestMessageFieldOrderDataField',
+    'VarEnvPayloadA',
+    'VarEnvPayloadB',
+    'VariableEnvelopeMessage',
+    'VariableEnvelopeMessagePayloadField',
+    'VariableEnvelopeMsgIdMessage',
+    'VariableMixedFields',
+    'VariableMultipleArrays',
+    'VariableOneofMessage',
+    'VariableOneofMessageDataField',
+    'VariableSingleArray',
+]
+
+serialization_test_definitions = {
+    201: BasicTypesMessage,
+    203: ComprehensiveArrayMessage,
+    204: SerializationTestMessage,
+    205: UnionTestMessage,
+    212: UnionTestMessageFieldOrder,
+    206: VariableSingleArray,
+    207: VariableMultipleArrays,
+    208: VariableMixedFields,
+    209: TruncationTestNonVariable,
+    210: TruncationTestVariable,
+    211: Message,
+    220: NestedVariableMessage,
+    213: NestedEnumMessage,
+    214: CollisionEnumMessage,
+    215: FlattenMessage,
+    216: NoneDiscriminatorMessage,
+    217: MultiOneofMessage,
+    221: VariableEnvelopeMessage,
+    222: VariableEnvelopeMsgIdMessage,
+    223: VariableOneofMessage,
+    224: MaxSizeOneofMessage,
+    225: MinSizeOneofMessage,
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from message ID"""
+    return serialization_test_definitions.get(msg_id)
+
+def get_msg_length(msg_id: int) -> int:
+    """Get message size from message ID (for minimal frame parsing)"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a message ID.
+    
+    Args:
+        msg_id: Message ID
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
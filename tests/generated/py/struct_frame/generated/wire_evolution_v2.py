@@ -0,0 +1,842 @@
+# Automatically generated struct frame header 
+# Generated by struct-frame 0.0.1.
+
+import struct
+from enum import Enum
+from typing import List, Union
+
+# Helper function to truncate float64 to float32 precision
+def _truncate_float32(val: float) -> float:
+    """Truncate a Python float (float64) to float32 precision"""
+    return struct.unpack("<f", struct.pack("<f", val))[0]
+
+# Oneof discriminator enums
+class OneOfExtensionMessageCommandField(Enum):
+    """Discriminator enum for OneOfExtensionMessage.command oneof"""
+    NONE = 0
+    CMD_A = 1
+    CMD_B = 2
+    CMD_C = 3
+    CMD_D = 4
+
+class MultiOneOfExtensionMessageBaseUnionField(Enum):
+    """Discriminator enum for MultiOneOfExtensionMessage.base_union oneof"""
+    NONE = 0
+    FIRST_A = 1
+    FIRST_B = 2
+
+class MultiOneOfExtensionMessageExtUnionField(Enum):
+    """Discriminator enum for MultiOneOfExtensionMessage.ext_union oneof"""
+    NONE = 0
+    SECOND_A = 1
+    SECOND_EXT = 2
+
+# Message definitions 
+#// Wire-evolution interop fixture — *version 2* (adds extension fields/variants).
+#//
+#// This is the "newer" half of a paired schema set used to test genuine
+#// cross-version extension interop.  It is generated into its own package
+#// (`wire_evolution_v2`) so that the v2 side is truly unaware that it is talking
+#// to a v1 peer — it simply uses the canonical `option extensions_start`
+#// mechanism to append extension fields/variants after the base portion.
+#//
+#// The base fields/variants, message ids, and oneof base variants are identical
+#// to `wire_evolution_v1.sf`.  v2 additionally declares `extensions_start` plus
+#// the extension fields (crc_seed, ext_timestamp) and extension oneof variants
+#// (cmd_c/cmd_d, second_ext).  Because extension fields are excluded from the
+#// magic-byte computation, a v1 and v2 build of the same message agree on magic
+#// bytes — which is what lets a v1 receiver validate the base portion of a v2
+#// frame using the frame length field to skip the trailing extension bytes.
+#//
+#// ============================================================================
+#// Shared sub-message types used inside oneofs
+#// ============================================================================
+class BaseCommandA:
+    msg_size = 6
+    MAX_SIZE = 6  # C++ compatible alias
+    BASE_SIZE = 6  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, value_a: int = None, flags_a: int = None):
+        self.value_a = value_a if value_a is not None else 0
+        self.flags_a = flags_a if flags_a is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<IH", self.value_a, self.flags_a)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<IH", data, offset)
+        offset += 6
+        fields["value_a"] = _vals[0]
+        fields["flags_a"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "BaseCommandA Msg, ID None, Size 6 \n"
+        out += f"value_a = {self.value_a}\n"
+        out += f"flags_a = {self.flags_a}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["value_a"] = self.value_a
+        out["flags_a"] = self.flags_a
+        if include_name:
+            out["name"] = "BaseCommandA"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, BaseCommandA):
+            return False
+        return (self.value_a == other.value_a and
+                self.flags_a == other.flags_a)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+class BaseCommandB:
+    msg_size = 3
+    MAX_SIZE = 3  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, value_b: int = None, active_b: bool = None):
+        self.value_b = value_b if value_b is not None else 0
+        self.active_b = active_b if active_b is not None else False
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<h?", self.value_b, self.active_b)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<h?", data, offset)
+        offset += 3
+        fields["value_b"] = _vals[0]
+        fields["active_b"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "BaseCommandB Msg, ID None, Size 3 \n"
+        out += f"value_b = {self.value_b}\n"
+        out += f"active_b = {self.active_b}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["value_b"] = self.value_b
+        out["active_b"] = self.active_b
+        if include_name:
+            out["name"] = "BaseCommandB"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, BaseCommandB):
+            return False
+        return (self.value_b == other.value_b and
+                self.active_b == other.active_b)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// Extension oneof variants — older (v1) receivers treat these as unknown.
+class ExtCommandC:
+    msg_size = 5
+    MAX_SIZE = 5  # C++ compatible alias
+    BASE_SIZE = 5  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, value_c: float = None, mode_c: int = None):
+        self.value_c = _truncate_float32(value_c) if value_c is not None else 0.0
+        self.mode_c = mode_c if mode_c is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<fB", self.value_c, self.mode_c)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<fB", data, offset)
+        offset += 5
+        fields["value_c"] = _vals[0]
+        fields["mode_c"] = _vals[1]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtCommandC Msg, ID None, Size 5 \n"
+        out += f"value_c = {self.value_c}\n"
+        out += f"mode_c = {self.mode_c}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["value_c"] = self.value_c
+        out["mode_c"] = self.mode_c
+        if include_name:
+            out["name"] = "ExtCommandC"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtCommandC):
+            return False
+        return (self.value_c == other.value_c and
+                self.mode_c == other.mode_c)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+class ExtCommandD:
+    msg_size = 8
+    MAX_SIZE = 8  # C++ compatible alias
+    BASE_SIZE = 8  # Non-extension portion size (== MAX_SIZE when no extensions)
+
+    def __init__(self, value_d: float = None):
+        self.value_d = value_d if value_d is not None else 0.0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<d", self.value_d)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["value_d"] = struct.unpack_from("<d", data, offset)[0]
+        offset += 8
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "ExtCommandD Msg, ID None, Size 8 \n"
+        out += f"value_d = {self.value_d}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["value_d"] = self.value_d
+        if include_name:
+            out["name"] = "ExtCommandD"
+        if include_id:
+            out["msg_id"] = "None"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, ExtCommandD):
+            return False
+        return (self.value_d == other.value_d)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+#// ============================================================================
+#// Scenario 1 — standard message with top-level extension field (fixed base)
+#// ============================================================================
+class BaseExtensionMessage:
+    msg_size = 7
+    MAX_SIZE = 7  # C++ compatible alias
+    BASE_SIZE = 3  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 1
+    MSG_ID = 1  # C++ compatible alias
+    MAGIC1 = 7  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 11  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, header: int = None, seq: int = None, crc_seed: int = None):
+        self.header = header if header is not None else 0
+        self.seq = seq if seq is not None else 0
+        self.crc_seed = crc_seed if crc_seed is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<HBI", self.header, self.seq, self.crc_seed)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        _vals = struct.unpack_from("<HBI", data, offset)
+        offset += 7
+        fields["header"] = _vals[0]
+        fields["seq"] = _vals[1]
+        fields["crc_seed"] = _vals[2]
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "BaseExtensionMessage Msg, ID 1, Size 7 \n"
+        out += f"header = {self.header}\n"
+        out += f"seq = {self.seq}\n"
+        out += f"crc_seed = {self.crc_seed}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["header"] = self.header
+        out["seq"] = self.seq
+        out["crc_seed"] = self.crc_seed
+        if include_name:
+            out["name"] = "BaseExtensionMessage"
+        if include_id:
+            out["msg_id"] = "1"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, BaseExtensionMessage):
+            return False
+        return (self.header == other.header and
+                self.seq == other.seq and
+                self.crc_seed == other.crc_seed)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Scenario 2 — variable-length message with top-level extension field
+#// ============================================================================
+class VariableExtensionMessage:
+    msg_size = 38
+    MAX_SIZE = 38  # C++ compatible alias
+    BASE_SIZE = 34  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 2
+    MSG_ID = 2  # C++ compatible alias
+    MAGIC1 = 7  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 9  # Checksum magic number (based on field types and positions)
+    MIN_SIZE = 6  # Minimum size when all variable fields are empty
+    IS_VARIABLE = True  # This message uses variable-length encoding
+
+    def __init__(self, node_id: int = None, readings: List[int] = None, ext_timestamp: int = None):
+        self.node_id = node_id if node_id is not None else 0
+        self.readings = readings if readings is not None else []
+        self.ext_timestamp = ext_timestamp if ext_timestamp is not None else 0
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format (variable-length encoding by default)
+        
+        For variable messages: returns variable-length encoding.
+        Use serialize_max_size() for MAX_SIZE encoding (needed for minimal profiles).
+        """
+        return self._serialize_variable()
+
+    def serialize_max_size(self) -> bytes:
+        """Serialize the message to MAX_SIZE (for minimal profiles without length field)"""
+        data = bytearray()
+        data += struct.pack("<B", self.node_id)
+        # Bounded array: readings
+        data += struct.pack("<B", min(len(self.readings), 16))
+        _vals = list(self.readings[:16])
+        _vals += [0] * (16 - len(_vals))
+        data += struct.pack("<16H", *_vals)
+        data += struct.pack("<I", self.ext_timestamp)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["node_id"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Bounded array: readings
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _all = struct.unpack_from("<16H", data, offset)
+        offset += 32
+        fields["readings"] = list(_all[:min(count, 16)])
+        fields["ext_timestamp"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "VariableExtensionMessage Msg, ID 2, Size 38 \n"
+        out += f"node_id = {self.node_id}\n"
+        out += f"readings = {self.readings}\n"
+        out += f"ext_timestamp = {self.ext_timestamp}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["node_id"] = self.node_id
+        out["readings"] = self.readings
+        out["ext_timestamp"] = self.ext_timestamp
+        if include_name:
+            out["name"] = "VariableExtensionMessage"
+        if include_id:
+            out["msg_id"] = "2"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, VariableExtensionMessage):
+            return False
+        return (self.node_id == other.node_id and
+                self.readings == other.readings and
+                self.ext_timestamp == other.ext_timestamp)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    IS_VARIABLE = True
+
+    def serialized_size(self) -> int:
+        """Calculate the serialized size using variable-length encoding."""
+        size = 0
+        size += 1  # node_id
+        size += 1 + (min(len(self.readings), 16) * 2)  # readings
+        size += 4  # ext_timestamp
+        return size
+
+    def _serialize_variable(self) -> bytes:
+        """Serialize message using variable-length encoding (only serializes used bytes)."""
+        data = bytearray()
+        data += struct.pack("<B", self.node_id)
+        # Bounded array: readings
+        _n = min(len(self.readings), 16)
+        data += struct.pack("<B", _n)
+        _vals = list(self.readings[:_n])
+        data += struct.pack("<%dH" % _n, *_vals)
+        data += struct.pack("<I", self.ext_timestamp)
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_variable(cls, data: bytes):
+        """Deserialize message using variable-length encoding."""
+        offset = 0
+        fields = {}
+        # node_id: uint8
+        fields["node_id"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # readings: variable uint16 array
+        count = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        _n = min(count, 16)
+        fields["readings"] = list(struct.unpack_from("<%dH" % _n, data, offset))
+        offset += _n * 2
+        # ext_timestamp: uint32
+        fields["ext_timestamp"] = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        return cls(**fields)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Variable message - check encoding format
+        if len(data) == cls.MAX_SIZE:
+            # Minimal profile format (MAX_SIZE encoding)
+            return cls._deserialize_fixed(data)
+        else:
+            # Variable-length format
+            return cls._deserialize_variable(data)
+
+#// ============================================================================
+#// Scenario 3 — single oneof with base + extension variants
+#// ============================================================================
+class OneOfExtensionMessage:
+    msg_size = 10
+    MAX_SIZE = 10  # C++ compatible alias
+    BASE_SIZE = 8  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 3
+    MSG_ID = 3  # C++ compatible alias
+    MAGIC1 = 254  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 127  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, device_id: int = None, command: dict = None, command_which: str = None, command_discriminator: int = None):
+        self.device_id = device_id if device_id is not None else 0
+        self.command = command if command is not None else {}
+        self.command_which = command_which
+        self.command_discriminator = command_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<B", self.device_id)
+        # Oneof command discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'cmd_a': 1, 'cmd_b': 2, 'cmd_c': 3, 'cmd_d': 4}
+        if self.command_which is not None:
+            data += struct.pack("<B", _field_order_map[self.command_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof command payload
+        union_data = b""
+        if self.command_which is not None:
+            union_data = self.command[self.command_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(8, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["device_id"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof command discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["command_discriminator"] = discriminator
+        # Oneof command payload
+        fields["command"] = {}
+        fields["command_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["command"]["cmd_a"] = BaseCommandA._deserialize_fixed(data[offset:offset+BaseCommandA.MAX_SIZE])
+            fields["command_which"] = "cmd_a"
+        if discriminator == 2:
+            fields["command"]["cmd_b"] = BaseCommandB._deserialize_fixed(data[offset:offset+BaseCommandB.MAX_SIZE])
+            fields["command_which"] = "cmd_b"
+        if discriminator == 3:
+            fields["command"]["cmd_c"] = ExtCommandC._deserialize_fixed(data[offset:offset+ExtCommandC.MAX_SIZE])
+            fields["command_which"] = "cmd_c"
+        if discriminator == 4:
+            fields["command"]["cmd_d"] = ExtCommandD._deserialize_fixed(data[offset:offset+ExtCommandD.MAX_SIZE])
+            fields["command_which"] = "cmd_d"
+        offset += 8
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "OneOfExtensionMessage Msg, ID 3, Size 10 \n"
+        out += f"device_id = {self.device_id}\n"
+        out += f"command = {self.command}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["device_id"] = self.device_id
+        if self.command_which:
+            out["command"] = self.command[self.command_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "OneOfExtensionMessage"
+        if include_id:
+            out["msg_id"] = "3"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, OneOfExtensionMessage):
+            return False
+        return (self.device_id == other.device_id and
+                self.command == other.command and
+                self.command_which == other.command_which and
+                self.command_discriminator == other.command_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+#// ============================================================================
+#// Scenario 4 — two oneofs, only the second has an extension variant
+#// ============================================================================
+class MultiOneOfExtensionMessage:
+    msg_size = 15
+    MAX_SIZE = 15  # C++ compatible alias
+    BASE_SIZE = 15  # Non-extension portion size (== MAX_SIZE when no extensions)
+    msg_id = 4
+    MSG_ID = 4  # C++ compatible alias
+    MAGIC1 = 125  # Checksum magic number (based on field types and positions)
+    MAGIC2 = 252  # Checksum magic number (based on field types and positions)
+
+    def __init__(self, priority: int = None, base_union: dict = None, base_union_which: str = None, base_union_discriminator: int = None, ext_union: dict = None, ext_union_which: str = None, ext_union_discriminator: int = None):
+        self.priority = priority if priority is not None else 0
+        self.base_union = base_union if base_union is not None else {}
+        self.base_union_which = base_union_which
+        self.base_union_discriminator = base_union_discriminator
+        self.ext_union = ext_union if ext_union is not None else {}
+        self.ext_union_which = ext_union_which
+        self.ext_union_discriminator = ext_union_discriminator
+
+    def serialize(self) -> bytes:
+        """Serialize the message into binary format"""
+        data = bytearray()
+        data += struct.pack("<B", self.priority)
+        # Oneof base_union discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'first_a': 1, 'first_b': 2}
+        if self.base_union_which is not None:
+            data += struct.pack("<B", _field_order_map[self.base_union_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof base_union payload
+        union_data = b""
+        if self.base_union_which is not None:
+            union_data = self.base_union[self.base_union_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(6, b"\x00")
+        data += union_data
+        # Oneof ext_union discriminator (uint8 - field order, 1-based)
+        _field_order_map = {'second_a': 1, 'second_ext': 2}
+        if self.ext_union_which is not None:
+            data += struct.pack("<B", _field_order_map[self.ext_union_which])
+        else:
+            data += struct.pack("<B", 0)
+        # Oneof ext_union payload
+        union_data = b""
+        if self.ext_union_which is not None:
+            union_data = self.ext_union[self.ext_union_which].serialize()
+        # Pad to union size
+        union_data = union_data.ljust(6, b"\x00")
+        data += union_data
+        return bytes(data)
+
+    @classmethod
+    def _deserialize_fixed(cls, data: bytes):
+        """Deserialize binary data into a message instance (fixed-size format)"""
+        offset = 0
+        fields = {}
+        fields["priority"] = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        # Oneof base_union discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["base_union_discriminator"] = discriminator
+        # Oneof base_union payload
+        fields["base_union"] = {}
+        fields["base_union_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["base_union"]["first_a"] = BaseCommandA._deserialize_fixed(data[offset:offset+BaseCommandA.MAX_SIZE])
+            fields["base_union_which"] = "first_a"
+        if discriminator == 2:
+            fields["base_union"]["first_b"] = BaseCommandB._deserialize_fixed(data[offset:offset+BaseCommandB.MAX_SIZE])
+            fields["base_union_which"] = "first_b"
+        offset += 6
+        # Oneof ext_union discriminator (uint8 - field order, 1-based)
+        discriminator = struct.unpack_from("<B", data, offset)[0]
+        offset += 1
+        fields["ext_union_discriminator"] = discriminator
+        # Oneof ext_union payload
+        fields["ext_union"] = {}
+        fields["ext_union_which"] = None
+        # Determine which field is active based on field order (1-based index)
+        if discriminator == 1:
+            fields["ext_union"]["second_a"] = BaseCommandA._deserialize_fixed(data[offset:offset+BaseCommandA.MAX_SIZE])
+            fields["ext_union_which"] = "second_a"
+        if discriminator == 2:
+            fields["ext_union"]["second_ext"] = ExtCommandC._deserialize_fixed(data[offset:offset+ExtCommandC.MAX_SIZE])
+            fields["ext_union_which"] = "second_ext"
+        offset += 6
+        return cls(**fields)
+
+    def data(self) -> bytes:
+        """Return packed message bytes (C++ MessageBase compatible API)"""
+        return self.serialize()
+
+    def __str__(self):
+        out = "MultiOneOfExtensionMessage Msg, ID 4, Size 15 \n"
+        out += f"priority = {self.priority}\n"
+        out += f"base_union = {self.base_union}\n"
+        out += f"ext_union = {self.ext_union}\n"
+        out += "\n"
+        return out
+
+    def to_dict(self, include_name = True, include_id = True):
+        out = {}
+        out["priority"] = self.priority
+        if self.base_union_which:
+            out["base_union"] = self.base_union[self.base_union_which].to_dict(False, False)
+        if self.ext_union_which:
+            out["ext_union"] = self.ext_union[self.ext_union_which].to_dict(False, False)
+        if include_name:
+            out["name"] = "MultiOneOfExtensionMessage"
+        if include_id:
+            out["msg_id"] = "4"
+        return out
+
+    def __eq__(self, other) -> bool:
+        """Compare two messages for equality"""
+        if not isinstance(other, MultiOneOfExtensionMessage):
+            return False
+        return (self.priority == other.priority and
+                self.base_union == other.base_union and
+                self.base_union_which == other.base_union_which and
+                self.base_union_discriminator == other.base_union_discriminator and
+                self.ext_union == other.ext_union and
+                self.ext_union_which == other.ext_union_which and
+                self.ext_union_discriminator == other.ext_union_discriminator)
+
+    def __ne__(self, other) -> bool:
+        """Compare two messages for inequality"""
+        return not self.__eq__(other)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Deserialize message from binary data or FrameMsgInfo.
+        
+        Args:
+            data: Either bytes to deserialize, or FrameMsgInfo from frame parser
+        
+        Returns:
+            Deserialized message instance
+        """
+        # Check if data is FrameMsgInfo (duck typing - has msg_data attribute)
+        if hasattr(data, "msg_data"):
+            data = data.msg_data
+        
+        # Fixed-size message - use standard deserialization
+        return cls._deserialize_fixed(data)
+
+
+__all__ = [
+    'BaseCommandA',
+    'BaseCommandB',
+    'BaseExtensionMessage',
+    'ExtCommandC',
+    'ExtCommandD',
+    'MultiOneOfExtensionMessage',
+    'MultiOneOfExtensionMessageBaseUnionField',
+    'MultiOneOfExtensionMessageExtUnionField',
+    'OneOfExtensionMessage',
+    'OneOfExtensionMessageCommandField',
+    'VariableExtensionMessage',
+]
+
+wire_evolution_v2_definitions = {
+    1: BaseExtensionMessage,
+    2: VariableExtensionMessage,
+    3: OneOfExtensionMessage,
+    4: MultiOneOfExtensionMessage,
+}
+
+def get_message_class(msg_id: int):
+    """Get message class from message ID"""
+    return wire_evolution_v2_definitions.get(msg_id)
+
+def get_msg_length(msg_id: int) -> int:
+    """Get message size from message ID (for minimal frame parsing)"""
+    msg_class = get_message_class(msg_id)
+    return msg_class.msg_size if msg_class else 0
+
+def get_message_info(msg_id: int):
+    """
+    Get unified message info (size and magic numbers) for a message ID.
+    
+    Args:
+        msg_id: Message ID
+    
+    Returns:
+        MessageInfo(size, magic1, magic2) or None if message not found
+    """
+    try:
+        from .frame_profiles import MessageInfo
+    except ImportError:
+        from frame_profiles import MessageInfo
+    msg_class = get_message_class(msg_id)
+    if not msg_class:
+        return None
+    magic1 = getattr(msg_class, "MAGIC1", 0)
+    magic2 = getattr(msg_class, "MAGIC2", 0)
+    base_size = getattr(msg_class, "BASE_SIZE", msg_class.msg_size)
+    return MessageInfo(size=msg_class.msg_size, magic1=magic1, magic2=magic2, base_size=base_size)
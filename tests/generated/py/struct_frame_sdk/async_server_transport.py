@@ -0,0 +1,405 @@
+"""Async server transports (TCP accept / UDP demultiplex) using asyncio
+
+Unlike the client transports, a server transport talks to many peers at once.
+Every callback therefore carries a ``PeerInfo`` identifying which connection
+(TCP) or source address (UDP) the event belongs to.
+
+Both implementations are built on asyncio protocols rather than one
+``StreamReader`` task per connection, so thousands of peers cost one protocol
+object each on a single event loop.
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class AsyncServerTransportConfig:
+    """Configuration for async server transports.
+
+    Attributes:
+        host: Local address to listen on.
+        port: Local port to listen on (0 = ephemeral; see ``bound_address``).
+        backlog: TCP listen backlog.
+        max_peers: Maximum simultaneous peers (0 = unlimited). New TCP
+            connections beyond the limit are closed immediately; datagrams from
+            new UDP source addresses are dropped.
+        peer_idle_timeout: UDP only. Forget a source address after this many
+            seconds without traffic (0 = never).
+    """
+    host: str = '0.0.0.0'
+    port: int = 0
+    backlog: int = 1024
+    max_peers: int = 0
+    peer_idle_timeout: float = 0.0
+
+
+@dataclass(frozen=True)
+class PeerInfo:
+    """Identity of one remote peer.
+
+    ``peer_id`` is unique for the lifetime of the server transport, so a peer
+    that disconnects and reconnects from the same address gets a new identity.
+    Instances are hashable and can key per-peer state.
+    """
+    peer_id: int
+    address: Tuple
+    protocol: str
+
+
+PeerCallback = Callable[[PeerInfo], None]
+PeerDataCallback = Callable[[PeerInfo, bytes], None]
+
+
+class BaseAsyncServerTransport:
+    """Common callback plumbing and peer bookkeeping for server transports."""
+
+    protocol_name = ''
+
+    def __init__(self, config: Optional[AsyncServerTransportConfig] = None):
+        self.config = config or AsyncServerTransportConfig()
+        self.listening = False
+        self.peer_connect_callback: Optional[PeerCallback] = None
+        self.peer_data_callback: Optional[PeerDataCallback] = None
+        self.peer_close_callback: Optional[PeerCallback] = None
+        self.error_callback: Optional[Callable[[Exception], None]] = None
+        self._peer_ids = itertools.count(1)
+
+    def set_peer_connect_callback(self, callback: PeerCallback) -> None:
+        """Set callback invoked when a new peer appears"""
+        self.peer_connect_callback = callback
+
+    def set_peer_data_callback(self, callback: PeerDataCallback) -> None:
+        """Set callback for data received from a peer"""
+        self.peer_data_callback = callback
+
+    def set_peer_close_callback(self, callback: PeerCallback) -> None:
+        """Set callback invoked when a peer goes away"""
+        self.peer_close_callback = callback
+
+    def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
+        """Set callback for transport errors"""
+        self.error_callback = callback
+
+    def is_listening(self) -> bool:
+        """Check if the server is accepting peers"""
+        return self.listening
+
+    def peers(self) -> List[PeerInfo]:
+        """Return the currently known peers"""
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """Bind and start accepting peers"""
+        raise NotImplementedError
+
+    async def stop(self) -> None:
+        """Stop accepting peers and drop every existing peer"""
+        raise NotImplementedError
+
+    async def send_to(self, peer: PeerInfo, data: bytes) -> int:
+        """Send data to one peer and return bytes written"""
+        raise NotImplementedError
+
+    async def broadcast(self, data: bytes) -> int:
+        """Send data to every known peer; returns the number of peers reached"""
+        count = 0
+        for peer in self.peers():
+            try:
+                await self.send_to(peer, data)
+                count += 1
+            except Exception as e:
+                self._handle_error(e)
+        return count
+
+    async def __aenter__(self):
+        """Async context manager entry: start and return self."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: always stop."""
+        await self.stop()
+        return False
+
+    def _new_peer(self, address) -> PeerInfo:
+        if isinstance(address, list):
+            address = tuple(address)
+        return PeerInfo(next(self._peer_ids), address, self.protocol_name)
+
+    def _handle_peer_connect(self, peer: PeerInfo) -> None:
+        if self.peer_connect_callback:
+            self.peer_connect_callback(peer)
+
+    def _handle_peer_data(self, peer: PeerInfo, data: bytes) -> None:
+        if self.peer_data_callback:
+            self.peer_data_callback(peer, data)
+
+    def _handle_peer_close(self, peer: PeerInfo) -> None:
+        if self.peer_close_callback:
+            self.peer_close_callback(peer)
+
+    def _handle_error(self, error: Exception) -> None:
+        if self.error_callback:
+            self.error_callback(error)
+
+
+# =============================================================================
+# TCP
+# =============================================================================
+
+@dataclass
+class AsyncTcpServerTransportConfig(AsyncServerTransportConfig):
+    """Async TCP server transport configuration"""
+    pass
+
+
+class _TcpPeerProtocol(asyncio.Protocol):
+    """Per-connection protocol; forwards events to the owning server."""
+
+    def __init__(self, server: 'AsyncTcpServerTransport'):
+        self.server = server
+        self.transport: Optional[asyncio.Transport] = None
+        self.peer: Optional[PeerInfo] = None
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.peer = self.server._accept(self, transport)
+
+    def data_received(self, data):
+        if self.peer is not None:
+            self.server._handle_peer_data(self.peer, data)
+
+    def connection_lost(self, exc):
+        self._can_write.set()
+        if self.peer is not None:
+            if exc:
+                self.server._handle_error(exc)
+            self.server._release(self.peer)
+
+    def pause_writing(self):
+        self._can_write.clear()
+
+    def resume_writing(self):
+        self._can_write.set()
+
+    async def drain(self) -> None:
+        await self._can_write.wait()
+
+
+class AsyncTcpServerTransport(BaseAsyncServerTransport):
+    """Async TCP server accepting any number of client connections"""
+
+    protocol_name = 'tcp'
+
+    def __init__(self, config: Optional[AsyncTcpServerTransportConfig] = None):
+        super().__init__(config or AsyncTcpServerTransportConfig())
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[PeerInfo, _TcpPeerProtocol] = {}
+
+    async def start(self) -> None:
+        """Start listening for TCP connections"""
+        try:
+            loop = asyncio.get_running_loop()
+            self.server = await loop.create_server(
+                lambda: _TcpPeerProtocol(self),
+                self.config.host,
+                self.config.port,
+                backlog=self.config.backlog,
+            )
+            self.listening = True
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def stop(self) -> None:
+        """Stop listening and close every client connection"""
+        self.listening = False
+        if self.server:
+            self.server.close()
+        for protocol in list(self._connections.values()):
+            if protocol.transport:
+                protocol.transport.close()
+        if self.server:
+            try:
+                await asyncio.wait_for(self.server.wait_closed(), timeout=2.0)
+            except (asyncio.TimeoutError, Exception):
+                pass
+            self.server = None
+
+    @property
+    def bound_address(self) -> Optional[Tuple]:
+        """Actual (host, port) the server listens on, once started"""
+        if self.server and self.server.sockets:
+            return self.server.sockets[0].getsockname()
+        return None
+
+    def peers(self) -> List[PeerInfo]:
+        return list(self._connections)
+
+    async def send_to(self, peer: PeerInfo, data: bytes) -> int:
+        """Send data to one connected client"""
+        protocol = self._connections.get(peer)
+        if protocol is None or protocol.transport is None or protocol.transport.is_closing():
+            raise RuntimeError(f'TCP peer {peer.peer_id} not connected')
+        try:
+            protocol.transport.write(data)
+            await protocol.drain()
+            return len(data)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def close_peer(self, peer: PeerInfo) -> None:
+        """Close one client connection (close callback fires when it completes)"""
+        protocol = self._connections.get(peer)
+        if protocol is not None and protocol.transport is not None:
+            protocol.transport.close()
+
+    def _accept(self, protocol: _TcpPeerProtocol, transport: asyncio.Transport) -> Optional[PeerInfo]:
+        if not self.listening or (self.config.max_peers > 0 and len(self._connections) >= self.config.max_peers):
+            transport.close()
+            return None
+        peer = self._new_peer(transport.get_extra_info('peername'))
+        self._connections[peer] = protocol
+        self._handle_peer_connect(peer)
+        return peer
+
+    def _release(self, peer: PeerInfo) -> None:
+        if self._connections.pop(peer, None) is not None:
+            self._handle_peer_close(peer)
+
+
+# =============================================================================
+# UDP
+# =============================================================================
+
+@dataclass
+class AsyncUdpServerTransportConfig(AsyncServerTransportConfig):
+    """Async UDP server transport configuration"""
+    enable_broadcast: bool = False
+
+
+class _UdpServerProtocol(asyncio.DatagramProtocol):
+    """Single datagram endpoint shared by every UDP peer."""
+
+    def __init__(self, server: 'AsyncUdpServerTransport'):
+        self.server = server
+
+    def datagram_received(self, data, addr):
+        self.server._datagram(data, addr)
+
+    def error_received(self, exc):
+        self.server._handle_error(exc)
+
+    def connection_lost(self, exc):
+        if exc:
+            self.server._handle_error(exc)
+
+
+class AsyncUdpServerTransport(BaseAsyncServerTransport):
+    """Async UDP server that demultiplexes datagrams by source address"""
+
+    protocol_name = 'udp'
+
+    def __init__(self, config: Optional[AsyncUdpServerTransportConfig] = None):
+        super().__init__(config or AsyncUdpServerTransportConfig())
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self._peers_by_addr: Dict[Tuple, PeerInfo] = {}
+        self._last_seen: Dict[PeerInfo, float] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Bind the UDP socket"""
+        try:
+            loop = asyncio.get_running_loop()
+            self.transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UdpServerProtocol(self),
+                local_addr=(self.config.host, self.config.port),
+            )
+            if getattr(self.config, 'enable_broadcast', False):
+                sock = self.transport.get_extra_info('socket')
+                if sock:
+                    import socket
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self.listening = True
+            if self.config.peer_idle_timeout > 0:
+                self._sweep_task = asyncio.create_task(self._sweep_loop())
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def stop(self) -> None:
+        """Close the UDP socket and forget every peer"""
+        self.listening = False
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+        for peer in list(self._peers_by_addr.values()):
+            self._forget(peer)
+
+    @property
+    def bound_address(self) -> Optional[Tuple]:
+        """Actual (host, port) the socket is bound to, once started"""
+        if self.transport:
+            return self.transport.get_extra_info('sockname')
+        return None
+
+    def peers(self) -> List[PeerInfo]:
+        return list(self._peers_by_addr.values())
+
+    async def send_to(self, peer: PeerInfo, data: bytes) -> int:
+        """Send one datagram to a peer's source address"""
+        if not self.transport or not self.listening:
+            raise RuntimeError('UDP server not started')
+        try:
+            self.transport.sendto(data, peer.address)
+            return len(data)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def close_peer(self, peer: PeerInfo) -> None:
+        """Forget a peer; its next datagram will create a new identity"""
+        if self._peers_by_addr.get(peer.address) == peer:
+            self._forget(peer)
+
+    def _datagram(self, data: bytes, addr) -> None:
+        addr = tuple(addr)
+        peer = self._peers_by_addr.get(addr)
+        if peer is None:
+            if self.config.max_peers > 0 and len(self._peers_by_addr) >= self.config.max_peers:
+                return
+            peer = self._new_peer(addr)
+            self._peers_by_addr[addr] = peer
+            self._handle_peer_connect(peer)
+        if self.config.peer_idle_timeout > 0:
+            self._last_seen[peer] = time.monotonic()
+        self._handle_peer_data(peer, data)
+
+    def _forget(self, peer: PeerInfo) -> None:
+        del self._peers_by_addr[peer.address]
+        self._last_seen.pop(peer, None)
+        self._handle_peer_close(peer)
+
+    async def _sweep_loop(self) -> None:
+        """Periodically forget peers that have been silent too long"""
+        timeout = self.config.peer_idle_timeout
+        while self.listening:
+            await asyncio.sleep(timeout / 2)
+            cutoff = time.monotonic() - timeout
+            for peer, seen in list(self._last_seen.items()):
+                if seen < cutoff and self._peers_by_addr.get(peer.address) == peer:
+                    self._forget(peer)
@@ -0,0 +1,231 @@
+"""Async Struct Frame Server
+Multi-peer counterpart of ``AsyncStructFrameSdk``.
+
+The server owns one ``AccumulatingReader`` per peer, so a partial or corrupt
+frame from one connection never affects another, and each peer has its own
+``ParserDiagnostics``. Handlers are shared across peers and receive the
+``PeerInfo`` of the sender as a third argument.
+"""
+
+from typing import Callable, Dict, List, Optional, Any
+from dataclasses import dataclass
+
+from .async_server_transport import BaseAsyncServerTransport, PeerInfo
+from .async_struct_frame_sdk import MessageCodec, GetMessageInfo
+from .transport import SendResult
+
+try:
+    from frame_profiles import ProfileConfig, AccumulatingReader, ParserDiagnostics, encode_message
+except ImportError:  # pragma: no cover - import shim for packaged layout
+    from ..frame_profiles import ProfileConfig, AccumulatingReader, ParserDiagnostics, encode_message
+
+
+# Peer message handler: (message_or_raw_payload, msg_id, peer) -> None
+PeerMessageHandler = Callable[[Any, int, PeerInfo], None]
+
+
+@dataclass
+class AsyncStructFrameServerConfig:
+    """Async Struct Frame Server Configuration.
+
+    Attributes:
+        transport: Server transport (AsyncTcpServerTransport / AsyncUdpServerTransport).
+        profile: Frame profile configuration (e.g. PROFILE_STANDARD_CONFIG).
+        get_message_info: Callback for looking up message metadata by ID.
+        buffer_size: Size of each peer's reader accumulation buffer.
+        debug: Enable debug logging.
+    """
+    transport: BaseAsyncServerTransport
+    profile: ProfileConfig
+    get_message_info: Optional[GetMessageInfo] = None
+    buffer_size: int = 4096
+    debug: bool = False
+
+
+class AsyncStructFrameServer:
+    """Frame parsing and dispatch for many peers on one event loop."""
+
+    def __init__(self, config: AsyncStructFrameServerConfig):
+        self.transport = config.transport
+        self.profile = config.profile
+        self.get_message_info = config.get_message_info
+        self.buffer_size = config.buffer_size
+        self.debug = config.debug
+        self.message_handlers: Dict[int, List[PeerMessageHandler]] = {}
+        self.message_codecs: Dict[int, MessageCodec] = {}
+        self.peer_connect_handlers: List[Callable[[PeerInfo], None]] = []
+        self.peer_close_handlers: List[Callable[[PeerInfo], None]] = []
+        self.readers: Dict[PeerInfo, AccumulatingReader] = {}
+
+        self.transport.set_peer_connect_callback(self._handle_peer_connect)
+        self.transport.set_peer_data_callback(self._handle_incoming_data)
+        self.transport.set_peer_close_callback(self._handle_peer_close)
+        self.transport.set_error_callback(self._handle_error)
+
+    async def start(self) -> None:
+        """Start accepting peers"""
+        await self.transport.start()
+        self._log('Listening')
+
+    async def stop(self) -> None:
+        """Stop the server and drop all peers"""
+        await self.transport.stop()
+        self.readers.clear()
+        self._log('Stopped')
+
+    async def __aenter__(self) -> 'AsyncStructFrameServer':
+        """Async context manager entry: start and return self."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: always stop."""
+        await self.stop()
+        return False
+
+    def register_codec(self, codec: MessageCodec) -> None:
+        """Register a message codec for automatic deserialization"""
+        self.message_codecs[codec.msg_id] = codec
+
+    def subscribe(self, msg_id: int, handler: PeerMessageHandler) -> Callable[[], None]:
+        """Subscribe to messages with a specific message ID from any peer.
+
+        Returns an unsubscribe function.
+        """
+        if msg_id not in self.message_handlers:
+            self.message_handlers[msg_id] = []
+        self.message_handlers[msg_id].append(handler)
+        self._log(f'Subscribed to message ID {msg_id}')
+
+        def unsubscribe():
+            handlers = self.message_handlers.get(msg_id)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    def on_peer_connect(self, handler: Callable[[PeerInfo], None]) -> None:
+        """Register a handler called when a peer appears"""
+        self.peer_connect_handlers.append(handler)
+
+    def on_peer_close(self, handler: Callable[[PeerInfo], None]) -> None:
+        """Register a handler called when a peer goes away"""
+        self.peer_close_handlers.append(handler)
+
+    def peers(self) -> List[PeerInfo]:
+        """Return the currently connected peers"""
+        return list(self.readers)
+
+    def diagnostics(self, peer: PeerInfo) -> Optional[ParserDiagnostics]:
+        """Return a snapshot of one peer's parser diagnostics (None if unknown)"""
+        reader = self.readers.get(peer)
+        return reader.diagnostics if reader is not None else None
+
+    async def send_raw(self, peer: PeerInfo, msg_id: int, data: bytes,
+                       seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> SendResult:
+        """Frame a pre-serialized payload and send it to one peer."""
+        framed = self._frame_raw(msg_id, data, seq, sys_id, comp_id)
+        attempted = len(framed)
+        written = await self.transport.send_to(peer, framed)
+        self._log(f'Sent message ID {msg_id} to peer {peer.peer_id}')
+        return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
+
+    async def send(self, peer: PeerInfo, message: Any,
+                   seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> SendResult:
+        """Send a generated message object to one peer."""
+        framed = encode_message(self.profile, message, seq=seq, sys_id=sys_id, comp_id=comp_id)
+        attempted = len(framed)
+        written = await self.transport.send_to(peer, framed)
+        self._log(f'Sent {attempted} frame bytes to peer {peer.peer_id}')
+        return SendResult(success=written == attempted, attempted_bytes=attempted, bytes_written=written)
+
+    async def broadcast(self, message: Any,
+                        seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> int:
+        """Encode a message once and send it to every peer; returns peers reached."""
+        framed = encode_message(self.profile, message, seq=seq, sys_id=sys_id, comp_id=comp_id)
+        return await self.transport.broadcast(framed)
+
+    def _frame_raw(self, msg_id: int, data: bytes, seq: int, sys_id: int, comp_id: int) -> bytes:
+        info = self.get_message_info(msg_id) if self.get_message_info else None
+        magic1 = info.magic1 if info is not None else 0
+        magic2 = info.magic2 if info is not None else 0
+        payload = data if type(data) is bytes else bytes(data)
+        raw_cls = type('_RawMessage', (), {
+            'MSG_ID': msg_id,
+            'MAGIC1': magic1,
+            'MAGIC2': magic2,
+            'serialize': lambda self_: payload,
+        })
+        return encode_message(self.profile, raw_cls(), seq=seq, sys_id=sys_id, comp_id=comp_id)
+
+    def _reader_for(self, peer: PeerInfo) -> AccumulatingReader:
+        reader = self.readers.get(peer)
+        if reader is None:
+            reader = AccumulatingReader(
+                self.profile,
+                get_message_info=self.get_message_info,
+                buffer_size=self.buffer_size,
+            )
+            self.readers[peer] = reader
+        return reader
+
+    def _handle_peer_connect(self, peer: PeerInfo) -> None:
+        """Allocate the per-peer reader and notify connect handlers"""
+        self._reader_for(peer)
+        self._log(f'Peer {peer.peer_id} connected from {peer.address}')
+        for handler in list(self.peer_connect_handlers):
+            try:
+                handler(peer)
+            except Exception as e:
+                self._log(f'Peer connect handler error: {e}')
+
+    def _handle_incoming_data(self, peer: PeerInfo, data: bytes) -> None:
+        """Feed a peer's bytes to its own reader and dispatch every complete frame."""
+        reader = self._reader_for(peer)
+        reader.add_data(data)
+        while True:
+            result = reader.try_next()
+            if result is None:
+                break
+            if not result.valid:
+                continue
+            self._dispatch(peer, result)
+
+    def _dispatch(self, peer: PeerInfo, result) -> None:
+        """Deserialize (if a codec is registered) and notify handlers."""
+        handlers = self.message_handlers.get(result.msg_id)
+        if not handlers:
+            return
+
+        message: Any = result.msg_data
+        codec = self.message_codecs.get(result.msg_id)
+        if codec:
+            try:
+                message = codec.deserialize(result.msg_data)
+            except Exception as e:
+                self._log(f'Failed to deserialize message ID {result.msg_id}: {e}')
+
+        for handler in list(handlers):
+            try:
+                handler(message, result.msg_id, peer)
+            except Exception as e:
+                self._log(f'Handler error for message ID {result.msg_id}: {e}')
+
+    def _handle_peer_close(self, peer: PeerInfo) -> None:
+        """Drop the peer's reader (and any partial frame) and notify close handlers"""
+        self.readers.pop(peer, None)
+        self._log(f'Peer {peer.peer_id} closed')
+        for handler in list(self.peer_close_handlers):
+            try:
+                handler(peer)
+            except Exception as e:
+                self._log(f'Peer close handler error: {e}')
+
+    def _handle_error(self, error: Exception) -> None:
+        """Handle transport error"""
+        self._log(f'Transport error: {error}')
+
+    def _log(self, message: str) -> None:
+        """Log debug message"""
+        if self.debug:
+            print(f'[AsyncStructFrameServer] {message}')
@@ -0,0 +1,139 @@
+"""Async Unix domain socket transport implementation using asyncio
+
+Asyncio counterpart of ``UnixTransport`` (stream or seqpacket). asyncio's
+stream helpers only create ``SOCK_STREAM`` sockets, so this transport drives
+a non-blocking socket directly with ``loop.sock_recv_into`` /
+``loop.sock_sendall``, receiving into one preallocated buffer. Size
+``buffer_size`` for the largest seqpacket record: the kernel truncates
+longer records on this path.
+"""
+
+import asyncio
+import socket
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .async_transport import BaseAsyncTransport, AsyncTransportConfig
+from .unix_transport import unix_socket_type, unlink_stale
+
+
+@dataclass
+class AsyncUnixTransportConfig(AsyncTransportConfig):
+    """Async Unix domain socket transport configuration (see UnixTransportConfig)"""
+    path: str = ''
+    socket_type: str = 'stream'
+    listen: bool = False
+    timeout: float = 5.0
+    buffer_size: int = 4096
+    sock: Optional[socket.socket] = field(default=None, repr=False, compare=False)
+
+
+class AsyncUnixTransport(BaseAsyncTransport):
+    """Async Unix domain socket transport (stream or seqpacket)"""
+
+    def __init__(self, config: AsyncUnixTransportConfig):
+        super().__init__(config)
+        self.unix_config = config
+        self._type = unix_socket_type(config.socket_type)
+        self.socket: Optional[socket.socket] = None
+        self.data_view_callback: Optional[Callable[[memoryview], None]] = None
+        self.receive_task: Optional[asyncio.Task] = None
+        self._recv_buffer = bytearray(config.buffer_size)
+        self._recv_view = memoryview(self._recv_buffer)
+
+    def set_data_view_callback(self, callback: Optional[Callable[[memoryview], None]]) -> None:
+        """Set a zero-copy receive callback; the view is valid only during the call"""
+        self.data_view_callback = callback
+
+    async def connect(self) -> None:
+        """Connect to (or accept a peer on) the configured path"""
+        loop = asyncio.get_running_loop()
+        try:
+            if self.unix_config.sock is not None:
+                sock = self.unix_config.sock
+                sock.setblocking(False)
+            elif self.unix_config.listen:
+                sock = await asyncio.wait_for(self._accept_one(loop), timeout=self.unix_config.timeout)
+            else:
+                sock = socket.socket(socket.AF_UNIX, self._type)
+                sock.setblocking(False)
+                try:
+                    await asyncio.wait_for(loop.sock_connect(sock, self.unix_config.path),
+                                           timeout=self.unix_config.timeout)
+                except BaseException:
+                    sock.close()
+                    raise
+            self.socket = sock
+            self.connected = True
+            self.receive_task = asyncio.create_task(self._receive_loop())
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def _accept_one(self, loop: asyncio.AbstractEventLoop) -> socket.socket:
+        listener = socket.socket(socket.AF_UNIX, self._type)
+        listener.setblocking(False)
+        try:
+            unlink_stale(self.unix_config.path)
+            listener.bind(self.unix_config.path)
+            listener.listen(1)
+            conn, _ = await loop.sock_accept(listener)
+            conn.setblocking(False)
+            return conn
+        finally:
+            listener.close()
+            unlink_stale(self.unix_config.path)
+
+    async def disconnect(self) -> None:
+        """Disconnect Unix socket"""
+        self.connected = False
+
+        if self.receive_task:
+            self.receive_task.cancel()
+            try:
+                await self.receive_task
+            except asyncio.CancelledError:
+                pass
+            self.receive_task = None
+
+        if self.socket:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.socket.close()
+            self.socket = None
+
+    async def send(self, data: bytes) -> int:
+        """Send data; on seqpacket sockets each call is one record"""
+        if not self.socket or not self.connected:
+            raise RuntimeError('Unix socket not connected')
+
+        try:
+            await asyncio.get_running_loop().sock_sendall(self.socket, data)
+            return len(data)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def _receive_loop(self) -> None:
+        """Receive loop: one chunk (stream) or one record (seqpacket) per read"""
+        loop = asyncio.get_running_loop()
+        view = self._recv_view
+        while self.connected and self.socket:
+            try:
+                nbytes = await loop.sock_recv_into(self.socket, view)
+                if nbytes == 0:
+                    # Connection closed
+                    self._handle_close()
+                    break
+                if self.data_view_callback:
+                    self.data_view_callback(view[:nbytes])
+                else:
+                    self._handle_data(bytes(view[:nbytes]))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                if self.connected:
+                    self._handle_error(e)
+                break
@@ -0,0 +1,696 @@
+"""Link capture recording and indexed replay for struct-frame SDK
+
+Capture file (``.sfcap``), little-endian:
+
+  - file header: magic ``b'SFCAPTUR'``, version (u16), reserved (u16), wall
+    clock start time (i64 ns since the epoch), profile name (16 bytes, NUL
+    padded, informational)
+  - records, back to back: timestamp (i64 ns since capture start), length
+    (u32), direction (u8, 0 = rx, 1 = tx), 3 pad bytes, then ``length``
+    bytes of raw link data exactly as the transport delivered/sent them
+
+Sidecar index (``<capture>.idx``), written when the recorder is given a
+profile or by ``CaptureIndex.build()``: a record table (time, file offset,
+rx stream position, direction) and a frame table (time, rx stream position,
+msg_id, frame size) for every valid rx frame. Seeking by time or by msg_id is
+a binary search over these tables.
+
+``CaptureWriter`` does the file I/O on a background thread through a
+buffered file, so recording costs the link thread one copy and a queue put.
+``RecordingTransport`` / ``AsyncRecordingTransport`` wrap any transport and
+record what passes through it. ``CaptureReplay`` memory-maps a capture and
+feeds rx records to a sink at original, scaled or maximum speed;
+``ReplayTransport`` does that for an SDK.
+"""
+
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+from .async_transport import BaseAsyncTransport
+from .transport import BaseTransport, TransportConfig
+
+try:
+    from frame_profiles import AccumulatingReader, ProfileConfig
+except ImportError:  # pragma: no cover - import shim for packaged layout
+    from ..frame_profiles import AccumulatingReader, ProfileConfig
+
+
+CAPTURE_MAGIC = b'SFCAPTUR'
+INDEX_MAGIC = b'SFCAPIDX'
+CAPTURE_VERSION = 1
+
+RX = 0
+TX = 1
+
+_FILE_HEADER = struct.Struct('<8sHHq16s')
+_RECORD = struct.Struct('<qIB3x')
+_INDEX_HEADER = struct.Struct('<8sHHqII')
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def index_path(capture_path: str) -> str:
+    """Path of the sidecar index for *capture_path*"""
+    return capture_path + '.idx'
+
+
+class CapturePosition(NamedTuple):
+    """Where replay starts: a record number, bytes to skip in it, and its time (ns)"""
+    record: int
+    skip: int
+    t_ns: int
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+class CaptureIndex:
+    """Record and frame tables of a capture, searchable in O(log n).
+
+    Tables are ``array`` columns. Frame times and stream positions are
+    grouped per msg_id on the first msg_id lookup.
+    """
+
+    def __init__(self, capture_size: int = 0):
+        self.capture_size = capture_size
+        self.rec_t = array('q')
+        self.rec_offset = array('q')
+        self.rec_pos = array('q')     # rx bytes recorded before this record
+        self.rec_dir = array('b')
+        self.frame_t = array('q')
+        self.frame_pos = array('q')   # rx stream offset of the frame's first byte
+        self.frame_id = array('i')
+        self.frame_size = array('i')
+        self._rx_records: Optional[Tuple[array, array]] = None
+        self._by_id: Optional[Dict[int, Tuple[array, array]]] = None
+
+    @property
+    def record_count(self) -> int:
+        return len(self.rec_t)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frame_t)
+
+    def msg_ids(self):
+        """Message IDs seen in the capture"""
+        return sorted(self._frames_by_id())
+
+    def count(self, msg_id: int) -> int:
+        """Number of valid rx frames with *msg_id*"""
+        entry = self._frames_by_id().get(msg_id)
+        return len(entry[0]) if entry else 0
+
+    def _frames_by_id(self) -> Dict[int, Tuple[array, array]]:
+        if self._by_id is None:
+            by_id: Dict[int, Tuple[array, array]] = {}
+            for t, pos, msg_id in zip(self.frame_t, self.frame_pos, self.frame_id):
+                entry = by_id.get(msg_id)
+                if entry is None:
+                    entry = by_id[msg_id] = (array('q'), array('q'))
+                entry[0].append(t)
+                entry[1].append(pos)
+            self._by_id = by_id
+        return self._by_id
+
+    def _rx(self) -> Tuple[array, array]:
+        if self._rx_records is None:
+            numbers, positions = array('q'), array('q')
+            for i, (direction, pos) in enumerate(zip(self.rec_dir, self.rec_pos)):
+                if direction == RX:
+                    numbers.append(i)
+                    positions.append(pos)
+            self._rx_records = (numbers, positions)
+        return self._rx_records
+
+    def seek_time(self, t_ns: int) -> CapturePosition:
+        """First record at or after *t_ns* (ns since capture start)"""
+        i = bisect_left(self.rec_t, t_ns)
+        return CapturePosition(i, 0, self.rec_t[i] if i < len(self.rec_t) else t_ns)
+
+    def seek_msg_id(self, msg_id: int, after_ns: int = 0) -> Optional[CapturePosition]:
+        """Position of the first *msg_id* frame completed at or after *after_ns*.
+
+        Returns None when there is no such frame. The position points at the
+        frame's first byte, which may lie in an earlier record than the one
+        that completed it.
+        """
+        entry = self._frames_by_id().get(msg_id)
+        if entry is None:
+            return None
+        times, positions = entry
+        k = bisect_left(times, after_ns)
+        if k == len(times):
+            return None
+        return self.position_of(positions[k])
+
+    def position_of(self, stream_pos: int) -> CapturePosition:
+        """Map an rx stream offset to the record containing it"""
+        numbers, positions = self._rx()
+        k = bisect_right(positions, stream_pos) - 1
+        if k < 0:
+            raise ValueError(f"stream position {stream_pos} precedes the first rx record")
+        record = numbers[k]
+        return CapturePosition(record, stream_pos - positions[k], self.rec_t[record])
+
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Write the index to *path* (atomically, via a temporary file)"""
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_INDEX_HEADER.pack(INDEX_MAGIC, CAPTURE_VERSION, 0, self.capture_size,
+                                       self.record_count, self.frame_count))
+            for column in (self.rec_t, self.rec_offset, self.rec_pos, self.frame_t, self.frame_pos,
+                           self.frame_id, self.frame_size):
+                f.write(_le_bytes(column))
+            f.write(self.rec_dir.tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, capture_path: Optional[str] = None) -> 'CaptureIndex':
+        """Read an index; with *capture_path*, reject it if the capture changed size."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, _, capture_size, n, m = _INDEX_HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or version != CAPTURE_VERSION:
+            raise ValueError(f"{path} is not a struct-frame capture index")
+        if capture_path is not None and os.path.getsize(capture_path) != capture_size:
+            raise ValueError(f"{path} is stale: {capture_path} has changed size")
+        index = cls(capture_size)
+        offset = _INDEX_HEADER.size
+        for name, typecode, count in (('rec_t', 'q', n), ('rec_offset', 'q', n), ('rec_pos', 'q', n),
+                                      ('frame_t', 'q', m), ('frame_pos', 'q', m),
+                                      ('frame_id', 'i', m), ('frame_size', 'i', m)):
+            column, offset = _le_array(typecode, data, offset, count)
+            setattr(index, name, column)
+        index.rec_dir = array('b', data[offset:offset + n])
+        return index
+
+    @classmethod
+    def build(cls, capture_path: str, profile: ProfileConfig,
+              get_message_info=None, save: bool = True) -> 'CaptureIndex':
+        """Index an existing capture by parsing its rx records with *profile*."""
+        indexer = _Indexer(profile, get_message_info)
+        with CaptureReader(capture_path) as reader:
+            for t_ns, direction, offset, data in reader.records():
+                indexer.add(t_ns, direction, offset, data)
+                data.release()
+        index = indexer.finish(os.path.getsize(capture_path))
+        if save:
+            index.save(index_path(capture_path))
+        return index
+
+
+def _le_bytes(column: array) -> bytes:
+    if _BIG_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _le_array(typecode: str, data: bytes, offset: int, count: int) -> Tuple[array, int]:
+    column = array(typecode)
+    end = offset + count * column.itemsize
+    column.frombytes(data[offset:end])
+    if _BIG_ENDIAN:
+        column.byteswap()
+    return column, end
+
+
+class _Indexer:
+    """Builds a CaptureIndex from records in file order."""
+
+    def __init__(self, profile: ProfileConfig, get_message_info=None):
+        self._reader = AccumulatingReader(profile, get_message_info=get_message_info,
+                                          buffer_size=65536 + profile.overhead)
+        self._index = CaptureIndex()
+        self._rx_bytes = 0
+
+    def add(self, t_ns: int, direction: int, offset: int, data) -> None:
+        index = self._index
+        index.rec_t.append(t_ns)
+        index.rec_offset.append(offset)
+        index.rec_pos.append(self._rx_bytes)
+        index.rec_dir.append(direction)
+        if direction != RX:
+            return
+        chunk_start = self._rx_bytes
+        self._rx_bytes += len(data)
+        reader = self._reader
+        reader.add_data(data)
+        while (result := reader.try_next()) is not None:
+            if result.valid:
+                index.frame_t.append(t_ns)
+                index.frame_pos.append(chunk_start + reader.offset - result.frame_size)
+                index.frame_id.append(result.msg_id)
+                index.frame_size.append(result.frame_size)
+
+    def finish(self, capture_size: int) -> CaptureIndex:
+        self._index.capture_size = capture_size
+        return self._index
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+class CaptureWriter:
+    """Append-only capture writer with a background I/O thread.
+
+    ``write()`` timestamps the data, takes a private copy when handed a
+    mutable buffer, and queues it; the writer thread does the buffered file
+    writes and flushes whenever the queue has been idle for
+    *flush_interval* seconds. With a *profile*, the thread also parses the rx
+    stream and ``close()`` writes the sidecar index.
+
+    If the writer thread fails (disk full, an indexing error), ``write()``
+    raises RuntimeError from then on instead of queueing data that will
+    never be written, and ``close()`` raises the original error.
+
+    Args:
+        path: Capture file to create (truncated if it exists)
+        profile: Frame profile for the sidecar index, or None for no index
+        get_message_info: Needed to index minimal profiles / magic-number CRCs
+        buffer_size: Size of the file's write buffer
+        flush_interval: Idle time after which buffered data is flushed
+    """
+
+    def __init__(self, path: str, profile: Optional[ProfileConfig] = None,
+                 get_message_info=None, buffer_size: int = 1 << 20,
+                 flush_interval: float = 0.5):
+        self.path = path
+        self.records = 0
+        self.bytes = 0
+        self._flush_interval = flush_interval
+        self._indexer = _Indexer(profile, get_message_info) if profile is not None else None
+        self._file = open(path, 'wb', buffering=buffer_size)
+        name = (profile.name if profile is not None else '').encode('ascii', 'replace')[:16]
+        self._file.write(_FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, 0, time.time_ns(), name))
+        self._offset = _FILE_HEADER.size
+        self._start = time.monotonic_ns()
+        self._queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='capture-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, data, direction: int = RX, t_ns: Optional[int] = None) -> None:
+        """Queue *data* as one record; *t_ns* defaults to now (ns since start)."""
+        if self._closed:
+            raise ValueError("capture writer is closed")
+        if self._error is not None:
+            raise RuntimeError(f"capture writer failed: {self._error!r}") from self._error
+        if t_ns is None:
+            t_ns = time.monotonic_ns() - self._start
+        self._queue.put((t_ns, direction, data if type(data) is bytes else bytes(data)))
+
+    def close(self) -> None:
+        """Write everything queued, the sidecar index (if any), and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> 'CaptureWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _run(self) -> None:
+        get, f = self._queue.get, self._file
+        pack = _RECORD.pack
+        try:
+            while True:
+                try:
+                    item = get(timeout=self._flush_interval)
+                except queue.Empty:
+                    f.flush()
+                    continue
+                if item is None:
+                    break
+                t_ns, direction, data = item
+                f.write(pack(t_ns, len(data), direction))
+                f.write(data)
+                if self._indexer is not None:
+                    self._indexer.add(t_ns, direction, self._offset, data)
+                self._offset += _RECORD.size + len(data)
+                self.records += 1
+                self.bytes += len(data)
+            f.close()
+            if self._indexer is not None:
+                self._indexer.finish(self._offset).save(index_path(self.path))
+        except BaseException as e:  # surfaced by close()
+            self._error = e
+            f.close()
+
+
+def _open_writer(capture: Union[str, CaptureWriter], profile, get_message_info) -> Tuple[CaptureWriter, bool]:
+    if not isinstance(capture, str):
+        return capture, False
+    return CaptureWriter(capture, profile, get_message_info), True
+
+
+def _record(transport, data, direction: int) -> None:
+    """Write to *transport*'s capture.
+
+    A failed writer is reported once through the transport's error callback
+    and recording stops; the link itself keeps running.
+    """
+    if transport._recording:
+        try:
+            transport.writer.write(data, direction)
+        except Exception as e:
+            transport._recording = False
+            if transport.error_callback:
+                transport.error_callback(e)
+
+
+def _close_writer(transport) -> None:
+    """Close an owned writer; an error already reported by _record() is not raised again."""
+    if transport._owns_writer:
+        try:
+            transport.writer.close()
+        except Exception:
+            if transport._recording:
+                raise
+
+
+class RecordingTransport(BaseTransport):
+    """Wraps a transport and records everything it receives (and sends).
+
+    *capture* is a path or a writer (``CaptureWriter``, or anything with
+    the same ``write(data, direction)`` / ``close()``, such as
+    ``PcapngWriter``); a writer created from a path is closed on
+    ``disconnect()``. Received data is forwarded unchanged, as a
+    view when the SDK asks for views. If the writer fails, the error goes
+    to the error callback and the link continues without recording.
+    """
+
+    def __init__(self, transport: BaseTransport, capture: Union[str, CaptureWriter],
+                 profile: Optional[ProfileConfig] = None, get_message_info=None,
+                 record_tx: bool = True):
+        super().__init__(TransportConfig())
+        self.inner = transport
+        self.writer, self._owns_writer = _open_writer(capture, profile, get_message_info)
+        self._record_tx = record_tx
+        self._recording = True
+        if hasattr(transport, 'set_data_view_callback'):
+            transport.set_data_view_callback(self._on_data)
+        else:
+            transport.set_data_callback(self._on_data)
+        transport.set_error_callback(lambda error: self.error_callback and self.error_callback(error))
+        transport.set_close_callback(lambda: self.close_callback and self.close_callback())
+
+    def _on_data(self, data) -> None:
+        _record(self, data, RX)
+        if self.data_view_callback:
+            self.data_view_callback(data if isinstance(data, memoryview) else memoryview(data))
+        elif self.data_callback:
+            self.data_callback(data if type(data) is bytes else bytes(data))
+
+    def connect(self) -> None:
+        self.inner.connect()
+
+    def disconnect(self) -> None:
+        self.inner.disconnect()
+        _close_writer(self)
+
+    def send(self, data: bytes) -> int:
+        if self._record_tx:
+            _record(self, data, TX)
+        return self.inner.send(data)
+
+    def is_connected(self) -> bool:
+        return self.inner.is_connected()
+
+
+class AsyncRecordingTransport(BaseAsyncTransport):
+    """Async counterpart of RecordingTransport"""
+
+    def __init__(self, transport: BaseAsyncTransport, capture: Union[str, CaptureWriter],
+                 profile: Optional[ProfileConfig] = None, get_message_info=None,
+                 record_tx: bool = True):
+        super().__init__()
+        self.inner = transport
+        self.writer, self._owns_writer = _open_writer(capture, profile, get_message_info)
+        self._record_tx = record_tx
+        self._recording = True
+        transport.set_data_callback(self._on_data)
+        transport.set_error_callback(lambda error: self.error_callback and self.error_callback(error))
+        transport.set_close_callback(lambda: self.close_callback and self.close_callback())
+
+    def _on_data(self, data) -> None:
+        _record(self, data, RX)
+        if self.data_callback:
+            self.data_callback(data)
+
+    async def connect(self) -> None:
+        await self.inner.connect()
+
+    async def disconnect(self) -> None:
+        await self.inner.disconnect()
+        _close_writer(self)
+
+    async def send(self, data: bytes) -> int:
+        if self._record_tx:
+            _record(self, data, TX)
+        return await self.inner.send(data)
+
+    def is_connected(self) -> bool:
+        return self.inner.is_connected()
+
+
+# =============================================================================
+# Reading and replay
+# =============================================================================
+
+class CaptureReader:
+    """Memory-mapped, read-only view of a capture file.
+
+    Record data is returned as ``memoryview`` slices of the mapping; they are
+    valid until ``close()``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if len(self._view) < _FILE_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a struct-frame capture")
+        magic, version, _, start_time_ns, name = _FILE_HEADER.unpack_from(self._view, 0)
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a struct-frame capture")
+        self.start_time_ns = start_time_ns
+        self.profile_name = name.rstrip(b'\0').decode('ascii', 'replace')
+        self._table: Optional[Tuple[array, array]] = None
+
+    def records(self, offset: int = _FILE_HEADER.size) -> Iterator[Tuple[int, int, int, memoryview]]:
+        """Yield ``(t_ns, direction, file_offset, data)`` from *offset* on.
+
+        A record truncated by an interrupted recording ends the iteration.
+        """
+        view, size, unpack = self._view, len(self._view), _RECORD.unpack_from
+        header = _RECORD.size
+        while offset + header <= size:
+            t_ns, length, direction = unpack(view, offset)
+            start = offset + header
+            if start + length > size:
+                return
+            yield t_ns, direction, offset, view[start:start + length]
+            offset = start + length
+
+    def record_table(self) -> Tuple[array, array]:
+        """``(times, file offsets)`` of every record; built by one scan, then cached."""
+        if self._table is None:
+            times, offsets = array('q'), array('q')
+            for t_ns, _direction, offset, data in self.records():
+                times.append(t_ns)
+                offsets.append(offset)
+                data.release()
+            self._table = (times, offsets)
+        return self._table
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'CaptureReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class CaptureReplay:
+    """Replays the rx side of a capture into a sink.
+
+    Loads the sidecar index when one exists (required for ``seek_msg_id``);
+    time seeks fall back to a one-off scan of the record headers.
+    """
+
+    def __init__(self, path: str, index: Optional[CaptureIndex] = None):
+        self.reader = CaptureReader(path)
+        if index is None and os.path.exists(index_path(path)):
+            index = CaptureIndex.load(index_path(path), path)
+        self.index = index
+
+    def _table(self) -> Tuple[array, array]:
+        if self.index is not None:
+            return self.index.rec_t, self.index.rec_offset
+        return self.reader.record_table()
+
+    def seek_time(self, t_ns: int) -> CapturePosition:
+        """Position of the first record at or after *t_ns* (ns since capture start)"""
+        if self.index is not None:
+            return self.index.seek_time(t_ns)
+        times, _ = self._table()
+        i = bisect_left(times, t_ns)
+        return CapturePosition(i, 0, times[i] if i < len(times) else t_ns)
+
+    def seek_msg_id(self, msg_id: int, after_ns: int = 0) -> Optional[CapturePosition]:
+        """Position of the first *msg_id* frame at or after *after_ns*; needs the index."""
+        if self.index is None:
+            raise ValueError("seeking by msg_id needs a capture index (CaptureIndex.build)")
+        return self.index.seek_msg_id(msg_id, after_ns)
+
+    def play(self, sink: Callable[[memoryview], None], speed: Optional[float] = 1.0,
+             start: Optional[CapturePosition] = None, end_ns: Optional[int] = None,
+             direction: int = RX, stop: Optional[threading.Event] = None) -> int:
+        """Feed records to *sink* and return the number of bytes delivered.
+
+        Args:
+            sink: Called with a view of each record's data (valid only during the call)
+            speed: 1.0 replays with the original timing, 2.0 twice as fast,
+                None or 0 as fast as the sink accepts
+            start: Starting position from seek_time()/seek_msg_id()
+            end_ns: Stop before the first record after this time
+            direction: Which records to deliver (RX or TX)
+            stop: Event that aborts the replay when set
+        """
+        skip = 0
+        offset = _FILE_HEADER.size
+        if start is not None:
+            times, offsets = self._table()
+            if start.record >= len(offsets):
+                return 0
+            offset, skip = offsets[start.record], start.skip
+        paced = bool(speed)
+        delivered = 0
+        wall0 = time.perf_counter()
+        t0 = None
+        for t_ns, record_dir, _offset, data in self.reader.records(offset):
+            if end_ns is not None and t_ns > end_ns:
+                data.release()
+                break
+            if stop is not None and stop.is_set():
+                data.release()
+                break
+            if record_dir != direction:
+                data.release()
+                continue
+            if paced:
+                if t0 is None:
+                    t0 = t_ns
+                delay = (t_ns - t0) / 1e9 / speed - (time.perf_counter() - wall0)
+                if delay > 0:
+                    if stop is not None:
+                        if stop.wait(delay):
+                            data.release()
+                            break
+                    else:
+                        time.sleep(delay)
+            if skip:
+                chunk = data[skip:]
+                data.release()
+                data, skip = chunk, 0
+            try:
+                sink(data)
+                delivered += len(data)
+            finally:
+                data.release()
+        return delivered
+
+    def close(self) -> None:
+        self.reader.close()
+
+    def __enter__(self) -> 'CaptureReplay':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class ReplayTransport(BaseTransport):
+    """Receive-only transport that plays a capture into whatever it is attached to.
+
+    ``connect()`` starts the replay on a background thread; when the capture
+    ends the transport reports a close. ``wait()`` blocks until then. Data
+    sent through it is discarded.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0,
+                 start: Optional[CapturePosition] = None, end_ns: Optional[int] = None):
+        super().__init__(TransportConfig())
+        self.replay = CaptureReplay(path)
+        self.speed = speed
+        self.start = start
+        self.end_ns = end_ns
+        self.bytes_replayed = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def connect(self) -> None:
+        if self.replay.reader._mmap is None:
+            self.replay = CaptureReplay(self.replay.reader.path)
+        self._stop.clear()
+        self.connected = True
+        self._thread = threading.Thread(target=self._run, name='capture-replay', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.bytes_replayed = self.replay.play(self._handle_data_view, self.speed, self.start,
+                                                   self.end_ns, stop=self._stop)
+        except Exception as e:
+            self._handle_error(e)
+        if self.connected:
+            self._handle_close()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the replay to finish; True if it did."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def disconnect(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.connected = False
+        self.replay.close()
+
+    def send(self, data: bytes) -> int:
+        return len(data)
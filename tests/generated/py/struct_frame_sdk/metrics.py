@@ -0,0 +1,368 @@
+"""Per-message metrics for the SDK clients
+
+``MetricsCollector`` records, per message ID, frames and payload bytes in and
+out, decode/handler error counts and HDR-style latency histograms of decode
+and handler time, plus transport bytes in/out and parser error events.
+
+Attach one with ``StructFrameSdkConfig(metrics=MetricsCollector())`` (or
+``sdk.enable_metrics()``). With no collector attached the SDK pays nothing:
+timing is compiled into the dispatch table only when a collector is present.
+
+``snapshot()`` returns plain data; ``prometheus_text()`` renders the Prometheus
+text exposition format and ``serve()`` exposes it over a local HTTP endpoint::
+
+    metrics = MetricsCollector(labels={'link': 'uart0'})
+    sdk = StructFrameSdk(StructFrameSdkConfig(..., metrics=metrics))
+    server = metrics.serve(port=9464)   # GET http://127.0.0.1:9464/metrics
+
+Updates come from the receive path without locking; a snapshot taken from
+another thread may be a few events behind but is never torn per counter.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from frame_profiles import FrameMsgStatus
+except ImportError:  # pragma: no cover - import shim for packaged layout
+    from ..frame_profiles import FrameMsgStatus
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of non-negative integer values.
+
+    Values below ``2 ** (sub_bucket_bits + 1)`` are recorded exactly; above
+    that each power of two is split into ``2 ** sub_bucket_bits`` buckets, so
+    the relative error of any reported percentile is below
+    ``2 ** -sub_bucket_bits`` (about 3% with the default of 5). Recording is a
+    couple of integer operations and one list increment.
+    """
+
+    __slots__ = ('_sub_bits', '_sub_count', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, sub_bucket_bits: int = 5):
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self.counts: List[int] = [0] * (2 * self._sub_count)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - 1 - self._sub_bits
+        if shift <= 0:
+            return value
+        return (self._sub_count * shift) + (value >> shift)
+
+    def _lower_bound(self, index: int) -> int:
+        shift = index // self._sub_count - 1
+        if shift <= 0:
+            return index
+        return (index - self._sub_count * shift) << shift
+
+    def record(self, value: int) -> None:
+        """Record one value (negative values are clamped to 0)."""
+        if value < 0:
+            value = 0
+        index = self._index(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, pct: float) -> int:
+        """Value at *pct* (0-100): the lower bound of the bucket holding it, capped at max."""
+        if self.count == 0:
+            return 0
+        rank = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(max(self._lower_bound(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """count/sum/min/max/mean and p50/p90/p99/p999"""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+        }
+
+    def reset(self) -> None:
+        self.counts = [0] * (2 * self._sub_count)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+
+class MessageMetrics:
+    """Counters and latency histograms (nanoseconds) for one message ID"""
+
+    __slots__ = ('msg_id', 'rx_frames', 'rx_bytes', 'tx_frames', 'tx_bytes',
+                 'decode_errors', 'handler_errors', 'decode_ns', 'handler_ns')
+
+    def __init__(self, msg_id: int):
+        self.msg_id = msg_id
+        self.decode_ns = LatencyHistogram()
+        self.handler_ns = LatencyHistogram()
+        self.reset()
+
+    def reset(self) -> None:
+        self.rx_frames = 0
+        self.rx_bytes = 0
+        self.tx_frames = 0
+        self.tx_bytes = 0
+        self.decode_errors = 0
+        self.handler_errors = 0
+        self.decode_ns.reset()
+        self.handler_ns.reset()
+
+
+class MetricsCollector:
+    """Collects SDK metrics; see the module docstring.
+
+    Args:
+        labels: Constant labels added to every exported sample
+            (e.g. ``{'link': 'uart0'}``).
+        clock: Nanosecond clock used for decode/handler timing.
+    """
+
+    def __init__(self, labels: Optional[Dict[str, str]] = None,
+                 clock: Callable[[], int] = time.perf_counter_ns):
+        self.labels = dict(labels or {})
+        self.clock = clock
+        self.messages: Dict[int, MessageMetrics] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter and histogram.
+
+        Per-message entries are zeroed in place because the SDK's timing
+        wrappers hold on to them.
+        """
+        for m in list(self.messages.values()):
+            m.reset()
+        self.rx_bytes = 0
+        self.tx_bytes = 0
+        self.crc_failures = 0
+        self.sync_recoveries = 0
+        self.filtered = 0
+        self._started = time.monotonic()
+
+    def message(self, msg_id: int) -> MessageMetrics:
+        """Metrics for *msg_id*, created on first use."""
+        m = self.messages.get(msg_id)
+        if m is None:
+            m = self.messages[msg_id] = MessageMetrics(msg_id)
+        return m
+
+    # ------------------------------------------------------------------
+    # Recording (called by the SDK)
+    # ------------------------------------------------------------------
+
+    def on_rx_bytes(self, nbytes: int) -> None:
+        self.rx_bytes += nbytes
+
+    def on_frame(self, result) -> None:
+        """Count one parse result from the reader (valid or not)."""
+        if result.valid:
+            m = self.message(result.msg_id)
+            m.rx_frames += 1
+            m.rx_bytes += result.msg_len
+            return
+        status = result.status
+        if status is FrameMsgStatus.CRC_FAILURE:
+            self.crc_failures += 1
+        elif status is FrameMsgStatus.FILTERED:
+            self.filtered += 1
+        elif status is FrameMsgStatus.SYNC_RECOVERY:
+            self.sync_recoveries += 1
+
+    def on_tx(self, msg_id: Optional[int], payload_len: int, nbytes: int) -> None:
+        self.tx_bytes += nbytes
+        if msg_id is not None:
+            m = self.message(msg_id)
+            m.tx_frames += 1
+            m.tx_bytes += payload_len
+
+    def timed_decode(self, msg_id: int, deserialize: Callable[[bytes], Any]) -> Callable[[bytes], Any]:
+        """Wrap a codec's deserialize to record its latency and failures."""
+        m = self.message(msg_id)
+        hist, clock = m.decode_ns, self.clock
+
+        def decode(data):
+            start = clock()
+            try:
+                return deserialize(data)
+            except Exception:
+                m.decode_errors += 1
+                raise
+            finally:
+                hist.record(clock() - start)
+        return decode
+
+    def timed_handler(self, msg_id: int, handler: Callable[[Any, int], None]) -> Callable[[Any, int], None]:
+        """Wrap a handler to record its latency and failures."""
+        m = self.message(msg_id)
+        hist, clock = m.handler_ns, self.clock
+
+        def run(message, mid):
+            start = clock()
+            try:
+                handler(message, mid)
+            except Exception:
+                m.handler_errors += 1
+                raise
+            finally:
+                hist.record(clock() - start)
+        return run
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-data view of all metrics (latencies in nanoseconds)."""
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        messages = {}
+        for msg_id, m in list(self.messages.items()):
+            messages[msg_id] = {
+                'rx_frames': m.rx_frames,
+                'rx_bytes': m.rx_bytes,
+                'rx_frames_per_sec': m.rx_frames / elapsed,
+                'tx_frames': m.tx_frames,
+                'tx_bytes': m.tx_bytes,
+                'decode_errors': m.decode_errors,
+                'handler_errors': m.handler_errors,
+                'decode_ns': m.decode_ns.summary(),
+                'handler_ns': m.handler_ns.summary(),
+            }
+        return {
+            'elapsed_s': elapsed,
+            'transport': {'rx_bytes': self.rx_bytes, 'tx_bytes': self.tx_bytes},
+            'parser': {'crc_failures': self.crc_failures, 'sync_recoveries': self.sync_recoveries,
+                       'filtered': self.filtered},
+            'messages': messages,
+        }
+
+    def prometheus_text(self, prefix: str = 'structframe') -> str:
+        """Render the Prometheus text exposition format (version 0.0.4)."""
+        base = ''.join(f',{k}="{_escape(v)}"' for k, v in sorted(self.labels.items()))
+        plain = '{' + base[1:] + '}' if base else ''
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f'{prefix}_{name}'
+            lines.append(f'# HELP {full} {help_text}')
+            lines.append(f'# TYPE {full} {kind}')
+            return full
+
+        for name, help_text, value in (
+                ('transport_rx_bytes_total', 'Bytes received from the transport.', self.rx_bytes),
+                ('transport_tx_bytes_total', 'Bytes written to the transport.', self.tx_bytes),
+                ('crc_failures_total', 'Complete frames dropped for a CRC mismatch.', self.crc_failures),
+                ('sync_recoveries_total', 'Parser resynchronisations.', self.sync_recoveries),
+                ('filtered_frames_total', 'Frames skipped by subscription header filters.', self.filtered)):
+            lines.append(f'{family(name, "counter", help_text)}{plain} {value}')
+
+        messages = sorted(self.messages.items())
+        for name, attr, help_text in (
+                ('rx_frames_total', 'rx_frames', 'Valid frames received per message ID.'),
+                ('rx_payload_bytes_total', 'rx_bytes', 'Payload bytes received per message ID.'),
+                ('tx_frames_total', 'tx_frames', 'Frames sent per message ID.'),
+                ('tx_payload_bytes_total', 'tx_bytes', 'Payload bytes sent per message ID.'),
+                ('decode_errors_total', 'decode_errors', 'Codec failures per message ID.'),
+                ('handler_errors_total', 'handler_errors', 'Handler exceptions per message ID.')):
+            full = family(name, 'counter', help_text)
+            for msg_id, m in messages:
+                lines.append(f'{full}{{msg_id="{msg_id}"{base}}} {getattr(m, attr)}')
+
+        for name, attr, help_text in (
+                ('decode_seconds', 'decode_ns', 'Codec decode latency per message ID.'),
+                ('handler_seconds', 'handler_ns', 'Handler execution latency per message ID.')):
+            full = family(name, 'summary', help_text)
+            for msg_id, m in messages:
+                hist = getattr(m, attr)
+                labels = f'msg_id="{msg_id}"{base}'
+                for q, pct in (('0.5', 50), ('0.9', 90), ('0.99', 99), ('0.999', 99.9)):
+                    lines.append(f'{full}{{{labels},quantile="{q}"}} {hist.percentile(pct) / 1e9:.9g}')
+                lines.append(f'{full}_sum{{{labels}}} {hist.total / 1e9:.9g}')
+                lines.append(f'{full}_count{{{labels}}} {hist.count}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 0, host: str = '127.0.0.1', prefix: str = 'structframe') -> 'MetricsServer':
+        """Start a background HTTP server exposing ``/metrics``; binds loopback by default."""
+        return MetricsServer(self, host, port, prefix)
+
+
+class MetricsServer:
+    """Background HTTP endpoint serving ``prometheus_text()`` at ``/metrics``"""
+
+    def __init__(self, collector: MetricsCollector, host: str = '127.0.0.1', port: int = 0,
+                 prefix: str = 'structframe'):
+        render = lambda: collector.prometheus_text(prefix)  # noqa: E731
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self.host, self.port = self._httpd.server_address[:2]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='structframe-metrics',
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}/metrics'
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join(timeout=2.0)
+
+    def __enter__(self) -> 'MetricsServer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
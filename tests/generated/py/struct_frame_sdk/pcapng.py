@@ -0,0 +1,382 @@
+"""pcapng export and import for struct-frame link traffic
+
+Writes captures Wireshark opens directly with ``wireshark/struct_frame.lua``:
+one Section Header Block, one Interface Description Block with a user DLT
+(``LINKTYPE_USER0`` = 147 by default, which the dissector registers on) and
+nanosecond timestamp resolution, then one Enhanced Packet Block per packet.
+The EPB flags option carries the direction (inbound for rx, outbound for tx).
+
+The dissector expects one struct-frame frame per packet. Given a *profile*,
+``PcapngWriter`` re-frames each direction's byte stream so every EPB holds
+exactly one frame (or one run of bytes skipped while resyncing) however the
+transport chunked it. Without a profile, each write becomes one packet.
+
+``PcapngWriter`` packs blocks on a background thread into a large buffer and
+writes it in one call, so the link thread only pays a queue put. Pass it to
+``RecordingTransport`` / ``AsyncRecordingTransport`` to tap any transport.
+
+``PcapngReader`` memory-maps a pcapng file (or a classic pcap file, as made
+by ``wireshark/generate_test_packets.py``) and yields its packets as views.
+"""
+
+import functools
+import mmap
+import queue
+import struct
+import threading
+import time
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from .capture import RX, TX, CaptureReader
+
+try:
+    from frame_profiles import BufferReader, ProfileConfig
+except ImportError:  # pragma: no cover - import shim for packaged layout
+    from ..frame_profiles import BufferReader, ProfileConfig
+
+
+LINKTYPE_USER0 = 147
+
+BLOCK_SHB = 0x0A0D0D0A
+BLOCK_IDB = 0x00000001
+BLOCK_SPB = 0x00000003
+BLOCK_EPB = 0x00000006
+
+BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+OPT_ENDOFOPT = 0
+OPT_SHB_USERAPPL = 4
+OPT_IF_NAME = 2
+OPT_IF_TSRESOL = 9
+OPT_EPB_FLAGS = 2
+
+EPB_INBOUND = 1
+EPB_OUTBOUND = 2
+
+_PCAP_MAGIC_US = 0xA1B2C3D4
+_PCAP_MAGIC_NS = 0xA1B23C4D
+
+_EPB_HEAD = struct.Struct('<IIIIIII')
+_EPB_TAIL = struct.Struct('<HHIHHI')   # epb_flags option, end of options, block length
+_PAD = b'\0\0\0'
+
+
+def _option(code: int, value: bytes) -> bytes:
+    return struct.pack('<HH', code, len(value)) + value + _PAD[:-len(value) % 4]
+
+
+def _block(block_type: int, body: bytes) -> bytes:
+    length = 12 + len(body)
+    return struct.pack('<II', block_type, length) + body + struct.pack('<I', length)
+
+
+def section_header(application: str = 'struct-frame') -> bytes:
+    """Section Header Block (little-endian, unspecified section length)"""
+    options = _option(OPT_SHB_USERAPPL, application.encode()) + _option(OPT_ENDOFOPT, b'')
+    return _block(BLOCK_SHB, struct.pack('<IHHq', BYTE_ORDER_MAGIC, 1, 0, -1) + options)
+
+
+def interface_description(linktype: int = LINKTYPE_USER0, snaplen: int = 0,
+                          name: Optional[str] = None) -> bytes:
+    """Interface Description Block with nanosecond timestamps"""
+    options = _option(OPT_IF_TSRESOL, b'\x09')
+    if name:
+        options += _option(OPT_IF_NAME, name.encode())
+    options += _option(OPT_ENDOFOPT, b'')
+    return _block(BLOCK_IDB, struct.pack('<HHI', linktype, 0, snaplen) + options)
+
+
+def enhanced_packet(data, t_ns: int, direction: int = RX, interface: int = 0) -> bytes:
+    """Enhanced Packet Block with an epb_flags direction option"""
+    length = len(data)
+    pad = -length % 4
+    total = _EPB_HEAD.size + length + pad + _EPB_TAIL.size
+    flags = EPB_OUTBOUND if direction == TX else EPB_INBOUND
+    return b''.join((
+        _EPB_HEAD.pack(BLOCK_EPB, total, interface, t_ns >> 32, t_ns & 0xFFFFFFFF, length, length),
+        data, _PAD[:pad],
+        _EPB_TAIL.pack(OPT_EPB_FLAGS, 4, flags, OPT_ENDOFOPT, 0, total),
+    ))
+
+
+class _Framer:
+    """Cuts one direction's byte stream into frames (and resync runs)."""
+
+    def __init__(self, profile: ProfileConfig, get_message_info=None):
+        self._profile = profile
+        # Message info is static; the generated lookup is costly per call.
+        self._get_message_info = (functools.lru_cache(maxsize=None)(get_message_info)
+                                  if get_message_info is not None else None)
+        self._pending = bytearray()
+
+    def feed(self, data) -> List[bytes]:
+        pending = self._pending
+        pending += data
+        out = []
+        reader = BufferReader(self._profile, pending, self._get_message_info)
+        start = 0
+        while reader.try_next() is not None:
+            out.append(bytes(pending[start:reader.offset]))
+            start = reader.offset
+        del reader  # releases its view of pending before the resize
+        del pending[:start]
+        return out
+
+    def flush(self) -> bytes:
+        rest, self._pending = bytes(self._pending), bytearray()
+        return rest
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+class PcapngWriter:
+    """Streaming pcapng writer with a background I/O thread.
+
+    Same interface as ``CaptureWriter`` (``write(data, direction, t_ns)``,
+    ``close()``, context manager), so it plugs into ``RecordingTransport``.
+
+    Args:
+        path: pcapng file to create (truncated if it exists)
+        profile: Frame profile used to write one frame per packet, or None
+            to write one packet per ``write()``
+        get_message_info: Needed to frame minimal profiles
+        linktype: Link type of the interface (default LINKTYPE_USER0)
+        buffer_size: Bytes of packed blocks collected before each file write
+        flush_interval: Idle time after which collected blocks are written
+        interface_name: Optional if_name of the interface
+
+    As with ``CaptureWriter``, ``write()`` raises RuntimeError once the
+    writer thread has failed, and ``close()`` raises the original error.
+    """
+
+    def __init__(self, path: str, profile: Optional[ProfileConfig] = None,
+                 get_message_info=None, linktype: int = LINKTYPE_USER0,
+                 buffer_size: int = 1 << 20, flush_interval: float = 0.5,
+                 interface_name: Optional[str] = None):
+        self.path = path
+        self.packets = 0
+        self.bytes = 0
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._framers = ({RX: _Framer(profile, get_message_info), TX: _Framer(profile, get_message_info)}
+                         if profile is not None else None)
+        self._file = open(path, 'wb', buffering=0)
+        self._file.write(section_header() + interface_description(linktype, 0, interface_name))
+        self._start_wall = time.time_ns()
+        self._start = time.monotonic_ns()
+        self._queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='pcapng-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, data, direction: int = RX, t_ns: Optional[int] = None) -> None:
+        """Queue *data*; *t_ns* is absolute (ns since the epoch) and defaults to now."""
+        if self._closed:
+            raise ValueError("pcapng writer is closed")
+        if self._error is not None:
+            raise RuntimeError(f"pcapng writer failed: {self._error!r}") from self._error
+        if t_ns is None:
+            t_ns = self._start_wall + time.monotonic_ns() - self._start
+        self._queue.put((t_ns, direction, data if type(data) is bytes else bytes(data)))
+
+    def close(self) -> None:
+        """Write everything queued (and any partial frames as-is), then close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> 'PcapngWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _run(self) -> None:
+        get, f = self._queue.get, self._file
+        out = bytearray()
+        last_t = {RX: 0, TX: 0}
+        try:
+            while True:
+                try:
+                    item = get(timeout=self._flush_interval)
+                except queue.Empty:
+                    if out:
+                        f.write(out)
+                        out.clear()
+                    continue
+                if item is None:
+                    break
+                t_ns, direction, data = item
+                last_t[direction] = t_ns
+                packets = self._framers[direction].feed(data) if self._framers is not None else (data,)
+                for packet in packets:
+                    out += enhanced_packet(packet, t_ns, direction)
+                    self.packets += 1
+                    self.bytes += len(packet)
+                if len(out) >= self._buffer_size:
+                    f.write(out)
+                    out.clear()
+            if self._framers is not None:
+                for direction, framer in self._framers.items():
+                    rest = framer.flush()
+                    if rest:
+                        out += enhanced_packet(rest, last_t[direction], direction)
+                        self.packets += 1
+                        self.bytes += len(rest)
+            f.write(out)
+            f.close()
+        except BaseException as e:  # surfaced by close()
+            self._error = e
+            f.close()
+
+
+def export_capture(capture_path: str, pcapng_path: str, profile: Optional[ProfileConfig] = None,
+                   get_message_info=None, linktype: int = LINKTYPE_USER0) -> int:
+    """Convert a ``.sfcap`` capture (see ``capture``) to pcapng; returns the packet count."""
+    with CaptureReader(capture_path) as reader:
+        writer = PcapngWriter(pcapng_path, profile, get_message_info, linktype)
+        try:
+            for t_ns, direction, _offset, data in reader.records():
+                writer.write(data, direction, reader.start_time_ns + t_ns)
+                data.release()
+        finally:
+            writer.close()
+    return writer.packets
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+class PcapPacket(NamedTuple):
+    """One packet: absolute time (ns), interface index, link type, direction and data"""
+    t_ns: int
+    interface: int
+    linktype: int
+    direction: int
+    data: memoryview
+
+
+def _tsresol_scale(value: int) -> Tuple[int, int]:
+    """``(multiplier, divisor)`` turning timestamp units into nanoseconds."""
+    if value & 0x80:
+        return 10 ** 9, 1 << (value & 0x7F)
+    exp = value
+    return (10 ** (9 - exp), 1) if exp <= 9 else (1, 10 ** (exp - 9))
+
+
+class PcapngReader:
+    """Memory-mapped reader for pcapng (and classic pcap) files.
+
+    ``packets()`` yields ``PcapPacket`` whose data is a ``memoryview`` of the
+    mapping, valid until ``close()``. Packets without a direction option are
+    reported as RX. Blocks other than SHB/IDB/EPB/SPB are skipped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        head = bytes(self._view[:4])
+        if head == struct.pack('<I', BLOCK_SHB):
+            self.format = 'pcapng'
+        elif head in (struct.pack('<I', _PCAP_MAGIC_US), struct.pack('>I', _PCAP_MAGIC_US),
+                      struct.pack('<I', _PCAP_MAGIC_NS), struct.pack('>I', _PCAP_MAGIC_NS)):
+            self.format = 'pcap'
+        else:
+            self.close()
+            raise ValueError(f"{path} is not a pcap or pcapng file")
+
+    def packets(self) -> Iterator[PcapPacket]:
+        if self.format == 'pcap':
+            return self._pcap_packets()
+        return self._pcapng_packets()
+
+    def _pcap_packets(self) -> Iterator[PcapPacket]:
+        view = self._view
+        magic_le = struct.unpack_from('<I', view, 0)[0]
+        order = '<' if magic_le in (_PCAP_MAGIC_US, _PCAP_MAGIC_NS) else '>'
+        magic = struct.unpack_from(order + 'I', view, 0)[0]
+        unit = 1 if magic == _PCAP_MAGIC_NS else 1000
+        linktype = struct.unpack_from(order + 'I', view, 20)[0] & 0x0FFFFFFF
+        record = struct.Struct(order + 'IIII')
+        offset, size = 24, len(view)
+        while offset + record.size <= size:
+            ts_sec, ts_frac, incl_len, _orig_len = record.unpack_from(view, offset)
+            start = offset + record.size
+            if start + incl_len > size:
+                return
+            yield PcapPacket(ts_sec * 10 ** 9 + ts_frac * unit, 0, linktype, RX, view[start:start + incl_len])
+            offset = start + incl_len
+
+    def _pcapng_packets(self) -> Iterator[PcapPacket]:
+        view, size = self._view, len(self._view)
+        order = '<'
+        interfaces: List[Tuple[int, Tuple[int, int]]] = []
+        offset = 0
+        while offset + 12 <= size:
+            block_type = struct.unpack_from(order + 'I', view, offset)[0]
+            if block_type == BLOCK_SHB:
+                magic = struct.unpack_from('<I', view, offset + 8)[0]
+                order = '<' if magic == BYTE_ORDER_MAGIC else '>'
+                interfaces = []
+            length = struct.unpack_from(order + 'I', view, offset + 4)[0]
+            if length < 12 or offset + length > size:
+                return
+            body = offset + 8
+            if block_type == BLOCK_IDB:
+                linktype = struct.unpack_from(order + 'H', view, body)[0]
+                scale = _tsresol_scale(6)
+                for code, value in self._options(view, body + 8, offset + length - 4, order):
+                    if code == OPT_IF_TSRESOL and value:
+                        scale = _tsresol_scale(value[0])
+                interfaces.append((linktype, scale))
+            elif block_type == BLOCK_EPB:
+                interface, ts_high, ts_low, cap_len, _orig_len = struct.unpack_from(order + 'IIIII', view, body)
+                data_start = body + 20
+                direction = RX
+                options_start = data_start + cap_len + (-cap_len % 4)
+                for code, value in self._options(view, options_start, offset + length - 4, order):
+                    if code == OPT_EPB_FLAGS and len(value) == 4:
+                        if struct.unpack(order + 'I', value)[0] & 3 == EPB_OUTBOUND:
+                            direction = TX
+                linktype, (mul, div) = interfaces[interface] if interface < len(interfaces) else (0, (1000, 1))
+                t_ns = ((ts_high << 32) | ts_low) * mul // div
+                yield PcapPacket(t_ns, interface, linktype, direction, view[data_start:data_start + cap_len])
+            elif block_type == BLOCK_SPB:
+                orig_len = struct.unpack_from(order + 'I', view, body)[0]
+                cap_len = min(orig_len, length - 16)
+                linktype = interfaces[0][0] if interfaces else 0
+                yield PcapPacket(0, 0, linktype, RX, view[body + 4:body + 4 + cap_len])
+            offset += length
+
+    @staticmethod
+    def _options(view, offset: int, end: int, order: str) -> Iterator[Tuple[int, bytes]]:
+        while offset + 4 <= end:
+            code, length = struct.unpack_from(order + 'HH', view, offset)
+            if code == OPT_ENDOFOPT:
+                return
+            yield code, bytes(view[offset + 4:offset + 4 + length])
+            offset += 4 + length + (-length % 4)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'PcapngReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,142 @@
+"""Serial Port Transport implementation using pyserial"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+try:
+    import serial
+except ImportError:
+    serial = None
+
+from .transport import BaseTransport, TransportConfig
+
+
+@dataclass
+class SerialTransportConfig(TransportConfig):
+    """Serial transport configuration"""
+    port: str = ''
+    baudrate: int = 9600
+    bytesize: int = 8
+    parity: str = 'N'  # 'N', 'E', 'O', 'M', 'S'
+    stopbits: float = 1  # 1, 1.5, 2
+    timeout: float = 1.0
+    xonxoff: bool = False
+    rtscts: bool = False
+    dsrdtr: bool = False
+
+
+class SerialTransport(BaseTransport):
+    """Serial transport using pyserial"""
+
+    def __init__(self, config: SerialTransportConfig):
+        super().__init__(config)
+        if serial is None:
+            raise ImportError('pyserial package is required. Install with: pip install pyserial')
+        self.serial_config = config
+        self.serial_port: Optional[serial.Serial] = None
+        self.receive_thread: Optional[threading.Thread] = None
+        self.running = False
+
+    def connect(self) -> None:
+        """Connect serial port"""
+        try:
+            self.serial_port = serial.Serial(
+                port=self.serial_config.port,
+                baudrate=self.serial_config.baudrate,
+                bytesize=self.serial_config.bytesize,
+                parity=self.serial_config.parity,
+                stopbits=self.serial_config.stopbits,
+                timeout=self.serial_config.timeout,
+                xonxoff=self.serial_config.xonxoff,
+                rtscts=self.serial_config.rtscts,
+                dsrdtr=self.serial_config.dsrdtr
+            )
+            
+            if not self.serial_port.is_open:
+                self.serial_port.open()
+            
+            self.connected = True
+            self.running = True
+
+            reactor = self.config.reactor
+            if reactor is not None:
+                # Shared selector loop instead of a dedicated thread. Needs a
+                # selectable port (POSIX serial.Serial exposes fileno()).
+                if not hasattr(self.serial_port, 'fileno'):
+                    raise RuntimeError('Serial port is not selectable; reactor mode requires a POSIX port')
+                port = self.serial_port
+                reactor.register(port, lambda: self._on_readable(port))
+                return
+
+            # Start receive thread
+            self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
+            self.receive_thread.start()
+            
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def disconnect(self) -> None:
+        """Disconnect serial port"""
+        self.running = False
+        if self.config.reactor is not None and self.serial_port is not None:
+            self.config.reactor.unregister(self.serial_port)
+        if self.serial_port and self.serial_port.is_open:
+            self.serial_port.close()
+            self.serial_port = None
+        if self.receive_thread:
+            self.receive_thread.join(timeout=1.0)
+            self.receive_thread = None
+        self.connected = False
+
+    def send(self, data: bytes) -> int:
+        """Send data via serial port"""
+        if not self.serial_port or not self.connected or not self.serial_port.is_open:
+            raise RuntimeError('Serial port not connected')
+        
+        try:
+            written = self.serial_port.write(data)
+            self.serial_port.flush()
+            return written
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _receive_loop(self) -> None:
+        """Receive loop running in separate thread.
+
+        Performs a blocking read of at least one byte (honouring the port's
+        configured timeout) and then drains whatever else is already buffered.
+        This sleeps in the serial driver between bytes instead of busy-polling
+        ``in_waiting``, which would otherwise spin a CPU core at 100%.
+        """
+        while self.running and self.serial_port and self.serial_port.is_open:
+            try:
+                data = self.serial_port.read(1)  # blocks up to the configured timeout
+                if data:
+                    extra = self.serial_port.in_waiting
+                    if extra:
+                        data += self.serial_port.read(extra)
+                    self._handle_data(data)
+            except Exception as e:
+                if self.running:  # Only handle error if still running
+                    self._handle_error(e)
+                break
+
+    def _on_readable(self, port) -> None:
+        """Reactor callback: drain whatever the driver has buffered.
+
+        Selector readiness guarantees at least one byte, so the read never
+        waits for the configured timeout.
+        """
+        if port is not self.serial_port or not self.running:
+            self.config.reactor.unregister(port)
+            return
+        try:
+            data = port.read(port.in_waiting or 1)
+            if data:
+                self._handle_data(data)
+        except Exception as e:
+            self.config.reactor.unregister(port)
+            if self.running:
+                self._handle_error(e)
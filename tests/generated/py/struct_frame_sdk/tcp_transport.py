@@ -0,0 +1,83 @@
+"""TCP Transport implementation using socket"""
+
+import socket
+from dataclasses import dataclass
+from .transport import BaseSocketTransport, SocketTransportConfig
+
+
+@dataclass
+class TcpTransportConfig(SocketTransportConfig):
+    """TCP transport configuration"""
+    host: str = ''
+    port: int = 0
+    timeout: float = 5.0
+
+
+class TcpTransport(BaseSocketTransport):
+    """TCP transport using socket"""
+
+    def __init__(self, config: TcpTransportConfig):
+        super().__init__(config)
+        self.tcp_config = config
+
+    def connect(self) -> None:
+        """Connect TCP socket"""
+        try:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.settimeout(self.tcp_config.timeout)
+            self.socket.connect((self.tcp_config.host, self.tcp_config.port))
+            self.connected = True
+            self._start_receive_thread()
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _close_socket(self) -> None:
+        """Close TCP socket with proper shutdown"""
+        if self.socket:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                # Socket may already be disconnected/unconnected; ignore.
+                pass
+            self.socket.close()
+            self.socket = None
+
+    def send(self, data: bytes) -> int:
+        """Send data via TCP"""
+        if not self.socket or not self.connected:
+            raise RuntimeError('TCP socket not connected')
+        
+        try:
+            self.socket.sendall(data)
+            return len(data)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _receive_once(self) -> bool:
+        """Receive one chunk into the pre-allocated buffer.
+
+        Uses recv_into to receive directly into the pre-allocated buffer,
+        reducing socket-layer allocations. A view of the filled region is
+        handed on, so view callbacks see no copy and bytes callbacks see one.
+        """
+        try:
+            # Use recv_into with pre-allocated buffer to avoid socket-layer allocation
+            nbytes = self.socket.recv_into(self._recv_view)
+            if nbytes == 0:
+                # Connection closed
+                self._handle_close()
+                return False
+            self._handle_data_view(self._recv_view[:nbytes])
+            return True
+        except socket.timeout:
+            return True
+        except Exception as e:
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+                # A receive error means the connection is no longer usable;
+                # notify close handlers so the SDK/app stops treating it as
+                # connected (and can trigger reconnect logic).
+                self._handle_close()
+            return False
@@ -0,0 +1,268 @@
+"""Transport interface for struct-frame SDK
+Provides abstraction for various communication channels
+"""
+
+import socket
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TransportConfig:
+    """Configuration for transport layer
+
+    Set ``reactor`` to a ``TransportReactor`` / ``TransportReactorPool`` to have
+    the transport register with that shared selector loop instead of starting
+    its own receive thread.
+    """
+    auto_reconnect: bool = False
+    reconnect_delay: float = 1.0  # seconds
+    max_reconnect_attempts: int = 0  # 0 = infinite
+    reactor: Optional[Any] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class SocketTransportConfig(TransportConfig):
+    """Base configuration for socket-based transports"""
+    buffer_size: int = 4096
+
+
+@dataclass
+class SendResult:
+    """Verbose send result for SDK send operations."""
+    success: bool = False
+    attempted_bytes: int = 0
+    bytes_written: int = 0
+
+
+class ITransport(ABC):
+    """Transport interface for sending and receiving data"""
+
+    @abstractmethod
+    def connect(self) -> None:
+        """Connect to the transport endpoint"""
+        pass
+
+    @abstractmethod
+    def disconnect(self) -> None:
+        """Disconnect from the transport endpoint"""
+        pass
+
+    @abstractmethod
+    def send(self, data: bytes) -> int:
+        """Send data through the transport and return bytes written"""
+        pass
+
+    @abstractmethod
+    def set_data_callback(self, callback: Callable[[bytes], None]) -> None:
+        """Set callback for receiving data"""
+        pass
+
+    @abstractmethod
+    def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
+        """Set callback for connection errors"""
+        pass
+
+    @abstractmethod
+    def set_close_callback(self, callback: Callable[[], None]) -> None:
+        """Set callback for connection close"""
+        pass
+
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """Check if transport is connected"""
+        pass
+
+
+class BaseTransport(ITransport):
+    """Base transport with common functionality"""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self.connected = False
+        self.data_callback: Optional[Callable[[bytes], None]] = None
+        self.data_view_callback: Optional[Callable[[memoryview], None]] = None
+        self.error_callback: Optional[Callable[[Exception], None]] = None
+        self.close_callback: Optional[Callable[[], None]] = None
+        self.reconnect_attempts = 0
+
+    def set_data_callback(self, callback: Callable[[bytes], None]) -> None:
+        self.data_callback = callback
+
+    def set_data_view_callback(self, callback: Optional[Callable[[memoryview], None]]) -> None:
+        """Set a zero-copy receive callback.
+
+        The callback gets a ``memoryview`` into the transport's receive buffer
+        instead of a fresh ``bytes`` object. The view is only valid until the
+        callback returns: consume it (e.g. ``AccumulatingReader.add_data`` plus
+        a full drain) or copy it. Takes precedence over ``set_data_callback``.
+        """
+        self.data_view_callback = callback
+
+    def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
+        self.error_callback = callback
+
+    def set_close_callback(self, callback: Callable[[], None]) -> None:
+        self.close_callback = callback
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def __enter__(self):
+        """Context manager entry: connect and return self."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: always disconnect."""
+        self.disconnect()
+        return False
+
+    def _handle_data(self, data: bytes) -> None:
+        """Internal method to handle received data"""
+        if self.data_view_callback:
+            self.data_view_callback(memoryview(data))
+        elif self.data_callback:
+            self.data_callback(data)
+
+    def _handle_data_view(self, view: memoryview) -> None:
+        """Deliver a borrowed view of the receive buffer.
+
+        Zero-copy when a view callback is set; otherwise falls back to a single
+        ``bytes`` copy for bytes-based callbacks.
+        """
+        if self.data_view_callback:
+            self.data_view_callback(view)
+        elif self.data_callback:
+            self.data_callback(bytes(view))
+
+    def _handle_error(self, error: Exception) -> None:
+        """Internal method to handle errors"""
+        if self.error_callback:
+            self.error_callback(error)
+        if self.config.auto_reconnect and self.connected:
+            self._attempt_reconnect()
+
+    def _handle_close(self) -> None:
+        """Internal method to handle connection close"""
+        self.connected = False
+        if self.close_callback:
+            self.close_callback()
+        if self.config.auto_reconnect:
+            self._attempt_reconnect()
+
+    def _attempt_reconnect(self) -> None:
+        """Attempt to reconnect with backoff"""
+        import time
+        
+        if self.config.max_reconnect_attempts > 0 and \
+           self.reconnect_attempts >= self.config.max_reconnect_attempts:
+            return
+
+        self.reconnect_attempts += 1
+        reactor = self.config.reactor
+        if reactor is not None and reactor.in_reactor_thread():
+            # Never sleep on a shared reactor thread; every other link would stall.
+            reactor.call_later(self.config.reconnect_delay, self._reconnect_now)
+            return
+        time.sleep(self.config.reconnect_delay)
+        self._reconnect_now()
+
+    def _reconnect_now(self) -> None:
+        """Single reconnect attempt (after the backoff delay)"""
+        try:
+            self.connect()
+            self.reconnect_attempts = 0
+        except Exception as e:
+            self._handle_error(e)
+
+
+class BaseSocketTransport(BaseTransport):
+    """
+    Base class for socket-based transports (TCP, UDP).
+    
+    Consolidates common socket functionality like receive thread management,
+    connection state, and error handling. Pre-allocates a receive buffer to
+    avoid repeated memory allocation in the receive loop.
+
+    When ``config.reactor`` is set, the socket is registered with the shared
+    reactor and ``_receive_once()`` runs on its thread each time the socket is
+    readable; no per-transport thread is started.
+    """
+
+    def __init__(self, config: SocketTransportConfig):
+        super().__init__(config)
+        self.socket_config = config
+        self.socket: Optional[socket.socket] = None
+        self.receive_thread: Optional[threading.Thread] = None
+        self.running = False
+        # Pre-allocate receive buffer to avoid repeated allocation in receive loop
+        self._recv_buffer = bytearray(config.buffer_size)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._reactor_socket: Optional[socket.socket] = None
+
+    def _start_receive_thread(self) -> None:
+        """Start the receive loop thread (or register with the reactor)"""
+        self.running = True
+        reactor = self.config.reactor
+        if reactor is not None:
+            self._detach_reactor()
+            sock = self.socket
+            self._reactor_socket = sock
+            reactor.register(sock, lambda: self._on_readable(sock))
+            return
+        self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
+        self.receive_thread.start()
+
+    def _stop_receive_thread(self) -> None:
+        """Stop the receive loop thread (or unregister from the reactor)"""
+        self.running = False
+        self._detach_reactor()
+        if self.receive_thread:
+            self.receive_thread.join(timeout=1.0)
+            self.receive_thread = None
+
+    def _detach_reactor(self) -> None:
+        """Unregister the current socket from the reactor, if registered"""
+        if self._reactor_socket is not None:
+            self.config.reactor.unregister(self._reactor_socket)
+            self._reactor_socket = None
+
+    def _on_readable(self, sock: socket.socket) -> None:
+        """Reactor callback: perform one receive on a readable socket"""
+        if sock is not self.socket or not self.running:
+            self.config.reactor.unregister(sock)
+            return
+        if not self._receive_once():
+            self.config.reactor.unregister(sock)
+            if self._reactor_socket is sock:
+                self._reactor_socket = None
+
+    def _receive_loop(self) -> None:
+        """Receive loop running in separate thread"""
+        while self.running and self.socket:
+            if not self._receive_once():
+                break
+
+    def _close_socket(self) -> None:
+        """Close the socket (override for protocol-specific cleanup)"""
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+    def disconnect(self) -> None:
+        """Disconnect the socket transport"""
+        self._stop_receive_thread()
+        self._close_socket()
+        self.connected = False
+
+    @abstractmethod
+    def _receive_once(self) -> bool:
+        """Receive and deliver one read (subclass must implement).
+
+        Returns False when the socket is finished (closed or failed) and no
+        further reads should be attempted.
+        """
+        pass
@@ -0,0 +1,85 @@
+"""UDP Transport implementation using socket"""
+
+import socket
+from dataclasses import dataclass
+from .transport import BaseSocketTransport, SocketTransportConfig
+
+
+# Windows error raised when a datagram is larger than the receive buffer
+WSAEMSGSIZE = 10040
+
+
+@dataclass
+class UdpTransportConfig(SocketTransportConfig):
+    """UDP transport configuration"""
+    local_port: int = 0
+    local_address: str = '0.0.0.0'
+    remote_host: str = ''
+    remote_port: int = 0
+    enable_broadcast: bool = False
+
+
+class UdpTransport(BaseSocketTransport):
+    """UDP transport using socket"""
+
+    def __init__(self, config: UdpTransportConfig):
+        super().__init__(config)
+        self.udp_config = config
+
+    def connect(self) -> None:
+        """Connect (bind) UDP socket"""
+        try:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            
+            if self.udp_config.enable_broadcast:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            
+            self.socket.bind((self.udp_config.local_address, self.udp_config.local_port))
+            self.connected = True
+            self._start_receive_thread()
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def send(self, data: bytes) -> int:
+        """Send data via UDP"""
+        if not self.socket or not self.connected:
+            raise RuntimeError('UDP socket not connected')
+        
+        try:
+            return self.socket.sendto(data, (self.udp_config.remote_host, self.udp_config.remote_port))
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _receive_once(self) -> bool:
+        """Receive one datagram into the pre-allocated buffer.
+        
+        Uses recvfrom_into to receive directly into the pre-allocated buffer,
+        reducing socket-layer allocations. A view of the filled region is
+        handed on, so view callbacks see no copy and bytes callbacks see one.
+        """
+        # WSAEMSGSIZE (Windows): a datagram larger than the receive buffer was
+        # truncated. recvfrom_into raises rather than silently delivering a partial
+        # datagram. We report and drop that datagram and keep listening instead of
+        # tearing down the receive loop; size buffer_size for the profile's largest
+        # expected frame to avoid this.
+        try:
+            # Use recvfrom_into with pre-allocated buffer to reduce socket-layer allocation
+            nbytes, addr = self.socket.recvfrom_into(self._recv_view)
+            self._handle_data_view(self._recv_view[:nbytes])
+            return True
+        except socket.timeout:
+            return True
+        except OSError as e:
+            if getattr(e, 'winerror', None) == WSAEMSGSIZE or getattr(e, 'errno', None) == WSAEMSGSIZE:
+                if self.running:
+                    self._handle_error(e)
+                return True
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+            return False
+        except Exception as e:
+            if self.running:  # Only handle error if still running
+                self._handle_error(e)
+            return False
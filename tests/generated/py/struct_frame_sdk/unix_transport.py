@@ -0,0 +1,185 @@
+"""Unix domain socket transport implementation using socket
+
+For processes on the same host, ``AF_UNIX`` sockets skip the TCP/IP stack
+entirely (no checksums, segmentation, congestion control or loopback
+routing). Two socket types are supported:
+
+  - ``'stream'`` (``SOCK_STREAM``): a byte stream, like TCP.
+  - ``'seqpacket'`` (``SOCK_SEQPACKET``): connection-oriented and reliable,
+    but record-preserving like UDP; each ``send()`` arrives as one read.
+
+An endpoint either connects to ``path``, listens on ``path`` and accepts one
+peer (``listen=True``), or wraps an already-connected socket (``sock=``), for
+example one half of ``UnixTransport.pair()``.
+"""
+
+import os
+import socket
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from .transport import BaseSocketTransport, SocketTransportConfig
+
+
+UNIX_SOCKET_TYPES = {
+    'stream': 'SOCK_STREAM',
+    'seqpacket': 'SOCK_SEQPACKET',
+}
+
+
+def unix_socket_type(name: str) -> int:
+    """Map a config ``socket_type`` name to the ``socket`` module constant"""
+    attr = UNIX_SOCKET_TYPES.get(name)
+    if attr is None:
+        raise ValueError(f"socket_type must be one of {sorted(UNIX_SOCKET_TYPES)}, got {name!r}")
+    if not hasattr(socket, 'AF_UNIX') or not hasattr(socket, attr):
+        raise OSError(f'Unix domain {name} sockets are not available on this platform')
+    return getattr(socket, attr)
+
+
+def unlink_stale(path: str) -> None:
+    """Remove a leftover socket file so ``bind()`` can reuse the path"""
+    if path and not path.startswith('\0'):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class UnixTransportConfig(SocketTransportConfig):
+    """Unix domain socket transport configuration
+
+    Attributes:
+        path: Filesystem path (or Linux abstract name starting with NUL).
+        socket_type: ``'stream'`` or ``'seqpacket'``.
+        listen: Bind ``path`` and accept one peer instead of connecting.
+        timeout: Connect/accept timeout in seconds.
+        sock: Already-connected socket to wrap; ``path``/``listen`` are ignored.
+    """
+    path: str = ''
+    socket_type: str = 'stream'
+    listen: bool = False
+    timeout: float = 5.0
+    sock: Optional[socket.socket] = field(default=None, repr=False, compare=False)
+
+
+class UnixTransport(BaseSocketTransport):
+    """Unix domain socket transport (stream or seqpacket)"""
+
+    def __init__(self, config: UnixTransportConfig):
+        super().__init__(config)
+        self.unix_config = config
+        self._type = unix_socket_type(config.socket_type)
+
+    @classmethod
+    def pair(cls, socket_type: str = 'stream',
+             buffer_size: int = 4096) -> Tuple['UnixTransport', 'UnixTransport']:
+        """Return two transports joined by ``socket.socketpair()``.
+
+        Handy for a parent and a forked child, or two threads; neither side
+        needs a filesystem path.
+        """
+        a, b = socket.socketpair(socket.AF_UNIX, unix_socket_type(socket_type))
+        return (cls(UnixTransportConfig(socket_type=socket_type, buffer_size=buffer_size, sock=a)),
+                cls(UnixTransportConfig(socket_type=socket_type, buffer_size=buffer_size, sock=b)))
+
+    def connect(self) -> None:
+        """Connect to (or accept a peer on) the configured path"""
+        try:
+            if self.unix_config.sock is not None:
+                self.socket = self.unix_config.sock
+            elif self.unix_config.listen:
+                self.socket = self._accept_one()
+            else:
+                self.socket = socket.socket(socket.AF_UNIX, self._type)
+                self.socket.settimeout(self.unix_config.timeout)
+                self.socket.connect(self.unix_config.path)
+            # Block in recv; disconnect() shuts the socket down to wake it.
+            self.socket.settimeout(None)
+            self.connected = True
+            self._start_receive_thread()
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _accept_one(self) -> socket.socket:
+        listener = socket.socket(socket.AF_UNIX, self._type)
+        try:
+            unlink_stale(self.unix_config.path)
+            listener.bind(self.unix_config.path)
+            listener.listen(1)
+            listener.settimeout(self.unix_config.timeout)
+            conn, _ = listener.accept()
+            return conn
+        finally:
+            # One peer only: the path is not needed once it has connected.
+            listener.close()
+            unlink_stale(self.unix_config.path)
+
+    def disconnect(self) -> None:
+        """Shut the socket down first so the blocked receive thread exits at once"""
+        self.running = False
+        if self.socket:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        super().disconnect()
+
+    def _close_socket(self) -> None:
+        """Close Unix socket with proper shutdown"""
+        if self.socket:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.socket.close()
+            self.socket = None
+
+    def send(self, data: bytes) -> int:
+        """Send data; on seqpacket sockets each call is one record"""
+        if not self.socket or not self.connected:
+            raise RuntimeError('Unix socket not connected')
+
+        try:
+            if self._type == socket.SOCK_STREAM:
+                self.socket.sendall(data)
+                return len(data)
+            sent = self.socket.send(data)
+            if sent != len(data):
+                raise OSError(f'seqpacket record truncated ({sent}/{len(data)} bytes sent)')
+            return sent
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    def _receive_once(self) -> bool:
+        """Receive one chunk (stream) or one record (seqpacket) into the buffer.
+
+        A view of the filled region is handed on, so view callbacks see no copy.
+        Seqpacket records larger than ``buffer_size`` are reported and dropped
+        rather than delivered truncated.
+        """
+        try:
+            if self._type == socket.SOCK_STREAM:
+                nbytes = self.socket.recv_into(self._recv_view)
+            else:
+                nbytes = self.socket.recv_into(self._recv_view, 0, getattr(socket, 'MSG_TRUNC', 0))
+            if nbytes == 0:
+                if self.running:
+                    self._handle_close()
+                return False
+            if nbytes > len(self._recv_view):
+                self._handle_error(OSError(
+                    f'seqpacket record of {nbytes} bytes exceeds buffer_size {len(self._recv_view)}'))
+                return True
+            self._handle_data_view(self._recv_view[:nbytes])
+            return True
+        except socket.timeout:
+            return True
+        except Exception as e:
+            if self.running:
+                self._handle_error(e)
+                self._handle_close()
+            return False
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""Standalone round-trip test runner for package 'envelope_test'.
+Generated by struct-frame 0.10.1. Exercises every message across all 5 frame profiles."""
+import os, runpy, sys
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "struct_frame", "generated"))
+sys.path.insert(0, HERE)
+runpy.run_module("struct_frame.generated.envelope_test_tests", run_name="__main__")
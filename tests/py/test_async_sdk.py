@@ -28,6 +28,7 @@ _sdk_dir = os.path.join(
 sys.path.insert(0, _sdk_dir)
 
 from struct_frame_sdk.async_struct_frame_sdk import AsyncStructFrameSdk, AsyncStructFrameSdkConfig
+from struct_frame_sdk.subscription import SubscriptionMode
 from struct_frame_sdk.async_transport import IAsyncTransport
 
 from frame_profiles import (
@@ -299,6 +300,34 @@ def test_codec_registration_and_message_decoding():
     run_test("codec: decoded flag preserved", received[0].get("flag") is True)
 
 
+def test_raw_subscriber_skips_codec():
+    """RAW subscribers get the original payload and never trigger the codec."""
+    transport = MockAsyncTransport()
+    sdk = make_sdk(transport)
+    calls = [0]
+
+    class _Codec:
+        msg_id = BasicTypesMessage.MSG_ID
+
+        def deserialize(self, data: bytes):
+            calls[0] += 1
+            return BasicTypesMessage.deserialize(data)
+
+    raw_seen, lazy_seen = [], []
+    sdk.register_codec(_Codec())
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: raw_seen.append(p), SubscriptionMode.RAW)
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: lazy_seen.append(p), SubscriptionMode.LAZY)
+
+    msg = BasicTypesMessage()
+    msg.regular_int = 9
+    transport.inject_data(encode_basic_types(msg))
+
+    run_test("modes: raw subscriber receives bytes", raw_seen == [bytes(msg.serialize())])
+    run_test("modes: codec not run until lazy decode()", calls[0] == 0)
+    run_test("modes: lazy decode() returns decoded message",
+             lazy_seen[0].decode().regular_int == 9 and calls[0] == 1)
+
+
 def test_close_callback_clears_buffer_state():
     """Transport close callback resets SDK parse buffer."""
     transport = MockAsyncTransport()
@@ -358,6 +387,7 @@ def main():
     test_unsubscribe_removes_handler()
     test_no_handler_for_unknown_id()
     test_codec_registration_and_message_decoding()
+    test_raw_subscriber_skips_codec()
     test_close_callback_clears_buffer_state()
 
     # Async tests driven through asyncio.run()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""Multi-peer server tests for the Python async SDK.
+
+Exercises ``AsyncTcpServerTransport`` / ``AsyncUdpServerTransport`` together
+with ``AsyncStructFrameServer`` over real localhost sockets:
+
+  - many TCP clients connect; every frame is dispatched with its peer identity
+  - each peer has an independent reader, so a split frame on one connection
+    and corrupt bytes on another do not interfere
+  - per-peer diagnostics only count that peer's errors
+  - send() replies reach the right client; broadcast() reaches all of them,
+    and a peer that stops draining does not hold up the others
+  - subscription modes and payload filters apply to server handlers
+  - peer close callbacks fire and the peer's reader is released
+  - UDP datagrams are demultiplexed into peers by source address
+
+All waits are bounded so the suite cannot hang if a socket misbehaves.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.async_server_transport import (
+    AsyncTcpServerTransport,
+    AsyncTcpServerTransportConfig,
+    AsyncUdpServerTransport,
+    AsyncUdpServerTransportConfig,
+)
+from struct_frame_sdk.async_struct_frame_server import (
+    AsyncStructFrameServer,
+    AsyncStructFrameServerConfig,
+)
+from struct_frame_sdk.subscription import FieldFilter, LazyMessage, SubscriptionFilter, SubscriptionMode
+
+from frame_profiles import BufferWriter, PROFILE_STANDARD_CONFIG, parse_frame_buffer
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+async def wait_until(predicate, timeout=2.0, interval=0.01) -> bool:
+    """Poll *predicate* on the event loop until true or *timeout* elapses."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(interval)
+    return predicate()
+
+
+def encode_basic_types(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+def make_server(transport) -> AsyncStructFrameServer:
+    return AsyncStructFrameServer(AsyncStructFrameServerConfig(
+        transport=transport,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+async def test_tcp_many_peers_dispatch():
+    """Frames from many clients are dispatched with the sending peer attached."""
+    transport = AsyncTcpServerTransport(AsyncTcpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    received = []
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: received.append((peer, payload)))
+    num_clients = 20
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        clients = [await asyncio.open_connection(host, port) for _ in range(num_clients)]
+        run_test("tcp server: all clients accepted",
+                 await wait_until(lambda: len(server.peers()) == num_clients))
+
+        for i, (_, writer) in enumerate(clients):
+            writer.write(encode_basic_types(i))
+            await writer.drain()
+        run_test("tcp server: one frame dispatched per client",
+                 await wait_until(lambda: len(received) == num_clients))
+
+        peers = {peer for peer, _ in received}
+        run_test("tcp server: every frame carries a distinct peer", len(peers) == num_clients)
+        run_test("tcp server: peers report protocol 'tcp'",
+                 all(peer.protocol == 'tcp' for peer in peers))
+        values = sorted(BasicTypesMessage.deserialize(p).regular_int for _, p in received)
+        run_test("tcp server: payloads intact", values == list(range(num_clients)))
+
+        for _, writer in clients:
+            writer.close()
+        run_test("tcp server: peers released after clients close",
+                 await wait_until(lambda: not server.peers()))
+
+
+async def test_tcp_peer_isolation_and_diagnostics():
+    """A split frame on one connection is unaffected by garbage on another."""
+    transport = AsyncTcpServerTransport(AsyncTcpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    received = []
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: received.append(peer))
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        _, clean = await asyncio.open_connection(host, port)
+        _, noisy = await asyncio.open_connection(host, port)
+        await wait_until(lambda: len(server.peers()) == 2)
+
+        frame = encode_basic_types(7)
+        clean.write(frame[:5])
+        await clean.drain()
+        await asyncio.sleep(0.05)
+
+        corrupt = bytearray(encode_basic_types(8))
+        corrupt[-1] ^= 0xFF
+        noisy.write(bytes(corrupt))
+        await noisy.drain()
+        await asyncio.sleep(0.05)
+
+        clean.write(frame[5:])
+        await clean.drain()
+        run_test("isolation: split frame completes despite other peer's garbage",
+                 await wait_until(lambda: len(received) == 1))
+
+        clean_peer = received[0] if received else None
+        noisy_peer = next((p for p in server.peers() if p != clean_peer), None)
+        clean_diag = server.diagnostics(clean_peer) if clean_peer else None
+        noisy_diag = server.diagnostics(noisy_peer) if noisy_peer else None
+        run_test("diagnostics: clean peer has no CRC failures",
+                 clean_diag is not None and clean_diag.cnt_crc_failures == 0)
+        run_test("diagnostics: noisy peer counted its CRC failure",
+                 noisy_diag is not None and noisy_diag.cnt_crc_failures == 1)
+
+        clean.close()
+        noisy.close()
+
+
+async def test_tcp_send_and_broadcast():
+    """send() reaches only the addressed peer; broadcast() reaches all peers."""
+    transport = AsyncTcpServerTransport(AsyncTcpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    requests = []
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: requests.append(peer))
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        reader_a, writer_a = await asyncio.open_connection(host, port)
+        reader_b, writer_b = await asyncio.open_connection(host, port)
+        await wait_until(lambda: len(server.peers()) == 2)
+
+        writer_a.write(encode_basic_types(1))
+        await writer_a.drain()
+        await wait_until(lambda: len(requests) == 1)
+
+        reply = BasicTypesMessage()
+        reply.regular_int = 55
+        result = await server.send(requests[0], reply)
+        run_test("send: result.success is true", result.success)
+        data = await asyncio.wait_for(reader_a.read(4096), timeout=2.0)
+        parsed = parse_frame_buffer(PROFILE_STANDARD_CONFIG, data, get_message_info)
+        run_test("send: addressed client receives the reply",
+                 parsed.valid and BasicTypesMessage.deserialize(parsed.msg_data).regular_int == 55)
+
+        reached = await server.broadcast(reply)
+        run_test("broadcast: reports both peers reached", reached == 2)
+        data_b = await asyncio.wait_for(reader_b.read(4096), timeout=2.0)
+        run_test("broadcast: other client receives the frame",
+                 parse_frame_buffer(PROFILE_STANDARD_CONFIG, data_b, get_message_info).valid)
+
+        writer_a.close()
+        writer_b.close()
+
+
+async def test_tcp_broadcast_with_stalled_peer():
+    """A peer whose writes are paused does not delay broadcast to the others."""
+    transport = AsyncTcpServerTransport(AsyncTcpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    connected = []
+    server.on_peer_connect(connected.append)
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        _, writer_a = await asyncio.open_connection(host, port)
+        await wait_until(lambda: len(connected) == 1)
+        reader_b, writer_b = await asyncio.open_connection(host, port)
+        await wait_until(lambda: len(connected) == 2)
+
+        stalled = transport._connections[connected[0]]
+        stalled.pause_writing()
+        reply = BasicTypesMessage()
+        reply.regular_int = 77
+        task = asyncio.create_task(server.broadcast(reply))
+        try:
+            data_b = await asyncio.wait_for(reader_b.read(4096), timeout=2.0)
+        except asyncio.TimeoutError:
+            data_b = b''
+        run_test("broadcast: healthy peer served while another is stalled",
+                 parse_frame_buffer(PROFILE_STANDARD_CONFIG, data_b, get_message_info).valid
+                 and not task.done())
+
+        stalled.resume_writing()
+        reached = await asyncio.wait_for(task, timeout=2.0)
+        run_test("broadcast: stalled peer counted once it drains", reached == 2)
+
+        writer_a.close()
+        writer_b.close()
+
+
+async def test_tcp_subscription_modes_and_filters():
+    """RAW, LAZY and filtered subscriptions receive the sending peer too."""
+    transport = AsyncTcpServerTransport(AsyncTcpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    raw, lazy, filtered = [], [], []
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: raw.append((payload, peer)), SubscriptionMode.RAW)
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda view, msg_id, peer: lazy.append(view), SubscriptionMode.LAZY)
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: filtered.append(payload),
+                     filter=SubscriptionFilter(fields=[FieldFilter(0, 'b', equals=5)]))
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        _, writer = await asyncio.open_connection(host, port)
+        for value in (4, 5, 6):
+            msg = BasicTypesMessage()
+            msg.small_int = value
+            w = BufferWriter(PROFILE_STANDARD_CONFIG)
+            w.write(msg)
+            writer.write(bytes(w.data()))
+        await writer.drain()
+        run_test("modes: RAW handler gets every frame",
+                 await wait_until(lambda: len(raw) == 3))
+        run_test("modes: RAW payload carries the sending peer",
+                 raw and isinstance(raw[0][0], (bytes, bytearray, memoryview))
+                 and raw[0][1] in server.peers())
+        run_test("modes: LAZY handler gets a LazyMessage",
+                 len(lazy) == 3 and all(isinstance(v, LazyMessage) for v in lazy))
+        run_test("filters: payload filter keeps only the matching frame",
+                 len(filtered) == 1 and BasicTypesMessage.deserialize(filtered[0]).small_int == 5)
+
+        writer.close()
+
+
+async def test_tcp_connect_close_callbacks_and_max_peers():
+    """Peer lifecycle handlers fire and max_peers rejects excess connections."""
+    transport = AsyncTcpServerTransport(
+        AsyncTcpServerTransportConfig(host='127.0.0.1', max_peers=1))
+    server = make_server(transport)
+    connected, closed = [], []
+    server.on_peer_connect(connected.append)
+    server.on_peer_close(closed.append)
+
+    async with server:
+        host, port = transport.bound_address[:2]
+        _, first = await asyncio.open_connection(host, port)
+        run_test("lifecycle: connect handler fires",
+                 await wait_until(lambda: len(connected) == 1))
+
+        second_reader, _ = await asyncio.open_connection(host, port)
+        eof = await asyncio.wait_for(second_reader.read(1), timeout=2.0)
+        run_test("max_peers: excess connection closed by server", eof == b'')
+        run_test("max_peers: only one peer tracked", len(server.peers()) == 1)
+
+        first.close()
+        run_test("lifecycle: close handler fires",
+                 await wait_until(lambda: len(closed) == 1))
+        run_test("lifecycle: closed peer matches connected peer",
+                 closed and closed[0] == connected[0])
+        run_test("lifecycle: closed peer reader released",
+                 closed and server.diagnostics(closed[0]) is None)
+
+
+async def test_udp_demultiplex_by_source():
+    """Datagrams from different source addresses become different peers."""
+    transport = AsyncUdpServerTransport(AsyncUdpServerTransportConfig(host='127.0.0.1'))
+    server = make_server(transport)
+    received = []
+    server.subscribe(BasicTypesMessage.MSG_ID,
+                     lambda payload, msg_id, peer: received.append(peer))
+
+    async with server:
+        addr = transport.bound_address[:2]
+        socks = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(3)]
+        try:
+            for i, s in enumerate(socks):
+                s.bind(('127.0.0.1', 0))
+                s.sendto(encode_basic_types(i), addr)
+                s.sendto(encode_basic_types(i + 10), addr)
+            run_test("udp server: all datagrams dispatched",
+                     await wait_until(lambda: len(received) == 6))
+            run_test("udp server: one peer per source address",
+                     len(set(received)) == 3 and len(server.peers()) == 3)
+            run_test("udp server: peers report protocol 'udp'",
+                     all(peer.protocol == 'udp' for peer in received))
+
+            target = received[0]
+            await server.send_raw(target, BasicTypesMessage.MSG_ID,
+                                  BasicTypesMessage().serialize())
+            owner = next(s for s in socks if s.getsockname() == target.address)
+            owner.settimeout(2.0)
+            data, _ = owner.recvfrom(4096)
+            run_test("udp server: reply delivered to peer's source address",
+                     parse_frame_buffer(PROFILE_STANDARD_CONFIG, data, get_message_info).valid)
+        finally:
+            for s in socks:
+                s.close()
+
+
+async def test_udp_idle_timeout():
+    """Silent UDP peers are forgotten after peer_idle_timeout."""
+    transport = AsyncUdpServerTransport(
+        AsyncUdpServerTransportConfig(host='127.0.0.1', peer_idle_timeout=0.1))
+    server = make_server(transport)
+    closed = []
+    server.on_peer_close(closed.append)
+
+    async with server:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.sendto(encode_basic_types(1), transport.bound_address[:2])
+            await wait_until(lambda: len(server.peers()) == 1)
+            run_test("udp idle: silent peer forgotten",
+                     await wait_until(lambda: len(closed) == 1 and not server.peers()))
+        finally:
+            s.close()
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("ASYNC MULTI-PEER SERVER TESTS - Python")
+    print("========================================")
+    print()
+
+    asyncio.run(test_tcp_many_peers_dispatch())
+    asyncio.run(test_tcp_peer_isolation_and_diagnostics())
+    asyncio.run(test_tcp_send_and_broadcast())
+    asyncio.run(test_tcp_broadcast_with_stalled_peer())
+    asyncio.run(test_tcp_subscription_modes_and_filters())
+    asyncio.run(test_tcp_connect_close_callbacks_and_max_peers())
+    asyncio.run(test_udp_demultiplex_by_source())
+    asyncio.run(test_udp_idle_timeout())
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Batched UDP transport loopback tests for the Python SDK.
+
+Exercises ``BatchedUdpTransport`` over real localhost sockets:
+
+  - datagrams that pile up while a callback is busy are drained in one batch
+  - ``max_recv_batch`` caps the size of a batch
+  - queued frames are held until flush() or until max_send_batch is reached
+  - send_many() bursts and the per-batch statistics agree with what was sent
+  - a StructFrameSdk dispatches every frame, in thread and reactor mode
+
+All waits are bounded so the suite cannot hang if a socket misbehaves.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.batched_udp_transport import (
+    BatchedUdpTransport,
+    BatchedUdpTransportConfig,
+)
+from struct_frame_sdk.reactor import TransportReactor
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+
+from frame_profiles import BufferWriter, PROFILE_STANDARD_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+def wait_until(predicate, timeout=2.0, interval=0.01) -> bool:
+    """Poll *predicate* until true or *timeout* elapses."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+def encode_basic_types(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+def slow_first_callback(received, entered: threading.Event, gate: threading.Event):
+    """Data callback that blocks on the first datagram until *gate* is set."""
+    def on_data(data):
+        if not received:
+            entered.set()
+            gate.wait(2.0)
+        received.append(bytes(data))
+    return on_data
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_drains_backlog_in_one_batch():
+    """Datagrams queued while the callback is busy arrive as one batch."""
+    transport = BatchedUdpTransport(BatchedUdpTransportConfig(local_address='127.0.0.1'))
+    received = []
+    entered, gate = threading.Event(), threading.Event()
+    transport.set_data_callback(slow_first_callback(received, entered, gate))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        transport.connect()
+        addr = transport.socket.getsockname()
+        sender.sendto(b'first', addr)
+        run_test("batch: first datagram picked up", entered.wait(2.0))
+        for i in range(40):
+            sender.sendto(bytes([i]) * 4, addr)
+        time.sleep(0.05)
+        gate.set()
+
+        run_test("batch: every datagram delivered", wait_until(lambda: len(received) == 41))
+        run_test("batch: datagram boundaries preserved",
+                 received[0] == b'first' and received[1:] == [bytes([i]) * 4 for i in range(40)])
+        stats = transport.stats()
+        run_test("batch: backlog drained in a single wakeup", stats.rx_max_batch == 41)
+        run_test("batch: stats count datagrams and bytes",
+                 stats.rx_datagrams == 41 and stats.rx_bytes == 5 + 40 * 4)
+    finally:
+        gate.set()
+        sender.close()
+        transport.disconnect()
+
+
+def test_max_recv_batch_caps_batches():
+    """No batch exceeds max_recv_batch; the remainder is read on later wakeups."""
+    transport = BatchedUdpTransport(
+        BatchedUdpTransportConfig(local_address='127.0.0.1', max_recv_batch=8))
+    received = []
+    entered, gate = threading.Event(), threading.Event()
+    transport.set_data_callback(slow_first_callback(received, entered, gate))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        transport.connect()
+        addr = transport.socket.getsockname()
+        sender.sendto(b'\xff', addr)
+        entered.wait(2.0)
+        for i in range(30):
+            sender.sendto(bytes([i]), addr)
+        time.sleep(0.05)
+        gate.set()
+
+        run_test("cap: every datagram delivered", wait_until(lambda: len(received) == 31))
+        stats = transport.stats()
+        run_test("cap: batches limited to max_recv_batch", stats.rx_max_batch == 8)
+        run_test("cap: backlog split across several batches", stats.rx_batches >= 4)
+    finally:
+        gate.set()
+        sender.close()
+        transport.disconnect()
+
+
+def test_queue_flush_and_bursts():
+    """Queued frames go out on flush() or once max_send_batch are pending."""
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('127.0.0.1', 0))
+    sink.settimeout(2.0)
+    port = sink.getsockname()[1]
+    transport = BatchedUdpTransport(BatchedUdpTransportConfig(
+        local_address='127.0.0.1', remote_host='127.0.0.1', remote_port=port, max_send_batch=4))
+    try:
+        transport.connect()
+        for i in range(3):
+            transport.queue(bytes([i]))
+        run_test("queue: frames held until flush", transport.pending() == 3
+                 and transport.stats().tx_datagrams == 0)
+        run_test("flush: returns datagrams sent", transport.flush() == 3)
+        run_test("flush: sink receives each queued frame",
+                 [sink.recv(16) for _ in range(3)] == [b'\x00', b'\x01', b'\x02'])
+        run_test("flush: empty queue sends nothing", transport.flush() == 0)
+
+        for i in range(4):
+            transport.queue(bytes([10 + i]))
+        run_test("queue: auto-flush at max_send_batch", transport.pending() == 0)
+        run_test("queue: auto-flushed frames arrive",
+                 [sink.recv(16) for _ in range(4)] == [bytes([10 + i]) for i in range(4)])
+
+        run_test("send_many: returns datagrams sent",
+                 transport.send_many([b'ab', b'cd']) == 2)
+        stats = transport.stats()
+        run_test("stats: bursts and datagrams counted",
+                 stats.tx_bursts == 3 and stats.tx_datagrams == 9 and stats.tx_max_burst == 4)
+        run_test("stats: mean burst size", abs(stats.tx_mean_burst - 3.0) < 1e-9)
+    finally:
+        transport.disconnect()
+        sink.close()
+
+
+def test_sdk_dispatch_thread_and_reactor():
+    """StructFrameSdk dispatches every frame over the batched transport."""
+    for mode in ('thread', 'reactor'):
+        reactor = TransportReactor() if mode == 'reactor' else None
+        transport = BatchedUdpTransport(
+            BatchedUdpTransportConfig(local_address='127.0.0.1', reactor=reactor))
+        sdk = StructFrameSdk(StructFrameSdkConfig(
+            transport=transport,
+            profile=PROFILE_STANDARD_CONFIG,
+            get_message_info=get_message_info,
+        ))
+        received = []
+        sdk.subscribe(BasicTypesMessage.MSG_ID,
+                      lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sdk.connect()
+            addr = transport.socket.getsockname()
+            for i in range(100):
+                sender.sendto(encode_basic_types(i), addr)
+            run_test(f"sdk ({mode}): all frames dispatched in order",
+                     wait_until(lambda: received == list(range(100))))
+        finally:
+            sender.close()
+            sdk.disconnect()
+            if reactor is not None:
+                reactor.close()
+
+
+def test_invalid_config():
+    """Zero batch sizes are rejected."""
+    try:
+        BatchedUdpTransport(BatchedUdpTransportConfig(max_recv_batch=0))
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("config: max_recv_batch=0 rejected", rejected)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("BATCHED UDP TRANSPORT TESTS - Python")
+    print("========================================")
+    print()
+
+    test_drains_backlog_in_one_batch()
+    test_max_recv_batch_caps_batches()
+    test_queue_flush_and_bursts()
+    test_sdk_dispatch_thread_and_reactor()
+    test_invalid_config()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
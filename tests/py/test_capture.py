@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Capture recording and replay tests for the Python SDK.
+
+Covers ``struct_frame_sdk.capture``:
+
+  - RecordingTransport records rx chunks and tx sends while the SDK keeps
+    receiving normally; the capture holds the link bytes unchanged
+  - the sidecar index lists every frame; seek by msg_id lands exactly on the
+    frame's first byte even when the frame spans records
+  - CaptureIndex.build() on an existing capture matches the recorder's index
+  - ReplayTransport feeds a capture into an SDK from any seek position, and
+    replay timing follows the recorded timestamps at 1x and scaled speed
+  - truncated records and stale indexes are handled
+  - a failed writer thread stops write(), and RecordingTransport reports it
+    once and keeps the link running
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.async_transport import BaseAsyncTransport
+from struct_frame_sdk.capture import (
+    RX,
+    TX,
+    AsyncRecordingTransport,
+    CaptureIndex,
+    CaptureReader,
+    CaptureReplay,
+    CaptureWriter,
+    RecordingTransport,
+    ReplayTransport,
+    index_path,
+)
+from struct_frame_sdk.transport import BaseTransport
+
+from frame_profiles import AccumulatingReader, PROFILE_STANDARD_CONFIG, encode_message
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    SerializationTestMessage,
+    TruncationTestNonVariable,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+class LoopbackTransport(BaseTransport):
+    """Delivers inject()ed bytes to the SDK as views, like the socket transports."""
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data_view(memoryview(bytearray(data)))
+
+
+class AsyncLoopbackTransport(BaseAsyncTransport):
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data(data)
+
+
+MESSAGE_TYPES = [BasicTypesMessage, SerializationTestMessage, TruncationTestNonVariable]
+
+
+def traffic(count: int = 60):
+    """(stream, [msg_id per frame]) cycling through MESSAGE_TYPES."""
+    frames, ids = [], []
+    for i in range(count):
+        cls = MESSAGE_TYPES[i % len(MESSAGE_TYPES)]
+        frames.append(encode_message(PROFILE_STANDARD_CONFIG, cls(), seq=i & 0xFF))
+        ids.append(cls.MSG_ID)
+    return b''.join(frames), ids
+
+
+def make_sdk(transport):
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    received = []
+    for cls in MESSAGE_TYPES:
+        sdk.subscribe(cls.MSG_ID, lambda _m, msg_id: received.append(msg_id))
+    return sdk, received
+
+
+def record(path: str, stream: bytes, chunk: int = 37):
+    """Record *stream* through a RecordingTransport in odd-sized chunks."""
+    inner = LoopbackTransport()
+    transport = RecordingTransport(inner, path, profile=PROFILE_STANDARD_CONFIG,
+                                   get_message_info=get_message_info)
+    sdk, received = make_sdk(transport)
+    sdk.connect()
+    for offset in range(0, len(stream), chunk):
+        inner.inject(stream[offset:offset + chunk])
+    sdk.send(BasicTypesMessage())
+    sdk.disconnect()
+    return received
+
+
+def frame_at(path: str, position) -> int:
+    """msg_id of the frame starting at *position*."""
+    with CaptureReplay(path) as replay:
+        data = bytearray()
+        replay.play(data.extend, speed=None, start=position)
+    reader = AccumulatingReader(PROFILE_STANDARD_CONFIG, get_message_info=get_message_info)
+    reader.add_data(bytes(data))
+    result = reader.next()
+    return result.msg_id if result.valid and reader.offset == result.frame_size else -1
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_record(tmp: str):
+    """Recording is transparent and stores the link bytes exactly."""
+    stream, ids = traffic()
+    path = os.path.join(tmp, 'link.sfcap')
+    received = record(path, stream)
+    run_test("record: SDK still receives every frame", received == ids)
+
+    with CaptureReader(path) as reader:
+        records = [(t, d, bytes(data)) for t, d, _off, data in reader.records()]
+        profile_name = reader.profile_name
+    rx = b''.join(data for _t, d, data in records if d == RX)
+    tx = [data for _t, d, data in records if d == TX]
+    run_test("record: rx records concatenate to the link stream", rx == stream)
+    run_test("record: tx send recorded", tx == [encode_message(PROFILE_STANDARD_CONFIG, BasicTypesMessage())])
+    run_test("record: timestamps are monotonic", all(a[0] <= b[0] for a, b in zip(records, records[1:])))
+    run_test("record: profile name stored", profile_name == 'ProfileStandard')
+
+
+def test_index_and_seek(tmp: str):
+    """The sidecar index finds frames by msg_id and records by time."""
+    stream, ids = traffic()
+    path = os.path.join(tmp, 'seek.sfcap')
+    record(path, stream)
+    index = CaptureIndex.load(index_path(path), path)
+    run_test("index: every rx frame indexed", list(index.frame_id) == ids)
+    run_test("index: per-msg_id counts", all(index.count(cls.MSG_ID) == 20 for cls in MESSAGE_TYPES))
+
+    ok = True
+    for cls in MESSAGE_TYPES:
+        pos = index.seek_msg_id(cls.MSG_ID)
+        ok = ok and pos is not None and frame_at(path, pos) == cls.MSG_ID
+    run_test("index: seek_msg_id lands on the frame's first byte", ok)
+
+    spanning = [k for k, size in enumerate(index.frame_size)
+                if index.position_of(index.frame_pos[k]).skip + size > 37]
+    pos = index.position_of(index.frame_pos[spanning[0]])
+    run_test("index: frames spanning records replay from their start",
+             bool(spanning) and frame_at(path, pos) == ids[spanning[0]])
+
+    last_t = index.frame_t[-1]
+    run_test("index: seek past the last frame returns None",
+             index.seek_msg_id(BasicTypesMessage.MSG_ID, after_ns=last_t + 1) is None)
+    t_mid = index.rec_t[len(index.rec_t) // 2]
+    run_test("index: seek_time finds the first record at that time",
+             index.rec_t[index.seek_time(t_mid).record] == t_mid
+             and index.seek_time(t_mid).record == list(index.rec_t).index(t_mid))
+
+    built = CaptureIndex.build(path, PROFILE_STANDARD_CONFIG, get_message_info, save=False)
+    run_test("index: build() matches the recorder's index",
+             built.frame_pos == index.frame_pos and built.rec_offset == index.rec_offset)
+
+
+def test_replay_transport(tmp: str):
+    """ReplayTransport feeds the SDK at max speed, from the start or a seek point."""
+    stream, ids = traffic()
+    path = os.path.join(tmp, 'replay.sfcap')
+    record(path, stream)
+
+    transport = ReplayTransport(path, speed=None)
+    sdk, received = make_sdk(transport)
+    sdk.connect()
+    finished = transport.wait(5)
+    run_test("replay: all frames delivered in order", finished and received == ids)
+    run_test("replay: transport closes at end of capture", not transport.is_connected())
+    sdk.disconnect()
+
+    index = CaptureIndex.load(index_path(path))
+    after = index.frame_t[30]
+    with CaptureReplay(path) as replay:
+        start = replay.seek_msg_id(TruncationTestNonVariable.MSG_ID, after_ns=after)
+    transport = ReplayTransport(path, speed=None, start=start)
+    sdk, received = make_sdk(transport)
+    sdk.connect()
+    transport.wait(5)
+    sdk.disconnect()
+    first = next(k for k, msg_id in enumerate(ids)
+                 if msg_id == TruncationTestNonVariable.MSG_ID and index.frame_t[k] >= after)
+    run_test("replay: seek_msg_id start replays from that frame", received == ids[first:])
+
+
+def test_replay_timing(tmp: str):
+    """Original-speed replay follows timestamps; scaled and max speed are faster."""
+    path = os.path.join(tmp, 'timed.sfcap')
+    frame = encode_message(PROFILE_STANDARD_CONFIG, BasicTypesMessage())
+    with CaptureWriter(path) as writer:
+        for i in range(5):
+            writer.write(frame, RX, t_ns=i * 50_000_000)
+
+    def timed(speed):
+        with CaptureReplay(path) as replay:
+            t0 = time.perf_counter()
+            delivered = replay.play(lambda view: None, speed=speed)
+            return time.perf_counter() - t0, delivered
+
+    original, delivered = timed(1.0)
+    scaled, _ = timed(4.0)
+    fastest, _ = timed(None)
+    run_test("timing: every record delivered", delivered == 5 * len(frame))
+    run_test("timing: 1x replay spans the recorded 200 ms", 0.19 <= original < 0.6)
+    run_test("timing: 4x replay is about four times faster", 0.045 <= scaled < 0.15)
+    run_test("timing: max speed does not sleep", fastest < 0.04)
+
+    with CaptureReplay(path) as replay:
+        stop = threading.Event()
+        threading.Timer(0.05, stop.set).start()
+        t0 = time.perf_counter()
+        replay.play(lambda view: None, speed=1.0, stop=stop)
+        run_test("timing: stop event aborts a paced replay", time.perf_counter() - t0 < 0.15)
+
+    with CaptureReplay(path) as replay:
+        start = replay.seek_time(100_000_000)
+        got = []
+        replay.play(lambda view: got.append(1), speed=None, start=start)
+        run_test("timing: seek_time without an index", start.record == 2 and len(got) == 3)
+
+
+def test_truncated_and_stale(tmp: str):
+    """A truncated tail record is ignored; an index for another size is rejected."""
+    stream, _ids = traffic(12)
+    path = os.path.join(tmp, 'cut.sfcap')
+    record(path, stream)
+    with open(path, 'ab') as f:
+        f.write(b'\x00' * 20)  # record header claiming 0 bytes plus partial garbage
+    try:
+        CaptureIndex.load(index_path(path), path)
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("stale: index for a different capture size rejected", rejected)
+
+    with open(path, 'ab') as f:
+        f.write(b'\x01\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00')  # claims 255 bytes
+    with CaptureReader(path) as reader:
+        rx = b''.join(bytes(data) for _t, d, _o, data in reader.records() if d == RX)
+    run_test("truncated: complete records still read", rx.startswith(stream))
+
+
+def test_async_recording(tmp: str):
+    """AsyncRecordingTransport records rx and tx around an async transport."""
+    path = os.path.join(tmp, 'async.sfcap')
+    frame = encode_message(PROFILE_STANDARD_CONFIG, BasicTypesMessage())
+
+    async def scenario():
+        inner = AsyncLoopbackTransport()
+        transport = AsyncRecordingTransport(inner, path)
+        seen = []
+        transport.set_data_callback(seen.append)
+        await transport.connect()
+        inner.inject(frame)
+        await transport.send(b'\x01\x02')
+        await transport.disconnect()
+        return seen
+
+    seen = asyncio.run(scenario())
+    with CaptureReader(path) as reader:
+        records = [(d, bytes(data)) for _t, d, _o, data in reader.records()]
+    run_test("async: data forwarded and recorded",
+             seen == [frame] and records == [(RX, frame), (TX, b'\x01\x02')])
+    run_test("async: no index without a profile", not os.path.exists(index_path(path)))
+
+
+def test_writer_failure(tmp: str):
+    """A failed writer thread is surfaced by write() and by the transport."""
+    def broken_info(_msg_id):
+        raise OSError("indexer failed")
+
+    def wait_failed(writer):
+        deadline = time.monotonic() + 2.0
+        while writer._error is None and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    frame = encode_message(PROFILE_STANDARD_CONFIG, BasicTypesMessage())
+    writer = CaptureWriter(os.path.join(tmp, 'failed.sfcap'), PROFILE_STANDARD_CONFIG, broken_info)
+    writer.write(frame)
+    wait_failed(writer)
+    try:
+        writer.write(frame)
+        raised = None
+    except RuntimeError as e:
+        raised = e
+    run_test("failure: write() raises once the writer thread failed",
+             raised is not None and isinstance(raised.__cause__, OSError))
+    try:
+        writer.close()
+        closed_error = None
+    except OSError as e:
+        closed_error = e
+    run_test("failure: close() raises the writer's error", closed_error is not None)
+
+    inner = LoopbackTransport()
+    transport = RecordingTransport(inner, os.path.join(tmp, 'failed_link.sfcap'),
+                                   profile=PROFILE_STANDARD_CONFIG, get_message_info=broken_info)
+    errors, seen = [], []
+    transport.set_error_callback(errors.append)
+    transport.set_data_view_callback(lambda view: seen.append(bytes(view)))
+    transport.connect()
+    inner.inject(frame)
+    wait_failed(transport.writer)
+    for _ in range(5):
+        inner.inject(frame)
+    transport.send(frame)
+    transport.disconnect()
+    run_test("failure: link keeps delivering data", seen == [frame] * 6)
+    run_test("failure: error reported once through the error callback",
+             len(errors) == 1 and isinstance(errors[0], RuntimeError))
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("CAPTURE / REPLAY TESTS - Python")
+    print("========================================")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_record(tmp)
+        test_index_and_seek(tmp)
+        test_replay_transport(tmp)
+        test_replay_timing(tmp)
+        test_truncated_and_stale(tmp)
+        test_async_recording(tmp)
+        test_writer_failure(tmp)
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Parallel capture analysis tests for the Python boilerplate.
+
+Covers ``frame_analysis``:
+
+  - split points are real frame starts; a valid frame embedded in a payload
+    is not taken as a split once a second back-to-back frame is required
+  - sharded analysis (inline and in a ProcessPoolExecutor) finds exactly the
+    frames a sequential BufferReader finds, in file order
+  - per-msg_id columns carry header fields and decoded message fields, and
+    convert to typed arrays
+  - resync over a memoryview (as analyze_shard passes) finds the same frames
+    as over bytes without copying the rest of the buffer
+"""
+
+import mmap
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from frame_analysis import analyze_capture, find_split_points, find_sync
+from frame_profiles import BufferReader, PROFILE_NETWORK_CONFIG, PROFILE_SENSOR_CONFIG, encode_message
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    SerializationTestMessage,
+    get_message_info,
+)
+
+MESSAGES = 'struct_frame.generated.serialization_test'
+PROFILE = PROFILE_NETWORK_CONFIG
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+def basic(i: int, description: bytes = b'') -> bytes:
+    msg = BasicTypesMessage(regular_int=i, double_precision=i / 4, description=description)
+    return encode_message(PROFILE, msg, seq=i & 0xFF, sys_id=1, comp_id=i % 3)
+
+
+def serial(i: int) -> bytes:
+    return encode_message(PROFILE, SerializationTestMessage(magic_number=i, test_float=1.5),
+                          seq=i & 0xFF, sys_id=2)
+
+
+def build_capture(count: int = 600) -> bytes:
+    """Mixed frames, one corrupted, some garbage, some payloads hiding a valid frame."""
+    frames = []
+    for i in range(count):
+        if i % 50 == 7:
+            frames.append(basic(i, description=serial(9999)))  # decoy frame inside a payload
+        else:
+            frames.append(basic(i) if i % 3 else serial(i))
+    bad = bytearray(frames[100])
+    bad[-1] ^= 0xFF
+    frames[100] = bytes(bad)
+    frames.insert(300, b'\x00\x90\x13\x37')
+    return b''.join(frames)
+
+
+def sequential(data, base: int = 0):
+    reader = BufferReader(PROFILE, data, get_message_info)
+    out = []
+    while (result := reader.try_next()) is not None:
+        if result.valid:
+            out.append((base + reader.offset - result.frame_size, result.msg_id))
+    return out
+
+
+def noisy_capture(count: int = 400) -> bytes:
+    """Frames separated by random garbage, start bytes included."""
+    rnd = random.Random(7)
+    parts = []
+    for i in range(count):
+        parts.append(bytes(rnd.randrange(256) for _ in range(rnd.randrange(1, 30))))
+        parts.append(basic(i))
+    return b''.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_split_points(data: bytes, reference):
+    """Split points land on real frame starts."""
+    starts = {offset for offset, _ in reference}
+    bounds = find_split_points(data, PROFILE, 16, get_message_info)
+    run_test("split: boundaries are frame starts",
+             len(bounds) > 8 and all(b in starts for b in bounds[1:-1]))
+    run_test("split: boundaries cover the whole file",
+             bounds[0] == 0 and bounds[-1] == len(data) and bounds == sorted(set(bounds)))
+
+    decoy = basic(7, description=serial(9999))
+    stream = decoy + basic(8)
+    inner = stream.index(serial(9999))
+    run_test("split: single-frame check accepts a frame hidden in a payload",
+             find_sync(stream, 1, len(stream), PROFILE, get_message_info, confirm=1) == inner)
+    run_test("split: two back-to-back frames reject it",
+             find_sync(stream, 1, len(stream), PROFILE, get_message_info, confirm=2) == len(decoy))
+
+    run_test("split: profiles without CRC are one shard",
+             find_split_points(data, PROFILE_SENSOR_CONFIG, 8) == [0, len(data)])
+
+
+def test_inline_analysis(path: str, reference):
+    """Inline sharded analysis matches the sequential reader and decodes fields."""
+    result = analyze_capture(path, PROFILE, messages=MESSAGES, workers=1, shards=12)
+    offsets = sorted((o, msg_id) for msg_id in result.msg_ids() for o in result.columns[msg_id]['offset'])
+    run_test("inline: same frames as a sequential BufferReader", offsets == reference)
+    run_test("inline: several shards used", len(result.shards) > 6)
+    run_test("inline: CRC failure counted once", result.crc_failures == 1)
+
+    basic_cols = result.columns[BasicTypesMessage.MSG_ID]
+    ids = list(basic_cols['regular_int'])
+    run_test("inline: decoded field column in file order", ids == sorted(ids) and 1 in ids and 599 in ids)
+    run_test("inline: header columns present",
+             list(basic_cols['sequence'][:2]) == [1, 2] and set(basic_cols['system_id']) == {1})
+
+    typed = result.to_arrays(BasicTypesMessage.MSG_ID)
+    run_test("inline: typed arrays for numeric columns",
+             isinstance(typed['regular_int'], array) and typed['regular_int'].typecode == 'q'
+             and typed['double_precision'].typecode == 'd' and isinstance(typed['description'], list))
+    pydict = result.to_pydict(SerializationTestMessage.MSG_ID)
+    run_test("inline: Parquet-ready dict of equal-length lists",
+             len({len(v) for v in pydict.values()}) == 1 and pydict['test_float'][0] == 1.5)
+
+    headers = analyze_capture(path, PROFILE, messages=MESSAGES, workers=1, shards=4, decode=False)
+    run_test("inline: header-only analysis skips payload decode",
+             set(headers.columns[BasicTypesMessage.MSG_ID]) == {'offset', 'size', 'sequence', 'system_id',
+                                                                 'component_id'})
+
+
+def test_process_pool(path: str, reference):
+    """Shards decoded in worker processes merge to the same result."""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        result = analyze_capture(path, PROFILE, messages=MESSAGES, shards=6, executor=pool)
+    offsets = sorted((o, msg_id) for msg_id in result.msg_ids() for o in result.columns[msg_id]['offset'])
+    run_test("pool: same frames as a sequential BufferReader", offsets == reference)
+    run_test("pool: decoded values survive the round trip",
+             list(result.columns[SerializationTestMessage.MSG_ID]['magic_number'][:3]) == [0, 3, 6])
+
+
+def test_resync_on_views(tmp: str):
+    """Garbage between frames is skipped in place on memoryview input."""
+    data = noisy_capture()
+    reference = sequential(data)
+    path = os.path.join(tmp, 'noisy.bin')
+    with open(path, 'wb') as f:
+        f.write(data)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)[5:]
+        run_test("resync: mmap slice finds the same frames as bytes",
+                 sequential(view, base=5) == sequential(data[5:], base=5))
+        reader = BufferReader(PROFILE, view, get_message_info)
+        tracemalloc.start()
+        while reader.try_next() is not None:
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del reader
+        view.release()
+    run_test("resync: noisy input fully recovered", len(reference) == 400)
+    run_test("resync: the rest of the buffer is not copied", peak < len(data) // 8)
+
+    result = analyze_capture(path, PROFILE, messages=MESSAGES, workers=1, shards=4, decode=False)
+    offsets = sorted((o, msg_id) for msg_id in result.msg_ids() for o in result.columns[msg_id]['offset'])
+    run_test("resync: sharded analysis of noisy input matches", offsets == reference)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("FRAME ANALYSIS TESTS - Python")
+    print("========================================")
+    print()
+
+    data = build_capture()
+    reference = sequential(data)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'capture.bin')
+        with open(path, 'wb') as f:
+            f.write(data)
+        test_split_points(data, reference)
+        test_inline_analysis(path, reference)
+        test_process_pool(path, reference)
+        test_resync_on_views(tmp)
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Frame profiler tests for the Python boilerplate.
+
+Covers ``frame_profiler``:
+
+  - an instrumented AccumulatingReader returns exactly what the plain reader
+    returns (buffer and stream mode, every profile, with corruption and
+    garbage), while recording header/checksum/copy/message_info/resync time
+  - profiled_encode() produces the same bytes as encode_message()
+  - sampling times only every Nth parse but still counts all of them
+  - uninstrument() restores the plain class
+  - the command line prints a breakdown for a capture file
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+_generated_dir = os.path.join(os.path.dirname(__file__), '..', 'generated', 'py')
+sys.path.insert(0, _generated_dir)
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from frame_profiles import (
+    AccumulatingReader,
+    PROFILE_BULK_CONFIG,
+    PROFILE_NETWORK_CONFIG,
+    PROFILE_SENSOR_CONFIG,
+    PROFILE_STANDARD_CONFIG,
+    encode_message,
+)
+from frame_profiler import (
+    FrameProfiler,
+    InstrumentedAccumulatingReader,
+    instrument,
+    main,
+    profiled_encode,
+    uninstrument,
+)
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+PROFILES = [PROFILE_STANDARD_CONFIG, PROFILE_SENSOR_CONFIG, PROFILE_BULK_CONFIG, PROFILE_NETWORK_CONFIG]
+
+
+def message(value: int) -> BasicTypesMessage:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    return msg
+
+
+def capture(profile, count: int = 40) -> bytes:
+    """Frames with one corrupted CRC and a run of garbage in the middle."""
+    frames = [encode_message(profile, message(i), seq=i) for i in range(count)]
+    if profile.has_crc:
+        bad = bytearray(frames[count // 3])
+        bad[-1] ^= 0xFF
+        frames[count // 3] = bytes(bad)
+    frames.insert(count // 2, b'\x00\x11\x22\x33')
+    return b''.join(frames)
+
+
+def outcomes(reader, data: bytes, stream: bool, chunk: int = 61):
+    out = []
+    if stream:
+        for byte in data:
+            r = reader.push_byte(byte)
+            if r.valid or r.frame_size:
+                out.append((r.status, r.valid, r.msg_id, bytes(r.msg_data), r.sequence, r.frame_size))
+        return out
+    for offset in range(0, len(data), chunk):
+        reader.add_data(data[offset:offset + chunk])
+        while (r := reader.try_next()) is not None:
+            out.append((r.status, r.valid, r.msg_id, bytes(r.msg_data), r.sequence, r.frame_size))
+    return out
+
+
+def make_reader(profile):
+    return AccumulatingReader(profile, get_message_info=get_message_info, buffer_size=512)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_instrumented_reader_matches_plain():
+    """Instrumented parsing is result-for-result identical to the plain reader."""
+    for profile in PROFILES:
+        data = capture(profile)
+        if profile is PROFILE_SENSOR_CONFIG:
+            # No sync on the tiny header profile; garbage would derail both readers alike.
+            data = b''.join(encode_message(profile, message(i)) for i in range(40))
+        for stream in (False, True):
+            plain = make_reader(profile)
+            timed = make_reader(profile)
+            instrument(timed)
+            same = outcomes(plain, data, stream) == outcomes(timed, data, stream)
+            same = same and plain.diagnostics == timed.diagnostics
+            mode = 'stream' if stream else 'buffer'
+            run_test(f"reader: {profile.name} {mode} mode matches plain reader", same)
+
+
+def test_phases_recorded():
+    """Header, checksum, copy, message_info and resync phases all get samples."""
+    reader = make_reader(PROFILE_STANDARD_CONFIG)
+    profiler = instrument(reader)
+    outcomes(reader, capture(PROFILE_STANDARD_CONFIG), stream=False)
+    phases = profiler.summary()['phases']
+    run_test("phases: header/checksum/payload_copy timed",
+             all(phases[p]['samples'] > 0 for p in ('header', 'checksum', 'payload_copy')))
+    run_test("phases: get_message_info calls counted and timed",
+             profiler.message_info_calls > 0 and phases['message_info']['samples'] > 0)
+    run_test("phases: resync scan timed and bytes counted",
+             phases['resync']['samples'] > 0 and profiler.resync_bytes >= 4)
+    run_test("phases: report lists every timed phase",
+             all(p in profiler.report() for p in ('header', 'checksum', 'payload_copy', 'resync')))
+
+
+def test_profiled_encode_matches():
+    """profiled_encode() returns the exact encode_message() bytes."""
+    profiler = FrameProfiler()
+    same = all(profiled_encode(profiler, profile, message(7), seq=3, sys_id=1, comp_id=2)
+               == encode_message(profile, message(7), 3, 1, 2) for profile in PROFILES)
+    run_test("encode: identical bytes for every profile", same)
+    run_test("encode: serialize/header/checksum timed",
+             profiler.phases['serialize'].count == len(PROFILES)
+             and profiler.phases['encode_checksum'].count == 3)
+
+
+def test_sampling():
+    """Only every Nth parse is timed, but every parse is counted."""
+    reader = make_reader(PROFILE_STANDARD_CONFIG)
+    profiler = instrument(reader, FrameProfiler(sample_rate=0.1))
+    data = b''.join(encode_message(PROFILE_STANDARD_CONFIG, message(i)) for i in range(100))
+    reader.add_data(data)
+    while reader.try_next() is not None:
+        pass
+    run_test("sampling: every parse counted", profiler.parses >= 100)
+    run_test("sampling: about a tenth timed",
+             profiler.parses_sampled == (profiler.parses + 9) // 10
+             and profiler.phases['header'].count == profiler.parses_sampled)
+    est = profiler.estimated_ns('checksum')
+    run_test("sampling: estimate scales up sampled time",
+             est >= profiler.phases['checksum'].total_ns * 9)
+
+    try:
+        FrameProfiler(sample_rate=0)
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("sampling: rate outside (0, 1] rejected", rejected)
+
+
+def test_uninstrument():
+    """uninstrument() puts the plain class and callback back."""
+    reader = make_reader(PROFILE_STANDARD_CONFIG)
+    instrument(reader)
+    swapped = type(reader) is InstrumentedAccumulatingReader
+    uninstrument(reader)
+    run_test("toggle: class swapped in and out",
+             swapped and type(reader) is AccumulatingReader
+             and reader._get_message_info is get_message_info)
+
+    class Custom(AccumulatingReader):
+        pass
+    try:
+        instrument(Custom(PROFILE_STANDARD_CONFIG))
+        rejected = False
+    except TypeError:
+        rejected = True
+    run_test("toggle: subclasses are rejected", rejected)
+
+
+def test_cli():
+    """The CLI prints a per-phase breakdown for a capture file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'capture.bin')
+        with open(path, 'wb') as f:
+            f.write(capture(PROFILE_NETWORK_CONFIG, 200))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = main([path, '--profile', 'network', '--sample-rate', '0.5',
+                         '--messages', 'struct_frame.generated.serialization_test',
+                         '--path', _generated_dir])
+    text = out.getvalue()
+    run_test("cli: exit code 0", code == 0)
+    run_test("cli: frame totals printed", "199 valid, 1 CRC failures" in text)
+    run_test("cli: phase table printed",
+             all(p in text for p in ('header', 'checksum', 'payload_copy', 'other (bookkeeping)')))
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main_tests():
+    print()
+    print("========================================")
+    print("FRAME PROFILER TESTS - Python")
+    print("========================================")
+    print()
+
+    test_instrumented_reader_matches_plain()
+    test_phases_recorded()
+    test_profiled_encode_matches()
+    test_sampling()
+    test_uninstrument()
+    test_cli()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_tests())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""MultiProfileReader tests for the Python boilerplate.
+
+Feeds streams that interleave ProfileStandard, ProfileBulk, ProfileNetwork
+and ProfileSensor frames through one ``MultiProfileReader``:
+
+  - every frame is parsed in order with the right profile, whatever the
+    chunking (byte-at-a-time, odd sizes, whole stream)
+  - CRC failures and resyncs are attributed to the right profile; bytes that
+    match no start pattern are counted separately
+  - ambiguous or undetectable profile sets are rejected up front
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from frame_profiles import (
+    BufferWriter,
+    MultiProfileReader,
+    PROFILE_BULK_CONFIG,
+    PROFILE_IPC_CONFIG,
+    PROFILE_NETWORK_CONFIG,
+    PROFILE_SENSOR_CONFIG,
+    PROFILE_STANDARD_CONFIG,
+)
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+MIXED = [PROFILE_STANDARD_CONFIG, PROFILE_BULK_CONFIG, PROFILE_NETWORK_CONFIG, PROFILE_SENSOR_CONFIG]
+
+
+def encode(profile, value: int, seq: int = 0) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(profile, capacity=512)
+    writer.write(msg, seq=seq)
+    return bytes(writer.data())
+
+
+def mixed_stream(count: int):
+    """Frames cycling through MIXED; returns (stream, [(profile name, value)])."""
+    frames, expected = [], []
+    for i in range(count):
+        profile = MIXED[i % len(MIXED)]
+        frames.append(encode(profile, i, seq=i // len(MIXED)))
+        expected.append((profile.name, i))
+    return b''.join(frames), expected
+
+
+def drain(reader, stream: bytes, chunk: int):
+    out = []
+    for offset in range(0, len(stream), chunk):
+        reader.add_data(stream[offset:offset + chunk])
+        while (result := reader.try_next()) is not None:
+            if result.valid:
+                out.append((reader.last_profile.name,
+                            BasicTypesMessage.deserialize(result.msg_data).regular_int))
+    return out
+
+
+def make_reader(profiles=MIXED):
+    return MultiProfileReader(profiles, get_message_info=get_message_info, buffer_size=1024)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_mixed_stream_any_chunking():
+    """All frames come out in order with their profile, for any chunk size."""
+    stream, expected = mixed_stream(80)
+    for chunk in (1, 7, 300, len(stream)):
+        reader = make_reader()
+        run_test(f"mixed: chunk={chunk} parses every frame with its profile",
+                 drain(reader, stream, chunk) == expected)
+    run_test("mixed: frame counts per profile",
+             reader.frame_counts == {p.name: 20 for p in MIXED})
+    run_test("mixed: no partial left over", not reader.has_partial())
+    run_test("mixed: per-profile sequence tracking sees no gaps",
+             all(d.cnt_seq_gaps == 0 for d in reader.diagnostics.values()))
+
+
+def test_lookup_table():
+    """The start-byte table maps two-byte patterns to profiles."""
+    reader = make_reader()
+    run_test("table: 0x90 0x71 -> ProfileStandard", reader.profile_for(0x90, 0x71) is PROFILE_STANDARD_CONFIG)
+    run_test("table: 0x90 0x74 -> ProfileBulk", reader.profile_for(0x90, 0x74) is PROFILE_BULK_CONFIG)
+    run_test("table: tiny header matches any second byte",
+             reader.profile_for(PROFILE_SENSOR_CONFIG.computed_start_byte1(), 0x42) is PROFILE_SENSOR_CONFIG)
+    run_test("table: unknown pattern -> None", reader.profile_for(0x90, 0x00) is None)
+
+
+def test_per_profile_diagnostics():
+    """CRC failures are charged to their profile, noise to the stream."""
+    bad_bulk = bytearray(encode(PROFILE_BULK_CONFIG, 2))
+    bad_bulk[-1] ^= 0xFF
+    stream = (encode(PROFILE_STANDARD_CONFIG, 1) + bytes(bad_bulk) + b'\x00\x13\x37'
+              + encode(PROFILE_NETWORK_CONFIG, 3) + encode(PROFILE_BULK_CONFIG, 4))
+    reader = make_reader([PROFILE_STANDARD_CONFIG, PROFILE_BULK_CONFIG, PROFILE_NETWORK_CONFIG])
+    out = drain(reader, stream, 5)
+    diag = reader.diagnostics
+    run_test("diag: good frames around the bad ones survive",
+             [v for _, v in out] == [1, 3, 4])
+    run_test("diag: CRC failure attributed to ProfileBulk",
+             diag['ProfileBulk'].cnt_crc_failures == 1
+             and diag['ProfileStandard'].cnt_crc_failures == 0
+             and diag['ProfileNetwork'].cnt_crc_failures == 0)
+    run_test("diag: unmatched bytes counted on the stream",
+             reader.stream_diagnostics.cnt_failed_bytes == 3)
+    reader.reset_diagnostics()
+    run_test("diag: reset clears counters",
+             reader.diagnostics['ProfileBulk'].cnt_crc_failures == 0 and sum(reader.frame_counts.values()) == 0)
+
+
+def test_rejects_ambiguous_profiles():
+    """Profiles that cannot be told apart by start bytes are rejected."""
+    for name, profiles in (("no start bytes", [PROFILE_STANDARD_CONFIG, PROFILE_IPC_CONFIG]),
+                           ("duplicate pattern", [PROFILE_BULK_CONFIG, PROFILE_BULK_CONFIG])):
+        try:
+            make_reader(profiles)
+            rejected = False
+        except ValueError:
+            rejected = True
+        run_test(f"config: {name} rejected", rejected)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("MULTI-PROFILE READER TESTS - Python")
+    print("========================================")
+    print()
+
+    test_mixed_stream_any_chunking()
+    test_lookup_table()
+    test_per_profile_diagnostics()
+    test_rejects_ambiguous_profiles()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ Tests error handling for:
 
 import sys
 import os
+import tracemalloc
 
 # Add paths
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
@@ -858,6 +859,32 @@ def test_buffer_mode_recovers_after_crc_failure():
     return result2.valid
 
 
+def test_buffer_mode_garbage_prefix_in_place():
+    """Buffer mode skips a long run of false start bytes without copying the buffer.
+    Each false start used to copy the rest of the buffer to search it."""
+    msg = _make_test_msg()
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG, capacity=1024)
+    writer.write(msg)
+    frame = bytes(writer.data()[:writer.size()])
+    garbage = bytes([PROFILE_STANDARD_CONFIG.computed_start_byte1(), 0x00]) * 32768
+
+    for data in (garbage + frame, memoryview(bytearray(garbage + frame))):
+        reader = AccumulatingReader(PROFILE_STANDARD_CONFIG, get_message_info=get_message_info, buffer_size=1024)
+        reader.add_data(data)
+        decoded = False
+        tracemalloc.start()
+        while True:
+            result = _try_next(reader)
+            if result is None:
+                break
+            decoded = decoded or result.valid
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if not decoded or peak >= len(garbage) // 8:
+            return False
+    return True
+
+
 def test_stream_recovers_after_garbage():
     """Stream mode recovers after garbage prefix and decodes a valid frame."""
     reader = AccumulatingReader(PROFILE_STANDARD_CONFIG, get_message_info=get_message_info, buffer_size=1024)
@@ -1078,6 +1105,7 @@ def main():
 
     # Define test matrix
     tests = [
+        ("Buffer mode: garbage prefix resynced in place", test_buffer_mode_garbage_prefix_in_place),
         ("Buffer mode: invalid result carries diagnostics", test_buffer_mode_invalid_result_has_diagnostics),
         ("Buffer mode: recovers after CRC failure", test_buffer_mode_recovers_after_crc_failure),
         ("Buffer reader: skips CRC-failed frame", test_buffer_reader_skips_crc_failure),
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""pcapng export/import tests for the Python SDK.
+
+Covers ``struct_frame_sdk.pcapng``:
+
+  - the file is well-formed pcapng: SHB, one IDB with the user DLT and
+    nanosecond resolution, EPBs with matching leading/trailing lengths
+  - with a profile, every packet holds exactly one frame however the rx
+    stream was chunked; without one, every write is one packet
+  - direction and nanosecond timestamps survive a write/read round trip
+  - RecordingTransport taps a live transport into pcapng transparently
+  - .sfcap captures export to pcapng; classic pcap and big-endian pcapng
+    files are readable
+  - write() raises once the writer thread has failed
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.capture import RX, TX, CaptureWriter, RecordingTransport
+from struct_frame_sdk.pcapng import (
+    BLOCK_EPB,
+    BLOCK_IDB,
+    BLOCK_SHB,
+    LINKTYPE_USER0,
+    PcapngReader,
+    PcapngWriter,
+    export_capture,
+)
+from struct_frame_sdk.transport import BaseTransport
+
+from frame_profiles import PROFILE_STANDARD_CONFIG, encode_message
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    SerializationTestMessage,
+    TruncationTestNonVariable,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+class LoopbackTransport(BaseTransport):
+    """Delivers inject()ed bytes to the SDK as views, like the socket transports."""
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data_view(memoryview(bytearray(data)))
+
+
+MESSAGE_TYPES = [BasicTypesMessage, SerializationTestMessage, TruncationTestNonVariable]
+PROFILE = PROFILE_STANDARD_CONFIG
+
+
+def traffic(count: int = 60):
+    """Frames cycling through MESSAGE_TYPES."""
+    return [encode_message(PROFILE, MESSAGE_TYPES[i % 3](), seq=i & 0xFF) for i in range(count)]
+
+
+def read_all(path: str):
+    with PcapngReader(path) as reader:
+        out = []
+        for p in reader.packets():
+            out.append((p.t_ns, p.interface, p.linktype, p.direction, bytes(p.data)))
+            p.data.release()
+        return reader.format, out
+
+
+def blocks(path: str):
+    """(type, length) of every block, or None if a trailing length disagrees."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    out, offset = [], 0
+    while offset < len(data):
+        block_type, length = struct.unpack_from('<II', data, offset)
+        if length % 4 or struct.unpack_from('<I', data, offset + length - 4)[0] != length:
+            return None
+        out.append((block_type, length))
+        offset += length
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_file_layout(tmp: str):
+    """Blocks are well-formed and the interface uses the user DLT at ns resolution."""
+    path = os.path.join(tmp, 'layout.pcapng')
+    with PcapngWriter(path, interface_name='uart0') as writer:
+        writer.write(b'\x90\x71\x01', RX, t_ns=1)
+    layout = blocks(path)
+    run_test("layout: SHB, IDB, EPB with consistent lengths",
+             layout is not None and [t for t, _ in layout] == [BLOCK_SHB, BLOCK_IDB, BLOCK_EPB])
+    with open(path, 'rb') as f:
+        data = f.read()
+    idb = layout[0][1]
+    run_test("layout: IDB link type is LINKTYPE_USER0",
+             struct.unpack_from('<H', data, idb + 8)[0] == LINKTYPE_USER0)
+    run_test("layout: if_tsresol option is 9 (ns)", b'\x09\x00\x01\x00\x09' in data[idb:idb + layout[1][1]])
+
+
+def test_framing(tmp: str):
+    """With a profile, odd-sized rx chunks come out as one frame per packet."""
+    frames = traffic()
+    stream = b''.join(frames)
+    bad = bytearray(frames[10])
+    bad[-1] ^= 0xFF
+    garbage = b'\x00\x11\x22'
+    stream = b''.join(frames[:10]) + bytes(bad) + garbage + b''.join(frames[11:])
+
+    path = os.path.join(tmp, 'framed.pcapng')
+    with PcapngWriter(path, PROFILE, get_message_info, buffer_size=256) as writer:
+        for offset in range(0, len(stream), 37):
+            writer.write(stream[offset:offset + 37], RX)
+        writer.write(stream[:5], TX)  # a partial frame is written as-is on close
+    _fmt, packets = read_all(path)
+    rx = [data for _t, _i, _l, d, data in packets if d == RX]
+    run_test("framing: valid frames one per packet",
+             rx[:10] == frames[:10] and rx[-len(frames[11:]):] == frames[11:])
+    run_test("framing: CRC failure kept as its own packet", rx[10] == bytes(bad))
+    run_test("framing: resync bytes kept, nothing lost", b''.join(rx) == stream and garbage in rx[11])
+    run_test("framing: trailing partial flushed on close",
+             [data for _t, _i, _l, d, data in packets if d == TX] == [stream[:5]])
+    run_test("framing: writer counts packets", writer.packets == len(packets))
+
+    path = os.path.join(tmp, 'raw.pcapng')
+    with PcapngWriter(path) as writer:
+        writer.write(stream[:37])
+        writer.write(stream[37:80], TX)
+    _fmt, packets = read_all(path)
+    run_test("framing: without a profile one packet per write",
+             [data for *_rest, data in packets] == [stream[:37], stream[37:80]])
+
+
+def test_round_trip(tmp: str):
+    """Directions, nanosecond timestamps and link type are read back."""
+    path = os.path.join(tmp, 'rt.pcapng')
+    t0 = 1_700_000_000_123_456_789
+    with PcapngWriter(path) as writer:
+        writer.write(b'a', RX, t_ns=t0)
+        writer.write(b'bcdef', TX, t_ns=t0 + 1)
+    fmt, packets = read_all(path)
+    run_test("round trip: pcapng format detected", fmt == 'pcapng')
+    run_test("round trip: ns timestamps exact", [p[0] for p in packets] == [t0, t0 + 1])
+    run_test("round trip: directions from epb_flags", [p[3] for p in packets] == [RX, TX])
+    run_test("round trip: link type and data",
+             all(p[2] == LINKTYPE_USER0 for p in packets) and [p[4] for p in packets] == [b'a', b'bcdef'])
+
+
+def test_tap(tmp: str):
+    """RecordingTransport with a PcapngWriter taps a live link."""
+    frames = traffic(30)
+    stream = b''.join(frames)
+    path = os.path.join(tmp, 'tap.pcapng')
+    inner = LoopbackTransport()
+    writer = PcapngWriter(path, PROFILE, get_message_info)
+    transport = RecordingTransport(inner, writer)
+    sdk = StructFrameSdk(StructFrameSdkConfig(transport=transport, profile=PROFILE,
+                                              get_message_info=get_message_info))
+    received = []
+    for cls in MESSAGE_TYPES:
+        sdk.subscribe(cls.MSG_ID, lambda _m, msg_id: received.append(msg_id))
+    sdk.connect()
+    for offset in range(0, len(stream), 50):
+        inner.inject(stream[offset:offset + 50])
+    sdk.send(BasicTypesMessage())
+    sdk.disconnect()
+    writer.close()
+    _fmt, packets = read_all(path)
+    run_test("tap: SDK still receives every frame", len(received) == len(frames))
+    run_test("tap: rx packets are the frames", [p[4] for p in packets if p[3] == RX] == frames)
+    run_test("tap: tx send recorded as outbound",
+             [p[4] for p in packets if p[3] == TX] == [encode_message(PROFILE, BasicTypesMessage())])
+    run_test("tap: timestamps are monotonic", all(a[0] <= b[0] for a, b in zip(packets, packets[1:])))
+
+
+def test_import_formats(tmp: str):
+    """.sfcap export, classic pcap and big-endian pcapng."""
+    frames = traffic(12)
+    sfcap = os.path.join(tmp, 'link.sfcap')
+    with CaptureWriter(sfcap) as writer:
+        writer.write(b''.join(frames[:7]), RX, t_ns=1000)
+        writer.write(b''.join(frames[7:]), RX, t_ns=2000)
+    out = os.path.join(tmp, 'link.pcapng')
+    count = export_capture(sfcap, out, PROFILE, get_message_info)
+    _fmt, packets = read_all(out)
+    run_test("export: one packet per frame", count == 12 and [p[4] for p in packets] == frames)
+    run_test("export: absolute times from the capture start", packets[0][0] > 10 ** 18
+             and packets[7][0] - packets[0][0] == 1000)
+
+    pcap = os.path.join(tmp, 'classic.pcap')
+    with open(pcap, 'wb') as f:
+        f.write(struct.pack('<IHHIIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, LINKTYPE_USER0))
+        for i, frame in enumerate(frames[:3]):
+            f.write(struct.pack('<IIII', 100 + i, 250, len(frame), len(frame)) + frame)
+    fmt, packets = read_all(pcap)
+    run_test("import: classic pcap read",
+             fmt == 'pcap' and [p[4] for p in packets] == frames[:3] and packets[1][0] == 101_000_250_000)
+
+    be = os.path.join(tmp, 'be.pcapng')
+    payload = frames[0] + b'\0' * (-len(frames[0]) % 4)
+    with open(be, 'wb') as f:
+        f.write(struct.pack('>IIIHHqI', BLOCK_SHB, 28, 0x1A2B3C4D, 1, 0, -1, 28))
+        f.write(struct.pack('>IIHHII', BLOCK_IDB, 20, LINKTYPE_USER0, 0, 0, 20))
+        length = 32 + len(payload)
+        f.write(struct.pack('>IIIIIII', BLOCK_EPB, length, 0, 0, 5, len(frames[0]), len(frames[0]))
+                + payload + struct.pack('>I', length))
+    fmt, packets = read_all(be)
+    run_test("import: big-endian pcapng with default us resolution",
+             packets == [(5000, 0, LINKTYPE_USER0, RX, frames[0])])
+
+    bogus = os.path.join(tmp, 'bogus.bin')
+    with open(bogus, 'wb') as f:
+        f.write(b'not a capture')
+    try:
+        PcapngReader(bogus)
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("import: other files rejected", rejected)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def test_writer_failure(tmp: str):
+    """A failed writer thread stops write() instead of queueing forever."""
+    def broken_info(_msg_id):
+        raise OSError("framer failed")
+
+    frame = encode_message(PROFILE_STANDARD_CONFIG, BasicTypesMessage())
+    writer = PcapngWriter(os.path.join(tmp, 'failed.pcapng'), PROFILE_STANDARD_CONFIG, broken_info)
+    writer.write(frame)
+    deadline = time.monotonic() + 2.0
+    while writer._error is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+    try:
+        writer.write(frame)
+        raised = None
+    except RuntimeError as e:
+        raised = e
+    run_test("failure: write() raises once the writer thread failed",
+             raised is not None and isinstance(raised.__cause__, OSError))
+    try:
+        writer.close()
+        closed_error = None
+    except OSError as e:
+        closed_error = e
+    run_test("failure: close() raises the writer's error", closed_error is not None)
+
+
+def main():
+    print()
+    print("========================================")
+    print("PCAPNG TESTS - Python")
+    print("========================================")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_file_layout(tmp)
+        test_framing(tmp)
+        test_round_trip(tmp)
+        test_tap(tmp)
+        test_import_formats(tmp)
+        test_writer_failure(tmp)
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
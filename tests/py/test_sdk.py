@@ -22,6 +22,7 @@ _sdk_dir = os.path.join(
 sys.path.insert(0, _sdk_dir)
 
 from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.subscription import SubscriptionMode, LazyMessage
 from struct_frame_sdk.transport import ITransport
 
 from frame_profiles import (
@@ -330,6 +331,60 @@ def test_throwing_handler_does_not_stop_siblings():
     run_test("handler isolation: sibling handler still fires", sibling_fired[0] is True)
 
 
+def test_subscription_modes_decode_once():
+    """RAW/LAZY/DECODED subscribers share one decode per frame."""
+    transport = MockTransport()
+    sdk = make_sdk(transport)
+    calls = [0]
+
+    class _CountingCodec:
+        msg_id = BasicTypesMessage.MSG_ID
+
+        def deserialize(self, data: bytes):
+            calls[0] += 1
+            return BasicTypesMessage.deserialize(data)
+
+    sdk.register_codec(_CountingCodec())
+    raw_seen, lazy_seen, decoded_seen = [], [], []
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: raw_seen.append(p), SubscriptionMode.RAW)
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: lazy_seen.append(p), 'lazy')
+
+    msg = BasicTypesMessage()
+    msg.regular_int = 42
+    frame = encode_basic_types(msg)
+    transport.inject_data(frame)
+    run_test("modes: raw-only + lazy subscribers do not decode", calls[0] == 0)
+    run_test("modes: raw subscriber gets original payload bytes",
+             raw_seen == [frame[4:4 + len(msg.serialize())]])
+    run_test("modes: lazy subscriber gets a LazyMessage",
+             isinstance(lazy_seen[0], LazyMessage) and lazy_seen[0].raw == raw_seen[0])
+    run_test("modes: lazy decode() decodes once and caches",
+             lazy_seen[0].decode().regular_int == 42 and lazy_seen[0].decode() is lazy_seen[0].decode()
+             and calls[0] == 1)
+
+    unsubscribe = sdk.subscribe(BasicTypesMessage.MSG_ID,
+                                lambda p, _id: decoded_seen.append(p))
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: decoded_seen.append(p))
+    calls[0] = 0
+    transport.inject_data(frame)
+    lazy_seen[-1].decode()
+    run_test("modes: mixed subscribers decode the frame exactly once", calls[0] == 1)
+    run_test("modes: decoded subscribers share the same object",
+             len(decoded_seen) == 2 and decoded_seen[0] is decoded_seen[1] is lazy_seen[-1].decode())
+
+    unsubscribe()
+    run_test("modes: unsubscribe removes handler and its mode",
+             len(sdk.message_handlers[BasicTypesMessage.MSG_ID])
+             == len(sdk.subscriptions[BasicTypesMessage.MSG_ID]) == 3)
+
+    try:
+        sdk.subscribe(BasicTypesMessage.MSG_ID, lambda *_: None, 'bogus')
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("modes: unknown mode rejected", rejected)
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -349,6 +404,7 @@ def main():
     test_codec_registration_and_message_decoding()
     test_close_callback_clears_buffer_state()
     test_throwing_handler_does_not_stop_siblings()
+    test_subscription_modes_decode_once()
 
     print()
     print("========================================")
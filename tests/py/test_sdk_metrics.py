@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""SDK metrics tests for the Python SDK.
+
+Covers ``MetricsCollector`` attached to StructFrameSdk / AsyncStructFrameSdk:
+
+  - per-msg_id rx/tx frame and byte counters, transport bytes in/out and
+    parser error events
+  - decode and handler latency histograms, decode/handler error counts
+  - no timing wrappers are installed unless metrics are enabled, and
+    enable_metrics()/disable_metrics() rebuild existing subscriptions
+  - LatencyHistogram percentile accuracy
+  - Prometheus text output, scraped from the local HTTP endpoint
+"""
+
+import asyncio
+import os
+import random
+import sys
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.async_struct_frame_sdk import AsyncStructFrameSdk, AsyncStructFrameSdkConfig
+from struct_frame_sdk.async_transport import BaseAsyncTransport
+from struct_frame_sdk.metrics import LatencyHistogram, MetricsCollector
+from struct_frame_sdk.transport import BaseTransport
+
+from frame_profiles import BufferWriter, PROFILE_STANDARD_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+class LoopbackTransport(BaseTransport):
+    """Counts sends and delivers inject()ed bytes to the SDK."""
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data(data)
+
+
+class AsyncLoopbackTransport(BaseAsyncTransport):
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data(data)
+
+
+class BasicTypesCodec:
+    msg_id = BasicTypesMessage.MSG_ID
+
+    def deserialize(self, data):
+        return BasicTypesMessage.deserialize(data)
+
+
+PAYLOAD_LEN = BasicTypesMessage.msg_size
+
+
+def frame(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG, capacity=512)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+def make_sdk(metrics=None):
+    transport = LoopbackTransport()
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+        metrics=metrics,
+    ))
+    return sdk, transport
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_counters():
+    """Per-msg_id and transport counters track rx, tx and parser errors."""
+    metrics = MetricsCollector()
+    sdk, transport = make_sdk(metrics)
+    sdk.register_codec(BasicTypesCodec())
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda m, _id: None)
+
+    bad = bytearray(frame(0))
+    bad[-1] ^= 0xFF
+    stream = frame(1) + frame(2) + bytes(bad) + frame(3)
+    transport.inject(stream)
+    sdk.send(BasicTypesMessage())
+
+    snap = metrics.snapshot()
+    msg = snap['messages'][BasicTypesMessage.MSG_ID]
+    run_test("counters: rx frames per msg_id", msg['rx_frames'] == 3)
+    run_test("counters: rx payload bytes per msg_id", msg['rx_bytes'] == 3 * PAYLOAD_LEN)
+    run_test("counters: transport bytes in", snap['transport']['rx_bytes'] == len(stream))
+    run_test("counters: CRC failure counted", snap['parser']['crc_failures'] == 1)
+    run_test("counters: tx frame and bytes per msg_id",
+             msg['tx_frames'] == 1 and msg['tx_bytes'] == PAYLOAD_LEN
+             and snap['transport']['tx_bytes'] == len(frame(0)))
+    run_test("counters: rate reported", msg['rx_frames_per_sec'] > 0)
+
+
+def test_latency_and_errors():
+    """Decode and handler time are histogrammed; failures are counted."""
+    metrics = MetricsCollector()
+    sdk, transport = make_sdk(metrics)
+    calls = [0]
+
+    class FlakyCodec:
+        msg_id = BasicTypesMessage.MSG_ID
+
+        def deserialize(self, data):
+            calls[0] += 1
+            if calls[0] == 2:
+                raise ValueError('bad payload')
+            return BasicTypesMessage.deserialize(data)
+
+    def handler(message, _msg_id):
+        if isinstance(message, BasicTypesMessage) and message.regular_int == 3:
+            raise RuntimeError('boom')
+
+    sdk.register_codec(FlakyCodec())
+    sdk.subscribe(BasicTypesMessage.MSG_ID, handler)
+    transport.inject(frame(1) + frame(2) + frame(3))
+
+    m = metrics.message(BasicTypesMessage.MSG_ID)
+    run_test("latency: one decode sample per frame", m.decode_ns.count == 3)
+    run_test("latency: one handler sample per frame", m.handler_ns.count == 3)
+    run_test("latency: decode error counted", m.decode_errors == 1)
+    run_test("latency: handler error counted", m.handler_errors == 1)
+    run_test("latency: summary has percentiles",
+             0 < m.handler_ns.summary()['p50'] <= m.handler_ns.max)
+
+
+def test_enable_disable():
+    """Without metrics no wrappers are installed; toggling rebuilds the table."""
+    sdk, transport = make_sdk()
+    seen = []
+    handler = lambda m, _id: seen.append(m)  # noqa: E731
+    sdk.subscribe(BasicTypesMessage.MSG_ID, handler)
+    plain = sdk._dispatch_table[BasicTypesMessage.MSG_ID][1]
+    run_test("toggle: metrics off by default", sdk.metrics is None and plain == (handler,))
+
+    metrics = sdk.enable_metrics()
+    transport.inject(frame(1))
+    run_test("toggle: enable_metrics() instruments existing subscriptions",
+             metrics.message(BasicTypesMessage.MSG_ID).handler_ns.count == 1)
+
+    sdk.disable_metrics()
+    transport.inject(frame(2))
+    run_test("toggle: disable_metrics() restores plain handlers",
+             sdk._dispatch_table[BasicTypesMessage.MSG_ID][1] == (handler,)
+             and metrics.message(BasicTypesMessage.MSG_ID).rx_frames == 1 and len(seen) == 2)
+
+    metrics.reset()
+    run_test("toggle: reset() zeroes counters", metrics.message(BasicTypesMessage.MSG_ID).rx_frames == 0)
+
+
+def test_histogram_accuracy():
+    """Percentiles stay within the histogram's ~3% relative error."""
+    rng = random.Random(1234)
+    values = sorted(rng.randint(1, 50_000_000) for _ in range(20000))
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+    ok = True
+    for pct in (50, 90, 99):
+        exact = values[int(len(values) * pct / 100) - 1]
+        ok = ok and abs(hist.percentile(pct) - exact) / exact < 0.035
+    run_test("histogram: p50/p90/p99 within 3.5%", ok)
+    run_test("histogram: min/max exact", hist.min == values[0] and hist.max == values[-1])
+    small = LatencyHistogram()
+    for v in (0, 1, 2, 3):
+        small.record(v)
+    run_test("histogram: small values recorded exactly", small.percentile(50) == 1 and small.percentile(100) == 3)
+
+
+def test_prometheus_http():
+    """Prometheus text is served from the local endpoint."""
+    metrics = MetricsCollector(labels={'link': 'test'})
+    sdk, transport = make_sdk(metrics)
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda m, _id: None)
+    transport.inject(frame(1) + frame(2))
+
+    with metrics.serve() as server:
+        with urllib.request.urlopen(server.url, timeout=5) as response:
+            content_type = response.headers.get('Content-Type', '')
+            body = response.read().decode('utf-8')
+    run_test("prometheus: text content type", content_type.startswith('text/plain'))
+    run_test("prometheus: per-msg_id counter sample",
+             f'structframe_rx_frames_total{{msg_id="{BasicTypesMessage.MSG_ID}",link="test"}} 2' in body)
+    run_test("prometheus: transport counter with constant labels",
+             f'structframe_transport_rx_bytes_total{{link="test"}} {2 * len(frame(0))}' in body)
+    run_test("prometheus: handler summary exported",
+             '# TYPE structframe_handler_seconds summary' in body
+             and f'structframe_handler_seconds_count{{msg_id="{BasicTypesMessage.MSG_ID}",link="test"}} 2' in body)
+
+
+def test_async_sdk():
+    """AsyncStructFrameSdk records the same metrics."""
+    async def scenario():
+        metrics = MetricsCollector()
+        transport = AsyncLoopbackTransport()
+        sdk = AsyncStructFrameSdk(AsyncStructFrameSdkConfig(
+            transport=transport,
+            profile=PROFILE_STANDARD_CONFIG,
+            get_message_info=get_message_info,
+            metrics=metrics,
+        ))
+        sdk.subscribe(BasicTypesMessage.MSG_ID, lambda m, _id: None)
+        transport.inject(frame(1))
+        await sdk.send(BasicTypesMessage())
+        return metrics.message(BasicTypesMessage.MSG_ID)
+
+    m = asyncio.run(scenario())
+    run_test("async: rx, tx and handler timing recorded",
+             m.rx_frames == 1 and m.tx_frames == 1 and m.handler_ns.count == 1)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("SDK METRICS TESTS - Python")
+    print("========================================")
+    print()
+
+    test_counters()
+    test_latency_and_errors()
+    test_enable_disable()
+    test_histogram_accuracy()
+    test_prometheus_http()
+    test_async_sdk()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Shared-memory transport tests for the Python SDK.
+
+Exercises ``SharedMemoryTransport`` / ``AsyncSharedMemoryTransport`` with
+ProfileIPC frames:
+
+  - creator and attacher exchange frames in both directions through the SDK
+  - a ring much smaller than the traffic wraps and applies back-pressure
+    without corrupting the byte stream
+  - a separate process attaches by name and echoes frames back
+  - disconnecting one side fires the other side's close callback
+  - the async transport dispatches through AsyncStructFrameSdk
+
+All waits are bounded so the suite cannot hang if a peer misbehaves.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.shared_memory_transport import (
+    SharedMemoryTransport,
+    SharedMemoryTransportConfig,
+    _CACHE_LINE,
+    _CLOSED,
+    _HEAD,
+    _TAIL,
+    _WAITING,
+)
+from struct_frame_sdk.async_shared_memory_transport import (
+    AsyncSharedMemoryTransport,
+    AsyncSharedMemoryTransportConfig,
+)
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.async_struct_frame_sdk import AsyncStructFrameSdk, AsyncStructFrameSdkConfig
+
+from frame_profiles import BufferWriter, PROFILE_IPC_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+_name_counter = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+def wait_until(predicate, timeout=2.0, interval=0.01) -> bool:
+    """Poll *predicate* until true or *timeout* elapses."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+def unique_name() -> str:
+    global _name_counter
+    _name_counter += 1
+    return f'sf_test_{os.getpid()}_{_name_counter}'
+
+
+def encode_ipc(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_IPC_CONFIG)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+def make_sdk(transport) -> StructFrameSdk:
+    return StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_IPC_CONFIG,
+        get_message_info=get_message_info,
+    ))
+
+
+def collect_values(sdk, received):
+    sdk.subscribe(BasicTypesMessage.MSG_ID,
+                  lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+
+
+def echo_child(name: str):
+    """Child process: attach to *name* and echo every byte until the creator leaves."""
+    sys.path.insert(0, _sdk_dir)
+    transport = SharedMemoryTransport(SharedMemoryTransportConfig(name=name))
+    done = multiprocessing.Event()
+    transport.set_data_callback(transport.send)
+    transport.set_close_callback(done.set)
+    transport.connect()
+    done.wait(10.0)
+    transport.disconnect()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_bidirectional_sdk():
+    """Frames flow both ways between creator and attacher."""
+    name = unique_name()
+    a = make_sdk(SharedMemoryTransport(SharedMemoryTransportConfig(name=name, create=True)))
+    b = make_sdk(SharedMemoryTransport(SharedMemoryTransportConfig(name=name)))
+    got_a, got_b = [], []
+    collect_values(a, got_a)
+    collect_values(b, got_b)
+    try:
+        a.connect()
+        b.connect()
+        for i in range(100):
+            msg = BasicTypesMessage()
+            msg.regular_int = i
+            a.send(msg)
+        msg = BasicTypesMessage()
+        msg.regular_int = -5
+        b.send(msg)
+        run_test("shm: creator -> attacher frames dispatched in order",
+                 wait_until(lambda: got_b == list(range(100))))
+        run_test("shm: attacher -> creator frame dispatched",
+                 wait_until(lambda: got_a == [-5]))
+    finally:
+        b.disconnect()
+        a.disconnect()
+
+
+def test_small_ring_wraps():
+    """Traffic far larger than the ring wraps around and stays intact."""
+    name = unique_name()
+    tx = SharedMemoryTransport(SharedMemoryTransportConfig(name=name, create=True, capacity=100))
+    rx = SharedMemoryTransport(SharedMemoryTransportConfig(name=name))
+    received = bytearray()
+    rx.set_data_callback(received.extend)
+    try:
+        tx.connect()
+        rx.connect()
+        run_test("shm: capacity rounded up to a power of two", tx.channel.capacity == 128)
+        run_test("shm: ring indices on separate cache lines",
+                 len({i * 8 // _CACHE_LINE for i in (_HEAD, _TAIL, _WAITING, _CLOSED)}) == 4)
+        payload = b''.join(encode_ipc(i) for i in range(300))
+        sent = tx.send(payload)
+        run_test("shm: send returns full length despite small ring", sent == len(payload))
+        run_test("shm: wrapped stream arrives intact",
+                 wait_until(lambda: bytes(received) == payload))
+    finally:
+        rx.disconnect()
+        tx.disconnect()
+
+
+def test_cross_process_echo():
+    """A separate process attaches by name and echoes frames back."""
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        run_test("shm: cross-process echo (skipped, no fork)", True)
+        return
+    name = unique_name()
+    sdk = make_sdk(SharedMemoryTransport(SharedMemoryTransportConfig(name=name, create=True)))
+    received = []
+    collect_values(sdk, received)
+    ctx = multiprocessing.get_context('fork')
+    child = None
+    try:
+        sdk.connect()
+        child = ctx.Process(target=echo_child, args=(name,))
+        child.start()
+        for i in range(50):
+            sdk.send_raw(BasicTypesMessage.MSG_ID, encode_ipc(i)[1:])
+        run_test("shm: frames echoed by another process",
+                 wait_until(lambda: received == list(range(50)), timeout=5.0))
+    finally:
+        sdk.disconnect()
+        if child is not None:
+            child.join(5.0)
+            run_test("shm: child exits after creator disconnects", child.exitcode == 0)
+
+
+def test_peer_close():
+    """Disconnecting one side fires the other side's close callback."""
+    name = unique_name()
+    creator = SharedMemoryTransport(SharedMemoryTransportConfig(name=name, create=True))
+    attacher = SharedMemoryTransport(SharedMemoryTransportConfig(name=name))
+    closed = []
+    creator.set_close_callback(lambda: closed.append(True))
+    try:
+        creator.connect()
+        attacher.connect()
+        attacher.disconnect()
+        run_test("shm: close callback fires when peer disconnects",
+                 wait_until(lambda: closed == [True]))
+        run_test("shm: transport reports disconnected", not creator.is_connected())
+    finally:
+        attacher.disconnect()
+        creator.disconnect()
+
+    try:
+        SharedMemoryTransport(SharedMemoryTransportConfig(name=unique_name())).connect()
+        missing = False
+    except FileNotFoundError:
+        missing = True
+    run_test("shm: attaching to a missing segment raises", missing)
+
+
+async def _async_roundtrip():
+    name = unique_name()
+    a = AsyncStructFrameSdk(AsyncStructFrameSdkConfig(
+        transport=AsyncSharedMemoryTransport(AsyncSharedMemoryTransportConfig(name=name, create=True)),
+        profile=PROFILE_IPC_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    b = AsyncStructFrameSdk(AsyncStructFrameSdkConfig(
+        transport=AsyncSharedMemoryTransport(AsyncSharedMemoryTransportConfig(name=name)),
+        profile=PROFILE_IPC_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    received = []
+    b.subscribe(BasicTypesMessage.MSG_ID,
+                lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+    closed = asyncio.Event()
+    b.transport.set_close_callback(closed.set)
+    await a.connect()
+    await b.connect()
+    try:
+        for i in range(20):
+            msg = BasicTypesMessage()
+            msg.regular_int = i
+            await a.send(msg)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0
+        while received != list(range(20)) and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+        run_test("async shm: frames dispatched through AsyncStructFrameSdk", received == list(range(20)))
+        await a.disconnect()
+        try:
+            await asyncio.wait_for(closed.wait(), timeout=2.0)
+            run_test("async shm: close callback fires when peer disconnects", True)
+        except asyncio.TimeoutError:
+            run_test("async shm: close callback fires when peer disconnects", False)
+    finally:
+        await b.disconnect()
+        await a.disconnect()
+
+
+def test_async_sdk():
+    asyncio.run(_async_roundtrip())
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("SHARED MEMORY TRANSPORT TESTS - Python")
+    print("========================================")
+    print()
+
+    test_bidirectional_sdk()
+    test_small_ring_wraps()
+    test_cross_process_echo()
+    test_peer_close()
+    test_async_sdk()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Subscription filter tests for the Python SDK.
+
+Exercises ``SubscriptionFilter`` / ``FieldFilter`` on ProfileNetwork frames
+(which carry sequence, system and component IDs):
+
+  - header filters deliver only matching frames and are pushed down into the
+    reader, so rejected frames skip CRC validation and payload copy
+  - an unfiltered subscriber on the same message ID disables the push-down
+    but filtered handlers still see only their frames
+  - fixed-offset payload filters run before the codec
+  - the reader's header filter works in byte-by-byte stream mode and does not
+    produce false sequence gaps
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.subscription import FieldFilter, SubscriptionFilter, SubscriptionMode
+from struct_frame_sdk.transport import BaseTransport
+
+from frame_base import FrameMsgStatus
+from frame_profiles import AccumulatingReader, BufferWriter, PROFILE_NETWORK_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+class LoopbackTransport(BaseTransport):
+    """Delivers inject()ed bytes straight to the SDK's data callback."""
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def send(self, data):
+        return len(data)
+
+    def inject(self, data: bytes):
+        self._handle_data(data)
+
+
+# BasicTypesMessage payload layout: int8 small_int, int16 medium_int, int32 regular_int ...
+REGULAR_INT_OFFSET = 3
+
+
+def frame(value: int, seq: int = 0, sys_id: int = 0, comp_id: int = 0) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_NETWORK_CONFIG, capacity=512)
+    writer.write(msg, seq=seq, sys_id=sys_id, comp_id=comp_id)
+    return bytes(writer.data())
+
+
+def make_sdk():
+    transport = LoopbackTransport()
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_NETWORK_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    return sdk, transport
+
+
+def values_of(received):
+    return [BasicTypesMessage.deserialize(p).regular_int for p in received]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_header_filter_pushdown():
+    """sys_id/comp_id filters are applied in the reader, before the CRC check."""
+    sdk, transport = make_sdk()
+    received = []
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: received.append(p),
+                  filter=SubscriptionFilter(sys_id=1, comp_id=(7, 8)))
+
+    corrupt = bytearray(frame(99, sys_id=2, comp_id=7))
+    corrupt[-1] ^= 0xFF
+    transport.inject(frame(1, sys_id=1, comp_id=7) + bytes(corrupt)
+                     + frame(2, sys_id=1, comp_id=9) + frame(3, sys_id=1, comp_id=8))
+
+    run_test("header: only matching frames delivered", values_of(received) == [1, 3])
+    run_test("header: rejected frames counted by the reader", sdk.reader.cnt_filtered == 2)
+    run_test("header: filtered frame with bad CRC is not a CRC failure",
+             sdk.reader.diagnostics.cnt_crc_failures == 0)
+
+
+def test_unfiltered_subscriber_disables_pushdown():
+    """Any unfiltered subscriber on the ID keeps every frame in the reader."""
+    sdk, transport = make_sdk()
+    filtered, everything = [], []
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: filtered.append(p),
+                  filter=SubscriptionFilter(sys_id=1))
+    unsubscribe = sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: everything.append(p))
+
+    transport.inject(frame(1, sys_id=1) + frame(2, sys_id=2))
+    run_test("mixed: filtered handler sees only its frames", values_of(filtered) == [1])
+    run_test("mixed: unfiltered handler sees all frames", values_of(everything) == [1, 2])
+    run_test("mixed: nothing filtered in the reader", sdk.reader.cnt_filtered == 0)
+
+    unsubscribe()
+    transport.inject(frame(3, sys_id=2))
+    run_test("mixed: push-down restored after unsubscribe", sdk.reader.cnt_filtered == 1)
+
+
+def test_seq_range_wraps():
+    """seq_range is inclusive and wraps when lo > hi."""
+    sdk, transport = make_sdk()
+    received = []
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: received.append(p),
+                  filter=SubscriptionFilter(seq_range=(250, 2)))
+    transport.inject(b''.join(frame(seq, seq=seq) for seq in (249, 250, 255, 0, 2, 3)))
+    run_test("seq: wrapped range selects 250..255,0..2", values_of(received) == [250, 255, 0, 2])
+
+
+def test_payload_field_filter_runs_before_codec():
+    """Payload filters reject frames without decoding them."""
+    sdk, transport = make_sdk()
+    decodes = [0]
+
+    class _Codec:
+        msg_id = BasicTypesMessage.MSG_ID
+
+        def deserialize(self, data):
+            decodes[0] += 1
+            return BasicTypesMessage.deserialize(data)
+
+    sdk.register_codec(_Codec())
+    received, raw = [], []
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda m, _id: received.append(m.regular_int),
+                  filter=SubscriptionFilter(fields=[FieldFilter(REGULAR_INT_OFFSET, 'i', min=100)]))
+    sdk.subscribe(BasicTypesMessage.MSG_ID, lambda p, _id: raw.append(p), SubscriptionMode.RAW,
+                  filter=SubscriptionFilter(fields=[FieldFilter(REGULAR_INT_OFFSET, 'i', equals=[5, 6])]))
+
+    transport.inject(b''.join(frame(v) for v in (5, 150, 6, 99, 100)))
+    run_test("fields: min filter delivers matching decoded messages", received == [150, 100])
+    run_test("fields: equals-set filter delivers matching raw payloads", values_of(raw) == [5, 6])
+    run_test("fields: codec only runs for frames a DECODED handler kept", decodes[0] == 2)
+
+    try:
+        FieldFilter(0, 'ii')
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("fields: multi-value format rejected", rejected)
+
+
+def test_reader_stream_mode_filter():
+    """The reader's header filter also applies to push_byte() streaming."""
+    reader = AccumulatingReader(PROFILE_NETWORK_CONFIG, get_message_info=get_message_info,
+                                buffer_size=512,
+                                header_filter=lambda msg_id, pkg, seq, sys_id, comp: sys_id == 1)
+    statuses, kept = [], []
+    for seq, sys_id in ((0, 1), (1, 2), (2, 1)):
+        for byte in frame(seq, seq=seq, sys_id=sys_id):
+            result = reader.push_byte(byte)
+            if result.valid:
+                kept.append(result.sequence)
+            elif result.status is FrameMsgStatus.FILTERED:
+                statuses.append(result.sequence)
+    run_test("stream: matching frames parsed", kept == [0, 2])
+    run_test("stream: rejected frame reported as FILTERED", statuses == [1])
+    run_test("stream: filtered frame does not count as a sequence gap",
+             reader.diagnostics.cnt_seq_gaps == 0)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("SUBSCRIPTION FILTER TESTS - Python")
+    print("========================================")
+    print()
+
+    test_header_filter_pushdown()
+    test_unfiltered_subscriber_disables_pushdown()
+    test_seq_range_wraps()
+    test_payload_field_filter_runs_before_codec()
+    test_reader_stream_mode_filter()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -211,6 +211,69 @@ def test_sdk_dispatch_over_socket():
         server.stop()
 
 
+def test_view_callback_zero_copy():
+    """set_data_view_callback() hands out views of the receive buffer."""
+    server = LoopbackServer()
+    views = []
+    received = bytearray()
+    transport = make_transport(server.port)
+
+    def on_view(view):
+        views.append(type(view))
+        received.extend(view)
+
+    transport.set_data_view_callback(on_view)
+    try:
+        transport.connect()
+        server.wait_accepted()
+        payload = bytes(range(64))
+        server.send(payload)
+        got = wait_until(lambda: len(received) >= len(payload))
+        run_test("tcp: view callback received peer bytes",
+                 got and bytes(received) == payload)
+        run_test("tcp: view callback gets memoryview (no bytes copy)",
+                 bool(views) and all(t is memoryview for t in views))
+    finally:
+        transport.disconnect()
+        server.stop()
+
+
+def test_sdk_split_frames_over_views():
+    """Frames split across reads reassemble when the SDK consumes borrowed views."""
+    server = LoopbackServer()
+    transport = make_transport(server.port)
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    received = []
+    sdk.subscribe(BasicTypesMessage.MSG_ID,
+                  lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+    try:
+        sdk.connect()
+        server.wait_accepted()
+        run_test("tcp+sdk: SDK uses the view callback", transport.data_view_callback is not None)
+
+        stream = bytearray()
+        for i in range(5):
+            msg = BasicTypesMessage()
+            msg.regular_int = i
+            writer = BufferWriter(PROFILE_STANDARD_CONFIG)
+            writer.write(msg)
+            stream += writer.data()
+        # Send in odd-sized pieces so frames straddle reads of the reused buffer.
+        for start in range(0, len(stream), 7):
+            server.send(bytes(stream[start:start + 7]))
+            time.sleep(0.002)
+        got = wait_until(lambda: len(received) == 5)
+        run_test("tcp+sdk: split frames reassembled from reused receive buffer",
+                 got and received == list(range(5)))
+    finally:
+        sdk.disconnect()
+        server.stop()
+
+
 def test_close_callback_on_peer_disconnect():
     """When the peer drops the connection the close callback fires."""
     server = LoopbackServer()
@@ -245,6 +308,8 @@ def main():
     test_send_to_peer()
     test_sdk_dispatch_over_socket()
     test_close_callback_on_peer_disconnect()
+    test_view_callback_zero_copy()
+    test_sdk_split_frames_over_views()
 
     print()
     print("========================================")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Shared-reactor tests for the Python sync transports.
+
+Verifies that ``TcpTransport`` / ``UdpTransport`` configured with a
+``TransportReactor`` (or ``TransportReactorPool``) are served from the
+reactor's thread instead of spawning one receive thread each:
+
+  - many TCP links deliver data through unchanged data callbacks
+  - thread count does not grow with the number of links
+  - disconnect() unregisters the socket; peer close fires the close callback
+  - UDP datagrams and a full StructFrameSdk dispatch work in reactor mode
+  - a reactor pool spreads links across its threads
+  - call_later() timers run on the reactor thread
+
+All waits are bounded so the suite cannot hang if a socket misbehaves.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.reactor import TransportReactor, TransportReactorPool
+from struct_frame_sdk.tcp_transport import TcpTransport, TcpTransportConfig
+from struct_frame_sdk.udp_transport import UdpTransport, UdpTransportConfig
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+
+from frame_profiles import BufferWriter, PROFILE_STANDARD_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+def wait_until(predicate, timeout=2.0, interval=0.01) -> bool:
+    """Poll *predicate* until true or *timeout* elapses."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+class MultiServer:
+    """Localhost TCP listener that accepts connections on demand."""
+
+    def __init__(self):
+        self._srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._srv.bind(('127.0.0.1', 0))
+        self._srv.listen(256)
+        self._srv.settimeout(2.0)
+        self.port = self._srv.getsockname()[1]
+        self.conns = []
+
+    def accept(self) -> socket.socket:
+        conn, _ = self._srv.accept()
+        self.conns.append(conn)
+        return conn
+
+    def stop(self):
+        for conn in self.conns:
+            try:
+                conn.close()
+            except OSError:
+                pass
+        self._srv.close()
+
+
+def encode_basic_types(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_many_tcp_links_one_thread():
+    """Many TCP transports share the reactor thread and keep their callbacks."""
+    server = MultiServer()
+    reactor = TransportReactor()
+    links = 50
+    received = [bytearray() for _ in range(links)]
+    callback_threads = set()
+    transports = []
+    try:
+        threads_before = threading.active_count()
+        for i in range(links):
+            t = TcpTransport(TcpTransportConfig(host='127.0.0.1', port=server.port, reactor=reactor))
+
+            def on_data(data, buf=received[i]):
+                callback_threads.add(threading.current_thread().name)
+                buf.extend(data)
+
+            t.set_data_callback(on_data)
+            t.connect()
+            server.accept()
+            transports.append(t)
+
+        run_test("reactor: thread count independent of link count",
+                 threading.active_count() <= threads_before + 1)
+        run_test("reactor: every socket registered",
+                 wait_until(lambda: len(reactor) == links))
+
+        for i, conn in enumerate(server.conns):
+            conn.sendall(bytes([i]) * 8)
+        run_test("reactor: every link received its peer's bytes",
+                 wait_until(lambda: all(bytes(received[i]) == bytes([i]) * 8 for i in range(links))))
+        run_test("reactor: callbacks ran on the reactor thread",
+                 callback_threads == {reactor.name})
+
+        n = transports[0].send(b'ping')
+        server.conns[0].settimeout(2.0)
+        run_test("reactor: send() unaffected by reactor mode",
+                 n == 4 and server.conns[0].recv(16) == b'ping')
+
+        for t in transports:
+            t.disconnect()
+        run_test("reactor: disconnect() unregisters sockets", len(reactor) == 0)
+    finally:
+        for t in transports:
+            t.disconnect()
+        reactor.close()
+        server.stop()
+
+
+def test_tcp_peer_close_in_reactor():
+    """A peer closing its end fires the close callback from the reactor."""
+    server = MultiServer()
+    reactor = TransportReactor()
+    transport = TcpTransport(TcpTransportConfig(host='127.0.0.1', port=server.port, reactor=reactor))
+    closed = threading.Event()
+    transport.set_close_callback(closed.set)
+    try:
+        transport.connect()
+        conn = server.accept()
+        conn.close()
+        run_test("reactor: close callback fires when peer disconnects", closed.wait(2.0))
+        run_test("reactor: closed socket unregistered",
+                 wait_until(lambda: len(reactor) == 0))
+    finally:
+        transport.disconnect()
+        reactor.close()
+        server.stop()
+
+
+def test_udp_and_sdk_in_reactor():
+    """UDP datagrams flow through a StructFrameSdk driven by the reactor."""
+    reactor = TransportReactor()
+    transport = UdpTransport(UdpTransportConfig(local_address='127.0.0.1', reactor=reactor))
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=transport,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    received = []
+    sdk.subscribe(BasicTypesMessage.MSG_ID,
+                  lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sdk.connect()
+        addr = transport.socket.getsockname()
+        for i in range(10):
+            sender.sendto(encode_basic_types(i), addr)
+        run_test("reactor: UDP frames dispatched through the SDK",
+                 wait_until(lambda: received == list(range(10))))
+    finally:
+        sender.close()
+        sdk.disconnect()
+        reactor.close()
+
+
+def test_reactor_pool_balances():
+    """A reactor pool spreads registrations across its threads."""
+    server = MultiServer()
+    pool = TransportReactorPool(size=2)
+    transports = []
+    try:
+        for _ in range(4):
+            t = TcpTransport(TcpTransportConfig(host='127.0.0.1', port=server.port, reactor=pool))
+            t.connect()
+            server.accept()
+            transports.append(t)
+        run_test("reactor pool: links split evenly across reactors",
+                 wait_until(lambda: [len(r) for r in pool.reactors] == [2, 2]))
+        for t in transports:
+            t.disconnect()
+        run_test("reactor pool: disconnect() unregisters from owning reactor", len(pool) == 0)
+    finally:
+        for t in transports:
+            t.disconnect()
+        pool.close()
+        server.stop()
+
+
+def test_call_later_runs_on_reactor():
+    """call_later() timers fire on the reactor thread after the delay."""
+    reactor = TransportReactor()
+    fired = []
+    try:
+        start = time.monotonic()
+        reactor.call_later(0.05, lambda: fired.append((threading.current_thread().name,
+                                                       time.monotonic() - start)))
+        run_test("reactor: call_later fires", wait_until(lambda: len(fired) == 1))
+        run_test("reactor: call_later runs on reactor thread",
+                 fired and fired[0][0] == reactor.name)
+        run_test("reactor: call_later honours the delay", fired and fired[0][1] >= 0.04)
+    finally:
+        reactor.close()
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("TRANSPORT REACTOR TESTS - Python")
+    print("========================================")
+    print()
+
+    test_many_tcp_links_one_thread()
+    test_tcp_peer_close_in_reactor()
+    test_udp_and_sdk_in_reactor()
+    test_reactor_pool_balances()
+    test_call_later_runs_on_reactor()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
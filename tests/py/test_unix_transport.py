@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Unix domain socket transport tests for the Python SDK.
+
+Exercises ``UnixTransport`` / ``AsyncUnixTransport`` over real AF_UNIX
+sockets:
+
+  - listen/connect on a filesystem path, with a StructFrameSdk dispatching
+    frames split across writes
+  - seqpacket sockets preserve record boundaries; oversized records are
+    reported and dropped without killing the link
+  - disconnect() returns promptly and only the peer sees a close
+  - socketpair() halves and the async transport dispatch through
+    AsyncStructFrameSdk
+
+All waits are bounded so the suite cannot hang if a socket misbehaves.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'generated', 'py'))
+
+_sdk_dir = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'src', 'struct_frame', 'boilerplate', 'py'
+)
+sys.path.insert(0, _sdk_dir)
+
+from struct_frame_sdk.unix_transport import UnixTransport, UnixTransportConfig
+from struct_frame_sdk.async_unix_transport import AsyncUnixTransport, AsyncUnixTransportConfig
+from struct_frame_sdk.struct_frame_sdk import StructFrameSdk, StructFrameSdkConfig
+from struct_frame_sdk.async_struct_frame_sdk import AsyncStructFrameSdk, AsyncStructFrameSdkConfig
+
+from frame_profiles import BufferWriter, PROFILE_STANDARD_CONFIG
+from struct_frame.generated.serialization_test import (
+    BasicTypesMessage,
+    get_message_info,
+)
+
+
+# ---------------------------------------------------------------------------
+# Test infrastructure
+# ---------------------------------------------------------------------------
+
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+
+def run_test(name: str, result: bool):
+    global tests_run, tests_passed, tests_failed
+    tests_run += 1
+    print(f"  {'PASS' if result else 'FAIL'}  {name}")
+    if result:
+        tests_passed += 1
+    else:
+        tests_failed += 1
+
+
+def wait_until(predicate, timeout=2.0, interval=0.01) -> bool:
+    """Poll *predicate* until true or *timeout* elapses."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
+def encode_basic_types(value: int) -> bytes:
+    msg = BasicTypesMessage()
+    msg.regular_int = value
+    writer = BufferWriter(PROFILE_STANDARD_CONFIG)
+    writer.write(msg)
+    return bytes(writer.data())
+
+
+def socket_path() -> str:
+    return os.path.join(tempfile.mkdtemp(prefix='sf-uds-'), 'link.sock')
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_stream_listen_connect_sdk():
+    """A listening and a connecting endpoint carry SDK frames over a path."""
+    path = socket_path()
+    server = UnixTransport(UnixTransportConfig(path=path, listen=True))
+    client = UnixTransport(UnixTransportConfig(path=path))
+    sdk = StructFrameSdk(StructFrameSdkConfig(
+        transport=server,
+        profile=PROFILE_STANDARD_CONFIG,
+        get_message_info=get_message_info,
+    ))
+    received = []
+    sdk.subscribe(BasicTypesMessage.MSG_ID,
+                  lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+    accept = threading.Thread(target=sdk.connect)
+    try:
+        accept.start()
+        run_test("stream: client connects to listening path",
+                 wait_until(lambda: os.path.exists(path)) and client.connect() is None)
+        accept.join(2.0)
+        run_test("stream: socket path removed once the peer connected", not os.path.exists(path))
+
+        frame = encode_basic_types(7)
+        client.send(frame[:3])
+        time.sleep(0.02)
+        client.send(frame[3:] + encode_basic_types(8))
+        run_test("stream: frames split across writes dispatched",
+                 wait_until(lambda: received == [7, 8]))
+    finally:
+        client.disconnect()
+        sdk.disconnect()
+
+
+def test_seqpacket_records():
+    """Seqpacket keeps one send() == one read; oversized records are dropped."""
+    a, b = UnixTransport.pair('seqpacket', buffer_size=64)
+    records, errors = [], []
+    b.set_data_callback(lambda data: records.append(bytes(data)))
+    b.set_error_callback(errors.append)
+    try:
+        a.connect()
+        b.connect()
+        for i in range(3):
+            a.send(bytes([i]) * (i + 1))
+        run_test("seqpacket: one callback per record",
+                 wait_until(lambda: records == [b'\x00', b'\x01\x01', b'\x02\x02\x02']))
+        a.send(b'x' * 200)
+        a.send(b'after')
+        run_test("seqpacket: oversized record reported",
+                 wait_until(lambda: len(errors) == 1))
+        run_test("seqpacket: link survives oversized record",
+                 wait_until(lambda: records[-1:] == [b'after']) and b'x' * 64 not in records)
+    finally:
+        a.disconnect()
+        b.disconnect()
+
+
+def test_disconnect_and_peer_close():
+    """disconnect() is prompt and only the peer's close callback fires."""
+    a, b = UnixTransport.pair('stream')
+    closed_a, closed_b = [], []
+    a.set_close_callback(lambda: closed_a.append(True))
+    b.set_close_callback(lambda: closed_b.append(True))
+    a.connect()
+    b.connect()
+    start = time.monotonic()
+    a.disconnect()
+    run_test("close: disconnect() returns promptly", time.monotonic() - start < 0.5)
+    run_test("close: peer close callback fires", wait_until(lambda: closed_b == [True]))
+    run_test("close: own disconnect does not fire close callback", closed_a == [])
+    b.disconnect()
+
+    try:
+        UnixTransport(UnixTransportConfig(socket_type='dgram'))
+        rejected = False
+    except ValueError:
+        rejected = True
+    run_test("config: unknown socket_type rejected", rejected)
+
+
+async def _async_suite():
+    for socket_type in ('stream', 'seqpacket'):
+        left, right = socket.socketpair(socket.AF_UNIX, getattr(socket, f'SOCK_{socket_type.upper()}'))
+        a = AsyncUnixTransport(AsyncUnixTransportConfig(socket_type=socket_type, sock=left))
+        sdk = AsyncStructFrameSdk(AsyncStructFrameSdkConfig(
+            transport=AsyncUnixTransport(AsyncUnixTransportConfig(socket_type=socket_type, sock=right)),
+            profile=PROFILE_STANDARD_CONFIG,
+            get_message_info=get_message_info,
+        ))
+        received = []
+        sdk.subscribe(BasicTypesMessage.MSG_ID,
+                      lambda payload, msg_id: received.append(BasicTypesMessage.deserialize(payload).regular_int))
+        await a.connect()
+        await sdk.connect()
+        try:
+            for i in range(20):
+                await a.send(encode_basic_types(i))
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 2.0
+            while received != list(range(20)) and loop.time() < deadline:
+                await asyncio.sleep(0.01)
+            run_test(f"async {socket_type}: frames dispatched through AsyncStructFrameSdk",
+                     received == list(range(20)))
+        finally:
+            await a.disconnect()
+            await sdk.disconnect()
+
+    path = socket_path()
+    server = AsyncUnixTransport(AsyncUnixTransportConfig(path=path, listen=True))
+    client = AsyncUnixTransport(AsyncUnixTransportConfig(path=path))
+    got = []
+    server.set_data_callback(got.append)
+    accept = asyncio.create_task(server.connect())
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        await asyncio.sleep(0.01)
+    await client.connect()
+    await asyncio.wait_for(accept, timeout=2.0)
+    await client.send(b'hello')
+    for _ in range(100):
+        if got:
+            break
+        await asyncio.sleep(0.01)
+    run_test("async stream: listen/connect over a path", got == [b'hello'])
+    await client.disconnect()
+    await server.disconnect()
+
+
+def test_async():
+    asyncio.run(_async_suite())
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main():
+    print()
+    print("========================================")
+    print("UNIX DOMAIN SOCKET TRANSPORT TESTS - Python")
+    print("========================================")
+    print()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("  SKIP  AF_UNIX not available on this platform")
+        return 0
+
+    test_stream_listen_connect_sdk()
+    test_seqpacket_records()
+    test_disconnect_and_peer_close()
+    test_async()
+
+    print()
+    print("========================================")
+    print(f"Summary: {tests_passed}/{tests_run} tests passed")
+    print("========================================")
+    print()
+
+    return 1 if tests_failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1757,6 +1757,18 @@ class TestRunner:
             "test_request_response_async":  ["py"],
             "test_sdk_request_response":    ["csharp"],
             "test_tcp_transport":           ["py"],
+            "test_async_server":            ["py"],
+            "test_transport_reactor":       ["py"],
+            "test_batched_udp_transport":   ["py"],
+            "test_shared_memory_transport": ["py"],
+            "test_unix_transport":          ["py"],
+            "test_subscription_filters":    ["py"],
+            "test_multi_profile_reader":    ["py"],
+            "test_sdk_metrics":             ["py"],
+            "test_frame_profiler":          ["py"],
+            "test_capture":                 ["py"],
+            "test_frame_analysis":          ["py"],
+            "test_pcapng":                  ["py"],
         }
 
         # Initialise table: None = N/A, "MISSING" = applicable but not yet run
@@ -1860,6 +1872,126 @@ class TestRunner:
                 if not success:
                     all_success = False
 
+        # ---- Python: test_async_server.py (multi-peer TCP/UDP server over loopback) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_async_server.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_async_server", "py", success, stdout, stderr,
+                        "py:async_server", "test_async_server.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_transport_reactor.py (sync transports on a shared selector reactor) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_transport_reactor.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_transport_reactor", "py", success, stdout, stderr,
+                        "py:transport_reactor", "test_transport_reactor.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_batched_udp_transport.py (batched UDP drain/burst transport over loopback) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_batched_udp_transport.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_batched_udp_transport", "py", success, stdout, stderr,
+                        "py:batched_udp_transport", "test_batched_udp_transport.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_shared_memory_transport.py (shared-memory ring transport, sync + async) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_shared_memory_transport.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_shared_memory_transport", "py", success, stdout, stderr,
+                        "py:shared_memory_transport", "test_shared_memory_transport.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_unix_transport.py (Unix domain stream/seqpacket transports, sync + async) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_unix_transport.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_unix_transport", "py", success, stdout, stderr,
+                        "py:unix_transport", "test_unix_transport.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_subscription_filters.py (Python SDK subscription filters) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_subscription_filters.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_subscription_filters", "py", success, stdout, stderr,
+                        "py:subscription_filters", "test_subscription_filters.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_multi_profile_reader.py (MultiProfileReader mixed-profile parsing) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_multi_profile_reader.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_multi_profile_reader", "py", success, stdout, stderr,
+                        "py:multi_profile_reader", "test_multi_profile_reader.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_sdk_metrics.py (SDK metrics collector) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_sdk_metrics.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_sdk_metrics", "py", success, stdout, stderr,
+                        "py:sdk_metrics", "test_sdk_metrics.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_frame_profiler.py (Frame profiler hooks and CLI) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_frame_profiler.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_frame_profiler", "py", success, stdout, stderr,
+                        "py:frame_profiler", "test_frame_profiler.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_capture.py (Capture recording and replay) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_capture.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_capture", "py", success, stdout, stderr,
+                        "py:capture", "test_capture.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_frame_analysis.py (Parallel mmap capture analysis) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_frame_analysis.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_frame_analysis", "py", success, stdout, stderr,
+                        "py:frame_analysis", "test_frame_analysis.py failed")
+                if not success:
+                    all_success = False
+
+        # ---- Python: test_pcapng.py (pcapng export/import) ----
+        if py_lang:
+            script = self.project_root / py_lang.test_dir / "test_pcapng.py"
+            if script.exists():
+                success, stdout, stderr = self.run_cmd(f'python "{script}"', timeout=30)
+                _record("test_pcapng", "py", success, stdout, stderr,
+                        "py:pcapng", "test_pcapng.py failed")
+                if not success:
+                    all_success = False
+
         # ---- TypeScript: test_sdk.ts (section 6.3) ----
         ts_lang = self.languages.get("ts")
         if ts_lang and self.results["compilation"].get("ts", False):
@@ -12,16 +12,25 @@ Covered behaviours:
 2. Second run without ``--force`` detects a matching hash and skips.
 3. Second run with ``--force`` ignores the hash and regenerates.
 4. Changing the proto content invalidates the hash and forces regeneration.
+5. A ``.structframe.sources`` manifest records the import closure; while no
+   source changes, later runs skip before parsing.
+6. Source edits that keep the definitions (comments) fall back to the
+   generation hash, which still skips and refreshes the manifest.
+7. A new file that would change how an import resolves invalidates the
+   manifest.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import tempfile
 from pathlib import Path
 from test_utils import _check, run_generator, PROTO_FILE
 
 HASH_FILENAME = ".structframe.hash"
+SOURCES_FILENAME = ".structframe.sources"
+SOURCES_SKIP = "source files unchanged"
 
 
 def _run_generator(proto: Path, out_dir: Path, force: bool = False) -> tuple[int, str]:
@@ -120,3 +129,95 @@ def test_changed_proto_invalidates_hash():
                f"Modified proto should NOT be skipped, got:\n{output2}")
         _check(new_hash != original_hash,
                f"Hash should change after proto modification; was {original_hash}, still {new_hash}")
+
+
+def _write_import_tree(root: Path) -> Path:
+    """main.sf imports sub/leaf.sf, which imports common.sf from its own directory."""
+    (root / "sub").mkdir()
+    (root / "sub" / "common.sf").write_text(
+        "package common;\noption pkgid = 3;\n"
+        "enum Mode {\n  OFF = 0;\n  ON = 1;\n}\n", encoding="utf-8")
+    (root / "sub" / "leaf.sf").write_text(
+        'import "common.sf";\n'
+        "package leaf;\noption pkgid = 2;\n"
+        "message Leaf {\n  option msgid = 2;\n  uint8 mode = 1;\n}\n", encoding="utf-8")
+    main = root / "main.sf"
+    main.write_text(
+        'import "sub/leaf.sf";\n'
+        "package app;\noption pkgid = 1;\n"
+        "message Top {\n  option msgid = 1;\n  uint32 value = 1;\n}\n", encoding="utf-8")
+    return main
+
+
+def test_source_manifest_records_import_closure():
+    """The manifest lists every file in the import closure and the generation hash."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_import_tree(root)
+        out = root / "gen"
+        code, output = _run_generator(main, out)
+        _check(code == 0, f"Generator failed (exit {code}):\n{output}")
+        manifest = json.loads((out / SOURCES_FILENAME).read_text())
+        files = {Path(p).resolve() for p in manifest["files"]}
+        expected = {main.resolve(), (root / "sub" / "leaf.sf").resolve(), (root / "sub" / "common.sf").resolve()}
+        _check(files == expected, f"Manifest should list the import closure, got {sorted(files)}")
+        _check(manifest["generation_hash"] == (out / HASH_FILENAME).read_text().strip(),
+               "Manifest should record the generation hash it belongs to")
+        _check(str((root / "common.sf").resolve()) in manifest["absent"],
+               f"Unused import candidate should be recorded as absent, got {manifest['absent']}")
+
+
+def test_unchanged_sources_skip_before_parsing():
+    """With no source changes the second run skips on the manifest alone."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_import_tree(root)
+        out = root / "gen"
+        code, _ = _run_generator(main, out)
+        _check(code == 0, "First generation should succeed")
+        code2, output2 = _run_generator(main, out)
+        _check(code2 == 0 and SOURCES_SKIP in output2,
+               f"Unchanged tree should skip before parsing, got:\n{output2}")
+
+        # Different CLI flags must not reuse the manifest.
+        result = run_generator(main, "--build_py", "--py_path", str(out) + os.sep, "--equality")
+        _check(SOURCES_SKIP not in result.stdout and "no changes detected" not in result.stdout.lower(),
+               f"Changed flags must regenerate, got:\n{result.stdout}")
+
+
+def test_comment_change_refreshes_manifest():
+    """A comment-only edit falls back to the generation hash and refreshes the manifest."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_import_tree(root)
+        out = root / "gen"
+        code, _ = _run_generator(main, out)
+        _check(code == 0, "First generation should succeed")
+
+        common = root / "sub" / "common.sf"
+        common.write_text("// edited\n" + common.read_text(), encoding="utf-8")
+        code2, output2 = _run_generator(main, out)
+        _check(code2 == 0 and SOURCES_SKIP not in output2 and "hash matches" in output2,
+               f"Edited import should be parsed and skipped on the generation hash, got:\n{output2}")
+        code3, output3 = _run_generator(main, out)
+        _check(code3 == 0 and SOURCES_SKIP in output3,
+               f"Refreshed manifest should give the fast path again, got:\n{output3}")
+
+
+def test_new_shadowing_import_invalidates_manifest():
+    """Creating a file that an import would now resolve to forces a parse."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_import_tree(root)
+        out = root / "gen"
+        code, _ = _run_generator(main, out)
+        _check(code == 0, "First generation should succeed")
+
+        # Imports resolve against the root file's directory first.
+        (root / "common.sf").write_text(
+            "package common;\noption pkgid = 3;\n"
+            "enum Mode {\n  OFF = 0;\n  ON = 1;\n  AUTO = 2;\n}\n", encoding="utf-8")
+        code2, output2 = _run_generator(main, out)
+        _check(code2 == 0, f"Generation should succeed, got {code2}:\n{output2}")
+        _check("no changes detected" not in output2.lower(),
+               f"Shadowing import must regenerate, got:\n{output2}")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the GeneratorSession library API.
+
+Sessions hold all parser and model state, so several of them can be used in
+one process without touching each other or the module-level default session.
+Generating through a session must produce the same files as the CLI.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from test_utils import _check, run_generator, SRC_DIR, PROTO_FILE
+
+PKG_PROTO = PROTO_FILE.parent / "pkg_test_messages.sf"
+
+
+def test_independent_sessions():
+    """Two sessions loaded in one process keep separate models."""
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame import generate
+    from struct_frame.generate import GeneratorSession
+
+    module_packages = dict(generate.packages)
+    first = GeneratorSession()
+    second = GeneratorSession()
+    _check(first.load(str(PROTO_FILE)), "Loading test_messages.sf should succeed")
+    _check(second.load(str(PKG_PROTO)), "Loading pkg_test_messages.sf should succeed")
+    _check(set(first.packages) == {"serialization_test"}, f"Unexpected packages: {sorted(first.packages)}")
+    _check("serialization_test" not in second.packages, "Sessions must not share packages")
+    _check(os.path.abspath(PROTO_FILE) in first.processed_files, "Parsed files are recorded per session")
+    _check(not first.processed_files & second.processed_files, "Sessions must not share parsed files")
+    _check(generate.packages == module_packages, "Sessions must leave the module-level state alone")
+
+    # Reloading replaces the model instead of adding to it.
+    _check(first.load(str(PKG_PROTO)), "Reloading a session should succeed")
+    _check(set(first.packages) == set(second.packages), "A reloaded session should hold only the new model")
+
+
+def test_load_reports_errors():
+    """load() returns False for a broken schema and the session stays usable."""
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame.generate import GeneratorSession
+
+    with tempfile.TemporaryDirectory() as tmp:
+        broken = Path(tmp) / "broken.sf"
+        broken.write_text("package broken;\nmessage M {\n  uint8 a = ;\n}\n", encoding="utf-8")
+        session = GeneratorSession()
+        _check(not session.load(str(broken)), "A syntax error should fail load()")
+        _check(session.load(str(PROTO_FILE)), "The session should load a valid schema afterwards")
+        _check(set(session.packages) == {"serialization_test"}, "Nothing of the broken schema may remain")
+
+
+def test_generate_matches_cli():
+    """session.generate() returns exactly the files the CLI writes for them."""
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame.generate import GeneratorSession
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = {"c": str(root / "c") + os.sep, "py": str(root / "py") + os.sep}
+        result = run_generator(PKG_PROTO, "--build_c", "--c_path", paths["c"],
+                               "--build_py", "--py_path", paths["py"], "--equality",
+                               "--catalog_path", str(root) + os.sep)
+        _check(result.returncode == 0, f"Generator failed:\n{result.stdout}{result.stderr}")
+
+        session = GeneratorSession()
+        _check(session.load(str(PKG_PROTO)), "Loading pkg_test_messages.sf should succeed")
+        files = session.generate(["c", "py"], paths=paths, equality=True)
+        _check(files, "generate() should return files")
+        for name, content in files.items():
+            _check(Path(name).read_text(encoding="utf-8") == content, f"{name} differs from the CLI output")
+
+        try:
+            session.generate(["cobol"])
+        except ValueError as err:
+            _check("cobol" in str(err), f"Error should name the language: {err}")
+        else:
+            _check(False, "Unknown languages should be rejected")
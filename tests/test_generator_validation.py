@@ -388,3 +388,64 @@ message Foo {
         result = _run(str(sf))
     _report("field_number_zero", result, expected_reject=True,
             expected_msg="must be numbered 1..N")
+
+
+def test_message_cycle() -> None:
+    """Messages that embed each other (here via a oneof) are reported as a cycle."""
+    proto = """\
+package cycle_test;
+
+message Alpha {
+  option msgid = 1;
+  Beta beta = 1;
+}
+
+message Beta {
+  option msgid = 2;
+  oneof body {
+    Alpha alpha = 1;
+    uint8 none = 2;
+  }
+}
+"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sf = Path(tmp) / "cycle.sf"
+        sf.write_text(proto)
+        result = _run(str(sf))
+    _report("message_cycle", result, expected_reject=True,
+            expected_msg="circular message dependency: cycle_test.Alpha -> cycle_test.Beta -> cycle_test.Alpha")
+
+
+def test_self_referencing_message() -> None:
+    """A message that embeds itself is a cycle of one."""
+    proto = """\
+package self_ref_test;
+
+message Node {
+  option msgid = 1;
+  uint8 value = 1;
+  Node next = 2;
+}
+"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sf = Path(tmp) / "self_ref.sf"
+        sf.write_text(proto)
+        result = _run(str(sf))
+    _report("self_referencing_message", result, expected_reject=True,
+            expected_msg="circular message dependency: self_ref_test.Node -> self_ref_test.Node")
+
+
+def test_deep_message_chain_allowed() -> None:
+    """Nesting far deeper than the recursion limit validates, with correct sizes."""
+    depth = 3000
+    lines = ["package deep_chain_test;\n"]
+    for i in range(depth):
+        inner = f"M{i + 1} inner = 1;" if i + 1 < depth else "uint16 value = 1;"
+        lines.append(f"message M{i} {{\n  {inner}\n  uint8 tag = 2;\n}}\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        sf = Path(tmp) / "deep_chain.sf"
+        sf.write_text("".join(lines))
+        result = run_generator(sf, "--validate", "--debug")
+    _report("deep_message_chain_allowed", result, expected_reject=False)
+    _check(f"Message: M0, Size: {2 + depth}, ID: None" in _output(result),
+           "The outermost message should embed the whole chain")
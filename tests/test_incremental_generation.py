@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for per-package incremental generation.
+
+Four packages: ``base`` (an enum), ``mid`` (imports ``base``), ``other``
+(independent) and ``app`` (imports ``mid`` and ``other``). After an edit,
+only the edited package and the packages that import it, directly or
+transitively, are regenerated, files whose content did not change are not
+rewritten (their mtimes survive), and the result matches a full ``--force``
+generation byte for byte.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from test_utils import _check, run_generator
+
+LANG_FLAGS = ["--build_c", "--build_py", "--build_ts"]
+
+
+def _write_tree(root: Path) -> Path:
+    (root / "base.sf").write_text(
+        "package base;\noption pkgid = 3;\n"
+        "enum Mode {\n  OFF = 0;\n  ON = 1;\n}\n", encoding="utf-8")
+    (root / "mid.sf").write_text(
+        'import "base.sf";\n'
+        "package mid;\noption pkgid = 2;\n"
+        "message Status {\n  option msgid = 1;\n  base.Mode mode = 1;\n  uint16 count = 2;\n}\n",
+        encoding="utf-8")
+    (root / "other.sf").write_text(
+        "package other;\noption pkgid = 4;\n"
+        "message Ping {\n  option msgid = 1;\n  uint32 stamp = 1;\n}\n", encoding="utf-8")
+    main = root / "main.sf"
+    main.write_text(
+        'import "mid.sf";\nimport "other.sf";\n'
+        "package app;\noption pkgid = 1;\n"
+        "message Top {\n  option msgid = 1;\n  uint32 value = 1;\n}\n", encoding="utf-8")
+    return main
+
+
+def _generate(main: Path, out: Path, *extra: str) -> str:
+    flags = [*LANG_FLAGS, "--debug",
+             "--c_path", str(out / "c") + os.sep,
+             "--py_path", str(out / "py") + os.sep,
+             "--ts_path", str(out / "ts") + os.sep, *extra]
+    result = run_generator(main, *flags)
+    output = result.stdout + result.stderr
+    _check(result.returncode == 0, f"Generator failed (exit {result.returncode}):\n{output}")
+    return output
+
+
+def _regenerated(output: str) -> set[str]:
+    match = re.search(r"Regenerating \d+ of \d+ package\(s\): (.*)", output)
+    _check(match is not None, f"Debug output should list regenerated packages:\n{output}")
+    return set() if match.group(1) == "(none)" else set(match.group(1).split(", "))
+
+
+def _snapshot(out: Path) -> dict[str, tuple[int, bytes]]:
+    """{relative path: (mtime_ns, content)} of generated (non-boilerplate) files."""
+    result = {}
+    for p in out.rglob("*"):
+        if p.is_file() and not p.name.startswith(".") and ("structframe" in p.name or "generated" in p.parts):
+            result[str(p.relative_to(out))] = (p.stat().st_mtime_ns, p.read_bytes())
+    return result
+
+
+def _age(out: Path) -> None:
+    """Backdate every output file so a rewrite is visible in its mtime."""
+    for p in out.rglob("*"):
+        if p.is_file():
+            os.utime(p, ns=(1_000_000_000, 1_000_000_000))
+
+
+def _rewritten(before: dict, after: dict) -> set[str]:
+    return {name for name in after if name not in before or after[name][0] != before[name][0]}
+
+
+def test_edit_regenerates_package_and_dependents():
+    """Editing base regenerates base and its importers; other stays untouched."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        out = root / "gen"
+        first = _generate(main, out)
+        _check(_regenerated(first) == {"app", "base", "mid", "other"},
+               f"First run should generate every package, got {_regenerated(first)}")
+
+        _age(out)
+        before = _snapshot(out)
+        base = root / "base.sf"
+        base.write_text(base.read_text().replace("ON = 1;", "ON = 1;\n  AUTO = 2;"), encoding="utf-8")
+        output = _generate(main, out)
+        _check(_regenerated(output) == {"app", "base", "mid"},
+               f"Only base and its importers should regenerate, got {_regenerated(output)}")
+        after = _snapshot(out)
+        rewritten = _rewritten(before, after)
+        _check(any("base" in name for name in rewritten),
+               f"base outputs should be rewritten, got {sorted(rewritten)}")
+        _check(not any("other" in name for name in rewritten),
+               f"Unaffected packages must keep their mtimes, rewritten: {sorted(rewritten)}")
+
+        full = root / "full"
+        _generate(main, full, "--force")
+        _check({k: v[1] for k, v in _snapshot(out).items()} == {k: v[1] for k, v in _snapshot(full).items()},
+               "Incremental output must match a full generation")
+
+
+def test_leaf_edit_touches_only_leaf():
+    """Editing a leaf package leaves packages it does not reach untouched."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        out = root / "gen"
+        _generate(main, out)
+        _age(out)
+        before = _snapshot(out)
+        other = root / "other.sf"
+        other.write_text(other.read_text().replace("uint32 stamp = 1;", "uint32 stamp = 1;\n  uint8 flags = 2;"),
+                         encoding="utf-8")
+        output = _generate(main, out)
+        _check(_regenerated(output) == {"app", "other"},
+               f"Only other and app should regenerate, got {_regenerated(output)}")
+        rewritten = _rewritten(before, _snapshot(out))
+        _check(any("other" in name for name in rewritten), "other outputs should be rewritten")
+        _check(not any("base" in name or "mid" in name for name in rewritten),
+               f"base and mid must keep their mtimes, rewritten: {sorted(rewritten)}")
+
+
+def test_force_regenerates_everything():
+    """--force ignores the package manifest."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        out = root / "gen"
+        _generate(main, out)
+        output = _generate(main, out, "--force")
+        _check(_regenerated(output) == {"app", "base", "mid", "other"},
+               f"--force should regenerate every package, got {_regenerated(output)}")
+
+
+def test_flag_change_regenerates_everything():
+    """Changing output-affecting flags invalidates every package."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        out = root / "gen"
+        _generate(main, out)
+        output = _generate(main, out, "--equality")
+        _check(_regenerated(output) == {"app", "base", "mid", "other"},
+               f"--equality should regenerate every package, got {_regenerated(output)}")
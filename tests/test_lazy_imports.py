@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy loading of the language back-ends.
+
+Importing ``struct_frame`` or ``struct_frame.generate`` must not load any
+language back-end or the schema grammar. A generator run loads only the
+back-ends selected by its build flags, and the public names still resolve.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from test_utils import _check, SRC_DIR, PROTO_FILE
+
+BACKENDS = ["c_gen", "ts_gen", "js_gen", "py_gen", "gql_gen", "cpp_gen", "csharp_gen", "rust_gen"]
+
+
+def _loaded_after(code: str) -> set[str]:
+    """Names of back-ends (and the grammar) in sys.modules after running *code*."""
+    probe = (code + "\nimport json, sys\n"
+             f"print(json.dumps([m for m in {BACKENDS!r} if 'struct_frame.' + m in sys.modules]"
+             " + (['proto_schema_parser'] if 'proto_schema_parser' in sys.modules else [])))")
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env)
+    _check(result.returncode == 0, f"Probe failed:\n{result.stderr}")
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def test_import_loads_no_backend():
+    """Package and generator imports stay light; public names still resolve."""
+    loaded = _loaded_after("import struct_frame.generate")
+    _check(not loaded, f"Importing the generator should load nothing heavy, loaded {sorted(loaded)}")
+    loaded = _loaded_after("import struct_frame\nassert struct_frame.FileRustGen.__name__ == 'FileRustGen'")
+    _check(loaded == {"rust_gen"}, f"Accessing FileRustGen should load only rust_gen, loaded {sorted(loaded)}")
+
+
+def test_build_loads_selected_backends():
+    """A --build_py --build_c run loads exactly those back-ends."""
+    with tempfile.TemporaryDirectory() as tmp:
+        code = (
+            "import sys\n"
+            "from struct_frame import generate\n"
+            f"sys.argv = ['struct_frame', {str(PROTO_FILE)!r}, '--build_py', '--build_c', '--force',\n"
+            f"            '--py_path', {tmp + os.sep!r}, '--c_path', {tmp + os.sep + 'c' + os.sep!r}]\n"
+            "assert generate.main() == 0\n"
+        )
+        loaded = _loaded_after(code)
+        _check(loaded == {"py_gen", "c_gen", "proto_schema_parser"},
+               f"Only the selected back-ends should load, loaded {sorted(loaded)}")
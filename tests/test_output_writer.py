@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the output stage: skip-if-identical writes and atomic replaces.
+
+A ``--force`` run over an up-to-date output tree must not touch any file,
+boilerplate included. A boilerplate file edited by hand is restored, a
+changed output file is replaced atomically and keeps its permission bits,
+and a failed write leaves the old file and no temporary file behind.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from test_utils import _check, run_generator, SRC_DIR, PROTO_FILE
+
+
+LANGUAGES = [("--build_c", "--c_path", "c"), ("--build_cpp", "--cpp_path", "cpp"),
+             ("--build_py", "--py_path", "py"), ("--build_rust", "--rust_path", "rust")]
+
+
+def _generate(out: Path) -> str:
+    flags = ["--force", "--debug", "--sdk", "--catalog_path", str(out) + os.sep]
+    for build, path_flag, subdir in LANGUAGES:
+        flags += [build, path_flag, str(out / subdir) + os.sep]
+    result = run_generator(PROTO_FILE, *flags)
+    output = result.stdout + result.stderr
+    _check(result.returncode == 0, f"Generator failed (exit {result.returncode}):\n{output}")
+    return output
+
+
+def _snapshot(out: Path) -> dict[str, tuple[int, int]]:
+    """(inode, mtime_ns) of every output file, hash and cache files excluded."""
+    return {str(p.relative_to(out)): (p.stat().st_ino, p.stat().st_mtime_ns)
+            for p in out.rglob("*") if p.is_file() and not p.name.startswith(".structframe")
+            and ".structframe.cache" not in p.parts}
+
+
+def test_unchanged_tree_is_not_touched():
+    """A forced run over identical outputs rewrites and copies nothing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        _generate(out)
+        before = _snapshot(out)
+        output = _generate(out)
+        _check("Wrote 0 file(s)" in output, f"No generated file should be written:\n{output}")
+        _check("Copied 0 boilerplate file(s)" in output, f"No boilerplate should be copied:\n{output}")
+        after = _snapshot(out)
+        touched = sorted(name for name in before if after.get(name) != before[name])
+        _check(not touched, f"Files were rewritten: {touched[:10]}")
+        _check(not [p for p in out.rglob("*.tmp")], "No temporary file may be left behind")
+
+
+def test_edited_boilerplate_is_restored():
+    """Hand edits to boilerplate are overwritten; the source file is unchanged."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        _generate(out)
+        frame_base = out / "c" / "frame_base.h"
+        original = frame_base.read_bytes()
+        frame_base.write_bytes(original.replace(b"#", b"/", 1))
+        output = _generate(out)
+        _check("Copied 1 boilerplate file(s)" in output, f"Only the edited file should be copied:\n{output}")
+        _check(frame_base.read_bytes() == original, "The edited boilerplate should be restored")
+
+
+def test_atomic_replace():
+    """Changed files are swapped in whole, keep their mode, and failures change nothing."""
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame.generate import replace_file, write_if_changed
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "sub" / "out.h"
+        _check(write_if_changed(str(target), "one\n"), "A new file should be written")
+        _check(not write_if_changed(str(target), "one\n"), "Identical content should not be written")
+        os.chmod(target, 0o640)
+        inode = target.stat().st_ino
+        _check(write_if_changed(str(target), "two\n"), "Changed content should be written")
+        _check(target.read_text() == "two\n", "The new content should be in place")
+        _check(target.stat().st_ino != inode, "The file should be replaced, not rewritten in place")
+        _check(stat.S_IMODE(target.stat().st_mode) == 0o640, "The permission bits should be kept")
+
+        def failing_write(tmp_path):
+            Path(tmp_path).write_text("partial")
+            raise OSError("disk full")
+        try:
+            replace_file(str(target), failing_write)
+        except OSError:
+            pass
+        else:
+            _check(False, "The write error should propagate")
+        _check(target.read_text() == "two\n", "A failed write must leave the old file")
+        _check(sorted(p.name for p in target.parent.iterdir()) == ["out.h"], "No temporary file may remain")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent parsed-file cache (``--cache_dir`` / ``--no_cache``).
+
+Covered behaviours:
+1. A second run parses nothing: every file is a cache hit and the output is
+   byte-identical to an uncached run.
+2. Editing one imported file re-parses only that file.
+3. A corrupt cache entry, or one naming a type outside the parser's AST,
+   is a miss and gets rewritten.
+4. Concurrent generator runs sharing one cache directory all succeed, agree
+   on the output, and leave no temporary files behind.
+5. A memory-only cache (used by ``--watch``) returns fresh copies on hits.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from test_utils import _check, run_generator, SRC_DIR
+
+
+def _write_tree(root: Path) -> Path:
+    (root / "common.sf").write_text(
+        "package common;\noption pkgid = 2;\n"
+        "enum Mode {\n  OFF = 0;\n  ON = 1;\n}\n", encoding="utf-8")
+    main = root / "main.sf"
+    main.write_text(
+        'import "common.sf";\n'
+        "package app;\noption pkgid = 1;\n"
+        "message Top {\n  option msgid = 1;\n  uint32 value = 1;\n}\n", encoding="utf-8")
+    return main
+
+
+def _generate(main: Path, out: Path, cache: Path | None, *extra: str) -> tuple[int, int, str]:
+    """Run with --debug --force; return (hits, misses, output)."""
+    flags = ["--build_py", "--py_path", str(out) + os.sep, "--force", "--debug", *extra]
+    if cache is not None:
+        flags += ["--cache_dir", str(cache)]
+    result = run_generator(main, *flags)
+    output = result.stdout + result.stderr
+    _check(result.returncode == 0, f"Generator failed (exit {result.returncode}):\n{output}")
+    match = re.search(r"Parse cache: (\d+) hit\(s\), (\d+) miss\(es\)", output)
+    if match is None:
+        return 0, 0, output
+    return int(match.group(1)), int(match.group(2)), output
+
+
+def _read_outputs(out: Path) -> dict[str, bytes]:
+    return {str(p.relative_to(out)): p.read_bytes() for p in sorted(out.rglob("*.py"))
+            if "struct_frame_sdk" not in p.parts}
+
+
+def test_second_run_hits_cache():
+    """Every file is served from the cache and the output matches --no_cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        cache = root / "cache"
+        hits, misses, _ = _generate(main, root / "a", cache)
+        _check((hits, misses) == (0, 2), f"First run should miss both files, got {hits}/{misses}")
+        hits, misses, _ = _generate(main, root / "b", cache)
+        _check((hits, misses) == (2, 0), f"Second run should hit both files, got {hits}/{misses}")
+
+        _generate(main, root / "c", None, "--no_cache")
+        _check(_read_outputs(root / "b") == _read_outputs(root / "c"),
+               "Cached and uncached runs must produce identical output")
+
+
+def test_default_cache_next_to_hash_file():
+    """Without --cache_dir the cache lives next to .structframe.hash."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        _generate(main, root / "gen", None)
+        _check((root / "gen" / ".structframe.cache").is_dir(),
+               "Default cache directory should be created in the output directory")
+        hits, misses, _ = _generate(main, root / "gen", None)
+        _check((hits, misses) == (2, 0), f"Default cache should be reused, got {hits}/{misses}")
+
+
+def test_edit_reparses_only_changed_file():
+    """Only the edited import goes through the parser again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        cache = root / "cache"
+        _generate(main, root / "gen", cache)
+        common = root / "common.sf"
+        common.write_text(common.read_text().replace("ON = 1;", "ON = 1;\n  AUTO = 2;"), encoding="utf-8")
+        hits, misses, _ = _generate(main, root / "gen", cache)
+        _check((hits, misses) == (1, 1), f"Only common.sf should be re-parsed, got {hits}/{misses}")
+        generated = (root / "gen" / "struct_frame" / "generated" / "common.py").read_text()
+        _check("AUTO" in generated, "Edited enum value must reach the generated code")
+
+
+def test_corrupt_entry_is_a_miss():
+    """A truncated, foreign or non-AST entry is ignored and rewritten."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        cache = root / "cache"
+        _generate(main, root / "gen", cache)
+        entries = list(cache.rglob("*.json"))
+        _check(len(entries) == 2, f"Expected two cache entries, got {entries}")
+        entries[0].write_bytes(entries[0].read_bytes()[:20])
+        entries[1].write_bytes(b"garbage")
+        hits, misses, _ = _generate(main, root / "gen", cache)
+        _check((hits, misses) == (0, 2), f"Corrupt entries should be misses, got {hits}/{misses}")
+
+        original = entries[0].read_text(encoding="utf-8")
+        entries[0].write_text(original.replace('"@":"File"', '"@":"Popen"', 1), encoding="utf-8")
+        entries[1].write_bytes(pickle.dumps({"ast": None}))
+        hits, misses, _ = _generate(main, root / "gen", cache)
+        _check((hits, misses) == (0, 2), f"Non-AST entries should be misses, got {hits}/{misses}")
+        _check(entries[0].read_text(encoding="utf-8") == original, "Rejected entry should be rewritten")
+        hits, misses, _ = _generate(main, root / "gen", cache)
+        _check((hits, misses) == (2, 0), f"Entries should be rewritten, got {hits}/{misses}")
+
+        sys.path.insert(0, str(SRC_DIR))
+        from struct_frame.parse_cache import ParseCache
+
+        direct = ParseCache(str(cache))
+        _check(direct.load("0" * 64) is None, "Unknown digest should load as None")
+
+
+def test_concurrent_runs_share_cache():
+    """Parallel runs on one cold cache all succeed with identical output."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        cache = root / "cache"
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+        procs = [
+            subprocess.Popen([sys.executable, str(SRC_DIR / "main.py"), str(main), "--build_py",
+                              "--py_path", str(root / f"out{i}") + os.sep, "--cache_dir", str(cache)],
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
+            for i in range(6)
+        ]
+        codes = [p.wait() for p in procs]
+        for p in procs:
+            p.stdout.close()
+        _check(codes == [0] * 6, f"All concurrent runs should succeed, got {codes}")
+        first = _read_outputs(root / "out0")
+        _check(all(_read_outputs(root / f"out{i}") == first for i in range(1, 6)),
+               "Concurrent runs must produce identical output")
+        _check(not list(cache.rglob("*.tmp")), "No temporary files should remain in the cache")
+        _check(len(list(cache.rglob("*.json"))) == 2, "Cache should hold one entry per file")
+
+
+def test_memory_only_cache():
+    """A memory cache hands out independent copies and forgets retired digests."""
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame.parse_cache import ParseCache
+
+    cache = ParseCache(None, memory=True)
+    text = "package app;\noption pkgid = 1;\n"
+    first = cache.parse(text, "a" * 64)
+    second = cache.parse(text, "a" * 64)
+    _check((cache.hits, cache.misses) == (1, 1), f"Second parse should hit, got {cache.hits}/{cache.misses}")
+    _check(first == second and first is not second, "Hits must return a fresh, equal AST")
+    cache.retain([])
+    _check(cache.load("a" * 64) is None, "retain() should drop entries not in use")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for watch mode (``--watch`` / ``--watch_port``).
+
+A watcher is started as a subprocess on a small two-file schema. The tests
+cover regeneration after an edit is picked up by polling, socket-requested
+passes, recovery from a syntax error, a closure that grows when an import is
+added, and a clean shutdown via the ``stop`` command.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from test_utils import _check, SRC_DIR
+
+
+TIMEOUT = 20.0
+
+
+def _write_tree(root: Path) -> Path:
+    (root / "leaf.sf").write_text(
+        "package leaf;\noption pkgid = 2;\n"
+        "enum Mode {\n  OFF = 0;\n  ON = 1;\n}\n", encoding="utf-8")
+    main = root / "main.sf"
+    main.write_text(
+        'import "leaf.sf";\n'
+        "package app;\noption pkgid = 1;\n"
+        "message Top {\n  option msgid = 1;\n  leaf.Mode mode = 1;\n}\n", encoding="utf-8")
+    return main
+
+
+def _wait_for(predicate, what: str):
+    deadline = time.monotonic() + TIMEOUT
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.05)
+    _check(False, f"Timed out waiting for {what}")
+
+
+def _start(main: Path, out: Path, log: Path):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    with open(log, "w") as log_file:
+        proc = subprocess.Popen(
+            [sys.executable, str(SRC_DIR / "main.py"), str(main), "--build_py",
+             "--py_path", str(out) + os.sep, "--watch", "--watch_port", "0", "--watch_interval", "0.05"],
+            stdout=log_file, stderr=subprocess.STDOUT, env=env)
+    port = []
+
+    def listening():
+        match = re.search(r"127\.0\.0\.1:(\d+)", log.read_text())
+        if match:
+            port.append(int(match.group(1)))
+        _check(match or proc.poll() is None, f"Watcher exited early:\n{log.read_text()}")
+        return bool(match)
+
+    _wait_for(listening, "the watcher to listen")
+    return proc, port[0]
+
+
+def _touch_edit(path: Path, old: str, new: str):
+    """Edit *path* and make sure its mtime moves even on coarse filesystems."""
+    stat = path.stat()
+    path.write_text(path.read_text().replace(old, new), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_watch_regenerates_and_serves_requests():
+    sys.path.insert(0, str(SRC_DIR))
+    from struct_frame.watch import request
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        main = _write_tree(root)
+        out = root / "gen"
+        log = root / "watch.log"
+        proc, port = _start(main, out, log)
+        try:
+            leaf_py = out / "struct_frame" / "generated" / "leaf.py"
+            _check(leaf_py.exists(), "The first pass should generate the outputs")
+
+            # An edit is picked up by polling.
+            _touch_edit(root / "leaf.sf", "ON = 1;", "ON = 1;\n  AUTO = 2;")
+            _wait_for(lambda: "AUTO" in leaf_py.read_text(), "the edit to be regenerated")
+
+            # A requested pass with no changes is a cheap hash match.
+            reply = request(port, timeout=TIMEOUT)
+            _check(reply["status"] == "ok" and reply["exit_code"] == 0, f"Unexpected reply: {reply}")
+            _check("hash matches" in reply["output"], f"Unchanged schema should not regenerate:\n{reply['output']}")
+            _check(request(port, "ping", timeout=TIMEOUT)["watching"] == 2, "Both files should be watched")
+
+            # A syntax error is reported and the watcher keeps going.
+            _touch_edit(root / "leaf.sf", "AUTO = 2;", "AUTO = ;")
+            reply = request(port, timeout=TIMEOUT)
+            _check(reply["status"] == "error", f"Broken schema should fail the pass: {reply}")
+            _touch_edit(root / "leaf.sf", "AUTO = ;", "AUTO = 2;\n  BOOST = 3;")
+            reply = request(port, timeout=TIMEOUT)
+            _check(reply["status"] == "ok", f"Fixed schema should generate:\n{reply['output']}")
+            _check("BOOST" in leaf_py.read_text(), "Fixed schema should reach the outputs")
+
+            # A newly imported file joins the watched closure.
+            (root / "extra.sf").write_text(
+                "package extra;\noption pkgid = 3;\nenum Level {\n  LOW = 0;\n}\n", encoding="utf-8")
+            _touch_edit(main, 'import "leaf.sf";', 'import "leaf.sf";\nimport "extra.sf";')
+            extra_py = out / "struct_frame" / "generated" / "extra.py"
+            _wait_for(extra_py.exists, "the new import to be generated")
+            _touch_edit(root / "extra.sf", "LOW = 0;", "LOW = 0;\n  HIGH = 1;")
+            _wait_for(lambda: "HIGH" in extra_py.read_text(), "an edit of the new import")
+
+            _check(request(port, "bogus", timeout=TIMEOUT)["status"] == "error", "Unknown commands are errors")
+            _check(request(port, "stop", timeout=TIMEOUT)["status"] == "ok", "stop should be acknowledged")
+            _check(proc.wait(timeout=TIMEOUT) == 0, f"Watcher should exit cleanly:\n{log.read_text()}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()